@@ -1917,6 +1917,151 @@ module fbaModelServices {
     authentication required;
     funcdef runfba(runfba_params input) returns (object_metadata fbaMeta);
     
+    /* Input parameters for the "runfba_batch" function.
+	
+		fbamodel_id model - ID of the model that FBA should be run on (a required argument)
+		workspace_id model_workspace - workspace where model for FBA should be run (an optional argument; default is the value of the workspace argument)
+		list<FBAFormulation> formulations - the parameters of each FBA study in the batch (a required argument)
+		list<string> fluxes - IDs of the reactions, biomass reactions and compounds whose flux is reported for every formulation (an optional argument)
+		bool minimizeflux - a flag indicating if flux should be minimized after each study (an optional argument: default is '0')
+		bool save_fbas - a flag indicating if an FBA object should be saved for each study (an optional argument: default is '0')
+		list<fba_id> fbas - IDs under which the FBA objects should be saved, one per formulation (an optional argument; default is generated from the model ID)
+		workspace_id workspace - workspace where FBA results will be saved (a required argument)
+		string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+		
+	*/
+    typedef structure {
+    	fbamodel_id model;
+		workspace_id model_workspace;
+		list<FBAFormulation> formulations;
+		list<string> fluxes;
+		bool minimizeflux;
+		bool save_fbas;
+		list<fba_id> fbas;
+		workspace_id workspace;
+		string auth;
+    } runfba_batch_params;
+    
+    /* Results of a batch of flux balance analyses, one entry per formulation in each list
+    
+		list<string> fluxes - IDs of the fluxes reported
+		list<bool> feasible - flag indicating if each study had a solution
+		list<float> objectives - objective value of each study; 0 when it had no solution
+		list<list<float>> values - values of the reported fluxes in each study, in the order of fluxes
+		list<object_metadata> fbaMetas - metadata of the FBA objects saved (empty unless save_fbas is set)
+		
+	*/
+    typedef structure {
+		list<string> fluxes;
+		list<bool> feasible;
+		list<float> objectives;
+		list<list<float>> values;
+		list<object_metadata> fbaMetas;
+    } FBABatchResults;
+    /*
+        Run flux balance analysis for many formulations of one model, returning a table of objectives and fluxes
+    */
+    authentication required;
+    funcdef runfba_batch(runfba_batch_params input) returns (FBABatchResults output);
+    
+    /* A parameter swept by the "fba_parameter_sweep" function
+    
+		string variable_type - type of the swept variable: flux, biomassflux, drainflux or constraint
+		string variable - ID of the reaction, biomass reaction or compound, or name of the constraint
+		string bound - bound of a flux that takes the swept values: lower, upper or both (an optional argument: default is 'upper'; the right hand side of a constraint is always swept)
+		list<float> values - the values swept
+		
+	*/
+    typedef structure {
+		string variable_type;
+		string variable;
+		string bound;
+		list<float> values;
+    } sweep_parameter;
+    
+    /* Input parameters for the "fba_parameter_sweep" function.
+	
+		fbamodel_id model - ID of the model that FBA should be run on (a required argument)
+		workspace_id model_workspace - workspace where model for FBA should be run (a required argument)
+		FBAFormulation formulation - a hash specifying the parameters for the FBA study (an optional argument)
+		list<sweep_parameter> parameters - one or two parameters whose values span the grid (a required argument)
+		list<string> compounds - IDs of the compounds whose shadow prices are reported (an optional argument; default is the compounds whose drain fluxes are swept)
+		string auth - the authentication token of the KBase account (an optional argument; user is "public" if auth is not provided)
+		
+	*/
+    typedef structure {
+    	fbamodel_id model;
+		workspace_id model_workspace;
+		FBAFormulation formulation;
+		list<sweep_parameter> parameters;
+		list<string> compounds;
+		string auth;
+    } fba_parameter_sweep_params;
+    
+    /* Results of a parameter sweep, as dense arrays indexed by the position of the values of the first and the second parameter
+    
+		list<float> values1 - values of the first parameter
+		list<float> values2 - values of the second parameter (empty when only one parameter is swept; the arrays then have one column)
+		list<list<bool>> feasible - flag indicating if each grid point had a solution
+		list<list<float>> objectives - objective value at each grid point; 0 when it had no solution
+		list<string> compounds - IDs of the compounds whose shadow prices are reported
+		list<list<list<float>>> shadow_prices - objective gained per unit of each compound supplied, at each grid point, in the order of compounds
+		
+	*/
+    typedef structure {
+		list<float> values1;
+		list<float> values2;
+		list<list<bool>> feasible;
+		list<list<float>> objectives;
+		list<string> compounds;
+		list<list<list<float>>> shadow_prices;
+    } FBASweepResults;
+    /*
+        Run flux balance analysis over a grid of values of one or two bounds or constraints, such as a phenotypic phase plane
+    */
+    authentication required;
+    funcdef fba_parameter_sweep(fba_parameter_sweep_params input) returns (FBASweepResults output);
+    
+    /* Input parameters for the "simulate_double_knockouts" function.
+	
+		fbamodel_id model - ID of the model that knockouts should be simulated on (a required argument)
+		workspace_id model_workspace - workspace where model is located (a required argument)
+		FBAFormulation formulation - a hash specifying the parameters for the FBA study; gene knockouts listed here apply to every pair (an optional argument)
+		list<feature_id> genes - genes to knock out in pairs (an optional argument; default is every gene of the model)
+		string auth - the authentication token of the KBase account (an optional argument; user is "public" if auth is not provided)
+		
+	*/
+    typedef structure {
+    	fbamodel_id model;
+		workspace_id model_workspace;
+		FBAFormulation formulation;
+		list<feature_id> genes;
+		string auth;
+    } simulate_double_knockouts_params;
+    
+    /* Growth of double gene knockouts, stored as a sparse upper triangular matrix
+    
+		list<feature_id> genes - genes knocked out, in matrix order
+		float wildtype_growth - objective value with no gene knocked out
+		list<float> single_growth - objective value with each gene knocked out, in the order of genes
+		list<tuple<int,int,float>> interactions - (index of first gene, index of second gene, objective value) for the pairs that grow less than both of their single knockouts, first gene index less than second
+		int solved - number of knockouts that had to be solved
+		
+		Every pair not listed in interactions grows as its slower single knockout.
+	*/
+    typedef structure {
+		list<feature_id> genes;
+		float wildtype_growth;
+		list<float> single_growth;
+		list<tuple<int,int,float>> interactions;
+		int solved;
+    } DoubleKnockoutMatrix;
+    /*
+        Simulate the knockout of every pair of genes of a model, returning the pairs whose double knockout grows less than either single knockout
+    */
+    authentication required;
+    funcdef simulate_double_knockouts(simulate_double_knockouts_params input) returns (DoubleKnockoutMatrix output);
+    
     /* Input parameters for the "addmedia" function.
 	
 		fbamodel_id model - ID of the model that FBA should be run on (a required argument)
@@ -1945,11 +2090,15 @@ module fbaModelServices {
 	
 		fbamodel_id model - ID of the models that FBA should be run on (a required argument)
 		workspace_id model_workspace - workspaces where model for FBA should be run (an optional argument; default is the value of the workspace argument)
+		media_id minimal_media - ID of the minimal media essential genes and reactions are computed on (an optional argument; default is set by the service, normally 'Carbon-D-Glucose')
+		workspace_id minimal_media_workspace - workspace where the minimal media is located (an optional argument; default is set by the service, normally 'KBaseMedia')
 		
 	*/
     typedef structure {
     	fbamodel_id model;
 		workspace_id model_workspace;
+		media_id minimal_media;
+		workspace_id minimal_media_workspace;
     } generate_model_stats_params;
     
     typedef structure {
@@ -2439,6 +2588,70 @@ module fbaModelServices {
     */
     authentication required;
     funcdef queue_combine_wildtype_phenotype_reconciliation(combine_wildtype_phenotype_reconciliation_params input) returns (JobObject job);
+    
+    /* Input parameters for the "reconcile_phenotypes" function.
+	
+		fbamodel_id model - ID of the model that reconciliation should be run on (a required argument)
+		workspace_id model_workspace - workspace where model for reconciliation should be run (an optional argument; default is the value of the workspace argument)
+		FBAFormulation fba_formulation - a hash specifying the parameters for the reconciliation study (an optional argument)
+		GapfillingFormulation gapfill_formulation - a hash specifying the parameters for the gapfill study (an optional argument)
+		GapgenFormulation gapgen_formulation - a hash specifying the parameters for the gapgen study (an optional argument)
+		phenotype_set_id phenotypeSet - ID of a phenotype set against which the model should be reconciled (a required argument)
+		workspace_id phenotypeSet_workspace - workspace containing phenotype set to be simulated (an optional argument; default is the value of the workspace argument)
+		fbamodel_id out_model - ID where the reconciled model will be saved (an optional argument: default is the value of the model argument)
+		list<gapgen_id> gapGens - IDs of the gapgen studies or solutions to analyse and combine (an optional argument: default is all of them)
+		list<gapfill_id> gapFills - IDs of the gapfill studies or solutions to analyse and combine (an optional argument: default is all of them)
+		bool sensitivity_analysis - flag indicating if the phenotype set should be simulated with each solution (an optional argument: default is '0')
+		bool combine_solutions - flag indicating if the solutions should be combined and integrated into the reconciled model (an optional argument: default is '0')
+		workspace_id workspace - workspace where reconciliation results will be saved (a required argument)
+		string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+		
+	*/
+    typedef structure {
+		fbamodel_id model;
+		workspace_id model_workspace;
+		FBAFormulation fba_formulation;
+		GapfillingFormulation gapfill_formulation;
+		GapgenFormulation gapgen_formulation;
+		phenotype_set_id phenotypeSet;
+		workspace_id phenotypeSet_workspace;
+		fbamodel_id out_model;
+		workspace_id workspace;
+		list<gapfill_id> gapFills;
+		list<gapgen_id> gapGens;
+		bool sensitivity_analysis;
+		bool combine_solutions;
+		string auth;
+		bool overwrite;
+    } reconcile_phenotypes_params;
+    
+    /* Results of the "reconcile_phenotypes" function.
+	
+		mapping<string,int> phenoclasses - number of phenotypes the model predicts in each class (CP, CN, FP, FN)
+		list<fba_id> gapfills - IDs of the gapfilling FBA objects saved, one per false negative with solutions
+		list<gapgen_id> gapgens - IDs of the Gapgeneration objects saved, one per false positive with solutions
+		mapping<string,tuple<list<string>,list<string>>> sensitivity - by solution ID, the IDs of the phenotypes the solution corrects and of those it makes wrong
+		list<string> combined_solutions - IDs of the solutions integrated into the reconciled model
+		mapping<string,int> reconciled_phenoclasses - number of phenotypes the reconciled model predicts in each class
+		object_metadata reconciled_model - metadata of the reconciled model, when the solutions were combined
+		string checkpoint - file holding the results of the completed stages, which a later call for the same model, phenotype set and formulations resumes from
+		
+	*/
+    typedef structure {
+		mapping<string,int> phenoclasses;
+		list<fba_id> gapfills;
+		list<gapgen_id> gapgens;
+		mapping<string,tuple<list<string>,list<string>>> sensitivity;
+		list<string> combined_solutions;
+		mapping<string,int> reconciled_phenoclasses;
+		object_metadata reconciled_model;
+		string checkpoint;
+    } PhenotypeReconciliation;
+    /*
+        Reconciles an FBAModel with a PhenotypeSet in one call, gapfilling each false negative and gap generating each false positive, and optionally simulating the phenotype set with each solution and integrating the best combination of them
+    */
+    authentication required;
+    funcdef reconcile_phenotypes(reconcile_phenotypes_params input) returns (PhenotypeReconciliation output);
     	
 	/* Input parameters for the "run_job" function.
 	
@@ -2805,7 +2805,9 @@ Description:
 
 sub compute_model_stats {
 	my $self = shift;
-	my $args = Bio::KBase::ObjectAPI::utilities::args([], {}, @_);
+	my $args = Bio::KBase::ObjectAPI::utilities::args([], {
+		minimal_media => "KBaseMedia/Carbon-D-Glucose"
+	}, @_);
 	$self->genome()->{_mapping} = $self->template()->mapping();
 	my $output = $self->genome()->genome_stats();
 	my $genesshash = $self->genome()->gene_subsystem_hash();
@@ -2940,7 +2942,7 @@ sub compute_model_stats {
 		$output->{growth_complete_media} = 1;
 		$fba = $self->build_model_fba();
 		$fba->fva(1);
-		$fba->media_ref("KBaseMedia/Carbon-D-Glucose");
+		$fba->media_ref($args->{minimal_media});
 		$objective = $fba->runFBA();
 		if ($objective > 1e-9) {
 			$rxnfbas = $fba->FBAReactionVariables();
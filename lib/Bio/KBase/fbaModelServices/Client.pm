@@ -4766,9 +4766,9 @@ sub runfba
 
 
 
-=head2 quantitative_optimization
+=head2 runfba_batch
 
-  $output = $obj->quantitative_optimization($input)
+  $output = $obj->runfba_batch($input)
 
 =over 4
 
@@ -4777,15 +4777,18 @@ sub runfba
 =begin html
 
 <pre>
-$input is a quantitative_optimization_params
-$output is an object_metadata
-quantitative_optimization_params is a reference to a hash where the following keys are defined:
+$input is a runfba_batch_params
+$output is an FBABatchResults
+runfba_batch_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
-	formulation has a value which is an FBAFormulation
-	outputid has a value which is a fbamodel_id
+	formulations has a value which is a reference to a list where each element is an FBAFormulation
+	fluxes has a value which is a reference to a list where each element is a string
+	minimizeflux has a value which is a bool
+	save_fbas has a value which is a bool
+	fbas has a value which is a reference to a list where each element is a fba_id
 	workspace has a value which is a workspace_id
-	biomass has a value which is a string
+	auth has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
@@ -4835,6 +4838,13 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
+fba_id is a string
+FBABatchResults is a reference to a hash where the following keys are defined:
+	fluxes has a value which is a reference to a list where each element is a string
+	feasible has a value which is a reference to a list where each element is a bool
+	objectives has a value which is a reference to a list where each element is a float
+	values has a value which is a reference to a list where each element is a reference to a list where each element is a float
+	fbaMetas has a value which is a reference to a list where each element is an object_metadata
 object_metadata is a reference to a list containing 11 items:
 	0: (id) an object_id
 	1: (type) an object_type
@@ -4859,15 +4869,18 @@ workspace_ref is a string
 
 =begin text
 
-$input is a quantitative_optimization_params
-$output is an object_metadata
-quantitative_optimization_params is a reference to a hash where the following keys are defined:
+$input is a runfba_batch_params
+$output is an FBABatchResults
+runfba_batch_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
-	formulation has a value which is an FBAFormulation
-	outputid has a value which is a fbamodel_id
+	formulations has a value which is a reference to a list where each element is an FBAFormulation
+	fluxes has a value which is a reference to a list where each element is a string
+	minimizeflux has a value which is a bool
+	save_fbas has a value which is a bool
+	fbas has a value which is a reference to a list where each element is a fba_id
 	workspace has a value which is a workspace_id
-	biomass has a value which is a string
+	auth has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
@@ -4917,6 +4930,13 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
+fba_id is a string
+FBABatchResults is a reference to a hash where the following keys are defined:
+	fluxes has a value which is a reference to a list where each element is a string
+	feasible has a value which is a reference to a list where each element is a bool
+	objectives has a value which is a reference to a list where each element is a float
+	values has a value which is a reference to a list where each element is a reference to a list where each element is a float
+	fbaMetas has a value which is a reference to a list where each element is an object_metadata
 object_metadata is a reference to a list containing 11 items:
 	0: (id) an object_id
 	1: (type) an object_type
@@ -4940,13 +4960,13 @@ workspace_ref is a string
 
 =item Description
 
-Identify ways to adjust model to quantitatively match specified uptake, growth, and excretion constraints
+Run flux balance analysis for many formulations of one model, returning a table of objectives and fluxes
 
 =back
 
 =cut
 
-sub quantitative_optimization
+sub runfba_batch
 {
     my($self, @args) = @_;
 
@@ -4955,7 +4975,7 @@ sub quantitative_optimization
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function quantitative_optimization (received $n, expecting 1)");
+							       "Invalid argument count for function runfba_batch (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -4963,39 +4983,39 @@ sub quantitative_optimization
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to quantitative_optimization:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to runfba_batch:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'quantitative_optimization');
+								   method_name => 'runfba_batch');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.quantitative_optimization",
+	method => "fbaModelServices.runfba_batch",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'quantitative_optimization',
+					       method_name => 'runfba_batch',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method quantitative_optimization",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method runfba_batch",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'quantitative_optimization',
+					    method_name => 'runfba_batch',
 				       );
     }
 }
 
 
 
-=head2 generate_model_stats
+=head2 fba_parameter_sweep
 
-  $output = $obj->generate_model_stats($input)
+  $output = $obj->fba_parameter_sweep($input)
 
 =over 4
 
@@ -5004,53 +5024,76 @@ sub quantitative_optimization
 =begin html
 
 <pre>
-$input is a generate_model_stats_params
-$output is a model_statistics
-generate_model_stats_params is a reference to a hash where the following keys are defined:
+$input is a fba_parameter_sweep_params
+$output is an FBASweepResults
+fba_parameter_sweep_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	parameters has a value which is a reference to a list where each element is a sweep_parameter
+	compounds has a value which is a reference to a list where each element is a string
+	auth has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
-model_statistics is a reference to a hash where the following keys are defined:
-	total_reactions has a value which is an int
-	total_genes has a value which is an int
-	total_compounds has a value which is an int
-	extracellular_compounds has a value which is an int
-	intracellular_compounds has a value which is an int
-	transport_reactions has a value which is an int
-	subsystem_reactions has a value which is an int
-	subsystem_genes has a value which is an int
-	spontaneous_reactions has a value which is an int
-	reactions_with_genes has a value which is an int
-	gapfilled_reactions has a value which is an int
-	model_genes has a value which is an int
-	minimal_essential_genes has a value which is an int
-	complete_essential_genes has a value which is an int
-	minimal_essential_reactions has a value which is an int
-	complete_essential_reactions has a value which is an int
-	minimal_blocked_reactions has a value which is an int
-	complete_blocked_reactions has a value which is an int
-	minimal_variable_reactions has a value which is an int
-	complete_variable_reactions has a value which is an int
-	growth_complete_media has a value which is a bool
-	growth_minimal_media has a value which is a bool
-	subsystems has a value which is a reference to a list where each element is a subsystem_statistics
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
 bool is an int
-subsystem_statistics is a reference to a hash where the following keys are defined:
-	name has a value which is a string
-	class has a value which is a string
-	subclass has a value which is a string
-	genes has a value which is an int
-	reactions has a value which is an int
-	model_genes has a value which is an int
-	minimal_essential_genes has a value which is an int
-	complete_essential_genes has a value which is an int
-	minimal_essential_reactions has a value which is an int
-	complete_essential_reactions has a value which is an int
-	minimal_blocked_reactions has a value which is an int
-	complete_blocked_reactions has a value which is an int
-	minimal_variable_reactions has a value which is an int
-	complete_variable_reactions has a value which is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+sweep_parameter is a reference to a hash where the following keys are defined:
+	variable_type has a value which is a string
+	variable has a value which is a string
+	bound has a value which is a string
+	values has a value which is a reference to a list where each element is a float
+FBASweepResults is a reference to a hash where the following keys are defined:
+	values1 has a value which is a reference to a list where each element is a float
+	values2 has a value which is a reference to a list where each element is a float
+	feasible has a value which is a reference to a list where each element is a reference to a list where each element is a bool
+	objectives has a value which is a reference to a list where each element is a reference to a list where each element is a float
+	compounds has a value which is a reference to a list where each element is a string
+	shadow_prices has a value which is a reference to a list where each element is a reference to a list where each element is a reference to a list where each element is a float
 
 </pre>
 
@@ -5058,66 +5101,89 @@ subsystem_statistics is a reference to a hash where the following keys are defin
 
 =begin text
 
-$input is a generate_model_stats_params
-$output is a model_statistics
-generate_model_stats_params is a reference to a hash where the following keys are defined:
+$input is a fba_parameter_sweep_params
+$output is an FBASweepResults
+fba_parameter_sweep_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	parameters has a value which is a reference to a list where each element is a sweep_parameter
+	compounds has a value which is a reference to a list where each element is a string
+	auth has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
-model_statistics is a reference to a hash where the following keys are defined:
-	total_reactions has a value which is an int
-	total_genes has a value which is an int
-	total_compounds has a value which is an int
-	extracellular_compounds has a value which is an int
-	intracellular_compounds has a value which is an int
-	transport_reactions has a value which is an int
-	subsystem_reactions has a value which is an int
-	subsystem_genes has a value which is an int
-	spontaneous_reactions has a value which is an int
-	reactions_with_genes has a value which is an int
-	gapfilled_reactions has a value which is an int
-	model_genes has a value which is an int
-	minimal_essential_genes has a value which is an int
-	complete_essential_genes has a value which is an int
-	minimal_essential_reactions has a value which is an int
-	complete_essential_reactions has a value which is an int
-	minimal_blocked_reactions has a value which is an int
-	complete_blocked_reactions has a value which is an int
-	minimal_variable_reactions has a value which is an int
-	complete_variable_reactions has a value which is an int
-	growth_complete_media has a value which is a bool
-	growth_minimal_media has a value which is a bool
-	subsystems has a value which is a reference to a list where each element is a subsystem_statistics
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
 bool is an int
-subsystem_statistics is a reference to a hash where the following keys are defined:
-	name has a value which is a string
-	class has a value which is a string
-	subclass has a value which is a string
-	genes has a value which is an int
-	reactions has a value which is an int
-	model_genes has a value which is an int
-	minimal_essential_genes has a value which is an int
-	complete_essential_genes has a value which is an int
-	minimal_essential_reactions has a value which is an int
-	complete_essential_reactions has a value which is an int
-	minimal_blocked_reactions has a value which is an int
-	complete_blocked_reactions has a value which is an int
-	minimal_variable_reactions has a value which is an int
-	complete_variable_reactions has a value which is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+sweep_parameter is a reference to a hash where the following keys are defined:
+	variable_type has a value which is a string
+	variable has a value which is a string
+	bound has a value which is a string
+	values has a value which is a reference to a list where each element is a float
+FBASweepResults is a reference to a hash where the following keys are defined:
+	values1 has a value which is a reference to a list where each element is a float
+	values2 has a value which is a reference to a list where each element is a float
+	feasible has a value which is a reference to a list where each element is a reference to a list where each element is a bool
+	objectives has a value which is a reference to a list where each element is a reference to a list where each element is a float
+	compounds has a value which is a reference to a list where each element is a string
+	shadow_prices has a value which is a reference to a list where each element is a reference to a list where each element is a reference to a list where each element is a float
 
 
 =end text
 
 =item Description
 
-Generate statistics with model and associated genome properties
+Run flux balance analysis over a grid of values of one or two bounds or constraints, such as a phenotypic phase plane
 
 =back
 
 =cut
 
-sub generate_model_stats
+sub fba_parameter_sweep
 {
     my($self, @args) = @_;
 
@@ -5126,7 +5192,7 @@ sub generate_model_stats
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function generate_model_stats (received $n, expecting 1)");
+							       "Invalid argument count for function fba_parameter_sweep (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -5134,39 +5200,39 @@ sub generate_model_stats
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to generate_model_stats:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to fba_parameter_sweep:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'generate_model_stats');
+								   method_name => 'fba_parameter_sweep');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.generate_model_stats",
+	method => "fbaModelServices.fba_parameter_sweep",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'generate_model_stats',
+					       method_name => 'fba_parameter_sweep',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method generate_model_stats",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method fba_parameter_sweep",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'generate_model_stats',
+					    method_name => 'fba_parameter_sweep',
 				       );
     }
 }
 
 
 
-=head2 minimize_reactions
+=head2 simulate_double_knockouts
 
-  $fbaMeta = $obj->minimize_reactions($input)
+  $output = $obj->simulate_double_knockouts($input)
 
 =over 4
 
@@ -5175,17 +5241,14 @@ sub generate_model_stats
 =begin html
 
 <pre>
-$input is a minimize_reactions_params
-$fbaMeta is an object_metadata
-minimize_reactions_params is a reference to a hash where the following keys are defined:
+$input is a simulate_double_knockouts_params
+$output is a DoubleKnockoutMatrix
+simulate_double_knockouts_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
-	workspace has a value which is a workspace_id
 	formulation has a value which is an FBAFormulation
-	reactions has a value which is a reference to a list where each element is a string
-	all_model_reactions has a value which is a bool
-	reaction_costs has a value which is a reference to a hash where the key is a string and the value is a float
-	output_id has a value which is a fba_id
+	genes has a value which is a reference to a list where each element is a feature_id
+	auth has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
@@ -5235,24 +5298,16 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
-fba_id is a string
-object_metadata is a reference to a list containing 11 items:
-	0: (id) an object_id
-	1: (type) an object_type
-	2: (moddate) a timestamp
-	3: (instance) an int
-	4: (command) a string
-	5: (lastmodifier) a username
-	6: (owner) a username
-	7: (workspace) a workspace_id
-	8: (ref) a workspace_ref
-	9: (chsum) a string
-	10: (metadata) a reference to a hash where the key is a string and the value is a string
-object_id is a string
-object_type is a string
-timestamp is a string
-username is a string
-workspace_ref is a string
+DoubleKnockoutMatrix is a reference to a hash where the following keys are defined:
+	genes has a value which is a reference to a list where each element is a feature_id
+	wildtype_growth has a value which is a float
+	single_growth has a value which is a reference to a list where each element is a float
+	interactions has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+	0: an int
+	1: an int
+	2: a float
+
+	solved has a value which is an int
 
 </pre>
 
@@ -5260,17 +5315,14 @@ workspace_ref is a string
 
 =begin text
 
-$input is a minimize_reactions_params
-$fbaMeta is an object_metadata
-minimize_reactions_params is a reference to a hash where the following keys are defined:
+$input is a simulate_double_knockouts_params
+$output is a DoubleKnockoutMatrix
+simulate_double_knockouts_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
-	workspace has a value which is a workspace_id
 	formulation has a value which is an FBAFormulation
-	reactions has a value which is a reference to a list where each element is a string
-	all_model_reactions has a value which is a bool
-	reaction_costs has a value which is a reference to a hash where the key is a string and the value is a float
-	output_id has a value which is a fba_id
+	genes has a value which is a reference to a list where each element is a feature_id
+	auth has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
@@ -5320,37 +5372,29 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
-fba_id is a string
-object_metadata is a reference to a list containing 11 items:
-	0: (id) an object_id
-	1: (type) an object_type
-	2: (moddate) a timestamp
-	3: (instance) an int
-	4: (command) a string
-	5: (lastmodifier) a username
-	6: (owner) a username
-	7: (workspace) a workspace_id
-	8: (ref) a workspace_ref
-	9: (chsum) a string
-	10: (metadata) a reference to a hash where the key is a string and the value is a string
-object_id is a string
-object_type is a string
-timestamp is a string
-username is a string
-workspace_ref is a string
+DoubleKnockoutMatrix is a reference to a hash where the following keys are defined:
+	genes has a value which is a reference to a list where each element is a feature_id
+	wildtype_growth has a value which is a float
+	single_growth has a value which is a reference to a list where each element is a float
+	interactions has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+	0: an int
+	1: an int
+	2: a float
+
+	solved has a value which is an int
 
 
 =end text
 
 =item Description
 
-Minimize the specified set of reactions while maintaining the FBA objective above a specified threshold
+Simulate the knockout of every pair of genes of a model, returning the pairs whose double knockout grows less than either single knockout
 
 =back
 
 =cut
 
-sub minimize_reactions
+sub simulate_double_knockouts
 {
     my($self, @args) = @_;
 
@@ -5359,7 +5403,7 @@ sub minimize_reactions
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function minimize_reactions (received $n, expecting 1)");
+							       "Invalid argument count for function simulate_double_knockouts (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -5367,39 +5411,39 @@ sub minimize_reactions
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to minimize_reactions:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to simulate_double_knockouts:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'minimize_reactions');
+								   method_name => 'simulate_double_knockouts');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.minimize_reactions",
+	method => "fbaModelServices.simulate_double_knockouts",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'minimize_reactions',
+					       method_name => 'simulate_double_knockouts',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method minimize_reactions",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method simulate_double_knockouts",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'minimize_reactions',
+					    method_name => 'simulate_double_knockouts',
 				       );
     }
 }
 
 
 
-=head2 export_fba
+=head2 quantitative_optimization
 
-  $output = $obj->export_fba($input)
+  $output = $obj->quantitative_optimization($input)
 
 =over 4
 
@@ -5408,15 +5452,81 @@ sub minimize_reactions
 =begin html
 
 <pre>
-$input is an export_fba_params
-$output is a string
-export_fba_params is a reference to a hash where the following keys are defined:
-	fba has a value which is a fba_id
+$input is a quantitative_optimization_params
+$output is an object_metadata
+quantitative_optimization_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	outputid has a value which is a fbamodel_id
 	workspace has a value which is a workspace_id
-	format has a value which is a string
-	auth has a value which is a string
-fba_id is a string
+	biomass has a value which is a string
+fbamodel_id is a string
 workspace_id is a string
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
 
 </pre>
 
@@ -5424,37 +5534,103 @@ workspace_id is a string
 
 =begin text
 
-$input is an export_fba_params
-$output is a string
-export_fba_params is a reference to a hash where the following keys are defined:
-	fba has a value which is a fba_id
+$input is a quantitative_optimization_params
+$output is an object_metadata
+quantitative_optimization_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	outputid has a value which is a fbamodel_id
 	workspace has a value which is a workspace_id
-	format has a value which is a string
-	auth has a value which is a string
-fba_id is a string
+	biomass has a value which is a string
+fbamodel_id is a string
 workspace_id is a string
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
 
 
 =end text
 
 =item Description
 
-Export an FBA solution for viewing
+Identify ways to adjust model to quantitatively match specified uptake, growth, and excretion constraints
 
 =back
 
 =cut
 
-sub export_fba
+sub quantitative_optimization
 {
     my($self, @args) = @_;
 
-# Authentication: optional
+# Authentication: required
 
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function export_fba (received $n, expecting 1)");
+							       "Invalid argument count for function quantitative_optimization (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -5462,39 +5638,39 @@ sub export_fba
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to export_fba:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to quantitative_optimization:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'export_fba');
+								   method_name => 'quantitative_optimization');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.export_fba",
+	method => "fbaModelServices.quantitative_optimization",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'export_fba',
+					       method_name => 'quantitative_optimization',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method export_fba",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method quantitative_optimization",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'export_fba',
+					    method_name => 'quantitative_optimization',
 				       );
     }
 }
 
 
 
-=head2 import_phenotypes
+=head2 generate_model_stats
 
-  $output = $obj->import_phenotypes($input)
+  $output = $obj->generate_model_stats($input)
 
 =over 4
 
@@ -5503,49 +5679,56 @@ sub export_fba
 =begin html
 
 <pre>
-$input is an import_phenotypes_params
-$output is an object_metadata
-import_phenotypes_params is a reference to a hash where the following keys are defined:
-	phenotypeSet has a value which is a phenotype_set_id
-	workspace has a value which is a workspace_id
-	genome has a value which is a genome_id
-	genome_workspace has a value which is a workspace_id
-	phenotypes has a value which is a reference to a list where each element is a Phenotype
-	name has a value which is a string
-	source has a value which is a string
-	ignore_errors has a value which is a bool
-	auth has a value which is a string
-phenotype_set_id is a string
+$input is a generate_model_stats_params
+$output is a model_statistics
+generate_model_stats_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	minimal_media has a value which is a media_id
+	minimal_media_workspace has a value which is a workspace_id
+fbamodel_id is a string
 workspace_id is a string
-genome_id is a string
-Phenotype is a reference to a list containing 6 items:
-	0: (geneKO) a reference to a list where each element is a feature_id
-	1: (baseMedia) a media_id
-	2: (media_workspace) a workspace_id
-	3: (additionalCpd) a reference to a list where each element is a compound_id
-	4: (normalizedGrowth) a float
-	5: (label) a string
-feature_id is a string
 media_id is a string
-compound_id is a string
+model_statistics is a reference to a hash where the following keys are defined:
+	total_reactions has a value which is an int
+	total_genes has a value which is an int
+	total_compounds has a value which is an int
+	extracellular_compounds has a value which is an int
+	intracellular_compounds has a value which is an int
+	transport_reactions has a value which is an int
+	subsystem_reactions has a value which is an int
+	subsystem_genes has a value which is an int
+	spontaneous_reactions has a value which is an int
+	reactions_with_genes has a value which is an int
+	gapfilled_reactions has a value which is an int
+	model_genes has a value which is an int
+	minimal_essential_genes has a value which is an int
+	complete_essential_genes has a value which is an int
+	minimal_essential_reactions has a value which is an int
+	complete_essential_reactions has a value which is an int
+	minimal_blocked_reactions has a value which is an int
+	complete_blocked_reactions has a value which is an int
+	minimal_variable_reactions has a value which is an int
+	complete_variable_reactions has a value which is an int
+	growth_complete_media has a value which is a bool
+	growth_minimal_media has a value which is a bool
+	subsystems has a value which is a reference to a list where each element is a subsystem_statistics
 bool is an int
-object_metadata is a reference to a list containing 11 items:
-	0: (id) an object_id
-	1: (type) an object_type
-	2: (moddate) a timestamp
-	3: (instance) an int
-	4: (command) a string
-	5: (lastmodifier) a username
-	6: (owner) a username
-	7: (workspace) a workspace_id
-	8: (ref) a workspace_ref
-	9: (chsum) a string
-	10: (metadata) a reference to a hash where the key is a string and the value is a string
-object_id is a string
-object_type is a string
-timestamp is a string
-username is a string
-workspace_ref is a string
+subsystem_statistics is a reference to a hash where the following keys are defined:
+	name has a value which is a string
+	class has a value which is a string
+	subclass has a value which is a string
+	genes has a value which is an int
+	reactions has a value which is an int
+	model_genes has a value which is an int
+	minimal_essential_genes has a value which is an int
+	complete_essential_genes has a value which is an int
+	minimal_essential_reactions has a value which is an int
+	complete_essential_reactions has a value which is an int
+	minimal_blocked_reactions has a value which is an int
+	complete_blocked_reactions has a value which is an int
+	minimal_variable_reactions has a value which is an int
+	complete_variable_reactions has a value which is an int
 
 </pre>
 
@@ -5553,62 +5736,69 @@ workspace_ref is a string
 
 =begin text
 
-$input is an import_phenotypes_params
-$output is an object_metadata
-import_phenotypes_params is a reference to a hash where the following keys are defined:
-	phenotypeSet has a value which is a phenotype_set_id
-	workspace has a value which is a workspace_id
-	genome has a value which is a genome_id
-	genome_workspace has a value which is a workspace_id
-	phenotypes has a value which is a reference to a list where each element is a Phenotype
-	name has a value which is a string
-	source has a value which is a string
-	ignore_errors has a value which is a bool
-	auth has a value which is a string
-phenotype_set_id is a string
+$input is a generate_model_stats_params
+$output is a model_statistics
+generate_model_stats_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	minimal_media has a value which is a media_id
+	minimal_media_workspace has a value which is a workspace_id
+fbamodel_id is a string
 workspace_id is a string
-genome_id is a string
-Phenotype is a reference to a list containing 6 items:
-	0: (geneKO) a reference to a list where each element is a feature_id
-	1: (baseMedia) a media_id
-	2: (media_workspace) a workspace_id
-	3: (additionalCpd) a reference to a list where each element is a compound_id
-	4: (normalizedGrowth) a float
-	5: (label) a string
-feature_id is a string
 media_id is a string
-compound_id is a string
+model_statistics is a reference to a hash where the following keys are defined:
+	total_reactions has a value which is an int
+	total_genes has a value which is an int
+	total_compounds has a value which is an int
+	extracellular_compounds has a value which is an int
+	intracellular_compounds has a value which is an int
+	transport_reactions has a value which is an int
+	subsystem_reactions has a value which is an int
+	subsystem_genes has a value which is an int
+	spontaneous_reactions has a value which is an int
+	reactions_with_genes has a value which is an int
+	gapfilled_reactions has a value which is an int
+	model_genes has a value which is an int
+	minimal_essential_genes has a value which is an int
+	complete_essential_genes has a value which is an int
+	minimal_essential_reactions has a value which is an int
+	complete_essential_reactions has a value which is an int
+	minimal_blocked_reactions has a value which is an int
+	complete_blocked_reactions has a value which is an int
+	minimal_variable_reactions has a value which is an int
+	complete_variable_reactions has a value which is an int
+	growth_complete_media has a value which is a bool
+	growth_minimal_media has a value which is a bool
+	subsystems has a value which is a reference to a list where each element is a subsystem_statistics
 bool is an int
-object_metadata is a reference to a list containing 11 items:
-	0: (id) an object_id
-	1: (type) an object_type
-	2: (moddate) a timestamp
-	3: (instance) an int
-	4: (command) a string
-	5: (lastmodifier) a username
-	6: (owner) a username
-	7: (workspace) a workspace_id
-	8: (ref) a workspace_ref
-	9: (chsum) a string
-	10: (metadata) a reference to a hash where the key is a string and the value is a string
-object_id is a string
-object_type is a string
-timestamp is a string
-username is a string
-workspace_ref is a string
+subsystem_statistics is a reference to a hash where the following keys are defined:
+	name has a value which is a string
+	class has a value which is a string
+	subclass has a value which is a string
+	genes has a value which is an int
+	reactions has a value which is an int
+	model_genes has a value which is an int
+	minimal_essential_genes has a value which is an int
+	complete_essential_genes has a value which is an int
+	minimal_essential_reactions has a value which is an int
+	complete_essential_reactions has a value which is an int
+	minimal_blocked_reactions has a value which is an int
+	complete_blocked_reactions has a value which is an int
+	minimal_variable_reactions has a value which is an int
+	complete_variable_reactions has a value which is an int
 
 
 =end text
 
 =item Description
 
-Loads the specified phenotypes into the workspace
+Generate statistics with model and associated genome properties
 
 =back
 
 =cut
 
-sub import_phenotypes
+sub generate_model_stats
 {
     my($self, @args) = @_;
 
@@ -5617,7 +5807,7 @@ sub import_phenotypes
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function import_phenotypes (received $n, expecting 1)");
+							       "Invalid argument count for function generate_model_stats (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -5625,39 +5815,39 @@ sub import_phenotypes
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to import_phenotypes:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to generate_model_stats:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'import_phenotypes');
+								   method_name => 'generate_model_stats');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.import_phenotypes",
+	method => "fbaModelServices.generate_model_stats",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'import_phenotypes',
+					       method_name => 'generate_model_stats',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method import_phenotypes",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method generate_model_stats",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'import_phenotypes',
+					    method_name => 'generate_model_stats',
 				       );
     }
 }
 
 
 
-=head2 simulate_phenotypes
+=head2 minimize_reactions
 
-  $output = $obj->simulate_phenotypes($input)
+  $fbaMeta = $obj->minimize_reactions($input)
 
 =over 4
 
@@ -5666,24 +5856,19 @@ sub import_phenotypes
 =begin html
 
 <pre>
-$input is a simulate_phenotypes_params
-$output is an object_metadata
-simulate_phenotypes_params is a reference to a hash where the following keys are defined:
+$input is a minimize_reactions_params
+$fbaMeta is an object_metadata
+minimize_reactions_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
-	phenotypeSet has a value which is a phenotype_set_id
-	phenotypeSet_workspace has a value which is a workspace_id
-	formulation has a value which is an FBAFormulation
-	notes has a value which is a string
-	phenotypeSimulationSet has a value which is a phenotypeSimulationSet_id
 	workspace has a value which is a workspace_id
-	overwrite has a value which is a bool
-	auth has a value which is a string
-	all_transporters has a value which is a bool
-	positive_transporters has a value which is a bool
+	formulation has a value which is an FBAFormulation
+	reactions has a value which is a reference to a list where each element is a string
+	all_model_reactions has a value which is a bool
+	reaction_costs has a value which is a reference to a hash where the key is a string and the value is a float
+	output_id has a value which is a fba_id
 fbamodel_id is a string
 workspace_id is a string
-phenotype_set_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
 	media has a value which is a media_id
 	additionalcpds has a value which is a reference to a list where each element is a compound_id
@@ -5731,7 +5916,7 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
-phenotypeSimulationSet_id is a string
+fba_id is a string
 object_metadata is a reference to a list containing 11 items:
 	0: (id) an object_id
 	1: (type) an object_type
@@ -5756,24 +5941,19 @@ workspace_ref is a string
 
 =begin text
 
-$input is a simulate_phenotypes_params
-$output is an object_metadata
-simulate_phenotypes_params is a reference to a hash where the following keys are defined:
+$input is a minimize_reactions_params
+$fbaMeta is an object_metadata
+minimize_reactions_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
-	phenotypeSet has a value which is a phenotype_set_id
-	phenotypeSet_workspace has a value which is a workspace_id
-	formulation has a value which is an FBAFormulation
-	notes has a value which is a string
-	phenotypeSimulationSet has a value which is a phenotypeSimulationSet_id
 	workspace has a value which is a workspace_id
-	overwrite has a value which is a bool
-	auth has a value which is a string
-	all_transporters has a value which is a bool
-	positive_transporters has a value which is a bool
+	formulation has a value which is an FBAFormulation
+	reactions has a value which is a reference to a list where each element is a string
+	all_model_reactions has a value which is a bool
+	reaction_costs has a value which is a reference to a hash where the key is a string and the value is a float
+	output_id has a value which is a fba_id
 fbamodel_id is a string
 workspace_id is a string
-phenotype_set_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
 	media has a value which is a media_id
 	additionalcpds has a value which is a reference to a list where each element is a compound_id
@@ -5821,7 +6001,7 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
-phenotypeSimulationSet_id is a string
+fba_id is a string
 object_metadata is a reference to a list containing 11 items:
 	0: (id) an object_id
 	1: (type) an object_type
@@ -5845,13 +6025,13 @@ workspace_ref is a string
 
 =item Description
 
-Simulates the specified phenotype set
+Minimize the specified set of reactions while maintaining the FBA objective above a specified threshold
 
 =back
 
 =cut
 
-sub simulate_phenotypes
+sub minimize_reactions
 {
     my($self, @args) = @_;
 
@@ -5860,7 +6040,7 @@ sub simulate_phenotypes
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function simulate_phenotypes (received $n, expecting 1)");
+							       "Invalid argument count for function minimize_reactions (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -5868,39 +6048,39 @@ sub simulate_phenotypes
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to simulate_phenotypes:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to minimize_reactions:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'simulate_phenotypes');
+								   method_name => 'minimize_reactions');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.simulate_phenotypes",
+	method => "fbaModelServices.minimize_reactions",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'simulate_phenotypes',
+					       method_name => 'minimize_reactions',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method simulate_phenotypes",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method minimize_reactions",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'simulate_phenotypes',
+					    method_name => 'minimize_reactions',
 				       );
     }
 }
 
 
 
-=head2 add_media_transporters
+=head2 export_fba
 
-  $output = $obj->add_media_transporters($input)
+  $output = $obj->export_fba($input)
 
 =over 4
 
@@ -5909,159 +6089,14 @@ sub simulate_phenotypes
 =begin html
 
 <pre>
-$input is an add_media_transporters_params
-$output is an object_metadata
-add_media_transporters_params is a reference to a hash where the following keys are defined:
-	phenotypeSet has a value which is a phenotype_set_id
-	phenotypeSet_workspace has a value which is a workspace_id
-	model has a value which is a fbamodel_id
-	model_workspace has a value which is a workspace_id
-	outmodel has a value which is a fbamodel_id
+$input is an export_fba_params
+$output is a string
+export_fba_params is a reference to a hash where the following keys are defined:
+	fba has a value which is a fba_id
 	workspace has a value which is a workspace_id
-	overwrite has a value which is a bool
+	format has a value which is a string
 	auth has a value which is a string
-	all_transporters has a value which is a bool
-	positive_transporters has a value which is a bool
-phenotype_set_id is a string
-workspace_id is a string
-fbamodel_id is a string
-bool is an int
-object_metadata is a reference to a list containing 11 items:
-	0: (id) an object_id
-	1: (type) an object_type
-	2: (moddate) a timestamp
-	3: (instance) an int
-	4: (command) a string
-	5: (lastmodifier) a username
-	6: (owner) a username
-	7: (workspace) a workspace_id
-	8: (ref) a workspace_ref
-	9: (chsum) a string
-	10: (metadata) a reference to a hash where the key is a string and the value is a string
-object_id is a string
-object_type is a string
-timestamp is a string
-username is a string
-workspace_ref is a string
-
-</pre>
-
-=end html
-
-=begin text
-
-$input is an add_media_transporters_params
-$output is an object_metadata
-add_media_transporters_params is a reference to a hash where the following keys are defined:
-	phenotypeSet has a value which is a phenotype_set_id
-	phenotypeSet_workspace has a value which is a workspace_id
-	model has a value which is a fbamodel_id
-	model_workspace has a value which is a workspace_id
-	outmodel has a value which is a fbamodel_id
-	workspace has a value which is a workspace_id
-	overwrite has a value which is a bool
-	auth has a value which is a string
-	all_transporters has a value which is a bool
-	positive_transporters has a value which is a bool
-phenotype_set_id is a string
-workspace_id is a string
-fbamodel_id is a string
-bool is an int
-object_metadata is a reference to a list containing 11 items:
-	0: (id) an object_id
-	1: (type) an object_type
-	2: (moddate) a timestamp
-	3: (instance) an int
-	4: (command) a string
-	5: (lastmodifier) a username
-	6: (owner) a username
-	7: (workspace) a workspace_id
-	8: (ref) a workspace_ref
-	9: (chsum) a string
-	10: (metadata) a reference to a hash where the key is a string and the value is a string
-object_id is a string
-object_type is a string
-timestamp is a string
-username is a string
-workspace_ref is a string
-
-
-=end text
-
-=item Description
-
-Adds transporters for media in a PhenotypeSet to a model
-
-=back
-
-=cut
-
-sub add_media_transporters
-{
-    my($self, @args) = @_;
-
-# Authentication: required
-
-    if ((my $n = @args) != 1)
-    {
-	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function add_media_transporters (received $n, expecting 1)");
-    }
-    {
-	my($input) = @args;
-
-	my @_bad_arguments;
-        (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
-        if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to add_media_transporters:\n" . join("", map { "\t$_\n" } @_bad_arguments);
-	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'add_media_transporters');
-	}
-    }
-
-    my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.add_media_transporters",
-	params => \@args,
-    });
-    if ($result) {
-	if ($result->is_error) {
-	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
-					       code => $result->content->{error}->{code},
-					       method_name => 'add_media_transporters',
-					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
-					      );
-	} else {
-	    return wantarray ? @{$result->result} : $result->result->[0];
-	}
-    } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method add_media_transporters",
-					    status_line => $self->{client}->status_line,
-					    method_name => 'add_media_transporters',
-				       );
-    }
-}
-
-
-
-=head2 export_phenotypeSimulationSet
-
-  $output = $obj->export_phenotypeSimulationSet($input)
-
-=over 4
-
-=item Parameter and return types
-
-=begin html
-
-<pre>
-$input is an export_phenotypeSimulationSet_params
-$output is a string
-export_phenotypeSimulationSet_params is a reference to a hash where the following keys are defined:
-	phenotypeSimulationSet has a value which is a phenotypeSimulationSet_id
-	workspace has a value which is a workspace_id
-	format has a value which is a string
-	auth has a value which is a string
-phenotypeSimulationSet_id is a string
+fba_id is a string
 workspace_id is a string
 
 </pre>
@@ -6070,14 +6105,14 @@ workspace_id is a string
 
 =begin text
 
-$input is an export_phenotypeSimulationSet_params
+$input is an export_fba_params
 $output is a string
-export_phenotypeSimulationSet_params is a reference to a hash where the following keys are defined:
-	phenotypeSimulationSet has a value which is a phenotypeSimulationSet_id
+export_fba_params is a reference to a hash where the following keys are defined:
+	fba has a value which is a fba_id
 	workspace has a value which is a workspace_id
 	format has a value which is a string
 	auth has a value which is a string
-phenotypeSimulationSet_id is a string
+fba_id is a string
 workspace_id is a string
 
 
@@ -6085,13 +6120,13 @@ workspace_id is a string
 
 =item Description
 
-Export a PhenotypeSimulationSet for viewing
+Export an FBA solution for viewing
 
 =back
 
 =cut
 
-sub export_phenotypeSimulationSet
+sub export_fba
 {
     my($self, @args) = @_;
 
@@ -6100,7 +6135,7 @@ sub export_phenotypeSimulationSet
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function export_phenotypeSimulationSet (received $n, expecting 1)");
+							       "Invalid argument count for function export_fba (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -6108,39 +6143,39 @@ sub export_phenotypeSimulationSet
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to export_phenotypeSimulationSet:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to export_fba:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'export_phenotypeSimulationSet');
+								   method_name => 'export_fba');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.export_phenotypeSimulationSet",
+	method => "fbaModelServices.export_fba",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'export_phenotypeSimulationSet',
+					       method_name => 'export_fba',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method export_phenotypeSimulationSet",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method export_fba",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'export_phenotypeSimulationSet',
+					    method_name => 'export_fba',
 				       );
     }
 }
 
 
 
-=head2 integrate_reconciliation_solutions
+=head2 import_phenotypes
 
-  $modelMeta = $obj->integrate_reconciliation_solutions($input)
+  $output = $obj->import_phenotypes($input)
 
 =over 4
 
@@ -6149,21 +6184,31 @@ sub export_phenotypeSimulationSet
 =begin html
 
 <pre>
-$input is an integrate_reconciliation_solutions_params
-$modelMeta is an object_metadata
-integrate_reconciliation_solutions_params is a reference to a hash where the following keys are defined:
-	model has a value which is a fbamodel_id
-	model_workspace has a value which is a workspace_id
-	gapfillSolutions has a value which is a reference to a list where each element is a gapfillsolution_id
-	gapgenSolutions has a value which is a reference to a list where each element is a gapgensolution_id
-	out_model has a value which is a fbamodel_id
+$input is an import_phenotypes_params
+$output is an object_metadata
+import_phenotypes_params is a reference to a hash where the following keys are defined:
+	phenotypeSet has a value which is a phenotype_set_id
 	workspace has a value which is a workspace_id
+	genome has a value which is a genome_id
+	genome_workspace has a value which is a workspace_id
+	phenotypes has a value which is a reference to a list where each element is a Phenotype
+	name has a value which is a string
+	source has a value which is a string
+	ignore_errors has a value which is a bool
 	auth has a value which is a string
-	overwrite has a value which is a bool
-fbamodel_id is a string
+phenotype_set_id is a string
 workspace_id is a string
-gapfillsolution_id is a string
-gapgensolution_id is a string
+genome_id is a string
+Phenotype is a reference to a list containing 6 items:
+	0: (geneKO) a reference to a list where each element is a feature_id
+	1: (baseMedia) a media_id
+	2: (media_workspace) a workspace_id
+	3: (additionalCpd) a reference to a list where each element is a compound_id
+	4: (normalizedGrowth) a float
+	5: (label) a string
+feature_id is a string
+media_id is a string
+compound_id is a string
 bool is an int
 object_metadata is a reference to a list containing 11 items:
 	0: (id) an object_id
@@ -6189,21 +6234,31 @@ workspace_ref is a string
 
 =begin text
 
-$input is an integrate_reconciliation_solutions_params
-$modelMeta is an object_metadata
-integrate_reconciliation_solutions_params is a reference to a hash where the following keys are defined:
-	model has a value which is a fbamodel_id
-	model_workspace has a value which is a workspace_id
-	gapfillSolutions has a value which is a reference to a list where each element is a gapfillsolution_id
-	gapgenSolutions has a value which is a reference to a list where each element is a gapgensolution_id
-	out_model has a value which is a fbamodel_id
+$input is an import_phenotypes_params
+$output is an object_metadata
+import_phenotypes_params is a reference to a hash where the following keys are defined:
+	phenotypeSet has a value which is a phenotype_set_id
 	workspace has a value which is a workspace_id
+	genome has a value which is a genome_id
+	genome_workspace has a value which is a workspace_id
+	phenotypes has a value which is a reference to a list where each element is a Phenotype
+	name has a value which is a string
+	source has a value which is a string
+	ignore_errors has a value which is a bool
 	auth has a value which is a string
-	overwrite has a value which is a bool
-fbamodel_id is a string
+phenotype_set_id is a string
 workspace_id is a string
-gapfillsolution_id is a string
-gapgensolution_id is a string
+genome_id is a string
+Phenotype is a reference to a list containing 6 items:
+	0: (geneKO) a reference to a list where each element is a feature_id
+	1: (baseMedia) a media_id
+	2: (media_workspace) a workspace_id
+	3: (additionalCpd) a reference to a list where each element is a compound_id
+	4: (normalizedGrowth) a float
+	5: (label) a string
+feature_id is a string
+media_id is a string
+compound_id is a string
 bool is an int
 object_metadata is a reference to a list containing 11 items:
 	0: (id) an object_id
@@ -6228,13 +6283,13 @@ workspace_ref is a string
 
 =item Description
 
-Integrates the specified gapfill and gapgen solutions into the specified model
+Loads the specified phenotypes into the workspace
 
 =back
 
 =cut
 
-sub integrate_reconciliation_solutions
+sub import_phenotypes
 {
     my($self, @args) = @_;
 
@@ -6243,7 +6298,7 @@ sub integrate_reconciliation_solutions
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function integrate_reconciliation_solutions (received $n, expecting 1)");
+							       "Invalid argument count for function import_phenotypes (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -6251,39 +6306,39 @@ sub integrate_reconciliation_solutions
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to integrate_reconciliation_solutions:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to import_phenotypes:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'integrate_reconciliation_solutions');
+								   method_name => 'import_phenotypes');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.integrate_reconciliation_solutions",
+	method => "fbaModelServices.import_phenotypes",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'integrate_reconciliation_solutions',
+					       method_name => 'import_phenotypes',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method integrate_reconciliation_solutions",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method import_phenotypes",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'integrate_reconciliation_solutions',
+					    method_name => 'import_phenotypes',
 				       );
     }
 }
 
 
 
-=head2 queue_runfba
+=head2 simulate_phenotypes
 
-  $job = $obj->queue_runfba($input)
+  $output = $obj->simulate_phenotypes($input)
 
 =over 4
 
@@ -6292,24 +6347,24 @@ sub integrate_reconciliation_solutions
 =begin html
 
 <pre>
-$input is a queue_runfba_params
-$job is a JobObject
-queue_runfba_params is a reference to a hash where the following keys are defined:
-	model has a value which is a fbamodel_id
+$input is a simulate_phenotypes_params
+$output is an object_metadata
+simulate_phenotypes_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
+	phenotypeSet has a value which is a phenotype_set_id
+	phenotypeSet_workspace has a value which is a workspace_id
 	formulation has a value which is an FBAFormulation
-	fva has a value which is a bool
-	simulateko has a value which is a bool
-	minimizeflux has a value which is a bool
-	findminmedia has a value which is a bool
 	notes has a value which is a string
-	fba has a value which is a fba_id
+	phenotypeSimulationSet has a value which is a phenotypeSimulationSet_id
 	workspace has a value which is a workspace_id
-	auth has a value which is a string
 	overwrite has a value which is a bool
-	add_to_model has a value which is a bool
+	auth has a value which is a string
+	all_transporters has a value which is a bool
+	positive_transporters has a value which is a bool
 fbamodel_id is a string
 workspace_id is a string
+phenotype_set_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
 	media has a value which is a media_id
 	additionalcpds has a value which is a reference to a list where each element is a compound_id
@@ -6357,19 +6412,24 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
-fba_id is a string
-JobObject is a reference to a hash where the following keys are defined:
-	id has a value which is a job_id
-	type has a value which is a string
-	auth has a value which is a string
-	status has a value which is a string
-	jobdata has a value which is a reference to a hash where the key is a string and the value is a string
-	queuetime has a value which is a string
-	starttime has a value which is a string
-	completetime has a value which is a string
-	owner has a value which is a string
-	queuecommand has a value which is a string
-job_id is a string
+phenotypeSimulationSet_id is a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
 
 </pre>
 
@@ -6377,24 +6437,24 @@ job_id is a string
 
 =begin text
 
-$input is a queue_runfba_params
-$job is a JobObject
-queue_runfba_params is a reference to a hash where the following keys are defined:
+$input is a simulate_phenotypes_params
+$output is an object_metadata
+simulate_phenotypes_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
+	phenotypeSet has a value which is a phenotype_set_id
+	phenotypeSet_workspace has a value which is a workspace_id
 	formulation has a value which is an FBAFormulation
-	fva has a value which is a bool
-	simulateko has a value which is a bool
-	minimizeflux has a value which is a bool
-	findminmedia has a value which is a bool
 	notes has a value which is a string
-	fba has a value which is a fba_id
+	phenotypeSimulationSet has a value which is a phenotypeSimulationSet_id
 	workspace has a value which is a workspace_id
-	auth has a value which is a string
 	overwrite has a value which is a bool
-	add_to_model has a value which is a bool
+	auth has a value which is a string
+	all_transporters has a value which is a bool
+	positive_transporters has a value which is a bool
 fbamodel_id is a string
 workspace_id is a string
+phenotype_set_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
 	media has a value which is a media_id
 	additionalcpds has a value which is a reference to a list where each element is a compound_id
@@ -6442,32 +6502,37 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
-fba_id is a string
-JobObject is a reference to a hash where the following keys are defined:
-	id has a value which is a job_id
-	type has a value which is a string
-	auth has a value which is a string
-	status has a value which is a string
-	jobdata has a value which is a reference to a hash where the key is a string and the value is a string
-	queuetime has a value which is a string
-	starttime has a value which is a string
-	completetime has a value which is a string
-	owner has a value which is a string
-	queuecommand has a value which is a string
-job_id is a string
+phenotypeSimulationSet_id is a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
 
 
 =end text
 
 =item Description
 
-Queues an FBA job in a single media condition
+Simulates the specified phenotype set
 
 =back
 
 =cut
 
-sub queue_runfba
+sub simulate_phenotypes
 {
     my($self, @args) = @_;
 
@@ -6476,7 +6541,7 @@ sub queue_runfba
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function queue_runfba (received $n, expecting 1)");
+							       "Invalid argument count for function simulate_phenotypes (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -6484,39 +6549,39 @@ sub queue_runfba
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to queue_runfba:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to simulate_phenotypes:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'queue_runfba');
+								   method_name => 'simulate_phenotypes');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.queue_runfba",
+	method => "fbaModelServices.simulate_phenotypes",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'queue_runfba',
+					       method_name => 'simulate_phenotypes',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method queue_runfba",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method simulate_phenotypes",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'queue_runfba',
+					    method_name => 'simulate_phenotypes',
 				       );
     }
 }
 
 
 
-=head2 queue_gapfill_model
+=head2 add_media_transporters
 
-  $job = $obj->queue_gapfill_model($input)
+  $output = $obj->add_media_transporters($input)
 
 =over 4
 
@@ -6525,111 +6590,40 @@ sub queue_runfba
 =begin html
 
 <pre>
-$input is a gapfill_model_params
-$job is a JobObject
-gapfill_model_params is a reference to a hash where the following keys are defined:
-	model has a value which is a fbamodel_id
-	model_workspace has a value which is a workspace_id
-	formulation has a value which is a GapfillingFormulation
+$input is an add_media_transporters_params
+$output is an object_metadata
+add_media_transporters_params is a reference to a hash where the following keys are defined:
 	phenotypeSet has a value which is a phenotype_set_id
 	phenotypeSet_workspace has a value which is a workspace_id
-	integrate_solution has a value which is a bool
-	target_reactions has a value which is a reference to a list where each element is a string
-	out_model has a value which is a fbamodel_id
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	outmodel has a value which is a fbamodel_id
 	workspace has a value which is a workspace_id
-	gapFill has a value which is a gapfill_id
-	timePerSolution has a value which is an int
-	totalTimeLimit has a value which is an int
-	auth has a value which is a string
 	overwrite has a value which is a bool
-	completeGapfill has a value which is a bool
-fbamodel_id is a string
+	auth has a value which is a string
+	all_transporters has a value which is a bool
+	positive_transporters has a value which is a bool
+phenotype_set_id is a string
 workspace_id is a string
-GapfillingFormulation is a reference to a hash where the following keys are defined:
-	formulation has a value which is an FBAFormulation
-	num_solutions has a value which is an int
-	nomediahyp has a value which is a bool
-	nobiomasshyp has a value which is a bool
-	nogprhyp has a value which is a bool
-	nopathwayhyp has a value which is a bool
-	allowunbalanced has a value which is a bool
-	activitybonus has a value which is a float
-	drainpen has a value which is a float
-	directionpen has a value which is a float
-	nostructpen has a value which is a float
-	unfavorablepen has a value which is a float
-	nodeltagpen has a value which is a float
-	biomasstranspen has a value which is a float
-	singletranspen has a value which is a float
-	transpen has a value which is a float
-	blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
-	gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
-	allowedcmps has a value which is a reference to a list where each element is a compartment_id
-	probabilisticAnnotation has a value which is a probanno_id
-	probabilisticAnnotation_workspace has a value which is a workspace_id
-FBAFormulation is a reference to a hash where the following keys are defined:
-	media has a value which is a media_id
-	additionalcpds has a value which is a reference to a list where each element is a compound_id
-	promconstraint has a value which is a promconstraint_id
-	promconstraint_workspace has a value which is a workspace_id
-	eflux_sample has a value which is a sample_id
-	eflux_series has a value which is a series_id
-	eflux_workspace has a value which is a workspace_id
-	media_workspace has a value which is a workspace_id
-	objfraction has a value which is a float
-	allreversible has a value which is a bool
-	maximizeObjective has a value which is a bool
-	objectiveTerms has a value which is a reference to a list where each element is a term
-	geneko has a value which is a reference to a list where each element is a feature_id
-	rxnko has a value which is a reference to a list where each element is a reaction_id
-	bounds has a value which is a reference to a list where each element is a bound
-	constraints has a value which is a reference to a list where each element is a constraint
-	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
-	defaultmaxflux has a value which is a float
-	defaultminuptake has a value which is a float
-	defaultmaxuptake has a value which is a float
-	simplethermoconst has a value which is a bool
-	thermoconst has a value which is a bool
-	nothermoerror has a value which is a bool
-	minthermoerror has a value which is a bool
-media_id is a string
-compound_id is a string
-promconstraint_id is a string
-sample_id is a string
-series_id is a string
+fbamodel_id is a string
 bool is an int
-term is a reference to a list containing 3 items:
-	0: (coefficient) a float
-	1: (varType) a string
-	2: (variable) a string
-feature_id is a string
-reaction_id is a string
-bound is a reference to a list containing 4 items:
-	0: (min) a float
-	1: (max) a float
-	2: (varType) a string
-	3: (variable) a string
-constraint is a reference to a list containing 4 items:
-	0: (rhs) a float
-	1: (sign) a string
-	2: (terms) a reference to a list where each element is a term
-	3: (name) a string
-compartment_id is a string
-probanno_id is a string
-phenotype_set_id is a string
-gapfill_id is a string
-JobObject is a reference to a hash where the following keys are defined:
-	id has a value which is a job_id
-	type has a value which is a string
-	auth has a value which is a string
-	status has a value which is a string
-	jobdata has a value which is a reference to a hash where the key is a string and the value is a string
-	queuetime has a value which is a string
-	starttime has a value which is a string
-	completetime has a value which is a string
-	owner has a value which is a string
-	queuecommand has a value which is a string
-job_id is a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
 
 </pre>
 
@@ -6637,13 +6631,700 @@ job_id is a string
 
 =begin text
 
-$input is a gapfill_model_params
-$job is a JobObject
-gapfill_model_params is a reference to a hash where the following keys are defined:
-	model has a value which is a fbamodel_id
-	model_workspace has a value which is a workspace_id
-	formulation has a value which is a GapfillingFormulation
-	phenotypeSet has a value which is a phenotype_set_id
+$input is an add_media_transporters_params
+$output is an object_metadata
+add_media_transporters_params is a reference to a hash where the following keys are defined:
+	phenotypeSet has a value which is a phenotype_set_id
+	phenotypeSet_workspace has a value which is a workspace_id
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	outmodel has a value which is a fbamodel_id
+	workspace has a value which is a workspace_id
+	overwrite has a value which is a bool
+	auth has a value which is a string
+	all_transporters has a value which is a bool
+	positive_transporters has a value which is a bool
+phenotype_set_id is a string
+workspace_id is a string
+fbamodel_id is a string
+bool is an int
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
+
+
+=end text
+
+=item Description
+
+Adds transporters for media in a PhenotypeSet to a model
+
+=back
+
+=cut
+
+sub add_media_transporters
+{
+    my($self, @args) = @_;
+
+# Authentication: required
+
+    if ((my $n = @args) != 1)
+    {
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
+							       "Invalid argument count for function add_media_transporters (received $n, expecting 1)");
+    }
+    {
+	my($input) = @args;
+
+	my @_bad_arguments;
+        (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
+        if (@_bad_arguments) {
+	    my $msg = "Invalid arguments passed to add_media_transporters:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+								   method_name => 'add_media_transporters');
+	}
+    }
+
+    my $result = $self->{client}->call($self->{url}, $self->{headers}, {
+	method => "fbaModelServices.add_media_transporters",
+	params => \@args,
+    });
+    if ($result) {
+	if ($result->is_error) {
+	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
+					       code => $result->content->{error}->{code},
+					       method_name => 'add_media_transporters',
+					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
+					      );
+	} else {
+	    return wantarray ? @{$result->result} : $result->result->[0];
+	}
+    } else {
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method add_media_transporters",
+					    status_line => $self->{client}->status_line,
+					    method_name => 'add_media_transporters',
+				       );
+    }
+}
+
+
+
+=head2 export_phenotypeSimulationSet
+
+  $output = $obj->export_phenotypeSimulationSet($input)
+
+=over 4
+
+=item Parameter and return types
+
+=begin html
+
+<pre>
+$input is an export_phenotypeSimulationSet_params
+$output is a string
+export_phenotypeSimulationSet_params is a reference to a hash where the following keys are defined:
+	phenotypeSimulationSet has a value which is a phenotypeSimulationSet_id
+	workspace has a value which is a workspace_id
+	format has a value which is a string
+	auth has a value which is a string
+phenotypeSimulationSet_id is a string
+workspace_id is a string
+
+</pre>
+
+=end html
+
+=begin text
+
+$input is an export_phenotypeSimulationSet_params
+$output is a string
+export_phenotypeSimulationSet_params is a reference to a hash where the following keys are defined:
+	phenotypeSimulationSet has a value which is a phenotypeSimulationSet_id
+	workspace has a value which is a workspace_id
+	format has a value which is a string
+	auth has a value which is a string
+phenotypeSimulationSet_id is a string
+workspace_id is a string
+
+
+=end text
+
+=item Description
+
+Export a PhenotypeSimulationSet for viewing
+
+=back
+
+=cut
+
+sub export_phenotypeSimulationSet
+{
+    my($self, @args) = @_;
+
+# Authentication: optional
+
+    if ((my $n = @args) != 1)
+    {
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
+							       "Invalid argument count for function export_phenotypeSimulationSet (received $n, expecting 1)");
+    }
+    {
+	my($input) = @args;
+
+	my @_bad_arguments;
+        (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
+        if (@_bad_arguments) {
+	    my $msg = "Invalid arguments passed to export_phenotypeSimulationSet:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+								   method_name => 'export_phenotypeSimulationSet');
+	}
+    }
+
+    my $result = $self->{client}->call($self->{url}, $self->{headers}, {
+	method => "fbaModelServices.export_phenotypeSimulationSet",
+	params => \@args,
+    });
+    if ($result) {
+	if ($result->is_error) {
+	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
+					       code => $result->content->{error}->{code},
+					       method_name => 'export_phenotypeSimulationSet',
+					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
+					      );
+	} else {
+	    return wantarray ? @{$result->result} : $result->result->[0];
+	}
+    } else {
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method export_phenotypeSimulationSet",
+					    status_line => $self->{client}->status_line,
+					    method_name => 'export_phenotypeSimulationSet',
+				       );
+    }
+}
+
+
+
+=head2 integrate_reconciliation_solutions
+
+  $modelMeta = $obj->integrate_reconciliation_solutions($input)
+
+=over 4
+
+=item Parameter and return types
+
+=begin html
+
+<pre>
+$input is an integrate_reconciliation_solutions_params
+$modelMeta is an object_metadata
+integrate_reconciliation_solutions_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	gapfillSolutions has a value which is a reference to a list where each element is a gapfillsolution_id
+	gapgenSolutions has a value which is a reference to a list where each element is a gapgensolution_id
+	out_model has a value which is a fbamodel_id
+	workspace has a value which is a workspace_id
+	auth has a value which is a string
+	overwrite has a value which is a bool
+fbamodel_id is a string
+workspace_id is a string
+gapfillsolution_id is a string
+gapgensolution_id is a string
+bool is an int
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
+
+</pre>
+
+=end html
+
+=begin text
+
+$input is an integrate_reconciliation_solutions_params
+$modelMeta is an object_metadata
+integrate_reconciliation_solutions_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	gapfillSolutions has a value which is a reference to a list where each element is a gapfillsolution_id
+	gapgenSolutions has a value which is a reference to a list where each element is a gapgensolution_id
+	out_model has a value which is a fbamodel_id
+	workspace has a value which is a workspace_id
+	auth has a value which is a string
+	overwrite has a value which is a bool
+fbamodel_id is a string
+workspace_id is a string
+gapfillsolution_id is a string
+gapgensolution_id is a string
+bool is an int
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
+
+
+=end text
+
+=item Description
+
+Integrates the specified gapfill and gapgen solutions into the specified model
+
+=back
+
+=cut
+
+sub integrate_reconciliation_solutions
+{
+    my($self, @args) = @_;
+
+# Authentication: required
+
+    if ((my $n = @args) != 1)
+    {
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
+							       "Invalid argument count for function integrate_reconciliation_solutions (received $n, expecting 1)");
+    }
+    {
+	my($input) = @args;
+
+	my @_bad_arguments;
+        (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
+        if (@_bad_arguments) {
+	    my $msg = "Invalid arguments passed to integrate_reconciliation_solutions:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+								   method_name => 'integrate_reconciliation_solutions');
+	}
+    }
+
+    my $result = $self->{client}->call($self->{url}, $self->{headers}, {
+	method => "fbaModelServices.integrate_reconciliation_solutions",
+	params => \@args,
+    });
+    if ($result) {
+	if ($result->is_error) {
+	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
+					       code => $result->content->{error}->{code},
+					       method_name => 'integrate_reconciliation_solutions',
+					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
+					      );
+	} else {
+	    return wantarray ? @{$result->result} : $result->result->[0];
+	}
+    } else {
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method integrate_reconciliation_solutions",
+					    status_line => $self->{client}->status_line,
+					    method_name => 'integrate_reconciliation_solutions',
+				       );
+    }
+}
+
+
+
+=head2 queue_runfba
+
+  $job = $obj->queue_runfba($input)
+
+=over 4
+
+=item Parameter and return types
+
+=begin html
+
+<pre>
+$input is a queue_runfba_params
+$job is a JobObject
+queue_runfba_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	fva has a value which is a bool
+	simulateko has a value which is a bool
+	minimizeflux has a value which is a bool
+	findminmedia has a value which is a bool
+	notes has a value which is a string
+	fba has a value which is a fba_id
+	workspace has a value which is a workspace_id
+	auth has a value which is a string
+	overwrite has a value which is a bool
+	add_to_model has a value which is a bool
+fbamodel_id is a string
+workspace_id is a string
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+fba_id is a string
+JobObject is a reference to a hash where the following keys are defined:
+	id has a value which is a job_id
+	type has a value which is a string
+	auth has a value which is a string
+	status has a value which is a string
+	jobdata has a value which is a reference to a hash where the key is a string and the value is a string
+	queuetime has a value which is a string
+	starttime has a value which is a string
+	completetime has a value which is a string
+	owner has a value which is a string
+	queuecommand has a value which is a string
+job_id is a string
+
+</pre>
+
+=end html
+
+=begin text
+
+$input is a queue_runfba_params
+$job is a JobObject
+queue_runfba_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	fva has a value which is a bool
+	simulateko has a value which is a bool
+	minimizeflux has a value which is a bool
+	findminmedia has a value which is a bool
+	notes has a value which is a string
+	fba has a value which is a fba_id
+	workspace has a value which is a workspace_id
+	auth has a value which is a string
+	overwrite has a value which is a bool
+	add_to_model has a value which is a bool
+fbamodel_id is a string
+workspace_id is a string
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+fba_id is a string
+JobObject is a reference to a hash where the following keys are defined:
+	id has a value which is a job_id
+	type has a value which is a string
+	auth has a value which is a string
+	status has a value which is a string
+	jobdata has a value which is a reference to a hash where the key is a string and the value is a string
+	queuetime has a value which is a string
+	starttime has a value which is a string
+	completetime has a value which is a string
+	owner has a value which is a string
+	queuecommand has a value which is a string
+job_id is a string
+
+
+=end text
+
+=item Description
+
+Queues an FBA job in a single media condition
+
+=back
+
+=cut
+
+sub queue_runfba
+{
+    my($self, @args) = @_;
+
+# Authentication: required
+
+    if ((my $n = @args) != 1)
+    {
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
+							       "Invalid argument count for function queue_runfba (received $n, expecting 1)");
+    }
+    {
+	my($input) = @args;
+
+	my @_bad_arguments;
+        (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
+        if (@_bad_arguments) {
+	    my $msg = "Invalid arguments passed to queue_runfba:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+								   method_name => 'queue_runfba');
+	}
+    }
+
+    my $result = $self->{client}->call($self->{url}, $self->{headers}, {
+	method => "fbaModelServices.queue_runfba",
+	params => \@args,
+    });
+    if ($result) {
+	if ($result->is_error) {
+	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
+					       code => $result->content->{error}->{code},
+					       method_name => 'queue_runfba',
+					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
+					      );
+	} else {
+	    return wantarray ? @{$result->result} : $result->result->[0];
+	}
+    } else {
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method queue_runfba",
+					    status_line => $self->{client}->status_line,
+					    method_name => 'queue_runfba',
+				       );
+    }
+}
+
+
+
+=head2 queue_gapfill_model
+
+  $job = $obj->queue_gapfill_model($input)
+
+=over 4
+
+=item Parameter and return types
+
+=begin html
+
+<pre>
+$input is a gapfill_model_params
+$job is a JobObject
+gapfill_model_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	formulation has a value which is a GapfillingFormulation
+	phenotypeSet has a value which is a phenotype_set_id
+	phenotypeSet_workspace has a value which is a workspace_id
+	integrate_solution has a value which is a bool
+	target_reactions has a value which is a reference to a list where each element is a string
+	out_model has a value which is a fbamodel_id
+	workspace has a value which is a workspace_id
+	gapFill has a value which is a gapfill_id
+	timePerSolution has a value which is an int
+	totalTimeLimit has a value which is an int
+	auth has a value which is a string
+	overwrite has a value which is a bool
+	completeGapfill has a value which is a bool
+fbamodel_id is a string
+workspace_id is a string
+GapfillingFormulation is a reference to a hash where the following keys are defined:
+	formulation has a value which is an FBAFormulation
+	num_solutions has a value which is an int
+	nomediahyp has a value which is a bool
+	nobiomasshyp has a value which is a bool
+	nogprhyp has a value which is a bool
+	nopathwayhyp has a value which is a bool
+	allowunbalanced has a value which is a bool
+	activitybonus has a value which is a float
+	drainpen has a value which is a float
+	directionpen has a value which is a float
+	nostructpen has a value which is a float
+	unfavorablepen has a value which is a float
+	nodeltagpen has a value which is a float
+	biomasstranspen has a value which is a float
+	singletranspen has a value which is a float
+	transpen has a value which is a float
+	blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
+	gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
+	allowedcmps has a value which is a reference to a list where each element is a compartment_id
+	probabilisticAnnotation has a value which is a probanno_id
+	probabilisticAnnotation_workspace has a value which is a workspace_id
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+compartment_id is a string
+probanno_id is a string
+phenotype_set_id is a string
+gapfill_id is a string
+JobObject is a reference to a hash where the following keys are defined:
+	id has a value which is a job_id
+	type has a value which is a string
+	auth has a value which is a string
+	status has a value which is a string
+	jobdata has a value which is a reference to a hash where the key is a string and the value is a string
+	queuetime has a value which is a string
+	starttime has a value which is a string
+	completetime has a value which is a string
+	owner has a value which is a string
+	queuecommand has a value which is a string
+job_id is a string
+
+</pre>
+
+=end html
+
+=begin text
+
+$input is a gapfill_model_params
+$job is a JobObject
+gapfill_model_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	formulation has a value which is a GapfillingFormulation
+	phenotypeSet has a value which is a phenotype_set_id
 	phenotypeSet_workspace has a value which is a workspace_id
 	integrate_solution has a value which is a bool
 	target_reactions has a value which is a reference to a list where each element is a string
@@ -7438,23 +8119,308 @@ constraint is a reference to a list containing 4 items:
 	3: (name) a string
 phenotype_set_id is a string
 gapgen_id is a string
-object_metadata is a reference to a list containing 11 items:
-	0: (id) an object_id
-	1: (type) an object_type
-	2: (moddate) a timestamp
-	3: (instance) an int
-	4: (command) a string
-	5: (lastmodifier) a username
-	6: (owner) a username
-	7: (workspace) a workspace_id
-	8: (ref) a workspace_ref
-	9: (chsum) a string
-	10: (metadata) a reference to a hash where the key is a string and the value is a string
-object_id is a string
-object_type is a string
-timestamp is a string
-username is a string
-workspace_ref is a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
+
+</pre>
+
+=end html
+
+=begin text
+
+$input is a gapgen_model_params
+$modelMeta is an object_metadata
+gapgen_model_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	formulation has a value which is a GapgenFormulation
+	phenotypeSet has a value which is a phenotype_set_id
+	phenotypeSet_workspace has a value which is a workspace_id
+	integrate_solution has a value which is a bool
+	out_model has a value which is a fbamodel_id
+	workspace has a value which is a workspace_id
+	gapGen has a value which is a gapgen_id
+	auth has a value which is a string
+	timePerSolution has a value which is an int
+	totalTimeLimit has a value which is an int
+	overwrite has a value which is a bool
+fbamodel_id is a string
+workspace_id is a string
+GapgenFormulation is a reference to a hash where the following keys are defined:
+	formulation has a value which is an FBAFormulation
+	refmedia has a value which is a media_id
+	refmedia_workspace has a value which is a workspace_id
+	num_solutions has a value which is an int
+	nomediahyp has a value which is a bool
+	nobiomasshyp has a value which is a bool
+	nogprhyp has a value which is a bool
+	nopathwayhyp has a value which is a bool
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+phenotype_set_id is a string
+gapgen_id is a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
+
+
+=end text
+
+=item Description
+
+
+
+=back
+
+=cut
+
+sub gapgen_model
+{
+    my($self, @args) = @_;
+
+# Authentication: required
+
+    if ((my $n = @args) != 1)
+    {
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
+							       "Invalid argument count for function gapgen_model (received $n, expecting 1)");
+    }
+    {
+	my($input) = @args;
+
+	my @_bad_arguments;
+        (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
+        if (@_bad_arguments) {
+	    my $msg = "Invalid arguments passed to gapgen_model:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+								   method_name => 'gapgen_model');
+	}
+    }
+
+    my $result = $self->{client}->call($self->{url}, $self->{headers}, {
+	method => "fbaModelServices.gapgen_model",
+	params => \@args,
+    });
+    if ($result) {
+	if ($result->is_error) {
+	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
+					       code => $result->content->{error}->{code},
+					       method_name => 'gapgen_model',
+					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
+					      );
+	} else {
+	    return wantarray ? @{$result->result} : $result->result->[0];
+	}
+    } else {
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method gapgen_model",
+					    status_line => $self->{client}->status_line,
+					    method_name => 'gapgen_model',
+				       );
+    }
+}
+
+
+
+=head2 queue_wildtype_phenotype_reconciliation
+
+  $job = $obj->queue_wildtype_phenotype_reconciliation($input)
+
+=over 4
+
+=item Parameter and return types
+
+=begin html
+
+<pre>
+$input is a wildtype_phenotype_reconciliation_params
+$job is a JobObject
+wildtype_phenotype_reconciliation_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	fba_formulation has a value which is an FBAFormulation
+	gapfill_formulation has a value which is a GapfillingFormulation
+	gapgen_formulation has a value which is a GapgenFormulation
+	phenotypeSet has a value which is a phenotype_set_id
+	phenotypeSet_workspace has a value which is a workspace_id
+	out_model has a value which is a fbamodel_id
+	workspace has a value which is a workspace_id
+	gapFills has a value which is a reference to a list where each element is a gapfill_id
+	gapGens has a value which is a reference to a list where each element is a gapgen_id
+	queueSensitivityAnalysis has a value which is a bool
+	queueReconciliationCombination has a value which is a bool
+	auth has a value which is a string
+	overwrite has a value which is a bool
+fbamodel_id is a string
+workspace_id is a string
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+GapfillingFormulation is a reference to a hash where the following keys are defined:
+	formulation has a value which is an FBAFormulation
+	num_solutions has a value which is an int
+	nomediahyp has a value which is a bool
+	nobiomasshyp has a value which is a bool
+	nogprhyp has a value which is a bool
+	nopathwayhyp has a value which is a bool
+	allowunbalanced has a value which is a bool
+	activitybonus has a value which is a float
+	drainpen has a value which is a float
+	directionpen has a value which is a float
+	nostructpen has a value which is a float
+	unfavorablepen has a value which is a float
+	nodeltagpen has a value which is a float
+	biomasstranspen has a value which is a float
+	singletranspen has a value which is a float
+	transpen has a value which is a float
+	blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
+	gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
+	allowedcmps has a value which is a reference to a list where each element is a compartment_id
+	probabilisticAnnotation has a value which is a probanno_id
+	probabilisticAnnotation_workspace has a value which is a workspace_id
+compartment_id is a string
+probanno_id is a string
+GapgenFormulation is a reference to a hash where the following keys are defined:
+	formulation has a value which is an FBAFormulation
+	refmedia has a value which is a media_id
+	refmedia_workspace has a value which is a workspace_id
+	num_solutions has a value which is an int
+	nomediahyp has a value which is a bool
+	nobiomasshyp has a value which is a bool
+	nogprhyp has a value which is a bool
+	nopathwayhyp has a value which is a bool
+phenotype_set_id is a string
+gapfill_id is a string
+gapgen_id is a string
+JobObject is a reference to a hash where the following keys are defined:
+	id has a value which is a job_id
+	type has a value which is a string
+	auth has a value which is a string
+	status has a value which is a string
+	jobdata has a value which is a reference to a hash where the key is a string and the value is a string
+	queuetime has a value which is a string
+	starttime has a value which is a string
+	completetime has a value which is a string
+	owner has a value which is a string
+	queuecommand has a value which is a string
+job_id is a string
 
 </pre>
 
@@ -7462,33 +8428,26 @@ workspace_ref is a string
 
 =begin text
 
-$input is a gapgen_model_params
-$modelMeta is an object_metadata
-gapgen_model_params is a reference to a hash where the following keys are defined:
+$input is a wildtype_phenotype_reconciliation_params
+$job is a JobObject
+wildtype_phenotype_reconciliation_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
-	formulation has a value which is a GapgenFormulation
+	fba_formulation has a value which is an FBAFormulation
+	gapfill_formulation has a value which is a GapfillingFormulation
+	gapgen_formulation has a value which is a GapgenFormulation
 	phenotypeSet has a value which is a phenotype_set_id
 	phenotypeSet_workspace has a value which is a workspace_id
-	integrate_solution has a value which is a bool
 	out_model has a value which is a fbamodel_id
 	workspace has a value which is a workspace_id
-	gapGen has a value which is a gapgen_id
+	gapFills has a value which is a reference to a list where each element is a gapfill_id
+	gapGens has a value which is a reference to a list where each element is a gapgen_id
+	queueSensitivityAnalysis has a value which is a bool
+	queueReconciliationCombination has a value which is a bool
 	auth has a value which is a string
-	timePerSolution has a value which is an int
-	totalTimeLimit has a value which is an int
 	overwrite has a value which is a bool
 fbamodel_id is a string
 workspace_id is a string
-GapgenFormulation is a reference to a hash where the following keys are defined:
-	formulation has a value which is an FBAFormulation
-	refmedia has a value which is a media_id
-	refmedia_workspace has a value which is a workspace_id
-	num_solutions has a value which is an int
-	nomediahyp has a value which is a bool
-	nobiomasshyp has a value which is a bool
-	nogprhyp has a value which is a bool
-	nopathwayhyp has a value which is a bool
 FBAFormulation is a reference to a hash where the following keys are defined:
 	media has a value which is a media_id
 	additionalcpds has a value which is a reference to a list where each element is a compound_id
@@ -7536,38 +8495,67 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
+GapfillingFormulation is a reference to a hash where the following keys are defined:
+	formulation has a value which is an FBAFormulation
+	num_solutions has a value which is an int
+	nomediahyp has a value which is a bool
+	nobiomasshyp has a value which is a bool
+	nogprhyp has a value which is a bool
+	nopathwayhyp has a value which is a bool
+	allowunbalanced has a value which is a bool
+	activitybonus has a value which is a float
+	drainpen has a value which is a float
+	directionpen has a value which is a float
+	nostructpen has a value which is a float
+	unfavorablepen has a value which is a float
+	nodeltagpen has a value which is a float
+	biomasstranspen has a value which is a float
+	singletranspen has a value which is a float
+	transpen has a value which is a float
+	blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
+	gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
+	allowedcmps has a value which is a reference to a list where each element is a compartment_id
+	probabilisticAnnotation has a value which is a probanno_id
+	probabilisticAnnotation_workspace has a value which is a workspace_id
+compartment_id is a string
+probanno_id is a string
+GapgenFormulation is a reference to a hash where the following keys are defined:
+	formulation has a value which is an FBAFormulation
+	refmedia has a value which is a media_id
+	refmedia_workspace has a value which is a workspace_id
+	num_solutions has a value which is an int
+	nomediahyp has a value which is a bool
+	nobiomasshyp has a value which is a bool
+	nogprhyp has a value which is a bool
+	nopathwayhyp has a value which is a bool
 phenotype_set_id is a string
+gapfill_id is a string
 gapgen_id is a string
-object_metadata is a reference to a list containing 11 items:
-	0: (id) an object_id
-	1: (type) an object_type
-	2: (moddate) a timestamp
-	3: (instance) an int
-	4: (command) a string
-	5: (lastmodifier) a username
-	6: (owner) a username
-	7: (workspace) a workspace_id
-	8: (ref) a workspace_ref
-	9: (chsum) a string
-	10: (metadata) a reference to a hash where the key is a string and the value is a string
-object_id is a string
-object_type is a string
-timestamp is a string
-username is a string
-workspace_ref is a string
+JobObject is a reference to a hash where the following keys are defined:
+	id has a value which is a job_id
+	type has a value which is a string
+	auth has a value which is a string
+	status has a value which is a string
+	jobdata has a value which is a reference to a hash where the key is a string and the value is a string
+	queuetime has a value which is a string
+	starttime has a value which is a string
+	completetime has a value which is a string
+	owner has a value which is a string
+	queuecommand has a value which is a string
+job_id is a string
 
 
 =end text
 
 =item Description
 
-
+Queues an FBAModel reconciliation job
 
 =back
 
 =cut
 
-sub gapgen_model
+sub queue_wildtype_phenotype_reconciliation
 {
     my($self, @args) = @_;
 
@@ -7576,7 +8564,7 @@ sub gapgen_model
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function gapgen_model (received $n, expecting 1)");
+							       "Invalid argument count for function queue_wildtype_phenotype_reconciliation (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -7584,39 +8572,39 @@ sub gapgen_model
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to gapgen_model:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to queue_wildtype_phenotype_reconciliation:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'gapgen_model');
+								   method_name => 'queue_wildtype_phenotype_reconciliation');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.gapgen_model",
+	method => "fbaModelServices.queue_wildtype_phenotype_reconciliation",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'gapgen_model',
+					       method_name => 'queue_wildtype_phenotype_reconciliation',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method gapgen_model",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method queue_wildtype_phenotype_reconciliation",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'gapgen_model',
+					    method_name => 'queue_wildtype_phenotype_reconciliation',
 				       );
     }
 }
 
 
 
-=head2 queue_wildtype_phenotype_reconciliation
+=head2 queue_reconciliation_sensitivity_analysis
 
-  $job = $obj->queue_wildtype_phenotype_reconciliation($input)
+  $job = $obj->queue_reconciliation_sensitivity_analysis($input)
 
 =over 4
 
@@ -7874,7 +8862,7 @@ Queues an FBAModel reconciliation job
 
 =cut
 
-sub queue_wildtype_phenotype_reconciliation
+sub queue_reconciliation_sensitivity_analysis
 {
     my($self, @args) = @_;
 
@@ -7883,7 +8871,7 @@ sub queue_wildtype_phenotype_reconciliation
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function queue_wildtype_phenotype_reconciliation (received $n, expecting 1)");
+							       "Invalid argument count for function queue_reconciliation_sensitivity_analysis (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -7891,39 +8879,39 @@ sub queue_wildtype_phenotype_reconciliation
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to queue_wildtype_phenotype_reconciliation:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to queue_reconciliation_sensitivity_analysis:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'queue_wildtype_phenotype_reconciliation');
+								   method_name => 'queue_reconciliation_sensitivity_analysis');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.queue_wildtype_phenotype_reconciliation",
+	method => "fbaModelServices.queue_reconciliation_sensitivity_analysis",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'queue_wildtype_phenotype_reconciliation',
+					       method_name => 'queue_reconciliation_sensitivity_analysis',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method queue_wildtype_phenotype_reconciliation",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method queue_reconciliation_sensitivity_analysis",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'queue_wildtype_phenotype_reconciliation',
+					    method_name => 'queue_reconciliation_sensitivity_analysis',
 				       );
     }
 }
 
 
 
-=head2 queue_reconciliation_sensitivity_analysis
+=head2 queue_combine_wildtype_phenotype_reconciliation
 
-  $job = $obj->queue_reconciliation_sensitivity_analysis($input)
+  $job = $obj->queue_combine_wildtype_phenotype_reconciliation($input)
 
 =over 4
 
@@ -7932,9 +8920,9 @@ sub queue_wildtype_phenotype_reconciliation
 =begin html
 
 <pre>
-$input is a wildtype_phenotype_reconciliation_params
+$input is a combine_wildtype_phenotype_reconciliation_params
 $job is a JobObject
-wildtype_phenotype_reconciliation_params is a reference to a hash where the following keys are defined:
+combine_wildtype_phenotype_reconciliation_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
 	fba_formulation has a value which is an FBAFormulation
@@ -7946,8 +8934,6 @@ wildtype_phenotype_reconciliation_params is a reference to a hash where the foll
 	workspace has a value which is a workspace_id
 	gapFills has a value which is a reference to a list where each element is a gapfill_id
 	gapGens has a value which is a reference to a list where each element is a gapgen_id
-	queueSensitivityAnalysis has a value which is a bool
-	queueReconciliationCombination has a value which is a bool
 	auth has a value which is a string
 	overwrite has a value which is a bool
 fbamodel_id is a string
@@ -8054,9 +9040,9 @@ job_id is a string
 
 =begin text
 
-$input is a wildtype_phenotype_reconciliation_params
+$input is a combine_wildtype_phenotype_reconciliation_params
 $job is a JobObject
-wildtype_phenotype_reconciliation_params is a reference to a hash where the following keys are defined:
+combine_wildtype_phenotype_reconciliation_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
 	fba_formulation has a value which is an FBAFormulation
@@ -8068,8 +9054,6 @@ wildtype_phenotype_reconciliation_params is a reference to a hash where the foll
 	workspace has a value which is a workspace_id
 	gapFills has a value which is a reference to a list where each element is a gapfill_id
 	gapGens has a value which is a reference to a list where each element is a gapgen_id
-	queueSensitivityAnalysis has a value which is a bool
-	queueReconciliationCombination has a value which is a bool
 	auth has a value which is a string
 	overwrite has a value which is a bool
 fbamodel_id is a string
@@ -8181,7 +9165,7 @@ Queues an FBAModel reconciliation job
 
 =cut
 
-sub queue_reconciliation_sensitivity_analysis
+sub queue_combine_wildtype_phenotype_reconciliation
 {
     my($self, @args) = @_;
 
@@ -8190,7 +9174,7 @@ sub queue_reconciliation_sensitivity_analysis
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function queue_reconciliation_sensitivity_analysis (received $n, expecting 1)");
+							       "Invalid argument count for function queue_combine_wildtype_phenotype_reconciliation (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -8198,39 +9182,39 @@ sub queue_reconciliation_sensitivity_analysis
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to queue_reconciliation_sensitivity_analysis:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to queue_combine_wildtype_phenotype_reconciliation:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'queue_reconciliation_sensitivity_analysis');
+								   method_name => 'queue_combine_wildtype_phenotype_reconciliation');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.queue_reconciliation_sensitivity_analysis",
+	method => "fbaModelServices.queue_combine_wildtype_phenotype_reconciliation",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'queue_reconciliation_sensitivity_analysis',
+					       method_name => 'queue_combine_wildtype_phenotype_reconciliation',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method queue_reconciliation_sensitivity_analysis",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method queue_combine_wildtype_phenotype_reconciliation",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'queue_reconciliation_sensitivity_analysis',
+					    method_name => 'queue_combine_wildtype_phenotype_reconciliation',
 				       );
     }
 }
 
 
 
-=head2 queue_combine_wildtype_phenotype_reconciliation
+=head2 reconcile_phenotypes
 
-  $job = $obj->queue_combine_wildtype_phenotype_reconciliation($input)
+  $output = $obj->reconcile_phenotypes($input)
 
 =over 4
 
@@ -8239,9 +9223,9 @@ sub queue_reconciliation_sensitivity_analysis
 =begin html
 
 <pre>
-$input is a combine_wildtype_phenotype_reconciliation_params
-$job is a JobObject
-combine_wildtype_phenotype_reconciliation_params is a reference to a hash where the following keys are defined:
+$input is a reconcile_phenotypes_params
+$output is a PhenotypeReconciliation
+reconcile_phenotypes_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
 	fba_formulation has a value which is an FBAFormulation
@@ -8253,6 +9237,8 @@ combine_wildtype_phenotype_reconciliation_params is a reference to a hash where
 	workspace has a value which is a workspace_id
 	gapFills has a value which is a reference to a list where each element is a gapfill_id
 	gapGens has a value which is a reference to a list where each element is a gapgen_id
+	sensitivity_analysis has a value which is a bool
+	combine_solutions has a value which is a bool
 	auth has a value which is a string
 	overwrite has a value which is a bool
 fbamodel_id is a string
@@ -8340,18 +9326,36 @@ GapgenFormulation is a reference to a hash where the following keys are defined:
 phenotype_set_id is a string
 gapfill_id is a string
 gapgen_id is a string
-JobObject is a reference to a hash where the following keys are defined:
-	id has a value which is a job_id
-	type has a value which is a string
-	auth has a value which is a string
-	status has a value which is a string
-	jobdata has a value which is a reference to a hash where the key is a string and the value is a string
-	queuetime has a value which is a string
-	starttime has a value which is a string
-	completetime has a value which is a string
-	owner has a value which is a string
-	queuecommand has a value which is a string
-job_id is a string
+PhenotypeReconciliation is a reference to a hash where the following keys are defined:
+	phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+	gapfills has a value which is a reference to a list where each element is a fba_id
+	gapgens has a value which is a reference to a list where each element is a gapgen_id
+	sensitivity has a value which is a reference to a hash where the key is a string and the value is a reference to a list containing 2 items:
+	0: a reference to a list where each element is a string
+	1: a reference to a list where each element is a string
+
+	combined_solutions has a value which is a reference to a list where each element is a string
+	reconciled_phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+	reconciled_model has a value which is an object_metadata
+	checkpoint has a value which is a string
+fba_id is a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
 
 </pre>
 
@@ -8359,9 +9363,9 @@ job_id is a string
 
 =begin text
 
-$input is a combine_wildtype_phenotype_reconciliation_params
-$job is a JobObject
-combine_wildtype_phenotype_reconciliation_params is a reference to a hash where the following keys are defined:
+$input is a reconcile_phenotypes_params
+$output is a PhenotypeReconciliation
+reconcile_phenotypes_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
 	fba_formulation has a value which is an FBAFormulation
@@ -8373,6 +9377,8 @@ combine_wildtype_phenotype_reconciliation_params is a reference to a hash where
 	workspace has a value which is a workspace_id
 	gapFills has a value which is a reference to a list where each element is a gapfill_id
 	gapGens has a value which is a reference to a list where each element is a gapgen_id
+	sensitivity_analysis has a value which is a bool
+	combine_solutions has a value which is a bool
 	auth has a value which is a string
 	overwrite has a value which is a bool
 fbamodel_id is a string
@@ -8460,31 +9466,49 @@ GapgenFormulation is a reference to a hash where the following keys are defined:
 phenotype_set_id is a string
 gapfill_id is a string
 gapgen_id is a string
-JobObject is a reference to a hash where the following keys are defined:
-	id has a value which is a job_id
-	type has a value which is a string
-	auth has a value which is a string
-	status has a value which is a string
-	jobdata has a value which is a reference to a hash where the key is a string and the value is a string
-	queuetime has a value which is a string
-	starttime has a value which is a string
-	completetime has a value which is a string
-	owner has a value which is a string
-	queuecommand has a value which is a string
-job_id is a string
+PhenotypeReconciliation is a reference to a hash where the following keys are defined:
+	phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+	gapfills has a value which is a reference to a list where each element is a fba_id
+	gapgens has a value which is a reference to a list where each element is a gapgen_id
+	sensitivity has a value which is a reference to a hash where the key is a string and the value is a reference to a list containing 2 items:
+	0: a reference to a list where each element is a string
+	1: a reference to a list where each element is a string
+
+	combined_solutions has a value which is a reference to a list where each element is a string
+	reconciled_phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+	reconciled_model has a value which is an object_metadata
+	checkpoint has a value which is a string
+fba_id is a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
 
 
 =end text
 
 =item Description
 
-Queues an FBAModel reconciliation job
+Reconciles an FBAModel with a PhenotypeSet in one call, gapfilling each false negative and gap generating each false positive, and optionally simulating the phenotype set with each solution and integrating the best combination of them
 
 =back
 
 =cut
 
-sub queue_combine_wildtype_phenotype_reconciliation
+sub reconcile_phenotypes
 {
     my($self, @args) = @_;
 
@@ -8493,7 +9517,7 @@ sub queue_combine_wildtype_phenotype_reconciliation
     if ((my $n = @args) != 1)
     {
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error =>
-							       "Invalid argument count for function queue_combine_wildtype_phenotype_reconciliation (received $n, expecting 1)");
+							       "Invalid argument count for function reconcile_phenotypes (received $n, expecting 1)");
     }
     {
 	my($input) = @args;
@@ -8501,30 +9525,30 @@ sub queue_combine_wildtype_phenotype_reconciliation
 	my @_bad_arguments;
         (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument 1 \"input\" (value was \"$input\")");
         if (@_bad_arguments) {
-	    my $msg = "Invalid arguments passed to queue_combine_wildtype_phenotype_reconciliation:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	    my $msg = "Invalid arguments passed to reconcile_phenotypes:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-								   method_name => 'queue_combine_wildtype_phenotype_reconciliation');
+								   method_name => 'reconcile_phenotypes');
 	}
     }
 
     my $result = $self->{client}->call($self->{url}, $self->{headers}, {
-	method => "fbaModelServices.queue_combine_wildtype_phenotype_reconciliation",
+	method => "fbaModelServices.reconcile_phenotypes",
 	params => \@args,
     });
     if ($result) {
 	if ($result->is_error) {
 	    Bio::KBase::Exceptions::JSONRPC->throw(error => $result->error_message,
 					       code => $result->content->{error}->{code},
-					       method_name => 'queue_combine_wildtype_phenotype_reconciliation',
+					       method_name => 'reconcile_phenotypes',
 					       data => $result->content->{error}->{error} # JSON::RPC::ReturnObject only supports JSONRPC 1.1 or 1.O
 					      );
 	} else {
 	    return wantarray ? @{$result->result} : $result->result->[0];
 	}
     } else {
-        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method queue_combine_wildtype_phenotype_reconciliation",
+        Bio::KBase::Exceptions::HTTP->throw(error => "Error invoking method reconcile_phenotypes",
 					    status_line => $self->{client}->status_line,
-					    method_name => 'queue_combine_wildtype_phenotype_reconciliation',
+					    method_name => 'reconcile_phenotypes',
 				       );
     }
 }
@@ -16971,15 +17995,235 @@ a "location" refers to a sequence of regions
 
 =begin html
 
-<pre>
-a reference to a list where each element is a region_of_dna
+<pre>
+a reference to a list where each element is a region_of_dna
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a list where each element is a region_of_dna
+
+=end text
+
+=back
+
+
+
+=head2 annotation
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a list containing 3 items:
+0: (comment) a string
+1: (annotator) a string
+2: (annotation_time) an int
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a list containing 3 items:
+0: (comment) a string
+1: (annotator) a string
+2: (annotation_time) an int
+
+
+=end text
+
+=back
+
+
+
+=head2 gene_hit
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a list containing 2 items:
+0: (gene) a feature_id
+1: (blast_score) a float
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a list containing 2 items:
+0: (gene) a feature_id
+1: (blast_score) a float
+
+
+=end text
+
+=back
+
+
+
+=head2 alt_func
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a list containing 3 items:
+0: (function) a string
+1: (probability) a float
+2: (gene_hits) a reference to a list where each element is a gene_hit
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a list containing 3 items:
+0: (function) a string
+1: (probability) a float
+2: (gene_hits) a reference to a list where each element is a gene_hit
+
+
+=end text
+
+=back
+
+
+
+=head2 feature
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a hash where the following keys are defined:
+id has a value which is a feature_id
+location has a value which is a location
+type has a value which is a feature_type
+function has a value which is a string
+alternative_functions has a value which is a reference to a list where each element is an alt_func
+protein_translation has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
+annotations has a value which is a reference to a list where each element is an annotation
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a hash where the following keys are defined:
+id has a value which is a feature_id
+location has a value which is a location
+type has a value which is a feature_type
+function has a value which is a string
+alternative_functions has a value which is a reference to a list where each element is an alt_func
+protein_translation has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
+annotations has a value which is a reference to a list where each element is an annotation
+
+
+=end text
+
+=back
+
+
+
+=head2 contig
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a hash where the following keys are defined:
+id has a value which is a contig_id
+dna has a value which is a string
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a hash where the following keys are defined:
+id has a value which is a contig_id
+dna has a value which is a string
+
+
+=end text
+
+=back
+
+
+
+=head2 GenomeObject
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a hash where the following keys are defined:
+id has a value which is a genome_id
+scientific_name has a value which is a string
+domain has a value which is a string
+genetic_code has a value which is an int
+source has a value which is a string
+source_id has a value which is a string
+contigs has a value which is a reference to a list where each element is a contig
+features has a value which is a reference to a list where each element is a feature
+
 </pre>
 
 =end html
 
 =begin text
 
-a reference to a list where each element is a region_of_dna
+a reference to a hash where the following keys are defined:
+id has a value which is a genome_id
+scientific_name has a value which is a string
+domain has a value which is a string
+genetic_code has a value which is an int
+source has a value which is a string
+source_id has a value which is a string
+contigs has a value which is a reference to a list where each element is a contig
+features has a value which is a reference to a list where each element is a feature
+
 
 =end text
 
@@ -16987,21 +18231,30 @@ a reference to a list where each element is a region_of_dna
 
 
 
-=head2 annotation
+=head2 annotationProbability
 
 =over 4
 
 
 
+=item Description
+
+Data structures to hold a single annotation probability for a single gene
+
+feature_id feature - feature the annotation is associated with
+string function - the name of the functional role being annotated to the feature
+float probability - the probability that the functional role is associated with the feature
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a list containing 3 items:
-0: (comment) a string
-1: (annotator) a string
-2: (annotation_time) an int
+0: (feature) a feature_id
+1: (function) a string
+2: (probability) a float
 
 </pre>
 
@@ -17010,9 +18263,9 @@ a reference to a list containing 3 items:
 =begin text
 
 a reference to a list containing 3 items:
-0: (comment) a string
-1: (annotator) a string
-2: (annotation_time) an int
+0: (feature) a feature_id
+1: (function) a string
+2: (probability) a float
 
 
 =end text
@@ -17021,7 +18274,7 @@ a reference to a list containing 3 items:
 
 
 
-=head2 gene_hit
+=head2 probanno_id
 
 =over 4
 
@@ -17032,20 +18285,14 @@ a reference to a list containing 3 items:
 =begin html
 
 <pre>
-a reference to a list containing 2 items:
-0: (gene) a feature_id
-1: (blast_score) a float
-
+a string
 </pre>
 
 =end html
 
 =begin text
 
-a reference to a list containing 2 items:
-0: (gene) a feature_id
-1: (blast_score) a float
-
+a string
 
 =end text
 
@@ -17064,10 +18311,9 @@ a reference to a list containing 2 items:
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
+a reference to a list containing 2 items:
 0: (function) a string
 1: (probability) a float
-2: (gene_hits) a reference to a list where each element is a gene_hit
 
 </pre>
 
@@ -17075,10 +18321,9 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
+a reference to a list containing 2 items:
 0: (function) a string
 1: (probability) a float
-2: (gene_hits) a reference to a list where each element is a gene_hit
 
 
 =end text
@@ -17087,12 +18332,26 @@ a reference to a list containing 3 items:
 
 
 
-=head2 feature
+=head2 ProbAnnoFeature
 
 =over 4
 
 
 
+=item Description
+
+Object to carry alternative functions for each feature
+    
+feature_id id
+ID of the feature. Required.
+    
+string function
+Primary annotated function of the feature in the genome annotation. Required.
+    
+list<alt_func> alternative_functions
+List of tuples containing alternative functions and probabilities. Required.
+
+
 =item Definition
 
 =begin html
@@ -17100,13 +18359,7 @@ a reference to a list containing 3 items:
 <pre>
 a reference to a hash where the following keys are defined:
 id has a value which is a feature_id
-location has a value which is a location
-type has a value which is a feature_type
-function has a value which is a string
 alternative_functions has a value which is a reference to a list where each element is an alt_func
-protein_translation has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
-annotations has a value which is a reference to a list where each element is an annotation
 
 </pre>
 
@@ -17116,13 +18369,7 @@ annotations has a value which is a reference to a list where each element is an
 
 a reference to a hash where the following keys are defined:
 id has a value which is a feature_id
-location has a value which is a location
-type has a value which is a feature_type
-function has a value which is a string
 alternative_functions has a value which is a reference to a list where each element is an alt_func
-protein_translation has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
-annotations has a value which is a reference to a list where each element is an annotation
 
 
 =end text
@@ -17131,20 +18378,32 @@ annotations has a value which is a reference to a list where each element is an
 
 
 
-=head2 contig
+=head2 ProbabilisticAnnotation
 
 =over 4
 
 
 
+=item Description
+
+Object to carry alternative functions and probabilities for genes in a genome
+
+    probanno_id id - ID of the probabilistic annotation object. Required.    
+    genome_id genome - ID of the genome the probabilistic annotation was built for. Required.
+    workspace_ref genome_uuid - Reference to retrieve genome from workspace service. Required.
+    list<ProbAnnoFeature> featureAlternativeFunctions - List of ProbAnnoFeature objects holding alternative functions for features. Required.
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a contig_id
-dna has a value which is a string
+id has a value which is a probanno_id
+genome has a value which is a genome_id
+genome_uuid has a value which is a workspace_ref
+featureAlternativeFunctions has a value which is a reference to a list where each element is a ProbAnnoFeature
 
 </pre>
 
@@ -17153,8 +18412,10 @@ dna has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a contig_id
-dna has a value which is a string
+id has a value which is a probanno_id
+genome has a value which is a genome_id
+genome_uuid has a value which is a workspace_ref
+featureAlternativeFunctions has a value which is a reference to a list where each element is a ProbAnnoFeature
 
 
 =end text
@@ -17163,26 +18424,30 @@ dna has a value which is a string
 
 
 
-=head2 GenomeObject
+=head2 ReactionProbability
 
 =over 4
 
 
 
+=item Description
+
+Data structure to hold probability of a reaction
+
+        reaction_id reaction - ID of the reaction
+        float probability - Probability of the reaction
+        string gene_list - List of genes most likely to be attached to reaction
+
+
 =item Definition
 
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a genome_id
-scientific_name has a value which is a string
-domain has a value which is a string
-genetic_code has a value which is an int
-source has a value which is a string
-source_id has a value which is a string
-contigs has a value which is a reference to a list where each element is a contig
-features has a value which is a reference to a list where each element is a feature
+a reference to a list containing 3 items:
+0: (reaction) a reaction_id
+1: (probability) a float
+2: (gene_list) a string
 
 </pre>
 
@@ -17190,15 +18455,10 @@ features has a value which is a reference to a list where each element is a feat
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a genome_id
-scientific_name has a value which is a string
-domain has a value which is a string
-genetic_code has a value which is an int
-source has a value which is a string
-source_id has a value which is a string
-contigs has a value which is a reference to a list where each element is a contig
-features has a value which is a reference to a list where each element is a feature
+a reference to a list containing 3 items:
+0: (reaction) a reaction_id
+1: (probability) a float
+2: (gene_list) a string
 
 
 =end text
@@ -17207,7 +18467,7 @@ features has a value which is a reference to a list where each element is a feat
 
 
 
-=head2 annotationProbability
+=head2 Biochemistry
 
 =over 4
 
@@ -17215,11 +18475,9 @@ features has a value which is a reference to a list where each element is a feat
 
 =item Description
 
-Data structures to hold a single annotation probability for a single gene
-
-feature_id feature - feature the annotation is associated with
-string function - the name of the functional role being annotated to the feature
-float probability - the probability that the functional role is associated with the feature
+********************************************************************************
+    Biochemistry type definition
+   	********************************************************************************
 
 
 =item Definition
@@ -17227,10 +18485,12 @@ float probability - the probability that the functional role is associated with
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
-0: (feature) a feature_id
-1: (function) a string
-2: (probability) a float
+a reference to a hash where the following keys are defined:
+id has a value which is a biochemistry_id
+name has a value which is a string
+compounds has a value which is a reference to a list where each element is a compound_id
+reactions has a value which is a reference to a list where each element is a reaction_id
+media has a value which is a reference to a list where each element is a media_id
 
 </pre>
 
@@ -17238,10 +18498,12 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
-0: (feature) a feature_id
-1: (function) a string
-2: (probability) a float
+a reference to a hash where the following keys are defined:
+id has a value which is a biochemistry_id
+name has a value which is a string
+compounds has a value which is a reference to a list where each element is a compound_id
+reactions has a value which is a reference to a list where each element is a reaction_id
+media has a value which is a reference to a list where each element is a media_id
 
 
 =end text
@@ -17250,25 +18512,48 @@ a reference to a list containing 3 items:
 
 
 
-=head2 probanno_id
+=head2 MediaCompound
 
 =over 4
 
 
 
+=item Description
+
+Data structures for media compound formulation
+
+compound_id compound - ID of compound in media
+string name - name of compound in media
+float concentration - concentration of compound in media
+float maxFlux - maximum flux of compound in media
+float minFlux - minimum flux of compound in media
+
+
 =item Definition
 
 =begin html
 
 <pre>
-a string
+a reference to a hash where the following keys are defined:
+compound has a value which is a compound_id
+name has a value which is a string
+concentration has a value which is a float
+max_flux has a value which is a float
+min_flux has a value which is a float
+
 </pre>
 
 =end html
 
 =begin text
 
-a string
+a reference to a hash where the following keys are defined:
+compound has a value which is a compound_id
+name has a value which is a string
+concentration has a value which is a float
+max_flux has a value which is a float
+min_flux has a value which is a float
+
 
 =end text
 
@@ -17276,20 +18561,34 @@ a string
 
 
 
-=head2 alt_func
+=head2 Media
 
 =over 4
 
 
 
+=item Description
+
+Data structures for media formulation
+
+media_id id - ID of media formulation
+string name - name of media formulaiton
+list<MediaCompound> media_compounds - list of compounds in media formulation
+float pH - pH of media condition
+float temperature - temperature of media condition
+
+
 =item Definition
 
 =begin html
 
 <pre>
-a reference to a list containing 2 items:
-0: (function) a string
-1: (probability) a float
+a reference to a hash where the following keys are defined:
+id has a value which is a media_id
+name has a value which is a string
+media_compounds has a value which is a reference to a list where each element is a MediaCompound
+pH has a value which is a float
+temperature has a value which is a float
 
 </pre>
 
@@ -17297,9 +18596,12 @@ a reference to a list containing 2 items:
 
 =begin text
 
-a reference to a list containing 2 items:
-0: (function) a string
-1: (probability) a float
+a reference to a hash where the following keys are defined:
+id has a value which is a media_id
+name has a value which is a string
+media_compounds has a value which is a reference to a list where each element is a MediaCompound
+pH has a value which is a float
+temperature has a value which is a float
 
 
 =end text
@@ -17308,7 +18610,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 ProbAnnoFeature
+=head2 Compound
 
 =over 4
 
@@ -17316,16 +18618,16 @@ a reference to a list containing 2 items:
 
 =item Description
 
-Object to carry alternative functions for each feature
-    
-feature_id id
-ID of the feature. Required.
-    
-string function
-Primary annotated function of the feature in the genome annotation. Required.
-    
-list<alt_func> alternative_functions
-List of tuples containing alternative functions and probabilities. Required.
+Data structures for media formulation
+
+compound_id id - ID of compound
+string abbrev - abbreviated name of compound
+string name - primary name of compound
+list<string> aliases - list of aliases for compound
+float charge - molecular charge of compound
+float deltaG - estimated compound delta G
+float deltaGErr - uncertainty in estimated compound delta G
+string formula - molecular formula of compound
 
 
 =item Definition
@@ -17334,8 +18636,14 @@ List of tuples containing alternative functions and probabilities. Required.
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a feature_id
-alternative_functions has a value which is a reference to a list where each element is an alt_func
+id has a value which is a compound_id
+abbrev has a value which is a string
+name has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
+charge has a value which is a float
+deltaG has a value which is a float
+deltaGErr has a value which is a float
+formula has a value which is a string
 
 </pre>
 
@@ -17344,8 +18652,14 @@ alternative_functions has a value which is a reference to a list where each elem
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a feature_id
-alternative_functions has a value which is a reference to a list where each element is an alt_func
+id has a value which is a compound_id
+abbrev has a value which is a string
+name has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
+charge has a value which is a float
+deltaG has a value which is a float
+deltaGErr has a value which is a float
+formula has a value which is a string
 
 
 =end text
@@ -17354,7 +18668,7 @@ alternative_functions has a value which is a reference to a list where each elem
 
 
 
-=head2 ProbabilisticAnnotation
+=head2 Reaction
 
 =over 4
 
@@ -17362,12 +18676,18 @@ alternative_functions has a value which is a reference to a list where each elem
 
 =item Description
 
-Object to carry alternative functions and probabilities for genes in a genome
+Data structures for media formulation
 
-    probanno_id id - ID of the probabilistic annotation object. Required.    
-    genome_id genome - ID of the genome the probabilistic annotation was built for. Required.
-    workspace_ref genome_uuid - Reference to retrieve genome from workspace service. Required.
-    list<ProbAnnoFeature> featureAlternativeFunctions - List of ProbAnnoFeature objects holding alternative functions for features. Required.
+reaction_id id - ID of reaction
+string name - primary name of reaction
+string abbrev - abbreviated name of reaction
+list<string> enzymes - list of EC numbers for reaction
+string direction - directionality of reaction
+string reversibility - reversibility of reaction
+float deltaG - estimated delta G of reaction
+float deltaGErr - uncertainty in estimated delta G of reaction
+string equation - reaction equation in terms of compound IDs
+string definition - reaction equation in terms of compound names
 
 
 =item Definition
@@ -17376,10 +18696,16 @@ Object to carry alternative functions and probabilities for genes in a genome
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a probanno_id
-genome has a value which is a genome_id
-genome_uuid has a value which is a workspace_ref
-featureAlternativeFunctions has a value which is a reference to a list where each element is a ProbAnnoFeature
+id has a value which is a reaction_id
+name has a value which is a string
+abbrev has a value which is a string
+enzymes has a value which is a reference to a list where each element is a string
+direction has a value which is a string
+reversibility has a value which is a string
+deltaG has a value which is a float
+deltaGErr has a value which is a float
+equation has a value which is a string
+definition has a value which is a string
 
 </pre>
 
@@ -17388,10 +18714,16 @@ featureAlternativeFunctions has a value which is a reference to a list where eac
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a probanno_id
-genome has a value which is a genome_id
-genome_uuid has a value which is a workspace_ref
-featureAlternativeFunctions has a value which is a reference to a list where each element is a ProbAnnoFeature
+id has a value which is a reaction_id
+name has a value which is a string
+abbrev has a value which is a string
+enzymes has a value which is a reference to a list where each element is a string
+direction has a value which is a string
+reversibility has a value which is a string
+deltaG has a value which is a float
+deltaGErr has a value which is a float
+equation has a value which is a string
+definition has a value which is a string
 
 
 =end text
@@ -17400,7 +18732,7 @@ featureAlternativeFunctions has a value which is a reference to a list where eac
 
 
 
-=head2 ReactionProbability
+=head2 ModelCompartment
 
 =over 4
 
@@ -17408,11 +18740,9 @@ featureAlternativeFunctions has a value which is a reference to a list where eac
 
 =item Description
 
-Data structure to hold probability of a reaction
-
-        reaction_id reaction - ID of the reaction
-        float probability - Probability of the reaction
-        string gene_list - List of genes most likely to be attached to reaction
+********************************************************************************
+    FBAModel type definition
+   	********************************************************************************
 
 
 =item Definition
@@ -17420,10 +18750,12 @@ Data structure to hold probability of a reaction
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
-0: (reaction) a reaction_id
-1: (probability) a float
-2: (gene_list) a string
+a reference to a hash where the following keys are defined:
+id has a value which is a modelcompartment_id
+name has a value which is a string
+pH has a value which is a float
+potential has a value which is a float
+index has a value which is an int
 
 </pre>
 
@@ -17431,10 +18763,12 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
-0: (reaction) a reaction_id
-1: (probability) a float
-2: (gene_list) a string
+a reference to a hash where the following keys are defined:
+id has a value which is a modelcompartment_id
+name has a value which is a string
+pH has a value which is a float
+potential has a value which is a float
+index has a value which is an int
 
 
 =end text
@@ -17443,7 +18777,7 @@ a reference to a list containing 3 items:
 
 
 
-=head2 Biochemistry
+=head2 ModelCompound
 
 =over 4
 
@@ -17451,9 +18785,12 @@ a reference to a list containing 3 items:
 
 =item Description
 
-********************************************************************************
-    Biochemistry type definition
-   	********************************************************************************
+Data structures for a compound in a model
+
+modelcompound_id id - ID of the specific instance of the compound in the model
+compound_id compound - ID of the compound associated with the model compound
+string name - name of the compound associated with the model compound
+modelcompartment_id compartment - ID of the compartment containing the compound
 
 
 =item Definition
@@ -17462,11 +18799,10 @@ a reference to a list containing 3 items:
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a biochemistry_id
+id has a value which is a modelcompound_id
+compound has a value which is a compound_id
 name has a value which is a string
-compounds has a value which is a reference to a list where each element is a compound_id
-reactions has a value which is a reference to a list where each element is a reaction_id
-media has a value which is a reference to a list where each element is a media_id
+compartment has a value which is a modelcompartment_id
 
 </pre>
 
@@ -17475,11 +18811,10 @@ media has a value which is a reference to a list where each element is a media_i
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a biochemistry_id
+id has a value which is a modelcompound_id
+compound has a value which is a compound_id
 name has a value which is a string
-compounds has a value which is a reference to a list where each element is a compound_id
-reactions has a value which is a reference to a list where each element is a reaction_id
-media has a value which is a reference to a list where each element is a media_id
+compartment has a value which is a modelcompartment_id
 
 
 =end text
@@ -17488,7 +18823,7 @@ media has a value which is a reference to a list where each element is a media_i
 
 
 
-=head2 MediaCompound
+=head2 ModelReaction
 
 =over 4
 
@@ -17496,13 +18831,16 @@ media has a value which is a reference to a list where each element is a media_i
 
 =item Description
 
-Data structures for media compound formulation
+Data structures for a reaction in a model
 
-compound_id compound - ID of compound in media
-string name - name of compound in media
-float concentration - concentration of compound in media
-float maxFlux - maximum flux of compound in media
-float minFlux - minimum flux of compound in media
+modelreaction_id id - ID of the specific instance of the reaction in the model
+reaction_id reaction - ID of the reaction
+string name - name of the reaction
+string direction - directionality of the reaction
+string equation - stoichiometric equation of the reaction in terms of compound IDs
+string definition - stoichiometric equation of the reaction in terms of compound names
+list<feature_id> features - list of features associated with the reaction
+modelcompartment_id compartment - ID of the compartment containing the reaction
 
 
 =item Definition
@@ -17511,11 +18849,15 @@ float minFlux - minimum flux of compound in media
 
 <pre>
 a reference to a hash where the following keys are defined:
-compound has a value which is a compound_id
+id has a value which is a modelreaction_id
+reaction has a value which is a reaction_id
 name has a value which is a string
-concentration has a value which is a float
-max_flux has a value which is a float
-min_flux has a value which is a float
+direction has a value which is a string
+equation has a value which is a string
+definition has a value which is a string
+gapfilled has a value which is a bool
+features has a value which is a reference to a list where each element is a feature_id
+compartment has a value which is a modelcompartment_id
 
 </pre>
 
@@ -17524,11 +18866,15 @@ min_flux has a value which is a float
 =begin text
 
 a reference to a hash where the following keys are defined:
-compound has a value which is a compound_id
+id has a value which is a modelreaction_id
+reaction has a value which is a reaction_id
 name has a value which is a string
-concentration has a value which is a float
-max_flux has a value which is a float
-min_flux has a value which is a float
+direction has a value which is a string
+equation has a value which is a string
+definition has a value which is a string
+gapfilled has a value which is a bool
+features has a value which is a reference to a list where each element is a feature_id
+compartment has a value which is a modelcompartment_id
 
 
 =end text
@@ -17537,7 +18883,7 @@ min_flux has a value which is a float
 
 
 
-=head2 Media
+=head2 BiomassCompound
 
 =over 4
 
@@ -17545,13 +18891,11 @@ min_flux has a value which is a float
 
 =item Description
 
-Data structures for media formulation
+Data structures for a reaction in a model
 
-media_id id - ID of media formulation
-string name - name of media formulaiton
-list<MediaCompound> media_compounds - list of compounds in media formulation
-float pH - pH of media condition
-float temperature - temperature of media condition
+modelcompound_id modelcompound - ID of model compound in biomass reaction
+float coefficient - coefficient of compound in biomass reaction
+string name - name of compound in biomass reaction
 
 
 =item Definition
@@ -17559,12 +18903,10 @@ float temperature - temperature of media condition
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a media_id
-name has a value which is a string
-media_compounds has a value which is a reference to a list where each element is a MediaCompound
-pH has a value which is a float
-temperature has a value which is a float
+a reference to a list containing 3 items:
+0: (modelcompound) a modelcompound_id
+1: (coefficient) a float
+2: (name) a string
 
 </pre>
 
@@ -17572,12 +18914,10 @@ temperature has a value which is a float
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a media_id
-name has a value which is a string
-media_compounds has a value which is a reference to a list where each element is a MediaCompound
-pH has a value which is a float
-temperature has a value which is a float
+a reference to a list containing 3 items:
+0: (modelcompound) a modelcompound_id
+1: (coefficient) a float
+2: (name) a string
 
 
 =end text
@@ -17586,7 +18926,7 @@ temperature has a value which is a float
 
 
 
-=head2 Compound
+=head2 ModelBiomass
 
 =over 4
 
@@ -17594,16 +18934,12 @@ temperature has a value which is a float
 
 =item Description
 
-Data structures for media formulation
+Data structures for a reaction in a model
 
-compound_id id - ID of compound
-string abbrev - abbreviated name of compound
-string name - primary name of compound
-list<string> aliases - list of aliases for compound
-float charge - molecular charge of compound
-float deltaG - estimated compound delta G
-float deltaGErr - uncertainty in estimated compound delta G
-string formula - molecular formula of compound
+biomass_id id - ID of biomass reaction
+string name - name of biomass reaction
+string definition - stoichiometric equation of biomass reaction in terms of compound names
+list<BiomassCompound> biomass_compounds - list of compounds in biomass reaction
 
 
 =item Definition
@@ -17612,14 +18948,10 @@ string formula - molecular formula of compound
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a compound_id
-abbrev has a value which is a string
+id has a value which is a biomass_id
 name has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
-charge has a value which is a float
-deltaG has a value which is a float
-deltaGErr has a value which is a float
-formula has a value which is a string
+definition has a value which is a string
+biomass_compounds has a value which is a reference to a list where each element is a BiomassCompound
 
 </pre>
 
@@ -17628,14 +18960,10 @@ formula has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a compound_id
-abbrev has a value which is a string
+id has a value which is a biomass_id
 name has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
-charge has a value which is a float
-deltaG has a value which is a float
-deltaGErr has a value which is a float
-formula has a value which is a string
+definition has a value which is a string
+biomass_compounds has a value which is a reference to a list where each element is a BiomassCompound
 
 
 =end text
@@ -17644,44 +18972,36 @@ formula has a value which is a string
 
 
 
-=head2 Reaction
+=head2 FBAMeta
 
 =over 4
 
 
-
-=item Description
-
-Data structures for media formulation
-
-reaction_id id - ID of reaction
-string name - primary name of reaction
-string abbrev - abbreviated name of reaction
-list<string> enzymes - list of EC numbers for reaction
-string direction - directionality of reaction
-string reversibility - reversibility of reaction
-float deltaG - estimated delta G of reaction
-float deltaGErr - uncertainty in estimated delta G of reaction
-string equation - reaction equation in terms of compound IDs
-string definition - reaction equation in terms of compound names
-
-
+
+=item Description
+
+Data structures for a reaction in a model
+
+fba_id id - ID of the FBA object
+workspace_id workspace - ID of the workspace containing the FBA object
+media_id media - ID of the media the FBA was performed in
+workspace_id media_workspace - ID of the workspace containing the media formulation
+float objective - optimized objective value of the FBA study
+list<feature_id> ko - list of genes knocked out in the FBA study
+
+
 =item Definition
 
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a reaction_id
-name has a value which is a string
-abbrev has a value which is a string
-enzymes has a value which is a reference to a list where each element is a string
-direction has a value which is a string
-reversibility has a value which is a string
-deltaG has a value which is a float
-deltaGErr has a value which is a float
-equation has a value which is a string
-definition has a value which is a string
+a reference to a list containing 6 items:
+0: (id) a fba_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (objective) a float
+5: (ko) a reference to a list where each element is a feature_id
 
 </pre>
 
@@ -17689,17 +19009,13 @@ definition has a value which is a string
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a reaction_id
-name has a value which is a string
-abbrev has a value which is a string
-enzymes has a value which is a reference to a list where each element is a string
-direction has a value which is a string
-reversibility has a value which is a string
-deltaG has a value which is a float
-deltaGErr has a value which is a float
-equation has a value which is a string
-definition has a value which is a string
+a reference to a list containing 6 items:
+0: (id) a fba_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (objective) a float
+5: (ko) a reference to a list where each element is a feature_id
 
 
 =end text
@@ -17708,7 +19024,7 @@ definition has a value which is a string
 
 
 
-=head2 ModelCompartment
+=head2 GapGenMeta
 
 =over 4
 
@@ -17716,9 +19032,14 @@ definition has a value which is a string
 
 =item Description
 
-********************************************************************************
-    FBAModel type definition
-   	********************************************************************************
+Metadata object providing a summary of a gapgen simulation
+
+gapgen_id id - ID of gapgen study object
+workspace_id workspace - workspace containing gapgen study
+media_id media - media formulation for gapgen study
+workspace_id media_workspace - ID of the workspace containing the media formulation
+bool done - boolean indicating if gapgen study is complete
+list<feature_id> ko - list of genes knocked out in gapgen study
 
 
 =item Definition
@@ -17726,12 +19047,13 @@ definition has a value which is a string
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a modelcompartment_id
-name has a value which is a string
-pH has a value which is a float
-potential has a value which is a float
-index has a value which is an int
+a reference to a list containing 6 items:
+0: (id) a gapgen_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (done) a bool
+5: (ko) a reference to a list where each element is a feature_id
 
 </pre>
 
@@ -17739,12 +19061,13 @@ index has a value which is an int
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a modelcompartment_id
-name has a value which is a string
-pH has a value which is a float
-potential has a value which is a float
-index has a value which is an int
+a reference to a list containing 6 items:
+0: (id) a gapgen_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (done) a bool
+5: (ko) a reference to a list where each element is a feature_id
 
 
 =end text
@@ -17753,7 +19076,7 @@ index has a value which is an int
 
 
 
-=head2 ModelCompound
+=head2 GapFillMeta
 
 =over 4
 
@@ -17761,12 +19084,14 @@ index has a value which is an int
 
 =item Description
 
-Data structures for a compound in a model
+Metadata object providing a summary of a gapfilling simulation
 
-modelcompound_id id - ID of the specific instance of the compound in the model
-compound_id compound - ID of the compound associated with the model compound
-string name - name of the compound associated with the model compound
-modelcompartment_id compartment - ID of the compartment containing the compound
+gapfill_id id - ID of gapfill study object
+workspace_id workspace - workspace containing gapfill study
+media_id media - media formulation for gapfill study
+workspace_id media_workspace - ID of the workspace containing the media formulation
+bool done - boolean indicating if gapfill study is complete
+list<feature_id> ko - list of genes knocked out in gapfill study
 
 
 =item Definition
@@ -17774,11 +19099,13 @@ modelcompartment_id compartment - ID of the compartment containing the compound
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a modelcompound_id
-compound has a value which is a compound_id
-name has a value which is a string
-compartment has a value which is a modelcompartment_id
+a reference to a list containing 6 items:
+0: (id) a gapfill_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (done) a bool
+5: (ko) a reference to a list where each element is a feature_id
 
 </pre>
 
@@ -17786,11 +19113,13 @@ compartment has a value which is a modelcompartment_id
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a modelcompound_id
-compound has a value which is a compound_id
-name has a value which is a string
-compartment has a value which is a modelcompartment_id
+a reference to a list containing 6 items:
+0: (id) a gapfill_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (done) a bool
+5: (ko) a reference to a list where each element is a feature_id
 
 
 =end text
@@ -17799,7 +19128,7 @@ compartment has a value which is a modelcompartment_id
 
 
 
-=head2 ModelReaction
+=head2 FBAModel
 
 =over 4
 
@@ -17807,16 +19136,28 @@ compartment has a value which is a modelcompartment_id
 
 =item Description
 
-Data structures for a reaction in a model
+Data structure holding data for metabolic model
 
-modelreaction_id id - ID of the specific instance of the reaction in the model
-reaction_id reaction - ID of the reaction
-string name - name of the reaction
-string direction - directionality of the reaction
-string equation - stoichiometric equation of the reaction in terms of compound IDs
-string definition - stoichiometric equation of the reaction in terms of compound names
-list<feature_id> features - list of features associated with the reaction
-modelcompartment_id compartment - ID of the compartment containing the reaction
+fbamodel_id id - ID of model
+workspace_id workspace - workspace containing model
+genome_id genome - ID of associated genome
+workspace_id genome_workspace - workspace with associated genome
+mapping_id map - ID of associated mapping database
+workspace_id map_workspace - workspace with associated mapping database
+biochemistry_id biochemistry - ID of associated biochemistry database
+workspace_id biochemistry_workspace - workspace with associated biochemistry database
+string name - name of the model
+string type - type of model (e.g. single genome, community)
+string status - status of model (e.g. under construction)
+list<ModelBiomass> biomasses - list of biomass reactions in model
+list<ModelCompartment> compartments - list of compartments in model
+list<ModelReaction> reactions - list of reactions in model
+list<ModelCompound> compounds - list of compounds in model
+list<FBAMeta> fbas - list of flux balance analysis studies for model
+list<GapFillMeta> integrated_gapfillings - list of integrated gapfilling solutions
+list<GapFillMeta> unintegrated_gapfillings - list of unintegrated gapfilling solutions
+list<GapGenMeta> integrated_gapgenerations - list of integrated gapgen solutions
+list<GapGenMeta> unintegrated_gapgenerations - list of unintegrated gapgen solutions
 
 
 =item Definition
@@ -17825,15 +19166,26 @@ modelcompartment_id compartment - ID of the compartment containing the reaction
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a modelreaction_id
-reaction has a value which is a reaction_id
+id has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+map has a value which is a mapping_id
+map_workspace has a value which is a workspace_id
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
 name has a value which is a string
-direction has a value which is a string
-equation has a value which is a string
-definition has a value which is a string
-gapfilled has a value which is a bool
-features has a value which is a reference to a list where each element is a feature_id
-compartment has a value which is a modelcompartment_id
+type has a value which is a string
+status has a value which is a string
+biomasses has a value which is a reference to a list where each element is a ModelBiomass
+compartments has a value which is a reference to a list where each element is a ModelCompartment
+reactions has a value which is a reference to a list where each element is a ModelReaction
+compounds has a value which is a reference to a list where each element is a ModelCompound
+fbas has a value which is a reference to a list where each element is an FBAMeta
+integrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
+unintegrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
+integrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
+unintegrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
 
 </pre>
 
@@ -17842,15 +19194,26 @@ compartment has a value which is a modelcompartment_id
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a modelreaction_id
-reaction has a value which is a reaction_id
+id has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+map has a value which is a mapping_id
+map_workspace has a value which is a workspace_id
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
 name has a value which is a string
-direction has a value which is a string
-equation has a value which is a string
-definition has a value which is a string
-gapfilled has a value which is a bool
-features has a value which is a reference to a list where each element is a feature_id
-compartment has a value which is a modelcompartment_id
+type has a value which is a string
+status has a value which is a string
+biomasses has a value which is a reference to a list where each element is a ModelBiomass
+compartments has a value which is a reference to a list where each element is a ModelCompartment
+reactions has a value which is a reference to a list where each element is a ModelReaction
+compounds has a value which is a reference to a list where each element is a ModelCompound
+fbas has a value which is a reference to a list where each element is an FBAMeta
+integrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
+unintegrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
+integrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
+unintegrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
 
 
 =end text
@@ -17859,7 +19222,7 @@ compartment has a value which is a modelcompartment_id
 
 
 
-=head2 BiomassCompound
+=head2 GeneAssertion
 
 =over 4
 
@@ -17867,11 +19230,9 @@ compartment has a value which is a modelcompartment_id
 
 =item Description
 
-Data structures for a reaction in a model
-
-modelcompound_id modelcompound - ID of model compound in biomass reaction
-float coefficient - coefficient of compound in biomass reaction
-string name - name of compound in biomass reaction
+********************************************************************************
+    Flux Balance Analysis type definition
+   	********************************************************************************
 
 
 =item Definition
@@ -17879,10 +19240,11 @@ string name - name of compound in biomass reaction
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
-0: (modelcompound) a modelcompound_id
-1: (coefficient) a float
-2: (name) a string
+a reference to a list containing 4 items:
+0: (feature) a feature_id
+1: (growthFraction) a float
+2: (growth) a float
+3: (isEssential) a bool
 
 </pre>
 
@@ -17890,10 +19252,11 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
-0: (modelcompound) a modelcompound_id
-1: (coefficient) a float
-2: (name) a string
+a reference to a list containing 4 items:
+0: (feature) a feature_id
+1: (growthFraction) a float
+2: (growth) a float
+3: (isEssential) a bool
 
 
 =end text
@@ -17902,7 +19265,7 @@ a reference to a list containing 3 items:
 
 
 
-=head2 ModelBiomass
+=head2 CompoundFlux
 
 =over 4
 
@@ -17910,12 +19273,16 @@ a reference to a list containing 3 items:
 
 =item Description
 
-Data structures for a reaction in a model
+Compound variable in FBA solution
 
-biomass_id id - ID of biomass reaction
-string name - name of biomass reaction
-string definition - stoichiometric equation of biomass reaction in terms of compound names
-list<BiomassCompound> biomass_compounds - list of compounds in biomass reaction
+modelcompound_id compound - ID of compound in model in FBA solution
+float value - flux uptake of compound in FBA solution
+float upperBound - maximum uptake of compoundin FBA simulation
+float lowerBound - minimum uptake of compoundin FBA simulation
+float max - maximum uptake of compoundin FBA simulation
+float min - minimum uptake of compoundin FBA simulation
+string type - type of compound variable
+string name - name of compound
 
 
 =item Definition
@@ -17923,11 +19290,15 @@ list<BiomassCompound> biomass_compounds - list of compounds in biomass reaction
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a biomass_id
-name has a value which is a string
-definition has a value which is a string
-biomass_compounds has a value which is a reference to a list where each element is a BiomassCompound
+a reference to a list containing 8 items:
+0: (compound) a modelcompound_id
+1: (value) a float
+2: (upperBound) a float
+3: (lowerBound) a float
+4: (max) a float
+5: (min) a float
+6: (type) a string
+7: (name) a string
 
 </pre>
 
@@ -17935,11 +19306,15 @@ biomass_compounds has a value which is a reference to a list where each element
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a biomass_id
-name has a value which is a string
-definition has a value which is a string
-biomass_compounds has a value which is a reference to a list where each element is a BiomassCompound
+a reference to a list containing 8 items:
+0: (compound) a modelcompound_id
+1: (value) a float
+2: (upperBound) a float
+3: (lowerBound) a float
+4: (max) a float
+5: (min) a float
+6: (type) a string
+7: (name) a string
 
 
 =end text
@@ -17948,7 +19323,7 @@ biomass_compounds has a value which is a reference to a list where each element
 
 
 
-=head2 FBAMeta
+=head2 ReactionFlux
 
 =over 4
 
@@ -17956,14 +19331,16 @@ biomass_compounds has a value which is a reference to a list where each element
 
 =item Description
 
-Data structures for a reaction in a model
+Reaction variable in FBA solution
 
-fba_id id - ID of the FBA object
-workspace_id workspace - ID of the workspace containing the FBA object
-media_id media - ID of the media the FBA was performed in
-workspace_id media_workspace - ID of the workspace containing the media formulation
-float objective - optimized objective value of the FBA study
-list<feature_id> ko - list of genes knocked out in the FBA study
+modelreaction_id reaction - ID of reaction in model in FBA solution
+float value - flux through reaction in FBA solution
+float upperBound - maximum flux through reaction in FBA simulation
+float lowerBound -  minimum flux through reaction in FBA simulation
+float max - maximum flux through reaction in FBA simulation
+float min - minimum flux through reaction in FBA simulation
+string type - type of reaction variable
+string definition - stoichiometry of solution reaction in terms of compound names
 
 
 =item Definition
@@ -17971,13 +19348,15 @@ list<feature_id> ko - list of genes knocked out in the FBA study
 =begin html
 
 <pre>
-a reference to a list containing 6 items:
-0: (id) a fba_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (objective) a float
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a list containing 8 items:
+0: (reaction) a modelreaction_id
+1: (value) a float
+2: (upperBound) a float
+3: (lowerBound) a float
+4: (max) a float
+5: (min) a float
+6: (type) a string
+7: (definition) a string
 
 </pre>
 
@@ -17985,13 +19364,15 @@ a reference to a list containing 6 items:
 
 =begin text
 
-a reference to a list containing 6 items:
-0: (id) a fba_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (objective) a float
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a list containing 8 items:
+0: (reaction) a modelreaction_id
+1: (value) a float
+2: (upperBound) a float
+3: (lowerBound) a float
+4: (max) a float
+5: (min) a float
+6: (type) a string
+7: (definition) a string
 
 
 =end text
@@ -18000,7 +19381,7 @@ a reference to a list containing 6 items:
 
 
 
-=head2 GapGenMeta
+=head2 MetaboliteProduction
 
 =over 4
 
@@ -18008,14 +19389,11 @@ a reference to a list containing 6 items:
 
 =item Description
 
-Metadata object providing a summary of a gapgen simulation
+Maximum production of compound in FBA simulation
 
-gapgen_id id - ID of gapgen study object
-workspace_id workspace - workspace containing gapgen study
-media_id media - media formulation for gapgen study
-workspace_id media_workspace - ID of the workspace containing the media formulation
-bool done - boolean indicating if gapgen study is complete
-list<feature_id> ko - list of genes knocked out in gapgen study
+float maximumProduction - maximum production of compound
+modelcompound_id modelcompound - ID of compound with production maximized
+string name - name of compound with simulated production
 
 
 =item Definition
@@ -18023,13 +19401,10 @@ list<feature_id> ko - list of genes knocked out in gapgen study
 =begin html
 
 <pre>
-a reference to a list containing 6 items:
-0: (id) a gapgen_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (done) a bool
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a list containing 3 items:
+0: (maximumProduction) a float
+1: (modelcompound) a modelcompound_id
+2: (name) a string
 
 </pre>
 
@@ -18037,13 +19412,10 @@ a reference to a list containing 6 items:
 
 =begin text
 
-a reference to a list containing 6 items:
-0: (id) a gapgen_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (done) a bool
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a list containing 3 items:
+0: (maximumProduction) a float
+1: (modelcompound) a modelcompound_id
+2: (name) a string
 
 
 =end text
@@ -18052,7 +19424,7 @@ a reference to a list containing 6 items:
 
 
 
-=head2 GapFillMeta
+=head2 MinimalMediaPrediction
 
 =over 4
 
@@ -18060,14 +19432,10 @@ a reference to a list containing 6 items:
 
 =item Description
 
-Metadata object providing a summary of a gapfilling simulation
+Data structures for gapfilling solution
 
-gapfill_id id - ID of gapfill study object
-workspace_id workspace - workspace containing gapfill study
-media_id media - media formulation for gapfill study
-workspace_id media_workspace - ID of the workspace containing the media formulation
-bool done - boolean indicating if gapfill study is complete
-list<feature_id> ko - list of genes knocked out in gapfill study
+list<compound_id> optionalNutrients - list of optional nutrients
+list<compound_id> essentialNutrients - list of essential nutrients
 
 
 =item Definition
@@ -18075,13 +19443,9 @@ list<feature_id> ko - list of genes knocked out in gapfill study
 =begin html
 
 <pre>
-a reference to a list containing 6 items:
-0: (id) a gapfill_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (done) a bool
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a hash where the following keys are defined:
+optionalNutrients has a value which is a reference to a list where each element is a compound_id
+essentialNutrients has a value which is a reference to a list where each element is a compound_id
 
 </pre>
 
@@ -18089,13 +19453,9 @@ a reference to a list containing 6 items:
 
 =begin text
 
-a reference to a list containing 6 items:
-0: (id) a gapfill_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (done) a bool
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a hash where the following keys are defined:
+optionalNutrients has a value which is a reference to a list where each element is a compound_id
+essentialNutrients has a value which is a reference to a list where each element is a compound_id
 
 
 =end text
@@ -18104,7 +19464,7 @@ a reference to a list containing 6 items:
 
 
 
-=head2 FBAModel
+=head2 bound
 
 =over 4
 
@@ -18112,28 +19472,12 @@ a reference to a list containing 6 items:
 
 =item Description
 
-Data structure holding data for metabolic model
+Term of constraint or objective in FBA simulation
 
-fbamodel_id id - ID of model
-workspace_id workspace - workspace containing model
-genome_id genome - ID of associated genome
-workspace_id genome_workspace - workspace with associated genome
-mapping_id map - ID of associated mapping database
-workspace_id map_workspace - workspace with associated mapping database
-biochemistry_id biochemistry - ID of associated biochemistry database
-workspace_id biochemistry_workspace - workspace with associated biochemistry database
-string name - name of the model
-string type - type of model (e.g. single genome, community)
-string status - status of model (e.g. under construction)
-list<ModelBiomass> biomasses - list of biomass reactions in model
-list<ModelCompartment> compartments - list of compartments in model
-list<ModelReaction> reactions - list of reactions in model
-list<ModelCompound> compounds - list of compounds in model
-list<FBAMeta> fbas - list of flux balance analysis studies for model
-list<GapFillMeta> integrated_gapfillings - list of integrated gapfilling solutions
-list<GapFillMeta> unintegrated_gapfillings - list of unintegrated gapfilling solutions
-list<GapGenMeta> integrated_gapgenerations - list of integrated gapgen solutions
-list<GapGenMeta> unintegrated_gapgenerations - list of unintegrated gapgen solutions
+float min - minimum value of custom bound
+float max - maximum value of custom bound
+string varType - type of variable for custom bound
+string variable - variable ID for custom bound
 
 
 =item Definition
@@ -18141,27 +19485,11 @@ list<GapGenMeta> unintegrated_gapgenerations - list of unintegrated gapgen solut
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-map has a value which is a mapping_id
-map_workspace has a value which is a workspace_id
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
-name has a value which is a string
-type has a value which is a string
-status has a value which is a string
-biomasses has a value which is a reference to a list where each element is a ModelBiomass
-compartments has a value which is a reference to a list where each element is a ModelCompartment
-reactions has a value which is a reference to a list where each element is a ModelReaction
-compounds has a value which is a reference to a list where each element is a ModelCompound
-fbas has a value which is a reference to a list where each element is an FBAMeta
-integrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
-unintegrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
-integrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
-unintegrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
+a reference to a list containing 4 items:
+0: (min) a float
+1: (max) a float
+2: (varType) a string
+3: (variable) a string
 
 </pre>
 
@@ -18169,27 +19497,11 @@ unintegrated_gapgenerations has a value which is a reference to a list where eac
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-map has a value which is a mapping_id
-map_workspace has a value which is a workspace_id
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
-name has a value which is a string
-type has a value which is a string
-status has a value which is a string
-biomasses has a value which is a reference to a list where each element is a ModelBiomass
-compartments has a value which is a reference to a list where each element is a ModelCompartment
-reactions has a value which is a reference to a list where each element is a ModelReaction
-compounds has a value which is a reference to a list where each element is a ModelCompound
-fbas has a value which is a reference to a list where each element is an FBAMeta
-integrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
-unintegrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
-integrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
-unintegrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
+a reference to a list containing 4 items:
+0: (min) a float
+1: (max) a float
+2: (varType) a string
+3: (variable) a string
 
 
 =end text
@@ -18198,7 +19510,7 @@ unintegrated_gapgenerations has a value which is a reference to a list where eac
 
 
 
-=head2 GeneAssertion
+=head2 term
 
 =over 4
 
@@ -18206,9 +19518,11 @@ unintegrated_gapgenerations has a value which is a reference to a list where eac
 
 =item Description
 
-********************************************************************************
-    Flux Balance Analysis type definition
-   	********************************************************************************
+Term of constraint or objective in FBA simulation
+
+float coefficient - coefficient of term in objective or constraint
+string varType - type of variable for term in objective or constraint
+string variable - variable ID for term in objective or constraint
 
 
 =item Definition
@@ -18216,11 +19530,10 @@ unintegrated_gapgenerations has a value which is a reference to a list where eac
 =begin html
 
 <pre>
-a reference to a list containing 4 items:
-0: (feature) a feature_id
-1: (growthFraction) a float
-2: (growth) a float
-3: (isEssential) a bool
+a reference to a list containing 3 items:
+0: (coefficient) a float
+1: (varType) a string
+2: (variable) a string
 
 </pre>
 
@@ -18228,11 +19541,10 @@ a reference to a list containing 4 items:
 
 =begin text
 
-a reference to a list containing 4 items:
-0: (feature) a feature_id
-1: (growthFraction) a float
-2: (growth) a float
-3: (isEssential) a bool
+a reference to a list containing 3 items:
+0: (coefficient) a float
+1: (varType) a string
+2: (variable) a string
 
 
 =end text
@@ -18241,7 +19553,7 @@ a reference to a list containing 4 items:
 
 
 
-=head2 CompoundFlux
+=head2 constraint
 
 =over 4
 
@@ -18249,16 +19561,12 @@ a reference to a list containing 4 items:
 
 =item Description
 
-Compound variable in FBA solution
+Custom constraint in FBA simulation
 
-modelcompound_id compound - ID of compound in model in FBA solution
-float value - flux uptake of compound in FBA solution
-float upperBound - maximum uptake of compoundin FBA simulation
-float lowerBound - minimum uptake of compoundin FBA simulation
-float max - maximum uptake of compoundin FBA simulation
-float min - minimum uptake of compoundin FBA simulation
-string type - type of compound variable
-string name - name of compound
+float rhs - right hand side of custom constraint
+string sign - sign of custom constraint (e.g. <, >)
+list<term> terms - terms in custom constraint
+string name - name of custom constraint
 
 
 =item Definition
@@ -18266,15 +19574,11 @@ string name - name of compound
 =begin html
 
 <pre>
-a reference to a list containing 8 items:
-0: (compound) a modelcompound_id
-1: (value) a float
-2: (upperBound) a float
-3: (lowerBound) a float
-4: (max) a float
-5: (min) a float
-6: (type) a string
-7: (name) a string
+a reference to a list containing 4 items:
+0: (rhs) a float
+1: (sign) a string
+2: (terms) a reference to a list where each element is a term
+3: (name) a string
 
 </pre>
 
@@ -18282,15 +19586,11 @@ a reference to a list containing 8 items:
 
 =begin text
 
-a reference to a list containing 8 items:
-0: (compound) a modelcompound_id
-1: (value) a float
-2: (upperBound) a float
-3: (lowerBound) a float
-4: (max) a float
-5: (min) a float
-6: (type) a string
-7: (name) a string
+a reference to a list containing 4 items:
+0: (rhs) a float
+1: (sign) a string
+2: (terms) a reference to a list where each element is a term
+3: (name) a string
 
 
 =end text
@@ -18299,7 +19599,7 @@ a reference to a list containing 8 items:
 
 
 
-=head2 ReactionFlux
+=head2 FBAFormulation
 
 =over 4
 
@@ -18307,16 +19607,32 @@ a reference to a list containing 8 items:
 
 =item Description
 
-Reaction variable in FBA solution
+Data structures for gapfilling solution
 
-modelreaction_id reaction - ID of reaction in model in FBA solution
-float value - flux through reaction in FBA solution
-float upperBound - maximum flux through reaction in FBA simulation
-float lowerBound -  minimum flux through reaction in FBA simulation
-float max - maximum flux through reaction in FBA simulation
-float min - minimum flux through reaction in FBA simulation
-string type - type of reaction variable
-string definition - stoichiometry of solution reaction in terms of compound names
+media_id media - ID of media formulation to be used
+list<compound_id> additionalcpds - list of additional compounds to allow update
+promconstraint_id promconstraint - ID of promconstraint
+workspace_id promconstraint_workspace - workspace containing promconstraint
+sample_id eflux_sample - ID of gene expression sample to run eflux
+series_id eflux_series - ID of series that a sample belongs to.
+workspace_id eflux_workspace - workspace containing gene expression sample series for eflux
+workspace_id media_workspace - workspace containing media for FBA study
+float objfraction - fraction of objective to use for constraints
+bool allreversible - flag indicating if all reactions should be reversible
+bool maximizeObjective - flag indicating if objective should be maximized
+list<term> objectiveTerms - list of terms of objective function
+list<feature_id> geneko - list of gene knockouts
+list<reaction_id> rxnko - list of reaction knockouts
+list<bound> bounds - list of custom bounds
+list<constraint> constraints - list of custom constraints
+mapping<string,float> uptakelim - hash of maximum uptake for elements
+float defaultmaxflux - default maximum intracellular flux
+float defaultminuptake - default minimum nutrient uptake
+float defaultmaxuptake - default maximum nutrient uptake
+bool simplethermoconst - flag indicating if simple thermodynamic constraints should be used
+bool thermoconst - flag indicating if thermodynamic constraints should be used
+bool nothermoerror - flag indicating if no error should be allowed in thermodynamic constraints
+bool minthermoerror - flag indicating if error should be minimized in thermodynamic constraints
 
 
 =item Definition
@@ -18324,15 +19640,31 @@ string definition - stoichiometry of solution reaction in terms of compound name
 =begin html
 
 <pre>
-a reference to a list containing 8 items:
-0: (reaction) a modelreaction_id
-1: (value) a float
-2: (upperBound) a float
-3: (lowerBound) a float
-4: (max) a float
-5: (min) a float
-6: (type) a string
-7: (definition) a string
+a reference to a hash where the following keys are defined:
+media has a value which is a media_id
+additionalcpds has a value which is a reference to a list where each element is a compound_id
+promconstraint has a value which is a promconstraint_id
+promconstraint_workspace has a value which is a workspace_id
+eflux_sample has a value which is a sample_id
+eflux_series has a value which is a series_id
+eflux_workspace has a value which is a workspace_id
+media_workspace has a value which is a workspace_id
+objfraction has a value which is a float
+allreversible has a value which is a bool
+maximizeObjective has a value which is a bool
+objectiveTerms has a value which is a reference to a list where each element is a term
+geneko has a value which is a reference to a list where each element is a feature_id
+rxnko has a value which is a reference to a list where each element is a reaction_id
+bounds has a value which is a reference to a list where each element is a bound
+constraints has a value which is a reference to a list where each element is a constraint
+uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+defaultmaxflux has a value which is a float
+defaultminuptake has a value which is a float
+defaultmaxuptake has a value which is a float
+simplethermoconst has a value which is a bool
+thermoconst has a value which is a bool
+nothermoerror has a value which is a bool
+minthermoerror has a value which is a bool
 
 </pre>
 
@@ -18340,15 +19672,31 @@ a reference to a list containing 8 items:
 
 =begin text
 
-a reference to a list containing 8 items:
-0: (reaction) a modelreaction_id
-1: (value) a float
-2: (upperBound) a float
-3: (lowerBound) a float
-4: (max) a float
-5: (min) a float
-6: (type) a string
-7: (definition) a string
+a reference to a hash where the following keys are defined:
+media has a value which is a media_id
+additionalcpds has a value which is a reference to a list where each element is a compound_id
+promconstraint has a value which is a promconstraint_id
+promconstraint_workspace has a value which is a workspace_id
+eflux_sample has a value which is a sample_id
+eflux_series has a value which is a series_id
+eflux_workspace has a value which is a workspace_id
+media_workspace has a value which is a workspace_id
+objfraction has a value which is a float
+allreversible has a value which is a bool
+maximizeObjective has a value which is a bool
+objectiveTerms has a value which is a reference to a list where each element is a term
+geneko has a value which is a reference to a list where each element is a feature_id
+rxnko has a value which is a reference to a list where each element is a reaction_id
+bounds has a value which is a reference to a list where each element is a bound
+constraints has a value which is a reference to a list where each element is a constraint
+uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+defaultmaxflux has a value which is a float
+defaultminuptake has a value which is a float
+defaultmaxuptake has a value which is a float
+simplethermoconst has a value which is a bool
+thermoconst has a value which is a bool
+nothermoerror has a value which is a bool
+minthermoerror has a value which is a bool
 
 
 =end text
@@ -18357,7 +19705,7 @@ a reference to a list containing 8 items:
 
 
 
-=head2 MetaboliteProduction
+=head2 FBA
 
 =over 4
 
@@ -18365,11 +19713,20 @@ a reference to a list containing 8 items:
 
 =item Description
 
-Maximum production of compound in FBA simulation
+Data structures for gapfilling solution
 
-float maximumProduction - maximum production of compound
-modelcompound_id modelcompound - ID of compound with production maximized
-string name - name of compound with simulated production
+fba_id id - ID of FBA study
+workspace_id workspace - workspace containing FBA study
+        fbamodel_id model - ID of model FBA was run on
+        workspace_id model_workspace - workspace with FBA model
+        float objective - objective value of FBA study
+        bool isComplete - flag indicating if job is complete
+FBAFormulation formulation - specs for FBA study
+list<MinimalMediaPrediction> minimalMediaPredictions - list of minimal media formulation
+list<MetaboliteProduction> metaboliteProductions - list of biomass component production
+list<ReactionFlux> reactionFluxes - list of reaction fluxes
+list<CompoundFlux> compoundFluxes - list of compound uptake fluxes
+list<GeneAssertion> geneAssertions - list of gene assertions
 
 
 =item Definition
@@ -18377,10 +19734,19 @@ string name - name of compound with simulated production
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
-0: (maximumProduction) a float
-1: (modelcompound) a modelcompound_id
-2: (name) a string
+a reference to a hash where the following keys are defined:
+id has a value which is a fba_id
+workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+objective has a value which is a float
+isComplete has a value which is a bool
+formulation has a value which is an FBAFormulation
+minimalMediaPredictions has a value which is a reference to a list where each element is a MinimalMediaPrediction
+metaboliteProductions has a value which is a reference to a list where each element is a MetaboliteProduction
+reactionFluxes has a value which is a reference to a list where each element is a ReactionFlux
+compoundFluxes has a value which is a reference to a list where each element is a CompoundFlux
+geneAssertions has a value which is a reference to a list where each element is a GeneAssertion
 
 </pre>
 
@@ -18388,10 +19754,19 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
-0: (maximumProduction) a float
-1: (modelcompound) a modelcompound_id
-2: (name) a string
+a reference to a hash where the following keys are defined:
+id has a value which is a fba_id
+workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+objective has a value which is a float
+isComplete has a value which is a bool
+formulation has a value which is an FBAFormulation
+minimalMediaPredictions has a value which is a reference to a list where each element is a MinimalMediaPrediction
+metaboliteProductions has a value which is a reference to a list where each element is a MetaboliteProduction
+reactionFluxes has a value which is a reference to a list where each element is a ReactionFlux
+compoundFluxes has a value which is a reference to a list where each element is a CompoundFlux
+geneAssertions has a value which is a reference to a list where each element is a GeneAssertion
 
 
 =end text
@@ -18400,7 +19775,7 @@ a reference to a list containing 3 items:
 
 
 
-=head2 MinimalMediaPrediction
+=head2 GapfillingFormulation
 
 =over 4
 
@@ -18408,10 +19783,9 @@ a reference to a list containing 3 items:
 
 =item Description
 
-Data structures for gapfilling solution
-
-list<compound_id> optionalNutrients - list of optional nutrients
-list<compound_id> essentialNutrients - list of essential nutrients
+********************************************************************************
+    Gapfilling type definition
+   	********************************************************************************
 
 
 =item Definition
@@ -18420,8 +19794,27 @@ list<compound_id> essentialNutrients - list of essential nutrients
 
 <pre>
 a reference to a hash where the following keys are defined:
-optionalNutrients has a value which is a reference to a list where each element is a compound_id
-essentialNutrients has a value which is a reference to a list where each element is a compound_id
+formulation has a value which is an FBAFormulation
+num_solutions has a value which is an int
+nomediahyp has a value which is a bool
+nobiomasshyp has a value which is a bool
+nogprhyp has a value which is a bool
+nopathwayhyp has a value which is a bool
+allowunbalanced has a value which is a bool
+activitybonus has a value which is a float
+drainpen has a value which is a float
+directionpen has a value which is a float
+nostructpen has a value which is a float
+unfavorablepen has a value which is a float
+nodeltagpen has a value which is a float
+biomasstranspen has a value which is a float
+singletranspen has a value which is a float
+transpen has a value which is a float
+blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
+gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
+allowedcmps has a value which is a reference to a list where each element is a compartment_id
+probabilisticAnnotation has a value which is a probanno_id
+probabilisticAnnotation_workspace has a value which is a workspace_id
 
 </pre>
 
@@ -18430,8 +19823,27 @@ essentialNutrients has a value which is a reference to a list where each element
 =begin text
 
 a reference to a hash where the following keys are defined:
-optionalNutrients has a value which is a reference to a list where each element is a compound_id
-essentialNutrients has a value which is a reference to a list where each element is a compound_id
+formulation has a value which is an FBAFormulation
+num_solutions has a value which is an int
+nomediahyp has a value which is a bool
+nobiomasshyp has a value which is a bool
+nogprhyp has a value which is a bool
+nopathwayhyp has a value which is a bool
+allowunbalanced has a value which is a bool
+activitybonus has a value which is a float
+drainpen has a value which is a float
+directionpen has a value which is a float
+nostructpen has a value which is a float
+unfavorablepen has a value which is a float
+nodeltagpen has a value which is a float
+biomasstranspen has a value which is a float
+singletranspen has a value which is a float
+transpen has a value which is a float
+blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
+gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
+allowedcmps has a value which is a reference to a list where each element is a compartment_id
+probabilisticAnnotation has a value which is a probanno_id
+probabilisticAnnotation_workspace has a value which is a workspace_id
 
 
 =end text
@@ -18440,7 +19852,7 @@ essentialNutrients has a value which is a reference to a list where each element
 
 
 
-=head2 bound
+=head2 reactionAddition
 
 =over 4
 
@@ -18448,12 +19860,12 @@ essentialNutrients has a value which is a reference to a list where each element
 
 =item Description
 
-Term of constraint or objective in FBA simulation
+Reactions removed in gapgen solution
 
-float min - minimum value of custom bound
-float max - maximum value of custom bound
-string varType - type of variable for custom bound
-string variable - variable ID for custom bound
+modelreaction_id reaction - ID of the removed reaction
+string direction - direction of reaction removed in gapgen solution
+string equation - stoichiometry of removed reaction in terms of compound IDs
+string definition - stoichiometry of removed reaction in terms of compound names
 
 
 =item Definition
@@ -18461,11 +19873,12 @@ string variable - variable ID for custom bound
 =begin html
 
 <pre>
-a reference to a list containing 4 items:
-0: (min) a float
-1: (max) a float
-2: (varType) a string
-3: (variable) a string
+a reference to a list containing 5 items:
+0: (reaction) a reaction_id
+1: (direction) a string
+2: (compartment_id) a string
+3: (equation) a string
+4: (definition) a string
 
 </pre>
 
@@ -18473,11 +19886,12 @@ a reference to a list containing 4 items:
 
 =begin text
 
-a reference to a list containing 4 items:
-0: (min) a float
-1: (max) a float
-2: (varType) a string
-3: (variable) a string
+a reference to a list containing 5 items:
+0: (reaction) a reaction_id
+1: (direction) a string
+2: (compartment_id) a string
+3: (equation) a string
+4: (definition) a string
 
 
 =end text
@@ -18486,7 +19900,7 @@ a reference to a list containing 4 items:
 
 
 
-=head2 term
+=head2 biomassRemoval
 
 =over 4
 
@@ -18494,11 +19908,10 @@ a reference to a list containing 4 items:
 
 =item Description
 
-Term of constraint or objective in FBA simulation
+Biomass component removed in gapfill solution
 
-float coefficient - coefficient of term in objective or constraint
-string varType - type of variable for term in objective or constraint
-string variable - variable ID for term in objective or constraint
+compound_id compound - ID of biomass component removed
+string name - name of biomass component removed
 
 
 =item Definition
@@ -18506,10 +19919,9 @@ string variable - variable ID for term in objective or constraint
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
-0: (coefficient) a float
-1: (varType) a string
-2: (variable) a string
+a reference to a list containing 2 items:
+0: (compound) a compound_id
+1: (name) a string
 
 </pre>
 
@@ -18517,10 +19929,9 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
-0: (coefficient) a float
-1: (varType) a string
-2: (variable) a string
+a reference to a list containing 2 items:
+0: (compound) a compound_id
+1: (name) a string
 
 
 =end text
@@ -18529,7 +19940,7 @@ a reference to a list containing 3 items:
 
 
 
-=head2 constraint
+=head2 mediaAddition
 
 =over 4
 
@@ -18537,12 +19948,10 @@ a reference to a list containing 3 items:
 
 =item Description
 
-Custom constraint in FBA simulation
+Media component added in gapfill solution
 
-float rhs - right hand side of custom constraint
-string sign - sign of custom constraint (e.g. <, >)
-list<term> terms - terms in custom constraint
-string name - name of custom constraint
+compound_id compound - ID of media component added
+string name - name of media component added
 
 
 =item Definition
@@ -18550,11 +19959,9 @@ string name - name of custom constraint
 =begin html
 
 <pre>
-a reference to a list containing 4 items:
-0: (rhs) a float
-1: (sign) a string
-2: (terms) a reference to a list where each element is a term
-3: (name) a string
+a reference to a list containing 2 items:
+0: (compound) a compound_id
+1: (name) a string
 
 </pre>
 
@@ -18562,11 +19969,9 @@ a reference to a list containing 4 items:
 
 =begin text
 
-a reference to a list containing 4 items:
-0: (rhs) a float
-1: (sign) a string
-2: (terms) a reference to a list where each element is a term
-3: (name) a string
+a reference to a list containing 2 items:
+0: (compound) a compound_id
+1: (name) a string
 
 
 =end text
@@ -18575,7 +19980,7 @@ a reference to a list containing 4 items:
 
 
 
-=head2 FBAFormulation
+=head2 GapFillSolution
 
 =over 4
 
@@ -18585,30 +19990,11 @@ a reference to a list containing 4 items:
 
 Data structures for gapfilling solution
 
-media_id media - ID of media formulation to be used
-list<compound_id> additionalcpds - list of additional compounds to allow update
-promconstraint_id promconstraint - ID of promconstraint
-workspace_id promconstraint_workspace - workspace containing promconstraint
-sample_id eflux_sample - ID of gene expression sample to run eflux
-series_id eflux_series - ID of series that a sample belongs to.
-workspace_id eflux_workspace - workspace containing gene expression sample series for eflux
-workspace_id media_workspace - workspace containing media for FBA study
-float objfraction - fraction of objective to use for constraints
-bool allreversible - flag indicating if all reactions should be reversible
-bool maximizeObjective - flag indicating if objective should be maximized
-list<term> objectiveTerms - list of terms of objective function
-list<feature_id> geneko - list of gene knockouts
-list<reaction_id> rxnko - list of reaction knockouts
-list<bound> bounds - list of custom bounds
-list<constraint> constraints - list of custom constraints
-mapping<string,float> uptakelim - hash of maximum uptake for elements
-float defaultmaxflux - default maximum intracellular flux
-float defaultminuptake - default minimum nutrient uptake
-float defaultmaxuptake - default maximum nutrient uptake
-bool simplethermoconst - flag indicating if simple thermodynamic constraints should be used
-bool thermoconst - flag indicating if thermodynamic constraints should be used
-bool nothermoerror - flag indicating if no error should be allowed in thermodynamic constraints
-bool minthermoerror - flag indicating if error should be minimized in thermodynamic constraints
+gapfillsolution_id id - ID of gapfilling solution
+        float objective - cost of gapfilling solution
+list<biomassRemoval> biomassRemovals - list of biomass components being removed
+list<mediaAddition> mediaAdditions - list of media components being added
+list<reactionAddition> reactionAdditions - list of reactions being added
 
 
 =item Definition
@@ -18617,30 +20003,12 @@ bool minthermoerror - flag indicating if error should be minimized in thermodyna
 
 <pre>
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-additionalcpds has a value which is a reference to a list where each element is a compound_id
-promconstraint has a value which is a promconstraint_id
-promconstraint_workspace has a value which is a workspace_id
-eflux_sample has a value which is a sample_id
-eflux_series has a value which is a series_id
-eflux_workspace has a value which is a workspace_id
-media_workspace has a value which is a workspace_id
-objfraction has a value which is a float
-allreversible has a value which is a bool
-maximizeObjective has a value which is a bool
-objectiveTerms has a value which is a reference to a list where each element is a term
-geneko has a value which is a reference to a list where each element is a feature_id
-rxnko has a value which is a reference to a list where each element is a reaction_id
-bounds has a value which is a reference to a list where each element is a bound
-constraints has a value which is a reference to a list where each element is a constraint
-uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
-defaultmaxflux has a value which is a float
-defaultminuptake has a value which is a float
-defaultmaxuptake has a value which is a float
-simplethermoconst has a value which is a bool
-thermoconst has a value which is a bool
-nothermoerror has a value which is a bool
-minthermoerror has a value which is a bool
+id has a value which is a gapfillsolution_id
+objective has a value which is a float
+integrated has a value which is a bool
+biomassRemovals has a value which is a reference to a list where each element is a biomassRemoval
+mediaAdditions has a value which is a reference to a list where each element is a mediaAddition
+reactionAdditions has a value which is a reference to a list where each element is a reactionAddition
 
 </pre>
 
@@ -18649,30 +20017,12 @@ minthermoerror has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-additionalcpds has a value which is a reference to a list where each element is a compound_id
-promconstraint has a value which is a promconstraint_id
-promconstraint_workspace has a value which is a workspace_id
-eflux_sample has a value which is a sample_id
-eflux_series has a value which is a series_id
-eflux_workspace has a value which is a workspace_id
-media_workspace has a value which is a workspace_id
-objfraction has a value which is a float
-allreversible has a value which is a bool
-maximizeObjective has a value which is a bool
-objectiveTerms has a value which is a reference to a list where each element is a term
-geneko has a value which is a reference to a list where each element is a feature_id
-rxnko has a value which is a reference to a list where each element is a reaction_id
-bounds has a value which is a reference to a list where each element is a bound
-constraints has a value which is a reference to a list where each element is a constraint
-uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
-defaultmaxflux has a value which is a float
-defaultminuptake has a value which is a float
-defaultmaxuptake has a value which is a float
-simplethermoconst has a value which is a bool
-thermoconst has a value which is a bool
-nothermoerror has a value which is a bool
-minthermoerror has a value which is a bool
+id has a value which is a gapfillsolution_id
+objective has a value which is a float
+integrated has a value which is a bool
+biomassRemovals has a value which is a reference to a list where each element is a biomassRemoval
+mediaAdditions has a value which is a reference to a list where each element is a mediaAddition
+reactionAdditions has a value which is a reference to a list where each element is a reactionAddition
 
 
 =end text
@@ -18681,7 +20031,7 @@ minthermoerror has a value which is a bool
 
 
 
-=head2 FBA
+=head2 GapFill
 
 =over 4
 
@@ -18689,20 +20039,15 @@ minthermoerror has a value which is a bool
 
 =item Description
 
-Data structures for gapfilling solution
+Data structures for gapfilling analysis
 
-fba_id id - ID of FBA study
-workspace_id workspace - workspace containing FBA study
-        fbamodel_id model - ID of model FBA was run on
-        workspace_id model_workspace - workspace with FBA model
-        float objective - objective value of FBA study
-        bool isComplete - flag indicating if job is complete
-FBAFormulation formulation - specs for FBA study
-list<MinimalMediaPrediction> minimalMediaPredictions - list of minimal media formulation
-list<MetaboliteProduction> metaboliteProductions - list of biomass component production
-list<ReactionFlux> reactionFluxes - list of reaction fluxes
-list<CompoundFlux> compoundFluxes - list of compound uptake fluxes
-list<GeneAssertion> geneAssertions - list of gene assertions
+gapfill_id id - ID of gapfill analysis
+workspace_id workspace - workspace containing gapfill analysis
+fbamodel_id model - ID of model being gapfilled
+        workspace_id model_workspace - workspace containing model
+        bool isComplete - indicates if gapfilling is complete
+GapfillingFormulation formulation - formulation of gapfilling analysis
+list<GapFillSolution> solutions - list of gapfilling solutions
 
 
 =item Definition
@@ -18711,18 +20056,13 @@ list<GeneAssertion> geneAssertions - list of gene assertions
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a fba_id
+id has a value which is a gapfill_id
 workspace has a value which is a workspace_id
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
-objective has a value which is a float
 isComplete has a value which is a bool
-formulation has a value which is an FBAFormulation
-minimalMediaPredictions has a value which is a reference to a list where each element is a MinimalMediaPrediction
-metaboliteProductions has a value which is a reference to a list where each element is a MetaboliteProduction
-reactionFluxes has a value which is a reference to a list where each element is a ReactionFlux
-compoundFluxes has a value which is a reference to a list where each element is a CompoundFlux
-geneAssertions has a value which is a reference to a list where each element is a GeneAssertion
+formulation has a value which is a GapfillingFormulation
+solutions has a value which is a reference to a list where each element is a GapFillSolution
 
 </pre>
 
@@ -18731,18 +20071,13 @@ geneAssertions has a value which is a reference to a list where each element is
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a fba_id
+id has a value which is a gapfill_id
 workspace has a value which is a workspace_id
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
-objective has a value which is a float
 isComplete has a value which is a bool
-formulation has a value which is an FBAFormulation
-minimalMediaPredictions has a value which is a reference to a list where each element is a MinimalMediaPrediction
-metaboliteProductions has a value which is a reference to a list where each element is a MetaboliteProduction
-reactionFluxes has a value which is a reference to a list where each element is a ReactionFlux
-compoundFluxes has a value which is a reference to a list where each element is a CompoundFlux
-geneAssertions has a value which is a reference to a list where each element is a GeneAssertion
+formulation has a value which is a GapfillingFormulation
+solutions has a value which is a reference to a list where each element is a GapFillSolution
 
 
 =end text
@@ -18751,7 +20086,7 @@ geneAssertions has a value which is a reference to a list where each element is
 
 
 
-=head2 GapfillingFormulation
+=head2 GapgenFormulation
 
 =over 4
 
@@ -18760,7 +20095,7 @@ geneAssertions has a value which is a reference to a list where each element is
 =item Description
 
 ********************************************************************************
-    Gapfilling type definition
+    Gap Generation type definition
    	********************************************************************************
 
 
@@ -18771,26 +20106,13 @@ geneAssertions has a value which is a reference to a list where each element is
 <pre>
 a reference to a hash where the following keys are defined:
 formulation has a value which is an FBAFormulation
+refmedia has a value which is a media_id
+refmedia_workspace has a value which is a workspace_id
 num_solutions has a value which is an int
 nomediahyp has a value which is a bool
 nobiomasshyp has a value which is a bool
 nogprhyp has a value which is a bool
 nopathwayhyp has a value which is a bool
-allowunbalanced has a value which is a bool
-activitybonus has a value which is a float
-drainpen has a value which is a float
-directionpen has a value which is a float
-nostructpen has a value which is a float
-unfavorablepen has a value which is a float
-nodeltagpen has a value which is a float
-biomasstranspen has a value which is a float
-singletranspen has a value which is a float
-transpen has a value which is a float
-blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
-gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
-allowedcmps has a value which is a reference to a list where each element is a compartment_id
-probabilisticAnnotation has a value which is a probanno_id
-probabilisticAnnotation_workspace has a value which is a workspace_id
 
 </pre>
 
@@ -18800,26 +20122,13 @@ probabilisticAnnotation_workspace has a value which is a workspace_id
 
 a reference to a hash where the following keys are defined:
 formulation has a value which is an FBAFormulation
+refmedia has a value which is a media_id
+refmedia_workspace has a value which is a workspace_id
 num_solutions has a value which is an int
 nomediahyp has a value which is a bool
 nobiomasshyp has a value which is a bool
 nogprhyp has a value which is a bool
 nopathwayhyp has a value which is a bool
-allowunbalanced has a value which is a bool
-activitybonus has a value which is a float
-drainpen has a value which is a float
-directionpen has a value which is a float
-nostructpen has a value which is a float
-unfavorablepen has a value which is a float
-nodeltagpen has a value which is a float
-biomasstranspen has a value which is a float
-singletranspen has a value which is a float
-transpen has a value which is a float
-blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
-gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
-allowedcmps has a value which is a reference to a list where each element is a compartment_id
-probabilisticAnnotation has a value which is a probanno_id
-probabilisticAnnotation_workspace has a value which is a workspace_id
 
 
 =end text
@@ -18828,7 +20137,7 @@ probabilisticAnnotation_workspace has a value which is a workspace_id
 
 
 
-=head2 reactionAddition
+=head2 reactionRemoval
 
 =over 4
 
@@ -18849,12 +20158,11 @@ string definition - stoichiometry of removed reaction in terms of compound names
 =begin html
 
 <pre>
-a reference to a list containing 5 items:
-0: (reaction) a reaction_id
+a reference to a list containing 4 items:
+0: (reaction) a modelreaction_id
 1: (direction) a string
-2: (compartment_id) a string
-3: (equation) a string
-4: (definition) a string
+2: (equation) a string
+3: (definition) a string
 
 </pre>
 
@@ -18862,12 +20170,11 @@ a reference to a list containing 5 items:
 
 =begin text
 
-a reference to a list containing 5 items:
-0: (reaction) a reaction_id
+a reference to a list containing 4 items:
+0: (reaction) a modelreaction_id
 1: (direction) a string
-2: (compartment_id) a string
-3: (equation) a string
-4: (definition) a string
+2: (equation) a string
+3: (definition) a string
 
 
 =end text
@@ -18876,7 +20183,7 @@ a reference to a list containing 5 items:
 
 
 
-=head2 biomassRemoval
+=head2 biomassAddition
 
 =over 4
 
@@ -18884,10 +20191,10 @@ a reference to a list containing 5 items:
 
 =item Description
 
-Biomass component removed in gapfill solution
+Compounds added to biomass in gapgen solution
 
-compound_id compound - ID of biomass component removed
-string name - name of biomass component removed
+compound_id compound - ID of biomass compound added
+string name - name of biomass compound added
 
 
 =item Definition
@@ -18916,7 +20223,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 mediaAddition
+=head2 mediaRemoval
 
 =over 4
 
@@ -18924,10 +20231,10 @@ a reference to a list containing 2 items:
 
 =item Description
 
-Media component added in gapfill solution
+Media components removed in gapgen solution
 
-compound_id compound - ID of media component added
-string name - name of media component added
+compound_id compound - ID of media component removed
+string name - name of media component removed
 
 
 =item Definition
@@ -18956,7 +20263,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 GapFillSolution
+=head2 GapgenSolution
 
 =over 4
 
@@ -18964,13 +20271,13 @@ a reference to a list containing 2 items:
 
 =item Description
 
-Data structures for gapfilling solution
+Data structures for gap generation solution
 
-gapfillsolution_id id - ID of gapfilling solution
-        float objective - cost of gapfilling solution
-list<biomassRemoval> biomassRemovals - list of biomass components being removed
-list<mediaAddition> mediaAdditions - list of media components being added
-list<reactionAddition> reactionAdditions - list of reactions being added
+gapgensolution_id id - ID of gapgen solution
+        float objective - cost of gapgen solution
+list<biomassAddition> biomassAdditions - list of components added to biomass
+list<mediaRemoval> mediaRemovals - list of media components removed
+list<reactionRemoval> reactionRemovals - list of reactions removed
 
 
 =item Definition
@@ -18979,12 +20286,11 @@ list<reactionAddition> reactionAdditions - list of reactions being added
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a gapfillsolution_id
+id has a value which is a gapgensolution_id
 objective has a value which is a float
-integrated has a value which is a bool
-biomassRemovals has a value which is a reference to a list where each element is a biomassRemoval
-mediaAdditions has a value which is a reference to a list where each element is a mediaAddition
-reactionAdditions has a value which is a reference to a list where each element is a reactionAddition
+biomassAdditions has a value which is a reference to a list where each element is a biomassAddition
+mediaRemovals has a value which is a reference to a list where each element is a mediaRemoval
+reactionRemovals has a value which is a reference to a list where each element is a reactionRemoval
 
 </pre>
 
@@ -18993,12 +20299,11 @@ reactionAdditions has a value which is a reference to a list where each element
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a gapfillsolution_id
+id has a value which is a gapgensolution_id
 objective has a value which is a float
-integrated has a value which is a bool
-biomassRemovals has a value which is a reference to a list where each element is a biomassRemoval
-mediaAdditions has a value which is a reference to a list where each element is a mediaAddition
-reactionAdditions has a value which is a reference to a list where each element is a reactionAddition
+biomassAdditions has a value which is a reference to a list where each element is a biomassAddition
+mediaRemovals has a value which is a reference to a list where each element is a mediaRemoval
+reactionRemovals has a value which is a reference to a list where each element is a reactionRemoval
 
 
 =end text
@@ -19007,7 +20312,7 @@ reactionAdditions has a value which is a reference to a list where each element
 
 
 
-=head2 GapFill
+=head2 GapGen
 
 =over 4
 
@@ -19015,15 +20320,15 @@ reactionAdditions has a value which is a reference to a list where each element
 
 =item Description
 
-Data structures for gapfilling analysis
+Data structures for gap generation analysis
 
-gapfill_id id - ID of gapfill analysis
-workspace_id workspace - workspace containing gapfill analysis
-fbamodel_id model - ID of model being gapfilled
+gapgen_id id - ID of gapgen object
+workspace_id workspace - workspace containing gapgen object
+fbamodel_id model - ID of model being gap generated
         workspace_id model_workspace - workspace containing model
-        bool isComplete - indicates if gapfilling is complete
-GapfillingFormulation formulation - formulation of gapfilling analysis
-list<GapFillSolution> solutions - list of gapfilling solutions
+        bool isComplete - flag indicating if gap generation is complete
+GapgenFormulation formulation - formulation of gap generation analysis
+list<GapgenSolution> solutions - list of gap generation solutions
 
 
 =item Definition
@@ -19032,13 +20337,13 @@ list<GapFillSolution> solutions - list of gapfilling solutions
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a gapfill_id
+id has a value which is a gapgen_id
 workspace has a value which is a workspace_id
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
 isComplete has a value which is a bool
-formulation has a value which is a GapfillingFormulation
-solutions has a value which is a reference to a list where each element is a GapFillSolution
+formulation has a value which is a GapgenFormulation
+solutions has a value which is a reference to a list where each element is a GapgenSolution
 
 </pre>
 
@@ -19047,13 +20352,13 @@ solutions has a value which is a reference to a list where each element is a Gap
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a gapfill_id
+id has a value which is a gapgen_id
 workspace has a value which is a workspace_id
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
 isComplete has a value which is a bool
-formulation has a value which is a GapfillingFormulation
-solutions has a value which is a reference to a list where each element is a GapFillSolution
+formulation has a value which is a GapgenFormulation
+solutions has a value which is a reference to a list where each element is a GapgenSolution
 
 
 =end text
@@ -19062,7 +20367,7 @@ solutions has a value which is a reference to a list where each element is a Gap
 
 
 
-=head2 GapgenFormulation
+=head2 Phenotype
 
 =over 4
 
@@ -19071,24 +20376,76 @@ solutions has a value which is a reference to a list where each element is a Gap
 =item Description
 
 ********************************************************************************
-    Gap Generation type definition
+    Phenotype type definitions
    	********************************************************************************
 
 
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a list containing 6 items:
+0: (geneKO) a reference to a list where each element is a feature_id
+1: (baseMedia) a media_id
+2: (media_workspace) a workspace_id
+3: (additionalCpd) a reference to a list where each element is a compound_id
+4: (normalizedGrowth) a float
+5: (label) a string
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a list containing 6 items:
+0: (geneKO) a reference to a list where each element is a feature_id
+1: (baseMedia) a media_id
+2: (media_workspace) a workspace_id
+3: (additionalCpd) a reference to a list where each element is a compound_id
+4: (normalizedGrowth) a float
+5: (label) a string
+
+
+=end text
+
+=back
+
+
+
+=head2 PhenotypeSet
+
+=over 4
+
+
+
+=item Description
+
+Data structures for set of growth phenotype observations
+
+phenotype_set_id id - ID of the phenotype set
+genome_id genome - ID of the genome for the strain used with the growth phenotypes
+workspace_id genome_workspace - workspace containing the genome object
+list<Phenotype> phenotypes - list of phenotypes included in the phenotype set
+string importErrors - list of errors encountered during the import of the phenotype set
+string source - source of the phenotype set
+string name - name of the phenotype set
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-formulation has a value which is an FBAFormulation
-refmedia has a value which is a media_id
-refmedia_workspace has a value which is a workspace_id
-num_solutions has a value which is an int
-nomediahyp has a value which is a bool
-nobiomasshyp has a value which is a bool
-nogprhyp has a value which is a bool
-nopathwayhyp has a value which is a bool
+id has a value which is a phenotype_set_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+phenotypes has a value which is a reference to a list where each element is a Phenotype
+source has a value which is a string
+name has a value which is a string
+importErrors has a value which is a string
 
 </pre>
 
@@ -19097,14 +20454,13 @@ nopathwayhyp has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-formulation has a value which is an FBAFormulation
-refmedia has a value which is a media_id
-refmedia_workspace has a value which is a workspace_id
-num_solutions has a value which is an int
-nomediahyp has a value which is a bool
-nobiomasshyp has a value which is a bool
-nogprhyp has a value which is a bool
-nopathwayhyp has a value which is a bool
+id has a value which is a phenotype_set_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+phenotypes has a value which is a reference to a list where each element is a Phenotype
+source has a value which is a string
+name has a value which is a string
+importErrors has a value which is a string
 
 
 =end text
@@ -19113,7 +20469,7 @@ nopathwayhyp has a value which is a bool
 
 
 
-=head2 reactionRemoval
+=head2 phenotypeSimulationSet_id
 
 =over 4
 
@@ -19121,12 +20477,43 @@ nopathwayhyp has a value which is a bool
 
 =item Description
 
-Reactions removed in gapgen solution
+ID of the phenotype simulation object
 
-modelreaction_id reaction - ID of the removed reaction
-string direction - direction of reaction removed in gapgen solution
-string equation - stoichiometry of removed reaction in terms of compound IDs
-string definition - stoichiometry of removed reaction in terms of compound names
+
+=item Definition
+
+=begin html
+
+<pre>
+a string
+</pre>
+
+=end html
+
+=begin text
+
+a string
+
+=end text
+
+=back
+
+
+
+=head2 PhenotypeSimulation
+
+=over 4
+
+
+
+=item Description
+
+Data structures for a phenotype simulation
+
+Phenotype phenotypeData - actual phenotype data simulated
+float simulatedGrowth - actual simulated growth rate
+float simulatedGrowthFraction - fraction of wildtype simulated growth rate
+string phenoclass - class of the phenotype simulation (i.e. 'CP' - correct positive, 'CN' - correct negative, 'FP' - false positive, 'FN' - false negative)
 
 
 =item Definition
@@ -19135,10 +20522,10 @@ string definition - stoichiometry of removed reaction in terms of compound names
 
 <pre>
 a reference to a list containing 4 items:
-0: (reaction) a modelreaction_id
-1: (direction) a string
-2: (equation) a string
-3: (definition) a string
+0: (phenotypeData) a Phenotype
+1: (simulatedGrowth) a float
+2: (simulatedGrowthFraction) a float
+3: (phenoclass) a string
 
 </pre>
 
@@ -19147,10 +20534,10 @@ a reference to a list containing 4 items:
 =begin text
 
 a reference to a list containing 4 items:
-0: (reaction) a modelreaction_id
-1: (direction) a string
-2: (equation) a string
-3: (definition) a string
+0: (phenotypeData) a Phenotype
+1: (simulatedGrowth) a float
+2: (simulatedGrowthFraction) a float
+3: (phenoclass) a string
 
 
 =end text
@@ -19159,7 +20546,7 @@ a reference to a list containing 4 items:
 
 
 
-=head2 biomassAddition
+=head2 PhenotypeSimulationSet
 
 =over 4
 
@@ -19167,30 +20554,39 @@ a reference to a list containing 4 items:
 
 =item Description
 
-Compounds added to biomass in gapgen solution
+Data structures for phenotype simulations of a set of phenotype data
 
-compound_id compound - ID of biomass compound added
-string name - name of biomass compound added
+phenotypeSimulationSet_id id - ID for the phenotype simulation set object
+fbamodel_id model - ID of the model used to simulate all phenotypes
+workspace_id model_workspace - workspace containing the model used for the simulation
+phenotype_set_id phenotypeSet - set of observed phenotypes that were simulated
+list<PhenotypeSimulation> phenotypeSimulations - list of simulated phenotypes
 
 
 =item Definition
 
 =begin html
 
-<pre>
-a reference to a list containing 2 items:
-0: (compound) a compound_id
-1: (name) a string
-
+<pre>
+a reference to a hash where the following keys are defined:
+id has a value which is a phenotypeSimulationSet_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSimulations has a value which is a reference to a list where each element is a PhenotypeSimulation
+
 </pre>
 
 =end html
 
 =begin text
 
-a reference to a list containing 2 items:
-0: (compound) a compound_id
-1: (name) a string
+a reference to a hash where the following keys are defined:
+id has a value which is a phenotypeSimulationSet_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSimulations has a value which is a reference to a list where each element is a PhenotypeSimulation
 
 
 =end text
@@ -19199,7 +20595,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 mediaRemoval
+=head2 reactionSpecification
 
 =over 4
 
@@ -19207,10 +20603,10 @@ a reference to a list containing 2 items:
 
 =item Description
 
-Media components removed in gapgen solution
+Data structure for holding gapfill or gapgen solution reaction information
 
-compound_id compound - ID of media component removed
-string name - name of media component removed
+string direction - direction of gapfilled or gapgen reaction
+string reactionID - ID of gapfilled or gapgen reaction
 
 
 =item Definition
@@ -19219,8 +20615,8 @@ string name - name of media component removed
 
 <pre>
 a reference to a list containing 2 items:
-0: (compound) a compound_id
-1: (name) a string
+0: (direction) a string
+1: (reactionID) a string
 
 </pre>
 
@@ -19229,8 +20625,8 @@ a reference to a list containing 2 items:
 =begin text
 
 a reference to a list containing 2 items:
-0: (compound) a compound_id
-1: (name) a string
+0: (direction) a string
+1: (reactionID) a string
 
 
 =end text
@@ -19239,7 +20635,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 GapgenSolution
+=head2 PhenotypeSensitivityAnalysis
 
 =over 4
 
@@ -19247,13 +20643,7 @@ a reference to a list containing 2 items:
 
 =item Description
 
-Data structures for gap generation solution
-
-gapgensolution_id id - ID of gapgen solution
-        float objective - cost of gapgen solution
-list<biomassAddition> biomassAdditions - list of components added to biomass
-list<mediaRemoval> mediaRemovals - list of media components removed
-list<reactionRemoval> reactionRemovals - list of reactions removed
+list<string id, string solutionIndex, list<reactionSpecification> reactionList, list<string> biomassEdits,list<tuple<float simulatedGrowth,float simulatedGrowthFraction,string phenoclass>> PhenotypeSimulations> reconciliationSolutionSimulations;
 
 
 =item Definition
@@ -19262,11 +20652,16 @@ list<reactionRemoval> reactionRemovals - list of reactions removed
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a gapgensolution_id
-objective has a value which is a float
-biomassAdditions has a value which is a reference to a list where each element is a biomassAddition
-mediaRemovals has a value which is a reference to a list where each element is a mediaRemoval
-reactionRemovals has a value which is a reference to a list where each element is a reactionRemoval
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSet_workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+phenotypes has a value which is a reference to a list where each element is a Phenotype
+wildtypePhenotypeSimulations has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+0: (simulatedGrowth) a float
+1: (simulatedGrowthFraction) a float
+2: (phenoclass) a string
+
 
 </pre>
 
@@ -19275,11 +20670,16 @@ reactionRemovals has a value which is a reference to a list where each element i
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a gapgensolution_id
-objective has a value which is a float
-biomassAdditions has a value which is a reference to a list where each element is a biomassAddition
-mediaRemovals has a value which is a reference to a list where each element is a mediaRemoval
-reactionRemovals has a value which is a reference to a list where each element is a reactionRemoval
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSet_workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+phenotypes has a value which is a reference to a list where each element is a Phenotype
+wildtypePhenotypeSimulations has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+0: (simulatedGrowth) a float
+1: (simulatedGrowthFraction) a float
+2: (phenoclass) a string
+
 
 
 =end text
@@ -19288,7 +20688,7 @@ reactionRemovals has a value which is a reference to a list where each element i
 
 
 
-=head2 GapGen
+=head2 job_id
 
 =over 4
 
@@ -19296,15 +20696,9 @@ reactionRemovals has a value which is a reference to a list where each element i
 
 =item Description
 
-Data structures for gap generation analysis
-
-gapgen_id id - ID of gapgen object
-workspace_id workspace - workspace containing gapgen object
-fbamodel_id model - ID of model being gap generated
-        workspace_id model_workspace - workspace containing model
-        bool isComplete - flag indicating if gap generation is complete
-GapgenFormulation formulation - formulation of gap generation analysis
-list<GapgenSolution> solutions - list of gap generation solutions
+********************************************************************************
+    Job object type definitions
+   	********************************************************************************
 
 
 =item Definition
@@ -19312,30 +20706,14 @@ list<GapgenSolution> solutions - list of gap generation solutions
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a gapgen_id
-workspace has a value which is a workspace_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-isComplete has a value which is a bool
-formulation has a value which is a GapgenFormulation
-solutions has a value which is a reference to a list where each element is a GapgenSolution
-
+a string
 </pre>
 
 =end html
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a gapgen_id
-workspace has a value which is a workspace_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-isComplete has a value which is a bool
-formulation has a value which is a GapgenFormulation
-solutions has a value which is a reference to a list where each element is a GapgenSolution
-
+a string
 
 =end text
 
@@ -19343,7 +20721,7 @@ solutions has a value which is a reference to a list where each element is a Gap
 
 
 
-=head2 Phenotype
+=head2 CommandArguments
 
 =over 4
 
@@ -19351,9 +20729,7 @@ solutions has a value which is a reference to a list where each element is a Gap
 
 =item Description
 
-********************************************************************************
-    Phenotype type definitions
-   	********************************************************************************
+Object to hold the arguments to be submitted to the post process command
 
 
 =item Definition
@@ -19361,13 +20737,8 @@ solutions has a value which is a reference to a list where each element is a Gap
 =begin html
 
 <pre>
-a reference to a list containing 6 items:
-0: (geneKO) a reference to a list where each element is a feature_id
-1: (baseMedia) a media_id
-2: (media_workspace) a workspace_id
-3: (additionalCpd) a reference to a list where each element is a compound_id
-4: (normalizedGrowth) a float
-5: (label) a string
+a reference to a hash where the following keys are defined:
+auth has a value which is a string
 
 </pre>
 
@@ -19375,13 +20746,8 @@ a reference to a list containing 6 items:
 
 =begin text
 
-a reference to a list containing 6 items:
-0: (geneKO) a reference to a list where each element is a feature_id
-1: (baseMedia) a media_id
-2: (media_workspace) a workspace_id
-3: (additionalCpd) a reference to a list where each element is a compound_id
-4: (normalizedGrowth) a float
-5: (label) a string
+a reference to a hash where the following keys are defined:
+auth has a value which is a string
 
 
 =end text
@@ -19390,7 +20756,7 @@ a reference to a list containing 6 items:
 
 
 
-=head2 PhenotypeSet
+=head2 clusterjob
 
 =over 4
 
@@ -19398,15 +20764,7 @@ a reference to a list containing 6 items:
 
 =item Description
 
-Data structures for set of growth phenotype observations
-
-phenotype_set_id id - ID of the phenotype set
-genome_id genome - ID of the genome for the strain used with the growth phenotypes
-workspace_id genome_workspace - workspace containing the genome object
-list<Phenotype> phenotypes - list of phenotypes included in the phenotype set
-string importErrors - list of errors encountered during the import of the phenotype set
-string source - source of the phenotype set
-string name - name of the phenotype set
+Object to hold data required to run cluster job
 
 
 =item Definition
@@ -19415,13 +20773,7 @@ string name - name of the phenotype set
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a phenotype_set_id
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-phenotypes has a value which is a reference to a list where each element is a Phenotype
-source has a value which is a string
-name has a value which is a string
-importErrors has a value which is a string
+auth has a value which is a string
 
 </pre>
 
@@ -19430,13 +20782,7 @@ importErrors has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a phenotype_set_id
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-phenotypes has a value which is a reference to a list where each element is a Phenotype
-source has a value which is a string
-name has a value which is a string
-importErrors has a value which is a string
+auth has a value which is a string
 
 
 =end text
@@ -19445,7 +20791,7 @@ importErrors has a value which is a string
 
 
 
-=head2 phenotypeSimulationSet_id
+=head2 JobObject
 
 =over 4
 
@@ -19453,7 +20799,18 @@ importErrors has a value which is a string
 
 =item Description
 
-ID of the phenotype simulation object
+Data structures for a job object
+
+job_id id - ID of the job object
+string type - type of the job
+string auth - authentication token of job owner
+string status - current status of job
+mapping<string,string> jobdata;
+string queuetime - time when job was queued
+string starttime - time when job started running
+string completetime - time when the job was completed
+string owner - owner of the job
+string queuecommand - command used to queue job
 
 
 =item Definition
@@ -19461,14 +20818,36 @@ ID of the phenotype simulation object
 =begin html
 
 <pre>
-a string
+a reference to a hash where the following keys are defined:
+id has a value which is a job_id
+type has a value which is a string
+auth has a value which is a string
+status has a value which is a string
+jobdata has a value which is a reference to a hash where the key is a string and the value is a string
+queuetime has a value which is a string
+starttime has a value which is a string
+completetime has a value which is a string
+owner has a value which is a string
+queuecommand has a value which is a string
+
 </pre>
 
 =end html
 
 =begin text
 
-a string
+a reference to a hash where the following keys are defined:
+id has a value which is a job_id
+type has a value which is a string
+auth has a value which is a string
+status has a value which is a string
+jobdata has a value which is a reference to a hash where the key is a string and the value is a string
+queuetime has a value which is a string
+starttime has a value which is a string
+completetime has a value which is a string
+owner has a value which is a string
+queuecommand has a value which is a string
+
 
 =end text
 
@@ -19476,7 +20855,7 @@ a string
 
 
 
-=head2 PhenotypeSimulation
+=head2 ETCNodes
 
 =over 4
 
@@ -19484,12 +20863,9 @@ a string
 
 =item Description
 
-Data structures for a phenotype simulation
-
-Phenotype phenotypeData - actual phenotype data simulated
-float simulatedGrowth - actual simulated growth rate
-float simulatedGrowthFraction - fraction of wildtype simulated growth rate
-string phenoclass - class of the phenotype simulation (i.e. 'CP' - correct positive, 'CN' - correct negative, 'FP' - false positive, 'FN' - false negative)
+********************************************************************************
+    ETC object type definitions
+   	********************************************************************************
 
 
 =item Definition
@@ -19497,11 +20873,14 @@ string phenoclass - class of the phenotype simulation (i.e. 'CP' - correct posit
 =begin html
 
 <pre>
-a reference to a list containing 4 items:
-0: (phenotypeData) a Phenotype
-1: (simulatedGrowth) a float
-2: (simulatedGrowthFraction) a float
-3: (phenoclass) a string
+a reference to a hash where the following keys are defined:
+resp has a value which is a string
+y has a value which is an int
+x has a value which is an int
+width has a value which is an int
+height has a value which is an int
+shape has a value which is a string
+label has a value which is a string
 
 </pre>
 
@@ -19509,11 +20888,14 @@ a reference to a list containing 4 items:
 
 =begin text
 
-a reference to a list containing 4 items:
-0: (phenotypeData) a Phenotype
-1: (simulatedGrowth) a float
-2: (simulatedGrowthFraction) a float
-3: (phenoclass) a string
+a reference to a hash where the following keys are defined:
+resp has a value which is a string
+y has a value which is an int
+x has a value which is an int
+width has a value which is an int
+height has a value which is an int
+shape has a value which is a string
+label has a value which is a string
 
 
 =end text
@@ -19522,34 +20904,22 @@ a reference to a list containing 4 items:
 
 
 
-=head2 PhenotypeSimulationSet
+=head2 ETCDiagramSpecs
 
 =over 4
 
 
 
-=item Description
-
-Data structures for phenotype simulations of a set of phenotype data
-
-phenotypeSimulationSet_id id - ID for the phenotype simulation set object
-fbamodel_id model - ID of the model used to simulate all phenotypes
-workspace_id model_workspace - workspace containing the model used for the simulation
-phenotype_set_id phenotypeSet - set of observed phenotypes that were simulated
-list<PhenotypeSimulation> phenotypeSimulations - list of simulated phenotypes
-
-
 =item Definition
 
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a phenotypeSimulationSet_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-phenotypeSet has a value which is a phenotype_set_id
-phenotypeSimulations has a value which is a reference to a list where each element is a PhenotypeSimulation
+a reference to a hash where the following keys are defined:
+nodes has a value which is a reference to a list where each element is an ETCNodes
+media has a value which is a string
+growth has a value which is a string
+organism has a value which is a string
 
 </pre>
 
@@ -19558,11 +20928,10 @@ phenotypeSimulations has a value which is a reference to a list where each eleme
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a phenotypeSimulationSet_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-phenotypeSet has a value which is a phenotype_set_id
-phenotypeSimulations has a value which is a reference to a list where each element is a PhenotypeSimulation
+nodes has a value which is a reference to a list where each element is an ETCNodes
+media has a value which is a string
+growth has a value which is a string
+organism has a value which is a string
 
 
 =end text
@@ -19571,7 +20940,7 @@ phenotypeSimulations has a value which is a reference to a list where each eleme
 
 
 
-=head2 reactionSpecification
+=head2 TemplateReactions
 
 =over 4
 
@@ -19579,10 +20948,9 @@ phenotypeSimulations has a value which is a reference to a list where each eleme
 
 =item Description
 
-Data structure for holding gapfill or gapgen solution reaction information
-
-string direction - direction of gapfilled or gapgen reaction
-string reactionID - ID of gapfilled or gapgen reaction
+********************************************************************************
+	  AutoRecon type definitions
+   	********************************************************************************
 
 
 =item Definition
@@ -19590,9 +20958,11 @@ string reactionID - ID of gapfilled or gapgen reaction
 =begin html
 
 <pre>
-a reference to a list containing 2 items:
-0: (direction) a string
-1: (reactionID) a string
+a reference to a hash where the following keys are defined:
+reaction has a value which is a reaction_id
+direction has a value which is a string
+equation has a value which is a string
+compartment has a value which is a compartment_id
 
 </pre>
 
@@ -19600,9 +20970,11 @@ a reference to a list containing 2 items:
 
 =begin text
 
-a reference to a list containing 2 items:
-0: (direction) a string
-1: (reactionID) a string
+a reference to a hash where the following keys are defined:
+reaction has a value which is a reaction_id
+direction has a value which is a string
+equation has a value which is a string
+compartment has a value which is a compartment_id
 
 
 =end text
@@ -19611,7 +20983,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 PhenotypeSensitivityAnalysis
+=head2 ComplexReactions
 
 =over 4
 
@@ -19619,7 +20991,10 @@ a reference to a list containing 2 items:
 
 =item Description
 
-list<string id, string solutionIndex, list<reactionSpecification> reactionList, list<string> biomassEdits,list<tuple<float simulatedGrowth,float simulatedGrowthFraction,string phenoclass>> PhenotypeSimulations> reconciliationSolutionSimulations;
+Information on complexes in a template model
+
+        complex_id complex - ID of the associated complex
+        list<TemplateReactions> reactions - List of template models associated with complex
 
 
 =item Definition
@@ -19628,16 +21003,9 @@ list<string id, string solutionIndex, list<reactionSpecification> reactionList,
 
 <pre>
 a reference to a hash where the following keys are defined:
-phenotypeSet has a value which is a phenotype_set_id
-phenotypeSet_workspace has a value which is a workspace_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-phenotypes has a value which is a reference to a list where each element is a Phenotype
-wildtypePhenotypeSimulations has a value which is a reference to a list where each element is a reference to a list containing 3 items:
-0: (simulatedGrowth) a float
-1: (simulatedGrowthFraction) a float
-2: (phenoclass) a string
-
+complex has a value which is a complex_id
+name has a value which is a string
+reactions has a value which is a reference to a list where each element is a TemplateReactions
 
 </pre>
 
@@ -19646,16 +21014,9 @@ wildtypePhenotypeSimulations has a value which is a reference to a list where ea
 =begin text
 
 a reference to a hash where the following keys are defined:
-phenotypeSet has a value which is a phenotype_set_id
-phenotypeSet_workspace has a value which is a workspace_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-phenotypes has a value which is a reference to a list where each element is a Phenotype
-wildtypePhenotypeSimulations has a value which is a reference to a list where each element is a reference to a list containing 3 items:
-0: (simulatedGrowth) a float
-1: (simulatedGrowthFraction) a float
-2: (phenoclass) a string
-
+complex has a value which is a complex_id
+name has a value which is a string
+reactions has a value which is a reference to a list where each element is a TemplateReactions
 
 
 =end text
@@ -19664,7 +21025,7 @@ wildtypePhenotypeSimulations has a value which is a reference to a list where ea
 
 
 
-=head2 job_id
+=head2 RoleComplexReactions
 
 =over 4
 
@@ -19672,9 +21033,10 @@ wildtypePhenotypeSimulations has a value which is a reference to a list where ea
 
 =item Description
 
-********************************************************************************
-    Job object type definitions
-   	********************************************************************************
+Information on complexes in a template model
+
+        complex_id complex - ID of the associated complex
+        list<TemplateReactions> reactions - List of template models associated with complex
 
 
 =item Definition
@@ -19682,14 +21044,22 @@ wildtypePhenotypeSimulations has a value which is a reference to a list where ea
 =begin html
 
 <pre>
-a string
+a reference to a hash where the following keys are defined:
+role has a value which is a role_id
+name has a value which is a string
+complexes has a value which is a reference to a list where each element is a ComplexReactions
+
 </pre>
 
 =end html
 
 =begin text
 
-a string
+a reference to a hash where the following keys are defined:
+role has a value which is a role_id
+name has a value which is a string
+complexes has a value which is a reference to a list where each element is a ComplexReactions
+
 
 =end text
 
@@ -19697,7 +21067,7 @@ a string
 
 
 
-=head2 CommandArguments
+=head2 ReactionDefinition
 
 =over 4
 
@@ -19705,7 +21075,11 @@ a string
 
 =item Description
 
-Object to hold the arguments to be submitted to the post process command
+Reaction definition
+
+        reaction_id id - ID of reaction
+        string name - name of reaction
+        string definition - stoichiometric equation of reaction in terms of compound names
 
 
 =item Definition
@@ -19714,7 +21088,9 @@ Object to hold the arguments to be submitted to the post process command
 
 <pre>
 a reference to a hash where the following keys are defined:
-auth has a value which is a string
+id has a value which is a reaction_id
+name has a value which is a string
+definition has a value which is a string
 
 </pre>
 
@@ -19723,7 +21099,9 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-auth has a value which is a string
+id has a value which is a reaction_id
+name has a value which is a string
+definition has a value which is a string
 
 
 =end text
@@ -19732,7 +21110,7 @@ auth has a value which is a string
 
 
 
-=head2 clusterjob
+=head2 ReactionSynonyms
 
 =over 4
 
@@ -19740,7 +21118,10 @@ auth has a value which is a string
 
 =item Description
 
-Object to hold data required to run cluster job
+Reaction synonyms
+
+        reaction_id primary - ID of primary reaction
+        list<ReactionDefinition> synonyms - list of synonym reactions to the primary reaction (including itself)
 
 
 =item Definition
@@ -19749,7 +21130,8 @@ Object to hold data required to run cluster job
 
 <pre>
 a reference to a hash where the following keys are defined:
-auth has a value which is a string
+primary has a value which is a reaction_id
+synonyms has a value which is a reference to a list where each element is a ReactionDefinition
 
 </pre>
 
@@ -19758,7 +21140,8 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-auth has a value which is a string
+primary has a value which is a reaction_id
+synonyms has a value which is a reference to a list where each element is a ReactionDefinition
 
 
 =end text
@@ -19767,7 +21150,7 @@ auth has a value which is a string
 
 
 
-=head2 JobObject
+=head2 ReactionSynonymsObject
 
 =over 4
 
@@ -19775,18 +21158,13 @@ auth has a value which is a string
 
 =item Description
 
-Data structures for a job object
+Reaction synonyms object
 
-job_id id - ID of the job object
-string type - type of the job
-string auth - authentication token of job owner
-string status - current status of job
-mapping<string,string> jobdata;
-string queuetime - time when job was queued
-string starttime - time when job started running
-string completetime - time when the job was completed
-string owner - owner of the job
-string queuecommand - command used to queue job
+        int version - version number of object
+        biochemistry_id biochemistry - ID of associated biochemistry database
+        workspace_id biochemistry_workspace - workspace with associated biochemistry database
+        list<ReactionSynonyms> synonym_list - list of all reaction synonyms from a biochemistry database
+        list<ReactionDefinition> excluded_list - list of reactions excluded because all compounds are cofactors
 
 
 =item Definition
@@ -19795,16 +21173,11 @@ string queuecommand - command used to queue job
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a job_id
-type has a value which is a string
-auth has a value which is a string
-status has a value which is a string
-jobdata has a value which is a reference to a hash where the key is a string and the value is a string
-queuetime has a value which is a string
-starttime has a value which is a string
-completetime has a value which is a string
-owner has a value which is a string
-queuecommand has a value which is a string
+version has a value which is an int
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
+synonyms_list has a value which is a reference to a list where each element is a ReactionSynonyms
+excluded_list has a value which is a reference to a list where each element is a ReactionDefinition
 
 </pre>
 
@@ -19813,16 +21186,11 @@ queuecommand has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a job_id
-type has a value which is a string
-auth has a value which is a string
-status has a value which is a string
-jobdata has a value which is a reference to a hash where the key is a string and the value is a string
-queuetime has a value which is a string
-starttime has a value which is a string
-completetime has a value which is a string
-owner has a value which is a string
-queuecommand has a value which is a string
+version has a value which is an int
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
+synonyms_list has a value which is a reference to a list where each element is a ReactionSynonyms
+excluded_list has a value which is a reference to a list where each element is a ReactionDefinition
 
 
 =end text
@@ -19831,7 +21199,7 @@ queuecommand has a value which is a string
 
 
 
-=head2 ETCNodes
+=head2 get_models_params
 
 =over 4
 
@@ -19840,7 +21208,7 @@ queuecommand has a value which is a string
 =item Description
 
 ********************************************************************************
-    ETC object type definitions
+    Function definitions relating to data retrieval for Model Objects
    	********************************************************************************
 
 
@@ -19850,13 +21218,10 @@ queuecommand has a value which is a string
 
 <pre>
 a reference to a hash where the following keys are defined:
-resp has a value which is a string
-y has a value which is an int
-x has a value which is an int
-width has a value which is an int
-height has a value which is an int
-shape has a value which is a string
-label has a value which is a string
+models has a value which is a reference to a list where each element is a fbamodel_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -19865,13 +21230,10 @@ label has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-resp has a value which is a string
-y has a value which is an int
-x has a value which is an int
-width has a value which is an int
-height has a value which is an int
-shape has a value which is a string
-label has a value which is a string
+models has a value which is a reference to a list where each element is a fbamodel_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -19880,22 +21242,32 @@ label has a value which is a string
 
 
 
-=head2 ETCDiagramSpecs
+=head2 get_fbas_params
 
 =over 4
 
 
 
+=item Description
+
+Input parameters for the "get_fbas" function.
+
+        list<fba_id> fbas - a list of the FBA study IDs for the FBA studies to be returned (a required argument)
+        list<workspace_id> workspaces - a list of the workspaces contianing the FBA studies to be returned (a required argument)
+string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-nodes has a value which is a reference to a list where each element is an ETCNodes
-media has a value which is a string
-growth has a value which is a string
-organism has a value which is a string
+fbas has a value which is a reference to a list where each element is a fba_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -19904,10 +21276,10 @@ organism has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-nodes has a value which is a reference to a list where each element is an ETCNodes
-media has a value which is a string
-growth has a value which is a string
-organism has a value which is a string
+fbas has a value which is a reference to a list where each element is a fba_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -19916,7 +21288,7 @@ organism has a value which is a string
 
 
 
-=head2 TemplateReactions
+=head2 get_gapfills_params
 
 =over 4
 
@@ -19924,9 +21296,12 @@ organism has a value which is a string
 
 =item Description
 
-********************************************************************************
-	  AutoRecon type definitions
-   	********************************************************************************
+Input parameters for the "get_gapfills" function.
+
+        list<gapfill_id> gapfills - a list of the gapfill study IDs for the gapfill studies to be returned (a required argument)
+        list<workspace_id> workspaces - a list of the workspaces contianing the gapfill studies to be returned (a required argument)
+string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -19935,10 +21310,10 @@ organism has a value which is a string
 
 <pre>
 a reference to a hash where the following keys are defined:
-reaction has a value which is a reaction_id
-direction has a value which is a string
-equation has a value which is a string
-compartment has a value which is a compartment_id
+gapfills has a value which is a reference to a list where each element is a gapfill_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -19947,10 +21322,10 @@ compartment has a value which is a compartment_id
 =begin text
 
 a reference to a hash where the following keys are defined:
-reaction has a value which is a reaction_id
-direction has a value which is a string
-equation has a value which is a string
-compartment has a value which is a compartment_id
+gapfills has a value which is a reference to a list where each element is a gapfill_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -19959,7 +21334,7 @@ compartment has a value which is a compartment_id
 
 
 
-=head2 ComplexReactions
+=head2 get_gapgens_params
 
 =over 4
 
@@ -19967,10 +21342,12 @@ compartment has a value which is a compartment_id
 
 =item Description
 
-Information on complexes in a template model
+Input parameters for the "get_gapgens" function.
 
-        complex_id complex - ID of the associated complex
-        list<TemplateReactions> reactions - List of template models associated with complex
+        list<gapgen_id> gapgens - a list of the gapgen study IDs for the gapgen studies to be returned (a required argument)
+        list<workspace_id> workspaces - a list of the workspaces contianing the gapgen studies to be returned (a required argument)
+string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -19979,9 +21356,10 @@ Information on complexes in a template model
 
 <pre>
 a reference to a hash where the following keys are defined:
-complex has a value which is a complex_id
-name has a value which is a string
-reactions has a value which is a reference to a list where each element is a TemplateReactions
+gapgens has a value which is a reference to a list where each element is a gapgen_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -19990,9 +21368,10 @@ reactions has a value which is a reference to a list where each element is a Tem
 =begin text
 
 a reference to a hash where the following keys are defined:
-complex has a value which is a complex_id
-name has a value which is a string
-reactions has a value which is a reference to a list where each element is a TemplateReactions
+gapgens has a value which is a reference to a list where each element is a gapgen_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -20001,7 +21380,7 @@ reactions has a value which is a reference to a list where each element is a Tem
 
 
 
-=head2 RoleComplexReactions
+=head2 get_reactions_params
 
 =over 4
 
@@ -20009,10 +21388,11 @@ reactions has a value which is a reference to a list where each element is a Tem
 
 =item Description
 
-Information on complexes in a template model
+Input parameters for the "get_reactions" function.
 
-        complex_id complex - ID of the associated complex
-        list<TemplateReactions> reactions - List of template models associated with complex
+        list<reaction_id> reactions - a list of the reaction IDs for the reactions to be returned (a required argument)
+        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -20021,9 +21401,9 @@ Information on complexes in a template model
 
 <pre>
 a reference to a hash where the following keys are defined:
-role has a value which is a role_id
-name has a value which is a string
-complexes has a value which is a reference to a list where each element is a ComplexReactions
+reactions has a value which is a reference to a list where each element is a reaction_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -20032,9 +21412,9 @@ complexes has a value which is a reference to a list where each element is a Com
 =begin text
 
 a reference to a hash where the following keys are defined:
-role has a value which is a role_id
-name has a value which is a string
-complexes has a value which is a reference to a list where each element is a ComplexReactions
+reactions has a value which is a reference to a list where each element is a reaction_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -20043,7 +21423,7 @@ complexes has a value which is a reference to a list where each element is a Com
 
 
 
-=head2 ReactionDefinition
+=head2 get_compounds_params
 
 =over 4
 
@@ -20051,11 +21431,10 @@ complexes has a value which is a reference to a list where each element is a Com
 
 =item Description
 
-Reaction definition
-
-        reaction_id id - ID of reaction
-        string name - name of reaction
-        string definition - stoichiometric equation of reaction in terms of compound names
+Input parameters for the "get_compounds" function.        
+list<compound_id> compounds - a list of the compound IDs for the compounds to be returned (a required argument)
+string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -20064,9 +21443,9 @@ Reaction definition
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a reaction_id
-name has a value which is a string
-definition has a value which is a string
+compounds has a value which is a reference to a list where each element is a compound_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -20075,9 +21454,9 @@ definition has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a reaction_id
-name has a value which is a string
-definition has a value which is a string
+compounds has a value which is a reference to a list where each element is a compound_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -20086,7 +21465,7 @@ definition has a value which is a string
 
 
 
-=head2 ReactionSynonyms
+=head2 get_alias_params
 
 =over 4
 
@@ -20094,10 +21473,13 @@ definition has a value which is a string
 
 =item Description
 
-Reaction synonyms
+Input parameters for the get_alias function
 
-        reaction_id primary - ID of primary reaction
-        list<ReactionDefinition> synonyms - list of synonym reactions to the primary reaction (including itself)
+                string object_type    - The type of object (e.g. Compound or Reaction)
+                string input_id_type - The type (e.g. ModelSEED) of alias to be inputted
+                string output_id_type - The type (e.g. KEGG) of alias to be outputted
+                list<string> input_ids - A list of input IDs
+                string auth; - The authentication token of the KBase account (optional)
 
 
 =item Definition
@@ -20106,8 +21488,11 @@ Reaction synonyms
 
 <pre>
 a reference to a hash where the following keys are defined:
-primary has a value which is a reaction_id
-synonyms has a value which is a reference to a list where each element is a ReactionDefinition
+object_type has a value which is a string
+input_id_type has a value which is a string
+output_id_type has a value which is a string
+input_ids has a value which is a reference to a list where each element is a string
+auth has a value which is a string
 
 </pre>
 
@@ -20116,8 +21501,11 @@ synonyms has a value which is a reference to a list where each element is a Reac
 =begin text
 
 a reference to a hash where the following keys are defined:
-primary has a value which is a reaction_id
-synonyms has a value which is a reference to a list where each element is a ReactionDefinition
+object_type has a value which is a string
+input_id_type has a value which is a string
+output_id_type has a value which is a string
+input_ids has a value which is a reference to a list where each element is a string
+auth has a value which is a string
 
 
 =end text
@@ -20126,7 +21514,7 @@ synonyms has a value which is a reference to a list where each element is a Reac
 
 
 
-=head2 ReactionSynonymsObject
+=head2 get_alias_outputs
 
 =over 4
 
@@ -20134,13 +21522,10 @@ synonyms has a value which is a reference to a list where each element is a Reac
 
 =item Description
 
-Reaction synonyms object
+Output for get_alias function
 
-        int version - version number of object
-        biochemistry_id biochemistry - ID of associated biochemistry database
-        workspace_id biochemistry_workspace - workspace with associated biochemistry database
-        list<ReactionSynonyms> synonym_list - list of all reaction synonyms from a biochemistry database
-        list<ReactionDefinition> excluded_list - list of reactions excluded because all compounds are cofactors
+              string original_id - The original ID
+              list<string> aliases - Aliases for the original ID in the new format
 
 
 =item Definition
@@ -20149,11 +21534,8 @@ Reaction synonyms object
 
 <pre>
 a reference to a hash where the following keys are defined:
-version has a value which is an int
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
-synonyms_list has a value which is a reference to a list where each element is a ReactionSynonyms
-excluded_list has a value which is a reference to a list where each element is a ReactionDefinition
+original_id has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
 
 </pre>
 
@@ -20162,11 +21544,8 @@ excluded_list has a value which is a reference to a list where each element is a
 =begin text
 
 a reference to a hash where the following keys are defined:
-version has a value which is an int
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
-synonyms_list has a value which is a reference to a list where each element is a ReactionSynonyms
-excluded_list has a value which is a reference to a list where each element is a ReactionDefinition
+original_id has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
 
 
 =end text
@@ -20175,7 +21554,7 @@ excluded_list has a value which is a reference to a list where each element is a
 
 
 
-=head2 get_models_params
+=head2 get_aliassets_params
 
 =over 4
 
@@ -20183,9 +21562,10 @@ excluded_list has a value which is a reference to a list where each element is a
 
 =item Description
 
-********************************************************************************
-    Function definitions relating to data retrieval for Model Objects
-   	********************************************************************************
+Input parameters for the get_aliassets function
+
+              string auth; - The authentication token of the KBase account (optional)
+              string object_type; - The type of object (e.g. Compound or Reaction)
 
 
 =item Definition
@@ -20194,10 +21574,8 @@ excluded_list has a value which is a reference to a list where each element is a
 
 <pre>
 a reference to a hash where the following keys are defined:
-models has a value which is a reference to a list where each element is a fbamodel_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
+object_type has a value which is a string
 auth has a value which is a string
-id_type has a value which is a string
 
 </pre>
 
@@ -20206,10 +21584,8 @@ id_type has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-models has a value which is a reference to a list where each element is a fbamodel_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
+object_type has a value which is a string
 auth has a value which is a string
-id_type has a value which is a string
 
 
 =end text
@@ -20218,7 +21594,7 @@ id_type has a value which is a string
 
 
 
-=head2 get_fbas_params
+=head2 get_media_params
 
 =over 4
 
@@ -20226,11 +21602,10 @@ id_type has a value which is a string
 
 =item Description
 
-Input parameters for the "get_fbas" function.
+Input parameters for the "get_media" function.
 
-        list<fba_id> fbas - a list of the FBA study IDs for the FBA studies to be returned (a required argument)
-        list<workspace_id> workspaces - a list of the workspaces contianing the FBA studies to be returned (a required argument)
-string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        list<media_id> medias - a list of the media IDs for the media to be returned (a required argument)
+        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -20240,10 +21615,9 @@ string id_type - the type of ID that should be used in the output data (a option
 
 <pre>
 a reference to a hash where the following keys are defined:
-fbas has a value which is a reference to a list where each element is a fba_id
+medias has a value which is a reference to a list where each element is a media_id
 workspaces has a value which is a reference to a list where each element is a workspace_id
 auth has a value which is a string
-id_type has a value which is a string
 
 </pre>
 
@@ -20252,10 +21626,9 @@ id_type has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-fbas has a value which is a reference to a list where each element is a fba_id
+medias has a value which is a reference to a list where each element is a media_id
 workspaces has a value which is a reference to a list where each element is a workspace_id
 auth has a value which is a string
-id_type has a value which is a string
 
 
 =end text
@@ -20264,7 +21637,7 @@ id_type has a value which is a string
 
 
 
-=head2 get_gapfills_params
+=head2 get_biochemistry_params
 
 =over 4
 
@@ -20272,11 +21645,11 @@ id_type has a value which is a string
 
 =item Description
 
-Input parameters for the "get_gapfills" function.
+Input parameters for the "get_biochemistry" function.
 
-        list<gapfill_id> gapfills - a list of the gapfill study IDs for the gapfill studies to be returned (a required argument)
-        list<workspace_id> workspaces - a list of the workspaces contianing the gapfill studies to be returned (a required argument)
-string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        biochemistry_id biochemistry - ID of the biochemistry database to be returned (a required argument)
+        workspace_id biochemistry_workspace - workspace containing the biochemistry database to be returned (a required argument)
+        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -20286,10 +21659,10 @@ string id_type - the type of ID that should be used in the output data (a option
 
 <pre>
 a reference to a hash where the following keys are defined:
-gapfills has a value which is a reference to a list where each element is a gapfill_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
-auth has a value which is a string
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
 id_type has a value which is a string
+auth has a value which is a string
 
 </pre>
 
@@ -20298,10 +21671,10 @@ id_type has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-gapfills has a value which is a reference to a list where each element is a gapfill_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
-auth has a value which is a string
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
 id_type has a value which is a string
+auth has a value which is a string
 
 
 =end text
@@ -20310,7 +21683,7 @@ id_type has a value which is a string
 
 
 
-=head2 get_gapgens_params
+=head2 import_probanno_params
 
 =over 4
 
@@ -20318,12 +21691,9 @@ id_type has a value which is a string
 
 =item Description
 
-Input parameters for the "get_gapgens" function.
-
-        list<gapgen_id> gapgens - a list of the gapgen study IDs for the gapgen studies to be returned (a required argument)
-        list<workspace_id> workspaces - a list of the workspaces contianing the gapgen studies to be returned (a required argument)
-string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+********************************************************************************
+    Code relating to reconstruction of metabolic models
+   	********************************************************************************
 
 
 =item Definition
@@ -20332,10 +21702,14 @@ string id_type - the type of ID that should be used in the output data (a option
 
 <pre>
 a reference to a hash where the following keys are defined:
-gapgens has a value which is a reference to a list where each element is a gapgen_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
+probanno has a value which is a probanno_id
+workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+annotationProbabilities has a value which is a reference to a list where each element is an annotationProbability
+ignore_errors has a value which is a bool
 auth has a value which is a string
-id_type has a value which is a string
+overwrite has a value which is a bool
 
 </pre>
 
@@ -20344,10 +21718,14 @@ id_type has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-gapgens has a value which is a reference to a list where each element is a gapgen_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
+probanno has a value which is a probanno_id
+workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+annotationProbabilities has a value which is a reference to a list where each element is an annotationProbability
+ignore_errors has a value which is a bool
 auth has a value which is a string
-id_type has a value which is a string
+overwrite has a value which is a bool
 
 
 =end text
@@ -20356,7 +21734,7 @@ id_type has a value which is a string
 
 
 
-=head2 get_reactions_params
+=head2 Genome_uid
 
 =over 4
 
@@ -20364,10 +21742,11 @@ id_type has a value which is a string
 
 =item Description
 
-Input parameters for the "get_reactions" function.
+Input parameters for the "genome_object_to_workspace" function.
 
-        list<reaction_id> reactions - a list of the reaction IDs for the reactions to be returned (a required argument)
-        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        Genome_uid uid - ID to use when saving genome to workspace
+        GenomeObject genomeobj - full genome typed object to be loaded into the workspace (a required argument)
+        workspace_id workspace - ID of the workspace into which the genome typed object is to be loaded (a required argument)
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -20376,22 +21755,14 @@ Input parameters for the "get_reactions" function.
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-reactions has a value which is a reference to a list where each element is a reaction_id
-auth has a value which is a string
-id_type has a value which is a string
-
+a string
 </pre>
 
 =end html
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-reactions has a value which is a reference to a list where each element is a reaction_id
-auth has a value which is a string
-id_type has a value which is a string
-
+a string
 
 =end text
 
@@ -20399,29 +21770,23 @@ id_type has a value which is a string
 
 
 
-=head2 get_compounds_params
+=head2 genome_object_to_workspace_params
 
 =over 4
 
 
 
-=item Description
-
-Input parameters for the "get_compounds" function.        
-list<compound_id> compounds - a list of the compound IDs for the compounds to be returned (a required argument)
-string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
-string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
-
-
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-compounds has a value which is a reference to a list where each element is a compound_id
+uid has a value which is a Genome_uid
+genomeobj has a value which is a GenomeObject
+workspace has a value which is a workspace_id
 auth has a value which is a string
-id_type has a value which is a string
+overwrite has a value which is a bool
 
 </pre>
 
@@ -20430,9 +21795,11 @@ id_type has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-compounds has a value which is a reference to a list where each element is a compound_id
+uid has a value which is a Genome_uid
+genomeobj has a value which is a GenomeObject
+workspace has a value which is a workspace_id
 auth has a value which is a string
-id_type has a value which is a string
+overwrite has a value which is a bool
 
 
 =end text
@@ -20441,7 +21808,7 @@ id_type has a value which is a string
 
 
 
-=head2 get_alias_params
+=head2 genome_to_workspace_params
 
 =over 4
 
@@ -20449,13 +21816,15 @@ id_type has a value which is a string
 
 =item Description
 
-Input parameters for the get_alias function
+Input parameters for the "genome_to_workspace" function.
 
-                string object_type    - The type of object (e.g. Compound or Reaction)
-                string input_id_type - The type (e.g. ModelSEED) of alias to be inputted
-                string output_id_type - The type (e.g. KEGG) of alias to be outputted
-                list<string> input_ids - A list of input IDs
-                string auth; - The authentication token of the KBase account (optional)
+        genome_id genome - ID of the CDM genome that is to be loaded into the workspace (a required argument)
+        string sourceLogin - login to pull private genome from source database
+        string sourcePassword - password to pull private genome from source database
+        string source - Source database for genome (i.e. seed, rast, kbase)
+        workspace_id workspace - ID of the workspace into which the genome typed object is to be loaded (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        Genome_uid uid - ID to use when saving genome to workspace
 
 
 =item Definition
@@ -20464,11 +21833,14 @@ Input parameters for the get_alias function
 
 <pre>
 a reference to a hash where the following keys are defined:
-object_type has a value which is a string
-input_id_type has a value which is a string
-output_id_type has a value which is a string
-input_ids has a value which is a reference to a list where each element is a string
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+sourceLogin has a value which is a string
+sourcePassword has a value which is a string
+source has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
+uid has a value which is a Genome_uid
 
 </pre>
 
@@ -20477,11 +21849,14 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-object_type has a value which is a string
-input_id_type has a value which is a string
-output_id_type has a value which is a string
-input_ids has a value which is a reference to a list where each element is a string
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+sourceLogin has a value which is a string
+sourcePassword has a value which is a string
+source has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
+uid has a value which is a Genome_uid
 
 
 =end text
@@ -20490,7 +21865,7 @@ auth has a value which is a string
 
 
 
-=head2 get_alias_outputs
+=head2 domains_to_workspace_params
 
 =over 4
 
@@ -20498,10 +21873,12 @@ auth has a value which is a string
 
 =item Description
 
-Output for get_alias function
+Input parameters for the "domains_to_workspace" function.
 
-              string original_id - The original ID
-              list<string> aliases - Aliases for the original ID in the new format
+        genome_id genome - ID of the workspace genome to fetch domains for (a required argument)
+        string output_id - ID in which the domains are to be saved (default is genome ID plus ".dom.0")
+        workspace_id workspace - ID of the workspace into which the domains are to be loaded (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -20510,8 +21887,10 @@ Output for get_alias function
 
 <pre>
 a reference to a hash where the following keys are defined:
-original_id has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
+genome has a value which is a genome_id
+output_id has a value which is a string
+workspace has a value which is a workspace_id
+auth has a value which is a string
 
 </pre>
 
@@ -20520,8 +21899,10 @@ aliases has a value which is a reference to a list where each element is a strin
 =begin text
 
 a reference to a hash where the following keys are defined:
-original_id has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
+genome has a value which is a genome_id
+output_id has a value which is a string
+workspace has a value which is a workspace_id
+auth has a value which is a string
 
 
 =end text
@@ -20530,7 +21911,7 @@ aliases has a value which is a reference to a list where each element is a strin
 
 
 
-=head2 get_aliassets_params
+=head2 compute_domains_params
 
 =over 4
 
@@ -20538,10 +21919,11 @@ aliases has a value which is a reference to a list where each element is a strin
 
 =item Description
 
-Input parameters for the get_aliassets function
-
-              string auth; - The authentication token of the KBase account (optional)
-              string object_type; - The type of object (e.g. Compound or Reaction)
+Input parameters for the "compute_domains_params" function.
+string genome;
+string genome_workspace;
+list<tuple<string,string>> proteins;
+workspace_id workspace;
 
 
 =item Definition
@@ -20550,8 +21932,13 @@ Input parameters for the get_aliassets function
 
 <pre>
 a reference to a hash where the following keys are defined:
-object_type has a value which is a string
-auth has a value which is a string
+genome has a value which is a string
+genome_workspace has a value which is a string
+proteins has a value which is a reference to a list where each element is a reference to a list containing 2 items:
+0: a string
+1: a string
+
+workspace has a value which is a workspace_id
 
 </pre>
 
@@ -20560,8 +21947,13 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-object_type has a value which is a string
-auth has a value which is a string
+genome has a value which is a string
+genome_workspace has a value which is a string
+proteins has a value which is a reference to a list where each element is a reference to a list containing 2 items:
+0: a string
+1: a string
+
+workspace has a value which is a workspace_id
 
 
 =end text
@@ -20570,7 +21962,7 @@ auth has a value which is a string
 
 
 
-=head2 get_media_params
+=head2 translation
 
 =over 4
 
@@ -20578,11 +21970,10 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "get_media" function.
+A link between a KBase gene ID and the ID for the same gene in another database
 
-        list<media_id> medias - a list of the media IDs for the media to be returned (a required argument)
-        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        string foreign_id - ID of the gene in another database
+        feature_id feature - ID of the gene in KBase
 
 
 =item Definition
@@ -20590,10 +21981,9 @@ Input parameters for the "get_media" function.
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-medias has a value which is a reference to a list where each element is a media_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
-auth has a value which is a string
+a reference to a list containing 2 items:
+0: (foreign_id) a string
+1: (feature) a feature_id
 
 </pre>
 
@@ -20601,10 +21991,9 @@ auth has a value which is a string
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-medias has a value which is a reference to a list where each element is a media_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
-auth has a value which is a string
+a reference to a list containing 2 items:
+0: (foreign_id) a string
+1: (feature) a feature_id
 
 
 =end text
@@ -20613,7 +22002,7 @@ auth has a value which is a string
 
 
 
-=head2 get_biochemistry_params
+=head2 add_feature_translation_params
 
 =over 4
 
@@ -20621,11 +22010,12 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "get_biochemistry" function.
+Input parameters for the "add_feature_translation" function.
 
-        biochemistry_id biochemistry - ID of the biochemistry database to be returned (a required argument)
-        workspace_id biochemistry_workspace - workspace containing the biochemistry database to be returned (a required argument)
-        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        genome_id genome - ID of the genome into which the new aliases are to be loaded (a required argument)
+        workspace_id workspace - ID of the workspace containing the target genome (a required argument)
+        list<translation> translations - list of translations between KBase gene IDs and gene IDs in another database (a required argument)
+        string id_type - type of the IDs being loaded (e.g. KEGG, NCBI) (a required argument)
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -20635,10 +22025,12 @@ Input parameters for the "get_biochemistry" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+translations has a value which is a reference to a list where each element is a translation
 id_type has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
 
 </pre>
 
@@ -20647,10 +22039,12 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+translations has a value which is a reference to a list where each element is a translation
 id_type has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
 
 
 =end text
@@ -20659,7 +22053,7 @@ auth has a value which is a string
 
 
 
-=head2 import_probanno_params
+=head2 genome_to_fbamodel_params
 
 =over 4
 
@@ -20667,9 +22061,17 @@ auth has a value which is a string
 
 =item Description
 
-********************************************************************************
-    Code relating to reconstruction of metabolic models
-   	********************************************************************************
+Input parameters for the "genome_to_fbamodel" function.
+
+        genome_id genome - ID of the genome for which a model is to be built (a required argument)
+        workspace_id genome_workspace - ID of the workspace containing the target genome (an optional argument; default is the workspace argument)
+        template_id templatemodel - 
+        workspace_id templatemodel_workspace - 
+        bool probannoOnly - a boolean indicating if only the probabilistic annotation should be used in building the model (an optional argument; default is '0')
+        fbamodel_id model - ID that should be used for the newly constructed model (an optional argument; default is 'undef')
+        bool coremodel - indicates that a core model should be constructed instead of a genome scale model (an optional argument; default is '0')
+        workspace_id workspace - ID of the workspace where the newly developed model will be stored; also the default assumed workspace for input objects (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -20678,14 +22080,15 @@ auth has a value which is a string
 
 <pre>
 a reference to a hash where the following keys are defined:
-probanno has a value which is a probanno_id
-workspace has a value which is a workspace_id
 genome has a value which is a genome_id
 genome_workspace has a value which is a workspace_id
-annotationProbabilities has a value which is a reference to a list where each element is an annotationProbability
-ignore_errors has a value which is a bool
+templatemodel has a value which is a template_id
+templatemodel_workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+coremodel has a value which is a bool
+workspace has a value which is a workspace_id
 auth has a value which is a string
-overwrite has a value which is a bool
+fulldb has a value which is a bool
 
 </pre>
 
@@ -20694,14 +22097,15 @@ overwrite has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-probanno has a value which is a probanno_id
-workspace has a value which is a workspace_id
 genome has a value which is a genome_id
 genome_workspace has a value which is a workspace_id
-annotationProbabilities has a value which is a reference to a list where each element is an annotationProbability
-ignore_errors has a value which is a bool
+templatemodel has a value which is a template_id
+templatemodel_workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+coremodel has a value which is a bool
+workspace has a value which is a workspace_id
 auth has a value which is a string
-overwrite has a value which is a bool
+fulldb has a value which is a bool
 
 
 =end text
@@ -20710,7 +22114,7 @@ overwrite has a value which is a bool
 
 
 
-=head2 Genome_uid
+=head2 translate_fbamodel_params
 
 =over 4
 
@@ -20718,12 +22122,12 @@ overwrite has a value which is a bool
 
 =item Description
 
-Input parameters for the "genome_object_to_workspace" function.
+Input parameters for the "translate_fbamodel" function.
 
-        Genome_uid uid - ID to use when saving genome to workspace
-        GenomeObject genomeobj - full genome typed object to be loaded into the workspace (a required argument)
-        workspace_id workspace - ID of the workspace into which the genome typed object is to be loaded (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        gencomp
+        gencomp_workspace
+        fbamodel_id model;
+        fbamodel_id model_workspace;
 
 
 =item Definition
@@ -20731,14 +22135,26 @@ Input parameters for the "genome_object_to_workspace" function.
 =begin html
 
 <pre>
-a string
+a reference to a hash where the following keys are defined:
+protcomp has a value which is a string
+protcomp_workspace has a value which is a string
+model has a value which is a string
+model_workspace has a value which is a string
+workspace has a value which is a workspace_id
+
 </pre>
 
 =end html
 
 =begin text
 
-a string
+a reference to a hash where the following keys are defined:
+protcomp has a value which is a string
+protcomp_workspace has a value which is a string
+model has a value which is a string
+model_workspace has a value which is a string
+workspace has a value which is a workspace_id
+
 
 =end text
 
@@ -20746,23 +22162,31 @@ a string
 
 
 
-=head2 genome_object_to_workspace_params
+=head2 build_pangenome_params
 
 =over 4
 
 
 
+=item Description
+
+Input parameters for the "translate_fbamodel" function.
+
+        gencomp
+        gencomp_workspace
+        fbamodel_id model;
+        fbamodel_id model_workspace;
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-uid has a value which is a Genome_uid
-genomeobj has a value which is a GenomeObject
+genomes has a value which is a reference to a list where each element is a string
+genome_workspace has a value which is a reference to a list where each element is a string
 workspace has a value which is a workspace_id
-auth has a value which is a string
-overwrite has a value which is a bool
 
 </pre>
 
@@ -20771,11 +22195,9 @@ overwrite has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-uid has a value which is a Genome_uid
-genomeobj has a value which is a GenomeObject
+genomes has a value which is a reference to a list where each element is a string
+genome_workspace has a value which is a reference to a list where each element is a string
 workspace has a value which is a workspace_id
-auth has a value which is a string
-overwrite has a value which is a bool
 
 
 =end text
@@ -20784,39 +22206,21 @@ overwrite has a value which is a bool
 
 
 
-=head2 genome_to_workspace_params
+=head2 heat_map_matrix
 
 =over 4
 
 
 
-=item Description
-
-Input parameters for the "genome_to_workspace" function.
-
-        genome_id genome - ID of the CDM genome that is to be loaded into the workspace (a required argument)
-        string sourceLogin - login to pull private genome from source database
-        string sourcePassword - password to pull private genome from source database
-        string source - Source database for genome (i.e. seed, rast, kbase)
-        workspace_id workspace - ID of the workspace into which the genome typed object is to be loaded (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
-        Genome_uid uid - ID to use when saving genome to workspace
-
-
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-sourceLogin has a value which is a string
-sourcePassword has a value which is a string
-source has a value which is a string
-auth has a value which is a string
-overwrite has a value which is a bool
-uid has a value which is a Genome_uid
+is_refs has a value which is a bool
+labels has a value which is a reference to a list where each element is a string
+matrix has a value which is a reference to a list where each element is a reference to a list where each element is a float
 
 </pre>
 
@@ -20825,14 +22229,9 @@ uid has a value which is a Genome_uid
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-sourceLogin has a value which is a string
-sourcePassword has a value which is a string
-source has a value which is a string
-auth has a value which is a string
-overwrite has a value which is a bool
-uid has a value which is a Genome_uid
+is_refs has a value which is a bool
+labels has a value which is a reference to a list where each element is a string
+matrix has a value which is a reference to a list where each element is a reference to a list where each element is a float
 
 
 =end text
@@ -20841,20 +22240,10 @@ uid has a value which is a Genome_uid
 
 
 
-=head2 domains_to_workspace_params
-
-=over 4
-
-
-
-=item Description
+=head2 genome_heatmap_from_pangenome_params
 
-Input parameters for the "domains_to_workspace" function.
+=over 4
 
-        genome_id genome - ID of the workspace genome to fetch domains for (a required argument)
-        string output_id - ID in which the domains are to be saved (default is genome ID plus ".dom.0")
-        workspace_id workspace - ID of the workspace into which the domains are to be loaded (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -20863,10 +22252,9 @@ Input parameters for the "domains_to_workspace" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-output_id has a value which is a string
-workspace has a value which is a workspace_id
-auth has a value which is a string
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+workspace has a value which is a string
 
 </pre>
 
@@ -20875,10 +22263,9 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-output_id has a value which is a string
-workspace has a value which is a workspace_id
-auth has a value which is a string
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+workspace has a value which is a string
 
 
 =end text
@@ -20887,7 +22274,7 @@ auth has a value which is a string
 
 
 
-=head2 compute_domains_params
+=head2 ortholog_data
 
 =over 4
 
@@ -20895,11 +22282,7 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "compute_domains_params" function.
-string genome;
-string genome_workspace;
-list<tuple<string,string>> proteins;
-workspace_id workspace;
+gene ID,gene ref,protein sequence,function,score
 
 
 =item Definition
@@ -20908,13 +22291,14 @@ workspace_id workspace;
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a string
-genome_workspace has a value which is a string
-proteins has a value which is a reference to a list where each element is a reference to a list containing 2 items:
+gene_data has a value which is a reference to a list where each element is a reference to a list containing 5 items:
 0: a string
 1: a string
+2: a string
+3: a string
+4: a float
 
-workspace has a value which is a workspace_id
+protein_heatmap has a value which is a heat_map_matrix
 
 </pre>
 
@@ -20923,13 +22307,14 @@ workspace has a value which is a workspace_id
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a string
-genome_workspace has a value which is a string
-proteins has a value which is a reference to a list where each element is a reference to a list containing 2 items:
+gene_data has a value which is a reference to a list where each element is a reference to a list containing 5 items:
 0: a string
 1: a string
+2: a string
+3: a string
+4: a float
 
-workspace has a value which is a workspace_id
+protein_heatmap has a value which is a heat_map_matrix
 
 
 =end text
@@ -20938,28 +22323,22 @@ workspace has a value which is a workspace_id
 
 
 
-=head2 translation
+=head2 ortholog_family_from_pangenome_params
 
 =over 4
 
 
 
-=item Description
-
-A link between a KBase gene ID and the ID for the same gene in another database
-
-        string foreign_id - ID of the gene in another database
-        feature_id feature - ID of the gene in KBase
-
-
 =item Definition
 
 =begin html
 
 <pre>
-a reference to a list containing 2 items:
-0: (foreign_id) a string
-1: (feature) a feature_id
+a reference to a hash where the following keys are defined:
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+orthologid has a value which is a string
+workspace has a value which is a string
 
 </pre>
 
@@ -20967,9 +22346,11 @@ a reference to a list containing 2 items:
 
 =begin text
 
-a reference to a list containing 2 items:
-0: (foreign_id) a string
-1: (feature) a feature_id
+a reference to a hash where the following keys are defined:
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+orthologid has a value which is a string
+workspace has a value which is a string
 
 
 =end text
@@ -20978,35 +22359,22 @@ a reference to a list containing 2 items:
 
 
 
-=head2 add_feature_translation_params
+=head2 pangenome_to_proteome_comparison_params
 
 =over 4
 
 
 
-=item Description
-
-Input parameters for the "add_feature_translation" function.
-
-        genome_id genome - ID of the genome into which the new aliases are to be loaded (a required argument)
-        workspace_id workspace - ID of the workspace containing the target genome (a required argument)
-        list<translation> translations - list of translations between KBase gene IDs and gene IDs in another database (a required argument)
-        string id_type - type of the IDs being loaded (e.g. KEGG, NCBI) (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
-
-
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-translations has a value which is a reference to a list where each element is a translation
-id_type has a value which is a string
-auth has a value which is a string
-overwrite has a value which is a bool
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+outputid has a value which is a string
+workspace has a value which is a string
 
 </pre>
 
@@ -21015,12 +22383,10 @@ overwrite has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-translations has a value which is a reference to a list where each element is a translation
-id_type has a value which is a string
-auth has a value which is a string
-overwrite has a value which is a bool
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+outputid has a value which is a string
+workspace has a value which is a string
 
 
 =end text
@@ -21029,7 +22395,7 @@ overwrite has a value which is a bool
 
 
 
-=head2 genome_to_fbamodel_params
+=head2 import_fbamodel_params
 
 =over 4
 
@@ -21037,16 +22403,15 @@ overwrite has a value which is a bool
 
 =item Description
 
-Input parameters for the "genome_to_fbamodel" function.
+Input parameters for the "import_fbamodel" function.
 
         genome_id genome - ID of the genome for which a model is to be built (a required argument)
         workspace_id genome_workspace - ID of the workspace containing the target genome (an optional argument; default is the workspace argument)
-        template_id templatemodel - 
-        workspace_id templatemodel_workspace - 
-        bool probannoOnly - a boolean indicating if only the probabilistic annotation should be used in building the model (an optional argument; default is '0')
-        fbamodel_id model - ID that should be used for the newly constructed model (an optional argument; default is 'undef')
-        bool coremodel - indicates that a core model should be constructed instead of a genome scale model (an optional argument; default is '0')
+        string biomass - biomass equation for model (an essential argument)
+        list<tuple<string id,string direction,string compartment,string gpr> reactions - list of reactions to appear in imported model (an essential argument)
+        fbamodel_id model - ID that should be used for the newly imported model (an optional argument; default is 'undef')
         workspace_id workspace - ID of the workspace where the newly developed model will be stored; also the default assumed workspace for input objects (a required argument)
+        bool ignore_errors - ignores missing genes or reactions and imports model anyway
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -21058,13 +22423,18 @@ Input parameters for the "genome_to_fbamodel" function.
 a reference to a hash where the following keys are defined:
 genome has a value which is a genome_id
 genome_workspace has a value which is a workspace_id
-templatemodel has a value which is a template_id
-templatemodel_workspace has a value which is a workspace_id
+biomass has a value which is a string
+reactions has a value which is a reference to a list where each element is a reference to a list containing 4 items:
+0: (id) a string
+1: (direction) a string
+2: (compartment) a string
+3: (gpr) a string
+
 model has a value which is a fbamodel_id
-coremodel has a value which is a bool
 workspace has a value which is a workspace_id
+ignore_errors has a value which is a bool
 auth has a value which is a string
-fulldb has a value which is a bool
+overwrite has a value which is a bool
 
 </pre>
 
@@ -21075,13 +22445,18 @@ fulldb has a value which is a bool
 a reference to a hash where the following keys are defined:
 genome has a value which is a genome_id
 genome_workspace has a value which is a workspace_id
-templatemodel has a value which is a template_id
-templatemodel_workspace has a value which is a workspace_id
+biomass has a value which is a string
+reactions has a value which is a reference to a list where each element is a reference to a list containing 4 items:
+0: (id) a string
+1: (direction) a string
+2: (compartment) a string
+3: (gpr) a string
+
 model has a value which is a fbamodel_id
-coremodel has a value which is a bool
 workspace has a value which is a workspace_id
+ignore_errors has a value which is a bool
 auth has a value which is a string
-fulldb has a value which is a bool
+overwrite has a value which is a bool
 
 
 =end text
@@ -21090,7 +22465,7 @@ fulldb has a value which is a bool
 
 
 
-=head2 translate_fbamodel_params
+=head2 export_fbamodel_params
 
 =over 4
 
@@ -21098,12 +22473,13 @@ fulldb has a value which is a bool
 
 =item Description
 
-Input parameters for the "translate_fbamodel" function.
+Input parameters for the "export_fbamodel" function.
 
-        gencomp
-        gencomp_workspace
-        fbamodel_id model;
-        fbamodel_id model_workspace;
+        fbamodel_id model - ID of the model to be exported (a required argument)
+        workspace_id workspace - workspace containing the model to be exported (a required argument)
+        fba_id fba - A FBA object related to the model. (an optional argument)
+        string format - format to which the model should be exported (sbml, html, json, readable, cytoseed) (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -21112,11 +22488,11 @@ Input parameters for the "translate_fbamodel" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-protcomp has a value which is a string
-protcomp_workspace has a value which is a string
-model has a value which is a string
-model_workspace has a value which is a string
+model has a value which is a fbamodel_id
 workspace has a value which is a workspace_id
+fbas has a value which is a reference to a list where each element is a fba_id
+format has a value which is a string
+auth has a value which is a string
 
 </pre>
 
@@ -21125,11 +22501,11 @@ workspace has a value which is a workspace_id
 =begin text
 
 a reference to a hash where the following keys are defined:
-protcomp has a value which is a string
-protcomp_workspace has a value which is a string
-model has a value which is a string
-model_workspace has a value which is a string
+model has a value which is a fbamodel_id
 workspace has a value which is a workspace_id
+fbas has a value which is a reference to a list where each element is a fba_id
+format has a value which is a string
+auth has a value which is a string
 
 
 =end text
@@ -21138,7 +22514,7 @@ workspace has a value which is a workspace_id
 
 
 
-=head2 build_pangenome_params
+=head2 export_object_params
 
 =over 4
 
@@ -21146,12 +22522,12 @@ workspace has a value which is a workspace_id
 
 =item Description
 
-Input parameters for the "translate_fbamodel" function.
+Input parameters for the "export_object" function.
 
-        gencomp
-        gencomp_workspace
-        fbamodel_id model;
-        fbamodel_id model_workspace;
+        workspace_ref reference - reference of object to print in html (a required argument)
+        string type - type of the object to be exported (a required argument)
+        string format - format to which data should be exported (an optional argument; default is html)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -21160,9 +22536,10 @@ Input parameters for the "translate_fbamodel" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-genomes has a value which is a reference to a list where each element is a string
-genome_workspace has a value which is a reference to a list where each element is a string
-workspace has a value which is a workspace_id
+reference has a value which is a workspace_ref
+type has a value which is a string
+format has a value which is a string
+auth has a value which is a string
 
 </pre>
 
@@ -21171,9 +22548,10 @@ workspace has a value which is a workspace_id
 =begin text
 
 a reference to a hash where the following keys are defined:
-genomes has a value which is a reference to a list where each element is a string
-genome_workspace has a value which is a reference to a list where each element is a string
-workspace has a value which is a workspace_id
+reference has a value which is a workspace_ref
+type has a value which is a string
+format has a value which is a string
+auth has a value which is a string
 
 
 =end text
@@ -21182,44 +22560,20 @@ workspace has a value which is a workspace_id
 
 
 
-=head2 heat_map_matrix
+=head2 export_genome_params
 
 =over 4
 
 
 
-=item Definition
-
-=begin html
-
-<pre>
-a reference to a hash where the following keys are defined:
-is_refs has a value which is a bool
-labels has a value which is a reference to a list where each element is a string
-matrix has a value which is a reference to a list where each element is a reference to a list where each element is a float
-
-</pre>
-
-=end html
-
-=begin text
-
-a reference to a hash where the following keys are defined:
-is_refs has a value which is a bool
-labels has a value which is a reference to a list where each element is a string
-matrix has a value which is a reference to a list where each element is a reference to a list where each element is a float
-
-
-=end text
-
-=back
-
-
-
-=head2 genome_heatmap_from_pangenome_params
+=item Description
 
-=over 4
+Input parameters for the "export_genome" function.
 
+        genome_id genome - ID of the genome to be exported (a required argument)
+        workspace_id workspace - workspace containing the model to be exported (a required argument)
+        string format - format to which the model should be exported (sbml, html, json, readable, cytoseed) (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -21228,9 +22582,10 @@ matrix has a value which is a reference to a list where each element is a refere
 
 <pre>
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-workspace has a value which is a string
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+format has a value which is a string
+auth has a value which is a string
 
 </pre>
 
@@ -21239,9 +22594,10 @@ workspace has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-workspace has a value which is a string
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+format has a value which is a string
+auth has a value which is a string
 
 
 =end text
@@ -21250,7 +22606,7 @@ workspace has a value which is a string
 
 
 
-=head2 ortholog_data
+=head2 adjust_model_reaction_params
 
 =over 4
 
@@ -21258,7 +22614,22 @@ workspace has a value which is a string
 
 =item Description
 
-gene ID,gene ref,protein sequence,function,score
+Input parameters for the "adjust_model_reaction" function.
+
+        fbamodel_id model - ID of model to be adjusted
+        workspace_id workspace - workspace containing model to be adjusted
+        list<reaction_id> reaction - List of IDs of reactions to be added, removed, or adjusted
+        list<string> direction - directions to set for reactions being added or adjusted
+        list<compartment_id> compartment - IDs of compartment containing reaction being added or adjusted
+        list<int> compartmentIndex - indexes of compartment containing reaction being altered or adjusted
+        list<string> gpr - array specifying gene-protein-reaction association(s)
+        bool removeReaction - boolean indicating listed reaction(s) should be removed
+        bool addReaction - boolean indicating reaction(s) should be added
+        bool overwrite - boolean indicating whether or not to overwrite model object in the workspace
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+
+        For all of the lists above, if only one element is specified it is assumed the user wants to apply the same
+        to all the listed reactions.
 
 
 =item Definition
@@ -21267,14 +22638,17 @@ gene ID,gene ref,protein sequence,function,score
 
 <pre>
 a reference to a hash where the following keys are defined:
-gene_data has a value which is a reference to a list where each element is a reference to a list containing 5 items:
-0: a string
-1: a string
-2: a string
-3: a string
-4: a float
-
-protein_heatmap has a value which is a heat_map_matrix
+model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+reaction has a value which is a reference to a list where each element is a reaction_id
+direction has a value which is a reference to a list where each element is a string
+compartment has a value which is a reference to a list where each element is a compartment_id
+compartmentIndex has a value which is a reference to a list where each element is an int
+gpr has a value which is a reference to a list where each element is a string
+removeReaction has a value which is a bool
+addReaction has a value which is a bool
+overwrite has a value which is a bool
+auth has a value which is a string
 
 </pre>
 
@@ -21283,14 +22657,17 @@ protein_heatmap has a value which is a heat_map_matrix
 =begin text
 
 a reference to a hash where the following keys are defined:
-gene_data has a value which is a reference to a list where each element is a reference to a list containing 5 items:
-0: a string
-1: a string
-2: a string
-3: a string
-4: a float
-
-protein_heatmap has a value which is a heat_map_matrix
+model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+reaction has a value which is a reference to a list where each element is a reaction_id
+direction has a value which is a reference to a list where each element is a string
+compartment has a value which is a reference to a list where each element is a compartment_id
+compartmentIndex has a value which is a reference to a list where each element is an int
+gpr has a value which is a reference to a list where each element is a string
+removeReaction has a value which is a bool
+addReaction has a value which is a bool
+overwrite has a value which is a bool
+auth has a value which is a string
 
 
 =end text
@@ -21299,22 +22676,40 @@ protein_heatmap has a value which is a heat_map_matrix
 
 
 
-=head2 ortholog_family_from_pangenome_params
+=head2 adjust_biomass_reaction_params
 
 =over 4
 
 
 
+=item Description
+
+Input parameters for the "adjust_biomass_reaction" function.
+
+        fbamodel_id model - ID of model to be adjusted
+        workspace_id workspace - workspace containing model to be adjusted
+        biomass_id biomass - ID of biomass reaction to adjust
+        list<float> coefficients - coefficient of biomass compound
+        list<compound_id> compounds - ID of biomass compound to adjust in biomass
+        list<compartment_id> compartments - ID of compartment containing compound to adjust in biomass
+        list<int> compartmentIndecies - index of compartment containing compound to adjust in biomass
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-orthologid has a value which is a string
-workspace has a value which is a string
+model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+biomass has a value which is a biomass_id
+coefficients has a value which is a reference to a list where each element is a float
+compounds has a value which is a reference to a list where each element is a compound_id
+compartments has a value which is a reference to a list where each element is a compartment_id
+compartmentIndecies has a value which is a reference to a list where each element is an int
+auth has a value which is a string
 
 </pre>
 
@@ -21323,10 +22718,14 @@ workspace has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-orthologid has a value which is a string
-workspace has a value which is a string
+model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+biomass has a value which is a biomass_id
+coefficients has a value which is a reference to a list where each element is a float
+compounds has a value which is a reference to a list where each element is a compound_id
+compartments has a value which is a reference to a list where each element is a compartment_id
+compartmentIndecies has a value which is a reference to a list where each element is an int
+auth has a value which is a string
 
 
 =end text
@@ -21335,22 +22734,37 @@ workspace has a value which is a string
 
 
 
-=head2 pangenome_to_proteome_comparison_params
+=head2 addmedia_params
 
 =over 4
 
 
 
+=item Description
+
+********************************************************************************
+    Code relating to flux balance analysis
+   	********************************************************************************
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-outputid has a value which is a string
-workspace has a value which is a string
+media has a value which is a media_id
+workspace has a value which is a workspace_id
+name has a value which is a string
+isDefined has a value which is a bool
+isMinimal has a value which is a bool
+type has a value which is a string
+compounds has a value which is a reference to a list where each element is a string
+concentrations has a value which is a reference to a list where each element is a float
+maxflux has a value which is a reference to a list where each element is a float
+minflux has a value which is a reference to a list where each element is a float
+overwrite has a value which is a bool
+auth has a value which is a string
 
 </pre>
 
@@ -21359,10 +22773,18 @@ workspace has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-outputid has a value which is a string
-workspace has a value which is a string
+media has a value which is a media_id
+workspace has a value which is a workspace_id
+name has a value which is a string
+isDefined has a value which is a bool
+isMinimal has a value which is a bool
+type has a value which is a string
+compounds has a value which is a reference to a list where each element is a string
+concentrations has a value which is a reference to a list where each element is a float
+maxflux has a value which is a reference to a list where each element is a float
+minflux has a value which is a reference to a list where each element is a float
+overwrite has a value which is a bool
+auth has a value which is a string
 
 
 =end text
@@ -21371,7 +22793,7 @@ workspace has a value which is a string
 
 
 
-=head2 import_fbamodel_params
+=head2 export_media_params
 
 =over 4
 
@@ -21379,15 +22801,11 @@ workspace has a value which is a string
 
 =item Description
 
-Input parameters for the "import_fbamodel" function.
+Input parameters for the "export_media" function.
 
-        genome_id genome - ID of the genome for which a model is to be built (a required argument)
-        workspace_id genome_workspace - ID of the workspace containing the target genome (an optional argument; default is the workspace argument)
-        string biomass - biomass equation for model (an essential argument)
-        list<tuple<string id,string direction,string compartment,string gpr> reactions - list of reactions to appear in imported model (an essential argument)
-        fbamodel_id model - ID that should be used for the newly imported model (an optional argument; default is 'undef')
-        workspace_id workspace - ID of the workspace where the newly developed model will be stored; also the default assumed workspace for input objects (a required argument)
-        bool ignore_errors - ignores missing genes or reactions and imports model anyway
+        media_id media - ID of the media to be exported (a required argument)
+        workspace_id workspace - workspace containing the media to be exported (a required argument)
+        string format - format to which the media should be exported (html, json, readable) (a required argument)
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -21397,20 +22815,10 @@ Input parameters for the "import_fbamodel" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-biomass has a value which is a string
-reactions has a value which is a reference to a list where each element is a reference to a list containing 4 items:
-0: (id) a string
-1: (direction) a string
-2: (compartment) a string
-3: (gpr) a string
-
-model has a value which is a fbamodel_id
+media has a value which is a media_id
 workspace has a value which is a workspace_id
-ignore_errors has a value which is a bool
+format has a value which is a string
 auth has a value which is a string
-overwrite has a value which is a bool
 
 </pre>
 
@@ -21419,20 +22827,10 @@ overwrite has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-biomass has a value which is a string
-reactions has a value which is a reference to a list where each element is a reference to a list containing 4 items:
-0: (id) a string
-1: (direction) a string
-2: (compartment) a string
-3: (gpr) a string
-
-model has a value which is a fbamodel_id
+media has a value which is a media_id
 workspace has a value which is a workspace_id
-ignore_errors has a value which is a bool
+format has a value which is a string
 auth has a value which is a string
-overwrite has a value which is a bool
 
 
 =end text
@@ -21441,7 +22839,7 @@ overwrite has a value which is a bool
 
 
 
-=head2 export_fbamodel_params
+=head2 runfba_params
 
 =over 4
 
@@ -21449,12 +22847,19 @@ overwrite has a value which is a bool
 
 =item Description
 
-Input parameters for the "export_fbamodel" function.
+Input parameters for the "addmedia" function.
 
-        fbamodel_id model - ID of the model to be exported (a required argument)
-        workspace_id workspace - workspace containing the model to be exported (a required argument)
-        fba_id fba - A FBA object related to the model. (an optional argument)
-        string format - format to which the model should be exported (sbml, html, json, readable, cytoseed) (a required argument)
+        fbamodel_id model - ID of the model that FBA should be run on (a required argument)
+        workspace_id model_workspace - workspace where model for FBA should be run (an optional argument; default is the value of the workspace argument)
+        FBAFormulation formulation - a hash specifying the parameters for the FBA study (an optional argument)
+        bool fva - a flag indicating if flux variability should be run (an optional argument: default is '0')
+        bool simulateko - a flag indicating if flux variability should be run (an optional argument: default is '0')
+        bool minimizeflux - a flag indicating if flux variability should be run (an optional argument: default is '0')
+        bool findminmedia - a flag indicating if flux variability should be run (an optional argument: default is '0')
+        string notes - a string of notes to attach to the FBA study (an optional argument; defaul is '')
+        fba_id fba - ID under which the FBA results should be saved (an optional argument; defaul is 'undef')
+        workspace_id workspace - workspace where FBA results will be saved (a required argument)
+        bool add_to_model - a flag indicating if the FBA study should be attached to the model to support viewing results (an optional argument: default is '0')
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -21465,10 +22870,18 @@ Input parameters for the "export_fbamodel" function.
 <pre>
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+fva has a value which is a bool
+simulateko has a value which is a bool
+minimizeflux has a value which is a bool
+findminmedia has a value which is a bool
+notes has a value which is a string
+fba has a value which is a fba_id
 workspace has a value which is a workspace_id
-fbas has a value which is a reference to a list where each element is a fba_id
-format has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
+add_to_model has a value which is a bool
 
 </pre>
 
@@ -21478,10 +22891,18 @@ auth has a value which is a string
 
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+fva has a value which is a bool
+simulateko has a value which is a bool
+minimizeflux has a value which is a bool
+findminmedia has a value which is a bool
+notes has a value which is a string
+fba has a value which is a fba_id
 workspace has a value which is a workspace_id
-fbas has a value which is a reference to a list where each element is a fba_id
-format has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
+add_to_model has a value which is a bool
 
 
 =end text
@@ -21490,7 +22911,7 @@ auth has a value which is a string
 
 
 
-=head2 export_object_params
+=head2 runfba_batch_params
 
 =over 4
 
@@ -21498,11 +22919,16 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "export_object" function.
+Input parameters for the "runfba_batch" function.
 
-        workspace_ref reference - reference of object to print in html (a required argument)
-        string type - type of the object to be exported (a required argument)
-        string format - format to which data should be exported (an optional argument; default is html)
+        fbamodel_id model - ID of the model that FBA should be run on (a required argument)
+        workspace_id model_workspace - workspace where model for FBA should be run (an optional argument; default is the value of the workspace argument)
+        list<FBAFormulation> formulations - the parameters of each FBA study in the batch (a required argument)
+        list<string> fluxes - IDs of the reactions, biomass reactions and compounds whose flux is reported for every formulation (an optional argument)
+        bool minimizeflux - a flag indicating if flux should be minimized after each study (an optional argument: default is '0')
+        bool save_fbas - a flag indicating if an FBA object should be saved for each study (an optional argument: default is '0')
+        list<fba_id> fbas - IDs under which the FBA objects should be saved, one per formulation (an optional argument; default is generated from the model ID)
+        workspace_id workspace - workspace where FBA results will be saved (a required argument)
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -21512,9 +22938,14 @@ Input parameters for the "export_object" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-reference has a value which is a workspace_ref
-type has a value which is a string
-format has a value which is a string
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulations has a value which is a reference to a list where each element is an FBAFormulation
+fluxes has a value which is a reference to a list where each element is a string
+minimizeflux has a value which is a bool
+save_fbas has a value which is a bool
+fbas has a value which is a reference to a list where each element is a fba_id
+workspace has a value which is a workspace_id
 auth has a value which is a string
 
 </pre>
@@ -21524,9 +22955,14 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-reference has a value which is a workspace_ref
-type has a value which is a string
-format has a value which is a string
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulations has a value which is a reference to a list where each element is an FBAFormulation
+fluxes has a value which is a reference to a list where each element is a string
+minimizeflux has a value which is a bool
+save_fbas has a value which is a bool
+fbas has a value which is a reference to a list where each element is a fba_id
+workspace has a value which is a workspace_id
 auth has a value which is a string
 
 
@@ -21536,7 +22972,7 @@ auth has a value which is a string
 
 
 
-=head2 export_genome_params
+=head2 FBABatchResults
 
 =over 4
 
@@ -21544,12 +22980,13 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "export_genome" function.
+Results of a batch of flux balance analyses, one entry per formulation in each list
 
-        genome_id genome - ID of the genome to be exported (a required argument)
-        workspace_id workspace - workspace containing the model to be exported (a required argument)
-        string format - format to which the model should be exported (sbml, html, json, readable, cytoseed) (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        list<string> fluxes - IDs of the fluxes reported
+        list<bool> feasible - flag indicating if each study had a solution
+        list<float> objectives - objective value of each study; 0 when it had no solution
+        list<list<float>> values - values of the reported fluxes in each study, in the order of fluxes
+        list<object_metadata> fbaMetas - metadata of the FBA objects saved (empty unless save_fbas is set)
 
 
 =item Definition
@@ -21558,10 +22995,11 @@ Input parameters for the "export_genome" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-format has a value which is a string
-auth has a value which is a string
+fluxes has a value which is a reference to a list where each element is a string
+feasible has a value which is a reference to a list where each element is a bool
+objectives has a value which is a reference to a list where each element is a float
+values has a value which is a reference to a list where each element is a reference to a list where each element is a float
+fbaMetas has a value which is a reference to a list where each element is an object_metadata
 
 </pre>
 
@@ -21570,10 +23008,11 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-format has a value which is a string
-auth has a value which is a string
+fluxes has a value which is a reference to a list where each element is a string
+feasible has a value which is a reference to a list where each element is a bool
+objectives has a value which is a reference to a list where each element is a float
+values has a value which is a reference to a list where each element is a reference to a list where each element is a float
+fbaMetas has a value which is a reference to a list where each element is an object_metadata
 
 
 =end text
@@ -21582,7 +23021,7 @@ auth has a value which is a string
 
 
 
-=head2 adjust_model_reaction_params
+=head2 sweep_parameter
 
 =over 4
 
@@ -21590,22 +23029,12 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "adjust_model_reaction" function.
-
-        fbamodel_id model - ID of model to be adjusted
-        workspace_id workspace - workspace containing model to be adjusted
-        list<reaction_id> reaction - List of IDs of reactions to be added, removed, or adjusted
-        list<string> direction - directions to set for reactions being added or adjusted
-        list<compartment_id> compartment - IDs of compartment containing reaction being added or adjusted
-        list<int> compartmentIndex - indexes of compartment containing reaction being altered or adjusted
-        list<string> gpr - array specifying gene-protein-reaction association(s)
-        bool removeReaction - boolean indicating listed reaction(s) should be removed
-        bool addReaction - boolean indicating reaction(s) should be added
-        bool overwrite - boolean indicating whether or not to overwrite model object in the workspace
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+A parameter swept by the "fba_parameter_sweep" function
 
-        For all of the lists above, if only one element is specified it is assumed the user wants to apply the same
-        to all the listed reactions.
+        string variable_type - type of the swept variable: flux, biomassflux, drainflux or constraint
+        string variable - ID of the reaction, biomass reaction or compound, or name of the constraint
+        string bound - bound of a flux that takes the swept values: lower, upper or both (an optional argument: default is 'upper'; the right hand side of a constraint is always swept)
+        list<float> values - the values swept
 
 
 =item Definition
@@ -21614,17 +23043,10 @@ Input parameters for the "adjust_model_reaction" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-model has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-reaction has a value which is a reference to a list where each element is a reaction_id
-direction has a value which is a reference to a list where each element is a string
-compartment has a value which is a reference to a list where each element is a compartment_id
-compartmentIndex has a value which is a reference to a list where each element is an int
-gpr has a value which is a reference to a list where each element is a string
-removeReaction has a value which is a bool
-addReaction has a value which is a bool
-overwrite has a value which is a bool
-auth has a value which is a string
+variable_type has a value which is a string
+variable has a value which is a string
+bound has a value which is a string
+values has a value which is a reference to a list where each element is a float
 
 </pre>
 
@@ -21633,17 +23055,10 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-model has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-reaction has a value which is a reference to a list where each element is a reaction_id
-direction has a value which is a reference to a list where each element is a string
-compartment has a value which is a reference to a list where each element is a compartment_id
-compartmentIndex has a value which is a reference to a list where each element is an int
-gpr has a value which is a reference to a list where each element is a string
-removeReaction has a value which is a bool
-addReaction has a value which is a bool
-overwrite has a value which is a bool
-auth has a value which is a string
+variable_type has a value which is a string
+variable has a value which is a string
+bound has a value which is a string
+values has a value which is a reference to a list where each element is a float
 
 
 =end text
@@ -21652,7 +23067,7 @@ auth has a value which is a string
 
 
 
-=head2 adjust_biomass_reaction_params
+=head2 fba_parameter_sweep_params
 
 =over 4
 
@@ -21660,16 +23075,14 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "adjust_biomass_reaction" function.
+Input parameters for the "fba_parameter_sweep" function.
 
-        fbamodel_id model - ID of model to be adjusted
-        workspace_id workspace - workspace containing model to be adjusted
-        biomass_id biomass - ID of biomass reaction to adjust
-        list<float> coefficients - coefficient of biomass compound
-        list<compound_id> compounds - ID of biomass compound to adjust in biomass
-        list<compartment_id> compartments - ID of compartment containing compound to adjust in biomass
-        list<int> compartmentIndecies - index of compartment containing compound to adjust in biomass
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        fbamodel_id model - ID of the model that FBA should be run on (a required argument)
+        workspace_id model_workspace - workspace where model for FBA should be run (a required argument)
+        FBAFormulation formulation - a hash specifying the parameters for the FBA study (an optional argument)
+        list<sweep_parameter> parameters - one or two parameters whose values span the grid (a required argument)
+        list<string> compounds - IDs of the compounds whose shadow prices are reported (an optional argument; default is the compounds whose drain fluxes are swept)
+        string auth - the authentication token of the KBase account (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -21679,12 +23092,10 @@ Input parameters for the "adjust_biomass_reaction" function.
 <pre>
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-biomass has a value which is a biomass_id
-coefficients has a value which is a reference to a list where each element is a float
-compounds has a value which is a reference to a list where each element is a compound_id
-compartments has a value which is a reference to a list where each element is a compartment_id
-compartmentIndecies has a value which is a reference to a list where each element is an int
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+parameters has a value which is a reference to a list where each element is a sweep_parameter
+compounds has a value which is a reference to a list where each element is a string
 auth has a value which is a string
 
 </pre>
@@ -21695,12 +23106,10 @@ auth has a value which is a string
 
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-biomass has a value which is a biomass_id
-coefficients has a value which is a reference to a list where each element is a float
-compounds has a value which is a reference to a list where each element is a compound_id
-compartments has a value which is a reference to a list where each element is a compartment_id
-compartmentIndecies has a value which is a reference to a list where each element is an int
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+parameters has a value which is a reference to a list where each element is a sweep_parameter
+compounds has a value which is a reference to a list where each element is a string
 auth has a value which is a string
 
 
@@ -21710,7 +23119,7 @@ auth has a value which is a string
 
 
 
-=head2 addmedia_params
+=head2 FBASweepResults
 
 =over 4
 
@@ -21718,9 +23127,14 @@ auth has a value which is a string
 
 =item Description
 
-********************************************************************************
-    Code relating to flux balance analysis
-   	********************************************************************************
+Results of a parameter sweep, as dense arrays indexed by the position of the values of the first and the second parameter
+
+        list<float> values1 - values of the first parameter
+        list<float> values2 - values of the second parameter (empty when only one parameter is swept; the arrays then have one column)
+        list<list<bool>> feasible - flag indicating if each grid point had a solution
+        list<list<float>> objectives - objective value at each grid point; 0 when it had no solution
+        list<string> compounds - IDs of the compounds whose shadow prices are reported
+        list<list<list<float>>> shadow_prices - objective gained per unit of each compound supplied, at each grid point, in the order of compounds
 
 
 =item Definition
@@ -21729,18 +23143,12 @@ auth has a value which is a string
 
 <pre>
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-workspace has a value which is a workspace_id
-name has a value which is a string
-isDefined has a value which is a bool
-isMinimal has a value which is a bool
-type has a value which is a string
+values1 has a value which is a reference to a list where each element is a float
+values2 has a value which is a reference to a list where each element is a float
+feasible has a value which is a reference to a list where each element is a reference to a list where each element is a bool
+objectives has a value which is a reference to a list where each element is a reference to a list where each element is a float
 compounds has a value which is a reference to a list where each element is a string
-concentrations has a value which is a reference to a list where each element is a float
-maxflux has a value which is a reference to a list where each element is a float
-minflux has a value which is a reference to a list where each element is a float
-overwrite has a value which is a bool
-auth has a value which is a string
+shadow_prices has a value which is a reference to a list where each element is a reference to a list where each element is a reference to a list where each element is a float
 
 </pre>
 
@@ -21749,18 +23157,12 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-workspace has a value which is a workspace_id
-name has a value which is a string
-isDefined has a value which is a bool
-isMinimal has a value which is a bool
-type has a value which is a string
+values1 has a value which is a reference to a list where each element is a float
+values2 has a value which is a reference to a list where each element is a float
+feasible has a value which is a reference to a list where each element is a reference to a list where each element is a bool
+objectives has a value which is a reference to a list where each element is a reference to a list where each element is a float
 compounds has a value which is a reference to a list where each element is a string
-concentrations has a value which is a reference to a list where each element is a float
-maxflux has a value which is a reference to a list where each element is a float
-minflux has a value which is a reference to a list where each element is a float
-overwrite has a value which is a bool
-auth has a value which is a string
+shadow_prices has a value which is a reference to a list where each element is a reference to a list where each element is a reference to a list where each element is a float
 
 
 =end text
@@ -21769,7 +23171,7 @@ auth has a value which is a string
 
 
 
-=head2 export_media_params
+=head2 simulate_double_knockouts_params
 
 =over 4
 
@@ -21777,12 +23179,13 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "export_media" function.
+Input parameters for the "simulate_double_knockouts" function.
 
-        media_id media - ID of the media to be exported (a required argument)
-        workspace_id workspace - workspace containing the media to be exported (a required argument)
-        string format - format to which the media should be exported (html, json, readable) (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        fbamodel_id model - ID of the model that knockouts should be simulated on (a required argument)
+        workspace_id model_workspace - workspace where model is located (a required argument)
+        FBAFormulation formulation - a hash specifying the parameters for the FBA study; gene knockouts listed here apply to every pair (an optional argument)
+        list<feature_id> genes - genes to knock out in pairs (an optional argument; default is every gene of the model)
+        string auth - the authentication token of the KBase account (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -21791,9 +23194,10 @@ Input parameters for the "export_media" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-workspace has a value which is a workspace_id
-format has a value which is a string
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+genes has a value which is a reference to a list where each element is a feature_id
 auth has a value which is a string
 
 </pre>
@@ -21803,9 +23207,10 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-workspace has a value which is a workspace_id
-format has a value which is a string
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+genes has a value which is a reference to a list where each element is a feature_id
 auth has a value which is a string
 
 
@@ -21815,7 +23220,7 @@ auth has a value which is a string
 
 
 
-=head2 runfba_params
+=head2 DoubleKnockoutMatrix
 
 =over 4
 
@@ -21823,20 +23228,15 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "addmedia" function.
+Growth of double gene knockouts, stored as a sparse upper triangular matrix
 
-        fbamodel_id model - ID of the model that FBA should be run on (a required argument)
-        workspace_id model_workspace - workspace where model for FBA should be run (an optional argument; default is the value of the workspace argument)
-        FBAFormulation formulation - a hash specifying the parameters for the FBA study (an optional argument)
-        bool fva - a flag indicating if flux variability should be run (an optional argument: default is '0')
-        bool simulateko - a flag indicating if flux variability should be run (an optional argument: default is '0')
-        bool minimizeflux - a flag indicating if flux variability should be run (an optional argument: default is '0')
-        bool findminmedia - a flag indicating if flux variability should be run (an optional argument: default is '0')
-        string notes - a string of notes to attach to the FBA study (an optional argument; defaul is '')
-        fba_id fba - ID under which the FBA results should be saved (an optional argument; defaul is 'undef')
-        workspace_id workspace - workspace where FBA results will be saved (a required argument)
-        bool add_to_model - a flag indicating if the FBA study should be attached to the model to support viewing results (an optional argument: default is '0')
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        list<feature_id> genes - genes knocked out, in matrix order
+        float wildtype_growth - objective value with no gene knocked out
+        list<float> single_growth - objective value with each gene knocked out, in the order of genes
+        list<tuple<int,int,float>> interactions - (index of first gene, index of second gene, objective value) for the pairs that grow less than both of their single knockouts, first gene index less than second
+        int solved - number of knockouts that had to be solved
+
+        Every pair not listed in interactions grows as its slower single knockout.
 
 
 =item Definition
@@ -21845,19 +23245,15 @@ Input parameters for the "addmedia" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-formulation has a value which is an FBAFormulation
-fva has a value which is a bool
-simulateko has a value which is a bool
-minimizeflux has a value which is a bool
-findminmedia has a value which is a bool
-notes has a value which is a string
-fba has a value which is a fba_id
-workspace has a value which is a workspace_id
-auth has a value which is a string
-overwrite has a value which is a bool
-add_to_model has a value which is a bool
+genes has a value which is a reference to a list where each element is a feature_id
+wildtype_growth has a value which is a float
+single_growth has a value which is a reference to a list where each element is a float
+interactions has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+0: an int
+1: an int
+2: a float
+
+solved has a value which is an int
 
 </pre>
 
@@ -21866,19 +23262,15 @@ add_to_model has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-formulation has a value which is an FBAFormulation
-fva has a value which is a bool
-simulateko has a value which is a bool
-minimizeflux has a value which is a bool
-findminmedia has a value which is a bool
-notes has a value which is a string
-fba has a value which is a fba_id
-workspace has a value which is a workspace_id
-auth has a value which is a string
-overwrite has a value which is a bool
-add_to_model has a value which is a bool
+genes has a value which is a reference to a list where each element is a feature_id
+wildtype_growth has a value which is a float
+single_growth has a value which is a reference to a list where each element is a float
+interactions has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+0: an int
+1: an int
+2: a float
+
+solved has a value which is an int
 
 
 =end text
@@ -21951,6 +23343,8 @@ Input parameters for the "generate_model_stats" function.
 
         fbamodel_id model - ID of the models that FBA should be run on (a required argument)
         workspace_id model_workspace - workspaces where model for FBA should be run (an optional argument; default is the value of the workspace argument)
+        media_id minimal_media - ID of the minimal media essential genes and reactions are computed on (an optional argument; default is set by the service, normally 'Carbon-D-Glucose')
+        workspace_id minimal_media_workspace - workspace where the minimal media is located (an optional argument; default is set by the service, normally 'KBaseMedia')
 
 
 =item Definition
@@ -21961,6 +23355,8 @@ Input parameters for the "generate_model_stats" function.
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
+minimal_media has a value which is a media_id
+minimal_media_workspace has a value which is a workspace_id
 
 </pre>
 
@@ -21971,6 +23367,8 @@ model_workspace has a value which is a workspace_id
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
+minimal_media has a value which is a media_id
+minimal_media_workspace has a value which is a workspace_id
 
 
 =end text
@@ -22934,6 +24332,148 @@ overwrite has a value which is a bool
 
 
 
+=head2 reconcile_phenotypes_params
+
+=over 4
+
+
+
+=item Description
+
+Input parameters for the "reconcile_phenotypes" function.
+
+        fbamodel_id model - ID of the model that reconciliation should be run on (a required argument)
+        workspace_id model_workspace - workspace where model for reconciliation should be run (an optional argument; default is the value of the workspace argument)
+        FBAFormulation fba_formulation - a hash specifying the parameters for the reconciliation study (an optional argument)
+        GapfillingFormulation gapfill_formulation - a hash specifying the parameters for the gapfill study (an optional argument)
+        GapgenFormulation gapgen_formulation - a hash specifying the parameters for the gapgen study (an optional argument)
+        phenotype_set_id phenotypeSet - ID of a phenotype set against which the model should be reconciled (a required argument)
+        workspace_id phenotypeSet_workspace - workspace containing phenotype set to be simulated (an optional argument; default is the value of the workspace argument)
+        fbamodel_id out_model - ID where the reconciled model will be saved (an optional argument: default is the value of the model argument)
+        list<gapgen_id> gapGens - IDs of the gapgen studies or solutions to analyse and combine (an optional argument: default is all of them)
+        list<gapfill_id> gapFills - IDs of the gapfill studies or solutions to analyse and combine (an optional argument: default is all of them)
+        bool sensitivity_analysis - flag indicating if the phenotype set should be simulated with each solution (an optional argument: default is '0')
+        bool combine_solutions - flag indicating if the solutions should be combined and integrated into the reconciled model (an optional argument: default is '0')
+        workspace_id workspace - workspace where reconciliation results will be saved (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a hash where the following keys are defined:
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+fba_formulation has a value which is an FBAFormulation
+gapfill_formulation has a value which is a GapfillingFormulation
+gapgen_formulation has a value which is a GapgenFormulation
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSet_workspace has a value which is a workspace_id
+out_model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+gapFills has a value which is a reference to a list where each element is a gapfill_id
+gapGens has a value which is a reference to a list where each element is a gapgen_id
+sensitivity_analysis has a value which is a bool
+combine_solutions has a value which is a bool
+auth has a value which is a string
+overwrite has a value which is a bool
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a hash where the following keys are defined:
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+fba_formulation has a value which is an FBAFormulation
+gapfill_formulation has a value which is a GapfillingFormulation
+gapgen_formulation has a value which is a GapgenFormulation
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSet_workspace has a value which is a workspace_id
+out_model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+gapFills has a value which is a reference to a list where each element is a gapfill_id
+gapGens has a value which is a reference to a list where each element is a gapgen_id
+sensitivity_analysis has a value which is a bool
+combine_solutions has a value which is a bool
+auth has a value which is a string
+overwrite has a value which is a bool
+
+
+=end text
+
+=back
+
+
+
+=head2 PhenotypeReconciliation
+
+=over 4
+
+
+
+=item Description
+
+Results of the "reconcile_phenotypes" function.
+
+        mapping<string,int> phenoclasses - number of phenotypes the model predicts in each class (CP, CN, FP, FN)
+        list<fba_id> gapfills - IDs of the gapfilling FBA objects saved, one per false negative with solutions
+        list<gapgen_id> gapgens - IDs of the Gapgeneration objects saved, one per false positive with solutions
+        mapping<string,tuple<list<string>,list<string>>> sensitivity - by solution ID, the IDs of the phenotypes the solution corrects and of those it makes wrong
+        list<string> combined_solutions - IDs of the solutions integrated into the reconciled model
+        mapping<string,int> reconciled_phenoclasses - number of phenotypes the reconciled model predicts in each class
+        object_metadata reconciled_model - metadata of the reconciled model, when the solutions were combined
+        string checkpoint - file holding the results of the completed stages, which a later call for the same model, phenotype set and formulations resumes from
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a hash where the following keys are defined:
+phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+gapfills has a value which is a reference to a list where each element is a fba_id
+gapgens has a value which is a reference to a list where each element is a gapgen_id
+sensitivity has a value which is a reference to a hash where the key is a string and the value is a reference to a list containing 2 items:
+0: a reference to a list where each element is a string
+1: a reference to a list where each element is a string
+
+combined_solutions has a value which is a reference to a list where each element is a string
+reconciled_phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+reconciled_model has a value which is an object_metadata
+checkpoint has a value which is a string
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a hash where the following keys are defined:
+phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+gapfills has a value which is a reference to a list where each element is a fba_id
+gapgens has a value which is a reference to a list where each element is a gapgen_id
+sensitivity has a value which is a reference to a hash where the key is a string and the value is a reference to a list containing 2 items:
+0: a reference to a list where each element is a string
+1: a reference to a list where each element is a string
+
+combined_solutions has a value which is a reference to a list where each element is a string
+reconciled_phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+reconciled_model has a value which is an object_metadata
+checkpoint has a value which is a string
+
+
+=end text
+
+=back
+
+
+
 =head2 run_job_params
 
 =over 4
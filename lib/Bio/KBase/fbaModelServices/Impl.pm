@@ -9186,9 +9186,9 @@ sub runfba
 
 
 
-=head2 quantitative_optimization
+=head2 runfba_batch
 
-  $output = $obj->quantitative_optimization($input)
+  $output = $obj->runfba_batch($input)
 
 =over 4
 
@@ -9197,15 +9197,18 @@ sub runfba
 =begin html
 
 <pre>
-$input is a quantitative_optimization_params
-$output is an object_metadata
-quantitative_optimization_params is a reference to a hash where the following keys are defined:
+$input is a runfba_batch_params
+$output is an FBABatchResults
+runfba_batch_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
-	formulation has a value which is an FBAFormulation
-	outputid has a value which is a fbamodel_id
+	formulations has a value which is a reference to a list where each element is an FBAFormulation
+	fluxes has a value which is a reference to a list where each element is a string
+	minimizeflux has a value which is a bool
+	save_fbas has a value which is a bool
+	fbas has a value which is a reference to a list where each element is a fba_id
 	workspace has a value which is a workspace_id
-	biomass has a value which is a string
+	auth has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
@@ -9255,6 +9258,13 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
+fba_id is a string
+FBABatchResults is a reference to a hash where the following keys are defined:
+	fluxes has a value which is a reference to a list where each element is a string
+	feasible has a value which is a reference to a list where each element is a bool
+	objectives has a value which is a reference to a list where each element is a float
+	values has a value which is a reference to a list where each element is a reference to a list where each element is a float
+	fbaMetas has a value which is a reference to a list where each element is an object_metadata
 object_metadata is a reference to a list containing 11 items:
 	0: (id) an object_id
 	1: (type) an object_type
@@ -9279,15 +9289,18 @@ workspace_ref is a string
 
 =begin text
 
-$input is a quantitative_optimization_params
-$output is an object_metadata
-quantitative_optimization_params is a reference to a hash where the following keys are defined:
+$input is a runfba_batch_params
+$output is an FBABatchResults
+runfba_batch_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
-	formulation has a value which is an FBAFormulation
-	outputid has a value which is a fbamodel_id
+	formulations has a value which is a reference to a list where each element is an FBAFormulation
+	fluxes has a value which is a reference to a list where each element is a string
+	minimizeflux has a value which is a bool
+	save_fbas has a value which is a bool
+	fbas has a value which is a reference to a list where each element is a fba_id
 	workspace has a value which is a workspace_id
-	biomass has a value which is a string
+	auth has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
@@ -9337,6 +9350,13 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
+fba_id is a string
+FBABatchResults is a reference to a hash where the following keys are defined:
+	fluxes has a value which is a reference to a list where each element is a string
+	feasible has a value which is a reference to a list where each element is a bool
+	objectives has a value which is a reference to a list where each element is a float
+	values has a value which is a reference to a list where each element is a reference to a list where each element is a float
+	fbaMetas has a value which is a reference to a list where each element is an object_metadata
 object_metadata is a reference to a list containing 11 items:
 	0: (id) an object_id
 	1: (type) an object_type
@@ -9362,13 +9382,13 @@ workspace_ref is a string
 
 =item Description
 
-Identify ways to adjust model to quantitatively match specified uptake, growth, and excretion constraints
+Run flux balance analysis for many formulations of one model, returning a table of objectives and fluxes
 
 =back
 
 =cut
 
-sub quantitative_optimization
+sub runfba_batch
 {
     my $self = shift;
     my($input) = @_;
@@ -9376,77 +9396,24 @@ sub quantitative_optimization
     my @_bad_arguments;
     (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument \"input\" (value was \"$input\")");
     if (@_bad_arguments) {
-	my $msg = "Invalid arguments passed to quantitative_optimization:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	my $msg = "Invalid arguments passed to runfba_batch:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-							       method_name => 'quantitative_optimization');
+							       method_name => 'runfba_batch');
     }
 
     my $ctx = $Bio::KBase::fbaModelServices::Server::CallContext;
     my($output);
-    #BEGIN quantitative_optimization
-    $self->_setContext($ctx,$input);
-	$input = $self->_validateargs($input,["model","constraints","workspace"],{
-		model_workspace => $input->{workspace},
-		formulation => undef,
-		outputid => undef,
-		biomass => undef,
-		solver => undef,
-		timePerSolution => 3600,
-		totalTimeLimit => 3600,
-		integrate_solution => 0,
-		num_solutions => 1,
-		MaxBoundMult => 2,
-		MinFluxCoef => 0.000001,
-		ReactionCoef => 100,
-		DrainCoef => 10,
-		BiomassCoef => 0.1,
-		ATPSynthCoef => 1,
-		ATPMaintCoef => 1,
-		MinVariables => 3,
-		Resolution => 0.01
-	});
-	my $model = $self->_get_msobject("FBAModel",$input->{model_workspace},$input->{model});
-	if (!defined($input->{outputid})) {
-		$input->{outputid} = $self->_get_new_id($input->{model});
-	}
-	$input->{formulation} = $self->_setDefaultFBAFormulation($input->{formulation});
-	my $fba = $self->_buildFBAObject($input->{formulation},$model,$input->{workspace},$input->{outputid});
-	if (defined($input->{solver})) {
-	   	$fba->parameters()->{MFASolver} = uc($input->{solver});
-	}
-	if (defined($input->{biomass}) && defined($fba->biomassflux_objterms()->{bio1})) {
-		my $bio = $model->searchForBiomass($input->{biomass});
-		if (defined($bio)) {
-			delete $fba->biomassflux_objterms()->{bio1};
-			$fba->biomassflux_objterms()->{$bio->id()} = 1;
-		}			
-	}
-	$fba->RunQuantitativeOptimization({
-		ReactionCoef => $input->{ReactionCoef},
-		DrainCoef => $input->{DrainCoef},
-		BiomassCoef => $input->{BiomassCoef},
-		ATPSynthCoef => $input->{ATPSynthCoef},
-		ATPMaintCoef => $input->{ATPMaintCoef},
-		TimePerSolution => $input->{timePerSolution},
-		TotalTimeLimit => $input->{totalTimeLimit},
-		Num_solutions => $input->{num_solutions},
-		MaxBoundMult => $input->{MaxBoundMult},
-		MinFluxCoef => $input->{MinFluxCoef},
-		Constraints => $input->{constraints},
-		Resolution => $input->{Resolution},
-		MinVariables => $input->{MinVariables}
-	});
-	$self->_save_msobject($fba,"FBA",$input->{workspace},$fba->id(),{hidden => 1});
-	$model->AddQuantitativeOptimization($fba,$input->{integrate_solution});	
-    $output = $self->_save_msobject($model,"FBAModel",$input->{workspace},$input->{outputid});
-    $self->_clearContext();
-    #END quantitative_optimization
+    #BEGIN runfba_batch
+    #runfba_batch runs on the in-process FBA engine of the python implementation
+    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => "_ERROR_runfba_batch is not supported by the perl implementation; call it on the python fbaModelServices server, with fba-engine=inprocess_ERROR_",
+							       method_name => 'runfba_batch');
+    #END runfba_batch
     my @_bad_returns;
-    (ref($output) eq 'ARRAY') or push(@_bad_returns, "Invalid type for return variable \"output\" (value was \"$output\")");
+    (ref($output) eq 'HASH') or push(@_bad_returns, "Invalid type for return variable \"output\" (value was \"$output\")");
     if (@_bad_returns) {
-	my $msg = "Invalid returns passed to quantitative_optimization:\n" . join("", map { "\t$_\n" } @_bad_returns);
+	my $msg = "Invalid returns passed to runfba_batch:\n" . join("", map { "\t$_\n" } @_bad_returns);
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-							       method_name => 'quantitative_optimization');
+							       method_name => 'runfba_batch');
     }
     return($output);
 }
@@ -9454,9 +9421,9 @@ sub quantitative_optimization
 
 
 
-=head2 generate_model_stats
+=head2 fba_parameter_sweep
 
-  $output = $obj->generate_model_stats($input)
+  $output = $obj->fba_parameter_sweep($input)
 
 =over 4
 
@@ -9465,53 +9432,76 @@ sub quantitative_optimization
 =begin html
 
 <pre>
-$input is a generate_model_stats_params
-$output is a model_statistics
-generate_model_stats_params is a reference to a hash where the following keys are defined:
+$input is a fba_parameter_sweep_params
+$output is an FBASweepResults
+fba_parameter_sweep_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	parameters has a value which is a reference to a list where each element is a sweep_parameter
+	compounds has a value which is a reference to a list where each element is a string
+	auth has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
-model_statistics is a reference to a hash where the following keys are defined:
-	total_reactions has a value which is an int
-	total_genes has a value which is an int
-	total_compounds has a value which is an int
-	extracellular_compounds has a value which is an int
-	intracellular_compounds has a value which is an int
-	transport_reactions has a value which is an int
-	subsystem_reactions has a value which is an int
-	subsystem_genes has a value which is an int
-	spontaneous_reactions has a value which is an int
-	reactions_with_genes has a value which is an int
-	gapfilled_reactions has a value which is an int
-	model_genes has a value which is an int
-	minimal_essential_genes has a value which is an int
-	complete_essential_genes has a value which is an int
-	minimal_essential_reactions has a value which is an int
-	complete_essential_reactions has a value which is an int
-	minimal_blocked_reactions has a value which is an int
-	complete_blocked_reactions has a value which is an int
-	minimal_variable_reactions has a value which is an int
-	complete_variable_reactions has a value which is an int
-	growth_complete_media has a value which is a bool
-	growth_minimal_media has a value which is a bool
-	subsystems has a value which is a reference to a list where each element is a subsystem_statistics
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
 bool is an int
-subsystem_statistics is a reference to a hash where the following keys are defined:
-	name has a value which is a string
-	class has a value which is a string
-	subclass has a value which is a string
-	genes has a value which is an int
-	reactions has a value which is an int
-	model_genes has a value which is an int
-	minimal_essential_genes has a value which is an int
-	complete_essential_genes has a value which is an int
-	minimal_essential_reactions has a value which is an int
-	complete_essential_reactions has a value which is an int
-	minimal_blocked_reactions has a value which is an int
-	complete_blocked_reactions has a value which is an int
-	minimal_variable_reactions has a value which is an int
-	complete_variable_reactions has a value which is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+sweep_parameter is a reference to a hash where the following keys are defined:
+	variable_type has a value which is a string
+	variable has a value which is a string
+	bound has a value which is a string
+	values has a value which is a reference to a list where each element is a float
+FBASweepResults is a reference to a hash where the following keys are defined:
+	values1 has a value which is a reference to a list where each element is a float
+	values2 has a value which is a reference to a list where each element is a float
+	feasible has a value which is a reference to a list where each element is a reference to a list where each element is a bool
+	objectives has a value which is a reference to a list where each element is a reference to a list where each element is a float
+	compounds has a value which is a reference to a list where each element is a string
+	shadow_prices has a value which is a reference to a list where each element is a reference to a list where each element is a reference to a list where each element is a float
 
 </pre>
 
@@ -9519,53 +9509,76 @@ subsystem_statistics is a reference to a hash where the following keys are defin
 
 =begin text
 
-$input is a generate_model_stats_params
-$output is a model_statistics
-generate_model_stats_params is a reference to a hash where the following keys are defined:
+$input is a fba_parameter_sweep_params
+$output is an FBASweepResults
+fba_parameter_sweep_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	parameters has a value which is a reference to a list where each element is a sweep_parameter
+	compounds has a value which is a reference to a list where each element is a string
+	auth has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
-model_statistics is a reference to a hash where the following keys are defined:
-	total_reactions has a value which is an int
-	total_genes has a value which is an int
-	total_compounds has a value which is an int
-	extracellular_compounds has a value which is an int
-	intracellular_compounds has a value which is an int
-	transport_reactions has a value which is an int
-	subsystem_reactions has a value which is an int
-	subsystem_genes has a value which is an int
-	spontaneous_reactions has a value which is an int
-	reactions_with_genes has a value which is an int
-	gapfilled_reactions has a value which is an int
-	model_genes has a value which is an int
-	minimal_essential_genes has a value which is an int
-	complete_essential_genes has a value which is an int
-	minimal_essential_reactions has a value which is an int
-	complete_essential_reactions has a value which is an int
-	minimal_blocked_reactions has a value which is an int
-	complete_blocked_reactions has a value which is an int
-	minimal_variable_reactions has a value which is an int
-	complete_variable_reactions has a value which is an int
-	growth_complete_media has a value which is a bool
-	growth_minimal_media has a value which is a bool
-	subsystems has a value which is a reference to a list where each element is a subsystem_statistics
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
 bool is an int
-subsystem_statistics is a reference to a hash where the following keys are defined:
-	name has a value which is a string
-	class has a value which is a string
-	subclass has a value which is a string
-	genes has a value which is an int
-	reactions has a value which is an int
-	model_genes has a value which is an int
-	minimal_essential_genes has a value which is an int
-	complete_essential_genes has a value which is an int
-	minimal_essential_reactions has a value which is an int
-	complete_essential_reactions has a value which is an int
-	minimal_blocked_reactions has a value which is an int
-	complete_blocked_reactions has a value which is an int
-	minimal_variable_reactions has a value which is an int
-	complete_variable_reactions has a value which is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+sweep_parameter is a reference to a hash where the following keys are defined:
+	variable_type has a value which is a string
+	variable has a value which is a string
+	bound has a value which is a string
+	values has a value which is a reference to a list where each element is a float
+FBASweepResults is a reference to a hash where the following keys are defined:
+	values1 has a value which is a reference to a list where each element is a float
+	values2 has a value which is a reference to a list where each element is a float
+	feasible has a value which is a reference to a list where each element is a reference to a list where each element is a bool
+	objectives has a value which is a reference to a list where each element is a reference to a list where each element is a float
+	compounds has a value which is a reference to a list where each element is a string
+	shadow_prices has a value which is a reference to a list where each element is a reference to a list where each element is a reference to a list where each element is a float
 
 
 =end text
@@ -9574,13 +9587,13 @@ subsystem_statistics is a reference to a hash where the following keys are defin
 
 =item Description
 
-Generate statistics with model and associated genome properties
+Run flux balance analysis over a grid of values of one or two bounds or constraints, such as a phenotypic phase plane
 
 =back
 
 =cut
 
-sub generate_model_stats
+sub fba_parameter_sweep
 {
     my $self = shift;
     my($input) = @_;
@@ -9588,27 +9601,24 @@ sub generate_model_stats
     my @_bad_arguments;
     (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument \"input\" (value was \"$input\")");
     if (@_bad_arguments) {
-	my $msg = "Invalid arguments passed to generate_model_stats:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	my $msg = "Invalid arguments passed to fba_parameter_sweep:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-							       method_name => 'generate_model_stats');
+							       method_name => 'fba_parameter_sweep');
     }
 
     my $ctx = $Bio::KBase::fbaModelServices::Server::CallContext;
     my($output);
-    #BEGIN generate_model_stats
-	$input = $self->_setContext($ctx,$input,{
-    	model => {type => "KBaseFBA.FBAModel",ws => "model_workspace"}
-	},["model"],{model_workspace => $input->{workspace}});
-    my $model = $input->{model};
-    $output = $model->compute_model_stats();
-    $self->_clearContext();
-    #END generate_model_stats
+    #BEGIN fba_parameter_sweep
+    #fba_parameter_sweep runs on the in-process FBA engine of the python implementation
+    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => "_ERROR_fba_parameter_sweep is not supported by the perl implementation; call it on the python fbaModelServices server, with fba-engine=inprocess_ERROR_",
+							       method_name => 'fba_parameter_sweep');
+    #END fba_parameter_sweep
     my @_bad_returns;
     (ref($output) eq 'HASH') or push(@_bad_returns, "Invalid type for return variable \"output\" (value was \"$output\")");
     if (@_bad_returns) {
-	my $msg = "Invalid returns passed to generate_model_stats:\n" . join("", map { "\t$_\n" } @_bad_returns);
+	my $msg = "Invalid returns passed to fba_parameter_sweep:\n" . join("", map { "\t$_\n" } @_bad_returns);
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-							       method_name => 'generate_model_stats');
+							       method_name => 'fba_parameter_sweep');
     }
     return($output);
 }
@@ -9616,9 +9626,9 @@ sub generate_model_stats
 
 
 
-=head2 minimize_reactions
+=head2 simulate_double_knockouts
 
-  $fbaMeta = $obj->minimize_reactions($input)
+  $output = $obj->simulate_double_knockouts($input)
 
 =over 4
 
@@ -9627,17 +9637,214 @@ sub generate_model_stats
 =begin html
 
 <pre>
-$input is a minimize_reactions_params
-$fbaMeta is an object_metadata
-minimize_reactions_params is a reference to a hash where the following keys are defined:
+$input is a simulate_double_knockouts_params
+$output is a DoubleKnockoutMatrix
+simulate_double_knockouts_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
-	workspace has a value which is a workspace_id
 	formulation has a value which is an FBAFormulation
-	reactions has a value which is a reference to a list where each element is a string
-	all_model_reactions has a value which is a bool
-	reaction_costs has a value which is a reference to a hash where the key is a string and the value is a float
-	output_id has a value which is a fba_id
+	genes has a value which is a reference to a list where each element is a feature_id
+	auth has a value which is a string
+fbamodel_id is a string
+workspace_id is a string
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+DoubleKnockoutMatrix is a reference to a hash where the following keys are defined:
+	genes has a value which is a reference to a list where each element is a feature_id
+	wildtype_growth has a value which is a float
+	single_growth has a value which is a reference to a list where each element is a float
+	interactions has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+	0: an int
+	1: an int
+	2: a float
+
+	solved has a value which is an int
+
+</pre>
+
+=end html
+
+=begin text
+
+$input is a simulate_double_knockouts_params
+$output is a DoubleKnockoutMatrix
+simulate_double_knockouts_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	genes has a value which is a reference to a list where each element is a feature_id
+	auth has a value which is a string
+fbamodel_id is a string
+workspace_id is a string
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+DoubleKnockoutMatrix is a reference to a hash where the following keys are defined:
+	genes has a value which is a reference to a list where each element is a feature_id
+	wildtype_growth has a value which is a float
+	single_growth has a value which is a reference to a list where each element is a float
+	interactions has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+	0: an int
+	1: an int
+	2: a float
+
+	solved has a value which is an int
+
+
+=end text
+
+
+
+=item Description
+
+Simulate the knockout of every pair of genes of a model, returning the pairs whose double knockout grows less than either single knockout
+
+=back
+
+=cut
+
+sub simulate_double_knockouts
+{
+    my $self = shift;
+    my($input) = @_;
+
+    my @_bad_arguments;
+    (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument \"input\" (value was \"$input\")");
+    if (@_bad_arguments) {
+	my $msg = "Invalid arguments passed to simulate_double_knockouts:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+							       method_name => 'simulate_double_knockouts');
+    }
+
+    my $ctx = $Bio::KBase::fbaModelServices::Server::CallContext;
+    my($output);
+    #BEGIN simulate_double_knockouts
+    #simulate_double_knockouts runs on the in-process FBA engine of the python implementation
+    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => "_ERROR_simulate_double_knockouts is not supported by the perl implementation; call it on the python fbaModelServices server, with fba-engine=inprocess_ERROR_",
+							       method_name => 'simulate_double_knockouts');
+    #END simulate_double_knockouts
+    my @_bad_returns;
+    (ref($output) eq 'HASH') or push(@_bad_returns, "Invalid type for return variable \"output\" (value was \"$output\")");
+    if (@_bad_returns) {
+	my $msg = "Invalid returns passed to simulate_double_knockouts:\n" . join("", map { "\t$_\n" } @_bad_returns);
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+							       method_name => 'simulate_double_knockouts');
+    }
+    return($output);
+}
+
+
+
+
+=head2 quantitative_optimization
+
+  $output = $obj->quantitative_optimization($input)
+
+=over 4
+
+=item Parameter and return types
+
+=begin html
+
+<pre>
+$input is a quantitative_optimization_params
+$output is an object_metadata
+quantitative_optimization_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	outputid has a value which is a fbamodel_id
+	workspace has a value which is a workspace_id
+	biomass has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
@@ -9687,7 +9894,6 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
-fba_id is a string
 object_metadata is a reference to a list containing 11 items:
 	0: (id) an object_id
 	1: (type) an object_type
@@ -9712,17 +9918,15 @@ workspace_ref is a string
 
 =begin text
 
-$input is a minimize_reactions_params
-$fbaMeta is an object_metadata
-minimize_reactions_params is a reference to a hash where the following keys are defined:
+$input is a quantitative_optimization_params
+$output is an object_metadata
+quantitative_optimization_params is a reference to a hash where the following keys are defined:
 	model has a value which is a fbamodel_id
 	model_workspace has a value which is a workspace_id
-	workspace has a value which is a workspace_id
 	formulation has a value which is an FBAFormulation
-	reactions has a value which is a reference to a list where each element is a string
-	all_model_reactions has a value which is a bool
-	reaction_costs has a value which is a reference to a hash where the key is a string and the value is a float
-	output_id has a value which is a fba_id
+	outputid has a value which is a fbamodel_id
+	workspace has a value which is a workspace_id
+	biomass has a value which is a string
 fbamodel_id is a string
 workspace_id is a string
 FBAFormulation is a reference to a hash where the following keys are defined:
@@ -9772,7 +9976,6 @@ constraint is a reference to a list containing 4 items:
 	1: (sign) a string
 	2: (terms) a reference to a list where each element is a term
 	3: (name) a string
-fba_id is a string
 object_metadata is a reference to a list containing 11 items:
 	0: (id) an object_id
 	1: (type) an object_type
@@ -9798,13 +10001,13 @@ workspace_ref is a string
 
 =item Description
 
-Minimize the specified set of reactions while maintaining the FBA objective above a specified threshold
+Identify ways to adjust model to quantitatively match specified uptake, growth, and excretion constraints
 
 =back
 
 =cut
 
-sub minimize_reactions
+sub quantitative_optimization
 {
     my $self = shift;
     my($input) = @_;
@@ -9812,34 +10015,482 @@ sub minimize_reactions
     my @_bad_arguments;
     (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument \"input\" (value was \"$input\")");
     if (@_bad_arguments) {
-	my $msg = "Invalid arguments passed to minimize_reactions:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	my $msg = "Invalid arguments passed to quantitative_optimization:\n" . join("", map { "\t$_\n" } @_bad_arguments);
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-							       method_name => 'minimize_reactions');
+							       method_name => 'quantitative_optimization');
     }
 
     my $ctx = $Bio::KBase::fbaModelServices::Server::CallContext;
-    my($fbaMeta);
-    #BEGIN minimize_reactions
+    my($output);
+    #BEGIN quantitative_optimization
     $self->_setContext($ctx,$input);
-    $input = $self->_validateargs($input,["model","workspace"],{
+	$input = $self->_validateargs($input,["model","constraints","workspace"],{
 		model_workspace => $input->{workspace},
 		formulation => undef,
-		reactions => [],
-		all_model_reactions => 0,
-		reaction_costs => {},
-		output_id => undef,
+		outputid => undef,
 		biomass => undef,
-		timelimit => 86000,
-		solver => undef
-	});    
-	my $model = $self->_get_msobject("FBAModel",$input->{model_workspace},$input->{model});
-	if (!defined($input->{output_id})) {
-		$input->{output_id} = $self->_get_new_id($input->{model}.".fba.");
-	}
-	$input->{formulation} = $self->_setDefaultFBAFormulation($input->{formulation});
-	#Creating FBAFormulation Object
-	my $fba = $self->_buildFBAObject($input->{formulation},$model,$input->{workspace},$input->{fba});
-	$fba->minimize_reactions(1);
+		solver => undef,
+		timePerSolution => 3600,
+		totalTimeLimit => 3600,
+		integrate_solution => 0,
+		num_solutions => 1,
+		MaxBoundMult => 2,
+		MinFluxCoef => 0.000001,
+		ReactionCoef => 100,
+		DrainCoef => 10,
+		BiomassCoef => 0.1,
+		ATPSynthCoef => 1,
+		ATPMaintCoef => 1,
+		MinVariables => 3,
+		Resolution => 0.01
+	});
+	my $model = $self->_get_msobject("FBAModel",$input->{model_workspace},$input->{model});
+	if (!defined($input->{outputid})) {
+		$input->{outputid} = $self->_get_new_id($input->{model});
+	}
+	$input->{formulation} = $self->_setDefaultFBAFormulation($input->{formulation});
+	my $fba = $self->_buildFBAObject($input->{formulation},$model,$input->{workspace},$input->{outputid});
+	if (defined($input->{solver})) {
+	   	$fba->parameters()->{MFASolver} = uc($input->{solver});
+	}
+	if (defined($input->{biomass}) && defined($fba->biomassflux_objterms()->{bio1})) {
+		my $bio = $model->searchForBiomass($input->{biomass});
+		if (defined($bio)) {
+			delete $fba->biomassflux_objterms()->{bio1};
+			$fba->biomassflux_objterms()->{$bio->id()} = 1;
+		}			
+	}
+	$fba->RunQuantitativeOptimization({
+		ReactionCoef => $input->{ReactionCoef},
+		DrainCoef => $input->{DrainCoef},
+		BiomassCoef => $input->{BiomassCoef},
+		ATPSynthCoef => $input->{ATPSynthCoef},
+		ATPMaintCoef => $input->{ATPMaintCoef},
+		TimePerSolution => $input->{timePerSolution},
+		TotalTimeLimit => $input->{totalTimeLimit},
+		Num_solutions => $input->{num_solutions},
+		MaxBoundMult => $input->{MaxBoundMult},
+		MinFluxCoef => $input->{MinFluxCoef},
+		Constraints => $input->{constraints},
+		Resolution => $input->{Resolution},
+		MinVariables => $input->{MinVariables}
+	});
+	$self->_save_msobject($fba,"FBA",$input->{workspace},$fba->id(),{hidden => 1});
+	$model->AddQuantitativeOptimization($fba,$input->{integrate_solution});	
+    $output = $self->_save_msobject($model,"FBAModel",$input->{workspace},$input->{outputid});
+    $self->_clearContext();
+    #END quantitative_optimization
+    my @_bad_returns;
+    (ref($output) eq 'ARRAY') or push(@_bad_returns, "Invalid type for return variable \"output\" (value was \"$output\")");
+    if (@_bad_returns) {
+	my $msg = "Invalid returns passed to quantitative_optimization:\n" . join("", map { "\t$_\n" } @_bad_returns);
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+							       method_name => 'quantitative_optimization');
+    }
+    return($output);
+}
+
+
+
+
+=head2 generate_model_stats
+
+  $output = $obj->generate_model_stats($input)
+
+=over 4
+
+=item Parameter and return types
+
+=begin html
+
+<pre>
+$input is a generate_model_stats_params
+$output is a model_statistics
+generate_model_stats_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	minimal_media has a value which is a media_id
+	minimal_media_workspace has a value which is a workspace_id
+fbamodel_id is a string
+workspace_id is a string
+media_id is a string
+model_statistics is a reference to a hash where the following keys are defined:
+	total_reactions has a value which is an int
+	total_genes has a value which is an int
+	total_compounds has a value which is an int
+	extracellular_compounds has a value which is an int
+	intracellular_compounds has a value which is an int
+	transport_reactions has a value which is an int
+	subsystem_reactions has a value which is an int
+	subsystem_genes has a value which is an int
+	spontaneous_reactions has a value which is an int
+	reactions_with_genes has a value which is an int
+	gapfilled_reactions has a value which is an int
+	model_genes has a value which is an int
+	minimal_essential_genes has a value which is an int
+	complete_essential_genes has a value which is an int
+	minimal_essential_reactions has a value which is an int
+	complete_essential_reactions has a value which is an int
+	minimal_blocked_reactions has a value which is an int
+	complete_blocked_reactions has a value which is an int
+	minimal_variable_reactions has a value which is an int
+	complete_variable_reactions has a value which is an int
+	growth_complete_media has a value which is a bool
+	growth_minimal_media has a value which is a bool
+	subsystems has a value which is a reference to a list where each element is a subsystem_statistics
+bool is an int
+subsystem_statistics is a reference to a hash where the following keys are defined:
+	name has a value which is a string
+	class has a value which is a string
+	subclass has a value which is a string
+	genes has a value which is an int
+	reactions has a value which is an int
+	model_genes has a value which is an int
+	minimal_essential_genes has a value which is an int
+	complete_essential_genes has a value which is an int
+	minimal_essential_reactions has a value which is an int
+	complete_essential_reactions has a value which is an int
+	minimal_blocked_reactions has a value which is an int
+	complete_blocked_reactions has a value which is an int
+	minimal_variable_reactions has a value which is an int
+	complete_variable_reactions has a value which is an int
+
+</pre>
+
+=end html
+
+=begin text
+
+$input is a generate_model_stats_params
+$output is a model_statistics
+generate_model_stats_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	minimal_media has a value which is a media_id
+	minimal_media_workspace has a value which is a workspace_id
+fbamodel_id is a string
+workspace_id is a string
+media_id is a string
+model_statistics is a reference to a hash where the following keys are defined:
+	total_reactions has a value which is an int
+	total_genes has a value which is an int
+	total_compounds has a value which is an int
+	extracellular_compounds has a value which is an int
+	intracellular_compounds has a value which is an int
+	transport_reactions has a value which is an int
+	subsystem_reactions has a value which is an int
+	subsystem_genes has a value which is an int
+	spontaneous_reactions has a value which is an int
+	reactions_with_genes has a value which is an int
+	gapfilled_reactions has a value which is an int
+	model_genes has a value which is an int
+	minimal_essential_genes has a value which is an int
+	complete_essential_genes has a value which is an int
+	minimal_essential_reactions has a value which is an int
+	complete_essential_reactions has a value which is an int
+	minimal_blocked_reactions has a value which is an int
+	complete_blocked_reactions has a value which is an int
+	minimal_variable_reactions has a value which is an int
+	complete_variable_reactions has a value which is an int
+	growth_complete_media has a value which is a bool
+	growth_minimal_media has a value which is a bool
+	subsystems has a value which is a reference to a list where each element is a subsystem_statistics
+bool is an int
+subsystem_statistics is a reference to a hash where the following keys are defined:
+	name has a value which is a string
+	class has a value which is a string
+	subclass has a value which is a string
+	genes has a value which is an int
+	reactions has a value which is an int
+	model_genes has a value which is an int
+	minimal_essential_genes has a value which is an int
+	complete_essential_genes has a value which is an int
+	minimal_essential_reactions has a value which is an int
+	complete_essential_reactions has a value which is an int
+	minimal_blocked_reactions has a value which is an int
+	complete_blocked_reactions has a value which is an int
+	minimal_variable_reactions has a value which is an int
+	complete_variable_reactions has a value which is an int
+
+
+=end text
+
+
+
+=item Description
+
+Generate statistics with model and associated genome properties
+
+=back
+
+=cut
+
+sub generate_model_stats
+{
+    my $self = shift;
+    my($input) = @_;
+
+    my @_bad_arguments;
+    (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument \"input\" (value was \"$input\")");
+    if (@_bad_arguments) {
+	my $msg = "Invalid arguments passed to generate_model_stats:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+							       method_name => 'generate_model_stats');
+    }
+
+    my $ctx = $Bio::KBase::fbaModelServices::Server::CallContext;
+    my($output);
+    #BEGIN generate_model_stats
+	$input = $self->_setContext($ctx,$input,{
+    	model => {type => "KBaseFBA.FBAModel",ws => "model_workspace"}
+	},["model"],{
+		model_workspace => $input->{workspace},
+		minimal_media => "Carbon-D-Glucose",
+		minimal_media_workspace => "KBaseMedia"
+	});
+    my $model = $input->{model};
+    $output = $model->compute_model_stats({
+    	minimal_media => $input->{minimal_media_workspace}."/".$input->{minimal_media}
+    });
+    $self->_clearContext();
+    #END generate_model_stats
+    my @_bad_returns;
+    (ref($output) eq 'HASH') or push(@_bad_returns, "Invalid type for return variable \"output\" (value was \"$output\")");
+    if (@_bad_returns) {
+	my $msg = "Invalid returns passed to generate_model_stats:\n" . join("", map { "\t$_\n" } @_bad_returns);
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+							       method_name => 'generate_model_stats');
+    }
+    return($output);
+}
+
+
+
+
+=head2 minimize_reactions
+
+  $fbaMeta = $obj->minimize_reactions($input)
+
+=over 4
+
+=item Parameter and return types
+
+=begin html
+
+<pre>
+$input is a minimize_reactions_params
+$fbaMeta is an object_metadata
+minimize_reactions_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	reactions has a value which is a reference to a list where each element is a string
+	all_model_reactions has a value which is a bool
+	reaction_costs has a value which is a reference to a hash where the key is a string and the value is a float
+	output_id has a value which is a fba_id
+fbamodel_id is a string
+workspace_id is a string
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+fba_id is a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
+
+</pre>
+
+=end html
+
+=begin text
+
+$input is a minimize_reactions_params
+$fbaMeta is an object_metadata
+minimize_reactions_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	workspace has a value which is a workspace_id
+	formulation has a value which is an FBAFormulation
+	reactions has a value which is a reference to a list where each element is a string
+	all_model_reactions has a value which is a bool
+	reaction_costs has a value which is a reference to a hash where the key is a string and the value is a float
+	output_id has a value which is a fba_id
+fbamodel_id is a string
+workspace_id is a string
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+fba_id is a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
+
+
+=end text
+
+
+
+=item Description
+
+Minimize the specified set of reactions while maintaining the FBA objective above a specified threshold
+
+=back
+
+=cut
+
+sub minimize_reactions
+{
+    my $self = shift;
+    my($input) = @_;
+
+    my @_bad_arguments;
+    (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument \"input\" (value was \"$input\")");
+    if (@_bad_arguments) {
+	my $msg = "Invalid arguments passed to minimize_reactions:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+							       method_name => 'minimize_reactions');
+    }
+
+    my $ctx = $Bio::KBase::fbaModelServices::Server::CallContext;
+    my($fbaMeta);
+    #BEGIN minimize_reactions
+    $self->_setContext($ctx,$input);
+    $input = $self->_validateargs($input,["model","workspace"],{
+		model_workspace => $input->{workspace},
+		formulation => undef,
+		reactions => [],
+		all_model_reactions => 0,
+		reaction_costs => {},
+		output_id => undef,
+		biomass => undef,
+		timelimit => 86000,
+		solver => undef
+	});    
+	my $model = $self->_get_msobject("FBAModel",$input->{model_workspace},$input->{model});
+	if (!defined($input->{output_id})) {
+		$input->{output_id} = $self->_get_new_id($input->{model}.".fba.");
+	}
+	$input->{formulation} = $self->_setDefaultFBAFormulation($input->{formulation});
+	#Creating FBAFormulation Object
+	my $fba = $self->_buildFBAObject($input->{formulation},$model,$input->{workspace},$input->{fba});
+	$fba->minimize_reactions(1);
 	if (@{$input->{reactions}} == 0 || $input->{all_model_reactions} == 1) {
 		my $mdlrxns = $model->modelreactions();
 		for (my $i=0; $i < @{$mdlrxns}; $i++) {
@@ -13756,13 +14407,344 @@ sub queue_combine_wildtype_phenotype_reconciliation
 	$self->_clearContext();
     #END queue_combine_wildtype_phenotype_reconciliation
     my @_bad_returns;
-    (ref($job) eq 'HASH') or push(@_bad_returns, "Invalid type for return variable \"job\" (value was \"$job\")");
+    (ref($job) eq 'HASH') or push(@_bad_returns, "Invalid type for return variable \"job\" (value was \"$job\")");
+    if (@_bad_returns) {
+	my $msg = "Invalid returns passed to queue_combine_wildtype_phenotype_reconciliation:\n" . join("", map { "\t$_\n" } @_bad_returns);
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+							       method_name => 'queue_combine_wildtype_phenotype_reconciliation');
+    }
+    return($job);
+}
+
+
+
+
+=head2 reconcile_phenotypes
+
+  $output = $obj->reconcile_phenotypes($input)
+
+=over 4
+
+=item Parameter and return types
+
+=begin html
+
+<pre>
+$input is a reconcile_phenotypes_params
+$output is a PhenotypeReconciliation
+reconcile_phenotypes_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	fba_formulation has a value which is an FBAFormulation
+	gapfill_formulation has a value which is a GapfillingFormulation
+	gapgen_formulation has a value which is a GapgenFormulation
+	phenotypeSet has a value which is a phenotype_set_id
+	phenotypeSet_workspace has a value which is a workspace_id
+	out_model has a value which is a fbamodel_id
+	workspace has a value which is a workspace_id
+	gapFills has a value which is a reference to a list where each element is a gapfill_id
+	gapGens has a value which is a reference to a list where each element is a gapgen_id
+	sensitivity_analysis has a value which is a bool
+	combine_solutions has a value which is a bool
+	auth has a value which is a string
+	overwrite has a value which is a bool
+fbamodel_id is a string
+workspace_id is a string
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+GapfillingFormulation is a reference to a hash where the following keys are defined:
+	formulation has a value which is an FBAFormulation
+	num_solutions has a value which is an int
+	nomediahyp has a value which is a bool
+	nobiomasshyp has a value which is a bool
+	nogprhyp has a value which is a bool
+	nopathwayhyp has a value which is a bool
+	allowunbalanced has a value which is a bool
+	activitybonus has a value which is a float
+	drainpen has a value which is a float
+	directionpen has a value which is a float
+	nostructpen has a value which is a float
+	unfavorablepen has a value which is a float
+	nodeltagpen has a value which is a float
+	biomasstranspen has a value which is a float
+	singletranspen has a value which is a float
+	transpen has a value which is a float
+	blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
+	gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
+	allowedcmps has a value which is a reference to a list where each element is a compartment_id
+	probabilisticAnnotation has a value which is a probanno_id
+	probabilisticAnnotation_workspace has a value which is a workspace_id
+compartment_id is a string
+probanno_id is a string
+GapgenFormulation is a reference to a hash where the following keys are defined:
+	formulation has a value which is an FBAFormulation
+	refmedia has a value which is a media_id
+	refmedia_workspace has a value which is a workspace_id
+	num_solutions has a value which is an int
+	nomediahyp has a value which is a bool
+	nobiomasshyp has a value which is a bool
+	nogprhyp has a value which is a bool
+	nopathwayhyp has a value which is a bool
+phenotype_set_id is a string
+gapfill_id is a string
+gapgen_id is a string
+PhenotypeReconciliation is a reference to a hash where the following keys are defined:
+	phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+	gapfills has a value which is a reference to a list where each element is a fba_id
+	gapgens has a value which is a reference to a list where each element is a gapgen_id
+	sensitivity has a value which is a reference to a hash where the key is a string and the value is a reference to a list containing 2 items:
+	0: a reference to a list where each element is a string
+	1: a reference to a list where each element is a string
+
+	combined_solutions has a value which is a reference to a list where each element is a string
+	reconciled_phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+	reconciled_model has a value which is an object_metadata
+	checkpoint has a value which is a string
+fba_id is a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
+
+</pre>
+
+=end html
+
+=begin text
+
+$input is a reconcile_phenotypes_params
+$output is a PhenotypeReconciliation
+reconcile_phenotypes_params is a reference to a hash where the following keys are defined:
+	model has a value which is a fbamodel_id
+	model_workspace has a value which is a workspace_id
+	fba_formulation has a value which is an FBAFormulation
+	gapfill_formulation has a value which is a GapfillingFormulation
+	gapgen_formulation has a value which is a GapgenFormulation
+	phenotypeSet has a value which is a phenotype_set_id
+	phenotypeSet_workspace has a value which is a workspace_id
+	out_model has a value which is a fbamodel_id
+	workspace has a value which is a workspace_id
+	gapFills has a value which is a reference to a list where each element is a gapfill_id
+	gapGens has a value which is a reference to a list where each element is a gapgen_id
+	sensitivity_analysis has a value which is a bool
+	combine_solutions has a value which is a bool
+	auth has a value which is a string
+	overwrite has a value which is a bool
+fbamodel_id is a string
+workspace_id is a string
+FBAFormulation is a reference to a hash where the following keys are defined:
+	media has a value which is a media_id
+	additionalcpds has a value which is a reference to a list where each element is a compound_id
+	promconstraint has a value which is a promconstraint_id
+	promconstraint_workspace has a value which is a workspace_id
+	eflux_sample has a value which is a sample_id
+	eflux_series has a value which is a series_id
+	eflux_workspace has a value which is a workspace_id
+	media_workspace has a value which is a workspace_id
+	objfraction has a value which is a float
+	allreversible has a value which is a bool
+	maximizeObjective has a value which is a bool
+	objectiveTerms has a value which is a reference to a list where each element is a term
+	geneko has a value which is a reference to a list where each element is a feature_id
+	rxnko has a value which is a reference to a list where each element is a reaction_id
+	bounds has a value which is a reference to a list where each element is a bound
+	constraints has a value which is a reference to a list where each element is a constraint
+	uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+	defaultmaxflux has a value which is a float
+	defaultminuptake has a value which is a float
+	defaultmaxuptake has a value which is a float
+	simplethermoconst has a value which is a bool
+	thermoconst has a value which is a bool
+	nothermoerror has a value which is a bool
+	minthermoerror has a value which is a bool
+media_id is a string
+compound_id is a string
+promconstraint_id is a string
+sample_id is a string
+series_id is a string
+bool is an int
+term is a reference to a list containing 3 items:
+	0: (coefficient) a float
+	1: (varType) a string
+	2: (variable) a string
+feature_id is a string
+reaction_id is a string
+bound is a reference to a list containing 4 items:
+	0: (min) a float
+	1: (max) a float
+	2: (varType) a string
+	3: (variable) a string
+constraint is a reference to a list containing 4 items:
+	0: (rhs) a float
+	1: (sign) a string
+	2: (terms) a reference to a list where each element is a term
+	3: (name) a string
+GapfillingFormulation is a reference to a hash where the following keys are defined:
+	formulation has a value which is an FBAFormulation
+	num_solutions has a value which is an int
+	nomediahyp has a value which is a bool
+	nobiomasshyp has a value which is a bool
+	nogprhyp has a value which is a bool
+	nopathwayhyp has a value which is a bool
+	allowunbalanced has a value which is a bool
+	activitybonus has a value which is a float
+	drainpen has a value which is a float
+	directionpen has a value which is a float
+	nostructpen has a value which is a float
+	unfavorablepen has a value which is a float
+	nodeltagpen has a value which is a float
+	biomasstranspen has a value which is a float
+	singletranspen has a value which is a float
+	transpen has a value which is a float
+	blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
+	gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
+	allowedcmps has a value which is a reference to a list where each element is a compartment_id
+	probabilisticAnnotation has a value which is a probanno_id
+	probabilisticAnnotation_workspace has a value which is a workspace_id
+compartment_id is a string
+probanno_id is a string
+GapgenFormulation is a reference to a hash where the following keys are defined:
+	formulation has a value which is an FBAFormulation
+	refmedia has a value which is a media_id
+	refmedia_workspace has a value which is a workspace_id
+	num_solutions has a value which is an int
+	nomediahyp has a value which is a bool
+	nobiomasshyp has a value which is a bool
+	nogprhyp has a value which is a bool
+	nopathwayhyp has a value which is a bool
+phenotype_set_id is a string
+gapfill_id is a string
+gapgen_id is a string
+PhenotypeReconciliation is a reference to a hash where the following keys are defined:
+	phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+	gapfills has a value which is a reference to a list where each element is a fba_id
+	gapgens has a value which is a reference to a list where each element is a gapgen_id
+	sensitivity has a value which is a reference to a hash where the key is a string and the value is a reference to a list containing 2 items:
+	0: a reference to a list where each element is a string
+	1: a reference to a list where each element is a string
+
+	combined_solutions has a value which is a reference to a list where each element is a string
+	reconciled_phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+	reconciled_model has a value which is an object_metadata
+	checkpoint has a value which is a string
+fba_id is a string
+object_metadata is a reference to a list containing 11 items:
+	0: (id) an object_id
+	1: (type) an object_type
+	2: (moddate) a timestamp
+	3: (instance) an int
+	4: (command) a string
+	5: (lastmodifier) a username
+	6: (owner) a username
+	7: (workspace) a workspace_id
+	8: (ref) a workspace_ref
+	9: (chsum) a string
+	10: (metadata) a reference to a hash where the key is a string and the value is a string
+object_id is a string
+object_type is a string
+timestamp is a string
+username is a string
+workspace_ref is a string
+
+
+=end text
+
+
+
+=item Description
+
+Reconciles an FBAModel with a PhenotypeSet in one call, gapfilling each false negative and gap generating each false positive, and optionally simulating the phenotype set with each solution and integrating the best combination of them
+
+=back
+
+=cut
+
+sub reconcile_phenotypes
+{
+    my $self = shift;
+    my($input) = @_;
+
+    my @_bad_arguments;
+    (ref($input) eq 'HASH') or push(@_bad_arguments, "Invalid type for argument \"input\" (value was \"$input\")");
+    if (@_bad_arguments) {
+	my $msg = "Invalid arguments passed to reconcile_phenotypes:\n" . join("", map { "\t$_\n" } @_bad_arguments);
+	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
+							       method_name => 'reconcile_phenotypes');
+    }
+
+    my $ctx = $Bio::KBase::fbaModelServices::Server::CallContext;
+    my($output);
+    #BEGIN reconcile_phenotypes
+    #reconcile_phenotypes runs on the in-process FBA engine of the python implementation
+    Bio::KBase::Exceptions::ArgumentValidationError->throw(error => "_ERROR_reconcile_phenotypes is not supported by the perl implementation; call it on the python fbaModelServices server, with fba-engine=inprocess_ERROR_",
+							       method_name => 'reconcile_phenotypes');
+    #END reconcile_phenotypes
+    my @_bad_returns;
+    (ref($output) eq 'HASH') or push(@_bad_returns, "Invalid type for return variable \"output\" (value was \"$output\")");
     if (@_bad_returns) {
-	my $msg = "Invalid returns passed to queue_combine_wildtype_phenotype_reconciliation:\n" . join("", map { "\t$_\n" } @_bad_returns);
+	my $msg = "Invalid returns passed to reconcile_phenotypes:\n" . join("", map { "\t$_\n" } @_bad_returns);
 	Bio::KBase::Exceptions::ArgumentValidationError->throw(error => $msg,
-							       method_name => 'queue_combine_wildtype_phenotype_reconciliation');
+							       method_name => 'reconcile_phenotypes');
     }
-    return($job);
+    return($output);
 }
 
 
@@ -24342,15 +25324,235 @@ a "location" refers to a sequence of regions
 
 =begin html
 
-<pre>
-a reference to a list where each element is a region_of_dna
+<pre>
+a reference to a list where each element is a region_of_dna
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a list where each element is a region_of_dna
+
+=end text
+
+=back
+
+
+
+=head2 annotation
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a list containing 3 items:
+0: (comment) a string
+1: (annotator) a string
+2: (annotation_time) an int
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a list containing 3 items:
+0: (comment) a string
+1: (annotator) a string
+2: (annotation_time) an int
+
+
+=end text
+
+=back
+
+
+
+=head2 gene_hit
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a list containing 2 items:
+0: (gene) a feature_id
+1: (blast_score) a float
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a list containing 2 items:
+0: (gene) a feature_id
+1: (blast_score) a float
+
+
+=end text
+
+=back
+
+
+
+=head2 alt_func
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a list containing 3 items:
+0: (function) a string
+1: (probability) a float
+2: (gene_hits) a reference to a list where each element is a gene_hit
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a list containing 3 items:
+0: (function) a string
+1: (probability) a float
+2: (gene_hits) a reference to a list where each element is a gene_hit
+
+
+=end text
+
+=back
+
+
+
+=head2 feature
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a hash where the following keys are defined:
+id has a value which is a feature_id
+location has a value which is a location
+type has a value which is a feature_type
+function has a value which is a string
+alternative_functions has a value which is a reference to a list where each element is an alt_func
+protein_translation has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
+annotations has a value which is a reference to a list where each element is an annotation
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a hash where the following keys are defined:
+id has a value which is a feature_id
+location has a value which is a location
+type has a value which is a feature_type
+function has a value which is a string
+alternative_functions has a value which is a reference to a list where each element is an alt_func
+protein_translation has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
+annotations has a value which is a reference to a list where each element is an annotation
+
+
+=end text
+
+=back
+
+
+
+=head2 contig
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a hash where the following keys are defined:
+id has a value which is a contig_id
+dna has a value which is a string
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a hash where the following keys are defined:
+id has a value which is a contig_id
+dna has a value which is a string
+
+
+=end text
+
+=back
+
+
+
+=head2 GenomeObject
+
+=over 4
+
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a hash where the following keys are defined:
+id has a value which is a genome_id
+scientific_name has a value which is a string
+domain has a value which is a string
+genetic_code has a value which is an int
+source has a value which is a string
+source_id has a value which is a string
+contigs has a value which is a reference to a list where each element is a contig
+features has a value which is a reference to a list where each element is a feature
+
 </pre>
 
 =end html
 
 =begin text
 
-a reference to a list where each element is a region_of_dna
+a reference to a hash where the following keys are defined:
+id has a value which is a genome_id
+scientific_name has a value which is a string
+domain has a value which is a string
+genetic_code has a value which is an int
+source has a value which is a string
+source_id has a value which is a string
+contigs has a value which is a reference to a list where each element is a contig
+features has a value which is a reference to a list where each element is a feature
+
 
 =end text
 
@@ -24358,21 +25560,30 @@ a reference to a list where each element is a region_of_dna
 
 
 
-=head2 annotation
+=head2 annotationProbability
 
 =over 4
 
 
 
+=item Description
+
+Data structures to hold a single annotation probability for a single gene
+
+feature_id feature - feature the annotation is associated with
+string function - the name of the functional role being annotated to the feature
+float probability - the probability that the functional role is associated with the feature
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a list containing 3 items:
-0: (comment) a string
-1: (annotator) a string
-2: (annotation_time) an int
+0: (feature) a feature_id
+1: (function) a string
+2: (probability) a float
 
 </pre>
 
@@ -24381,9 +25592,9 @@ a reference to a list containing 3 items:
 =begin text
 
 a reference to a list containing 3 items:
-0: (comment) a string
-1: (annotator) a string
-2: (annotation_time) an int
+0: (feature) a feature_id
+1: (function) a string
+2: (probability) a float
 
 
 =end text
@@ -24392,7 +25603,7 @@ a reference to a list containing 3 items:
 
 
 
-=head2 gene_hit
+=head2 probanno_id
 
 =over 4
 
@@ -24403,20 +25614,14 @@ a reference to a list containing 3 items:
 =begin html
 
 <pre>
-a reference to a list containing 2 items:
-0: (gene) a feature_id
-1: (blast_score) a float
-
+a string
 </pre>
 
 =end html
 
 =begin text
 
-a reference to a list containing 2 items:
-0: (gene) a feature_id
-1: (blast_score) a float
-
+a string
 
 =end text
 
@@ -24435,10 +25640,9 @@ a reference to a list containing 2 items:
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
+a reference to a list containing 2 items:
 0: (function) a string
 1: (probability) a float
-2: (gene_hits) a reference to a list where each element is a gene_hit
 
 </pre>
 
@@ -24446,10 +25650,9 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
+a reference to a list containing 2 items:
 0: (function) a string
 1: (probability) a float
-2: (gene_hits) a reference to a list where each element is a gene_hit
 
 
 =end text
@@ -24458,12 +25661,26 @@ a reference to a list containing 3 items:
 
 
 
-=head2 feature
+=head2 ProbAnnoFeature
 
 =over 4
 
 
 
+=item Description
+
+Object to carry alternative functions for each feature
+    
+feature_id id
+ID of the feature. Required.
+    
+string function
+Primary annotated function of the feature in the genome annotation. Required.
+    
+list<alt_func> alternative_functions
+List of tuples containing alternative functions and probabilities. Required.
+
+
 =item Definition
 
 =begin html
@@ -24471,13 +25688,7 @@ a reference to a list containing 3 items:
 <pre>
 a reference to a hash where the following keys are defined:
 id has a value which is a feature_id
-location has a value which is a location
-type has a value which is a feature_type
-function has a value which is a string
 alternative_functions has a value which is a reference to a list where each element is an alt_func
-protein_translation has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
-annotations has a value which is a reference to a list where each element is an annotation
 
 </pre>
 
@@ -24487,13 +25698,7 @@ annotations has a value which is a reference to a list where each element is an
 
 a reference to a hash where the following keys are defined:
 id has a value which is a feature_id
-location has a value which is a location
-type has a value which is a feature_type
-function has a value which is a string
 alternative_functions has a value which is a reference to a list where each element is an alt_func
-protein_translation has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
-annotations has a value which is a reference to a list where each element is an annotation
 
 
 =end text
@@ -24502,20 +25707,32 @@ annotations has a value which is a reference to a list where each element is an
 
 
 
-=head2 contig
+=head2 ProbabilisticAnnotation
 
 =over 4
 
 
 
+=item Description
+
+Object to carry alternative functions and probabilities for genes in a genome
+
+    probanno_id id - ID of the probabilistic annotation object. Required.    
+    genome_id genome - ID of the genome the probabilistic annotation was built for. Required.
+    workspace_ref genome_uuid - Reference to retrieve genome from workspace service. Required.
+    list<ProbAnnoFeature> featureAlternativeFunctions - List of ProbAnnoFeature objects holding alternative functions for features. Required.
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a contig_id
-dna has a value which is a string
+id has a value which is a probanno_id
+genome has a value which is a genome_id
+genome_uuid has a value which is a workspace_ref
+featureAlternativeFunctions has a value which is a reference to a list where each element is a ProbAnnoFeature
 
 </pre>
 
@@ -24524,8 +25741,10 @@ dna has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a contig_id
-dna has a value which is a string
+id has a value which is a probanno_id
+genome has a value which is a genome_id
+genome_uuid has a value which is a workspace_ref
+featureAlternativeFunctions has a value which is a reference to a list where each element is a ProbAnnoFeature
 
 
 =end text
@@ -24534,26 +25753,30 @@ dna has a value which is a string
 
 
 
-=head2 GenomeObject
+=head2 ReactionProbability
 
 =over 4
 
 
 
+=item Description
+
+Data structure to hold probability of a reaction
+
+        reaction_id reaction - ID of the reaction
+        float probability - Probability of the reaction
+        string gene_list - List of genes most likely to be attached to reaction
+
+
 =item Definition
 
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a genome_id
-scientific_name has a value which is a string
-domain has a value which is a string
-genetic_code has a value which is an int
-source has a value which is a string
-source_id has a value which is a string
-contigs has a value which is a reference to a list where each element is a contig
-features has a value which is a reference to a list where each element is a feature
+a reference to a list containing 3 items:
+0: (reaction) a reaction_id
+1: (probability) a float
+2: (gene_list) a string
 
 </pre>
 
@@ -24561,15 +25784,10 @@ features has a value which is a reference to a list where each element is a feat
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a genome_id
-scientific_name has a value which is a string
-domain has a value which is a string
-genetic_code has a value which is an int
-source has a value which is a string
-source_id has a value which is a string
-contigs has a value which is a reference to a list where each element is a contig
-features has a value which is a reference to a list where each element is a feature
+a reference to a list containing 3 items:
+0: (reaction) a reaction_id
+1: (probability) a float
+2: (gene_list) a string
 
 
 =end text
@@ -24578,7 +25796,7 @@ features has a value which is a reference to a list where each element is a feat
 
 
 
-=head2 annotationProbability
+=head2 Biochemistry
 
 =over 4
 
@@ -24586,11 +25804,9 @@ features has a value which is a reference to a list where each element is a feat
 
 =item Description
 
-Data structures to hold a single annotation probability for a single gene
-
-feature_id feature - feature the annotation is associated with
-string function - the name of the functional role being annotated to the feature
-float probability - the probability that the functional role is associated with the feature
+********************************************************************************
+    Biochemistry type definition
+   	********************************************************************************
 
 
 =item Definition
@@ -24598,10 +25814,12 @@ float probability - the probability that the functional role is associated with
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
-0: (feature) a feature_id
-1: (function) a string
-2: (probability) a float
+a reference to a hash where the following keys are defined:
+id has a value which is a biochemistry_id
+name has a value which is a string
+compounds has a value which is a reference to a list where each element is a compound_id
+reactions has a value which is a reference to a list where each element is a reaction_id
+media has a value which is a reference to a list where each element is a media_id
 
 </pre>
 
@@ -24609,10 +25827,12 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
-0: (feature) a feature_id
-1: (function) a string
-2: (probability) a float
+a reference to a hash where the following keys are defined:
+id has a value which is a biochemistry_id
+name has a value which is a string
+compounds has a value which is a reference to a list where each element is a compound_id
+reactions has a value which is a reference to a list where each element is a reaction_id
+media has a value which is a reference to a list where each element is a media_id
 
 
 =end text
@@ -24621,25 +25841,48 @@ a reference to a list containing 3 items:
 
 
 
-=head2 probanno_id
+=head2 MediaCompound
 
 =over 4
 
 
 
+=item Description
+
+Data structures for media compound formulation
+
+compound_id compound - ID of compound in media
+string name - name of compound in media
+float concentration - concentration of compound in media
+float maxFlux - maximum flux of compound in media
+float minFlux - minimum flux of compound in media
+
+
 =item Definition
 
 =begin html
 
 <pre>
-a string
+a reference to a hash where the following keys are defined:
+compound has a value which is a compound_id
+name has a value which is a string
+concentration has a value which is a float
+max_flux has a value which is a float
+min_flux has a value which is a float
+
 </pre>
 
 =end html
 
 =begin text
 
-a string
+a reference to a hash where the following keys are defined:
+compound has a value which is a compound_id
+name has a value which is a string
+concentration has a value which is a float
+max_flux has a value which is a float
+min_flux has a value which is a float
+
 
 =end text
 
@@ -24647,20 +25890,34 @@ a string
 
 
 
-=head2 alt_func
+=head2 Media
 
 =over 4
 
 
 
+=item Description
+
+Data structures for media formulation
+
+media_id id - ID of media formulation
+string name - name of media formulaiton
+list<MediaCompound> media_compounds - list of compounds in media formulation
+float pH - pH of media condition
+float temperature - temperature of media condition
+
+
 =item Definition
 
 =begin html
 
 <pre>
-a reference to a list containing 2 items:
-0: (function) a string
-1: (probability) a float
+a reference to a hash where the following keys are defined:
+id has a value which is a media_id
+name has a value which is a string
+media_compounds has a value which is a reference to a list where each element is a MediaCompound
+pH has a value which is a float
+temperature has a value which is a float
 
 </pre>
 
@@ -24668,9 +25925,12 @@ a reference to a list containing 2 items:
 
 =begin text
 
-a reference to a list containing 2 items:
-0: (function) a string
-1: (probability) a float
+a reference to a hash where the following keys are defined:
+id has a value which is a media_id
+name has a value which is a string
+media_compounds has a value which is a reference to a list where each element is a MediaCompound
+pH has a value which is a float
+temperature has a value which is a float
 
 
 =end text
@@ -24679,7 +25939,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 ProbAnnoFeature
+=head2 Compound
 
 =over 4
 
@@ -24687,16 +25947,16 @@ a reference to a list containing 2 items:
 
 =item Description
 
-Object to carry alternative functions for each feature
-    
-feature_id id
-ID of the feature. Required.
-    
-string function
-Primary annotated function of the feature in the genome annotation. Required.
-    
-list<alt_func> alternative_functions
-List of tuples containing alternative functions and probabilities. Required.
+Data structures for media formulation
+
+compound_id id - ID of compound
+string abbrev - abbreviated name of compound
+string name - primary name of compound
+list<string> aliases - list of aliases for compound
+float charge - molecular charge of compound
+float deltaG - estimated compound delta G
+float deltaGErr - uncertainty in estimated compound delta G
+string formula - molecular formula of compound
 
 
 =item Definition
@@ -24705,8 +25965,14 @@ List of tuples containing alternative functions and probabilities. Required.
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a feature_id
-alternative_functions has a value which is a reference to a list where each element is an alt_func
+id has a value which is a compound_id
+abbrev has a value which is a string
+name has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
+charge has a value which is a float
+deltaG has a value which is a float
+deltaGErr has a value which is a float
+formula has a value which is a string
 
 </pre>
 
@@ -24715,8 +25981,14 @@ alternative_functions has a value which is a reference to a list where each elem
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a feature_id
-alternative_functions has a value which is a reference to a list where each element is an alt_func
+id has a value which is a compound_id
+abbrev has a value which is a string
+name has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
+charge has a value which is a float
+deltaG has a value which is a float
+deltaGErr has a value which is a float
+formula has a value which is a string
 
 
 =end text
@@ -24725,7 +25997,7 @@ alternative_functions has a value which is a reference to a list where each elem
 
 
 
-=head2 ProbabilisticAnnotation
+=head2 Reaction
 
 =over 4
 
@@ -24733,12 +26005,18 @@ alternative_functions has a value which is a reference to a list where each elem
 
 =item Description
 
-Object to carry alternative functions and probabilities for genes in a genome
+Data structures for media formulation
 
-    probanno_id id - ID of the probabilistic annotation object. Required.    
-    genome_id genome - ID of the genome the probabilistic annotation was built for. Required.
-    workspace_ref genome_uuid - Reference to retrieve genome from workspace service. Required.
-    list<ProbAnnoFeature> featureAlternativeFunctions - List of ProbAnnoFeature objects holding alternative functions for features. Required.
+reaction_id id - ID of reaction
+string name - primary name of reaction
+string abbrev - abbreviated name of reaction
+list<string> enzymes - list of EC numbers for reaction
+string direction - directionality of reaction
+string reversibility - reversibility of reaction
+float deltaG - estimated delta G of reaction
+float deltaGErr - uncertainty in estimated delta G of reaction
+string equation - reaction equation in terms of compound IDs
+string definition - reaction equation in terms of compound names
 
 
 =item Definition
@@ -24747,10 +26025,16 @@ Object to carry alternative functions and probabilities for genes in a genome
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a probanno_id
-genome has a value which is a genome_id
-genome_uuid has a value which is a workspace_ref
-featureAlternativeFunctions has a value which is a reference to a list where each element is a ProbAnnoFeature
+id has a value which is a reaction_id
+name has a value which is a string
+abbrev has a value which is a string
+enzymes has a value which is a reference to a list where each element is a string
+direction has a value which is a string
+reversibility has a value which is a string
+deltaG has a value which is a float
+deltaGErr has a value which is a float
+equation has a value which is a string
+definition has a value which is a string
 
 </pre>
 
@@ -24759,10 +26043,16 @@ featureAlternativeFunctions has a value which is a reference to a list where eac
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a probanno_id
-genome has a value which is a genome_id
-genome_uuid has a value which is a workspace_ref
-featureAlternativeFunctions has a value which is a reference to a list where each element is a ProbAnnoFeature
+id has a value which is a reaction_id
+name has a value which is a string
+abbrev has a value which is a string
+enzymes has a value which is a reference to a list where each element is a string
+direction has a value which is a string
+reversibility has a value which is a string
+deltaG has a value which is a float
+deltaGErr has a value which is a float
+equation has a value which is a string
+definition has a value which is a string
 
 
 =end text
@@ -24771,7 +26061,7 @@ featureAlternativeFunctions has a value which is a reference to a list where eac
 
 
 
-=head2 ReactionProbability
+=head2 ModelCompartment
 
 =over 4
 
@@ -24779,11 +26069,9 @@ featureAlternativeFunctions has a value which is a reference to a list where eac
 
 =item Description
 
-Data structure to hold probability of a reaction
-
-        reaction_id reaction - ID of the reaction
-        float probability - Probability of the reaction
-        string gene_list - List of genes most likely to be attached to reaction
+********************************************************************************
+    FBAModel type definition
+   	********************************************************************************
 
 
 =item Definition
@@ -24791,10 +26079,12 @@ Data structure to hold probability of a reaction
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
-0: (reaction) a reaction_id
-1: (probability) a float
-2: (gene_list) a string
+a reference to a hash where the following keys are defined:
+id has a value which is a modelcompartment_id
+name has a value which is a string
+pH has a value which is a float
+potential has a value which is a float
+index has a value which is an int
 
 </pre>
 
@@ -24802,10 +26092,12 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
-0: (reaction) a reaction_id
-1: (probability) a float
-2: (gene_list) a string
+a reference to a hash where the following keys are defined:
+id has a value which is a modelcompartment_id
+name has a value which is a string
+pH has a value which is a float
+potential has a value which is a float
+index has a value which is an int
 
 
 =end text
@@ -24814,7 +26106,7 @@ a reference to a list containing 3 items:
 
 
 
-=head2 Biochemistry
+=head2 ModelCompound
 
 =over 4
 
@@ -24822,9 +26114,12 @@ a reference to a list containing 3 items:
 
 =item Description
 
-********************************************************************************
-    Biochemistry type definition
-   	********************************************************************************
+Data structures for a compound in a model
+
+modelcompound_id id - ID of the specific instance of the compound in the model
+compound_id compound - ID of the compound associated with the model compound
+string name - name of the compound associated with the model compound
+modelcompartment_id compartment - ID of the compartment containing the compound
 
 
 =item Definition
@@ -24833,11 +26128,10 @@ a reference to a list containing 3 items:
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a biochemistry_id
+id has a value which is a modelcompound_id
+compound has a value which is a compound_id
 name has a value which is a string
-compounds has a value which is a reference to a list where each element is a compound_id
-reactions has a value which is a reference to a list where each element is a reaction_id
-media has a value which is a reference to a list where each element is a media_id
+compartment has a value which is a modelcompartment_id
 
 </pre>
 
@@ -24846,11 +26140,10 @@ media has a value which is a reference to a list where each element is a media_i
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a biochemistry_id
+id has a value which is a modelcompound_id
+compound has a value which is a compound_id
 name has a value which is a string
-compounds has a value which is a reference to a list where each element is a compound_id
-reactions has a value which is a reference to a list where each element is a reaction_id
-media has a value which is a reference to a list where each element is a media_id
+compartment has a value which is a modelcompartment_id
 
 
 =end text
@@ -24859,7 +26152,7 @@ media has a value which is a reference to a list where each element is a media_i
 
 
 
-=head2 MediaCompound
+=head2 ModelReaction
 
 =over 4
 
@@ -24867,13 +26160,16 @@ media has a value which is a reference to a list where each element is a media_i
 
 =item Description
 
-Data structures for media compound formulation
+Data structures for a reaction in a model
 
-compound_id compound - ID of compound in media
-string name - name of compound in media
-float concentration - concentration of compound in media
-float maxFlux - maximum flux of compound in media
-float minFlux - minimum flux of compound in media
+modelreaction_id id - ID of the specific instance of the reaction in the model
+reaction_id reaction - ID of the reaction
+string name - name of the reaction
+string direction - directionality of the reaction
+string equation - stoichiometric equation of the reaction in terms of compound IDs
+string definition - stoichiometric equation of the reaction in terms of compound names
+list<feature_id> features - list of features associated with the reaction
+modelcompartment_id compartment - ID of the compartment containing the reaction
 
 
 =item Definition
@@ -24882,11 +26178,15 @@ float minFlux - minimum flux of compound in media
 
 <pre>
 a reference to a hash where the following keys are defined:
-compound has a value which is a compound_id
+id has a value which is a modelreaction_id
+reaction has a value which is a reaction_id
 name has a value which is a string
-concentration has a value which is a float
-max_flux has a value which is a float
-min_flux has a value which is a float
+direction has a value which is a string
+equation has a value which is a string
+definition has a value which is a string
+gapfilled has a value which is a bool
+features has a value which is a reference to a list where each element is a feature_id
+compartment has a value which is a modelcompartment_id
 
 </pre>
 
@@ -24895,11 +26195,15 @@ min_flux has a value which is a float
 =begin text
 
 a reference to a hash where the following keys are defined:
-compound has a value which is a compound_id
+id has a value which is a modelreaction_id
+reaction has a value which is a reaction_id
 name has a value which is a string
-concentration has a value which is a float
-max_flux has a value which is a float
-min_flux has a value which is a float
+direction has a value which is a string
+equation has a value which is a string
+definition has a value which is a string
+gapfilled has a value which is a bool
+features has a value which is a reference to a list where each element is a feature_id
+compartment has a value which is a modelcompartment_id
 
 
 =end text
@@ -24908,7 +26212,7 @@ min_flux has a value which is a float
 
 
 
-=head2 Media
+=head2 BiomassCompound
 
 =over 4
 
@@ -24916,13 +26220,11 @@ min_flux has a value which is a float
 
 =item Description
 
-Data structures for media formulation
+Data structures for a reaction in a model
 
-media_id id - ID of media formulation
-string name - name of media formulaiton
-list<MediaCompound> media_compounds - list of compounds in media formulation
-float pH - pH of media condition
-float temperature - temperature of media condition
+modelcompound_id modelcompound - ID of model compound in biomass reaction
+float coefficient - coefficient of compound in biomass reaction
+string name - name of compound in biomass reaction
 
 
 =item Definition
@@ -24930,12 +26232,10 @@ float temperature - temperature of media condition
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a media_id
-name has a value which is a string
-media_compounds has a value which is a reference to a list where each element is a MediaCompound
-pH has a value which is a float
-temperature has a value which is a float
+a reference to a list containing 3 items:
+0: (modelcompound) a modelcompound_id
+1: (coefficient) a float
+2: (name) a string
 
 </pre>
 
@@ -24943,12 +26243,10 @@ temperature has a value which is a float
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a media_id
-name has a value which is a string
-media_compounds has a value which is a reference to a list where each element is a MediaCompound
-pH has a value which is a float
-temperature has a value which is a float
+a reference to a list containing 3 items:
+0: (modelcompound) a modelcompound_id
+1: (coefficient) a float
+2: (name) a string
 
 
 =end text
@@ -24957,7 +26255,7 @@ temperature has a value which is a float
 
 
 
-=head2 Compound
+=head2 ModelBiomass
 
 =over 4
 
@@ -24965,16 +26263,12 @@ temperature has a value which is a float
 
 =item Description
 
-Data structures for media formulation
+Data structures for a reaction in a model
 
-compound_id id - ID of compound
-string abbrev - abbreviated name of compound
-string name - primary name of compound
-list<string> aliases - list of aliases for compound
-float charge - molecular charge of compound
-float deltaG - estimated compound delta G
-float deltaGErr - uncertainty in estimated compound delta G
-string formula - molecular formula of compound
+biomass_id id - ID of biomass reaction
+string name - name of biomass reaction
+string definition - stoichiometric equation of biomass reaction in terms of compound names
+list<BiomassCompound> biomass_compounds - list of compounds in biomass reaction
 
 
 =item Definition
@@ -24983,14 +26277,10 @@ string formula - molecular formula of compound
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a compound_id
-abbrev has a value which is a string
+id has a value which is a biomass_id
 name has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
-charge has a value which is a float
-deltaG has a value which is a float
-deltaGErr has a value which is a float
-formula has a value which is a string
+definition has a value which is a string
+biomass_compounds has a value which is a reference to a list where each element is a BiomassCompound
 
 </pre>
 
@@ -24999,14 +26289,10 @@ formula has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a compound_id
-abbrev has a value which is a string
+id has a value which is a biomass_id
 name has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
-charge has a value which is a float
-deltaG has a value which is a float
-deltaGErr has a value which is a float
-formula has a value which is a string
+definition has a value which is a string
+biomass_compounds has a value which is a reference to a list where each element is a BiomassCompound
 
 
 =end text
@@ -25015,44 +26301,36 @@ formula has a value which is a string
 
 
 
-=head2 Reaction
+=head2 FBAMeta
 
 =over 4
 
 
-
-=item Description
-
-Data structures for media formulation
-
-reaction_id id - ID of reaction
-string name - primary name of reaction
-string abbrev - abbreviated name of reaction
-list<string> enzymes - list of EC numbers for reaction
-string direction - directionality of reaction
-string reversibility - reversibility of reaction
-float deltaG - estimated delta G of reaction
-float deltaGErr - uncertainty in estimated delta G of reaction
-string equation - reaction equation in terms of compound IDs
-string definition - reaction equation in terms of compound names
-
-
+
+=item Description
+
+Data structures for a reaction in a model
+
+fba_id id - ID of the FBA object
+workspace_id workspace - ID of the workspace containing the FBA object
+media_id media - ID of the media the FBA was performed in
+workspace_id media_workspace - ID of the workspace containing the media formulation
+float objective - optimized objective value of the FBA study
+list<feature_id> ko - list of genes knocked out in the FBA study
+
+
 =item Definition
 
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a reaction_id
-name has a value which is a string
-abbrev has a value which is a string
-enzymes has a value which is a reference to a list where each element is a string
-direction has a value which is a string
-reversibility has a value which is a string
-deltaG has a value which is a float
-deltaGErr has a value which is a float
-equation has a value which is a string
-definition has a value which is a string
+a reference to a list containing 6 items:
+0: (id) a fba_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (objective) a float
+5: (ko) a reference to a list where each element is a feature_id
 
 </pre>
 
@@ -25060,17 +26338,13 @@ definition has a value which is a string
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a reaction_id
-name has a value which is a string
-abbrev has a value which is a string
-enzymes has a value which is a reference to a list where each element is a string
-direction has a value which is a string
-reversibility has a value which is a string
-deltaG has a value which is a float
-deltaGErr has a value which is a float
-equation has a value which is a string
-definition has a value which is a string
+a reference to a list containing 6 items:
+0: (id) a fba_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (objective) a float
+5: (ko) a reference to a list where each element is a feature_id
 
 
 =end text
@@ -25079,7 +26353,7 @@ definition has a value which is a string
 
 
 
-=head2 ModelCompartment
+=head2 GapGenMeta
 
 =over 4
 
@@ -25087,9 +26361,14 @@ definition has a value which is a string
 
 =item Description
 
-********************************************************************************
-    FBAModel type definition
-   	********************************************************************************
+Metadata object providing a summary of a gapgen simulation
+
+gapgen_id id - ID of gapgen study object
+workspace_id workspace - workspace containing gapgen study
+media_id media - media formulation for gapgen study
+workspace_id media_workspace - ID of the workspace containing the media formulation
+bool done - boolean indicating if gapgen study is complete
+list<feature_id> ko - list of genes knocked out in gapgen study
 
 
 =item Definition
@@ -25097,12 +26376,13 @@ definition has a value which is a string
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a modelcompartment_id
-name has a value which is a string
-pH has a value which is a float
-potential has a value which is a float
-index has a value which is an int
+a reference to a list containing 6 items:
+0: (id) a gapgen_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (done) a bool
+5: (ko) a reference to a list where each element is a feature_id
 
 </pre>
 
@@ -25110,12 +26390,13 @@ index has a value which is an int
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a modelcompartment_id
-name has a value which is a string
-pH has a value which is a float
-potential has a value which is a float
-index has a value which is an int
+a reference to a list containing 6 items:
+0: (id) a gapgen_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (done) a bool
+5: (ko) a reference to a list where each element is a feature_id
 
 
 =end text
@@ -25124,7 +26405,7 @@ index has a value which is an int
 
 
 
-=head2 ModelCompound
+=head2 GapFillMeta
 
 =over 4
 
@@ -25132,12 +26413,14 @@ index has a value which is an int
 
 =item Description
 
-Data structures for a compound in a model
+Metadata object providing a summary of a gapfilling simulation
 
-modelcompound_id id - ID of the specific instance of the compound in the model
-compound_id compound - ID of the compound associated with the model compound
-string name - name of the compound associated with the model compound
-modelcompartment_id compartment - ID of the compartment containing the compound
+gapfill_id id - ID of gapfill study object
+workspace_id workspace - workspace containing gapfill study
+media_id media - media formulation for gapfill study
+workspace_id media_workspace - ID of the workspace containing the media formulation
+bool done - boolean indicating if gapfill study is complete
+list<feature_id> ko - list of genes knocked out in gapfill study
 
 
 =item Definition
@@ -25145,11 +26428,13 @@ modelcompartment_id compartment - ID of the compartment containing the compound
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a modelcompound_id
-compound has a value which is a compound_id
-name has a value which is a string
-compartment has a value which is a modelcompartment_id
+a reference to a list containing 6 items:
+0: (id) a gapfill_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (done) a bool
+5: (ko) a reference to a list where each element is a feature_id
 
 </pre>
 
@@ -25157,11 +26442,13 @@ compartment has a value which is a modelcompartment_id
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a modelcompound_id
-compound has a value which is a compound_id
-name has a value which is a string
-compartment has a value which is a modelcompartment_id
+a reference to a list containing 6 items:
+0: (id) a gapfill_id
+1: (workspace) a workspace_id
+2: (media) a media_id
+3: (media_workspace) a workspace_id
+4: (done) a bool
+5: (ko) a reference to a list where each element is a feature_id
 
 
 =end text
@@ -25170,7 +26457,7 @@ compartment has a value which is a modelcompartment_id
 
 
 
-=head2 ModelReaction
+=head2 FBAModel
 
 =over 4
 
@@ -25178,16 +26465,28 @@ compartment has a value which is a modelcompartment_id
 
 =item Description
 
-Data structures for a reaction in a model
+Data structure holding data for metabolic model
 
-modelreaction_id id - ID of the specific instance of the reaction in the model
-reaction_id reaction - ID of the reaction
-string name - name of the reaction
-string direction - directionality of the reaction
-string equation - stoichiometric equation of the reaction in terms of compound IDs
-string definition - stoichiometric equation of the reaction in terms of compound names
-list<feature_id> features - list of features associated with the reaction
-modelcompartment_id compartment - ID of the compartment containing the reaction
+fbamodel_id id - ID of model
+workspace_id workspace - workspace containing model
+genome_id genome - ID of associated genome
+workspace_id genome_workspace - workspace with associated genome
+mapping_id map - ID of associated mapping database
+workspace_id map_workspace - workspace with associated mapping database
+biochemistry_id biochemistry - ID of associated biochemistry database
+workspace_id biochemistry_workspace - workspace with associated biochemistry database
+string name - name of the model
+string type - type of model (e.g. single genome, community)
+string status - status of model (e.g. under construction)
+list<ModelBiomass> biomasses - list of biomass reactions in model
+list<ModelCompartment> compartments - list of compartments in model
+list<ModelReaction> reactions - list of reactions in model
+list<ModelCompound> compounds - list of compounds in model
+list<FBAMeta> fbas - list of flux balance analysis studies for model
+list<GapFillMeta> integrated_gapfillings - list of integrated gapfilling solutions
+list<GapFillMeta> unintegrated_gapfillings - list of unintegrated gapfilling solutions
+list<GapGenMeta> integrated_gapgenerations - list of integrated gapgen solutions
+list<GapGenMeta> unintegrated_gapgenerations - list of unintegrated gapgen solutions
 
 
 =item Definition
@@ -25196,15 +26495,26 @@ modelcompartment_id compartment - ID of the compartment containing the reaction
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a modelreaction_id
-reaction has a value which is a reaction_id
+id has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+map has a value which is a mapping_id
+map_workspace has a value which is a workspace_id
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
 name has a value which is a string
-direction has a value which is a string
-equation has a value which is a string
-definition has a value which is a string
-gapfilled has a value which is a bool
-features has a value which is a reference to a list where each element is a feature_id
-compartment has a value which is a modelcompartment_id
+type has a value which is a string
+status has a value which is a string
+biomasses has a value which is a reference to a list where each element is a ModelBiomass
+compartments has a value which is a reference to a list where each element is a ModelCompartment
+reactions has a value which is a reference to a list where each element is a ModelReaction
+compounds has a value which is a reference to a list where each element is a ModelCompound
+fbas has a value which is a reference to a list where each element is an FBAMeta
+integrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
+unintegrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
+integrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
+unintegrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
 
 </pre>
 
@@ -25213,15 +26523,26 @@ compartment has a value which is a modelcompartment_id
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a modelreaction_id
-reaction has a value which is a reaction_id
+id has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+map has a value which is a mapping_id
+map_workspace has a value which is a workspace_id
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
 name has a value which is a string
-direction has a value which is a string
-equation has a value which is a string
-definition has a value which is a string
-gapfilled has a value which is a bool
-features has a value which is a reference to a list where each element is a feature_id
-compartment has a value which is a modelcompartment_id
+type has a value which is a string
+status has a value which is a string
+biomasses has a value which is a reference to a list where each element is a ModelBiomass
+compartments has a value which is a reference to a list where each element is a ModelCompartment
+reactions has a value which is a reference to a list where each element is a ModelReaction
+compounds has a value which is a reference to a list where each element is a ModelCompound
+fbas has a value which is a reference to a list where each element is an FBAMeta
+integrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
+unintegrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
+integrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
+unintegrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
 
 
 =end text
@@ -25230,7 +26551,7 @@ compartment has a value which is a modelcompartment_id
 
 
 
-=head2 BiomassCompound
+=head2 GeneAssertion
 
 =over 4
 
@@ -25238,11 +26559,9 @@ compartment has a value which is a modelcompartment_id
 
 =item Description
 
-Data structures for a reaction in a model
-
-modelcompound_id modelcompound - ID of model compound in biomass reaction
-float coefficient - coefficient of compound in biomass reaction
-string name - name of compound in biomass reaction
+********************************************************************************
+    Flux Balance Analysis type definition
+   	********************************************************************************
 
 
 =item Definition
@@ -25250,10 +26569,11 @@ string name - name of compound in biomass reaction
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
-0: (modelcompound) a modelcompound_id
-1: (coefficient) a float
-2: (name) a string
+a reference to a list containing 4 items:
+0: (feature) a feature_id
+1: (growthFraction) a float
+2: (growth) a float
+3: (isEssential) a bool
 
 </pre>
 
@@ -25261,10 +26581,11 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
-0: (modelcompound) a modelcompound_id
-1: (coefficient) a float
-2: (name) a string
+a reference to a list containing 4 items:
+0: (feature) a feature_id
+1: (growthFraction) a float
+2: (growth) a float
+3: (isEssential) a bool
 
 
 =end text
@@ -25273,7 +26594,7 @@ a reference to a list containing 3 items:
 
 
 
-=head2 ModelBiomass
+=head2 CompoundFlux
 
 =over 4
 
@@ -25281,12 +26602,16 @@ a reference to a list containing 3 items:
 
 =item Description
 
-Data structures for a reaction in a model
+Compound variable in FBA solution
 
-biomass_id id - ID of biomass reaction
-string name - name of biomass reaction
-string definition - stoichiometric equation of biomass reaction in terms of compound names
-list<BiomassCompound> biomass_compounds - list of compounds in biomass reaction
+modelcompound_id compound - ID of compound in model in FBA solution
+float value - flux uptake of compound in FBA solution
+float upperBound - maximum uptake of compoundin FBA simulation
+float lowerBound - minimum uptake of compoundin FBA simulation
+float max - maximum uptake of compoundin FBA simulation
+float min - minimum uptake of compoundin FBA simulation
+string type - type of compound variable
+string name - name of compound
 
 
 =item Definition
@@ -25294,11 +26619,15 @@ list<BiomassCompound> biomass_compounds - list of compounds in biomass reaction
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a biomass_id
-name has a value which is a string
-definition has a value which is a string
-biomass_compounds has a value which is a reference to a list where each element is a BiomassCompound
+a reference to a list containing 8 items:
+0: (compound) a modelcompound_id
+1: (value) a float
+2: (upperBound) a float
+3: (lowerBound) a float
+4: (max) a float
+5: (min) a float
+6: (type) a string
+7: (name) a string
 
 </pre>
 
@@ -25306,11 +26635,15 @@ biomass_compounds has a value which is a reference to a list where each element
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a biomass_id
-name has a value which is a string
-definition has a value which is a string
-biomass_compounds has a value which is a reference to a list where each element is a BiomassCompound
+a reference to a list containing 8 items:
+0: (compound) a modelcompound_id
+1: (value) a float
+2: (upperBound) a float
+3: (lowerBound) a float
+4: (max) a float
+5: (min) a float
+6: (type) a string
+7: (name) a string
 
 
 =end text
@@ -25319,7 +26652,7 @@ biomass_compounds has a value which is a reference to a list where each element
 
 
 
-=head2 FBAMeta
+=head2 ReactionFlux
 
 =over 4
 
@@ -25327,14 +26660,16 @@ biomass_compounds has a value which is a reference to a list where each element
 
 =item Description
 
-Data structures for a reaction in a model
+Reaction variable in FBA solution
 
-fba_id id - ID of the FBA object
-workspace_id workspace - ID of the workspace containing the FBA object
-media_id media - ID of the media the FBA was performed in
-workspace_id media_workspace - ID of the workspace containing the media formulation
-float objective - optimized objective value of the FBA study
-list<feature_id> ko - list of genes knocked out in the FBA study
+modelreaction_id reaction - ID of reaction in model in FBA solution
+float value - flux through reaction in FBA solution
+float upperBound - maximum flux through reaction in FBA simulation
+float lowerBound -  minimum flux through reaction in FBA simulation
+float max - maximum flux through reaction in FBA simulation
+float min - minimum flux through reaction in FBA simulation
+string type - type of reaction variable
+string definition - stoichiometry of solution reaction in terms of compound names
 
 
 =item Definition
@@ -25342,13 +26677,15 @@ list<feature_id> ko - list of genes knocked out in the FBA study
 =begin html
 
 <pre>
-a reference to a list containing 6 items:
-0: (id) a fba_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (objective) a float
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a list containing 8 items:
+0: (reaction) a modelreaction_id
+1: (value) a float
+2: (upperBound) a float
+3: (lowerBound) a float
+4: (max) a float
+5: (min) a float
+6: (type) a string
+7: (definition) a string
 
 </pre>
 
@@ -25356,13 +26693,15 @@ a reference to a list containing 6 items:
 
 =begin text
 
-a reference to a list containing 6 items:
-0: (id) a fba_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (objective) a float
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a list containing 8 items:
+0: (reaction) a modelreaction_id
+1: (value) a float
+2: (upperBound) a float
+3: (lowerBound) a float
+4: (max) a float
+5: (min) a float
+6: (type) a string
+7: (definition) a string
 
 
 =end text
@@ -25371,7 +26710,7 @@ a reference to a list containing 6 items:
 
 
 
-=head2 GapGenMeta
+=head2 MetaboliteProduction
 
 =over 4
 
@@ -25379,14 +26718,11 @@ a reference to a list containing 6 items:
 
 =item Description
 
-Metadata object providing a summary of a gapgen simulation
+Maximum production of compound in FBA simulation
 
-gapgen_id id - ID of gapgen study object
-workspace_id workspace - workspace containing gapgen study
-media_id media - media formulation for gapgen study
-workspace_id media_workspace - ID of the workspace containing the media formulation
-bool done - boolean indicating if gapgen study is complete
-list<feature_id> ko - list of genes knocked out in gapgen study
+float maximumProduction - maximum production of compound
+modelcompound_id modelcompound - ID of compound with production maximized
+string name - name of compound with simulated production
 
 
 =item Definition
@@ -25394,13 +26730,10 @@ list<feature_id> ko - list of genes knocked out in gapgen study
 =begin html
 
 <pre>
-a reference to a list containing 6 items:
-0: (id) a gapgen_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (done) a bool
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a list containing 3 items:
+0: (maximumProduction) a float
+1: (modelcompound) a modelcompound_id
+2: (name) a string
 
 </pre>
 
@@ -25408,13 +26741,10 @@ a reference to a list containing 6 items:
 
 =begin text
 
-a reference to a list containing 6 items:
-0: (id) a gapgen_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (done) a bool
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a list containing 3 items:
+0: (maximumProduction) a float
+1: (modelcompound) a modelcompound_id
+2: (name) a string
 
 
 =end text
@@ -25423,7 +26753,7 @@ a reference to a list containing 6 items:
 
 
 
-=head2 GapFillMeta
+=head2 MinimalMediaPrediction
 
 =over 4
 
@@ -25431,14 +26761,10 @@ a reference to a list containing 6 items:
 
 =item Description
 
-Metadata object providing a summary of a gapfilling simulation
+Data structures for gapfilling solution
 
-gapfill_id id - ID of gapfill study object
-workspace_id workspace - workspace containing gapfill study
-media_id media - media formulation for gapfill study
-workspace_id media_workspace - ID of the workspace containing the media formulation
-bool done - boolean indicating if gapfill study is complete
-list<feature_id> ko - list of genes knocked out in gapfill study
+list<compound_id> optionalNutrients - list of optional nutrients
+list<compound_id> essentialNutrients - list of essential nutrients
 
 
 =item Definition
@@ -25446,13 +26772,9 @@ list<feature_id> ko - list of genes knocked out in gapfill study
 =begin html
 
 <pre>
-a reference to a list containing 6 items:
-0: (id) a gapfill_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (done) a bool
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a hash where the following keys are defined:
+optionalNutrients has a value which is a reference to a list where each element is a compound_id
+essentialNutrients has a value which is a reference to a list where each element is a compound_id
 
 </pre>
 
@@ -25460,13 +26782,9 @@ a reference to a list containing 6 items:
 
 =begin text
 
-a reference to a list containing 6 items:
-0: (id) a gapfill_id
-1: (workspace) a workspace_id
-2: (media) a media_id
-3: (media_workspace) a workspace_id
-4: (done) a bool
-5: (ko) a reference to a list where each element is a feature_id
+a reference to a hash where the following keys are defined:
+optionalNutrients has a value which is a reference to a list where each element is a compound_id
+essentialNutrients has a value which is a reference to a list where each element is a compound_id
 
 
 =end text
@@ -25475,7 +26793,7 @@ a reference to a list containing 6 items:
 
 
 
-=head2 FBAModel
+=head2 bound
 
 =over 4
 
@@ -25483,28 +26801,12 @@ a reference to a list containing 6 items:
 
 =item Description
 
-Data structure holding data for metabolic model
+Term of constraint or objective in FBA simulation
 
-fbamodel_id id - ID of model
-workspace_id workspace - workspace containing model
-genome_id genome - ID of associated genome
-workspace_id genome_workspace - workspace with associated genome
-mapping_id map - ID of associated mapping database
-workspace_id map_workspace - workspace with associated mapping database
-biochemistry_id biochemistry - ID of associated biochemistry database
-workspace_id biochemistry_workspace - workspace with associated biochemistry database
-string name - name of the model
-string type - type of model (e.g. single genome, community)
-string status - status of model (e.g. under construction)
-list<ModelBiomass> biomasses - list of biomass reactions in model
-list<ModelCompartment> compartments - list of compartments in model
-list<ModelReaction> reactions - list of reactions in model
-list<ModelCompound> compounds - list of compounds in model
-list<FBAMeta> fbas - list of flux balance analysis studies for model
-list<GapFillMeta> integrated_gapfillings - list of integrated gapfilling solutions
-list<GapFillMeta> unintegrated_gapfillings - list of unintegrated gapfilling solutions
-list<GapGenMeta> integrated_gapgenerations - list of integrated gapgen solutions
-list<GapGenMeta> unintegrated_gapgenerations - list of unintegrated gapgen solutions
+float min - minimum value of custom bound
+float max - maximum value of custom bound
+string varType - type of variable for custom bound
+string variable - variable ID for custom bound
 
 
 =item Definition
@@ -25512,27 +26814,11 @@ list<GapGenMeta> unintegrated_gapgenerations - list of unintegrated gapgen solut
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-map has a value which is a mapping_id
-map_workspace has a value which is a workspace_id
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
-name has a value which is a string
-type has a value which is a string
-status has a value which is a string
-biomasses has a value which is a reference to a list where each element is a ModelBiomass
-compartments has a value which is a reference to a list where each element is a ModelCompartment
-reactions has a value which is a reference to a list where each element is a ModelReaction
-compounds has a value which is a reference to a list where each element is a ModelCompound
-fbas has a value which is a reference to a list where each element is an FBAMeta
-integrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
-unintegrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
-integrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
-unintegrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
+a reference to a list containing 4 items:
+0: (min) a float
+1: (max) a float
+2: (varType) a string
+3: (variable) a string
 
 </pre>
 
@@ -25540,27 +26826,11 @@ unintegrated_gapgenerations has a value which is a reference to a list where eac
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-map has a value which is a mapping_id
-map_workspace has a value which is a workspace_id
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
-name has a value which is a string
-type has a value which is a string
-status has a value which is a string
-biomasses has a value which is a reference to a list where each element is a ModelBiomass
-compartments has a value which is a reference to a list where each element is a ModelCompartment
-reactions has a value which is a reference to a list where each element is a ModelReaction
-compounds has a value which is a reference to a list where each element is a ModelCompound
-fbas has a value which is a reference to a list where each element is an FBAMeta
-integrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
-unintegrated_gapfillings has a value which is a reference to a list where each element is a GapFillMeta
-integrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
-unintegrated_gapgenerations has a value which is a reference to a list where each element is a GapGenMeta
+a reference to a list containing 4 items:
+0: (min) a float
+1: (max) a float
+2: (varType) a string
+3: (variable) a string
 
 
 =end text
@@ -25569,7 +26839,7 @@ unintegrated_gapgenerations has a value which is a reference to a list where eac
 
 
 
-=head2 GeneAssertion
+=head2 term
 
 =over 4
 
@@ -25577,9 +26847,11 @@ unintegrated_gapgenerations has a value which is a reference to a list where eac
 
 =item Description
 
-********************************************************************************
-    Flux Balance Analysis type definition
-   	********************************************************************************
+Term of constraint or objective in FBA simulation
+
+float coefficient - coefficient of term in objective or constraint
+string varType - type of variable for term in objective or constraint
+string variable - variable ID for term in objective or constraint
 
 
 =item Definition
@@ -25587,11 +26859,10 @@ unintegrated_gapgenerations has a value which is a reference to a list where eac
 =begin html
 
 <pre>
-a reference to a list containing 4 items:
-0: (feature) a feature_id
-1: (growthFraction) a float
-2: (growth) a float
-3: (isEssential) a bool
+a reference to a list containing 3 items:
+0: (coefficient) a float
+1: (varType) a string
+2: (variable) a string
 
 </pre>
 
@@ -25599,11 +26870,10 @@ a reference to a list containing 4 items:
 
 =begin text
 
-a reference to a list containing 4 items:
-0: (feature) a feature_id
-1: (growthFraction) a float
-2: (growth) a float
-3: (isEssential) a bool
+a reference to a list containing 3 items:
+0: (coefficient) a float
+1: (varType) a string
+2: (variable) a string
 
 
 =end text
@@ -25612,7 +26882,7 @@ a reference to a list containing 4 items:
 
 
 
-=head2 CompoundFlux
+=head2 constraint
 
 =over 4
 
@@ -25620,16 +26890,12 @@ a reference to a list containing 4 items:
 
 =item Description
 
-Compound variable in FBA solution
+Custom constraint in FBA simulation
 
-modelcompound_id compound - ID of compound in model in FBA solution
-float value - flux uptake of compound in FBA solution
-float upperBound - maximum uptake of compoundin FBA simulation
-float lowerBound - minimum uptake of compoundin FBA simulation
-float max - maximum uptake of compoundin FBA simulation
-float min - minimum uptake of compoundin FBA simulation
-string type - type of compound variable
-string name - name of compound
+float rhs - right hand side of custom constraint
+string sign - sign of custom constraint (e.g. <, >)
+list<term> terms - terms in custom constraint
+string name - name of custom constraint
 
 
 =item Definition
@@ -25637,15 +26903,11 @@ string name - name of compound
 =begin html
 
 <pre>
-a reference to a list containing 8 items:
-0: (compound) a modelcompound_id
-1: (value) a float
-2: (upperBound) a float
-3: (lowerBound) a float
-4: (max) a float
-5: (min) a float
-6: (type) a string
-7: (name) a string
+a reference to a list containing 4 items:
+0: (rhs) a float
+1: (sign) a string
+2: (terms) a reference to a list where each element is a term
+3: (name) a string
 
 </pre>
 
@@ -25653,15 +26915,11 @@ a reference to a list containing 8 items:
 
 =begin text
 
-a reference to a list containing 8 items:
-0: (compound) a modelcompound_id
-1: (value) a float
-2: (upperBound) a float
-3: (lowerBound) a float
-4: (max) a float
-5: (min) a float
-6: (type) a string
-7: (name) a string
+a reference to a list containing 4 items:
+0: (rhs) a float
+1: (sign) a string
+2: (terms) a reference to a list where each element is a term
+3: (name) a string
 
 
 =end text
@@ -25670,7 +26928,7 @@ a reference to a list containing 8 items:
 
 
 
-=head2 ReactionFlux
+=head2 FBAFormulation
 
 =over 4
 
@@ -25678,16 +26936,32 @@ a reference to a list containing 8 items:
 
 =item Description
 
-Reaction variable in FBA solution
+Data structures for gapfilling solution
 
-modelreaction_id reaction - ID of reaction in model in FBA solution
-float value - flux through reaction in FBA solution
-float upperBound - maximum flux through reaction in FBA simulation
-float lowerBound -  minimum flux through reaction in FBA simulation
-float max - maximum flux through reaction in FBA simulation
-float min - minimum flux through reaction in FBA simulation
-string type - type of reaction variable
-string definition - stoichiometry of solution reaction in terms of compound names
+media_id media - ID of media formulation to be used
+list<compound_id> additionalcpds - list of additional compounds to allow update
+promconstraint_id promconstraint - ID of promconstraint
+workspace_id promconstraint_workspace - workspace containing promconstraint
+sample_id eflux_sample - ID of gene expression sample to run eflux
+series_id eflux_series - ID of series that a sample belongs to.
+workspace_id eflux_workspace - workspace containing gene expression sample series for eflux
+workspace_id media_workspace - workspace containing media for FBA study
+float objfraction - fraction of objective to use for constraints
+bool allreversible - flag indicating if all reactions should be reversible
+bool maximizeObjective - flag indicating if objective should be maximized
+list<term> objectiveTerms - list of terms of objective function
+list<feature_id> geneko - list of gene knockouts
+list<reaction_id> rxnko - list of reaction knockouts
+list<bound> bounds - list of custom bounds
+list<constraint> constraints - list of custom constraints
+mapping<string,float> uptakelim - hash of maximum uptake for elements
+float defaultmaxflux - default maximum intracellular flux
+float defaultminuptake - default minimum nutrient uptake
+float defaultmaxuptake - default maximum nutrient uptake
+bool simplethermoconst - flag indicating if simple thermodynamic constraints should be used
+bool thermoconst - flag indicating if thermodynamic constraints should be used
+bool nothermoerror - flag indicating if no error should be allowed in thermodynamic constraints
+bool minthermoerror - flag indicating if error should be minimized in thermodynamic constraints
 
 
 =item Definition
@@ -25695,15 +26969,31 @@ string definition - stoichiometry of solution reaction in terms of compound name
 =begin html
 
 <pre>
-a reference to a list containing 8 items:
-0: (reaction) a modelreaction_id
-1: (value) a float
-2: (upperBound) a float
-3: (lowerBound) a float
-4: (max) a float
-5: (min) a float
-6: (type) a string
-7: (definition) a string
+a reference to a hash where the following keys are defined:
+media has a value which is a media_id
+additionalcpds has a value which is a reference to a list where each element is a compound_id
+promconstraint has a value which is a promconstraint_id
+promconstraint_workspace has a value which is a workspace_id
+eflux_sample has a value which is a sample_id
+eflux_series has a value which is a series_id
+eflux_workspace has a value which is a workspace_id
+media_workspace has a value which is a workspace_id
+objfraction has a value which is a float
+allreversible has a value which is a bool
+maximizeObjective has a value which is a bool
+objectiveTerms has a value which is a reference to a list where each element is a term
+geneko has a value which is a reference to a list where each element is a feature_id
+rxnko has a value which is a reference to a list where each element is a reaction_id
+bounds has a value which is a reference to a list where each element is a bound
+constraints has a value which is a reference to a list where each element is a constraint
+uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+defaultmaxflux has a value which is a float
+defaultminuptake has a value which is a float
+defaultmaxuptake has a value which is a float
+simplethermoconst has a value which is a bool
+thermoconst has a value which is a bool
+nothermoerror has a value which is a bool
+minthermoerror has a value which is a bool
 
 </pre>
 
@@ -25711,15 +27001,31 @@ a reference to a list containing 8 items:
 
 =begin text
 
-a reference to a list containing 8 items:
-0: (reaction) a modelreaction_id
-1: (value) a float
-2: (upperBound) a float
-3: (lowerBound) a float
-4: (max) a float
-5: (min) a float
-6: (type) a string
-7: (definition) a string
+a reference to a hash where the following keys are defined:
+media has a value which is a media_id
+additionalcpds has a value which is a reference to a list where each element is a compound_id
+promconstraint has a value which is a promconstraint_id
+promconstraint_workspace has a value which is a workspace_id
+eflux_sample has a value which is a sample_id
+eflux_series has a value which is a series_id
+eflux_workspace has a value which is a workspace_id
+media_workspace has a value which is a workspace_id
+objfraction has a value which is a float
+allreversible has a value which is a bool
+maximizeObjective has a value which is a bool
+objectiveTerms has a value which is a reference to a list where each element is a term
+geneko has a value which is a reference to a list where each element is a feature_id
+rxnko has a value which is a reference to a list where each element is a reaction_id
+bounds has a value which is a reference to a list where each element is a bound
+constraints has a value which is a reference to a list where each element is a constraint
+uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
+defaultmaxflux has a value which is a float
+defaultminuptake has a value which is a float
+defaultmaxuptake has a value which is a float
+simplethermoconst has a value which is a bool
+thermoconst has a value which is a bool
+nothermoerror has a value which is a bool
+minthermoerror has a value which is a bool
 
 
 =end text
@@ -25728,7 +27034,7 @@ a reference to a list containing 8 items:
 
 
 
-=head2 MetaboliteProduction
+=head2 FBA
 
 =over 4
 
@@ -25736,11 +27042,20 @@ a reference to a list containing 8 items:
 
 =item Description
 
-Maximum production of compound in FBA simulation
+Data structures for gapfilling solution
 
-float maximumProduction - maximum production of compound
-modelcompound_id modelcompound - ID of compound with production maximized
-string name - name of compound with simulated production
+fba_id id - ID of FBA study
+workspace_id workspace - workspace containing FBA study
+        fbamodel_id model - ID of model FBA was run on
+        workspace_id model_workspace - workspace with FBA model
+        float objective - objective value of FBA study
+        bool isComplete - flag indicating if job is complete
+FBAFormulation formulation - specs for FBA study
+list<MinimalMediaPrediction> minimalMediaPredictions - list of minimal media formulation
+list<MetaboliteProduction> metaboliteProductions - list of biomass component production
+list<ReactionFlux> reactionFluxes - list of reaction fluxes
+list<CompoundFlux> compoundFluxes - list of compound uptake fluxes
+list<GeneAssertion> geneAssertions - list of gene assertions
 
 
 =item Definition
@@ -25748,10 +27063,19 @@ string name - name of compound with simulated production
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
-0: (maximumProduction) a float
-1: (modelcompound) a modelcompound_id
-2: (name) a string
+a reference to a hash where the following keys are defined:
+id has a value which is a fba_id
+workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+objective has a value which is a float
+isComplete has a value which is a bool
+formulation has a value which is an FBAFormulation
+minimalMediaPredictions has a value which is a reference to a list where each element is a MinimalMediaPrediction
+metaboliteProductions has a value which is a reference to a list where each element is a MetaboliteProduction
+reactionFluxes has a value which is a reference to a list where each element is a ReactionFlux
+compoundFluxes has a value which is a reference to a list where each element is a CompoundFlux
+geneAssertions has a value which is a reference to a list where each element is a GeneAssertion
 
 </pre>
 
@@ -25759,10 +27083,19 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
-0: (maximumProduction) a float
-1: (modelcompound) a modelcompound_id
-2: (name) a string
+a reference to a hash where the following keys are defined:
+id has a value which is a fba_id
+workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+objective has a value which is a float
+isComplete has a value which is a bool
+formulation has a value which is an FBAFormulation
+minimalMediaPredictions has a value which is a reference to a list where each element is a MinimalMediaPrediction
+metaboliteProductions has a value which is a reference to a list where each element is a MetaboliteProduction
+reactionFluxes has a value which is a reference to a list where each element is a ReactionFlux
+compoundFluxes has a value which is a reference to a list where each element is a CompoundFlux
+geneAssertions has a value which is a reference to a list where each element is a GeneAssertion
 
 
 =end text
@@ -25771,7 +27104,7 @@ a reference to a list containing 3 items:
 
 
 
-=head2 MinimalMediaPrediction
+=head2 GapfillingFormulation
 
 =over 4
 
@@ -25779,10 +27112,9 @@ a reference to a list containing 3 items:
 
 =item Description
 
-Data structures for gapfilling solution
-
-list<compound_id> optionalNutrients - list of optional nutrients
-list<compound_id> essentialNutrients - list of essential nutrients
+********************************************************************************
+    Gapfilling type definition
+   	********************************************************************************
 
 
 =item Definition
@@ -25791,8 +27123,27 @@ list<compound_id> essentialNutrients - list of essential nutrients
 
 <pre>
 a reference to a hash where the following keys are defined:
-optionalNutrients has a value which is a reference to a list where each element is a compound_id
-essentialNutrients has a value which is a reference to a list where each element is a compound_id
+formulation has a value which is an FBAFormulation
+num_solutions has a value which is an int
+nomediahyp has a value which is a bool
+nobiomasshyp has a value which is a bool
+nogprhyp has a value which is a bool
+nopathwayhyp has a value which is a bool
+allowunbalanced has a value which is a bool
+activitybonus has a value which is a float
+drainpen has a value which is a float
+directionpen has a value which is a float
+nostructpen has a value which is a float
+unfavorablepen has a value which is a float
+nodeltagpen has a value which is a float
+biomasstranspen has a value which is a float
+singletranspen has a value which is a float
+transpen has a value which is a float
+blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
+gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
+allowedcmps has a value which is a reference to a list where each element is a compartment_id
+probabilisticAnnotation has a value which is a probanno_id
+probabilisticAnnotation_workspace has a value which is a workspace_id
 
 </pre>
 
@@ -25801,8 +27152,27 @@ essentialNutrients has a value which is a reference to a list where each element
 =begin text
 
 a reference to a hash where the following keys are defined:
-optionalNutrients has a value which is a reference to a list where each element is a compound_id
-essentialNutrients has a value which is a reference to a list where each element is a compound_id
+formulation has a value which is an FBAFormulation
+num_solutions has a value which is an int
+nomediahyp has a value which is a bool
+nobiomasshyp has a value which is a bool
+nogprhyp has a value which is a bool
+nopathwayhyp has a value which is a bool
+allowunbalanced has a value which is a bool
+activitybonus has a value which is a float
+drainpen has a value which is a float
+directionpen has a value which is a float
+nostructpen has a value which is a float
+unfavorablepen has a value which is a float
+nodeltagpen has a value which is a float
+biomasstranspen has a value which is a float
+singletranspen has a value which is a float
+transpen has a value which is a float
+blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
+gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
+allowedcmps has a value which is a reference to a list where each element is a compartment_id
+probabilisticAnnotation has a value which is a probanno_id
+probabilisticAnnotation_workspace has a value which is a workspace_id
 
 
 =end text
@@ -25811,7 +27181,7 @@ essentialNutrients has a value which is a reference to a list where each element
 
 
 
-=head2 bound
+=head2 reactionAddition
 
 =over 4
 
@@ -25819,12 +27189,12 @@ essentialNutrients has a value which is a reference to a list where each element
 
 =item Description
 
-Term of constraint or objective in FBA simulation
+Reactions removed in gapgen solution
 
-float min - minimum value of custom bound
-float max - maximum value of custom bound
-string varType - type of variable for custom bound
-string variable - variable ID for custom bound
+modelreaction_id reaction - ID of the removed reaction
+string direction - direction of reaction removed in gapgen solution
+string equation - stoichiometry of removed reaction in terms of compound IDs
+string definition - stoichiometry of removed reaction in terms of compound names
 
 
 =item Definition
@@ -25832,11 +27202,12 @@ string variable - variable ID for custom bound
 =begin html
 
 <pre>
-a reference to a list containing 4 items:
-0: (min) a float
-1: (max) a float
-2: (varType) a string
-3: (variable) a string
+a reference to a list containing 5 items:
+0: (reaction) a reaction_id
+1: (direction) a string
+2: (compartment_id) a string
+3: (equation) a string
+4: (definition) a string
 
 </pre>
 
@@ -25844,11 +27215,12 @@ a reference to a list containing 4 items:
 
 =begin text
 
-a reference to a list containing 4 items:
-0: (min) a float
-1: (max) a float
-2: (varType) a string
-3: (variable) a string
+a reference to a list containing 5 items:
+0: (reaction) a reaction_id
+1: (direction) a string
+2: (compartment_id) a string
+3: (equation) a string
+4: (definition) a string
 
 
 =end text
@@ -25857,7 +27229,7 @@ a reference to a list containing 4 items:
 
 
 
-=head2 term
+=head2 biomassRemoval
 
 =over 4
 
@@ -25865,11 +27237,10 @@ a reference to a list containing 4 items:
 
 =item Description
 
-Term of constraint or objective in FBA simulation
+Biomass component removed in gapfill solution
 
-float coefficient - coefficient of term in objective or constraint
-string varType - type of variable for term in objective or constraint
-string variable - variable ID for term in objective or constraint
+compound_id compound - ID of biomass component removed
+string name - name of biomass component removed
 
 
 =item Definition
@@ -25877,10 +27248,9 @@ string variable - variable ID for term in objective or constraint
 =begin html
 
 <pre>
-a reference to a list containing 3 items:
-0: (coefficient) a float
-1: (varType) a string
-2: (variable) a string
+a reference to a list containing 2 items:
+0: (compound) a compound_id
+1: (name) a string
 
 </pre>
 
@@ -25888,10 +27258,9 @@ a reference to a list containing 3 items:
 
 =begin text
 
-a reference to a list containing 3 items:
-0: (coefficient) a float
-1: (varType) a string
-2: (variable) a string
+a reference to a list containing 2 items:
+0: (compound) a compound_id
+1: (name) a string
 
 
 =end text
@@ -25900,7 +27269,7 @@ a reference to a list containing 3 items:
 
 
 
-=head2 constraint
+=head2 mediaAddition
 
 =over 4
 
@@ -25908,12 +27277,10 @@ a reference to a list containing 3 items:
 
 =item Description
 
-Custom constraint in FBA simulation
+Media component added in gapfill solution
 
-float rhs - right hand side of custom constraint
-string sign - sign of custom constraint (e.g. <, >)
-list<term> terms - terms in custom constraint
-string name - name of custom constraint
+compound_id compound - ID of media component added
+string name - name of media component added
 
 
 =item Definition
@@ -25921,11 +27288,9 @@ string name - name of custom constraint
 =begin html
 
 <pre>
-a reference to a list containing 4 items:
-0: (rhs) a float
-1: (sign) a string
-2: (terms) a reference to a list where each element is a term
-3: (name) a string
+a reference to a list containing 2 items:
+0: (compound) a compound_id
+1: (name) a string
 
 </pre>
 
@@ -25933,11 +27298,9 @@ a reference to a list containing 4 items:
 
 =begin text
 
-a reference to a list containing 4 items:
-0: (rhs) a float
-1: (sign) a string
-2: (terms) a reference to a list where each element is a term
-3: (name) a string
+a reference to a list containing 2 items:
+0: (compound) a compound_id
+1: (name) a string
 
 
 =end text
@@ -25946,7 +27309,7 @@ a reference to a list containing 4 items:
 
 
 
-=head2 FBAFormulation
+=head2 GapFillSolution
 
 =over 4
 
@@ -25956,30 +27319,11 @@ a reference to a list containing 4 items:
 
 Data structures for gapfilling solution
 
-media_id media - ID of media formulation to be used
-list<compound_id> additionalcpds - list of additional compounds to allow update
-promconstraint_id promconstraint - ID of promconstraint
-workspace_id promconstraint_workspace - workspace containing promconstraint
-sample_id eflux_sample - ID of gene expression sample to run eflux
-series_id eflux_series - ID of series that a sample belongs to.
-workspace_id eflux_workspace - workspace containing gene expression sample series for eflux
-workspace_id media_workspace - workspace containing media for FBA study
-float objfraction - fraction of objective to use for constraints
-bool allreversible - flag indicating if all reactions should be reversible
-bool maximizeObjective - flag indicating if objective should be maximized
-list<term> objectiveTerms - list of terms of objective function
-list<feature_id> geneko - list of gene knockouts
-list<reaction_id> rxnko - list of reaction knockouts
-list<bound> bounds - list of custom bounds
-list<constraint> constraints - list of custom constraints
-mapping<string,float> uptakelim - hash of maximum uptake for elements
-float defaultmaxflux - default maximum intracellular flux
-float defaultminuptake - default minimum nutrient uptake
-float defaultmaxuptake - default maximum nutrient uptake
-bool simplethermoconst - flag indicating if simple thermodynamic constraints should be used
-bool thermoconst - flag indicating if thermodynamic constraints should be used
-bool nothermoerror - flag indicating if no error should be allowed in thermodynamic constraints
-bool minthermoerror - flag indicating if error should be minimized in thermodynamic constraints
+gapfillsolution_id id - ID of gapfilling solution
+        float objective - cost of gapfilling solution
+list<biomassRemoval> biomassRemovals - list of biomass components being removed
+list<mediaAddition> mediaAdditions - list of media components being added
+list<reactionAddition> reactionAdditions - list of reactions being added
 
 
 =item Definition
@@ -25988,30 +27332,12 @@ bool minthermoerror - flag indicating if error should be minimized in thermodyna
 
 <pre>
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-additionalcpds has a value which is a reference to a list where each element is a compound_id
-promconstraint has a value which is a promconstraint_id
-promconstraint_workspace has a value which is a workspace_id
-eflux_sample has a value which is a sample_id
-eflux_series has a value which is a series_id
-eflux_workspace has a value which is a workspace_id
-media_workspace has a value which is a workspace_id
-objfraction has a value which is a float
-allreversible has a value which is a bool
-maximizeObjective has a value which is a bool
-objectiveTerms has a value which is a reference to a list where each element is a term
-geneko has a value which is a reference to a list where each element is a feature_id
-rxnko has a value which is a reference to a list where each element is a reaction_id
-bounds has a value which is a reference to a list where each element is a bound
-constraints has a value which is a reference to a list where each element is a constraint
-uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
-defaultmaxflux has a value which is a float
-defaultminuptake has a value which is a float
-defaultmaxuptake has a value which is a float
-simplethermoconst has a value which is a bool
-thermoconst has a value which is a bool
-nothermoerror has a value which is a bool
-minthermoerror has a value which is a bool
+id has a value which is a gapfillsolution_id
+objective has a value which is a float
+integrated has a value which is a bool
+biomassRemovals has a value which is a reference to a list where each element is a biomassRemoval
+mediaAdditions has a value which is a reference to a list where each element is a mediaAddition
+reactionAdditions has a value which is a reference to a list where each element is a reactionAddition
 
 </pre>
 
@@ -26020,30 +27346,12 @@ minthermoerror has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-additionalcpds has a value which is a reference to a list where each element is a compound_id
-promconstraint has a value which is a promconstraint_id
-promconstraint_workspace has a value which is a workspace_id
-eflux_sample has a value which is a sample_id
-eflux_series has a value which is a series_id
-eflux_workspace has a value which is a workspace_id
-media_workspace has a value which is a workspace_id
-objfraction has a value which is a float
-allreversible has a value which is a bool
-maximizeObjective has a value which is a bool
-objectiveTerms has a value which is a reference to a list where each element is a term
-geneko has a value which is a reference to a list where each element is a feature_id
-rxnko has a value which is a reference to a list where each element is a reaction_id
-bounds has a value which is a reference to a list where each element is a bound
-constraints has a value which is a reference to a list where each element is a constraint
-uptakelim has a value which is a reference to a hash where the key is a string and the value is a float
-defaultmaxflux has a value which is a float
-defaultminuptake has a value which is a float
-defaultmaxuptake has a value which is a float
-simplethermoconst has a value which is a bool
-thermoconst has a value which is a bool
-nothermoerror has a value which is a bool
-minthermoerror has a value which is a bool
+id has a value which is a gapfillsolution_id
+objective has a value which is a float
+integrated has a value which is a bool
+biomassRemovals has a value which is a reference to a list where each element is a biomassRemoval
+mediaAdditions has a value which is a reference to a list where each element is a mediaAddition
+reactionAdditions has a value which is a reference to a list where each element is a reactionAddition
 
 
 =end text
@@ -26052,7 +27360,7 @@ minthermoerror has a value which is a bool
 
 
 
-=head2 FBA
+=head2 GapFill
 
 =over 4
 
@@ -26060,20 +27368,15 @@ minthermoerror has a value which is a bool
 
 =item Description
 
-Data structures for gapfilling solution
+Data structures for gapfilling analysis
 
-fba_id id - ID of FBA study
-workspace_id workspace - workspace containing FBA study
-        fbamodel_id model - ID of model FBA was run on
-        workspace_id model_workspace - workspace with FBA model
-        float objective - objective value of FBA study
-        bool isComplete - flag indicating if job is complete
-FBAFormulation formulation - specs for FBA study
-list<MinimalMediaPrediction> minimalMediaPredictions - list of minimal media formulation
-list<MetaboliteProduction> metaboliteProductions - list of biomass component production
-list<ReactionFlux> reactionFluxes - list of reaction fluxes
-list<CompoundFlux> compoundFluxes - list of compound uptake fluxes
-list<GeneAssertion> geneAssertions - list of gene assertions
+gapfill_id id - ID of gapfill analysis
+workspace_id workspace - workspace containing gapfill analysis
+fbamodel_id model - ID of model being gapfilled
+        workspace_id model_workspace - workspace containing model
+        bool isComplete - indicates if gapfilling is complete
+GapfillingFormulation formulation - formulation of gapfilling analysis
+list<GapFillSolution> solutions - list of gapfilling solutions
 
 
 =item Definition
@@ -26082,18 +27385,13 @@ list<GeneAssertion> geneAssertions - list of gene assertions
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a fba_id
+id has a value which is a gapfill_id
 workspace has a value which is a workspace_id
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
-objective has a value which is a float
 isComplete has a value which is a bool
-formulation has a value which is an FBAFormulation
-minimalMediaPredictions has a value which is a reference to a list where each element is a MinimalMediaPrediction
-metaboliteProductions has a value which is a reference to a list where each element is a MetaboliteProduction
-reactionFluxes has a value which is a reference to a list where each element is a ReactionFlux
-compoundFluxes has a value which is a reference to a list where each element is a CompoundFlux
-geneAssertions has a value which is a reference to a list where each element is a GeneAssertion
+formulation has a value which is a GapfillingFormulation
+solutions has a value which is a reference to a list where each element is a GapFillSolution
 
 </pre>
 
@@ -26102,18 +27400,13 @@ geneAssertions has a value which is a reference to a list where each element is
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a fba_id
+id has a value which is a gapfill_id
 workspace has a value which is a workspace_id
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
-objective has a value which is a float
 isComplete has a value which is a bool
-formulation has a value which is an FBAFormulation
-minimalMediaPredictions has a value which is a reference to a list where each element is a MinimalMediaPrediction
-metaboliteProductions has a value which is a reference to a list where each element is a MetaboliteProduction
-reactionFluxes has a value which is a reference to a list where each element is a ReactionFlux
-compoundFluxes has a value which is a reference to a list where each element is a CompoundFlux
-geneAssertions has a value which is a reference to a list where each element is a GeneAssertion
+formulation has a value which is a GapfillingFormulation
+solutions has a value which is a reference to a list where each element is a GapFillSolution
 
 
 =end text
@@ -26122,7 +27415,7 @@ geneAssertions has a value which is a reference to a list where each element is
 
 
 
-=head2 GapfillingFormulation
+=head2 GapgenFormulation
 
 =over 4
 
@@ -26131,7 +27424,7 @@ geneAssertions has a value which is a reference to a list where each element is
 =item Description
 
 ********************************************************************************
-    Gapfilling type definition
+    Gap Generation type definition
    	********************************************************************************
 
 
@@ -26142,26 +27435,13 @@ geneAssertions has a value which is a reference to a list where each element is
 <pre>
 a reference to a hash where the following keys are defined:
 formulation has a value which is an FBAFormulation
+refmedia has a value which is a media_id
+refmedia_workspace has a value which is a workspace_id
 num_solutions has a value which is an int
 nomediahyp has a value which is a bool
 nobiomasshyp has a value which is a bool
 nogprhyp has a value which is a bool
 nopathwayhyp has a value which is a bool
-allowunbalanced has a value which is a bool
-activitybonus has a value which is a float
-drainpen has a value which is a float
-directionpen has a value which is a float
-nostructpen has a value which is a float
-unfavorablepen has a value which is a float
-nodeltagpen has a value which is a float
-biomasstranspen has a value which is a float
-singletranspen has a value which is a float
-transpen has a value which is a float
-blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
-gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
-allowedcmps has a value which is a reference to a list where each element is a compartment_id
-probabilisticAnnotation has a value which is a probanno_id
-probabilisticAnnotation_workspace has a value which is a workspace_id
 
 </pre>
 
@@ -26171,26 +27451,13 @@ probabilisticAnnotation_workspace has a value which is a workspace_id
 
 a reference to a hash where the following keys are defined:
 formulation has a value which is an FBAFormulation
+refmedia has a value which is a media_id
+refmedia_workspace has a value which is a workspace_id
 num_solutions has a value which is an int
 nomediahyp has a value which is a bool
 nobiomasshyp has a value which is a bool
 nogprhyp has a value which is a bool
 nopathwayhyp has a value which is a bool
-allowunbalanced has a value which is a bool
-activitybonus has a value which is a float
-drainpen has a value which is a float
-directionpen has a value which is a float
-nostructpen has a value which is a float
-unfavorablepen has a value which is a float
-nodeltagpen has a value which is a float
-biomasstranspen has a value which is a float
-singletranspen has a value which is a float
-transpen has a value which is a float
-blacklistedrxns has a value which is a reference to a list where each element is a reaction_id
-gauranteedrxns has a value which is a reference to a list where each element is a reaction_id
-allowedcmps has a value which is a reference to a list where each element is a compartment_id
-probabilisticAnnotation has a value which is a probanno_id
-probabilisticAnnotation_workspace has a value which is a workspace_id
 
 
 =end text
@@ -26199,7 +27466,7 @@ probabilisticAnnotation_workspace has a value which is a workspace_id
 
 
 
-=head2 reactionAddition
+=head2 reactionRemoval
 
 =over 4
 
@@ -26220,12 +27487,11 @@ string definition - stoichiometry of removed reaction in terms of compound names
 =begin html
 
 <pre>
-a reference to a list containing 5 items:
-0: (reaction) a reaction_id
+a reference to a list containing 4 items:
+0: (reaction) a modelreaction_id
 1: (direction) a string
-2: (compartment_id) a string
-3: (equation) a string
-4: (definition) a string
+2: (equation) a string
+3: (definition) a string
 
 </pre>
 
@@ -26233,12 +27499,11 @@ a reference to a list containing 5 items:
 
 =begin text
 
-a reference to a list containing 5 items:
-0: (reaction) a reaction_id
+a reference to a list containing 4 items:
+0: (reaction) a modelreaction_id
 1: (direction) a string
-2: (compartment_id) a string
-3: (equation) a string
-4: (definition) a string
+2: (equation) a string
+3: (definition) a string
 
 
 =end text
@@ -26247,7 +27512,7 @@ a reference to a list containing 5 items:
 
 
 
-=head2 biomassRemoval
+=head2 biomassAddition
 
 =over 4
 
@@ -26255,10 +27520,10 @@ a reference to a list containing 5 items:
 
 =item Description
 
-Biomass component removed in gapfill solution
+Compounds added to biomass in gapgen solution
 
-compound_id compound - ID of biomass component removed
-string name - name of biomass component removed
+compound_id compound - ID of biomass compound added
+string name - name of biomass compound added
 
 
 =item Definition
@@ -26287,7 +27552,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 mediaAddition
+=head2 mediaRemoval
 
 =over 4
 
@@ -26295,10 +27560,10 @@ a reference to a list containing 2 items:
 
 =item Description
 
-Media component added in gapfill solution
+Media components removed in gapgen solution
 
-compound_id compound - ID of media component added
-string name - name of media component added
+compound_id compound - ID of media component removed
+string name - name of media component removed
 
 
 =item Definition
@@ -26327,7 +27592,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 GapFillSolution
+=head2 GapgenSolution
 
 =over 4
 
@@ -26335,13 +27600,13 @@ a reference to a list containing 2 items:
 
 =item Description
 
-Data structures for gapfilling solution
+Data structures for gap generation solution
 
-gapfillsolution_id id - ID of gapfilling solution
-        float objective - cost of gapfilling solution
-list<biomassRemoval> biomassRemovals - list of biomass components being removed
-list<mediaAddition> mediaAdditions - list of media components being added
-list<reactionAddition> reactionAdditions - list of reactions being added
+gapgensolution_id id - ID of gapgen solution
+        float objective - cost of gapgen solution
+list<biomassAddition> biomassAdditions - list of components added to biomass
+list<mediaRemoval> mediaRemovals - list of media components removed
+list<reactionRemoval> reactionRemovals - list of reactions removed
 
 
 =item Definition
@@ -26350,12 +27615,11 @@ list<reactionAddition> reactionAdditions - list of reactions being added
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a gapfillsolution_id
+id has a value which is a gapgensolution_id
 objective has a value which is a float
-integrated has a value which is a bool
-biomassRemovals has a value which is a reference to a list where each element is a biomassRemoval
-mediaAdditions has a value which is a reference to a list where each element is a mediaAddition
-reactionAdditions has a value which is a reference to a list where each element is a reactionAddition
+biomassAdditions has a value which is a reference to a list where each element is a biomassAddition
+mediaRemovals has a value which is a reference to a list where each element is a mediaRemoval
+reactionRemovals has a value which is a reference to a list where each element is a reactionRemoval
 
 </pre>
 
@@ -26364,12 +27628,11 @@ reactionAdditions has a value which is a reference to a list where each element
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a gapfillsolution_id
+id has a value which is a gapgensolution_id
 objective has a value which is a float
-integrated has a value which is a bool
-biomassRemovals has a value which is a reference to a list where each element is a biomassRemoval
-mediaAdditions has a value which is a reference to a list where each element is a mediaAddition
-reactionAdditions has a value which is a reference to a list where each element is a reactionAddition
+biomassAdditions has a value which is a reference to a list where each element is a biomassAddition
+mediaRemovals has a value which is a reference to a list where each element is a mediaRemoval
+reactionRemovals has a value which is a reference to a list where each element is a reactionRemoval
 
 
 =end text
@@ -26378,7 +27641,7 @@ reactionAdditions has a value which is a reference to a list where each element
 
 
 
-=head2 GapFill
+=head2 GapGen
 
 =over 4
 
@@ -26386,15 +27649,15 @@ reactionAdditions has a value which is a reference to a list where each element
 
 =item Description
 
-Data structures for gapfilling analysis
+Data structures for gap generation analysis
 
-gapfill_id id - ID of gapfill analysis
-workspace_id workspace - workspace containing gapfill analysis
-fbamodel_id model - ID of model being gapfilled
+gapgen_id id - ID of gapgen object
+workspace_id workspace - workspace containing gapgen object
+fbamodel_id model - ID of model being gap generated
         workspace_id model_workspace - workspace containing model
-        bool isComplete - indicates if gapfilling is complete
-GapfillingFormulation formulation - formulation of gapfilling analysis
-list<GapFillSolution> solutions - list of gapfilling solutions
+        bool isComplete - flag indicating if gap generation is complete
+GapgenFormulation formulation - formulation of gap generation analysis
+list<GapgenSolution> solutions - list of gap generation solutions
 
 
 =item Definition
@@ -26403,13 +27666,13 @@ list<GapFillSolution> solutions - list of gapfilling solutions
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a gapfill_id
+id has a value which is a gapgen_id
 workspace has a value which is a workspace_id
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
 isComplete has a value which is a bool
-formulation has a value which is a GapfillingFormulation
-solutions has a value which is a reference to a list where each element is a GapFillSolution
+formulation has a value which is a GapgenFormulation
+solutions has a value which is a reference to a list where each element is a GapgenSolution
 
 </pre>
 
@@ -26418,13 +27681,13 @@ solutions has a value which is a reference to a list where each element is a Gap
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a gapfill_id
+id has a value which is a gapgen_id
 workspace has a value which is a workspace_id
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
 isComplete has a value which is a bool
-formulation has a value which is a GapfillingFormulation
-solutions has a value which is a reference to a list where each element is a GapFillSolution
+formulation has a value which is a GapgenFormulation
+solutions has a value which is a reference to a list where each element is a GapgenSolution
 
 
 =end text
@@ -26433,7 +27696,7 @@ solutions has a value which is a reference to a list where each element is a Gap
 
 
 
-=head2 GapgenFormulation
+=head2 Phenotype
 
 =over 4
 
@@ -26442,24 +27705,76 @@ solutions has a value which is a reference to a list where each element is a Gap
 =item Description
 
 ********************************************************************************
-    Gap Generation type definition
+    Phenotype type definitions
    	********************************************************************************
 
 
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a list containing 6 items:
+0: (geneKO) a reference to a list where each element is a feature_id
+1: (baseMedia) a media_id
+2: (media_workspace) a workspace_id
+3: (additionalCpd) a reference to a list where each element is a compound_id
+4: (normalizedGrowth) a float
+5: (label) a string
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a list containing 6 items:
+0: (geneKO) a reference to a list where each element is a feature_id
+1: (baseMedia) a media_id
+2: (media_workspace) a workspace_id
+3: (additionalCpd) a reference to a list where each element is a compound_id
+4: (normalizedGrowth) a float
+5: (label) a string
+
+
+=end text
+
+=back
+
+
+
+=head2 PhenotypeSet
+
+=over 4
+
+
+
+=item Description
+
+Data structures for set of growth phenotype observations
+
+phenotype_set_id id - ID of the phenotype set
+genome_id genome - ID of the genome for the strain used with the growth phenotypes
+workspace_id genome_workspace - workspace containing the genome object
+list<Phenotype> phenotypes - list of phenotypes included in the phenotype set
+string importErrors - list of errors encountered during the import of the phenotype set
+string source - source of the phenotype set
+string name - name of the phenotype set
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-formulation has a value which is an FBAFormulation
-refmedia has a value which is a media_id
-refmedia_workspace has a value which is a workspace_id
-num_solutions has a value which is an int
-nomediahyp has a value which is a bool
-nobiomasshyp has a value which is a bool
-nogprhyp has a value which is a bool
-nopathwayhyp has a value which is a bool
+id has a value which is a phenotype_set_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+phenotypes has a value which is a reference to a list where each element is a Phenotype
+source has a value which is a string
+name has a value which is a string
+importErrors has a value which is a string
 
 </pre>
 
@@ -26468,14 +27783,13 @@ nopathwayhyp has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-formulation has a value which is an FBAFormulation
-refmedia has a value which is a media_id
-refmedia_workspace has a value which is a workspace_id
-num_solutions has a value which is an int
-nomediahyp has a value which is a bool
-nobiomasshyp has a value which is a bool
-nogprhyp has a value which is a bool
-nopathwayhyp has a value which is a bool
+id has a value which is a phenotype_set_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+phenotypes has a value which is a reference to a list where each element is a Phenotype
+source has a value which is a string
+name has a value which is a string
+importErrors has a value which is a string
 
 
 =end text
@@ -26484,7 +27798,7 @@ nopathwayhyp has a value which is a bool
 
 
 
-=head2 reactionRemoval
+=head2 phenotypeSimulationSet_id
 
 =over 4
 
@@ -26492,12 +27806,43 @@ nopathwayhyp has a value which is a bool
 
 =item Description
 
-Reactions removed in gapgen solution
+ID of the phenotype simulation object
 
-modelreaction_id reaction - ID of the removed reaction
-string direction - direction of reaction removed in gapgen solution
-string equation - stoichiometry of removed reaction in terms of compound IDs
-string definition - stoichiometry of removed reaction in terms of compound names
+
+=item Definition
+
+=begin html
+
+<pre>
+a string
+</pre>
+
+=end html
+
+=begin text
+
+a string
+
+=end text
+
+=back
+
+
+
+=head2 PhenotypeSimulation
+
+=over 4
+
+
+
+=item Description
+
+Data structures for a phenotype simulation
+
+Phenotype phenotypeData - actual phenotype data simulated
+float simulatedGrowth - actual simulated growth rate
+float simulatedGrowthFraction - fraction of wildtype simulated growth rate
+string phenoclass - class of the phenotype simulation (i.e. 'CP' - correct positive, 'CN' - correct negative, 'FP' - false positive, 'FN' - false negative)
 
 
 =item Definition
@@ -26506,10 +27851,10 @@ string definition - stoichiometry of removed reaction in terms of compound names
 
 <pre>
 a reference to a list containing 4 items:
-0: (reaction) a modelreaction_id
-1: (direction) a string
-2: (equation) a string
-3: (definition) a string
+0: (phenotypeData) a Phenotype
+1: (simulatedGrowth) a float
+2: (simulatedGrowthFraction) a float
+3: (phenoclass) a string
 
 </pre>
 
@@ -26518,10 +27863,10 @@ a reference to a list containing 4 items:
 =begin text
 
 a reference to a list containing 4 items:
-0: (reaction) a modelreaction_id
-1: (direction) a string
-2: (equation) a string
-3: (definition) a string
+0: (phenotypeData) a Phenotype
+1: (simulatedGrowth) a float
+2: (simulatedGrowthFraction) a float
+3: (phenoclass) a string
 
 
 =end text
@@ -26530,7 +27875,7 @@ a reference to a list containing 4 items:
 
 
 
-=head2 biomassAddition
+=head2 PhenotypeSimulationSet
 
 =over 4
 
@@ -26538,30 +27883,39 @@ a reference to a list containing 4 items:
 
 =item Description
 
-Compounds added to biomass in gapgen solution
+Data structures for phenotype simulations of a set of phenotype data
 
-compound_id compound - ID of biomass compound added
-string name - name of biomass compound added
+phenotypeSimulationSet_id id - ID for the phenotype simulation set object
+fbamodel_id model - ID of the model used to simulate all phenotypes
+workspace_id model_workspace - workspace containing the model used for the simulation
+phenotype_set_id phenotypeSet - set of observed phenotypes that were simulated
+list<PhenotypeSimulation> phenotypeSimulations - list of simulated phenotypes
 
 
 =item Definition
 
 =begin html
 
-<pre>
-a reference to a list containing 2 items:
-0: (compound) a compound_id
-1: (name) a string
-
+<pre>
+a reference to a hash where the following keys are defined:
+id has a value which is a phenotypeSimulationSet_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSimulations has a value which is a reference to a list where each element is a PhenotypeSimulation
+
 </pre>
 
 =end html
 
 =begin text
 
-a reference to a list containing 2 items:
-0: (compound) a compound_id
-1: (name) a string
+a reference to a hash where the following keys are defined:
+id has a value which is a phenotypeSimulationSet_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSimulations has a value which is a reference to a list where each element is a PhenotypeSimulation
 
 
 =end text
@@ -26570,7 +27924,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 mediaRemoval
+=head2 reactionSpecification
 
 =over 4
 
@@ -26578,10 +27932,10 @@ a reference to a list containing 2 items:
 
 =item Description
 
-Media components removed in gapgen solution
+Data structure for holding gapfill or gapgen solution reaction information
 
-compound_id compound - ID of media component removed
-string name - name of media component removed
+string direction - direction of gapfilled or gapgen reaction
+string reactionID - ID of gapfilled or gapgen reaction
 
 
 =item Definition
@@ -26590,8 +27944,8 @@ string name - name of media component removed
 
 <pre>
 a reference to a list containing 2 items:
-0: (compound) a compound_id
-1: (name) a string
+0: (direction) a string
+1: (reactionID) a string
 
 </pre>
 
@@ -26600,8 +27954,8 @@ a reference to a list containing 2 items:
 =begin text
 
 a reference to a list containing 2 items:
-0: (compound) a compound_id
-1: (name) a string
+0: (direction) a string
+1: (reactionID) a string
 
 
 =end text
@@ -26610,7 +27964,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 GapgenSolution
+=head2 PhenotypeSensitivityAnalysis
 
 =over 4
 
@@ -26618,13 +27972,7 @@ a reference to a list containing 2 items:
 
 =item Description
 
-Data structures for gap generation solution
-
-gapgensolution_id id - ID of gapgen solution
-        float objective - cost of gapgen solution
-list<biomassAddition> biomassAdditions - list of components added to biomass
-list<mediaRemoval> mediaRemovals - list of media components removed
-list<reactionRemoval> reactionRemovals - list of reactions removed
+list<string id, string solutionIndex, list<reactionSpecification> reactionList, list<string> biomassEdits,list<tuple<float simulatedGrowth,float simulatedGrowthFraction,string phenoclass>> PhenotypeSimulations> reconciliationSolutionSimulations;
 
 
 =item Definition
@@ -26633,11 +27981,16 @@ list<reactionRemoval> reactionRemovals - list of reactions removed
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a gapgensolution_id
-objective has a value which is a float
-biomassAdditions has a value which is a reference to a list where each element is a biomassAddition
-mediaRemovals has a value which is a reference to a list where each element is a mediaRemoval
-reactionRemovals has a value which is a reference to a list where each element is a reactionRemoval
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSet_workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+phenotypes has a value which is a reference to a list where each element is a Phenotype
+wildtypePhenotypeSimulations has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+0: (simulatedGrowth) a float
+1: (simulatedGrowthFraction) a float
+2: (phenoclass) a string
+
 
 </pre>
 
@@ -26646,11 +27999,16 @@ reactionRemovals has a value which is a reference to a list where each element i
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a gapgensolution_id
-objective has a value which is a float
-biomassAdditions has a value which is a reference to a list where each element is a biomassAddition
-mediaRemovals has a value which is a reference to a list where each element is a mediaRemoval
-reactionRemovals has a value which is a reference to a list where each element is a reactionRemoval
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSet_workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+phenotypes has a value which is a reference to a list where each element is a Phenotype
+wildtypePhenotypeSimulations has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+0: (simulatedGrowth) a float
+1: (simulatedGrowthFraction) a float
+2: (phenoclass) a string
+
 
 
 =end text
@@ -26659,7 +28017,7 @@ reactionRemovals has a value which is a reference to a list where each element i
 
 
 
-=head2 GapGen
+=head2 job_id
 
 =over 4
 
@@ -26667,15 +28025,9 @@ reactionRemovals has a value which is a reference to a list where each element i
 
 =item Description
 
-Data structures for gap generation analysis
-
-gapgen_id id - ID of gapgen object
-workspace_id workspace - workspace containing gapgen object
-fbamodel_id model - ID of model being gap generated
-        workspace_id model_workspace - workspace containing model
-        bool isComplete - flag indicating if gap generation is complete
-GapgenFormulation formulation - formulation of gap generation analysis
-list<GapgenSolution> solutions - list of gap generation solutions
+********************************************************************************
+    Job object type definitions
+   	********************************************************************************
 
 
 =item Definition
@@ -26683,30 +28035,14 @@ list<GapgenSolution> solutions - list of gap generation solutions
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a gapgen_id
-workspace has a value which is a workspace_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-isComplete has a value which is a bool
-formulation has a value which is a GapgenFormulation
-solutions has a value which is a reference to a list where each element is a GapgenSolution
-
+a string
 </pre>
 
 =end html
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-id has a value which is a gapgen_id
-workspace has a value which is a workspace_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-isComplete has a value which is a bool
-formulation has a value which is a GapgenFormulation
-solutions has a value which is a reference to a list where each element is a GapgenSolution
-
+a string
 
 =end text
 
@@ -26714,7 +28050,7 @@ solutions has a value which is a reference to a list where each element is a Gap
 
 
 
-=head2 Phenotype
+=head2 CommandArguments
 
 =over 4
 
@@ -26722,9 +28058,7 @@ solutions has a value which is a reference to a list where each element is a Gap
 
 =item Description
 
-********************************************************************************
-    Phenotype type definitions
-   	********************************************************************************
+Object to hold the arguments to be submitted to the post process command
 
 
 =item Definition
@@ -26732,13 +28066,8 @@ solutions has a value which is a reference to a list where each element is a Gap
 =begin html
 
 <pre>
-a reference to a list containing 6 items:
-0: (geneKO) a reference to a list where each element is a feature_id
-1: (baseMedia) a media_id
-2: (media_workspace) a workspace_id
-3: (additionalCpd) a reference to a list where each element is a compound_id
-4: (normalizedGrowth) a float
-5: (label) a string
+a reference to a hash where the following keys are defined:
+auth has a value which is a string
 
 </pre>
 
@@ -26746,13 +28075,8 @@ a reference to a list containing 6 items:
 
 =begin text
 
-a reference to a list containing 6 items:
-0: (geneKO) a reference to a list where each element is a feature_id
-1: (baseMedia) a media_id
-2: (media_workspace) a workspace_id
-3: (additionalCpd) a reference to a list where each element is a compound_id
-4: (normalizedGrowth) a float
-5: (label) a string
+a reference to a hash where the following keys are defined:
+auth has a value which is a string
 
 
 =end text
@@ -26761,7 +28085,7 @@ a reference to a list containing 6 items:
 
 
 
-=head2 PhenotypeSet
+=head2 clusterjob
 
 =over 4
 
@@ -26769,15 +28093,7 @@ a reference to a list containing 6 items:
 
 =item Description
 
-Data structures for set of growth phenotype observations
-
-phenotype_set_id id - ID of the phenotype set
-genome_id genome - ID of the genome for the strain used with the growth phenotypes
-workspace_id genome_workspace - workspace containing the genome object
-list<Phenotype> phenotypes - list of phenotypes included in the phenotype set
-string importErrors - list of errors encountered during the import of the phenotype set
-string source - source of the phenotype set
-string name - name of the phenotype set
+Object to hold data required to run cluster job
 
 
 =item Definition
@@ -26786,13 +28102,7 @@ string name - name of the phenotype set
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a phenotype_set_id
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-phenotypes has a value which is a reference to a list where each element is a Phenotype
-source has a value which is a string
-name has a value which is a string
-importErrors has a value which is a string
+auth has a value which is a string
 
 </pre>
 
@@ -26801,13 +28111,7 @@ importErrors has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a phenotype_set_id
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-phenotypes has a value which is a reference to a list where each element is a Phenotype
-source has a value which is a string
-name has a value which is a string
-importErrors has a value which is a string
+auth has a value which is a string
 
 
 =end text
@@ -26816,7 +28120,7 @@ importErrors has a value which is a string
 
 
 
-=head2 phenotypeSimulationSet_id
+=head2 JobObject
 
 =over 4
 
@@ -26824,7 +28128,18 @@ importErrors has a value which is a string
 
 =item Description
 
-ID of the phenotype simulation object
+Data structures for a job object
+
+job_id id - ID of the job object
+string type - type of the job
+string auth - authentication token of job owner
+string status - current status of job
+mapping<string,string> jobdata;
+string queuetime - time when job was queued
+string starttime - time when job started running
+string completetime - time when the job was completed
+string owner - owner of the job
+string queuecommand - command used to queue job
 
 
 =item Definition
@@ -26832,14 +28147,36 @@ ID of the phenotype simulation object
 =begin html
 
 <pre>
-a string
+a reference to a hash where the following keys are defined:
+id has a value which is a job_id
+type has a value which is a string
+auth has a value which is a string
+status has a value which is a string
+jobdata has a value which is a reference to a hash where the key is a string and the value is a string
+queuetime has a value which is a string
+starttime has a value which is a string
+completetime has a value which is a string
+owner has a value which is a string
+queuecommand has a value which is a string
+
 </pre>
 
 =end html
 
 =begin text
 
-a string
+a reference to a hash where the following keys are defined:
+id has a value which is a job_id
+type has a value which is a string
+auth has a value which is a string
+status has a value which is a string
+jobdata has a value which is a reference to a hash where the key is a string and the value is a string
+queuetime has a value which is a string
+starttime has a value which is a string
+completetime has a value which is a string
+owner has a value which is a string
+queuecommand has a value which is a string
+
 
 =end text
 
@@ -26847,7 +28184,7 @@ a string
 
 
 
-=head2 PhenotypeSimulation
+=head2 ETCNodes
 
 =over 4
 
@@ -26855,12 +28192,9 @@ a string
 
 =item Description
 
-Data structures for a phenotype simulation
-
-Phenotype phenotypeData - actual phenotype data simulated
-float simulatedGrowth - actual simulated growth rate
-float simulatedGrowthFraction - fraction of wildtype simulated growth rate
-string phenoclass - class of the phenotype simulation (i.e. 'CP' - correct positive, 'CN' - correct negative, 'FP' - false positive, 'FN' - false negative)
+********************************************************************************
+    ETC object type definitions
+   	********************************************************************************
 
 
 =item Definition
@@ -26868,11 +28202,14 @@ string phenoclass - class of the phenotype simulation (i.e. 'CP' - correct posit
 =begin html
 
 <pre>
-a reference to a list containing 4 items:
-0: (phenotypeData) a Phenotype
-1: (simulatedGrowth) a float
-2: (simulatedGrowthFraction) a float
-3: (phenoclass) a string
+a reference to a hash where the following keys are defined:
+resp has a value which is a string
+y has a value which is an int
+x has a value which is an int
+width has a value which is an int
+height has a value which is an int
+shape has a value which is a string
+label has a value which is a string
 
 </pre>
 
@@ -26880,11 +28217,14 @@ a reference to a list containing 4 items:
 
 =begin text
 
-a reference to a list containing 4 items:
-0: (phenotypeData) a Phenotype
-1: (simulatedGrowth) a float
-2: (simulatedGrowthFraction) a float
-3: (phenoclass) a string
+a reference to a hash where the following keys are defined:
+resp has a value which is a string
+y has a value which is an int
+x has a value which is an int
+width has a value which is an int
+height has a value which is an int
+shape has a value which is a string
+label has a value which is a string
 
 
 =end text
@@ -26893,34 +28233,22 @@ a reference to a list containing 4 items:
 
 
 
-=head2 PhenotypeSimulationSet
+=head2 ETCDiagramSpecs
 
 =over 4
 
 
 
-=item Description
-
-Data structures for phenotype simulations of a set of phenotype data
-
-phenotypeSimulationSet_id id - ID for the phenotype simulation set object
-fbamodel_id model - ID of the model used to simulate all phenotypes
-workspace_id model_workspace - workspace containing the model used for the simulation
-phenotype_set_id phenotypeSet - set of observed phenotypes that were simulated
-list<PhenotypeSimulation> phenotypeSimulations - list of simulated phenotypes
-
-
 =item Definition
 
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-id has a value which is a phenotypeSimulationSet_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-phenotypeSet has a value which is a phenotype_set_id
-phenotypeSimulations has a value which is a reference to a list where each element is a PhenotypeSimulation
+a reference to a hash where the following keys are defined:
+nodes has a value which is a reference to a list where each element is an ETCNodes
+media has a value which is a string
+growth has a value which is a string
+organism has a value which is a string
 
 </pre>
 
@@ -26929,11 +28257,10 @@ phenotypeSimulations has a value which is a reference to a list where each eleme
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a phenotypeSimulationSet_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-phenotypeSet has a value which is a phenotype_set_id
-phenotypeSimulations has a value which is a reference to a list where each element is a PhenotypeSimulation
+nodes has a value which is a reference to a list where each element is an ETCNodes
+media has a value which is a string
+growth has a value which is a string
+organism has a value which is a string
 
 
 =end text
@@ -26942,7 +28269,7 @@ phenotypeSimulations has a value which is a reference to a list where each eleme
 
 
 
-=head2 reactionSpecification
+=head2 TemplateReactions
 
 =over 4
 
@@ -26950,10 +28277,9 @@ phenotypeSimulations has a value which is a reference to a list where each eleme
 
 =item Description
 
-Data structure for holding gapfill or gapgen solution reaction information
-
-string direction - direction of gapfilled or gapgen reaction
-string reactionID - ID of gapfilled or gapgen reaction
+********************************************************************************
+	  AutoRecon type definitions
+   	********************************************************************************
 
 
 =item Definition
@@ -26961,9 +28287,11 @@ string reactionID - ID of gapfilled or gapgen reaction
 =begin html
 
 <pre>
-a reference to a list containing 2 items:
-0: (direction) a string
-1: (reactionID) a string
+a reference to a hash where the following keys are defined:
+reaction has a value which is a reaction_id
+direction has a value which is a string
+equation has a value which is a string
+compartment has a value which is a compartment_id
 
 </pre>
 
@@ -26971,9 +28299,11 @@ a reference to a list containing 2 items:
 
 =begin text
 
-a reference to a list containing 2 items:
-0: (direction) a string
-1: (reactionID) a string
+a reference to a hash where the following keys are defined:
+reaction has a value which is a reaction_id
+direction has a value which is a string
+equation has a value which is a string
+compartment has a value which is a compartment_id
 
 
 =end text
@@ -26982,7 +28312,7 @@ a reference to a list containing 2 items:
 
 
 
-=head2 PhenotypeSensitivityAnalysis
+=head2 ComplexReactions
 
 =over 4
 
@@ -26990,7 +28320,10 @@ a reference to a list containing 2 items:
 
 =item Description
 
-list<string id, string solutionIndex, list<reactionSpecification> reactionList, list<string> biomassEdits,list<tuple<float simulatedGrowth,float simulatedGrowthFraction,string phenoclass>> PhenotypeSimulations> reconciliationSolutionSimulations;
+Information on complexes in a template model
+
+        complex_id complex - ID of the associated complex
+        list<TemplateReactions> reactions - List of template models associated with complex
 
 
 =item Definition
@@ -26999,16 +28332,9 @@ list<string id, string solutionIndex, list<reactionSpecification> reactionList,
 
 <pre>
 a reference to a hash where the following keys are defined:
-phenotypeSet has a value which is a phenotype_set_id
-phenotypeSet_workspace has a value which is a workspace_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-phenotypes has a value which is a reference to a list where each element is a Phenotype
-wildtypePhenotypeSimulations has a value which is a reference to a list where each element is a reference to a list containing 3 items:
-0: (simulatedGrowth) a float
-1: (simulatedGrowthFraction) a float
-2: (phenoclass) a string
-
+complex has a value which is a complex_id
+name has a value which is a string
+reactions has a value which is a reference to a list where each element is a TemplateReactions
 
 </pre>
 
@@ -27017,16 +28343,9 @@ wildtypePhenotypeSimulations has a value which is a reference to a list where ea
 =begin text
 
 a reference to a hash where the following keys are defined:
-phenotypeSet has a value which is a phenotype_set_id
-phenotypeSet_workspace has a value which is a workspace_id
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-phenotypes has a value which is a reference to a list where each element is a Phenotype
-wildtypePhenotypeSimulations has a value which is a reference to a list where each element is a reference to a list containing 3 items:
-0: (simulatedGrowth) a float
-1: (simulatedGrowthFraction) a float
-2: (phenoclass) a string
-
+complex has a value which is a complex_id
+name has a value which is a string
+reactions has a value which is a reference to a list where each element is a TemplateReactions
 
 
 =end text
@@ -27035,7 +28354,7 @@ wildtypePhenotypeSimulations has a value which is a reference to a list where ea
 
 
 
-=head2 job_id
+=head2 RoleComplexReactions
 
 =over 4
 
@@ -27043,9 +28362,10 @@ wildtypePhenotypeSimulations has a value which is a reference to a list where ea
 
 =item Description
 
-********************************************************************************
-    Job object type definitions
-   	********************************************************************************
+Information on complexes in a template model
+
+        complex_id complex - ID of the associated complex
+        list<TemplateReactions> reactions - List of template models associated with complex
 
 
 =item Definition
@@ -27053,14 +28373,22 @@ wildtypePhenotypeSimulations has a value which is a reference to a list where ea
 =begin html
 
 <pre>
-a string
+a reference to a hash where the following keys are defined:
+role has a value which is a role_id
+name has a value which is a string
+complexes has a value which is a reference to a list where each element is a ComplexReactions
+
 </pre>
 
 =end html
 
 =begin text
 
-a string
+a reference to a hash where the following keys are defined:
+role has a value which is a role_id
+name has a value which is a string
+complexes has a value which is a reference to a list where each element is a ComplexReactions
+
 
 =end text
 
@@ -27068,7 +28396,7 @@ a string
 
 
 
-=head2 CommandArguments
+=head2 ReactionDefinition
 
 =over 4
 
@@ -27076,7 +28404,11 @@ a string
 
 =item Description
 
-Object to hold the arguments to be submitted to the post process command
+Reaction definition
+
+        reaction_id id - ID of reaction
+        string name - name of reaction
+        string definition - stoichiometric equation of reaction in terms of compound names
 
 
 =item Definition
@@ -27085,7 +28417,9 @@ Object to hold the arguments to be submitted to the post process command
 
 <pre>
 a reference to a hash where the following keys are defined:
-auth has a value which is a string
+id has a value which is a reaction_id
+name has a value which is a string
+definition has a value which is a string
 
 </pre>
 
@@ -27094,7 +28428,9 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-auth has a value which is a string
+id has a value which is a reaction_id
+name has a value which is a string
+definition has a value which is a string
 
 
 =end text
@@ -27103,7 +28439,7 @@ auth has a value which is a string
 
 
 
-=head2 clusterjob
+=head2 ReactionSynonyms
 
 =over 4
 
@@ -27111,7 +28447,10 @@ auth has a value which is a string
 
 =item Description
 
-Object to hold data required to run cluster job
+Reaction synonyms
+
+        reaction_id primary - ID of primary reaction
+        list<ReactionDefinition> synonyms - list of synonym reactions to the primary reaction (including itself)
 
 
 =item Definition
@@ -27120,7 +28459,8 @@ Object to hold data required to run cluster job
 
 <pre>
 a reference to a hash where the following keys are defined:
-auth has a value which is a string
+primary has a value which is a reaction_id
+synonyms has a value which is a reference to a list where each element is a ReactionDefinition
 
 </pre>
 
@@ -27129,7 +28469,8 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-auth has a value which is a string
+primary has a value which is a reaction_id
+synonyms has a value which is a reference to a list where each element is a ReactionDefinition
 
 
 =end text
@@ -27138,7 +28479,7 @@ auth has a value which is a string
 
 
 
-=head2 JobObject
+=head2 ReactionSynonymsObject
 
 =over 4
 
@@ -27146,18 +28487,13 @@ auth has a value which is a string
 
 =item Description
 
-Data structures for a job object
+Reaction synonyms object
 
-job_id id - ID of the job object
-string type - type of the job
-string auth - authentication token of job owner
-string status - current status of job
-mapping<string,string> jobdata;
-string queuetime - time when job was queued
-string starttime - time when job started running
-string completetime - time when the job was completed
-string owner - owner of the job
-string queuecommand - command used to queue job
+        int version - version number of object
+        biochemistry_id biochemistry - ID of associated biochemistry database
+        workspace_id biochemistry_workspace - workspace with associated biochemistry database
+        list<ReactionSynonyms> synonym_list - list of all reaction synonyms from a biochemistry database
+        list<ReactionDefinition> excluded_list - list of reactions excluded because all compounds are cofactors
 
 
 =item Definition
@@ -27166,16 +28502,11 @@ string queuecommand - command used to queue job
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a job_id
-type has a value which is a string
-auth has a value which is a string
-status has a value which is a string
-jobdata has a value which is a reference to a hash where the key is a string and the value is a string
-queuetime has a value which is a string
-starttime has a value which is a string
-completetime has a value which is a string
-owner has a value which is a string
-queuecommand has a value which is a string
+version has a value which is an int
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
+synonyms_list has a value which is a reference to a list where each element is a ReactionSynonyms
+excluded_list has a value which is a reference to a list where each element is a ReactionDefinition
 
 </pre>
 
@@ -27184,16 +28515,11 @@ queuecommand has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a job_id
-type has a value which is a string
-auth has a value which is a string
-status has a value which is a string
-jobdata has a value which is a reference to a hash where the key is a string and the value is a string
-queuetime has a value which is a string
-starttime has a value which is a string
-completetime has a value which is a string
-owner has a value which is a string
-queuecommand has a value which is a string
+version has a value which is an int
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
+synonyms_list has a value which is a reference to a list where each element is a ReactionSynonyms
+excluded_list has a value which is a reference to a list where each element is a ReactionDefinition
 
 
 =end text
@@ -27202,7 +28528,7 @@ queuecommand has a value which is a string
 
 
 
-=head2 ETCNodes
+=head2 get_models_params
 
 =over 4
 
@@ -27211,7 +28537,7 @@ queuecommand has a value which is a string
 =item Description
 
 ********************************************************************************
-    ETC object type definitions
+    Function definitions relating to data retrieval for Model Objects
    	********************************************************************************
 
 
@@ -27221,13 +28547,10 @@ queuecommand has a value which is a string
 
 <pre>
 a reference to a hash where the following keys are defined:
-resp has a value which is a string
-y has a value which is an int
-x has a value which is an int
-width has a value which is an int
-height has a value which is an int
-shape has a value which is a string
-label has a value which is a string
+models has a value which is a reference to a list where each element is a fbamodel_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -27236,13 +28559,10 @@ label has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-resp has a value which is a string
-y has a value which is an int
-x has a value which is an int
-width has a value which is an int
-height has a value which is an int
-shape has a value which is a string
-label has a value which is a string
+models has a value which is a reference to a list where each element is a fbamodel_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -27251,22 +28571,32 @@ label has a value which is a string
 
 
 
-=head2 ETCDiagramSpecs
+=head2 get_fbas_params
 
 =over 4
 
 
 
+=item Description
+
+Input parameters for the "get_fbas" function.
+
+        list<fba_id> fbas - a list of the FBA study IDs for the FBA studies to be returned (a required argument)
+        list<workspace_id> workspaces - a list of the workspaces contianing the FBA studies to be returned (a required argument)
+string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-nodes has a value which is a reference to a list where each element is an ETCNodes
-media has a value which is a string
-growth has a value which is a string
-organism has a value which is a string
+fbas has a value which is a reference to a list where each element is a fba_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -27275,10 +28605,10 @@ organism has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-nodes has a value which is a reference to a list where each element is an ETCNodes
-media has a value which is a string
-growth has a value which is a string
-organism has a value which is a string
+fbas has a value which is a reference to a list where each element is a fba_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -27287,7 +28617,7 @@ organism has a value which is a string
 
 
 
-=head2 TemplateReactions
+=head2 get_gapfills_params
 
 =over 4
 
@@ -27295,9 +28625,12 @@ organism has a value which is a string
 
 =item Description
 
-********************************************************************************
-	  AutoRecon type definitions
-   	********************************************************************************
+Input parameters for the "get_gapfills" function.
+
+        list<gapfill_id> gapfills - a list of the gapfill study IDs for the gapfill studies to be returned (a required argument)
+        list<workspace_id> workspaces - a list of the workspaces contianing the gapfill studies to be returned (a required argument)
+string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -27306,10 +28639,10 @@ organism has a value which is a string
 
 <pre>
 a reference to a hash where the following keys are defined:
-reaction has a value which is a reaction_id
-direction has a value which is a string
-equation has a value which is a string
-compartment has a value which is a compartment_id
+gapfills has a value which is a reference to a list where each element is a gapfill_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -27318,10 +28651,10 @@ compartment has a value which is a compartment_id
 =begin text
 
 a reference to a hash where the following keys are defined:
-reaction has a value which is a reaction_id
-direction has a value which is a string
-equation has a value which is a string
-compartment has a value which is a compartment_id
+gapfills has a value which is a reference to a list where each element is a gapfill_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -27330,7 +28663,7 @@ compartment has a value which is a compartment_id
 
 
 
-=head2 ComplexReactions
+=head2 get_gapgens_params
 
 =over 4
 
@@ -27338,10 +28671,12 @@ compartment has a value which is a compartment_id
 
 =item Description
 
-Information on complexes in a template model
+Input parameters for the "get_gapgens" function.
 
-        complex_id complex - ID of the associated complex
-        list<TemplateReactions> reactions - List of template models associated with complex
+        list<gapgen_id> gapgens - a list of the gapgen study IDs for the gapgen studies to be returned (a required argument)
+        list<workspace_id> workspaces - a list of the workspaces contianing the gapgen studies to be returned (a required argument)
+string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -27350,9 +28685,10 @@ Information on complexes in a template model
 
 <pre>
 a reference to a hash where the following keys are defined:
-complex has a value which is a complex_id
-name has a value which is a string
-reactions has a value which is a reference to a list where each element is a TemplateReactions
+gapgens has a value which is a reference to a list where each element is a gapgen_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -27361,9 +28697,10 @@ reactions has a value which is a reference to a list where each element is a Tem
 =begin text
 
 a reference to a hash where the following keys are defined:
-complex has a value which is a complex_id
-name has a value which is a string
-reactions has a value which is a reference to a list where each element is a TemplateReactions
+gapgens has a value which is a reference to a list where each element is a gapgen_id
+workspaces has a value which is a reference to a list where each element is a workspace_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -27372,7 +28709,7 @@ reactions has a value which is a reference to a list where each element is a Tem
 
 
 
-=head2 RoleComplexReactions
+=head2 get_reactions_params
 
 =over 4
 
@@ -27380,10 +28717,11 @@ reactions has a value which is a reference to a list where each element is a Tem
 
 =item Description
 
-Information on complexes in a template model
+Input parameters for the "get_reactions" function.
 
-        complex_id complex - ID of the associated complex
-        list<TemplateReactions> reactions - List of template models associated with complex
+        list<reaction_id> reactions - a list of the reaction IDs for the reactions to be returned (a required argument)
+        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -27392,9 +28730,9 @@ Information on complexes in a template model
 
 <pre>
 a reference to a hash where the following keys are defined:
-role has a value which is a role_id
-name has a value which is a string
-complexes has a value which is a reference to a list where each element is a ComplexReactions
+reactions has a value which is a reference to a list where each element is a reaction_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -27403,9 +28741,9 @@ complexes has a value which is a reference to a list where each element is a Com
 =begin text
 
 a reference to a hash where the following keys are defined:
-role has a value which is a role_id
-name has a value which is a string
-complexes has a value which is a reference to a list where each element is a ComplexReactions
+reactions has a value which is a reference to a list where each element is a reaction_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -27414,7 +28752,7 @@ complexes has a value which is a reference to a list where each element is a Com
 
 
 
-=head2 ReactionDefinition
+=head2 get_compounds_params
 
 =over 4
 
@@ -27422,11 +28760,10 @@ complexes has a value which is a reference to a list where each element is a Com
 
 =item Description
 
-Reaction definition
-
-        reaction_id id - ID of reaction
-        string name - name of reaction
-        string definition - stoichiometric equation of reaction in terms of compound names
+Input parameters for the "get_compounds" function.        
+list<compound_id> compounds - a list of the compound IDs for the compounds to be returned (a required argument)
+string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -27435,9 +28772,9 @@ Reaction definition
 
 <pre>
 a reference to a hash where the following keys are defined:
-id has a value which is a reaction_id
-name has a value which is a string
-definition has a value which is a string
+compounds has a value which is a reference to a list where each element is a compound_id
+auth has a value which is a string
+id_type has a value which is a string
 
 </pre>
 
@@ -27446,9 +28783,9 @@ definition has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-id has a value which is a reaction_id
-name has a value which is a string
-definition has a value which is a string
+compounds has a value which is a reference to a list where each element is a compound_id
+auth has a value which is a string
+id_type has a value which is a string
 
 
 =end text
@@ -27457,7 +28794,7 @@ definition has a value which is a string
 
 
 
-=head2 ReactionSynonyms
+=head2 get_alias_params
 
 =over 4
 
@@ -27465,10 +28802,13 @@ definition has a value which is a string
 
 =item Description
 
-Reaction synonyms
+Input parameters for the get_alias function
 
-        reaction_id primary - ID of primary reaction
-        list<ReactionDefinition> synonyms - list of synonym reactions to the primary reaction (including itself)
+                string object_type    - The type of object (e.g. Compound or Reaction)
+                string input_id_type - The type (e.g. ModelSEED) of alias to be inputted
+                string output_id_type - The type (e.g. KEGG) of alias to be outputted
+                list<string> input_ids - A list of input IDs
+                string auth; - The authentication token of the KBase account (optional)
 
 
 =item Definition
@@ -27477,8 +28817,11 @@ Reaction synonyms
 
 <pre>
 a reference to a hash where the following keys are defined:
-primary has a value which is a reaction_id
-synonyms has a value which is a reference to a list where each element is a ReactionDefinition
+object_type has a value which is a string
+input_id_type has a value which is a string
+output_id_type has a value which is a string
+input_ids has a value which is a reference to a list where each element is a string
+auth has a value which is a string
 
 </pre>
 
@@ -27487,8 +28830,11 @@ synonyms has a value which is a reference to a list where each element is a Reac
 =begin text
 
 a reference to a hash where the following keys are defined:
-primary has a value which is a reaction_id
-synonyms has a value which is a reference to a list where each element is a ReactionDefinition
+object_type has a value which is a string
+input_id_type has a value which is a string
+output_id_type has a value which is a string
+input_ids has a value which is a reference to a list where each element is a string
+auth has a value which is a string
 
 
 =end text
@@ -27497,7 +28843,7 @@ synonyms has a value which is a reference to a list where each element is a Reac
 
 
 
-=head2 ReactionSynonymsObject
+=head2 get_alias_outputs
 
 =over 4
 
@@ -27505,13 +28851,10 @@ synonyms has a value which is a reference to a list where each element is a Reac
 
 =item Description
 
-Reaction synonyms object
+Output for get_alias function
 
-        int version - version number of object
-        biochemistry_id biochemistry - ID of associated biochemistry database
-        workspace_id biochemistry_workspace - workspace with associated biochemistry database
-        list<ReactionSynonyms> synonym_list - list of all reaction synonyms from a biochemistry database
-        list<ReactionDefinition> excluded_list - list of reactions excluded because all compounds are cofactors
+              string original_id - The original ID
+              list<string> aliases - Aliases for the original ID in the new format
 
 
 =item Definition
@@ -27520,11 +28863,8 @@ Reaction synonyms object
 
 <pre>
 a reference to a hash where the following keys are defined:
-version has a value which is an int
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
-synonyms_list has a value which is a reference to a list where each element is a ReactionSynonyms
-excluded_list has a value which is a reference to a list where each element is a ReactionDefinition
+original_id has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
 
 </pre>
 
@@ -27533,11 +28873,8 @@ excluded_list has a value which is a reference to a list where each element is a
 =begin text
 
 a reference to a hash where the following keys are defined:
-version has a value which is an int
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
-synonyms_list has a value which is a reference to a list where each element is a ReactionSynonyms
-excluded_list has a value which is a reference to a list where each element is a ReactionDefinition
+original_id has a value which is a string
+aliases has a value which is a reference to a list where each element is a string
 
 
 =end text
@@ -27546,7 +28883,7 @@ excluded_list has a value which is a reference to a list where each element is a
 
 
 
-=head2 get_models_params
+=head2 get_aliassets_params
 
 =over 4
 
@@ -27554,9 +28891,10 @@ excluded_list has a value which is a reference to a list where each element is a
 
 =item Description
 
-********************************************************************************
-    Function definitions relating to data retrieval for Model Objects
-   	********************************************************************************
+Input parameters for the get_aliassets function
+
+              string auth; - The authentication token of the KBase account (optional)
+              string object_type; - The type of object (e.g. Compound or Reaction)
 
 
 =item Definition
@@ -27565,10 +28903,8 @@ excluded_list has a value which is a reference to a list where each element is a
 
 <pre>
 a reference to a hash where the following keys are defined:
-models has a value which is a reference to a list where each element is a fbamodel_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
+object_type has a value which is a string
 auth has a value which is a string
-id_type has a value which is a string
 
 </pre>
 
@@ -27577,10 +28913,8 @@ id_type has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-models has a value which is a reference to a list where each element is a fbamodel_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
+object_type has a value which is a string
 auth has a value which is a string
-id_type has a value which is a string
 
 
 =end text
@@ -27589,7 +28923,7 @@ id_type has a value which is a string
 
 
 
-=head2 get_fbas_params
+=head2 get_media_params
 
 =over 4
 
@@ -27597,11 +28931,10 @@ id_type has a value which is a string
 
 =item Description
 
-Input parameters for the "get_fbas" function.
+Input parameters for the "get_media" function.
 
-        list<fba_id> fbas - a list of the FBA study IDs for the FBA studies to be returned (a required argument)
-        list<workspace_id> workspaces - a list of the workspaces contianing the FBA studies to be returned (a required argument)
-string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        list<media_id> medias - a list of the media IDs for the media to be returned (a required argument)
+        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -27611,10 +28944,9 @@ string id_type - the type of ID that should be used in the output data (a option
 
 <pre>
 a reference to a hash where the following keys are defined:
-fbas has a value which is a reference to a list where each element is a fba_id
+medias has a value which is a reference to a list where each element is a media_id
 workspaces has a value which is a reference to a list where each element is a workspace_id
 auth has a value which is a string
-id_type has a value which is a string
 
 </pre>
 
@@ -27623,10 +28955,9 @@ id_type has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-fbas has a value which is a reference to a list where each element is a fba_id
+medias has a value which is a reference to a list where each element is a media_id
 workspaces has a value which is a reference to a list where each element is a workspace_id
 auth has a value which is a string
-id_type has a value which is a string
 
 
 =end text
@@ -27635,7 +28966,7 @@ id_type has a value which is a string
 
 
 
-=head2 get_gapfills_params
+=head2 get_biochemistry_params
 
 =over 4
 
@@ -27643,11 +28974,11 @@ id_type has a value which is a string
 
 =item Description
 
-Input parameters for the "get_gapfills" function.
+Input parameters for the "get_biochemistry" function.
 
-        list<gapfill_id> gapfills - a list of the gapfill study IDs for the gapfill studies to be returned (a required argument)
-        list<workspace_id> workspaces - a list of the workspaces contianing the gapfill studies to be returned (a required argument)
-string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        biochemistry_id biochemistry - ID of the biochemistry database to be returned (a required argument)
+        workspace_id biochemistry_workspace - workspace containing the biochemistry database to be returned (a required argument)
+        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -27657,10 +28988,10 @@ string id_type - the type of ID that should be used in the output data (a option
 
 <pre>
 a reference to a hash where the following keys are defined:
-gapfills has a value which is a reference to a list where each element is a gapfill_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
-auth has a value which is a string
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
 id_type has a value which is a string
+auth has a value which is a string
 
 </pre>
 
@@ -27669,10 +29000,10 @@ id_type has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-gapfills has a value which is a reference to a list where each element is a gapfill_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
-auth has a value which is a string
+biochemistry has a value which is a biochemistry_id
+biochemistry_workspace has a value which is a workspace_id
 id_type has a value which is a string
+auth has a value which is a string
 
 
 =end text
@@ -27681,7 +29012,7 @@ id_type has a value which is a string
 
 
 
-=head2 get_gapgens_params
+=head2 import_probanno_params
 
 =over 4
 
@@ -27689,12 +29020,9 @@ id_type has a value which is a string
 
 =item Description
 
-Input parameters for the "get_gapgens" function.
-
-        list<gapgen_id> gapgens - a list of the gapgen study IDs for the gapgen studies to be returned (a required argument)
-        list<workspace_id> workspaces - a list of the workspaces contianing the gapgen studies to be returned (a required argument)
-string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+********************************************************************************
+    Code relating to reconstruction of metabolic models
+   	********************************************************************************
 
 
 =item Definition
@@ -27703,10 +29031,14 @@ string id_type - the type of ID that should be used in the output data (a option
 
 <pre>
 a reference to a hash where the following keys are defined:
-gapgens has a value which is a reference to a list where each element is a gapgen_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
+probanno has a value which is a probanno_id
+workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+annotationProbabilities has a value which is a reference to a list where each element is an annotationProbability
+ignore_errors has a value which is a bool
 auth has a value which is a string
-id_type has a value which is a string
+overwrite has a value which is a bool
 
 </pre>
 
@@ -27715,10 +29047,14 @@ id_type has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-gapgens has a value which is a reference to a list where each element is a gapgen_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
+probanno has a value which is a probanno_id
+workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+genome_workspace has a value which is a workspace_id
+annotationProbabilities has a value which is a reference to a list where each element is an annotationProbability
+ignore_errors has a value which is a bool
 auth has a value which is a string
-id_type has a value which is a string
+overwrite has a value which is a bool
 
 
 =end text
@@ -27727,7 +29063,7 @@ id_type has a value which is a string
 
 
 
-=head2 get_reactions_params
+=head2 Genome_uid
 
 =over 4
 
@@ -27735,10 +29071,11 @@ id_type has a value which is a string
 
 =item Description
 
-Input parameters for the "get_reactions" function.
+Input parameters for the "genome_object_to_workspace" function.
 
-        list<reaction_id> reactions - a list of the reaction IDs for the reactions to be returned (a required argument)
-        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        Genome_uid uid - ID to use when saving genome to workspace
+        GenomeObject genomeobj - full genome typed object to be loaded into the workspace (a required argument)
+        workspace_id workspace - ID of the workspace into which the genome typed object is to be loaded (a required argument)
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -27747,22 +29084,14 @@ Input parameters for the "get_reactions" function.
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-reactions has a value which is a reference to a list where each element is a reaction_id
-auth has a value which is a string
-id_type has a value which is a string
-
+a string
 </pre>
 
 =end html
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-reactions has a value which is a reference to a list where each element is a reaction_id
-auth has a value which is a string
-id_type has a value which is a string
-
+a string
 
 =end text
 
@@ -27770,29 +29099,23 @@ id_type has a value which is a string
 
 
 
-=head2 get_compounds_params
+=head2 genome_object_to_workspace_params
 
 =over 4
 
 
 
-=item Description
-
-Input parameters for the "get_compounds" function.        
-list<compound_id> compounds - a list of the compound IDs for the compounds to be returned (a required argument)
-string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
-string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
-
-
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-compounds has a value which is a reference to a list where each element is a compound_id
+uid has a value which is a Genome_uid
+genomeobj has a value which is a GenomeObject
+workspace has a value which is a workspace_id
 auth has a value which is a string
-id_type has a value which is a string
+overwrite has a value which is a bool
 
 </pre>
 
@@ -27801,9 +29124,11 @@ id_type has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-compounds has a value which is a reference to a list where each element is a compound_id
+uid has a value which is a Genome_uid
+genomeobj has a value which is a GenomeObject
+workspace has a value which is a workspace_id
 auth has a value which is a string
-id_type has a value which is a string
+overwrite has a value which is a bool
 
 
 =end text
@@ -27812,7 +29137,7 @@ id_type has a value which is a string
 
 
 
-=head2 get_alias_params
+=head2 genome_to_workspace_params
 
 =over 4
 
@@ -27820,13 +29145,15 @@ id_type has a value which is a string
 
 =item Description
 
-Input parameters for the get_alias function
+Input parameters for the "genome_to_workspace" function.
 
-                string object_type    - The type of object (e.g. Compound or Reaction)
-                string input_id_type - The type (e.g. ModelSEED) of alias to be inputted
-                string output_id_type - The type (e.g. KEGG) of alias to be outputted
-                list<string> input_ids - A list of input IDs
-                string auth; - The authentication token of the KBase account (optional)
+        genome_id genome - ID of the CDM genome that is to be loaded into the workspace (a required argument)
+        string sourceLogin - login to pull private genome from source database
+        string sourcePassword - password to pull private genome from source database
+        string source - Source database for genome (i.e. seed, rast, kbase)
+        workspace_id workspace - ID of the workspace into which the genome typed object is to be loaded (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        Genome_uid uid - ID to use when saving genome to workspace
 
 
 =item Definition
@@ -27835,11 +29162,14 @@ Input parameters for the get_alias function
 
 <pre>
 a reference to a hash where the following keys are defined:
-object_type has a value which is a string
-input_id_type has a value which is a string
-output_id_type has a value which is a string
-input_ids has a value which is a reference to a list where each element is a string
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+sourceLogin has a value which is a string
+sourcePassword has a value which is a string
+source has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
+uid has a value which is a Genome_uid
 
 </pre>
 
@@ -27848,11 +29178,14 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-object_type has a value which is a string
-input_id_type has a value which is a string
-output_id_type has a value which is a string
-input_ids has a value which is a reference to a list where each element is a string
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+sourceLogin has a value which is a string
+sourcePassword has a value which is a string
+source has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
+uid has a value which is a Genome_uid
 
 
 =end text
@@ -27861,7 +29194,7 @@ auth has a value which is a string
 
 
 
-=head2 get_alias_outputs
+=head2 domains_to_workspace_params
 
 =over 4
 
@@ -27869,10 +29202,12 @@ auth has a value which is a string
 
 =item Description
 
-Output for get_alias function
+Input parameters for the "domains_to_workspace" function.
 
-              string original_id - The original ID
-              list<string> aliases - Aliases for the original ID in the new format
+        genome_id genome - ID of the workspace genome to fetch domains for (a required argument)
+        string output_id - ID in which the domains are to be saved (default is genome ID plus ".dom.0")
+        workspace_id workspace - ID of the workspace into which the domains are to be loaded (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -27881,8 +29216,10 @@ Output for get_alias function
 
 <pre>
 a reference to a hash where the following keys are defined:
-original_id has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
+genome has a value which is a genome_id
+output_id has a value which is a string
+workspace has a value which is a workspace_id
+auth has a value which is a string
 
 </pre>
 
@@ -27891,8 +29228,10 @@ aliases has a value which is a reference to a list where each element is a strin
 =begin text
 
 a reference to a hash where the following keys are defined:
-original_id has a value which is a string
-aliases has a value which is a reference to a list where each element is a string
+genome has a value which is a genome_id
+output_id has a value which is a string
+workspace has a value which is a workspace_id
+auth has a value which is a string
 
 
 =end text
@@ -27901,7 +29240,7 @@ aliases has a value which is a reference to a list where each element is a strin
 
 
 
-=head2 get_aliassets_params
+=head2 compute_domains_params
 
 =over 4
 
@@ -27909,10 +29248,11 @@ aliases has a value which is a reference to a list where each element is a strin
 
 =item Description
 
-Input parameters for the get_aliassets function
-
-              string auth; - The authentication token of the KBase account (optional)
-              string object_type; - The type of object (e.g. Compound or Reaction)
+Input parameters for the "compute_domains_params" function.
+string genome;
+string genome_workspace;
+list<tuple<string,string>> proteins;
+workspace_id workspace;
 
 
 =item Definition
@@ -27921,8 +29261,13 @@ Input parameters for the get_aliassets function
 
 <pre>
 a reference to a hash where the following keys are defined:
-object_type has a value which is a string
-auth has a value which is a string
+genome has a value which is a string
+genome_workspace has a value which is a string
+proteins has a value which is a reference to a list where each element is a reference to a list containing 2 items:
+0: a string
+1: a string
+
+workspace has a value which is a workspace_id
 
 </pre>
 
@@ -27931,8 +29276,13 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-object_type has a value which is a string
-auth has a value which is a string
+genome has a value which is a string
+genome_workspace has a value which is a string
+proteins has a value which is a reference to a list where each element is a reference to a list containing 2 items:
+0: a string
+1: a string
+
+workspace has a value which is a workspace_id
 
 
 =end text
@@ -27941,7 +29291,7 @@ auth has a value which is a string
 
 
 
-=head2 get_media_params
+=head2 translation
 
 =over 4
 
@@ -27949,11 +29299,10 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "get_media" function.
+A link between a KBase gene ID and the ID for the same gene in another database
 
-        list<media_id> medias - a list of the media IDs for the media to be returned (a required argument)
-        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        string foreign_id - ID of the gene in another database
+        feature_id feature - ID of the gene in KBase
 
 
 =item Definition
@@ -27961,10 +29310,9 @@ Input parameters for the "get_media" function.
 =begin html
 
 <pre>
-a reference to a hash where the following keys are defined:
-medias has a value which is a reference to a list where each element is a media_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
-auth has a value which is a string
+a reference to a list containing 2 items:
+0: (foreign_id) a string
+1: (feature) a feature_id
 
 </pre>
 
@@ -27972,10 +29320,9 @@ auth has a value which is a string
 
 =begin text
 
-a reference to a hash where the following keys are defined:
-medias has a value which is a reference to a list where each element is a media_id
-workspaces has a value which is a reference to a list where each element is a workspace_id
-auth has a value which is a string
+a reference to a list containing 2 items:
+0: (foreign_id) a string
+1: (feature) a feature_id
 
 
 =end text
@@ -27984,7 +29331,7 @@ auth has a value which is a string
 
 
 
-=head2 get_biochemistry_params
+=head2 add_feature_translation_params
 
 =over 4
 
@@ -27992,11 +29339,12 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "get_biochemistry" function.
+Input parameters for the "add_feature_translation" function.
 
-        biochemistry_id biochemistry - ID of the biochemistry database to be returned (a required argument)
-        workspace_id biochemistry_workspace - workspace containing the biochemistry database to be returned (a required argument)
-        string id_type - the type of ID that should be used in the output data (a optional argument; default is 'ModelSEED')
+        genome_id genome - ID of the genome into which the new aliases are to be loaded (a required argument)
+        workspace_id workspace - ID of the workspace containing the target genome (a required argument)
+        list<translation> translations - list of translations between KBase gene IDs and gene IDs in another database (a required argument)
+        string id_type - type of the IDs being loaded (e.g. KEGG, NCBI) (a required argument)
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -28006,10 +29354,12 @@ Input parameters for the "get_biochemistry" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+translations has a value which is a reference to a list where each element is a translation
 id_type has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
 
 </pre>
 
@@ -28018,10 +29368,12 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-biochemistry has a value which is a biochemistry_id
-biochemistry_workspace has a value which is a workspace_id
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+translations has a value which is a reference to a list where each element is a translation
 id_type has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
 
 
 =end text
@@ -28030,7 +29382,7 @@ auth has a value which is a string
 
 
 
-=head2 import_probanno_params
+=head2 genome_to_fbamodel_params
 
 =over 4
 
@@ -28038,9 +29390,17 @@ auth has a value which is a string
 
 =item Description
 
-********************************************************************************
-    Code relating to reconstruction of metabolic models
-   	********************************************************************************
+Input parameters for the "genome_to_fbamodel" function.
+
+        genome_id genome - ID of the genome for which a model is to be built (a required argument)
+        workspace_id genome_workspace - ID of the workspace containing the target genome (an optional argument; default is the workspace argument)
+        template_id templatemodel - 
+        workspace_id templatemodel_workspace - 
+        bool probannoOnly - a boolean indicating if only the probabilistic annotation should be used in building the model (an optional argument; default is '0')
+        fbamodel_id model - ID that should be used for the newly constructed model (an optional argument; default is 'undef')
+        bool coremodel - indicates that a core model should be constructed instead of a genome scale model (an optional argument; default is '0')
+        workspace_id workspace - ID of the workspace where the newly developed model will be stored; also the default assumed workspace for input objects (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -28049,14 +29409,15 @@ auth has a value which is a string
 
 <pre>
 a reference to a hash where the following keys are defined:
-probanno has a value which is a probanno_id
-workspace has a value which is a workspace_id
 genome has a value which is a genome_id
 genome_workspace has a value which is a workspace_id
-annotationProbabilities has a value which is a reference to a list where each element is an annotationProbability
-ignore_errors has a value which is a bool
+templatemodel has a value which is a template_id
+templatemodel_workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+coremodel has a value which is a bool
+workspace has a value which is a workspace_id
 auth has a value which is a string
-overwrite has a value which is a bool
+fulldb has a value which is a bool
 
 </pre>
 
@@ -28065,14 +29426,15 @@ overwrite has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-probanno has a value which is a probanno_id
-workspace has a value which is a workspace_id
 genome has a value which is a genome_id
 genome_workspace has a value which is a workspace_id
-annotationProbabilities has a value which is a reference to a list where each element is an annotationProbability
-ignore_errors has a value which is a bool
+templatemodel has a value which is a template_id
+templatemodel_workspace has a value which is a workspace_id
+model has a value which is a fbamodel_id
+coremodel has a value which is a bool
+workspace has a value which is a workspace_id
 auth has a value which is a string
-overwrite has a value which is a bool
+fulldb has a value which is a bool
 
 
 =end text
@@ -28081,7 +29443,7 @@ overwrite has a value which is a bool
 
 
 
-=head2 Genome_uid
+=head2 translate_fbamodel_params
 
 =over 4
 
@@ -28089,12 +29451,12 @@ overwrite has a value which is a bool
 
 =item Description
 
-Input parameters for the "genome_object_to_workspace" function.
+Input parameters for the "translate_fbamodel" function.
 
-        Genome_uid uid - ID to use when saving genome to workspace
-        GenomeObject genomeobj - full genome typed object to be loaded into the workspace (a required argument)
-        workspace_id workspace - ID of the workspace into which the genome typed object is to be loaded (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        gencomp
+        gencomp_workspace
+        fbamodel_id model;
+        fbamodel_id model_workspace;
 
 
 =item Definition
@@ -28102,14 +29464,26 @@ Input parameters for the "genome_object_to_workspace" function.
 =begin html
 
 <pre>
-a string
+a reference to a hash where the following keys are defined:
+protcomp has a value which is a string
+protcomp_workspace has a value which is a string
+model has a value which is a string
+model_workspace has a value which is a string
+workspace has a value which is a workspace_id
+
 </pre>
 
 =end html
 
 =begin text
 
-a string
+a reference to a hash where the following keys are defined:
+protcomp has a value which is a string
+protcomp_workspace has a value which is a string
+model has a value which is a string
+model_workspace has a value which is a string
+workspace has a value which is a workspace_id
+
 
 =end text
 
@@ -28117,23 +29491,31 @@ a string
 
 
 
-=head2 genome_object_to_workspace_params
+=head2 build_pangenome_params
 
 =over 4
 
 
 
+=item Description
+
+Input parameters for the "translate_fbamodel" function.
+
+        gencomp
+        gencomp_workspace
+        fbamodel_id model;
+        fbamodel_id model_workspace;
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-uid has a value which is a Genome_uid
-genomeobj has a value which is a GenomeObject
+genomes has a value which is a reference to a list where each element is a string
+genome_workspace has a value which is a reference to a list where each element is a string
 workspace has a value which is a workspace_id
-auth has a value which is a string
-overwrite has a value which is a bool
 
 </pre>
 
@@ -28142,11 +29524,9 @@ overwrite has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-uid has a value which is a Genome_uid
-genomeobj has a value which is a GenomeObject
+genomes has a value which is a reference to a list where each element is a string
+genome_workspace has a value which is a reference to a list where each element is a string
 workspace has a value which is a workspace_id
-auth has a value which is a string
-overwrite has a value which is a bool
 
 
 =end text
@@ -28155,39 +29535,21 @@ overwrite has a value which is a bool
 
 
 
-=head2 genome_to_workspace_params
+=head2 heat_map_matrix
 
 =over 4
 
 
 
-=item Description
-
-Input parameters for the "genome_to_workspace" function.
-
-        genome_id genome - ID of the CDM genome that is to be loaded into the workspace (a required argument)
-        string sourceLogin - login to pull private genome from source database
-        string sourcePassword - password to pull private genome from source database
-        string source - Source database for genome (i.e. seed, rast, kbase)
-        workspace_id workspace - ID of the workspace into which the genome typed object is to be loaded (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
-        Genome_uid uid - ID to use when saving genome to workspace
-
-
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-sourceLogin has a value which is a string
-sourcePassword has a value which is a string
-source has a value which is a string
-auth has a value which is a string
-overwrite has a value which is a bool
-uid has a value which is a Genome_uid
+is_refs has a value which is a bool
+labels has a value which is a reference to a list where each element is a string
+matrix has a value which is a reference to a list where each element is a reference to a list where each element is a float
 
 </pre>
 
@@ -28196,14 +29558,9 @@ uid has a value which is a Genome_uid
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-sourceLogin has a value which is a string
-sourcePassword has a value which is a string
-source has a value which is a string
-auth has a value which is a string
-overwrite has a value which is a bool
-uid has a value which is a Genome_uid
+is_refs has a value which is a bool
+labels has a value which is a reference to a list where each element is a string
+matrix has a value which is a reference to a list where each element is a reference to a list where each element is a float
 
 
 =end text
@@ -28212,20 +29569,10 @@ uid has a value which is a Genome_uid
 
 
 
-=head2 domains_to_workspace_params
-
-=over 4
-
-
-
-=item Description
+=head2 genome_heatmap_from_pangenome_params
 
-Input parameters for the "domains_to_workspace" function.
+=over 4
 
-        genome_id genome - ID of the workspace genome to fetch domains for (a required argument)
-        string output_id - ID in which the domains are to be saved (default is genome ID plus ".dom.0")
-        workspace_id workspace - ID of the workspace into which the domains are to be loaded (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -28234,10 +29581,9 @@ Input parameters for the "domains_to_workspace" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-output_id has a value which is a string
-workspace has a value which is a workspace_id
-auth has a value which is a string
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+workspace has a value which is a string
 
 </pre>
 
@@ -28246,10 +29592,9 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-output_id has a value which is a string
-workspace has a value which is a workspace_id
-auth has a value which is a string
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+workspace has a value which is a string
 
 
 =end text
@@ -28258,7 +29603,7 @@ auth has a value which is a string
 
 
 
-=head2 compute_domains_params
+=head2 ortholog_data
 
 =over 4
 
@@ -28266,11 +29611,7 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "compute_domains_params" function.
-string genome;
-string genome_workspace;
-list<tuple<string,string>> proteins;
-workspace_id workspace;
+gene ID,gene ref,protein sequence,function,score
 
 
 =item Definition
@@ -28279,13 +29620,14 @@ workspace_id workspace;
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a string
-genome_workspace has a value which is a string
-proteins has a value which is a reference to a list where each element is a reference to a list containing 2 items:
+gene_data has a value which is a reference to a list where each element is a reference to a list containing 5 items:
 0: a string
 1: a string
+2: a string
+3: a string
+4: a float
 
-workspace has a value which is a workspace_id
+protein_heatmap has a value which is a heat_map_matrix
 
 </pre>
 
@@ -28294,13 +29636,14 @@ workspace has a value which is a workspace_id
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a string
-genome_workspace has a value which is a string
-proteins has a value which is a reference to a list where each element is a reference to a list containing 2 items:
+gene_data has a value which is a reference to a list where each element is a reference to a list containing 5 items:
 0: a string
 1: a string
+2: a string
+3: a string
+4: a float
 
-workspace has a value which is a workspace_id
+protein_heatmap has a value which is a heat_map_matrix
 
 
 =end text
@@ -28309,28 +29652,22 @@ workspace has a value which is a workspace_id
 
 
 
-=head2 translation
+=head2 ortholog_family_from_pangenome_params
 
 =over 4
 
 
 
-=item Description
-
-A link between a KBase gene ID and the ID for the same gene in another database
-
-        string foreign_id - ID of the gene in another database
-        feature_id feature - ID of the gene in KBase
-
-
 =item Definition
 
 =begin html
 
 <pre>
-a reference to a list containing 2 items:
-0: (foreign_id) a string
-1: (feature) a feature_id
+a reference to a hash where the following keys are defined:
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+orthologid has a value which is a string
+workspace has a value which is a string
 
 </pre>
 
@@ -28338,9 +29675,11 @@ a reference to a list containing 2 items:
 
 =begin text
 
-a reference to a list containing 2 items:
-0: (foreign_id) a string
-1: (feature) a feature_id
+a reference to a hash where the following keys are defined:
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+orthologid has a value which is a string
+workspace has a value which is a string
 
 
 =end text
@@ -28349,35 +29688,22 @@ a reference to a list containing 2 items:
 
 
 
-=head2 add_feature_translation_params
+=head2 pangenome_to_proteome_comparison_params
 
 =over 4
 
 
 
-=item Description
-
-Input parameters for the "add_feature_translation" function.
-
-        genome_id genome - ID of the genome into which the new aliases are to be loaded (a required argument)
-        workspace_id workspace - ID of the workspace containing the target genome (a required argument)
-        list<translation> translations - list of translations between KBase gene IDs and gene IDs in another database (a required argument)
-        string id_type - type of the IDs being loaded (e.g. KEGG, NCBI) (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
-
-
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-translations has a value which is a reference to a list where each element is a translation
-id_type has a value which is a string
-auth has a value which is a string
-overwrite has a value which is a bool
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+outputid has a value which is a string
+workspace has a value which is a string
 
 </pre>
 
@@ -28386,12 +29712,10 @@ overwrite has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-translations has a value which is a reference to a list where each element is a translation
-id_type has a value which is a string
-auth has a value which is a string
-overwrite has a value which is a bool
+pangenome has a value which is a string
+pangenome_workspace has a value which is a string
+outputid has a value which is a string
+workspace has a value which is a string
 
 
 =end text
@@ -28400,7 +29724,7 @@ overwrite has a value which is a bool
 
 
 
-=head2 genome_to_fbamodel_params
+=head2 import_fbamodel_params
 
 =over 4
 
@@ -28408,16 +29732,15 @@ overwrite has a value which is a bool
 
 =item Description
 
-Input parameters for the "genome_to_fbamodel" function.
+Input parameters for the "import_fbamodel" function.
 
         genome_id genome - ID of the genome for which a model is to be built (a required argument)
         workspace_id genome_workspace - ID of the workspace containing the target genome (an optional argument; default is the workspace argument)
-        template_id templatemodel - 
-        workspace_id templatemodel_workspace - 
-        bool probannoOnly - a boolean indicating if only the probabilistic annotation should be used in building the model (an optional argument; default is '0')
-        fbamodel_id model - ID that should be used for the newly constructed model (an optional argument; default is 'undef')
-        bool coremodel - indicates that a core model should be constructed instead of a genome scale model (an optional argument; default is '0')
+        string biomass - biomass equation for model (an essential argument)
+        list<tuple<string id,string direction,string compartment,string gpr> reactions - list of reactions to appear in imported model (an essential argument)
+        fbamodel_id model - ID that should be used for the newly imported model (an optional argument; default is 'undef')
         workspace_id workspace - ID of the workspace where the newly developed model will be stored; also the default assumed workspace for input objects (a required argument)
+        bool ignore_errors - ignores missing genes or reactions and imports model anyway
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -28429,13 +29752,18 @@ Input parameters for the "genome_to_fbamodel" function.
 a reference to a hash where the following keys are defined:
 genome has a value which is a genome_id
 genome_workspace has a value which is a workspace_id
-templatemodel has a value which is a template_id
-templatemodel_workspace has a value which is a workspace_id
+biomass has a value which is a string
+reactions has a value which is a reference to a list where each element is a reference to a list containing 4 items:
+0: (id) a string
+1: (direction) a string
+2: (compartment) a string
+3: (gpr) a string
+
 model has a value which is a fbamodel_id
-coremodel has a value which is a bool
 workspace has a value which is a workspace_id
+ignore_errors has a value which is a bool
 auth has a value which is a string
-fulldb has a value which is a bool
+overwrite has a value which is a bool
 
 </pre>
 
@@ -28446,13 +29774,18 @@ fulldb has a value which is a bool
 a reference to a hash where the following keys are defined:
 genome has a value which is a genome_id
 genome_workspace has a value which is a workspace_id
-templatemodel has a value which is a template_id
-templatemodel_workspace has a value which is a workspace_id
+biomass has a value which is a string
+reactions has a value which is a reference to a list where each element is a reference to a list containing 4 items:
+0: (id) a string
+1: (direction) a string
+2: (compartment) a string
+3: (gpr) a string
+
 model has a value which is a fbamodel_id
-coremodel has a value which is a bool
 workspace has a value which is a workspace_id
+ignore_errors has a value which is a bool
 auth has a value which is a string
-fulldb has a value which is a bool
+overwrite has a value which is a bool
 
 
 =end text
@@ -28461,7 +29794,7 @@ fulldb has a value which is a bool
 
 
 
-=head2 translate_fbamodel_params
+=head2 export_fbamodel_params
 
 =over 4
 
@@ -28469,12 +29802,13 @@ fulldb has a value which is a bool
 
 =item Description
 
-Input parameters for the "translate_fbamodel" function.
+Input parameters for the "export_fbamodel" function.
 
-        gencomp
-        gencomp_workspace
-        fbamodel_id model;
-        fbamodel_id model_workspace;
+        fbamodel_id model - ID of the model to be exported (a required argument)
+        workspace_id workspace - workspace containing the model to be exported (a required argument)
+        fba_id fba - A FBA object related to the model. (an optional argument)
+        string format - format to which the model should be exported (sbml, html, json, readable, cytoseed) (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -28483,11 +29817,11 @@ Input parameters for the "translate_fbamodel" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-protcomp has a value which is a string
-protcomp_workspace has a value which is a string
-model has a value which is a string
-model_workspace has a value which is a string
+model has a value which is a fbamodel_id
 workspace has a value which is a workspace_id
+fbas has a value which is a reference to a list where each element is a fba_id
+format has a value which is a string
+auth has a value which is a string
 
 </pre>
 
@@ -28496,11 +29830,11 @@ workspace has a value which is a workspace_id
 =begin text
 
 a reference to a hash where the following keys are defined:
-protcomp has a value which is a string
-protcomp_workspace has a value which is a string
-model has a value which is a string
-model_workspace has a value which is a string
+model has a value which is a fbamodel_id
 workspace has a value which is a workspace_id
+fbas has a value which is a reference to a list where each element is a fba_id
+format has a value which is a string
+auth has a value which is a string
 
 
 =end text
@@ -28509,7 +29843,7 @@ workspace has a value which is a workspace_id
 
 
 
-=head2 build_pangenome_params
+=head2 export_object_params
 
 =over 4
 
@@ -28517,12 +29851,12 @@ workspace has a value which is a workspace_id
 
 =item Description
 
-Input parameters for the "translate_fbamodel" function.
+Input parameters for the "export_object" function.
 
-        gencomp
-        gencomp_workspace
-        fbamodel_id model;
-        fbamodel_id model_workspace;
+        workspace_ref reference - reference of object to print in html (a required argument)
+        string type - type of the object to be exported (a required argument)
+        string format - format to which data should be exported (an optional argument; default is html)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -28531,9 +29865,10 @@ Input parameters for the "translate_fbamodel" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-genomes has a value which is a reference to a list where each element is a string
-genome_workspace has a value which is a reference to a list where each element is a string
-workspace has a value which is a workspace_id
+reference has a value which is a workspace_ref
+type has a value which is a string
+format has a value which is a string
+auth has a value which is a string
 
 </pre>
 
@@ -28542,9 +29877,10 @@ workspace has a value which is a workspace_id
 =begin text
 
 a reference to a hash where the following keys are defined:
-genomes has a value which is a reference to a list where each element is a string
-genome_workspace has a value which is a reference to a list where each element is a string
-workspace has a value which is a workspace_id
+reference has a value which is a workspace_ref
+type has a value which is a string
+format has a value which is a string
+auth has a value which is a string
 
 
 =end text
@@ -28553,44 +29889,20 @@ workspace has a value which is a workspace_id
 
 
 
-=head2 heat_map_matrix
+=head2 export_genome_params
 
 =over 4
 
 
 
-=item Definition
-
-=begin html
-
-<pre>
-a reference to a hash where the following keys are defined:
-is_refs has a value which is a bool
-labels has a value which is a reference to a list where each element is a string
-matrix has a value which is a reference to a list where each element is a reference to a list where each element is a float
-
-</pre>
-
-=end html
-
-=begin text
-
-a reference to a hash where the following keys are defined:
-is_refs has a value which is a bool
-labels has a value which is a reference to a list where each element is a string
-matrix has a value which is a reference to a list where each element is a reference to a list where each element is a float
-
-
-=end text
-
-=back
-
-
-
-=head2 genome_heatmap_from_pangenome_params
+=item Description
 
-=over 4
+Input parameters for the "export_genome" function.
 
+        genome_id genome - ID of the genome to be exported (a required argument)
+        workspace_id workspace - workspace containing the model to be exported (a required argument)
+        string format - format to which the model should be exported (sbml, html, json, readable, cytoseed) (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -28599,9 +29911,10 @@ matrix has a value which is a reference to a list where each element is a refere
 
 <pre>
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-workspace has a value which is a string
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+format has a value which is a string
+auth has a value which is a string
 
 </pre>
 
@@ -28610,9 +29923,10 @@ workspace has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-workspace has a value which is a string
+genome has a value which is a genome_id
+workspace has a value which is a workspace_id
+format has a value which is a string
+auth has a value which is a string
 
 
 =end text
@@ -28621,7 +29935,7 @@ workspace has a value which is a string
 
 
 
-=head2 ortholog_data
+=head2 adjust_model_reaction_params
 
 =over 4
 
@@ -28629,7 +29943,22 @@ workspace has a value which is a string
 
 =item Description
 
-gene ID,gene ref,protein sequence,function,score
+Input parameters for the "adjust_model_reaction" function.
+
+        fbamodel_id model - ID of model to be adjusted
+        workspace_id workspace - workspace containing model to be adjusted
+        list<reaction_id> reaction - List of IDs of reactions to be added, removed, or adjusted
+        list<string> direction - directions to set for reactions being added or adjusted
+        list<compartment_id> compartment - IDs of compartment containing reaction being added or adjusted
+        list<int> compartmentIndex - indexes of compartment containing reaction being altered or adjusted
+        list<string> gpr - array specifying gene-protein-reaction association(s)
+        bool removeReaction - boolean indicating listed reaction(s) should be removed
+        bool addReaction - boolean indicating reaction(s) should be added
+        bool overwrite - boolean indicating whether or not to overwrite model object in the workspace
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+
+        For all of the lists above, if only one element is specified it is assumed the user wants to apply the same
+        to all the listed reactions.
 
 
 =item Definition
@@ -28638,14 +29967,17 @@ gene ID,gene ref,protein sequence,function,score
 
 <pre>
 a reference to a hash where the following keys are defined:
-gene_data has a value which is a reference to a list where each element is a reference to a list containing 5 items:
-0: a string
-1: a string
-2: a string
-3: a string
-4: a float
-
-protein_heatmap has a value which is a heat_map_matrix
+model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+reaction has a value which is a reference to a list where each element is a reaction_id
+direction has a value which is a reference to a list where each element is a string
+compartment has a value which is a reference to a list where each element is a compartment_id
+compartmentIndex has a value which is a reference to a list where each element is an int
+gpr has a value which is a reference to a list where each element is a string
+removeReaction has a value which is a bool
+addReaction has a value which is a bool
+overwrite has a value which is a bool
+auth has a value which is a string
 
 </pre>
 
@@ -28654,14 +29986,17 @@ protein_heatmap has a value which is a heat_map_matrix
 =begin text
 
 a reference to a hash where the following keys are defined:
-gene_data has a value which is a reference to a list where each element is a reference to a list containing 5 items:
-0: a string
-1: a string
-2: a string
-3: a string
-4: a float
-
-protein_heatmap has a value which is a heat_map_matrix
+model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+reaction has a value which is a reference to a list where each element is a reaction_id
+direction has a value which is a reference to a list where each element is a string
+compartment has a value which is a reference to a list where each element is a compartment_id
+compartmentIndex has a value which is a reference to a list where each element is an int
+gpr has a value which is a reference to a list where each element is a string
+removeReaction has a value which is a bool
+addReaction has a value which is a bool
+overwrite has a value which is a bool
+auth has a value which is a string
 
 
 =end text
@@ -28670,22 +30005,40 @@ protein_heatmap has a value which is a heat_map_matrix
 
 
 
-=head2 ortholog_family_from_pangenome_params
+=head2 adjust_biomass_reaction_params
 
 =over 4
 
 
 
+=item Description
+
+Input parameters for the "adjust_biomass_reaction" function.
+
+        fbamodel_id model - ID of model to be adjusted
+        workspace_id workspace - workspace containing model to be adjusted
+        biomass_id biomass - ID of biomass reaction to adjust
+        list<float> coefficients - coefficient of biomass compound
+        list<compound_id> compounds - ID of biomass compound to adjust in biomass
+        list<compartment_id> compartments - ID of compartment containing compound to adjust in biomass
+        list<int> compartmentIndecies - index of compartment containing compound to adjust in biomass
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-orthologid has a value which is a string
-workspace has a value which is a string
+model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+biomass has a value which is a biomass_id
+coefficients has a value which is a reference to a list where each element is a float
+compounds has a value which is a reference to a list where each element is a compound_id
+compartments has a value which is a reference to a list where each element is a compartment_id
+compartmentIndecies has a value which is a reference to a list where each element is an int
+auth has a value which is a string
 
 </pre>
 
@@ -28694,10 +30047,14 @@ workspace has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-orthologid has a value which is a string
-workspace has a value which is a string
+model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+biomass has a value which is a biomass_id
+coefficients has a value which is a reference to a list where each element is a float
+compounds has a value which is a reference to a list where each element is a compound_id
+compartments has a value which is a reference to a list where each element is a compartment_id
+compartmentIndecies has a value which is a reference to a list where each element is an int
+auth has a value which is a string
 
 
 =end text
@@ -28706,22 +30063,37 @@ workspace has a value which is a string
 
 
 
-=head2 pangenome_to_proteome_comparison_params
+=head2 addmedia_params
 
 =over 4
 
 
 
+=item Description
+
+********************************************************************************
+    Code relating to flux balance analysis
+   	********************************************************************************
+
+
 =item Definition
 
 =begin html
 
 <pre>
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-outputid has a value which is a string
-workspace has a value which is a string
+media has a value which is a media_id
+workspace has a value which is a workspace_id
+name has a value which is a string
+isDefined has a value which is a bool
+isMinimal has a value which is a bool
+type has a value which is a string
+compounds has a value which is a reference to a list where each element is a string
+concentrations has a value which is a reference to a list where each element is a float
+maxflux has a value which is a reference to a list where each element is a float
+minflux has a value which is a reference to a list where each element is a float
+overwrite has a value which is a bool
+auth has a value which is a string
 
 </pre>
 
@@ -28730,10 +30102,18 @@ workspace has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-pangenome has a value which is a string
-pangenome_workspace has a value which is a string
-outputid has a value which is a string
-workspace has a value which is a string
+media has a value which is a media_id
+workspace has a value which is a workspace_id
+name has a value which is a string
+isDefined has a value which is a bool
+isMinimal has a value which is a bool
+type has a value which is a string
+compounds has a value which is a reference to a list where each element is a string
+concentrations has a value which is a reference to a list where each element is a float
+maxflux has a value which is a reference to a list where each element is a float
+minflux has a value which is a reference to a list where each element is a float
+overwrite has a value which is a bool
+auth has a value which is a string
 
 
 =end text
@@ -28742,7 +30122,7 @@ workspace has a value which is a string
 
 
 
-=head2 import_fbamodel_params
+=head2 export_media_params
 
 =over 4
 
@@ -28750,15 +30130,11 @@ workspace has a value which is a string
 
 =item Description
 
-Input parameters for the "import_fbamodel" function.
+Input parameters for the "export_media" function.
 
-        genome_id genome - ID of the genome for which a model is to be built (a required argument)
-        workspace_id genome_workspace - ID of the workspace containing the target genome (an optional argument; default is the workspace argument)
-        string biomass - biomass equation for model (an essential argument)
-        list<tuple<string id,string direction,string compartment,string gpr> reactions - list of reactions to appear in imported model (an essential argument)
-        fbamodel_id model - ID that should be used for the newly imported model (an optional argument; default is 'undef')
-        workspace_id workspace - ID of the workspace where the newly developed model will be stored; also the default assumed workspace for input objects (a required argument)
-        bool ignore_errors - ignores missing genes or reactions and imports model anyway
+        media_id media - ID of the media to be exported (a required argument)
+        workspace_id workspace - workspace containing the media to be exported (a required argument)
+        string format - format to which the media should be exported (html, json, readable) (a required argument)
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -28768,20 +30144,10 @@ Input parameters for the "import_fbamodel" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-biomass has a value which is a string
-reactions has a value which is a reference to a list where each element is a reference to a list containing 4 items:
-0: (id) a string
-1: (direction) a string
-2: (compartment) a string
-3: (gpr) a string
-
-model has a value which is a fbamodel_id
+media has a value which is a media_id
 workspace has a value which is a workspace_id
-ignore_errors has a value which is a bool
+format has a value which is a string
 auth has a value which is a string
-overwrite has a value which is a bool
 
 </pre>
 
@@ -28790,20 +30156,10 @@ overwrite has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-genome_workspace has a value which is a workspace_id
-biomass has a value which is a string
-reactions has a value which is a reference to a list where each element is a reference to a list containing 4 items:
-0: (id) a string
-1: (direction) a string
-2: (compartment) a string
-3: (gpr) a string
-
-model has a value which is a fbamodel_id
+media has a value which is a media_id
 workspace has a value which is a workspace_id
-ignore_errors has a value which is a bool
+format has a value which is a string
 auth has a value which is a string
-overwrite has a value which is a bool
 
 
 =end text
@@ -28812,7 +30168,7 @@ overwrite has a value which is a bool
 
 
 
-=head2 export_fbamodel_params
+=head2 runfba_params
 
 =over 4
 
@@ -28820,12 +30176,19 @@ overwrite has a value which is a bool
 
 =item Description
 
-Input parameters for the "export_fbamodel" function.
+Input parameters for the "addmedia" function.
 
-        fbamodel_id model - ID of the model to be exported (a required argument)
-        workspace_id workspace - workspace containing the model to be exported (a required argument)
-        fba_id fba - A FBA object related to the model. (an optional argument)
-        string format - format to which the model should be exported (sbml, html, json, readable, cytoseed) (a required argument)
+        fbamodel_id model - ID of the model that FBA should be run on (a required argument)
+        workspace_id model_workspace - workspace where model for FBA should be run (an optional argument; default is the value of the workspace argument)
+        FBAFormulation formulation - a hash specifying the parameters for the FBA study (an optional argument)
+        bool fva - a flag indicating if flux variability should be run (an optional argument: default is '0')
+        bool simulateko - a flag indicating if flux variability should be run (an optional argument: default is '0')
+        bool minimizeflux - a flag indicating if flux variability should be run (an optional argument: default is '0')
+        bool findminmedia - a flag indicating if flux variability should be run (an optional argument: default is '0')
+        string notes - a string of notes to attach to the FBA study (an optional argument; defaul is '')
+        fba_id fba - ID under which the FBA results should be saved (an optional argument; defaul is 'undef')
+        workspace_id workspace - workspace where FBA results will be saved (a required argument)
+        bool add_to_model - a flag indicating if the FBA study should be attached to the model to support viewing results (an optional argument: default is '0')
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -28836,10 +30199,18 @@ Input parameters for the "export_fbamodel" function.
 <pre>
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+fva has a value which is a bool
+simulateko has a value which is a bool
+minimizeflux has a value which is a bool
+findminmedia has a value which is a bool
+notes has a value which is a string
+fba has a value which is a fba_id
 workspace has a value which is a workspace_id
-fbas has a value which is a reference to a list where each element is a fba_id
-format has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
+add_to_model has a value which is a bool
 
 </pre>
 
@@ -28849,10 +30220,18 @@ auth has a value which is a string
 
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+fva has a value which is a bool
+simulateko has a value which is a bool
+minimizeflux has a value which is a bool
+findminmedia has a value which is a bool
+notes has a value which is a string
+fba has a value which is a fba_id
 workspace has a value which is a workspace_id
-fbas has a value which is a reference to a list where each element is a fba_id
-format has a value which is a string
 auth has a value which is a string
+overwrite has a value which is a bool
+add_to_model has a value which is a bool
 
 
 =end text
@@ -28861,7 +30240,7 @@ auth has a value which is a string
 
 
 
-=head2 export_object_params
+=head2 runfba_batch_params
 
 =over 4
 
@@ -28869,11 +30248,16 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "export_object" function.
+Input parameters for the "runfba_batch" function.
 
-        workspace_ref reference - reference of object to print in html (a required argument)
-        string type - type of the object to be exported (a required argument)
-        string format - format to which data should be exported (an optional argument; default is html)
+        fbamodel_id model - ID of the model that FBA should be run on (a required argument)
+        workspace_id model_workspace - workspace where model for FBA should be run (an optional argument; default is the value of the workspace argument)
+        list<FBAFormulation> formulations - the parameters of each FBA study in the batch (a required argument)
+        list<string> fluxes - IDs of the reactions, biomass reactions and compounds whose flux is reported for every formulation (an optional argument)
+        bool minimizeflux - a flag indicating if flux should be minimized after each study (an optional argument: default is '0')
+        bool save_fbas - a flag indicating if an FBA object should be saved for each study (an optional argument: default is '0')
+        list<fba_id> fbas - IDs under which the FBA objects should be saved, one per formulation (an optional argument; default is generated from the model ID)
+        workspace_id workspace - workspace where FBA results will be saved (a required argument)
         string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
 
 
@@ -28883,9 +30267,14 @@ Input parameters for the "export_object" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-reference has a value which is a workspace_ref
-type has a value which is a string
-format has a value which is a string
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulations has a value which is a reference to a list where each element is an FBAFormulation
+fluxes has a value which is a reference to a list where each element is a string
+minimizeflux has a value which is a bool
+save_fbas has a value which is a bool
+fbas has a value which is a reference to a list where each element is a fba_id
+workspace has a value which is a workspace_id
 auth has a value which is a string
 
 </pre>
@@ -28895,9 +30284,14 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-reference has a value which is a workspace_ref
-type has a value which is a string
-format has a value which is a string
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulations has a value which is a reference to a list where each element is an FBAFormulation
+fluxes has a value which is a reference to a list where each element is a string
+minimizeflux has a value which is a bool
+save_fbas has a value which is a bool
+fbas has a value which is a reference to a list where each element is a fba_id
+workspace has a value which is a workspace_id
 auth has a value which is a string
 
 
@@ -28907,7 +30301,7 @@ auth has a value which is a string
 
 
 
-=head2 export_genome_params
+=head2 FBABatchResults
 
 =over 4
 
@@ -28915,12 +30309,13 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "export_genome" function.
+Results of a batch of flux balance analyses, one entry per formulation in each list
 
-        genome_id genome - ID of the genome to be exported (a required argument)
-        workspace_id workspace - workspace containing the model to be exported (a required argument)
-        string format - format to which the model should be exported (sbml, html, json, readable, cytoseed) (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        list<string> fluxes - IDs of the fluxes reported
+        list<bool> feasible - flag indicating if each study had a solution
+        list<float> objectives - objective value of each study; 0 when it had no solution
+        list<list<float>> values - values of the reported fluxes in each study, in the order of fluxes
+        list<object_metadata> fbaMetas - metadata of the FBA objects saved (empty unless save_fbas is set)
 
 
 =item Definition
@@ -28929,10 +30324,11 @@ Input parameters for the "export_genome" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-format has a value which is a string
-auth has a value which is a string
+fluxes has a value which is a reference to a list where each element is a string
+feasible has a value which is a reference to a list where each element is a bool
+objectives has a value which is a reference to a list where each element is a float
+values has a value which is a reference to a list where each element is a reference to a list where each element is a float
+fbaMetas has a value which is a reference to a list where each element is an object_metadata
 
 </pre>
 
@@ -28941,10 +30337,11 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-genome has a value which is a genome_id
-workspace has a value which is a workspace_id
-format has a value which is a string
-auth has a value which is a string
+fluxes has a value which is a reference to a list where each element is a string
+feasible has a value which is a reference to a list where each element is a bool
+objectives has a value which is a reference to a list where each element is a float
+values has a value which is a reference to a list where each element is a reference to a list where each element is a float
+fbaMetas has a value which is a reference to a list where each element is an object_metadata
 
 
 =end text
@@ -28953,7 +30350,7 @@ auth has a value which is a string
 
 
 
-=head2 adjust_model_reaction_params
+=head2 sweep_parameter
 
 =over 4
 
@@ -28961,22 +30358,12 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "adjust_model_reaction" function.
-
-        fbamodel_id model - ID of model to be adjusted
-        workspace_id workspace - workspace containing model to be adjusted
-        list<reaction_id> reaction - List of IDs of reactions to be added, removed, or adjusted
-        list<string> direction - directions to set for reactions being added or adjusted
-        list<compartment_id> compartment - IDs of compartment containing reaction being added or adjusted
-        list<int> compartmentIndex - indexes of compartment containing reaction being altered or adjusted
-        list<string> gpr - array specifying gene-protein-reaction association(s)
-        bool removeReaction - boolean indicating listed reaction(s) should be removed
-        bool addReaction - boolean indicating reaction(s) should be added
-        bool overwrite - boolean indicating whether or not to overwrite model object in the workspace
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+A parameter swept by the "fba_parameter_sweep" function
 
-        For all of the lists above, if only one element is specified it is assumed the user wants to apply the same
-        to all the listed reactions.
+        string variable_type - type of the swept variable: flux, biomassflux, drainflux or constraint
+        string variable - ID of the reaction, biomass reaction or compound, or name of the constraint
+        string bound - bound of a flux that takes the swept values: lower, upper or both (an optional argument: default is 'upper'; the right hand side of a constraint is always swept)
+        list<float> values - the values swept
 
 
 =item Definition
@@ -28985,17 +30372,10 @@ Input parameters for the "adjust_model_reaction" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-model has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-reaction has a value which is a reference to a list where each element is a reaction_id
-direction has a value which is a reference to a list where each element is a string
-compartment has a value which is a reference to a list where each element is a compartment_id
-compartmentIndex has a value which is a reference to a list where each element is an int
-gpr has a value which is a reference to a list where each element is a string
-removeReaction has a value which is a bool
-addReaction has a value which is a bool
-overwrite has a value which is a bool
-auth has a value which is a string
+variable_type has a value which is a string
+variable has a value which is a string
+bound has a value which is a string
+values has a value which is a reference to a list where each element is a float
 
 </pre>
 
@@ -29004,17 +30384,10 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-model has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-reaction has a value which is a reference to a list where each element is a reaction_id
-direction has a value which is a reference to a list where each element is a string
-compartment has a value which is a reference to a list where each element is a compartment_id
-compartmentIndex has a value which is a reference to a list where each element is an int
-gpr has a value which is a reference to a list where each element is a string
-removeReaction has a value which is a bool
-addReaction has a value which is a bool
-overwrite has a value which is a bool
-auth has a value which is a string
+variable_type has a value which is a string
+variable has a value which is a string
+bound has a value which is a string
+values has a value which is a reference to a list where each element is a float
 
 
 =end text
@@ -29023,7 +30396,7 @@ auth has a value which is a string
 
 
 
-=head2 adjust_biomass_reaction_params
+=head2 fba_parameter_sweep_params
 
 =over 4
 
@@ -29031,16 +30404,14 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "adjust_biomass_reaction" function.
+Input parameters for the "fba_parameter_sweep" function.
 
-        fbamodel_id model - ID of model to be adjusted
-        workspace_id workspace - workspace containing model to be adjusted
-        biomass_id biomass - ID of biomass reaction to adjust
-        list<float> coefficients - coefficient of biomass compound
-        list<compound_id> compounds - ID of biomass compound to adjust in biomass
-        list<compartment_id> compartments - ID of compartment containing compound to adjust in biomass
-        list<int> compartmentIndecies - index of compartment containing compound to adjust in biomass
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        fbamodel_id model - ID of the model that FBA should be run on (a required argument)
+        workspace_id model_workspace - workspace where model for FBA should be run (a required argument)
+        FBAFormulation formulation - a hash specifying the parameters for the FBA study (an optional argument)
+        list<sweep_parameter> parameters - one or two parameters whose values span the grid (a required argument)
+        list<string> compounds - IDs of the compounds whose shadow prices are reported (an optional argument; default is the compounds whose drain fluxes are swept)
+        string auth - the authentication token of the KBase account (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -29050,12 +30421,10 @@ Input parameters for the "adjust_biomass_reaction" function.
 <pre>
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-biomass has a value which is a biomass_id
-coefficients has a value which is a reference to a list where each element is a float
-compounds has a value which is a reference to a list where each element is a compound_id
-compartments has a value which is a reference to a list where each element is a compartment_id
-compartmentIndecies has a value which is a reference to a list where each element is an int
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+parameters has a value which is a reference to a list where each element is a sweep_parameter
+compounds has a value which is a reference to a list where each element is a string
 auth has a value which is a string
 
 </pre>
@@ -29066,12 +30435,10 @@ auth has a value which is a string
 
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
-workspace has a value which is a workspace_id
-biomass has a value which is a biomass_id
-coefficients has a value which is a reference to a list where each element is a float
-compounds has a value which is a reference to a list where each element is a compound_id
-compartments has a value which is a reference to a list where each element is a compartment_id
-compartmentIndecies has a value which is a reference to a list where each element is an int
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+parameters has a value which is a reference to a list where each element is a sweep_parameter
+compounds has a value which is a reference to a list where each element is a string
 auth has a value which is a string
 
 
@@ -29081,7 +30448,7 @@ auth has a value which is a string
 
 
 
-=head2 addmedia_params
+=head2 FBASweepResults
 
 =over 4
 
@@ -29089,9 +30456,14 @@ auth has a value which is a string
 
 =item Description
 
-********************************************************************************
-    Code relating to flux balance analysis
-   	********************************************************************************
+Results of a parameter sweep, as dense arrays indexed by the position of the values of the first and the second parameter
+
+        list<float> values1 - values of the first parameter
+        list<float> values2 - values of the second parameter (empty when only one parameter is swept; the arrays then have one column)
+        list<list<bool>> feasible - flag indicating if each grid point had a solution
+        list<list<float>> objectives - objective value at each grid point; 0 when it had no solution
+        list<string> compounds - IDs of the compounds whose shadow prices are reported
+        list<list<list<float>>> shadow_prices - objective gained per unit of each compound supplied, at each grid point, in the order of compounds
 
 
 =item Definition
@@ -29100,18 +30472,12 @@ auth has a value which is a string
 
 <pre>
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-workspace has a value which is a workspace_id
-name has a value which is a string
-isDefined has a value which is a bool
-isMinimal has a value which is a bool
-type has a value which is a string
+values1 has a value which is a reference to a list where each element is a float
+values2 has a value which is a reference to a list where each element is a float
+feasible has a value which is a reference to a list where each element is a reference to a list where each element is a bool
+objectives has a value which is a reference to a list where each element is a reference to a list where each element is a float
 compounds has a value which is a reference to a list where each element is a string
-concentrations has a value which is a reference to a list where each element is a float
-maxflux has a value which is a reference to a list where each element is a float
-minflux has a value which is a reference to a list where each element is a float
-overwrite has a value which is a bool
-auth has a value which is a string
+shadow_prices has a value which is a reference to a list where each element is a reference to a list where each element is a reference to a list where each element is a float
 
 </pre>
 
@@ -29120,18 +30486,12 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-workspace has a value which is a workspace_id
-name has a value which is a string
-isDefined has a value which is a bool
-isMinimal has a value which is a bool
-type has a value which is a string
+values1 has a value which is a reference to a list where each element is a float
+values2 has a value which is a reference to a list where each element is a float
+feasible has a value which is a reference to a list where each element is a reference to a list where each element is a bool
+objectives has a value which is a reference to a list where each element is a reference to a list where each element is a float
 compounds has a value which is a reference to a list where each element is a string
-concentrations has a value which is a reference to a list where each element is a float
-maxflux has a value which is a reference to a list where each element is a float
-minflux has a value which is a reference to a list where each element is a float
-overwrite has a value which is a bool
-auth has a value which is a string
+shadow_prices has a value which is a reference to a list where each element is a reference to a list where each element is a reference to a list where each element is a float
 
 
 =end text
@@ -29140,7 +30500,7 @@ auth has a value which is a string
 
 
 
-=head2 export_media_params
+=head2 simulate_double_knockouts_params
 
 =over 4
 
@@ -29148,12 +30508,13 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "export_media" function.
+Input parameters for the "simulate_double_knockouts" function.
 
-        media_id media - ID of the media to be exported (a required argument)
-        workspace_id workspace - workspace containing the media to be exported (a required argument)
-        string format - format to which the media should be exported (html, json, readable) (a required argument)
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        fbamodel_id model - ID of the model that knockouts should be simulated on (a required argument)
+        workspace_id model_workspace - workspace where model is located (a required argument)
+        FBAFormulation formulation - a hash specifying the parameters for the FBA study; gene knockouts listed here apply to every pair (an optional argument)
+        list<feature_id> genes - genes to knock out in pairs (an optional argument; default is every gene of the model)
+        string auth - the authentication token of the KBase account (an optional argument; user is "public" if auth is not provided)
 
 
 =item Definition
@@ -29162,9 +30523,10 @@ Input parameters for the "export_media" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-workspace has a value which is a workspace_id
-format has a value which is a string
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+genes has a value which is a reference to a list where each element is a feature_id
 auth has a value which is a string
 
 </pre>
@@ -29174,9 +30536,10 @@ auth has a value which is a string
 =begin text
 
 a reference to a hash where the following keys are defined:
-media has a value which is a media_id
-workspace has a value which is a workspace_id
-format has a value which is a string
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+formulation has a value which is an FBAFormulation
+genes has a value which is a reference to a list where each element is a feature_id
 auth has a value which is a string
 
 
@@ -29186,7 +30549,7 @@ auth has a value which is a string
 
 
 
-=head2 runfba_params
+=head2 DoubleKnockoutMatrix
 
 =over 4
 
@@ -29194,20 +30557,15 @@ auth has a value which is a string
 
 =item Description
 
-Input parameters for the "addmedia" function.
+Growth of double gene knockouts, stored as a sparse upper triangular matrix
 
-        fbamodel_id model - ID of the model that FBA should be run on (a required argument)
-        workspace_id model_workspace - workspace where model for FBA should be run (an optional argument; default is the value of the workspace argument)
-        FBAFormulation formulation - a hash specifying the parameters for the FBA study (an optional argument)
-        bool fva - a flag indicating if flux variability should be run (an optional argument: default is '0')
-        bool simulateko - a flag indicating if flux variability should be run (an optional argument: default is '0')
-        bool minimizeflux - a flag indicating if flux variability should be run (an optional argument: default is '0')
-        bool findminmedia - a flag indicating if flux variability should be run (an optional argument: default is '0')
-        string notes - a string of notes to attach to the FBA study (an optional argument; defaul is '')
-        fba_id fba - ID under which the FBA results should be saved (an optional argument; defaul is 'undef')
-        workspace_id workspace - workspace where FBA results will be saved (a required argument)
-        bool add_to_model - a flag indicating if the FBA study should be attached to the model to support viewing results (an optional argument: default is '0')
-        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+        list<feature_id> genes - genes knocked out, in matrix order
+        float wildtype_growth - objective value with no gene knocked out
+        list<float> single_growth - objective value with each gene knocked out, in the order of genes
+        list<tuple<int,int,float>> interactions - (index of first gene, index of second gene, objective value) for the pairs that grow less than both of their single knockouts, first gene index less than second
+        int solved - number of knockouts that had to be solved
+
+        Every pair not listed in interactions grows as its slower single knockout.
 
 
 =item Definition
@@ -29216,19 +30574,15 @@ Input parameters for the "addmedia" function.
 
 <pre>
 a reference to a hash where the following keys are defined:
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-formulation has a value which is an FBAFormulation
-fva has a value which is a bool
-simulateko has a value which is a bool
-minimizeflux has a value which is a bool
-findminmedia has a value which is a bool
-notes has a value which is a string
-fba has a value which is a fba_id
-workspace has a value which is a workspace_id
-auth has a value which is a string
-overwrite has a value which is a bool
-add_to_model has a value which is a bool
+genes has a value which is a reference to a list where each element is a feature_id
+wildtype_growth has a value which is a float
+single_growth has a value which is a reference to a list where each element is a float
+interactions has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+0: an int
+1: an int
+2: a float
+
+solved has a value which is an int
 
 </pre>
 
@@ -29237,19 +30591,15 @@ add_to_model has a value which is a bool
 =begin text
 
 a reference to a hash where the following keys are defined:
-model has a value which is a fbamodel_id
-model_workspace has a value which is a workspace_id
-formulation has a value which is an FBAFormulation
-fva has a value which is a bool
-simulateko has a value which is a bool
-minimizeflux has a value which is a bool
-findminmedia has a value which is a bool
-notes has a value which is a string
-fba has a value which is a fba_id
-workspace has a value which is a workspace_id
-auth has a value which is a string
-overwrite has a value which is a bool
-add_to_model has a value which is a bool
+genes has a value which is a reference to a list where each element is a feature_id
+wildtype_growth has a value which is a float
+single_growth has a value which is a reference to a list where each element is a float
+interactions has a value which is a reference to a list where each element is a reference to a list containing 3 items:
+0: an int
+1: an int
+2: a float
+
+solved has a value which is an int
 
 
 =end text
@@ -29322,6 +30672,8 @@ Input parameters for the "generate_model_stats" function.
 
         fbamodel_id model - ID of the models that FBA should be run on (a required argument)
         workspace_id model_workspace - workspaces where model for FBA should be run (an optional argument; default is the value of the workspace argument)
+        media_id minimal_media - ID of the minimal media essential genes and reactions are computed on (an optional argument; default is set by the service, normally 'Carbon-D-Glucose')
+        workspace_id minimal_media_workspace - workspace where the minimal media is located (an optional argument; default is set by the service, normally 'KBaseMedia')
 
 
 =item Definition
@@ -29332,6 +30684,8 @@ Input parameters for the "generate_model_stats" function.
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
+minimal_media has a value which is a media_id
+minimal_media_workspace has a value which is a workspace_id
 
 </pre>
 
@@ -29342,6 +30696,8 @@ model_workspace has a value which is a workspace_id
 a reference to a hash where the following keys are defined:
 model has a value which is a fbamodel_id
 model_workspace has a value which is a workspace_id
+minimal_media has a value which is a media_id
+minimal_media_workspace has a value which is a workspace_id
 
 
 =end text
@@ -30305,6 +31661,148 @@ overwrite has a value which is a bool
 
 
 
+=head2 reconcile_phenotypes_params
+
+=over 4
+
+
+
+=item Description
+
+Input parameters for the "reconcile_phenotypes" function.
+
+        fbamodel_id model - ID of the model that reconciliation should be run on (a required argument)
+        workspace_id model_workspace - workspace where model for reconciliation should be run (an optional argument; default is the value of the workspace argument)
+        FBAFormulation fba_formulation - a hash specifying the parameters for the reconciliation study (an optional argument)
+        GapfillingFormulation gapfill_formulation - a hash specifying the parameters for the gapfill study (an optional argument)
+        GapgenFormulation gapgen_formulation - a hash specifying the parameters for the gapgen study (an optional argument)
+        phenotype_set_id phenotypeSet - ID of a phenotype set against which the model should be reconciled (a required argument)
+        workspace_id phenotypeSet_workspace - workspace containing phenotype set to be simulated (an optional argument; default is the value of the workspace argument)
+        fbamodel_id out_model - ID where the reconciled model will be saved (an optional argument: default is the value of the model argument)
+        list<gapgen_id> gapGens - IDs of the gapgen studies or solutions to analyse and combine (an optional argument: default is all of them)
+        list<gapfill_id> gapFills - IDs of the gapfill studies or solutions to analyse and combine (an optional argument: default is all of them)
+        bool sensitivity_analysis - flag indicating if the phenotype set should be simulated with each solution (an optional argument: default is '0')
+        bool combine_solutions - flag indicating if the solutions should be combined and integrated into the reconciled model (an optional argument: default is '0')
+        workspace_id workspace - workspace where reconciliation results will be saved (a required argument)
+        string auth - the authentication token of the KBase account changing workspace permissions; must have 'admin' privelages to workspace (an optional argument; user is "public" if auth is not provided)
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a hash where the following keys are defined:
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+fba_formulation has a value which is an FBAFormulation
+gapfill_formulation has a value which is a GapfillingFormulation
+gapgen_formulation has a value which is a GapgenFormulation
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSet_workspace has a value which is a workspace_id
+out_model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+gapFills has a value which is a reference to a list where each element is a gapfill_id
+gapGens has a value which is a reference to a list where each element is a gapgen_id
+sensitivity_analysis has a value which is a bool
+combine_solutions has a value which is a bool
+auth has a value which is a string
+overwrite has a value which is a bool
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a hash where the following keys are defined:
+model has a value which is a fbamodel_id
+model_workspace has a value which is a workspace_id
+fba_formulation has a value which is an FBAFormulation
+gapfill_formulation has a value which is a GapfillingFormulation
+gapgen_formulation has a value which is a GapgenFormulation
+phenotypeSet has a value which is a phenotype_set_id
+phenotypeSet_workspace has a value which is a workspace_id
+out_model has a value which is a fbamodel_id
+workspace has a value which is a workspace_id
+gapFills has a value which is a reference to a list where each element is a gapfill_id
+gapGens has a value which is a reference to a list where each element is a gapgen_id
+sensitivity_analysis has a value which is a bool
+combine_solutions has a value which is a bool
+auth has a value which is a string
+overwrite has a value which is a bool
+
+
+=end text
+
+=back
+
+
+
+=head2 PhenotypeReconciliation
+
+=over 4
+
+
+
+=item Description
+
+Results of the "reconcile_phenotypes" function.
+
+        mapping<string,int> phenoclasses - number of phenotypes the model predicts in each class (CP, CN, FP, FN)
+        list<fba_id> gapfills - IDs of the gapfilling FBA objects saved, one per false negative with solutions
+        list<gapgen_id> gapgens - IDs of the Gapgeneration objects saved, one per false positive with solutions
+        mapping<string,tuple<list<string>,list<string>>> sensitivity - by solution ID, the IDs of the phenotypes the solution corrects and of those it makes wrong
+        list<string> combined_solutions - IDs of the solutions integrated into the reconciled model
+        mapping<string,int> reconciled_phenoclasses - number of phenotypes the reconciled model predicts in each class
+        object_metadata reconciled_model - metadata of the reconciled model, when the solutions were combined
+        string checkpoint - file holding the results of the completed stages, which a later call for the same model, phenotype set and formulations resumes from
+
+
+=item Definition
+
+=begin html
+
+<pre>
+a reference to a hash where the following keys are defined:
+phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+gapfills has a value which is a reference to a list where each element is a fba_id
+gapgens has a value which is a reference to a list where each element is a gapgen_id
+sensitivity has a value which is a reference to a hash where the key is a string and the value is a reference to a list containing 2 items:
+0: a reference to a list where each element is a string
+1: a reference to a list where each element is a string
+
+combined_solutions has a value which is a reference to a list where each element is a string
+reconciled_phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+reconciled_model has a value which is an object_metadata
+checkpoint has a value which is a string
+
+</pre>
+
+=end html
+
+=begin text
+
+a reference to a hash where the following keys are defined:
+phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+gapfills has a value which is a reference to a list where each element is a fba_id
+gapgens has a value which is a reference to a list where each element is a gapgen_id
+sensitivity has a value which is a reference to a hash where the key is a string and the value is a reference to a list containing 2 items:
+0: a reference to a list where each element is a string
+1: a reference to a list where each element is a string
+
+combined_solutions has a value which is a reference to a list where each element is a string
+reconciled_phenoclasses has a value which is a reference to a hash where the key is a string and the value is an int
+reconciled_model has a value which is an object_metadata
+checkpoint has a value which is a string
+
+
+=end text
+
+=back
+
+
+
 =head2 run_job_params
 
 =over 4
@@ -58,6 +58,9 @@ our %return_counts = (
         'addmedia' => 1,
         'export_media' => 1,
         'runfba' => 1,
+        'runfba_batch' => 1,
+        'fba_parameter_sweep' => 1,
+        'simulate_double_knockouts' => 1,
         'quantitative_optimization' => 1,
         'generate_model_stats' => 1,
         'minimize_reactions' => 1,
@@ -75,6 +78,7 @@ our %return_counts = (
         'queue_wildtype_phenotype_reconciliation' => 1,
         'queue_reconciliation_sensitivity_analysis' => 1,
         'queue_combine_wildtype_phenotype_reconciliation' => 1,
+        'reconcile_phenotypes' => 1,
         'run_job' => 1,
         'queue_job' => 1,
         'set_cofactors' => 1,
@@ -158,6 +162,9 @@ our %method_authentication = (
         'addmedia' => 'required',
         'export_media' => 'optional',
         'runfba' => 'required',
+        'runfba_batch' => 'required',
+        'fba_parameter_sweep' => 'required',
+        'simulate_double_knockouts' => 'required',
         'quantitative_optimization' => 'required',
         'generate_model_stats' => 'required',
         'minimize_reactions' => 'required',
@@ -175,6 +182,7 @@ our %method_authentication = (
         'queue_wildtype_phenotype_reconciliation' => 'required',
         'queue_reconciliation_sensitivity_analysis' => 'required',
         'queue_combine_wildtype_phenotype_reconciliation' => 'required',
+        'reconcile_phenotypes' => 'required',
         'run_job' => 'required',
         'queue_job' => 'required',
         'set_cofactors' => 'required',
@@ -261,6 +269,9 @@ sub _build_valid_methods
         'addmedia' => 1,
         'export_media' => 1,
         'runfba' => 1,
+        'runfba_batch' => 1,
+        'fba_parameter_sweep' => 1,
+        'simulate_double_knockouts' => 1,
         'quantitative_optimization' => 1,
         'generate_model_stats' => 1,
         'minimize_reactions' => 1,
@@ -278,6 +289,7 @@ sub _build_valid_methods
         'queue_wildtype_phenotype_reconciliation' => 1,
         'queue_reconciliation_sensitivity_analysis' => 1,
         'queue_combine_wildtype_phenotype_reconciliation' => 1,
+        'reconcile_phenotypes' => 1,
         'run_job' => 1,
         'queue_job' => 1,
         'set_cofactors' => 1,
@@ -0,0 +1,179 @@
+'''
+Precomputed alias index behind get_alias and get_aliassets.
+
+An index is built once from a Biochemistry object's compound_aliases and
+reaction_aliases and is tied to the workspace reference (ws/obj/version) of
+that object. Indexes are written to disk as gzipped JSON so that worker
+processes can load them without reading the biochemistry from the
+workspace, and are held in memory for the life of the worker. A new index
+is built whenever the biochemistry gets a new version.
+'''
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+
+# object types accepted by get_alias and the Biochemistry fields holding
+# their aliases
+OBJECT_TYPES = {'compound': ('compounds', 'compound_aliases'),
+                'reaction': ('reactions', 'reaction_aliases')}
+
+# the alias sets every object has, whether or not the biochemistry lists
+# them
+_ID_SET = 'ModelSEED'
+_NAME_SET = 'name'
+
+_lock = threading.Lock()
+_indexes = {}
+
+
+class AliasIndex(object):
+
+    def __init__(self, ref, aliases):
+        '''
+        ref -- workspace reference of the biochemistry, ws/obj/version
+        aliases -- {object_type: {object_id: {alias_set: [alias, ...]}}}
+        '''
+        self.ref = ref
+        self._aliases = aliases
+        # {(object_type, alias_set): {alias: [object_id, ...]}}
+        self._by_alias = {}
+        # {(object_type, input_set, output_set): {alias: [alias, ...]}}
+        self._translations = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_biochemistry(cls, ref, biochem):
+        aliases = {}
+        for object_type, (objects, field) in OBJECT_TYPES.items():
+            typed = {}
+            for obj in biochem.get(objects, []):
+                sets = {_ID_SET: [obj['id']]}
+                if obj.get('name'):
+                    sets[_NAME_SET] = [obj['name']]
+                typed[obj['id']] = sets
+            for obj_id, sets in biochem.get(field, {}).items():
+                typed.setdefault(obj_id, {}).update(sets)
+            aliases[object_type] = typed
+        return cls(ref, aliases)
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, 'rb') as f:
+            data = json.loads(f.read().decode('utf-8'))
+        return cls(data['ref'], data['aliases'])
+
+    def save(self, path):
+        # written under a temporary name and renamed, so that a worker never
+        # reads an index another worker is still writing
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        os.close(fd)
+        with gzip.open(tmp, 'wb') as f:
+            f.write(json.dumps({'ref': self.ref, 'aliases': self._aliases},
+                               separators=(',', ':')).encode('utf-8'))
+        os.rename(tmp, path)
+
+    def alias_sets(self, object_type):
+        '''Returns the alias sets known for an object type.'''
+        sets = set()
+        for obj_sets in self._objects(object_type).values():
+            sets.update(obj_sets)
+        return sorted(sets)
+
+    def lookup(self, object_type, input_id_type, output_id_type, input_ids):
+        '''
+        Translates input_ids from one alias set to another in a single pass.
+        Returns get_alias_outputs for the ids that were found, in input
+        order.
+        '''
+        table = self._translation(object_type, input_id_type, output_id_type)
+        output = []
+        for input_id in input_ids:
+            aliases = table.get(input_id)
+            if aliases is not None:
+                output.append({'original_id': input_id,
+                               'aliases': list(aliases)})
+        return output
+
+    def _objects(self, object_type):
+        object_type = object_type.lower()
+        if object_type not in self._aliases:
+            raise ValueError('Object type %s does not support alias sets' %
+                             object_type)
+        return self._aliases[object_type]
+
+    def _translation(self, object_type, input_set, output_set):
+        key = (object_type.lower(), input_set, output_set)
+        with self._lock:
+            table = self._translations.get(key)
+        if table is not None:
+            return table
+        objects = self._objects(object_type)
+        by_alias = self._reverse(key[0], input_set)
+        table = {}
+        for alias, obj_ids in by_alias.items():
+            seen = set()
+            out = []
+            for obj_id in obj_ids:
+                for output in objects[obj_id].get(output_set, []):
+                    if output not in seen:
+                        seen.add(output)
+                        out.append(output)
+            table[alias] = out
+        with self._lock:
+            self._translations[key] = table
+        return table
+
+    def _reverse(self, object_type, alias_set):
+        key = (object_type, alias_set)
+        with self._lock:
+            by_alias = self._by_alias.get(key)
+        if by_alias is not None:
+            return by_alias
+        by_alias = {}
+        for obj_id in sorted(self._aliases[object_type]):
+            for alias in self._aliases[object_type][obj_id].get(alias_set,
+                                                                []):
+                by_alias.setdefault(alias, []).append(obj_id)
+        with self._lock:
+            self._by_alias[key] = by_alias
+        return by_alias
+
+
+def get_index(ref, load_biochemistry, directory=None):
+    '''
+    Returns the alias index for the biochemistry at workspace reference ref
+    (ws/obj/version). The index is taken from memory, then from directory,
+    and only built with load_biochemistry() - which must return the
+    Biochemistry object data - when neither has it. Older versions of the
+    same biochemistry are dropped from memory.
+    '''
+    base = ref.rsplit('/', 1)[0]
+    with _lock:
+        index = _indexes.get(base)
+    if index is not None and index.ref == ref:
+        return index
+    if directory is None:
+        directory = os.path.join(tempfile.gettempdir(), 'AliasIndex')
+    path = os.path.join(directory, ref.replace('/', '_') + '.json.gz')
+    index = None
+    if os.path.exists(path):
+        try:
+            index = AliasIndex.load(path)
+        except (IOError, ValueError, KeyError):
+            index = None
+    if index is None:
+        index = AliasIndex.from_biochemistry(ref, load_biochemistry())
+        index.save(path)
+    with _lock:
+        _indexes[base] = index
+    return index
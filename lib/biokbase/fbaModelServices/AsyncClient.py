@@ -0,0 +1,713 @@
+############################################################
+#
+# asyncio variant of the fbaModelServices client. Requires Python 3.5+ and
+# aiohttp; the method surface matches Client.py, with every service method
+# a coroutine.
+#
+# This module is Python 3 only and does not compile under Python 2, where
+# Client (or Transport) is the client to use. Client.py is generated
+# Python 2 code that Python 3 cannot import, so the auth file readers,
+# ServerError and the JSON encoder are kept here in their Python 3 form
+# instead of being shared, and _get_token asks for the token through the
+# client's aiohttp session.
+#
+############################################################
+
+import asyncio as _asyncio
+import json as _json
+import os as _os
+import random as _random
+from base64 import b64encode as _b64encode
+from configparser import ConfigParser as _ConfigParser
+from urllib.parse import urlparse as _urlparse
+
+import aiohttp as _aiohttp
+
+_CT = 'content-type'
+_AJ = 'application/json'
+_URL_SCHEME = frozenset(['http', 'https'])
+
+
+async def _get_token(session, user_id, password,
+                     auth_svc='https://nexus.api.globusonline.org/goauth/' +
+                              'token?grant_type=client_credentials'):
+    auth = _b64encode((user_id + ':' + password).encode()).decode()
+    headers = {'Authorization': 'Basic ' + auth}
+    async with session.get(auth_svc, headers=headers) as ret:
+        text = await ret.text()
+        if ret.status >= 200 and ret.status <= 299:
+            tok = _json.loads(text)
+        elif ret.status == 403:
+            raise Exception('Authentication failed: Bad user_id/password ' +
+                            'combination for user %s' % (user_id))
+        else:
+            raise Exception(text)
+    return tok['access_token']
+
+
+def _read_rcfile(file=_os.environ['HOME'] + '/.authrc'):  # @ReservedAssignment
+    authdata = None
+    if _os.path.exists(file):
+        try:
+            with open(file) as authrc:
+                rawdata = _json.load(authrc)
+                # strip down whatever we read to only what is legit
+                authdata = {x: rawdata.get(x) for x in (
+                    'user_id', 'token', 'client_secret', 'keyfile',
+                    'keyfile_passphrase', 'password')}
+        except Exception as e:
+            print("Error while reading authrc file %s: %s" % (file, e))
+    return authdata
+
+
+def _read_inifile(file=_os.environ.get(  # @ReservedAssignment
+                  'KB_DEPLOYMENT_CONFIG', _os.environ['HOME'] +
+                  '/.kbase_config')):
+    authdata = None
+    if _os.path.exists(file):
+        try:
+            config = _ConfigParser()
+            config.read(file)
+            # strip down whatever we read to only what is legit
+            authdata = {x: config.get('authentication', x)
+                        if config.has_option('authentication', x)
+                        else None for x in ('user_id', 'token',
+                                            'client_secret', 'keyfile',
+                                            'keyfile_passphrase', 'password')}
+        except Exception as e:
+            print("Error while reading INI file %s: %s" % (file, e))
+    return authdata
+
+
+class ServerError(Exception):
+
+    def __init__(self, name, code, message, data=None, error=None):
+        self.name = name
+        self.code = code
+        self.message = '' if message is None else message
+        self.data = data or error or ''
+        # data = JSON RPC 2.0, error = 1.1
+
+    def __str__(self):
+        return self.name + ': ' + str(self.code) + '. ' + self.message + \
+            '\n' + self.data
+
+
+class _JSONObjectEncoder(_json.JSONEncoder):
+
+    def default(self, obj):
+        if isinstance(obj, set):
+            return list(obj)
+        if isinstance(obj, frozenset):
+            return list(obj)
+        return _json.JSONEncoder.default(self, obj)
+
+
+class fbaModelServices(object):
+    '''
+    Coroutine based fbaModelServices client.
+
+    At most max_concurrency calls made through one client are in flight at
+    a time; further calls wait their turn, so fanning out with
+    asyncio.gather over hundreds of objects stays bounded. Connections are
+    kept alive in a pool of pool_size connections, which can be shared
+    between clients by passing the same aiohttp session to each. timeout
+    bounds every call in seconds, and cancelling the calling task aborts
+    the request and frees its slot.
+
+    Use it as an async context manager, or call close(), to release the
+    connection pool.
+    '''
+
+    def __init__(self, url=None, timeout=30 * 60, user_id=None,
+                 password=None, token=None, ignore_authrc=False,
+                 trust_all_ssl_certificates=False, max_concurrency=10,
+                 pool_size=10, session=None):
+        if url is None:
+            raise ValueError('A url is required')
+        scheme = _urlparse(url).scheme
+        if scheme not in _URL_SCHEME:
+            raise ValueError(url + " isn't a valid http url")
+        self.url = url
+        self.timeout = int(timeout)
+        if self.timeout < 1:
+            raise ValueError('Timeout value must be at least 1 second')
+        self._headers = dict()
+        self.trust_all_ssl_certificates = trust_all_ssl_certificates
+        self._semaphore = _asyncio.Semaphore(max_concurrency)
+        self._pool_size = pool_size
+        self._session = session
+        self._own_session = session is None
+        # user_id and password are exchanged for a token on the first call
+        self._credentials = None
+        # token overrides user_id and password
+        if token is not None:
+            self._headers['AUTHORIZATION'] = token
+        elif user_id is not None and password is not None:
+            self._credentials = (user_id, password)
+        elif 'KB_AUTH_TOKEN' in _os.environ:
+            self._headers['AUTHORIZATION'] = _os.environ.get('KB_AUTH_TOKEN')
+        elif not ignore_authrc:
+            authdata = _read_inifile()
+            if authdata is None:
+                authdata = _read_rcfile()
+            if authdata is not None:
+                if authdata.get('token') is not None:
+                    self._headers['AUTHORIZATION'] = authdata['token']
+                elif(authdata.get('user_id') is not None
+                     and authdata.get('password') is not None):
+                    self._credentials = (authdata['user_id'],
+                                         authdata['password'])
+
+    def _get_session(self):
+        if self._session is None:
+            connector = _aiohttp.TCPConnector(limit=self._pool_size)
+            self._session = _aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        if self._own_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def _call(self, method, params):
+        arg_hash = {'method': method,
+                    'params': params,
+                    'version': '1.1',
+                    'id': str(_random.random())[2:]
+                    }
+
+        body = _json.dumps(arg_hash, cls=_JSONObjectEncoder)
+        session = self._get_session()
+        async with self._semaphore:
+            if self._credentials is not None:
+                user_id, password = self._credentials
+                self._credentials = None
+                self._headers['AUTHORIZATION'] = await _get_token(
+                    session, user_id, password)
+            async with session.post(
+                    self.url, data=body, headers=self._headers,
+                    timeout=_aiohttp.ClientTimeout(total=self.timeout),
+                    ssl=False if self.trust_all_ssl_certificates
+                    else None) as ret:
+                text = await ret.text()
+                if ret.status == 500:
+                    if ret.headers.get(_CT) == _AJ:
+                        err = _json.loads(text)
+                        if 'error' in err:
+                            raise ServerError(**err['error'])
+                        else:
+                            raise ServerError('Unknown', 0, text)
+                    else:
+                        raise ServerError('Unknown', 0, text)
+                ret.raise_for_status()
+        resp = _json.loads(text)
+        if 'result' not in resp:
+            raise ServerError('Unknown', 0, 'An unknown server error occurred')
+        return resp['result']
+
+    async def get_models(self, input):
+        resp = await self._call('fbaModelServices.get_models',
+                                [input])
+        return resp[0]
+
+    async def get_fbas(self, input):
+        resp = await self._call('fbaModelServices.get_fbas',
+                                [input])
+        return resp[0]
+
+    async def get_gapfills(self, input):
+        resp = await self._call('fbaModelServices.get_gapfills',
+                                [input])
+        return resp[0]
+
+    async def get_gapgens(self, input):
+        resp = await self._call('fbaModelServices.get_gapgens',
+                                [input])
+        return resp[0]
+
+    async def get_reactions(self, input):
+        resp = await self._call('fbaModelServices.get_reactions',
+                                [input])
+        return resp[0]
+
+    async def get_compounds(self, input):
+        resp = await self._call('fbaModelServices.get_compounds',
+                                [input])
+        return resp[0]
+
+    async def get_alias(self, input):
+        resp = await self._call('fbaModelServices.get_alias',
+                                [input])
+        return resp[0]
+
+    async def get_aliassets(self, input):
+        resp = await self._call('fbaModelServices.get_aliassets',
+                                [input])
+        return resp[0]
+
+    async def get_media(self, input):
+        resp = await self._call('fbaModelServices.get_media',
+                                [input])
+        return resp[0]
+
+    async def get_biochemistry(self, input):
+        resp = await self._call('fbaModelServices.get_biochemistry',
+                                [input])
+        return resp[0]
+
+    async def import_probanno(self, input):
+        resp = await self._call('fbaModelServices.import_probanno',
+                                [input])
+        return resp[0]
+
+    async def genome_object_to_workspace(self, input):
+        resp = await self._call('fbaModelServices.genome_object_to_workspace',
+                                [input])
+        return resp[0]
+
+    async def genome_to_workspace(self, input):
+        resp = await self._call('fbaModelServices.genome_to_workspace',
+                                [input])
+        return resp[0]
+
+    async def domains_to_workspace(self, input):
+        resp = await self._call('fbaModelServices.domains_to_workspace',
+                                [input])
+        return resp[0]
+
+    async def compute_domains(self, params):
+        resp = await self._call('fbaModelServices.compute_domains',
+                                [params])
+        return resp[0]
+
+    async def add_feature_translation(self, input):
+        resp = await self._call('fbaModelServices.add_feature_translation',
+                                [input])
+        return resp[0]
+
+    async def genome_to_fbamodel(self, input):
+        resp = await self._call('fbaModelServices.genome_to_fbamodel',
+                                [input])
+        return resp[0]
+
+    async def translate_fbamodel(self, input):
+        resp = await self._call('fbaModelServices.translate_fbamodel',
+                                [input])
+        return resp[0]
+
+    async def build_pangenome(self, input):
+        resp = await self._call('fbaModelServices.build_pangenome',
+                                [input])
+        return resp[0]
+
+    async def genome_heatmap_from_pangenome(self, input):
+        resp = await self._call('fbaModelServices.genome_heatmap_from_pangenome',
+                                [input])
+        return resp[0]
+
+    async def ortholog_family_from_pangenome(self, input):
+        resp = await self._call('fbaModelServices.ortholog_family_from_pangenome',
+                                [input])
+        return resp[0]
+
+    async def pangenome_to_proteome_comparison(self, input):
+        resp = await self._call('fbaModelServices.pangenome_to_proteome_comparison',
+                                [input])
+        return resp[0]
+
+    async def import_fbamodel(self, input):
+        resp = await self._call('fbaModelServices.import_fbamodel',
+                                [input])
+        return resp[0]
+
+    async def export_fbamodel(self, input):
+        resp = await self._call('fbaModelServices.export_fbamodel',
+                                [input])
+        return resp[0]
+
+    async def export_object(self, input):
+        resp = await self._call('fbaModelServices.export_object',
+                                [input])
+        return resp[0]
+
+    async def export_genome(self, input):
+        resp = await self._call('fbaModelServices.export_genome',
+                                [input])
+        return resp[0]
+
+    async def adjust_model_reaction(self, input):
+        resp = await self._call('fbaModelServices.adjust_model_reaction',
+                                [input])
+        return resp[0]
+
+    async def adjust_biomass_reaction(self, input):
+        resp = await self._call('fbaModelServices.adjust_biomass_reaction',
+                                [input])
+        return resp[0]
+
+    async def addmedia(self, input):
+        resp = await self._call('fbaModelServices.addmedia',
+                                [input])
+        return resp[0]
+
+    async def export_media(self, input):
+        resp = await self._call('fbaModelServices.export_media',
+                                [input])
+        return resp[0]
+
+    async def runfba(self, input):
+        resp = await self._call('fbaModelServices.runfba',
+                                [input])
+        return resp[0]
+
+    async def runfba_batch(self, input):
+        resp = await self._call('fbaModelServices.runfba_batch',
+                                [input])
+        return resp[0]
+
+    async def fba_parameter_sweep(self, input):
+        resp = await self._call('fbaModelServices.fba_parameter_sweep',
+                                [input])
+        return resp[0]
+
+    async def simulate_double_knockouts(self, input):
+        resp = await self._call('fbaModelServices.simulate_double_knockouts',
+                                [input])
+        return resp[0]
+
+    async def quantitative_optimization(self, input):
+        resp = await self._call('fbaModelServices.quantitative_optimization',
+                                [input])
+        return resp[0]
+
+    async def generate_model_stats(self, input):
+        resp = await self._call('fbaModelServices.generate_model_stats',
+                                [input])
+        return resp[0]
+
+    async def minimize_reactions(self, input):
+        resp = await self._call('fbaModelServices.minimize_reactions',
+                                [input])
+        return resp[0]
+
+    async def export_fba(self, input):
+        resp = await self._call('fbaModelServices.export_fba',
+                                [input])
+        return resp[0]
+
+    async def import_phenotypes(self, input):
+        resp = await self._call('fbaModelServices.import_phenotypes',
+                                [input])
+        return resp[0]
+
+    async def simulate_phenotypes(self, input):
+        resp = await self._call('fbaModelServices.simulate_phenotypes',
+                                [input])
+        return resp[0]
+
+    async def add_media_transporters(self, input):
+        resp = await self._call('fbaModelServices.add_media_transporters',
+                                [input])
+        return resp[0]
+
+    async def export_phenotypeSimulationSet(self, input):
+        resp = await self._call('fbaModelServices.export_phenotypeSimulationSet',
+                                [input])
+        return resp[0]
+
+    async def integrate_reconciliation_solutions(self, input):
+        resp = await self._call('fbaModelServices.integrate_reconciliation_solutions',
+                                [input])
+        return resp[0]
+
+    async def queue_runfba(self, input):
+        resp = await self._call('fbaModelServices.queue_runfba',
+                                [input])
+        return resp[0]
+
+    async def queue_gapfill_model(self, input):
+        resp = await self._call('fbaModelServices.queue_gapfill_model',
+                                [input])
+        return resp[0]
+
+    async def gapfill_model(self, input):
+        resp = await self._call('fbaModelServices.gapfill_model',
+                                [input])
+        return resp[0]
+
+    async def queue_gapgen_model(self, input):
+        resp = await self._call('fbaModelServices.queue_gapgen_model',
+                                [input])
+        return resp[0]
+
+    async def gapgen_model(self, input):
+        resp = await self._call('fbaModelServices.gapgen_model',
+                                [input])
+        return resp[0]
+
+    async def queue_wildtype_phenotype_reconciliation(self, input):
+        resp = await self._call('fbaModelServices.queue_wildtype_phenotype_reconciliation',
+                                [input])
+        return resp[0]
+
+    async def queue_reconciliation_sensitivity_analysis(self, input):
+        resp = await self._call('fbaModelServices.queue_reconciliation_sensitivity_analysis',
+                                [input])
+        return resp[0]
+
+    async def queue_combine_wildtype_phenotype_reconciliation(self, input):
+        resp = await self._call('fbaModelServices.queue_combine_wildtype_phenotype_reconciliation',
+                                [input])
+        return resp[0]
+
+    async def reconcile_phenotypes(self, input):
+        resp = await self._call('fbaModelServices.reconcile_phenotypes',
+                                [input])
+        return resp[0]
+
+    async def run_job(self, input):
+        resp = await self._call('fbaModelServices.run_job',
+                                [input])
+        return resp[0]
+
+    async def queue_job(self, input):
+        resp = await self._call('fbaModelServices.queue_job',
+                                [input])
+        return resp[0]
+
+    async def set_cofactors(self, input):
+        resp = await self._call('fbaModelServices.set_cofactors',
+                                [input])
+        return resp[0]
+
+    async def find_reaction_synonyms(self, input):
+        resp = await self._call('fbaModelServices.find_reaction_synonyms',
+                                [input])
+        return resp[0]
+
+    async def role_to_reactions(self, params):
+        resp = await self._call('fbaModelServices.role_to_reactions',
+                                [params])
+        return resp[0]
+
+    async def reaction_sensitivity_analysis(self, input):
+        resp = await self._call('fbaModelServices.reaction_sensitivity_analysis',
+                                [input])
+        return resp[0]
+
+    async def filter_iterative_solutions(self, input):
+        resp = await self._call('fbaModelServices.filter_iterative_solutions',
+                                [input])
+        return resp[0]
+
+    async def delete_noncontributing_reactions(self, input):
+        resp = await self._call('fbaModelServices.delete_noncontributing_reactions',
+                                [input])
+        return resp[0]
+
+    async def annotate_workspace_Genome(self, params):
+        resp = await self._call('fbaModelServices.annotate_workspace_Genome',
+                                [params])
+        return resp[0]
+
+    async def gtf_to_genome(self, params):
+        resp = await self._call('fbaModelServices.gtf_to_genome',
+                                [params])
+        return resp[0]
+
+    async def fasta_to_ProteinSet(self, params):
+        resp = await self._call('fbaModelServices.fasta_to_ProteinSet',
+                                [params])
+        return resp[0]
+
+    async def ProteinSet_to_Genome(self, params):
+        resp = await self._call('fbaModelServices.ProteinSet_to_Genome',
+                                [params])
+        return resp[0]
+
+    async def fasta_to_ContigSet(self, params):
+        resp = await self._call('fbaModelServices.fasta_to_ContigSet',
+                                [params])
+        return resp[0]
+
+    async def ContigSet_to_Genome(self, params):
+        resp = await self._call('fbaModelServices.ContigSet_to_Genome',
+                                [params])
+        return resp[0]
+
+    async def probanno_to_genome(self, params):
+        resp = await self._call('fbaModelServices.probanno_to_genome',
+                                [params])
+        return resp[0]
+
+    async def get_mapping(self, params):
+        resp = await self._call('fbaModelServices.get_mapping',
+                                [params])
+        return resp[0]
+
+    async def subsystem_of_roles(self, params):
+        resp = await self._call('fbaModelServices.subsystem_of_roles',
+                                [params])
+        return resp[0]
+
+    async def adjust_mapping_role(self, params):
+        resp = await self._call('fbaModelServices.adjust_mapping_role',
+                                [params])
+        return resp[0]
+
+    async def adjust_mapping_complex(self, params):
+        resp = await self._call('fbaModelServices.adjust_mapping_complex',
+                                [params])
+        return resp[0]
+
+    async def adjust_mapping_subsystem(self, params):
+        resp = await self._call('fbaModelServices.adjust_mapping_subsystem',
+                                [params])
+        return resp[0]
+
+    async def get_template_model(self, params):
+        resp = await self._call('fbaModelServices.get_template_model',
+                                [params])
+        return resp[0]
+
+    async def import_template_fbamodel(self, input):
+        resp = await self._call('fbaModelServices.import_template_fbamodel',
+                                [input])
+        return resp[0]
+
+    async def adjust_template_reaction(self, params):
+        resp = await self._call('fbaModelServices.adjust_template_reaction',
+                                [params])
+        return resp[0]
+
+    async def adjust_template_biomass(self, params):
+        resp = await self._call('fbaModelServices.adjust_template_biomass',
+                                [params])
+        return resp[0]
+
+    async def add_stimuli(self, params):
+        resp = await self._call('fbaModelServices.add_stimuli',
+                                [params])
+        return resp[0]
+
+    async def import_regulatory_model(self, params):
+        resp = await self._call('fbaModelServices.import_regulatory_model',
+                                [params])
+        return resp[0]
+
+    async def compare_models(self, params):
+        resp = await self._call('fbaModelServices.compare_models',
+                                [params])
+        return resp[0]
+
+    async def compare_fbas(self, params):
+        resp = await self._call('fbaModelServices.compare_fbas',
+                                [params])
+        return resp[0]
+
+    async def compare_genomes(self, params):
+        resp = await self._call('fbaModelServices.compare_genomes',
+                                [params])
+        return resp[0]
+
+    async def import_metagenome_annotation(self, params):
+        resp = await self._call('fbaModelServices.import_metagenome_annotation',
+                                [params])
+        return resp[0]
+
+    async def models_to_community_model(self, params):
+        resp = await self._call('fbaModelServices.models_to_community_model',
+                                [params])
+        return resp[0]
+
+    async def metagenome_to_fbamodels(self, params):
+        resp = await self._call('fbaModelServices.metagenome_to_fbamodels',
+                                [params])
+        return resp[0]
+
+    async def import_expression(self, input):
+        resp = await self._call('fbaModelServices.import_expression',
+                                [input])
+        return resp[0]
+
+    async def import_regulome(self, input):
+        resp = await self._call('fbaModelServices.import_regulome',
+                                [input])
+        return resp[0]
+
+    async def create_promconstraint(self, params):
+        resp = await self._call('fbaModelServices.create_promconstraint',
+                                [params])
+        return resp[0]
+
+    async def add_biochemistry_compounds(self, params):
+        resp = await self._call('fbaModelServices.add_biochemistry_compounds',
+                                [params])
+        return resp[0]
+
+    async def update_object_references(self, params):
+        resp = await self._call('fbaModelServices.update_object_references',
+                                [params])
+        return resp[0]
+
+    async def add_reactions(self, params):
+        resp = await self._call('fbaModelServices.add_reactions',
+                                [params])
+        return resp[0]
+
+    async def remove_reactions(self, params):
+        resp = await self._call('fbaModelServices.remove_reactions',
+                                [params])
+        return resp[0]
+
+    async def modify_reactions(self, params):
+        resp = await self._call('fbaModelServices.modify_reactions',
+                                [params])
+        return resp[0]
+
+    async def add_features(self, params):
+        resp = await self._call('fbaModelServices.add_features',
+                                [params])
+        return resp[0]
+
+    async def remove_features(self, params):
+        resp = await self._call('fbaModelServices.remove_features',
+                                [params])
+        return resp[0]
+
+    async def modify_features(self, params):
+        resp = await self._call('fbaModelServices.modify_features',
+                                [params])
+        return resp[0]
+
+    async def import_trainingset(self, params):
+        resp = await self._call('fbaModelServices.import_trainingset',
+                                [params])
+        return resp[0]
+
+    async def preload_trainingset(self, params):
+        resp = await self._call('fbaModelServices.preload_trainingset',
+                                [params])
+        return resp[0]
+
+    async def build_classifier(self, params):
+        resp = await self._call('fbaModelServices.build_classifier',
+                                [params])
+        return resp[0]
+
+    async def classify_genomes(self, params):
+        resp = await self._call('fbaModelServices.classify_genomes',
+                                [params])
+        return resp[0]
+
+    async def build_tissue_model(self, params):
+        resp = await self._call('fbaModelServices.build_tissue_model',
+                                [params])
+        return resp[0]
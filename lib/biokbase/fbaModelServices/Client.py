@@ -320,6 +320,21 @@ class fbaModelServices(object):
                           [input])
         return resp[0]
 
+    def runfba_batch(self, input):
+        resp = self._call('fbaModelServices.runfba_batch',
+                          [input])
+        return resp[0]
+
+    def fba_parameter_sweep(self, input):
+        resp = self._call('fbaModelServices.fba_parameter_sweep',
+                          [input])
+        return resp[0]
+
+    def simulate_double_knockouts(self, input):
+        resp = self._call('fbaModelServices.simulate_double_knockouts',
+                          [input])
+        return resp[0]
+
     def quantitative_optimization(self, input):
         resp = self._call('fbaModelServices.quantitative_optimization',
                           [input])
@@ -405,6 +420,11 @@ class fbaModelServices(object):
                           [input])
         return resp[0]
 
+    def reconcile_phenotypes(self, input):
+        resp = self._call('fbaModelServices.reconcile_phenotypes',
+                          [input])
+        return resp[0]
+
     def run_job(self, input):
         resp = self._call('fbaModelServices.run_job',
                           [input])
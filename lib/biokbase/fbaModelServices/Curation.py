@@ -0,0 +1,143 @@
+'''
+Reaction deletions curating workspace FBAModel objects, as made by
+delete_noncontributing_reactions and filter_iterative_solutions.
+
+Deletions are collected per reaction direction against the model's cached
+ModelNetwork, where they are only flux bounds: the model is checked to keep
+growing by solving it with and without all of them in one batched solve,
+however many reactions are deleted, and the model object is edited once at
+the end, following the perl implementation: a reaction is removed when the
+direction it runs in (or both) is deleted, a reversible reaction deleted
+in one direction keeps the other, and a deletion of the direction a
+reaction does not run in is ignored.
+'''
+
+from __future__ import division
+
+import re
+
+from biokbase.fbaModelServices import FBA
+
+_PROBLEM_REACTION = re.compile(r'([+-])(rxn\d+)')
+
+_OPPOSITE = {'>': '<', '<': '>'}
+
+
+def iterative_solutions(gapfill):
+    '''
+    Returns the (cost, [(reaction id, direction)]) of each solution of an
+    iterative gapfilling: the rows of the ProblemReport.txt the MFAToolkit
+    writes, when the gapfilling FBA object holds one, or else its
+    GapfillingSolution objects.
+    '''
+    report = (gapfill.get('outputfiles') or {}).get('ProblemReport.txt')
+    solutions = []
+    if report:
+        for line in report[1:]:
+            fields = line.split(';')
+            if len(fields) < 3:
+                continue
+            solutions.append((float(fields[1]), [
+                (rxn_id, '>' if sign == '+' else '<')
+                for sign, rxn_id in _PROBLEM_REACTION.findall(fields[2])]))
+        return solutions
+    for solution in gapfill.get('gapfillingSolutions') or []:
+        reactions = []
+        for rxn in solution.get('gapfillingSolutionReactions', []):
+            reactions.append(('%s_%s%d' % (
+                FBA._ref_id(rxn['reaction_ref']),
+                FBA._ref_id(rxn.get('compartment_ref', 'c')),
+                rxn.get('compartmentIndex', 0)), rxn['direction']))
+        solutions.append((solution.get('solutionCost', 0), reactions))
+    return solutions
+
+
+class ModelDeletions(object):
+    '''
+    The reaction directions to delete from the model a ModelNetwork was
+    compiled from, as '>' (forward), '<' (reverse) or '=' (both) by flux
+    column.
+    '''
+
+    def __init__(self, network):
+        self.network = network
+        self.directions = {}
+
+    def add(self, rxn_id, direction):
+        '''
+        Flags a direction of a model reaction for deletion; flagging both
+        deletes the reaction. Returns False if the model has no such
+        reaction.
+        '''
+        col = self.network.find_reaction(rxn_id)
+        if col is None:
+            return False
+        if self.directions.get(col, direction) != direction:
+            direction = '='
+        self.directions[col] = direction
+        return True
+
+    def bounds(self, problem):
+        '''
+        Returns the FBAFormulation bounds that close the flagged directions
+        in an FBAProblem of the network.
+        '''
+        bounds = []
+        for col, direction in sorted(self.directions.items()):
+            lower = min(problem.lower[col], 0)
+            upper = max(problem.upper[col], 0)
+            if direction != '<':
+                upper = 0
+            if direction != '>':
+                lower = 0
+            bounds.append([lower, upper, 'flux', self.network.reactions[col]])
+        return bounds
+
+    def verify(self, formulation=None, media=None, processes=1):
+        '''
+        Returns the objective of the model with and without the flagged
+        directions, solved together in one batch, 0 for a program with no
+        solution. Raises a ValueError if the deletions stop a growing model
+        from growing.
+        '''
+        problem = FBA.FBAProblem(self.network, formulation, media)
+        deleted = dict(problem.formulation)
+        deleted['bounds'] = (problem.formulation['bounds'] +
+                             self.bounds(problem))
+        (_, wildtype), (_, solution) = FBA.solve_batch(
+            self.network, [problem.formulation, deleted], [media, media],
+            processes)
+        # a program with no solution does not grow
+        growth = wildtype.objective if wildtype.feasible else 0.0
+        remaining = solution.objective if solution.feasible else 0.0
+        if growth > FBA.NO_GROWTH >= remaining:
+            raise ValueError('Deleting the %d flagged reaction ' %
+                             len(self.directions) + 'directions stops the '
+                             'model from growing (it grows to %g without '
+                             'the deletions)' % growth)
+        return growth, remaining
+
+    def apply(self, model):
+        '''
+        Deletes the flagged directions from the FBAModel object the network
+        was compiled from, returning the ids of the reactions removed and of
+        those left running in one direction.
+        '''
+        reactions = dict((rxn['id'], rxn) for rxn in
+                         model.get('modelreactions', []))
+        removed = set()
+        narrowed = []
+        for col, direction in sorted(self.directions.items()):
+            rxn = reactions.get(self.network.reactions[col])
+            if rxn is None:
+                continue
+            current = rxn.get('direction', '=')
+            if direction == '=' or direction == current:
+                removed.add(rxn['id'])
+            elif current == '=':
+                rxn['direction'] = _OPPOSITE[direction]
+                narrowed.append(rxn['id'])
+        model['modelreactions'] = [rxn for rxn in
+                                   model.get('modelreactions', [])
+                                   if rxn['id'] not in removed]
+        return sorted(removed), narrowed
@@ -0,0 +1,1650 @@
+'''
+In-process flux balance analysis of workspace FBAModel objects.
+
+A ModelNetwork is compiled once from an FBAModel object: the stoichiometry of
+its reactions and biomass reactions becomes a sparse compound x flux matrix
+and the gene-protein-reaction associations become rules that can be
+evaluated against a set of knocked out genes. An FBAProblem applies an
+FBAFormulation and a Media object to a network - flux and drain bounds,
+knockouts, custom bounds and constraints, element uptake limits and the
+objective - and solves the resulting linear program with the HiGHS solver
+shipped with scipy, the same problem the MFAToolkit binary is given by
+Bio::KBase::ObjectAPI::KBaseFBA::FBA.
+
+Drain fluxes follow the MFAToolkit convention: a positive drain flux is
+uptake of a compound into the model, a negative one is excretion.
+'''
+
+from __future__ import division
+
+import copy
+import re
+import sys
+
+try:
+    import numpy as np
+    import scipy.sparse as sparse
+except ImportError:
+    np = None
+
+from biokbase.fbaModelServices.Solver import (INF, ColumnProjection,
+                                              LinearProgram, LPSolver,
+                                              program_map, solver_map, split)
+
+# formulation defaults, as set by _setDefaultFBAFormulation in the perl
+# implementation
+FORMULATION_DEFAULTS = {
+    'media': 'Complete',
+    'media_workspace': 'KBaseMedia',
+    'objfraction': 1,
+    'allreversible': 0,
+    'maximizeObjective': 1,
+    'objectiveTerms': [[1, 'biomassflux', 'bio1']],
+    'additionalcpds': [],
+    'geneko': [],
+    'rxnko': [],
+    'bounds': [],
+    'constraints': [],
+    'uptakelim': {},
+    'defaultmaxflux': 1000,
+    'defaultminuptake': -1000,
+    'defaultmaxuptake': 0,
+    'simplethermoconst': 0,
+    'thermoconst': 0,
+    'nothermoerror': 0,
+    'minthermoerror': 0
+}
+
+# formulation options that need more than a linear program
+_UNSUPPORTED = ('simplethermoconst', 'thermoconst', 'nothermoerror',
+                'minthermoerror', 'promconstraint', 'eflux_sample',
+                'eflux_series')
+
+# compounds that may always leave the cell from the listed compartments,
+# with their drain bounds (biomass and the generic DNA/RNA/protein
+# compound)
+_GENERIC_EXCHANGES = {'cpd11416': {'c': (-10000, 0)},
+                      'cpd02701': {'c': (-10000, 0)}}
+
+# bounds given to compounds listed in additionalcpds, and to the
+# additional compounds of a phenotype
+_ADDITIONAL_COMPOUND_BOUNDS = (-100, 100)
+
+# objective up to which a model counts as not growing, in every analysis
+NO_GROWTH = 1e-6
+
+# observed normalized growth above which a phenotype grows, as in
+# parseFBAPhenotypeOutput
+_OBSERVED_GROWTH = 0.0001
+
+_REACTION_TYPES = ('flux', 'reactionflux')
+_COMPOUND_TYPES = ('drainflux', 'compoundflux')
+_BIOMASS_TYPES = ('biomassflux',)
+
+_FORMULA_ELEMENT = re.compile(r'([A-Z][a-z]*)(\d*)')
+
+# tolerance below which a flux is reported as zero
+ZERO_FLUX = 1e-9
+
+# growth fraction below which a gene knockout is reported as essential
+ESSENTIAL_FRACTION = 0.01
+
+# relative growth loss beyond which a double knockout is reported as an
+# interaction
+INTERACTION_TOLERANCE = 1e-6
+
+# flux up to which a reaction counts as blocked in consistency checks
+BLOCKED_FLUX = 1e-6
+
+# flux a consistency check tries to push through each reaction it looks for
+_CONSISTENCY_FLUX = 1e-3
+
+
+def _ref_id(ref):
+    '''Returns the id at the end of a reference like ~/modelcompounds/id/x.'''
+    return ref.split('/')[-1]
+
+
+def _formula_elements(formula):
+    elements = {}
+    for element, count in _FORMULA_ELEMENT.findall(formula or ''):
+        elements[element] = elements.get(element, 0) + int(count or 1)
+    return elements
+
+
+def default_formulation(formulation=None):
+    '''Returns a copy of formulation with defaults for unset options.'''
+    out = copy.deepcopy(FORMULATION_DEFAULTS)
+    for key, value in (formulation or {}).items():
+        if value is not None:
+            out[key] = copy.deepcopy(value)
+    return out
+
+
+class ModelNetwork(object):
+    '''
+    Stoichiometry and gene rules of an FBAModel, in the form the linear
+    programs are built from. Flux columns are the model reactions followed
+    by the biomass reactions. The network's reduction, which the programs
+    built from it are solved through, is computed along with it.
+    '''
+
+    def __init__(self, model):
+        if np is None:
+            raise ImportError('numpy and scipy are required for FBA')
+        self.id = model['id']
+        self.genome_ref = model.get('genome_ref')
+        compartments = {}
+        for cmp in model.get('modelcompartments', []):
+            compartments[cmp['id']] = _ref_id(cmp.get('compartment_ref',
+                                                      cmp['id'][0]))
+
+        # the biochemistry the model's compounds come from, as referenced by
+        # the model (ws/obj/version, or ws/name for the latest version)
+        self.biochemistry_ref = None
+        self.compounds = []
+        self.compound_names = []
+        self.compound_base = []
+        self.compound_compartment = []
+        self.compound_formula = []
+        for cpd in model.get('modelcompounds', []):
+            base = _ref_id(cpd.get('compound_ref', ''))
+            if (self.biochemistry_ref is None and
+                    '/compounds/id/' in cpd.get('compound_ref', '')):
+                self.biochemistry_ref = cpd['compound_ref'].split(
+                    '/compounds/id/')[0]
+            if base in ('', 'cpd00000'):
+                base = cpd['id']
+            cmp = _ref_id(cpd.get('modelcompartment_ref', ''))
+            self.compounds.append(cpd['id'])
+            self.compound_names.append(cpd.get('name', cpd['id']))
+            self.compound_base.append(base)
+            self.compound_compartment.append(compartments.get(cmp, cmp[:1]))
+            self.compound_formula.append(cpd.get('formula', ''))
+        self.compound_index = dict((c, i) for i, c in
+                                   enumerate(self.compounds))
+
+        rows = []
+        cols = []
+        coefs = []
+        self.reactions = []
+        self.reaction_names = []
+        self.directions = []
+        self.max_forward = []
+        self.max_reverse = []
+        self.definitions = []
+        # {reaction column: [[set(features) per required subunit] per
+        # protein]}, for reactions that a gene knockout can disable
+        self.gene_rules = {}
+        # {feature id: [reaction columns]}
+        self.gene_reactions = {}
+        for col, rxn in enumerate(model.get('modelreactions', [])):
+            self.reactions.append(rxn['id'])
+            self.reaction_names.append(rxn.get('name', rxn['id']))
+            self.directions.append(rxn.get('direction', '='))
+            self.max_forward.append(rxn.get('maxforflux'))
+            self.max_reverse.append(rxn.get('maxrevflux'))
+            reagents = []
+            for rgt in rxn.get('modelReactionReagents', []):
+                row = self.compound_index[_ref_id(rgt['modelcompound_ref'])]
+                rows.append(row)
+                cols.append(col)
+                coefs.append(rgt['coefficient'])
+                reagents.append((row, rgt['coefficient']))
+            self.definitions.append(self._definition(reagents,
+                                                     self.directions[-1]))
+            rule = self._gene_rule(rxn.get('modelReactionProteins', []))
+            if rule:
+                self.gene_rules[col] = rule
+                for protein in rule:
+                    for subunit in protein:
+                        for feature in subunit:
+                            reactions = self.gene_reactions.setdefault(
+                                feature, [])
+                            if not reactions or reactions[-1] != col:
+                                reactions.append(col)
+        self.reaction_index = dict((r, i) for i, r in
+                                   enumerate(self.reactions))
+
+        self.biomasses = []
+        self.biomass_names = []
+        for bio in model.get('biomasses', []):
+            col = len(self.reactions) + len(self.biomasses)
+            self.biomasses.append(bio['id'])
+            self.biomass_names.append(bio.get('name', bio['id']))
+            for bcpd in bio.get('biomasscompounds', []):
+                rows.append(self.compound_index[
+                    _ref_id(bcpd['modelcompound_ref'])])
+                cols.append(col)
+                coefs.append(bcpd['coefficient'])
+        self.biomass_index = dict((b, len(self.reactions) + i) for i, b in
+                                  enumerate(self.biomasses))
+
+        self.flux_count = len(self.reactions) + len(self.biomasses)
+        self.S = sparse.coo_matrix(
+            (np.array(coefs, dtype=float), (np.array(rows, dtype=int),
+                                            np.array(cols, dtype=int))),
+            shape=(len(self.compounds), self.flux_count)).tocsc()
+
+        # flux limits set by the model, nan where it leaves the default
+        self.max_forward = np.array([np.nan if v is None else v
+                                     for v in self.max_forward], dtype=float)
+        self.max_reverse = np.array([np.nan if v is None else v
+                                     for v in self.max_reverse], dtype=float)
+        directions = np.array(self.directions)
+        self.forward_only = directions == '>'
+        self.reverse_only = directions == '<'
+        # compounds that get a drain flux in every formulation: the
+        # extracellular ones, bounded by the media, and the generic
+        # exchanges with their fixed bounds
+        self.extracellular = []
+        self.generic_drains = []
+        for row, base in enumerate(self.compound_base):
+            compartment = self.compound_compartment[row]
+            if compartment == 'e':
+                self.extracellular.append(row)
+            elif compartment in _GENERIC_EXCHANGES.get(base, {}):
+                self.generic_drains.append(
+                    (row, _GENERIC_EXCHANGES[base][compartment]))
+        self.reduction = self._reduce()
+        self.nbytes = self._size()
+
+    def _size(self):
+        # approximate memory held by the network, for bounding caches
+        T = self.reduction.T
+        size = sum(a.nbytes for a in (self.S.data, self.S.indices,
+                                      self.S.indptr, self.max_forward,
+                                      self.max_reverse, T.data, T.indices,
+                                      T.indptr, self.reduction.lower,
+                                      self.reduction.upper))
+        for strings in (self.compounds, self.compound_names,
+                        self.compound_base, self.compound_formula,
+                        self.reactions, self.reaction_names,
+                        self.definitions, self.biomasses):
+            size += sum(sys.getsizeof(s) for s in strings)
+        for index in (self.compound_index, self.reaction_index,
+                      self.gene_reactions, self.gene_rules):
+            size += sys.getsizeof(index)
+        for rule in self.gene_rules.values():
+            size += sum(sys.getsizeof(su) for protein in rule
+                        for su in protein)
+        return size
+
+    def _reduce(self):
+        '''
+        Returns the ColumnProjection of the flux columns that leaves out
+        the reactions that can not carry flux in any formulation and lumps
+        the ones whose fluxes are in fixed ratio, like the steps of a linear
+        pathway. It holds while no flux runs against its reaction's
+        direction, every compound stays balanced and drains are only added
+        for the extracellular compounds and generic exchanges.
+        '''
+        S = self.S
+        ncpd, n = S.shape
+        nrxn = len(self.reactions)
+        forward = np.ones(n, dtype=bool)
+        reverse = np.zeros(n, dtype=bool)
+        forward[:nrxn] = ~self.reverse_only
+        reverse[:nrxn] = ~self.forward_only
+        # compounds a drain can bring into or take out of the model
+        enter = np.zeros(ncpd, dtype=bool)
+        leave = np.zeros(ncpd, dtype=bool)
+        enter[self.extracellular] = True
+        leave[self.extracellular] = True
+        for row, (lower, upper) in self.generic_drains:
+            enter[row] |= upper > 0
+            leave[row] |= lower < 0
+        balanced = ~(enter | leave)
+
+        # flux column j is ratio[j] times the flux of group[j], the column
+        # of the group's first member; -1 for blocked columns
+        group = np.arange(n)
+        ratio = np.ones(n)
+        while True:
+            kept = np.flatnonzero(group >= 0)
+            ids, member_of = np.unique(group[kept], return_inverse=True)
+            T = sparse.csc_matrix((ratio[kept], (kept, member_of)),
+                                  shape=(n, len(ids)))
+            same = ratio[kept] > 0
+            group_forward = np.ones(len(ids), dtype=bool)
+            group_reverse = np.ones(len(ids), dtype=bool)
+            np.logical_and.at(group_forward, member_of,
+                              np.where(same, forward[kept], reverse[kept]))
+            np.logical_and.at(group_reverse, member_of,
+                              np.where(same, reverse[kept], forward[kept]))
+
+            M = sparse.csr_matrix(S.dot(T))
+            M.data[np.abs(M.data) < 1e-12] = 0
+            M.eliminate_zeros()
+            counts = np.diff(M.indptr)
+            rows = np.repeat(np.arange(ncpd), counts)
+            coefs = M.data
+            produce = enter.copy()
+            consume = leave.copy()
+            np.logical_or.at(produce, rows,
+                             ((coefs > 0) & group_forward[M.indices]) |
+                             ((coefs < 0) & group_reverse[M.indices]))
+            np.logical_or.at(consume, rows,
+                             ((coefs < 0) & group_forward[M.indices]) |
+                             ((coefs > 0) & group_reverse[M.indices]))
+            # every group in a balance that nothing can both produce and
+            # consume, or that only one group takes part in, is held at zero
+            dead = ~(group_forward | group_reverse)
+            stuck = ~(produce & consume) | (balanced & (counts == 1))
+            dead[M.indices[stuck[rows]]] = True
+            if dead.any():
+                group[kept[dead[member_of]]] = -1
+                continue
+
+            # the only two groups in a balance are in fixed ratio
+            merged = set()
+            for row in np.flatnonzero(balanced & (counts == 2)):
+                start = M.indptr[row]
+                first, second = M.indices[start:start + 2]
+                if first in merged or second in merged:
+                    continue
+                merged.update((first, second))
+                members = T.indices[T.indptr[second]:T.indptr[second + 1]]
+                ratio[members] *= -M.data[start] / M.data[start + 1]
+                group[members] = ids[first]
+            if not merged:
+                break
+        return ColumnProjection(T, np.where(reverse, -INF, 0.0),
+                                np.where(forward, INF, 0.0), ncpd)
+
+    def _definition(self, reagents, direction):
+        reactants = []
+        products = []
+        for row, coef in reagents:
+            term = '(%s) %s[%s]' % (abs(coef), self.compound_names[row],
+                                     self.compounds[row].split('_')[-1])
+            (reactants if coef < 0 else products).append(term)
+        sign = {'>': ' => ', '<': ' <= '}.get(direction, ' <=> ')
+        return ' + '.join(reactants) + sign + ' + '.join(products)
+
+    @staticmethod
+    def _gene_rule(proteins):
+        # a protein without any (required) gene, like a spontaneous or
+        # gapfilled reaction, can not be knocked out
+        rule = []
+        for protein in proteins:
+            subunits = []
+            for subunit in protein.get('modelReactionProteinSubunits', []):
+                features = set(_ref_id(f) for f in
+                               subunit.get('feature_refs', []))
+                if features and not subunit.get('optionalSubunit'):
+                    subunits.append(features)
+            if not subunits:
+                return None
+            rule.append(subunits)
+        return rule or None
+
+    def find_reaction(self, rxn_id):
+        '''Returns the flux column of a model reaction, or None.'''
+        if rxn_id in self.reaction_index:
+            return self.reaction_index[rxn_id]
+        return self.reaction_index.get(rxn_id + '_c0')
+
+    def find_compound(self, cpd_id):
+        '''Returns the row of a model compound, or None.'''
+        if cpd_id in self.compound_index:
+            return self.compound_index[cpd_id]
+        return self.compound_index.get(cpd_id + '_c0')
+
+    def find_biomass(self, bio_id):
+        '''Returns the flux column of a biomass reaction, or None.'''
+        return self.biomass_index.get(bio_id)
+
+    def knocked_out_reactions(self, genes):
+        '''
+        Returns the flux columns of the reactions that can not carry flux
+        once all the features in genes are knocked out.
+        '''
+        genes = set(genes)
+        affected = set()
+        for gene in genes:
+            affected.update(self.gene_reactions.get(gene, ()))
+        knocked = []
+        for col in sorted(affected):
+            active = False
+            for protein in self.gene_rules[col]:
+                if all(subunit - genes for subunit in protein):
+                    active = True
+                    break
+            if not active:
+                knocked.append(col)
+        return knocked
+
+
+def _knockout_chunk(solver, chunk):
+    # solves each (key, columns) knockout with the columns fixed at zero,
+    # then restores their bounds, returning the objective and the flux
+    # columns of the first flux_count that carry flux. An infeasible
+    # knockout does not grow.
+    flux_count, tasks = chunk
+    out = []
+    for key, cols in tasks:
+        lower = solver.lower[cols]
+        upper = solver.upper[cols]
+        solver.set_bounds(cols, 0, 0)
+        result = solver.solve()
+        solver.set_bounds(cols, lower, upper)
+        if result.optimal:
+            support = np.flatnonzero(np.abs(result.x[:flux_count]) >
+                                     ZERO_FLUX)
+            out.append((key, result.objective, support))
+        else:
+            out.append((key, 0.0, np.zeros(0, dtype=int)))
+    return out
+
+
+def _carrying_chunk(solver, chunk):
+    # maximizes each (column, forward, reverse) in the directions it may
+    # carry flux in, unless an earlier solution already put flux through
+    # it, returning the flux columns of the first flux_count that some
+    # solution put flux through. Only the column solved for is held to
+    # BLOCKED_FLUX; the others a solution happens to use need
+    # _CONSISTENCY_FLUX, above the solver's noise. A failed solve counts
+    # the column as carrying flux, as flux variability analysis leaves its
+    # bounds.
+    flux_count, tasks = chunk
+    carrying = np.zeros(flux_count, dtype=bool)
+    solved = 0
+    for col, forward, reverse in tasks:
+        for sign, possible in ((1, forward), (-1, reverse)):
+            if not possible or carrying[col]:
+                continue
+            solver.set_costs([col], sign)
+            result = solver.solve()
+            solver.set_costs([col], 0)
+            solved += 1
+            if result.optimal:
+                flux = np.abs(result.x[:flux_count])
+                carrying |= flux > _CONSISTENCY_FLUX
+                carrying[col] |= flux[col] > BLOCKED_FLUX
+            else:
+                carrying[col] = True
+    return np.flatnonzero(carrying), solved
+
+
+def _essential_chunk(solver, chunk):
+    # fixes each column at zero in turn; it is essential when that leaves
+    # no solution. A solution found shows that every reaction it leaves at
+    # zero is not essential, so those are not solved for.
+    flux_count, cols = chunk
+    variable = set()
+    essential = []
+    solved = 0
+    for col in cols:
+        if col in variable:
+            continue
+        lower = solver.lower[col]
+        upper = solver.upper[col]
+        solver.set_bounds([col], 0, 0)
+        result = solver.solve()
+        solver.set_bounds([col], lower, upper)
+        solved += 1
+        if result.optimal:
+            variable.update(np.flatnonzero(
+                np.abs(result.x[:flux_count]) <= BLOCKED_FLUX).tolist())
+        else:
+            essential.append(col)
+    return essential, solved
+
+
+def _phenotype_chunk(solver, phenotypes):
+    # phenotypes are (index, drain columns, knocked out columns), with those
+    # opening the same drains next to each other. The wild type growth for
+    # a set of opened drains is solved once; a knockout is only solved when
+    # the wild type solution carries flux through a reaction it disables.
+    # Returns (index, growth, wild type growth) per phenotype.
+    out = []
+    opened = None
+    saved = None
+    wildtype = None
+    for index, drains, knocked in phenotypes:
+        if drains != opened:
+            if opened:
+                solver.set_bounds(opened, *saved)
+            saved = (solver.lower[drains], solver.upper[drains])
+            solver.set_bounds(drains, *_ADDITIONAL_COMPOUND_BOUNDS)
+            opened = drains
+            wildtype = solver.solve()
+        growth = wildtype.objective if wildtype.optimal else 0.0
+        if (knocked and wildtype.optimal and
+                np.any(np.abs(wildtype.x[knocked]) > ZERO_FLUX)):
+            lower = solver.lower[knocked]
+            upper = solver.upper[knocked]
+            solver.set_bounds(knocked, 0, 0)
+            result = solver.solve()
+            solver.set_bounds(knocked, lower, upper)
+            growth = result.objective if result.optimal else 0.0
+        out.append((index, growth,
+                    wildtype.objective if wildtype.optimal else 0.0))
+    if opened:
+        solver.set_bounds(opened, *saved)
+    return out
+
+
+def _batch_chunk(solver, items):
+    # items are (index, lower, upper) column bounds of programs that differ
+    # from the solver's only in those bounds; only the bounds that differ
+    # from the previous solve are changed
+    out = []
+    for index, lower, upper in items:
+        changed = np.flatnonzero((solver.lower != lower) |
+                                 (solver.upper != upper))
+        if len(changed):
+            solver.set_bounds(changed, lower[changed], upper[changed])
+        out.append((index, solver.solve()))
+    return out
+
+
+def _sweep_chunk(solver, chunk):
+    # chunk holds the sweep targets, the compound rows whose duals are
+    # reported and the grid points (i, j, values) to solve, in walk order
+    targets, rows, points = chunk
+    saved = [(solver.row_lower[index], solver.row_upper[index])
+             if kind == 'row' else (solver.lower[index], solver.upper[index])
+             for kind, index, which in targets]
+    out = []
+    for i, j, values in points:
+        for (kind, index, which), value in zip(targets, values):
+            if kind == 'row':
+                solver.set_row_bounds(
+                    [index], -INF if which == '<' else value,
+                    INF if which == '>' else value)
+            else:
+                solver.set_bounds(
+                    [index], solver.lower[index] if which == 'upper'
+                    else value, solver.upper[index] if which == 'lower'
+                    else value)
+        result = solver.solve()
+        if result.optimal:
+            result.x = None
+            result.row_duals = result.row_duals[rows]
+        out.append((i, j, result))
+    for (kind, index, which), (lower, upper) in zip(targets, saved):
+        if kind == 'row':
+            solver.set_row_bounds([index], lower, upper)
+        else:
+            solver.set_bounds([index], lower, upper)
+    return out
+
+
+def _fva_chunk(solver, cols):
+    # minimizes then maximizes each column in turn. Every solution found is
+    # feasible for all the other solves, so a column it puts at its bound
+    # needs no solve for that bound. An unbounded or failed solve leaves
+    # the column's bound in place.
+    mins = dict((col, None) for col in cols)
+    maxs = dict((col, None) for col in cols)
+    for col in cols:
+        for maximize, found, bounds in ((False, mins, solver.lower),
+                                        (True, maxs, solver.upper)):
+            if found[col] is not None:
+                continue
+            solver.set_costs([col], 1)
+            solver.set_sense(maximize)
+            result = solver.solve()
+            solver.set_costs([col], 0)
+            if not result.optimal:
+                found[col] = bounds[col]
+                continue
+            found[col] = result.objective
+            for other in cols:
+                x = result.x[other]
+                if mins[other] is None and x <= solver.lower[other]:
+                    mins[other] = x
+                if maxs[other] is None and x >= solver.upper[other]:
+                    maxs[other] = x
+    return cols, [mins[col] for col in cols], [maxs[col] for col in cols]
+
+
+class FBASolution(object):
+    '''
+    The solution of an FBAProblem. x holds the value of every variable;
+    feasible is False when the problem had no solution, in which case the
+    objective is reported as zero.
+    '''
+
+    def __init__(self, feasible, objective, x, status=''):
+        self.feasible = feasible
+        self.objective = objective
+        self.x = x
+        self.status = status
+
+
+class FBAProblem(object):
+    '''
+    The linear program for one FBAFormulation and Media against a
+    ModelNetwork. Variables are the flux columns of the network, followed
+    by drain fluxes and, when uptake limits are given, one uptake variable
+    per limited drain.
+    '''
+
+    def __init__(self, network, formulation=None, media=None):
+        self.network = network
+        self.formulation = default_formulation(formulation)
+        form = self.formulation
+        for option in _UNSUPPORTED:
+            if form.get(option):
+                raise ValueError('Formulation option %s is not supported ' %
+                                 option + 'by the in-process FBA engine')
+        self.media = media or {'id': 'Complete', 'name': 'Complete',
+                               'mediacompounds': []}
+
+        nrxn = len(network.reactions)
+        maxflux = form['defaultmaxflux']
+        self.lb = np.zeros(network.flux_count)
+        self.ub = np.full(network.flux_count, float(maxflux))
+        self.lb[:nrxn] = -np.where(np.isnan(network.max_reverse), maxflux,
+                                   network.max_reverse)
+        self.ub[:nrxn] = np.where(np.isnan(network.max_forward), maxflux,
+                                  network.max_forward)
+        if not form['allreversible']:
+            self.lb[:nrxn][network.forward_only] = 0
+            self.ub[:nrxn][network.reverse_only] = 0
+
+        knocked = set(network.knocked_out_reactions(form['geneko']))
+        for rxn in form['rxnko']:
+            col = network.find_reaction(rxn)
+            if col is not None:
+                knocked.add(col)
+        self.knockouts = sorted(knocked)
+        self.lb[self.knockouts] = 0
+        self.ub[self.knockouts] = 0
+
+        self.drains = []
+        self.drain_lb = []
+        self.drain_ub = []
+        self._drain_index = {}
+        self._media_drains = None
+        self._set_media_drains()
+        for bound in form['bounds']:
+            self._apply_bound(bound)
+
+        self.objective = self._terms(form['objectiveTerms'], 'Objective')
+        self.constraints = []
+        for rhs, sign, terms, name in form['constraints']:
+            if sign not in ('<', '<=', '>', '>=', '=', '=='):
+                raise ValueError('Constraint sign %s not recognized!' % sign)
+            self.constraints.append((self._terms(terms, 'Constraint'),
+                                     sign[0], rhs, name))
+        self._build()
+
+    def _set_media_drains(self):
+        network = self.network
+        form = self.formulation
+        default = (form['defaultminuptake'], form['defaultmaxuptake'])
+        if (self.media.get('name') == 'Complete' and
+                form['defaultmaxuptake'] <= 0):
+            default = (default[0], form['defaultmaxflux'])
+        media = {}
+        for mcpd in self.media.get('mediacompounds', []):
+            media[_ref_id(mcpd['compound_ref'])] = (mcpd['minFlux'],
+                                                    mcpd['maxFlux'])
+        for cpd in form['additionalcpds']:
+            row = network.find_compound(cpd)
+            base = network.compound_base[row] if row is not None else cpd
+            if base in media:
+                media[base] = (media[base][0],
+                               _ADDITIONAL_COMPOUND_BOUNDS[1])
+            else:
+                media[base] = _ADDITIONAL_COMPOUND_BOUNDS
+        for row in network.extracellular:
+            self._add_drain(row, *media.get(network.compound_base[row],
+                                            default))
+        for row, bounds in network.generic_drains:
+            self._add_drain(row, *bounds)
+
+    def _add_drain(self, row, lower, upper):
+        if row in self._drain_index:
+            i = self._drain_index[row]
+            self.drain_lb[i] = lower
+            self.drain_ub[i] = upper
+            return
+        self._drain_index[row] = len(self.drains)
+        self.drains.append(row)
+        self.drain_lb.append(lower)
+        self.drain_ub.append(upper)
+
+    def _drain_column(self, row):
+        if row not in self._drain_index:
+            self._add_drain(row, self.formulation['defaultminuptake'],
+                            self.formulation['defaultmaxuptake'])
+        return self.network.flux_count + self._drain_index[row]
+
+    def phenotype_bounds(self, phenotype):
+        '''
+        Returns the drain columns a Phenotype's additional compounds open
+        and the flux columns its gene knockouts disable, on top of this
+        problem's media and knockouts.
+        '''
+        network = self.network
+        if self._media_drains is None:
+            self._media_drains = {}
+            for row in network.extracellular:
+                self._media_drains.setdefault(
+                    network.compound_base[row], []).append(
+                        network.flux_count + self._drain_index[row])
+        drains = set()
+        for ref in phenotype.get('additionalcompound_refs', []):
+            drains.update(self._media_drains.get(_ref_id(ref), ()))
+        genes = [_ref_id(ref) for ref in phenotype.get('geneko_refs', [])]
+        knocked = []
+        if genes:
+            base = set(self.knockouts)
+            knocked = [col for col in network.knocked_out_reactions(
+                self.formulation['geneko'] + genes) if col not in base]
+        return sorted(drains), knocked
+
+    def _apply_bound(self, bound):
+        lower, upper, var_type, var = bound
+        network = self.network
+        if var_type in _REACTION_TYPES:
+            col = network.find_reaction(var)
+            if col is None:
+                raise ValueError('Reaction %s not found!' % var)
+            self.lb[col] = lower
+            self.ub[col] = upper
+        elif var_type in _COMPOUND_TYPES:
+            row = network.find_compound(var)
+            if row is None:
+                raise ValueError('Compound %s not found!' % var)
+            self._add_drain(row, lower, upper)
+        else:
+            raise ValueError('Bound variable type %s not recognized!' %
+                             var_type)
+
+    def _terms(self, terms, kind):
+        # terms are returned as {variable column: coefficient}; drain
+        # columns are only final once all terms are read, so they are kept
+        # as ('drain', row) until _build
+        network = self.network
+        out = {}
+        for coef, var_type, var in terms:
+            if var_type in _REACTION_TYPES:
+                col = network.find_reaction(var)
+                if col is None:
+                    col = network.find_biomass(var)
+                if col is None:
+                    raise ValueError('Reaction %s not found!' % var)
+            elif var_type in _BIOMASS_TYPES:
+                col = network.find_biomass(var)
+                if col is None:
+                    raise ValueError('Biomass %s not found!' % var)
+            elif var_type in _COMPOUND_TYPES:
+                row = network.find_compound(var)
+                if row is None:
+                    raise ValueError('Compound %s not found!' % var)
+                self._drain_column(row)
+                col = ('drain', row)
+            else:
+                raise ValueError('%s variable type %s not recognized!' %
+                                 (kind, var_type))
+            out[col] = out.get(col, 0) + coef
+        return out
+
+    def _column(self, col):
+        if isinstance(col, tuple):
+            return self.network.flux_count + self._drain_index[col[1]]
+        return col
+
+    def _build(self):
+        network = self.network
+        nflux = network.flux_count
+        ndrain = len(self.drains)
+
+        # element uptake limits act on the uptake part of each drain: an
+        # uptake variable u >= max(0, drain) is added per drain of a
+        # compound containing a limited element
+        limits = self.formulation['uptakelim'] or {}
+        uptake = []
+        if limits:
+            for i, row in enumerate(self.drains):
+                elements = _formula_elements(
+                    network.compound_formula[row])
+                if self.drain_ub[i] > 0 and any(e in elements
+                                                for e in limits):
+                    uptake.append((i, elements))
+        self.variable_count = nflux + ndrain + len(uptake)
+
+        drain_matrix = sparse.csc_matrix(
+            (np.ones(ndrain), (np.array(self.drains, dtype=int),
+                               np.arange(ndrain))),
+            shape=(len(network.compounds), ndrain))
+        A_eq = sparse.hstack(
+            [network.S, drain_matrix,
+             sparse.csc_matrix((len(network.compounds), len(uptake)))],
+            format='csc')
+
+        rows = []
+        cols = []
+        vals = []
+        row_lower = []
+        row_upper = []
+        for terms, sign, value, name in self.constraints:
+            for col, coef in terms.items():
+                rows.append(len(row_lower))
+                cols.append(self._column(col))
+                vals.append(coef)
+            row_lower.append(-INF if sign == '<' else value)
+            row_upper.append(INF if sign == '>' else value)
+        for element, limit in sorted(limits.items()):
+            for j, (i, elements) in enumerate(uptake):
+                if element in elements:
+                    rows.append(len(row_lower))
+                    cols.append(nflux + ndrain + j)
+                    vals.append(elements[element])
+            row_lower.append(-INF)
+            row_upper.append(limit)
+        for j, (i, elements) in enumerate(uptake):
+            rows.extend((len(row_lower), len(row_lower)))
+            cols.extend((nflux + i, nflux + ndrain + j))
+            vals.extend((1, -1))
+            row_lower.append(-INF)
+            row_upper.append(0)
+        A = sparse.vstack([A_eq, sparse.csc_matrix(
+            (np.array(vals, dtype=float), (np.array(rows, dtype=int),
+                                           np.array(cols, dtype=int))),
+            shape=(len(row_lower), self.variable_count))], format='csc')
+
+        self.lower = np.concatenate([self.lb, self.drain_lb,
+                                     np.zeros(len(uptake))])
+        self.upper = np.concatenate([self.ub, self.drain_ub,
+                                     np.full(len(uptake), INF)])
+        self.c = np.zeros(self.variable_count)
+        for col, coef in self.objective.items():
+            self.c[self._column(col)] = coef
+        self.maximize = bool(self.formulation['maximizeObjective'])
+        zeros = np.zeros(len(network.compounds))
+        self.lp = LinearProgram(
+            self.c, A, np.concatenate([zeros, row_lower]),
+            np.concatenate([zeros, row_upper]), self.lower, self.upper,
+            self.maximize, self._projection(len(uptake)))
+
+    def _projection(self, nuptake):
+        # the network's reduction, unless drains were added that it does
+        # not know of or the formulation's bounds already leave its limits
+        network = self.network
+        if len(self.drains) != (len(network.extracellular) +
+                                len(network.generic_drains)):
+            return None
+        ngeneric = len(network.generic_drains)
+        lower = np.full(len(self.drains), -INF)
+        upper = np.full(len(self.drains), INF)
+        for i, (row, (low, high)) in enumerate(network.generic_drains):
+            j = len(self.drains) - ngeneric + i
+            lower[j] = -INF if low < 0 else 0
+            upper[j] = INF if high > 0 else 0
+        projection = network.reduction.extend(len(self.drains), lower,
+                                              upper).extend(nuptake)
+        if ((self.lower < projection.lower).any() or
+                (self.upper > projection.upper).any()):
+            return None
+        return projection
+
+    def _solution(self, result, objective=None):
+        if result.x is None:
+            return FBASolution(False, 0.0, np.zeros(self.variable_count),
+                               result.status)
+        x = result.x[:self.variable_count]
+        x = np.where(np.abs(x) < ZERO_FLUX, 0.0, x)
+        if objective is None:
+            objective = float(self.c.dot(x))
+        return FBASolution(True, objective, x, result.status)
+
+    def solve(self):
+        return self._solution(LPSolver(self.lp).solve())
+
+    def objective_constraint(self, value, fraction=None):
+        '''
+        Returns the program with an added last row holding the objective at
+        fraction (objfraction by default) of value.
+        '''
+        if fraction is None:
+            fraction = self.formulation['objfraction']
+        slack = (1 - fraction) * abs(value)
+        if self.maximize:
+            bounds = ([value - slack], [INF])
+        else:
+            bounds = ([-INF], [value + slack])
+        return self.lp.add_rows(sparse.csr_matrix(self.c), *bounds)
+
+    def minimize_flux(self, solution, fraction=None):
+        '''
+        Returns the solution with the least total reaction flux that keeps
+        the objective at fraction (objfraction by default) of solution's
+        objective.
+        '''
+        if not solution.feasible:
+            return solution
+        nvar = self.variable_count
+        nrxn = len(self.network.reactions)
+        # -t <= v <= t for each reaction flux v, minimizing the sum of t
+        lp = self.objective_constraint(solution.objective, fraction)
+        lp = lp.add_columns(sparse.csc_matrix((lp.shape[0], nrxn)),
+                            np.ones(nrxn), np.zeros(nrxn),
+                            np.full(nrxn, INF))
+        eye = sparse.identity(nrxn, format='csc')
+        gap = sparse.csc_matrix((nrxn, nvar - nrxn))
+        lp = lp.add_rows(sparse.bmat([[eye, gap, -eye], [-eye, gap, -eye]]),
+                         np.full(2 * nrxn, -INF), np.zeros(2 * nrxn))
+        lp.c[:nvar] = 0
+        lp.maximize = False
+        result = LPSolver(lp).solve()
+        if not result.optimal:
+            return solution
+        return self._solution(result, solution.objective)
+
+    def fva(self, solution, processes=1):
+        '''
+        Returns the minimum and maximum of every variable over the solutions
+        that keep the objective at objfraction of solution's objective.
+        Variables are split into contiguous chunks over processes worker
+        processes, each warm starting from its previous solve.
+        '''
+        if not solution.feasible:
+            return self.lower.copy(), self.upper.copy()
+        lp = self.objective_constraint(solution.objective)
+        lp.c = np.zeros(len(lp.c))
+        ncol = self.network.flux_count + len(self.drains)
+        columns = range(ncol)
+        if lp.projection is not None:
+            # one column per lumped group is enough: the others are a fixed
+            # multiple of it, and blocked columns are zero
+            T = lp.projection.T[:ncol].tocoo()
+            groups, first = np.unique(T.col, return_index=True)
+            columns = sorted(T.row[first])
+        minimum = self.lower.copy()
+        maximum = self.upper.copy()
+        for cols, mins, maxs in solver_map(lp, _fva_chunk,
+                                           split(columns, 4 * processes),
+                                           processes):
+            minimum[cols] = mins
+            maximum[cols] = maxs
+        if lp.projection is not None:
+            position = np.searchsorted(groups, T.col)
+            solved = T.row[first][position]
+            scale = T.data / T.data[first][position]
+            lower = scale * np.where(scale > 0, minimum[solved],
+                                     maximum[solved])
+            upper = scale * np.where(scale > 0, maximum[solved],
+                                     minimum[solved])
+            minimum[:ncol] = 0
+            maximum[:ncol] = 0
+            minimum[T.row] = lower
+            maximum[T.row] = upper
+        minimum[np.abs(minimum) < ZERO_FLUX] = 0
+        maximum[np.abs(maximum) < ZERO_FLUX] = 0
+        return minimum, maximum
+
+    def consistency(self, solution, processes=1, essential=True):
+        '''
+        Returns the flux columns of the reactions that can not carry flux
+        (blocked) and of the ones that carry flux in every solution
+        (essential, unless essential is False), over the solutions that
+        keep the objective at objfraction of solution's objective, and the
+        number of programs solved.
+
+        Blocked reactions are found with a FASTCC-style consistency check:
+        each solve pushes a small flux through as many of the reactions not
+        yet seen carrying flux as it can, in one direction, until a solve
+        finds no more; only the reactions left are solved for one at a
+        time. Essential reactions are looked for only among the ones that
+        carry flux in both solution and a minimal flux solution, in chunks
+        over processes worker processes.
+        '''
+        nrxn = len(self.network.reactions)
+        if not solution.feasible:
+            return np.arange(nrxn), np.zeros(0, dtype=int), 0
+        lp = self.objective_constraint(solution.objective)
+        nvar = lp.shape[1]
+        # z+ <= v and z- <= -v for each reaction flux v. The sum of the z
+        # of the reactions looked for, each within [0, _CONSISTENCY_FLUX],
+        # is maximized; the other z are left free below, so that their
+        # rows do not bind
+        lp = lp.add_columns(sparse.csc_matrix((lp.shape[0], 2 * nrxn)),
+                            np.zeros(2 * nrxn), np.full(2 * nrxn, -INF),
+                            np.zeros(2 * nrxn))
+        eye = sparse.identity(nrxn, format='csc')
+        gap = sparse.csc_matrix((nrxn, nvar - nrxn))
+        lp = lp.add_rows(sparse.bmat([[-eye, gap, eye, None],
+                                      [eye, gap, None, eye]]),
+                         np.full(2 * nrxn, -INF), np.zeros(2 * nrxn))
+        lp.c[:nvar] = 0
+        lp.maximize = True
+        solver = LPSolver(lp)
+
+        carrying = np.abs(solution.x[:nrxn]) > BLOCKED_FLUX
+        # the reactions the network's reduction holds at zero (group -1)
+        # need no solve, and of the ones it lumps only one does
+        group = np.arange(nrxn)
+        if lp.projection is not None:
+            T = lp.projection.T[:nrxn]
+            group = np.full(nrxn, -1)
+            group[np.diff(T.indptr) > 0] = T.indices
+        forward = self.upper[:nrxn] > 0
+        reverse = self.lower[:nrxn] < 0
+        solved = 0
+
+        def mark(result):
+            found = (np.abs(result.x[:nrxn]) > BLOCKED_FLUX) & ~carrying
+            carrying[found] = True
+            return found.any()
+        for side, possible in ((nvar, forward), (nvar + nrxn, reverse)):
+            while True:
+                cols = np.flatnonzero(possible & ~carrying & (group >= 0))
+                if not len(cols):
+                    break
+                solver.set_costs(side + cols, 1)
+                solver.set_bounds(side + cols, 0, _CONSISTENCY_FLUX)
+                result = solver.solve()
+                solver.set_costs(side + cols, 0)
+                solver.set_bounds(side + cols, -INF, 0)
+                solved += 1
+                if not result.optimal or not mark(result):
+                    break
+        # the reactions left are maximized and minimized one at a time, one
+        # per lumped group, in chunks over processes worker processes
+        plain = self.objective_constraint(solution.objective)
+        plain.c = np.zeros(len(plain.c))
+        plain.maximize = True
+        groups, first = np.unique(group, return_index=True)
+        tasks = [(col, forward[col], reverse[col])
+                 for col in first[groups >= 0] if not carrying[col]]
+        for found, count in solver_map(
+                plain, _carrying_chunk,
+                [(nrxn, chunk) for chunk in split(tasks, 4 * processes)],
+                processes):
+            carrying[found] = True
+            solved += count
+        blocked = np.flatnonzero(~carrying)
+        if not essential:
+            return blocked, np.zeros(0, dtype=int), solved
+
+        minimal = self.minimize_flux(solution)
+        candidates = np.flatnonzero(
+            carrying & (np.abs(solution.x[:nrxn]) > BLOCKED_FLUX) &
+            (np.abs(minimal.x[:nrxn]) > BLOCKED_FLUX))
+        essential = []
+        for cols, count in solver_map(
+                plain, _essential_chunk,
+                [(nrxn, chunk) for chunk in split(candidates.tolist(),
+                                                  4 * processes)],
+                processes):
+            essential.extend(cols)
+            solved += count
+        return blocked, np.array(sorted(essential), dtype=int), solved
+
+    def knockout_screen(self, solution, processes=1, genes=None):
+        '''
+        Simulates the knockout of each gene of the model (or of genes) on
+        top of the formulation's knockouts, given the solution of the
+        unmodified problem. Returns a list of GeneAssertion tuples (gene,
+        growth fraction, growth, essential) in gene order, and the number
+        of knockouts that had to be solved.
+        '''
+        if genes is None:
+            genes = self.network.gene_reactions
+        growth, solved = self._single_knockouts(
+            solution, sorted(genes), processes)[1::2]
+        return self._gene_assertions(solution, growth), solved
+
+    def double_knockout_matrix(self, solution, genes=None, processes=1):
+        '''
+        Simulates the knockout of every pair of genes (all genes of the
+        model by default), given the solution of the unmodified problem.
+        Returns a DoubleKnockoutMatrix: the growth of each single knockout,
+        and the growth of only those pairs that grow less than both of
+        their single knockouts. Every other pair grows as its slower single
+        knockout.
+
+        A single knockout solution that carries no flux through the
+        reactions a pair disables is optimal for the pair, so only pairs
+        failing that test for both genes are solved.
+        '''
+        if not self.maximize:
+            raise ValueError('Double knockouts can only be screened for a '
+                             'maximized objective')
+        network = self.network
+        if genes is None:
+            genes = sorted(network.gene_reactions)
+        for gene in genes:
+            if gene not in network.gene_reactions:
+                raise ValueError('Gene %s is not in model %s' %
+                                 (gene, network.id))
+        disabled, growth, support, solved = self._single_knockouts(
+            solution, genes, processes)
+        knocked = set(self.knockouts)
+        reactions = dict((gene, set(network.gene_reactions[gene]))
+                         for gene in genes)
+        tasks = []
+        for i, first in enumerate(genes):
+            if growth[first] <= ZERO_FLUX:
+                continue
+            for j in range(i + 1, len(genes)):
+                second = genes[j]
+                if growth[second] <= ZERO_FLUX:
+                    continue
+                if reactions[first] & reactions[second]:
+                    # the pair may disable reactions neither gene does
+                    # on its own
+                    cols = [col for col in network.knocked_out_reactions(
+                        self.formulation['geneko'] + [first, second])
+                        if col not in knocked]
+                else:
+                    cols = disabled[first] + disabled[second]
+                if (support[first].isdisjoint(cols) or
+                        support[second].isdisjoint(cols)):
+                    continue
+                tasks.append(((i, j), sorted(cols)))
+        tasks.sort(key=lambda task: task[1])
+        interactions = []
+        for chunk in solver_map(
+                self.lp, _knockout_chunk,
+                [(network.flux_count, chunk)
+                 for chunk in split(tasks, 4 * processes)], processes):
+            for (i, j), objective, _ in chunk:
+                slower = min(growth[genes[i]], growth[genes[j]])
+                if objective < slower - INTERACTION_TOLERANCE * abs(slower):
+                    interactions.append([i, j, objective])
+        interactions.sort()
+        return {'genes': list(genes),
+                'wildtype_growth': solution.objective,
+                'single_growth': [growth[gene] for gene in genes],
+                'interactions': interactions,
+                'solved': solved + len(tasks)}
+
+    def _single_knockouts(self, solution, genes, processes):
+        # returns the reactions each gene's knockout disables, the growth
+        # of each knockout, the flux columns carrying flux in a solution
+        # optimal for it and the number of knockouts solved.
+        #
+        # A solution that carries no flux through the reactions a knockout
+        # disables is still optimal after it, so such genes are given the
+        # wild type objective without a solve. The genes left are checked
+        # the same way against a minimal flux solution, and only the rest
+        # are solved, in contiguous chunks over processes worker processes.
+        network = self.network
+        knocked = set(self.knockouts)
+        disabled = {}
+        for gene in genes:
+            disabled[gene] = [col for col in network.knocked_out_reactions(
+                self.formulation['geneko'] + [gene]) if col not in knocked]
+        growth = dict((gene, solution.objective) for gene in genes)
+        if not solution.feasible:
+            return disabled, growth, dict((gene, set()) for gene in genes), 0
+
+        support = {}
+        remaining = list(genes)
+        for minimal in (False, True):
+            if not remaining:
+                break
+            candidate = (self.minimize_flux(solution, 1) if minimal
+                         else solution)
+            used = set(np.flatnonzero(
+                candidate.x[:network.flux_count]).tolist())
+            left = []
+            for gene in remaining:
+                if used.isdisjoint(disabled[gene]):
+                    support[gene] = used
+                else:
+                    left.append(gene)
+            remaining = left
+        # neighbouring knockouts touching neighbouring reactions keeps the
+        # warm started solves of a chunk close to each other
+        tasks = sorted(((gene, disabled[gene]) for gene in remaining),
+                       key=lambda task: task[1])
+        for chunk in solver_map(
+                self.lp, _knockout_chunk,
+                [(network.flux_count, chunk)
+                 for chunk in split(tasks, 4 * processes)], processes):
+            for gene, objective, used in chunk:
+                growth[gene] = objective
+                support[gene] = set(used.tolist())
+        return disabled, growth, support, len(tasks)
+
+    def _gene_assertions(self, solution, growth):
+        assertions = []
+        # a knockout can not take growth away from a model that does not
+        # grow
+        for gene in sorted(growth):
+            fraction = 1.0
+            if abs(solution.objective) > ZERO_FLUX:
+                fraction = growth[gene] / solution.objective
+            assertions.append([gene, fraction, growth[gene],
+                               1 if fraction < ESSENTIAL_FRACTION else 0])
+        return assertions
+
+    def sweep(self, parameters, compounds=None, processes=1):
+        '''
+        Solves the problem over the grid of one or two sweep_parameters
+        (bounds of a reaction, biomass or compound drain, or the right hand
+        side of a named constraint). Returns a FBASweepResults with the
+        objective value and the shadow price of each compound - the
+        objective gained per unit of the compound supplied - at every grid
+        point. compounds defaults to those whose drains are swept.
+
+        The grid is walked row by row, reversing every other row, so each
+        solve differs from the one before it in a single parameter; the
+        walk is split into contiguous stretches over processes worker
+        processes.
+        '''
+        network = self.network
+        if len(parameters) not in (1, 2):
+            raise ValueError('A sweep takes one or two parameters')
+        targets = [self._sweep_target(param) for param in parameters]
+        if compounds is None:
+            compounds = []
+            for param in parameters:
+                if param['variable_type'] in _COMPOUND_TYPES:
+                    compounds.append(param['variable'])
+        rows = []
+        for cpd in compounds:
+            row = network.find_compound(cpd)
+            if row is None:
+                raise ValueError('Compound %s not found!' % cpd)
+            rows.append(row)
+        values = [list(param['values']) for param in parameters]
+        if len(values) == 1:
+            values.append([None])
+        points = []
+        for i, first in enumerate(values[0]):
+            row_values = list(enumerate(values[1]))
+            if i % 2:
+                row_values.reverse()
+            for j, second in row_values:
+                points.append((i, j, (first, second)))
+        objectives = np.zeros((len(values[0]), len(values[1])))
+        feasible = np.zeros(objectives.shape, dtype=int)
+        prices = np.zeros(objectives.shape + (len(rows),))
+        lp = self.lp
+        if rows:
+            # the duals of a projected program are not shadow prices of
+            # the model's compounds
+            lp = copy.copy(lp)
+            lp.projection = None
+        for chunk in solver_map(
+                lp, _sweep_chunk,
+                [(targets, rows, chunk)
+                 for chunk in split(points, 4 * processes)], processes):
+            for i, j, result in chunk:
+                if result.optimal:
+                    feasible[i, j] = 1
+                    objectives[i, j] = result.objective
+                    prices[i, j] = -result.row_duals
+        # adding zero turns the negated zero duals into plain zeros
+        prices += 0.0
+        return {'values1': values[0],
+                'values2': values[1] if len(parameters) == 2 else [],
+                'feasible': feasible.tolist(),
+                'objectives': objectives.tolist(),
+                'compounds': [network.compounds[row] for row in rows],
+                'shadow_prices': prices.tolist()}
+
+    def _sweep_target(self, param):
+        # returns ('column', column, bound) or ('row', row, sign) for a
+        # sweep_parameter
+        network = self.network
+        var_type = param['variable_type']
+        var = param['variable']
+        if var_type == 'constraint':
+            for k, constraint in enumerate(self.constraints):
+                if constraint[3] == var:
+                    return ('row', len(network.compounds) + k, constraint[1])
+            raise ValueError('Constraint %s not found!' % var)
+        bound = param.get('bound', 'upper')
+        if bound not in ('lower', 'upper', 'both'):
+            raise ValueError('Bound %s not recognized!' % bound)
+        if var_type in _REACTION_TYPES or var_type in _BIOMASS_TYPES:
+            col = network.find_reaction(var)
+            if col is None:
+                col = network.find_biomass(var)
+            if col is None:
+                raise ValueError('Reaction %s not found!' % var)
+        elif var_type in _COMPOUND_TYPES:
+            row = network.find_compound(var)
+            if row is None or row not in self._drain_index:
+                raise ValueError('Compound %s has no drain flux!' % var)
+            col = network.flux_count + self._drain_index[row]
+        else:
+            raise ValueError('Sweep variable type %s not recognized!' %
+                             var_type)
+        return ('column', col, bound)
+
+    def reaction_fluxes(self, solution, minimum=None, maximum=None):
+        '''Returns the ReactionFlux tuples of a solution.'''
+        network = self.network
+        minimum = self.lower if minimum is None else minimum
+        maximum = self.upper if maximum is None else maximum
+        out = []
+        for col, rxn in enumerate(network.reactions):
+            out.append([rxn, float(solution.x[col]), float(self.ub[col]),
+                        float(self.lb[col]), float(maximum[col]),
+                        float(minimum[col]), 'flux',
+                        network.definitions[col]])
+        for i, bio in enumerate(network.biomasses):
+            col = len(network.reactions) + i
+            out.append([bio, float(solution.x[col]), float(self.ub[col]),
+                        float(self.lb[col]), float(maximum[col]),
+                        float(minimum[col]), 'biomassflux',
+                        network.biomass_names[i]])
+        return out
+
+    def compound_fluxes(self, solution, minimum=None, maximum=None):
+        '''Returns the CompoundFlux tuples of a solution.'''
+        network = self.network
+        minimum = self.lower if minimum is None else minimum
+        maximum = self.upper if maximum is None else maximum
+        out = []
+        for i, row in enumerate(self.drains):
+            col = network.flux_count + i
+            out.append([network.compounds[row], float(solution.x[col]),
+                        float(self.drain_ub[i]), float(self.drain_lb[i]),
+                        float(maximum[col]), float(minimum[col]),
+                        'drainflux', network.compound_names[row]])
+        return out
+
+    def flux_values(self, solution, ids):
+        '''
+        Returns the flux of each reaction, biomass reaction or compound
+        drain in ids; a compound with no drain in the problem has none.
+        '''
+        network = self.network
+        out = []
+        for var in ids:
+            col = network.find_reaction(var)
+            if col is None:
+                col = network.find_biomass(var)
+            if col is None:
+                row = network.find_compound(var)
+                if row is None:
+                    raise ValueError('Flux %s not found!' % var)
+                col = self._drain_index.get(row)
+                if col is not None:
+                    col += network.flux_count
+            out.append(0.0 if col is None else float(solution.x[col]))
+        return out
+
+    def fba_data(self, solution, fba_id=None, workspace=None,
+                 model_workspace=None, assertions=None):
+        '''Returns solution as an FBA structure of the service API.'''
+        return {'id': fba_id,
+                'workspace': workspace,
+                'model': self.network.id,
+                'model_workspace': model_workspace,
+                'objective': solution.objective,
+                'isComplete': 1,
+                'formulation': self.formulation,
+                'minimalMediaPredictions': [],
+                'metaboliteProductions': [],
+                'reactionFluxes': self.reaction_fluxes(solution),
+                'compoundFluxes': self.compound_fluxes(solution),
+                'geneAssertions': assertions or []}
+
+    def fba_object(self, solution, fba_id, model_ref, media_ref,
+                   minimum=None, maximum=None, assertions=None):
+        '''
+        Returns solution as a KBaseFBA.FBA typed object, for saving to the
+        workspace. minimum and maximum are the results of fva, and
+        assertions those of knockout_screen.
+        '''
+        form = self.formulation
+        network = self.network
+
+        objterms = ({}, {}, {})
+        for col, coef in self.objective.items():
+            if isinstance(col, tuple):
+                objterms[0][network.compounds[col[1]]] = coef
+            elif col < len(network.reactions):
+                objterms[1][network.reactions[col]] = coef
+            else:
+                objterms[2][network.biomasses[
+                    col - len(network.reactions)]] = coef
+
+        def model_ref_of(path, obj_id):
+            return '%s/%s/id/%s' % (model_ref, path, obj_id)
+
+        bounds = []
+        cpd_bounds = []
+        for lower, upper, var_type, var in form['bounds']:
+            if var_type in _REACTION_TYPES:
+                rxn = network.reactions[network.find_reaction(var)]
+                bounds.append({'modelreaction_ref':
+                               model_ref_of('modelreactions', rxn),
+                               'variableType': 'flux',
+                               'upperBound': upper, 'lowerBound': lower})
+            else:
+                cpd = network.compounds[network.find_compound(var)]
+                cpd_bounds.append({'modelcompound_ref':
+                                   model_ref_of('modelcompounds', cpd),
+                                   'variableType': 'drainflux',
+                                   'upperBound': upper,
+                                   'lowerBound': lower})
+        constraints = []
+        for rhs, sign, terms, name in form['constraints']:
+            const = {'name': name, 'rhs': rhs, 'sign': sign,
+                     'compound_terms': {}, 'reaction_terms': {},
+                     'biomass_terms': {}}
+            for coef, var_type, var in terms:
+                if var_type in _COMPOUND_TYPES:
+                    const['compound_terms'][var] = coef
+                elif var_type in _BIOMASS_TYPES:
+                    const['biomass_terms'][var] = coef
+                else:
+                    const['reaction_terms'][var] = coef
+            constraints.append(const)
+
+        rxn_vars = []
+        bio_vars = []
+        for flux in self.reaction_fluxes(solution, minimum, maximum):
+            var = {'variableType': flux[6], 'value': flux[1],
+                   'upperBound': flux[2], 'lowerBound': flux[3],
+                   'max': flux[4], 'min': flux[5], 'class': 'unknown'}
+            if flux[6] == 'flux':
+                var['modelreaction_ref'] = model_ref_of('modelreactions',
+                                                        flux[0])
+                rxn_vars.append(var)
+            else:
+                var['biomass_ref'] = model_ref_of('biomasses', flux[0])
+                var['variableType'] = 'biomassflux'
+                bio_vars.append(var)
+        cpd_vars = []
+        for flux in self.compound_fluxes(solution, minimum, maximum):
+            cpd_vars.append({'modelcompound_ref':
+                             model_ref_of('modelcompounds', flux[0]),
+                             'variableType': 'drainflux', 'value': flux[1],
+                             'upperBound': flux[2], 'lowerBound': flux[3],
+                             'max': flux[4], 'min': flux[5],
+                             'class': 'unknown'})
+
+        def feature_ref(gene):
+            return '%s/features/id/%s' % (network.genome_ref, gene)
+
+        genekos = []
+        deletions = []
+        if network.genome_ref:
+            genekos = [feature_ref(gene) for gene in form['geneko']]
+            deletions = [{'feature_refs': [feature_ref(assertion[0])],
+                          'growthFraction': assertion[1]}
+                         for assertion in assertions or []]
+        return {
+            'id': fba_id,
+            'fva': 0 if minimum is None else 1,
+            'fluxMinimization': 0,
+            'findMinimalMedia': 0,
+            'allReversible': form['allreversible'],
+            'simpleThermoConstraints': form['simplethermoconst'],
+            'thermodynamicConstraints': form['thermoconst'],
+            'noErrorThermodynamicConstraints': form['nothermoerror'],
+            'minimizeErrorThermodynamicConstraints': form['minthermoerror'],
+            'quantitativeOptimization': 0,
+            'maximizeObjective': form['maximizeObjective'],
+            'compoundflux_objterms': objterms[0],
+            'reactionflux_objterms': objterms[1],
+            'biomassflux_objterms': objterms[2],
+            'comboDeletions': 0 if assertions is None else 1,
+            'numberOfSolutions': 1,
+            'objectiveConstraintFraction': form['objfraction'],
+            'defaultMaxFlux': form['defaultmaxflux'],
+            'defaultMaxDrainFlux': form['defaultmaxuptake'],
+            'defaultMinDrainFlux': form['defaultminuptake'],
+            'decomposeReversibleFlux': 0,
+            'decomposeReversibleDrainFlux': 0,
+            'fluxUseVariables': 0,
+            'drainfluxUseVariables': 0,
+            'fbamodel_ref': model_ref,
+            'media_ref': media_ref,
+            'geneKO_refs': genekos,
+            'reactionKO_refs': [model_ref_of('modelreactions',
+                                             network.reactions[col])
+                                for col in (network.find_reaction(r) for r
+                                            in form['rxnko'])
+                                if col is not None],
+            'additionalCpd_refs': [],
+            'uptakeLimits': form['uptakelim'],
+            'parameters': {},
+            'inputfiles': {},
+            'outputfiles': {},
+            'FBAConstraints': constraints,
+            'FBAReactionBounds': bounds,
+            'FBACompoundBounds': cpd_bounds,
+            'objectiveValue': solution.objective,
+            'FBACompoundVariables': cpd_vars,
+            'FBAReactionVariables': rxn_vars,
+            'FBABiomassVariables': bio_vars,
+            'FBAPromResults': [],
+            'FBADeletionResults': deletions,
+            'FBAMinimalMediaResults': [],
+            'FBAMetaboliteProductionResults': []
+        }
+
+
+def _temporary_media(media, compound_refs):
+    # the media with compound_refs added, as createTemporaryMedia in the
+    # perl implementation
+    added = dict((_ref_id(ref), ref) for ref in compound_refs)
+    out = dict(media)
+    out['mediacompounds'] = [
+        mcpd for mcpd in media.get('mediacompounds', [])
+        if _ref_id(mcpd['compound_ref']) not in added]
+    for cpd in sorted(added):
+        out['mediacompounds'].append({
+            'compound_ref': added[cpd], 'concentration': 0.001,
+            'minFlux': _ADDITIONAL_COMPOUND_BOUNDS[0],
+            'maxFlux': _ADDITIONAL_COMPOUND_BOUNDS[1]})
+    return out
+
+
+def simulate_phenotypes(network, formulation, phenotype_set,
+                        phenotypeset_ref, media, processes=1):
+    '''
+    Simulates every Phenotype of a PhenotypeSet and returns their
+    PhenotypeSimulations. media maps the media_ref of each phenotype to its
+    Media object; the formulation's own media is not used.
+
+    Phenotypes are grouped by media, and one program is built per group.
+    Each phenotype then only changes the bounds of the drains its
+    additional compounds open and of the reactions its knockouts disable.
+    Groups are split over processes worker processes. With uptake limits,
+    additional compounds go into the media of their group instead, so that
+    the limits cover them.
+    '''
+    formulation = default_formulation(formulation)
+    phenotypes = phenotype_set['phenotypes']
+    groups = {}
+    for index, pheno in enumerate(phenotypes):
+        key = (pheno['media_ref'],)
+        if formulation['uptakelim']:
+            key += tuple(sorted(pheno.get('additionalcompound_refs', [])))
+        groups.setdefault(key, []).append(index)
+
+    tasks = []
+    for key in sorted(groups):
+        group_media = media[key[0]]
+        if len(key) > 1:
+            group_media = _temporary_media(group_media, key[1:])
+        problem = FBAProblem(network, formulation, group_media)
+        items = []
+        for index in groups[key]:
+            drains, knocked = problem.phenotype_bounds(phenotypes[index])
+            if len(key) > 1:
+                drains = []
+            items.append((index, drains, knocked))
+        items.sort(key=lambda item: (item[1], item[2]))
+        count = -(-4 * processes * len(items) // len(phenotypes))
+        for chunk in split(items, count):
+            tasks.append((problem.lp, chunk))
+
+    results = {}
+    for chunk in program_map(_phenotype_chunk, tasks, processes):
+        for index, growth, wildtype in chunk:
+            results[index] = (growth, wildtype)
+
+    simulations = []
+    for index, pheno in enumerate(phenotypes):
+        growth, wildtype = results[index]
+        if growth <= NO_GROWTH:
+            growth = 0.0
+        fraction = 0.0
+        if wildtype > NO_GROWTH:
+            fraction = growth / wildtype
+        phenoclass = 'UN'
+        if pheno.get('normalizedGrowth') is not None:
+            if pheno['normalizedGrowth'] > _OBSERVED_GROWTH:
+                phenoclass = 'CP' if fraction > 0 else 'FN'
+            else:
+                phenoclass = 'FP' if fraction > 0 else 'CN'
+        simulations.append({
+            'id': pheno['id'] + '.sim',
+            'phenotype_ref': '%s/phenotypes/id/%s' % (phenotypeset_ref,
+                                                      pheno['id']),
+            'simulatedGrowth': growth,
+            'simulatedGrowthFraction': fraction,
+            'phenoclass': phenoclass})
+    return simulations
+
+
+def _program_key(lp):
+    # programs with equal keys differ at most in their column bounds
+    return (lp.shape, lp.maximize, lp.A.indptr.tobytes(),
+            lp.A.indices.tobytes(), lp.A.data.tobytes(), lp.c.tobytes(),
+            lp.row_lower.tobytes(), lp.row_upper.tobytes())
+
+
+def solve_batch(network, formulations, media, processes=1):
+    '''
+    Solves each FBAFormulation against network, with the Media object at
+    the same position in media. Returns a list of (FBAProblem,
+    FBASolution) in formulation order.
+
+    Formulations whose programs differ only in column bounds - media,
+    knockouts and custom bounds - are solved one after the other by one
+    warm started solver, changing only the bounds that differ. Groups are
+    split over processes worker processes.
+    '''
+    problems = [FBAProblem(network, formulation, medium)
+                for formulation, medium in zip(formulations, media)]
+    groups = {}
+    order = []
+    for index, problem in enumerate(problems):
+        key = _program_key(problem.lp)
+        if key not in groups:
+            groups[key] = []
+            order.append(key)
+        groups[key].append(index)
+    tasks = []
+    for key in order:
+        items = [(index, problems[index].lp.lower, problems[index].lp.upper)
+                 for index in groups[key]]
+        count = -(-4 * processes * len(items) // len(problems))
+        for chunk in split(items, count):
+            tasks.append((problems[chunk[0][0]].lp, chunk))
+    results = {}
+    for chunk in program_map(_batch_chunk, tasks, processes):
+        for index, result in chunk:
+            results[index] = result
+    return [(problem, problem._solution(results[index]))
+            for index, problem in enumerate(problems)]
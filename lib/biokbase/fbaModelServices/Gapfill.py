@@ -0,0 +1,877 @@
+'''
+In-process gapfilling of workspace FBAModel objects.
+
+Gapfilling looks for the biochemistry reactions, and the reversals of
+irreversible model reactions, that a model needs to reach its objective in
+a media. Candidates are the reactions of a ReactionDatabase placed in the
+model's compartments (or those of allowedcmps). Each direction of a
+candidate carries the penalties PrepareForGapfilling in
+Bio::KBase::ObjectAPI::KBaseFBA::FBA sets for the MFAToolkit: the program
+minimizes the penalty-weighted candidate flux while the objective is held at
+GAPFILL_GROWTH. This is the fast gapfilling without use variables that the
+perl implementation runs by default.
+
+When num_solutions asks for alternatives, each penalized direction gets a
+binary use variable carrying its penalty instead, and alternatives are
+found with integer cuts that rule out each solution found and its
+supersets. Rather than one long series of MILP solves, the rest of the
+space is partitioned around the first solution into disjoint branches, each
+leaving out one of its uses and keeping the uses before it, that are
+enumerated in a pool of processes. The branches share the solutions found,
+and each stops once its next solution costs more than num_solutions found
+already, or when totalTimeLimit runs out.
+
+Most of a biochemistry can never carry flux in a given media, so candidates
+are pruned before the program is built. A ReactionGraph of the model and
+its candidates is expanded forward from the media and cofactors, through
+the reactions in their own directions, and then backward from the
+objective's compounds. Only candidate directions that are reached both
+ways are kept.
+'''
+
+from __future__ import division
+
+import copy
+import multiprocessing
+import threading
+import time
+
+try:
+    import numpy as np
+    import scipy.sparse as sparse
+except ImportError:
+    np = None
+
+from biokbase.fbaModelServices import FBA
+from biokbase.fbaModelServices.Solver import INF, LPSolver, program_map
+
+# gapfilling options, as defaulted by gapfill_model in the perl
+# implementation
+GAPFILL_DEFAULTS = {
+    'num_solutions': 1,
+    'timePerSolution': 3600,
+    'totalTimeLimit': 18000,
+    'nomediahyp': 1,
+    'nobiomasshyp': 1,
+    'nogprhyp': 1,
+    'nopathwayhyp': 0,
+    'allowunbalanced': 0,
+    'activitybonus': 0,
+    'drainpen': 10,
+    'directionpen': 5,
+    'nostructpen': 1,
+    'unfavorablepen': 0.1,
+    'nodeltagpen': 1,
+    'biomasstranspen': 3,
+    'singletranspen': 3,
+    'transpen': 1,
+    'blacklistedrxns': [],
+    'gauranteedrxns': [],
+    'allowedcmps': []
+}
+
+# hypotheses the MFAToolkit can test that need more than added reactions,
+# with the only setting supported here
+_HYPOTHESES = (('nomediahyp', 1), ('nobiomasshyp', 1), ('nogprhyp', 1),
+               ('nopathwayhyp', 0))
+
+# penalty of a reaction that is not mass or charge balanced, when
+# allowunbalanced lets it in at all
+_UNBALANCED_PENALTY = 10
+
+# delta G the biochemistry gives reactions it has no estimate for
+_UNKNOWN_DELTAG = 10000000
+
+# objective a gapfilled model has to reach, unless the model can not reach
+# it with every candidate added
+GAPFILL_GROWTH = 0.1
+
+# flux above which a candidate counts as part of a solution
+_ACTIVE_FLUX = 1e-6
+
+# relative difference in cost below which enumerated solutions are taken to
+# cost the same
+_COST_TOLERANCE = 1e-6
+
+# compounds that are taken to be available in every compartment when
+# candidates are pruned, as the currency metabolites no pathway starts
+# from: water, ATP/ADP/AMP, NAD(P)(H), O2, phosphate, pyrophosphate, CoA,
+# CO2, NH3 and H+
+COFACTORS = frozenset(['cpd00001', 'cpd00002', 'cpd00003', 'cpd00004',
+                       'cpd00005', 'cpd00006', 'cpd00007', 'cpd00008',
+                       'cpd00009', 'cpd00010', 'cpd00011', 'cpd00012',
+                       'cpd00013', 'cpd00018', 'cpd00067'])
+
+_lock = threading.Lock()
+_databases = {}
+
+
+def default_gapfill_formulation(formulation=None):
+    '''Returns a copy of a GapfillingFormulation with unset defaults.'''
+    out = copy.deepcopy(GAPFILL_DEFAULTS)
+    for key, value in (formulation or {}).items():
+        if value is not None:
+            out[key] = copy.deepcopy(value)
+    return out
+
+
+class ReactionDatabase(object):
+    '''
+    The reactions of a Biochemistry object, compiled once for all the
+    gapfillings against it: reagents as (compound index, compartment id,
+    coefficient) and what the candidate penalties are computed from.
+    '''
+
+    def __init__(self, ref, biochem):
+        self.ref = ref
+        self.compounds = []
+        self.compound_names = []
+        self.compound_formula = []
+        cofactors = set(COFACTORS)
+        for cpd in biochem.get('compounds', []):
+            self.compounds.append(cpd['id'])
+            self.compound_names.append(cpd.get('name', cpd['id']))
+            self.compound_formula.append(cpd.get('formula') or '')
+            if cpd.get('isCofactor'):
+                cofactors.add(cpd['id'])
+        self.compound_index = dict((c, i) for i, c in
+                                   enumerate(self.compounds))
+        self.cofactors = frozenset(cofactors)
+
+        self.reactions = []
+        self.reaction_names = []
+        self.directions = []
+        self.balanced = []
+        self.deltag = []
+        self.reagents = []
+        for rxn in biochem.get('reactions', []):
+            reagents = {}
+            for rgt in rxn.get('reagents', []):
+                row = self.compound_index.get(FBA._ref_id(
+                    rgt['compound_ref']))
+                if row is None:
+                    break
+                key = (row, FBA._ref_id(rgt.get('compartment_ref', 'c')))
+                reagents[key] = reagents.get(key, 0) + rgt['coefficient']
+            else:
+                reagents = [(row, cmp, coef) for (row, cmp), coef in
+                            sorted(reagents.items()) if coef]
+                if not reagents:
+                    continue
+                deltag = rxn.get('deltaG')
+                if deltag is not None and abs(deltag) >= _UNKNOWN_DELTAG:
+                    deltag = None
+                self.reactions.append(rxn['id'])
+                self.reaction_names.append(rxn.get('name', rxn['id']))
+                self.directions.append(rxn.get('direction', '='))
+                self.balanced.append(
+                    rxn.get('status', 'OK').startswith('OK'))
+                self.deltag.append(deltag)
+                self.reagents.append(reagents)
+        self.reaction_index = dict((r, i) for i, r in
+                                   enumerate(self.reactions))
+
+
+def get_database(ref, load_biochemistry):
+    '''
+    Returns the ReactionDatabase of the biochemistry at workspace reference
+    ref (ws/obj/version), compiling it with load_biochemistry() - which
+    must return the Biochemistry object data - the first time it is asked
+    for. Older versions of the same biochemistry are dropped.
+    '''
+    base = ref.rsplit('/', 1)[0]
+    with _lock:
+        database = _databases.get(base)
+    if database is not None and database.ref == ref:
+        return database
+    database = ReactionDatabase(ref, load_biochemistry())
+    with _lock:
+        _databases[base] = database
+    return database
+
+
+class ReactionGraph(object):
+    '''
+    Compact reachability index of a reaction network. Every direction a
+    reaction may run in is a node, and substrates and products are 0/1
+    compound x node matrices, so that each step of an expansion is one
+    sparse product.
+    '''
+
+    def __init__(self, S, forward, reverse):
+        S = sparse.csc_matrix(S)
+        consumed = (S < 0).astype(np.int32)
+        produced = (S > 0).astype(np.int32)
+        forward = np.flatnonzero(forward)
+        reverse = np.flatnonzero(reverse)
+        self.node_reaction = np.concatenate([forward, reverse])
+        self.node_forward = np.concatenate([
+            np.ones(len(forward), dtype=bool),
+            np.zeros(len(reverse), dtype=bool)])
+        self.substrates = sparse.hstack(
+            [consumed[:, forward], produced[:, reverse]], format='csc')
+        self.products = sparse.hstack(
+            [produced[:, forward], consumed[:, reverse]], format='csc')
+        self._substrates_of = self.substrates.T.tocsr()
+        self._products_of = self.products.T.tocsr()
+        self._substrate_count = np.diff(self._substrates_of.indptr)
+
+    def ready(self, reached):
+        '''
+        Returns the nodes all of whose substrates are in the reached
+        compound mask.
+        '''
+        return (self._substrates_of.dot(reached.astype(np.int32)) ==
+                self._substrate_count)
+
+    def reachable(self, seeds, nodes=None):
+        '''
+        Returns the nodes that can fire, and the compounds they make
+        reachable, from the seeds compound mask: a node fires once all its
+        substrates are reachable. Only the nodes in the nodes mask fire,
+        when it is given.
+        '''
+        reached = np.asarray(seeds, dtype=bool).copy()
+        fired = np.zeros(len(self.node_reaction), dtype=bool)
+        while True:
+            firing = self.ready(reached)
+            if nodes is not None:
+                firing &= nodes
+            if (firing == fired).all():
+                return fired, reached
+            fired = firing
+            reached |= self.products.dot(fired.astype(np.int32)) > 0
+
+    def productive(self, targets, nodes):
+        '''
+        Returns the nodes, out of the nodes mask, that make one of the
+        targets compound mask or a substrate of another such node.
+        '''
+        needed = np.asarray(targets, dtype=bool).copy()
+        useful = np.zeros(len(self.node_reaction), dtype=bool)
+        while True:
+            found = nodes & (self._products_of.dot(
+                needed.astype(np.int32)) > 0)
+            if (found == useful).all():
+                return useful
+            useful = found
+            needed |= self.substrates.dot(useful.astype(np.int32)) > 0
+
+
+class GapfillProblem(object):
+    '''
+    The gapfilling program for a model, one FBAFormulation and Media and a
+    GapfillingFormulation against a ReactionDatabase. The model is
+    extended with the candidates that survive pruning and compiled into
+    its own ModelNetwork, whose first flux columns are the model's
+    reactions.
+    '''
+
+    def __init__(self, network, model, database, formulation=None,
+                 media=None, gapfill=None):
+        self.model = model
+        self.database = database
+        self.options = default_gapfill_formulation(gapfill)
+        for option, value in _HYPOTHESES:
+            if self.options[option] != value:
+                raise ValueError('Gapfilling option %s=%s is not ' %
+                                 (option, self.options[option]) +
+                                 'supported by the in-process gapfilling ' +
+                                 'engine')
+        self.formulation = FBA.default_formulation(formulation)
+        self.media = media
+        self.model_network = network
+        self.guaranteed = set(self.options['gauranteedrxns'])
+
+        compartments = {}
+        for cmp in model.get('modelcompartments', []):
+            letter = FBA._ref_id(cmp.get('compartment_ref', cmp['id'][0]))
+            if letter not in compartments or cmp['id'] == letter + '0':
+                compartments[letter] = cmp['id']
+        allowed = self.options['allowedcmps'] or sorted(compartments)
+        # {compartment id: model compartment id}, with compartments only
+        # allowedcmps lists placed at index 0
+        self.compartments = dict((letter, compartments.get(letter,
+                                                           letter + '0'))
+                                 for letter in allowed)
+        self.candidates = self._candidates()
+        self.candidate_count = len(self.candidates)
+        self._prune()
+        self.network = FBA.ModelNetwork(self._extended_model())
+        self.problem = FBA.FBAProblem(self.network, self.formulation, media)
+        self._costs()
+
+    def _candidates(self):
+        # [(reaction index, candidate id, compartment, [(compound id, coef)],
+        # forward cost, reverse cost)] for the database reactions in the
+        # allowed compartments that the model does not have
+        network = self.model_network
+        database = self.database
+        options = self.options
+        blacklist = set(options['blacklistedrxns'])
+        biomass = set()
+        for col in network.biomass_index.values():
+            rows = network.S[:, col].tocoo()
+            biomass.update(network.compound_base[row]
+                           for row, coef in zip(rows.row, rows.data)
+                           if coef < 0)
+        candidates = []
+        for i, rxn_id in enumerate(database.reactions):
+            reagents = database.reagents[i]
+            cmps = sorted(set(cmp for row, cmp, coef in reagents))
+            if any(cmp not in self.compartments for cmp in cmps):
+                continue
+            cmp = 'c' if 'c' in cmps else cmps[0]
+            cand_id = '%s_%s' % (rxn_id, self.compartments[cmp])
+            if (cand_id in network.reaction_index or rxn_id in blacklist or
+                    cand_id in blacklist):
+                continue
+            guaranteed = (rxn_id in self.guaranteed or
+                          cand_id in self.guaranteed)
+            if not (database.balanced[i] or options['allowunbalanced'] or
+                    guaranteed):
+                continue
+            cost = 1.0
+            if len(cmps) > 1:
+                cost += options['transpen']
+                transported = set(
+                    row for row, cmp, coef in reagents
+                    if sum(1 for other, c, k in reagents if other == row) > 1)
+                if len(transported) == 1:
+                    cost += options['singletranspen']
+                if any(database.compounds[row] in biomass
+                       for row in transported):
+                    cost += options['biomasstranspen']
+            if any(not database.compound_formula[row]
+                   for row, cmp, coef in reagents):
+                cost += options['nostructpen']
+            if not database.balanced[i]:
+                cost += _UNBALANCED_PENALTY
+            forward = reverse = cost
+            deltag = database.deltag[i]
+            if deltag is None:
+                forward += options['nodeltagpen']
+                reverse += options['nodeltagpen']
+            elif deltag > 0:
+                forward += options['unfavorablepen']
+            elif deltag < 0:
+                reverse += options['unfavorablepen']
+            if database.directions[i] == '>':
+                reverse += options['directionpen']
+            elif database.directions[i] == '<':
+                forward += options['directionpen']
+            candidates.append((i, cand_id, cmp, [
+                ('%s_%s' % (database.compounds[row], self.compartments[c]),
+                 coef) for row, c, coef in reagents], forward, reverse))
+        return candidates
+
+    def _seeds_and_targets(self, compound_base, compound_compartment):
+        # the compounds reachability starts from: what the media supplies,
+        # additional compounds and cofactors; and the compounds of the
+        # objective it has to lead to
+        form = self.formulation
+        media = self.media or {'name': 'Complete', 'mediacompounds': []}
+        complete = form['defaultmaxuptake'] > 0 or (
+            media.get('name') == 'Complete')
+        supplied = set(FBA._ref_id(mcpd['compound_ref'])
+                       for mcpd in media.get('mediacompounds', [])
+                       if mcpd['maxFlux'] > 0)
+        supplied.update(FBA._ref_id(cpd).split('_')[0]
+                        for cpd in form['additionalcpds'])
+        cofactors = self.database.cofactors
+        seeds = np.array([
+            base in cofactors or (compartment == 'e' and
+                                  (complete or base in supplied))
+            for base, compartment in zip(compound_base,
+                                         compound_compartment)])
+
+        network = self.model_network
+        targets = np.zeros(len(compound_base), dtype=bool)
+        for coef, var_type, var in form['objectiveTerms']:
+            if var_type in FBA._COMPOUND_TYPES:
+                row = network.find_compound(var)
+                if row is not None:
+                    targets[row] = True
+                continue
+            col = network.find_biomass(var)
+            if col is None:
+                col = network.find_reaction(var)
+            if col is None:
+                continue
+            rows = network.S[:, col].tocoo()
+            consumed = rows.row[rows.data < 0] if col in (
+                network.biomass_index.values()) else rows.row
+            targets[consumed] = True
+        return seeds, targets
+
+    def _prune(self):
+        # keeps the candidate directions that can fire from the media and
+        # lead to the objective, and the guaranteed candidates whole.
+        # Reachability spreads through the model reactions in their own
+        # directions and the candidates in the directions the biochemistry
+        # gives them; the directions gapfilling can only add at a
+        # penalty - model reactions reversed and candidates run against
+        # their direction - may fire once that reaches their substrates,
+        # but reach nothing further, so that no direction is reached
+        # through its own opposite
+        network = self.model_network
+        compounds = list(network.compounds)
+        compound_index = dict(network.compound_index)
+        compound_base = list(network.compound_base)
+        compound_compartment = list(network.compound_compartment)
+        letters = dict((model_cmp, letter) for letter, model_cmp in
+                       self.compartments.items())
+        rows = []
+        cols = []
+        coefs = []
+        for j, candidate in enumerate(self.candidates):
+            for cpd, coef in candidate[3]:
+                if cpd not in compound_index:
+                    compound_index[cpd] = len(compounds)
+                    compounds.append(cpd)
+                    base, model_cmp = cpd.rsplit('_', 1)
+                    compound_base.append(base)
+                    compound_compartment.append(letters[model_cmp])
+                rows.append(compound_index[cpd])
+                cols.append(network.flux_count + j)
+                coefs.append(coef)
+        model_S = network.S.tocoo()
+        S = sparse.coo_matrix(
+            (np.concatenate([model_S.data, coefs]),
+             (np.concatenate([model_S.row, rows]).astype(int),
+              np.concatenate([model_S.col, cols]).astype(int))),
+            shape=(len(compounds),
+                   network.flux_count + len(self.candidates)))
+        nrxn = len(network.reactions)
+        forward = np.ones(S.shape[1], dtype=bool)
+        reverse = np.ones(S.shape[1], dtype=bool)
+        reverse[nrxn:network.flux_count] = False
+        graph = ReactionGraph(S, forward, reverse)
+        # the directions each column runs in of its own
+        runs_forward = np.ones(S.shape[1], dtype=bool)
+        runs_reverse = np.zeros(S.shape[1], dtype=bool)
+        runs_forward[:nrxn] = ~network.reverse_only
+        runs_reverse[:nrxn] = ~network.forward_only
+        for j, candidate in enumerate(self.candidates):
+            direction = self.database.directions[candidate[0]]
+            runs_forward[network.flux_count + j] = direction != '<'
+            runs_reverse[network.flux_count + j] = direction != '>'
+        own = np.where(graph.node_forward,
+                       runs_forward[graph.node_reaction],
+                       runs_reverse[graph.node_reaction])
+        seeds, targets = self._seeds_and_targets(compound_base,
+                                                 compound_compartment)
+        fired, reached = graph.reachable(seeds, own)
+        fired |= graph.ready(reached)
+        useful = graph.productive(targets, fired)
+
+        kept = np.zeros((S.shape[1], 2), dtype=bool)
+        kept[graph.node_reaction[useful],
+             np.where(graph.node_forward[useful], 0, 1)] = True
+        candidates = []
+        for j, candidate in enumerate(self.candidates):
+            forward, reverse = kept[network.flux_count + j]
+            if (candidate[1] in self.guaranteed or
+                    candidate[1].rsplit('_', 1)[0] in self.guaranteed):
+                forward = reverse = True
+            if forward or reverse:
+                candidates.append(candidate[:4] + (
+                    candidate[4] if forward else None,
+                    candidate[5] if reverse else None))
+        self.candidates = candidates
+        # model reactions whose opposite direction is reachable and useful,
+        # as the columns they may be reversed in
+        blacklist = set(self.options['blacklistedrxns'])
+        self.reversible = [
+            col for col in range(nrxn)
+            if network.reactions[col] not in blacklist and (
+                (network.forward_only[col] and kept[col, 1]) or
+                (network.reverse_only[col] and kept[col, 0]))]
+
+    def _extended_model(self):
+        # the model with the kept candidates added and the reversible model
+        # reactions opened in both directions, for compiling a network
+        model = self.model
+        database = self.database
+        extended = dict(model)
+        extended['modelcompartments'] = list(
+            model.get('modelcompartments', []))
+        present = set(cmp['id'] for cmp in extended['modelcompartments'])
+        for letter, model_cmp in sorted(self.compartments.items()):
+            if model_cmp not in present:
+                extended['modelcompartments'].append({
+                    'id': model_cmp, 'compartmentIndex': 0,
+                    'compartment_ref': '%s/compartments/id/%s' % (
+                        database.ref, letter),
+                    'label': model_cmp, 'pH': 7, 'potential': 0})
+        extended['modelcompounds'] = list(model.get('modelcompounds', []))
+        present = set(self.model_network.compounds)
+        extended['modelreactions'] = [dict(rxn) for rxn in
+                                      model.get('modelreactions', [])]
+        for col in self.reversible:
+            extended['modelreactions'][col]['direction'] = '='
+        for i, cand_id, cmp, reagents, forward, reverse in self.candidates:
+            for cpd, coef in reagents:
+                if cpd in present:
+                    continue
+                present.add(cpd)
+                base, model_cmp = cpd.rsplit('_', 1)
+                row = database.compound_index[base]
+                extended['modelcompounds'].append({
+                    'id': cpd, 'name': database.compound_names[row],
+                    'formula': database.compound_formula[row],
+                    'compound_ref': '%s/compounds/id/%s' % (database.ref,
+                                                           base),
+                    'modelcompartment_ref': '~/modelcompartments/id/' +
+                                            model_cmp})
+            direction = '='
+            if forward is None:
+                direction = '<'
+            elif reverse is None:
+                direction = '>'
+            extended['modelreactions'].append({
+                'id': cand_id, 'name': database.reaction_names[i],
+                'direction': direction,
+                'modelReactionReagents': [
+                    {'modelcompound_ref': '~/modelcompounds/id/' + cpd,
+                     'coefficient': coef} for cpd, coef in reagents],
+                'modelReactionProteins': []})
+        return extended
+
+    def _costs(self):
+        # penalties of forward and reverse flux through every flux column;
+        # model reactions are free in their own direction
+        nflux = self.network.flux_count
+        self.forward_cost = np.zeros(nflux)
+        self.reverse_cost = np.zeros(nflux)
+        penalty = self.options['directionpen']
+        for col in self.reversible:
+            if self.model_network.forward_only[col]:
+                self.reverse_cost[col] = penalty
+            else:
+                self.forward_cost[col] = penalty
+        nrxn = len(self.model_network.reactions)
+        for j, candidate in enumerate(self.candidates):
+            self.forward_cost[nrxn + j] = candidate[4] or 0
+            self.reverse_cost[nrxn + j] = candidate[5] or 0
+        self.penalized = np.flatnonzero((self.forward_cost > 0) |
+                                        (self.reverse_cost > 0))
+        # the (column, direction) pairs that carry a penalty, in the order
+        # of their parts and use variables
+        self.uses = ([(col, '>') for col in self.penalized
+                      if self.forward_cost[col] > 0] +
+                     [(col, '<') for col in self.penalized
+                      if self.reverse_cost[col] > 0])
+
+    def program(self, growth, use_variables=False):
+        '''
+        Returns the gapfilling program: the objective held at growth, and
+        the penalty-weighted flux through candidates minimized. Each
+        penalized column v gets a forward and a reverse part, v = f - r,
+        following the flux columns and drains. With use_variables, the
+        penalties go on binary columns instead, one per pair of self.uses
+        following the parts, that must be 1 for their part to carry flux.
+        '''
+        problem = self.problem
+        nvar = problem.variable_count
+        cols = self.penalized
+        count = len(cols)
+        lp = problem.objective_constraint(growth, 1)
+        lp = lp.add_columns(
+            sparse.csc_matrix((lp.shape[0], 2 * count)),
+            np.concatenate([self.forward_cost[cols],
+                            self.reverse_cost[cols]]),
+            np.zeros(2 * count), np.full(2 * count, INF))
+        select = sparse.csc_matrix(
+            (np.ones(count), (np.arange(count), cols)),
+            shape=(count, nvar))
+        eye = sparse.identity(count, format='csc')
+        lp = lp.add_rows(sparse.hstack([select, -eye, eye], format='csc'),
+                         np.zeros(count), np.zeros(count))
+        lp.c[:nvar] = 0
+        lp.maximize = False
+        if not use_variables:
+            return lp
+        # f - M y <= 0 for each part f and its use y, M the bound on the
+        # flux in that direction
+        position = dict((col, k) for k, col in enumerate(cols))
+        parts = np.array([nvar + position[col] + (count if direction == '<'
+                                                  else 0)
+                          for col, direction in self.uses], dtype=int)
+        limits = np.array([problem.upper[col] if direction == '>'
+                           else -problem.lower[col]
+                           for col, direction in self.uses])
+        limits[~np.isfinite(limits)] = self.formulation['defaultmaxflux']
+        nuse = len(parts)
+        costs = lp.c[parts].copy()
+        lp.c[parts] = 0
+        first = lp.shape[1]
+        lp = lp.add_columns(sparse.csc_matrix((lp.shape[0], nuse)), costs,
+                            np.zeros(nuse), np.ones(nuse), np.ones(nuse))
+        rows = np.arange(nuse)
+        link = sparse.csc_matrix(
+            (np.concatenate([np.ones(nuse), -limits]),
+             (np.concatenate([rows, rows]),
+              np.concatenate([parts, first + rows]))),
+            shape=(nuse, lp.shape[1]))
+        return lp.add_rows(link, np.full(nuse, -INF), np.zeros(nuse))
+
+    def solve(self, processes=1):
+        '''
+        Returns the gapfilling solutions, as GapfillingSolutions of the FBA
+        object sorted by cost, and the FBASolution of the extended model the
+        first comes from; the list is empty when the model can not reach its
+        objective even with every candidate. Alternative solutions are
+        enumerated in up to processes worker processes.
+        '''
+        solution = self.problem.solve()
+        if not solution.feasible or solution.objective <= FBA.NO_GROWTH:
+            return [], solution
+        growth = min(GAPFILL_GROWTH, solution.objective)
+        if self.options['num_solutions'] > 1:
+            return self._enumerate(growth, int(self.options['num_solutions']),
+                                   processes)
+        result = LPSolver(self.program(growth)).solve()
+        if not result.optimal:
+            return [], solution
+        nvar = self.problem.variable_count
+        count = len(self.penalized)
+        forward = result.x[nvar:nvar + count]
+        reverse = result.x[nvar + count:nvar + 2 * count]
+        solution = self.problem._solution(result, growth)
+        return [self._gapfilling_solution(
+            'sol.0', result.objective, growth,
+            [(col, '>') for col, flux in zip(self.penalized, forward)
+             if flux > _ACTIVE_FLUX and self.forward_cost[col] > 0] +
+            [(col, '<') for col, flux in zip(self.penalized, reverse)
+             if flux > _ACTIVE_FLUX and self.reverse_cost[col] > 0])], solution
+
+    def _enumerate(self, growth, count, processes):
+        # the count cheapest solutions of the program with use variables:
+        # the first, and those of the branches around it
+        options = self.options
+        deadline = time.time() + options['totalTimeLimit']
+        lp = self.program(growth, True)
+        first = lp.shape[1] - len(self.uses)
+        solver = LPSolver(lp)
+        solver.set_time_limit(max(0, min(options['timePerSolution'],
+                                         deadline - time.time())))
+        result = solver.solve()
+        if result.x is None:
+            return [], self.problem._solution(result)
+        key = _use_key(result.x, first)
+        found = {key: (result.objective, not result.optimal)}
+        # in one process, the first solution is cut off like any other
+        branches = [((), None)]
+        manager = None
+        shared = {}
+        if processes > 1 and len(key) > 1:
+            branches = [(key[:j], key[j]) for j in range(len(key))]
+            manager = multiprocessing.Manager()
+            shared = manager.dict()
+        try:
+            shared[key] = result.objective
+            settings = (first, count, deadline, options['timePerSolution'],
+                        shared)
+            for branch in program_map(
+                    _enumerate_branch,
+                    [(lp, (on, off, settings)) for on, off in branches],
+                    processes):
+                for other, cost, suboptimal in branch:
+                    found[other] = (cost, suboptimal)
+        finally:
+            if manager is not None:
+                manager.shutdown()
+        # branches run side by side can each find a solution before the
+        # other's part of it is shared
+        minimal = [(key, value) for key, value in found.items()
+                   if not any(set(other) < set(key) for other in found)]
+        ranked = sorted(minimal, key=lambda item: (item[1][0],
+                                                   item[0]))[:count]
+        solutions = []
+        for k, (other, (cost, suboptimal)) in enumerate(ranked):
+            gfsolution = self._gapfilling_solution(
+                'sol.%d' % k, cost, growth, [self.uses[i] for i in other])
+            gfsolution['suboptimal'] = int(suboptimal)
+            solutions.append(gfsolution)
+        return solutions, self.problem._solution(result, growth)
+
+    def _gapfilling_solution(self, sol_id, cost, objective, used):
+        # a GapfillingSolution with the (column, direction) pairs used
+        network = self.network
+        ref = self.database.ref
+        reactions = []
+        for col, direction in sorted(used):
+            rxn_id, model_cmp = network.reactions[col].rsplit('_', 1)
+            if col < len(self.model_network.reactions):
+                rxn = self.model['modelreactions'][col]
+                rxn_id = FBA._ref_id(rxn.get('reaction_ref', rxn_id))
+            letter = model_cmp.rstrip('0123456789')
+            reactions.append({
+                'round': 0,
+                'reaction_ref': '%s/reactions/id/%s' % (ref, rxn_id),
+                'compartment_ref': '%s/compartments/id/%s' % (ref, letter),
+                'direction': direction,
+                'compartmentIndex': int(model_cmp[len(letter):] or 0),
+                'candidateFeature_refs': []})
+        return {'id': sol_id,
+                'solutionCost': cost,
+                'biomassRemoval_refs': [],
+                'mediaSupplement_refs': [],
+                'koRestore_refs': [],
+                'integrated': 0,
+                'suboptimal': 0,
+                'objective': objective,
+                'gfscore': 0,
+                'actscore': 0,
+                'rejscore': 0,
+                'candscore': 0,
+                'rejectedCandidates': [],
+                'failedReaction_refs': [],
+                'activatedReactions': [],
+                'gapfillingSolutionReactions': reactions}
+
+    def fba_object(self, solution, solutions, fba_id, model_ref, media_ref):
+        '''
+        Returns the FBA object of a gapfilling, holding its solutions and
+        the fluxes of the model's own reactions and compounds in solution.
+        '''
+        fba = self.problem.fba_object(solution, fba_id, model_ref,
+                                      media_ref)
+        own = self.model_network
+        for key, field, ids in (
+                ('FBAReactionVariables', 'modelreaction_ref',
+                 own.reaction_index),
+                ('FBACompoundVariables', 'modelcompound_ref',
+                 own.compound_index)):
+            fba[key] = [var for var in fba[key]
+                        if FBA._ref_id(var[field]) in ids]
+        fba['fluxMinimization'] = 1
+        fba['numberOfSolutions'] = self.options['num_solutions']
+        fba['gapfillingSolutions'] = solutions
+        fba['parameters'] = {
+            'Perform gap filling': '1',
+            'Balanced reactions in gap filling only':
+                str(1 - int(self.options['allowunbalanced']))}
+        return fba
+
+
+def _use_key(x, first):
+    # the use variables set in solution x, whose first one is column first
+    return tuple(int(i) for i in np.flatnonzero(x[first:] > 0.5))
+
+
+def _enumerate_branch(solver, task):
+    # the (key, cost, suboptimal) of the solutions of a gapfilling program
+    # with use variables that keep the uses on and leave out the use off (if
+    # any), cheapest first; every solution in the shared {key: cost} that
+    # the branch can hold supersets of is cut off, including those found
+    # here. Stops when none is left, time is up, count are found or the next
+    # costs more than count shared
+    on, off, (first, count, deadline, per_solution, shared) = task
+    nuse = solver.A.shape[1] - first
+    solver.set_bounds([first + use for use in on], 1, 1)
+    if off is not None:
+        solver.set_bounds([first + off], 0, 0)
+    cut = set()
+    found = []
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
+        for key in list(shared.keys()):
+            if key in cut or off in key:
+                continue
+            cut.add(key)
+            solver.add_rows(sparse.csr_matrix(
+                (np.ones(len(key)), (np.zeros(len(key), dtype=int),
+                                     [first + use for use in key])),
+                shape=(1, first + nuse)), [-INF], [len(key) - 1])
+        if len(found) >= count:
+            # the branch's own solutions come cheapest first
+            break
+        solver.set_time_limit(min(per_solution, remaining))
+        result = solver.solve()
+        if result.x is None:
+            break
+        costs = sorted(shared.values())
+        if result.optimal and len(costs) >= count and (
+                result.objective > costs[count - 1] + _COST_TOLERANCE *
+                max(1, abs(costs[count - 1]))):
+            break
+        key = _use_key(result.x, first)
+        if key in cut:
+            # a solution that was cut off only comes back within the
+            # solver's tolerances
+            break
+        if any(set(other) < set(key) for other in shared.keys()):
+            # another branch found part of it meanwhile: cut that off first
+            continue
+        found.append((key, result.objective, not result.optimal))
+        if key not in shared:
+            shared[key] = result.objective
+    return found
+
+
+def integrate_solution(model, database, solution):
+    '''
+    Adds the reactions of a GapfillingSolution to model, making the ones it
+    already has reversible, as integrateGapfillSolution. Returns the ids of
+    the reactions added and of those reversed.
+    '''
+    reactions = dict((rxn['id'], rxn) for rxn in
+                     model.setdefault('modelreactions', []))
+    compounds = set(cpd['id'] for cpd in
+                    model.setdefault('modelcompounds', []))
+    compartments = set(cmp['id'] for cmp in
+                       model.setdefault('modelcompartments', []))
+    added = []
+    reversals = []
+    for gfrxn in solution['gapfillingSolutionReactions']:
+        rxn_id = FBA._ref_id(gfrxn['reaction_ref'])
+        letter = FBA._ref_id(gfrxn['compartment_ref'])
+        model_cmp = '%s%d' % (letter, gfrxn['compartmentIndex'])
+        mdl_id = '%s_%s' % (rxn_id, model_cmp)
+        if mdl_id in reactions:
+            if reactions[mdl_id].get('direction') != gfrxn['direction']:
+                reactions[mdl_id]['direction'] = '='
+                reversals.append(mdl_id)
+            continue
+        i = database.reaction_index[rxn_id]
+        reagents = []
+        for row, cmp, coef in database.reagents[i]:
+            cmp_id = '%s%d' % (cmp, gfrxn['compartmentIndex'])
+            if cmp_id not in compartments:
+                compartments.add(cmp_id)
+                model['modelcompartments'].append({
+                    'id': cmp_id,
+                    'compartmentIndex': gfrxn['compartmentIndex'],
+                    'compartment_ref': '%s/compartments/id/%s' % (
+                        database.ref, cmp),
+                    'label': cmp_id, 'pH': 7, 'potential': 0})
+            cpd_id = '%s_%s' % (database.compounds[row], cmp_id)
+            if cpd_id not in compounds:
+                compounds.add(cpd_id)
+                model['modelcompounds'].append({
+                    'id': cpd_id, 'name': database.compound_names[row],
+                    'formula': database.compound_formula[row],
+                    'charge': 0,
+                    'compound_ref': '%s/compounds/id/%s' % (
+                        database.ref, database.compounds[row]),
+                    'modelcompartment_ref': '~/modelcompartments/id/' +
+                                            cmp_id})
+            reagents.append({'modelcompound_ref': '~/modelcompounds/id/' +
+                                                  cpd_id,
+                             'coefficient': coef})
+        reactions[mdl_id] = {
+            'id': mdl_id, 'name': database.reaction_names[i],
+            'reaction_ref': gfrxn['reaction_ref'],
+            'direction': gfrxn['direction'], 'protons': 0,
+            'probability': 0,
+            'modelcompartment_ref': '~/modelcompartments/id/' + model_cmp,
+            'modelReactionReagents': reagents,
+            'modelReactionProteins': []}
+        model['modelreactions'].append(reactions[mdl_id])
+        added.append(mdl_id)
+    solution['integrated'] = 1
+    return added, reversals
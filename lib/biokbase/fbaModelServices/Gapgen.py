@@ -0,0 +1,396 @@
+'''
+In-process gap generation for workspace FBAModel objects.
+
+Gap generation looks for the model reactions, each in one direction, whose
+removal stops a model from growing in a media it should not grow in while
+it keeps growing in a reference media, as GrowMatch does for the
+MFAToolkit. Only reaction removals are tested: they are all the
+GapgenerationSolution objects parseGapgenResults in
+Bio::KBase::ObjectAPI::KBaseFBA::Gapgeneration reports.
+
+A removal on its own can only stop growth if it blocks flux that every
+growing solution needs, so single removals are only looked for among the
+reaction directions that carry flux in the target media solution. Those
+are screened in a pool of processes: first each is solved in the target
+media, and only those that stop growth there are solved in the reference
+media. When they give fewer than num_solutions, combinations are found by
+a MILP over all open reaction directions, with the single removals found
+left out. A binary use variable per direction removes it from a copy of
+the model that has to keep growing in the reference media, and from the
+dual of the target media program, whose objective is held at FBA.NO_GROWTH;
+by weak duality, no flux through what remains can grow above it.
+Alternatives are enumerated with integer cuts until num_solutions are
+found or totalTimeLimit runs out.
+'''
+
+from __future__ import division
+
+import copy
+import time
+
+try:
+    import numpy as np
+    import scipy.sparse as sparse
+except ImportError:
+    np = None
+
+from biokbase.fbaModelServices import FBA
+from biokbase.fbaModelServices.Solver import (INF, LinearProgram, LPSolver,
+                                              solver_map, split)
+
+# gap generation options, as defaulted by _setDefaultGapGenFormulation in
+# the perl implementation except for the hypotheses, which default to the
+# only one the in-process engine tests
+GAPGEN_DEFAULTS = {
+    'formulation': None,
+    'refmedia': 'Carbon-D-Glucose',
+    'refmedia_workspace': 'KBaseMedia',
+    'timePerSolution': 3600,
+    'totalTimeLimit': 18000,
+    'num_solutions': 1,
+    'nomediahyp': 1,
+    'nobiomasshyp': 1,
+    'nogprhyp': 1,
+    'nopathwayhyp': 0
+}
+
+# hypotheses the MFAToolkit can test that need more than removed
+# reactions, with the only setting supported here
+_HYPOTHESES = (('nomediahyp', 1), ('nobiomasshyp', 1), ('nogprhyp', 1),
+               ('nopathwayhyp', 0))
+
+# flux bounds prepareFBAFormulation gives gap generation programs whose
+# formulation sets none
+_FLUX_BOUNDS = {'defaultmaxflux': 100, 'defaultminuptake': -100}
+
+# objective the model has to keep in the reference media, unless it grows
+# less than that without removals
+GAPGEN_GROWTH = 0.1
+
+# bound on the dual values a removal frees in the target media program;
+# removals that need larger ones are not found
+_DUAL_BOUND = 1000
+
+
+def default_gapgen_formulation(formulation=None):
+    '''
+    Returns a copy of a GapgenFormulation with unset defaults, its
+    FBAFormulation included.
+    '''
+    out = copy.deepcopy(GAPGEN_DEFAULTS)
+    for key, value in (formulation or {}).items():
+        if value is not None:
+            out[key] = copy.deepcopy(value)
+    formulation = dict(out['formulation'] or {})
+    for key, value in _FLUX_BOUNDS.items():
+        if formulation.get(key) is None:
+            formulation[key] = value
+    out['formulation'] = FBA.default_formulation(formulation)
+    return out
+
+
+class GapgenProblem(object):
+    '''
+    The gap generation problem for a model, a GapgenFormulation, the Media
+    of its FBAFormulation, in which the model should stop growing, and the
+    reference Media it has to keep growing in.
+    '''
+
+    def __init__(self, network, media=None, refmedia=None, gapgen=None):
+        self.network = network
+        self.options = default_gapgen_formulation(gapgen)
+        for option, value in _HYPOTHESES:
+            if self.options[option] != value:
+                raise ValueError('Gap generation option %s=%s is not ' %
+                                 (option, self.options[option]) +
+                                 'supported by the in-process gap ' +
+                                 'generation engine')
+        self.formulation = self.options['formulation']
+        self.problem = FBA.FBAProblem(network, self.formulation, media)
+        self.reference = FBA.FBAProblem(network, self.formulation, refmedia)
+        if not self.problem.maximize:
+            raise ValueError('Gap generation needs a maximized objective')
+        # singles solved in each media, and combinations looked for
+        self.solved = [0, 0]
+        self.combinations = 0
+
+    def removable(self, col, direction, problem=None):
+        '''
+        Returns the bounds of flux column col with direction removed, or
+        None when the direction is closed or the column's flux is forced
+        into it.
+        '''
+        problem = problem or self.problem
+        lower = problem.lower[col]
+        upper = problem.upper[col]
+        if direction == '>':
+            if upper <= 0 or lower > 0:
+                return None
+            return lower, 0.0
+        if lower >= 0 or upper < 0:
+            return None
+        return 0.0, upper
+
+    def solve(self, processes=1):
+        '''
+        Returns the removals found, as lists of (column, direction) pairs,
+        and the FBASolution of the target media they are found from.
+        Removals come cheapest - fewest directions removed - first, and
+        single removals in decreasing order of the growth they leave in the
+        reference media. No removals are found when the model does not
+        grow in the target media, or can not reach GAPGEN_GROWTH in the
+        reference media.
+        '''
+        solution = self.problem.solve()
+        reference = self.reference.solve()
+        if (not solution.feasible or solution.objective <= FBA.NO_GROWTH or
+                not reference.feasible or
+                reference.objective <= FBA.NO_GROWTH):
+            return [], solution
+        growth = min(GAPGEN_GROWTH, reference.objective)
+        count = int(self.options['num_solutions'])
+        singles, excluded = self._single_removals(solution, growth,
+                                                  processes)
+        removals = [[single] for single in singles[:count]]
+        if len(removals) < count:
+            removals.extend(self._combinations(growth, excluded,
+                                               count - len(removals)))
+        return removals, solution
+
+    def _single_removals(self, solution, growth, processes):
+        # the directions carrying flux in solution whose removal alone stops
+        # growth in the target media and keeps growth in the reference
+        # media, and those that can take part in no removal
+        nrxn = len(self.network.reactions)
+        x = solution.x[:nrxn]
+        tasks = []
+        for col in np.flatnonzero(np.abs(x) > FBA.ZERO_FLUX):
+            direction = '>' if x[col] > 0 else '<'
+            bounds = self.removable(col, direction)
+            if bounds is not None:
+                tasks.append(((col, direction), [col]) + bounds)
+        stopped = [key for key, objective in
+                   self._removal_growth(self.problem, tasks, processes)
+                   if objective <= FBA.NO_GROWTH]
+        self.solved[0] = len(tasks)
+        tasks = []
+        for col, direction in stopped:
+            bounds = self.removable(col, direction, self.reference)
+            if bounds is None:
+                # closed in the reference media, where its removal changes
+                # nothing
+                bounds = (self.reference.lower[col],
+                          self.reference.upper[col])
+            tasks.append(((col, direction), [col]) + bounds)
+        growing = dict(self._removal_growth(self.reference, tasks,
+                                            processes))
+        self.solved[1] = len(tasks)
+        singles = sorted((key for key in stopped if growing[key] >= growth),
+                         key=lambda key: (-growing[key], key))
+        # a removal that stops the reference media growing does so in any
+        # combination
+        excluded = set(stopped)
+        return singles, excluded
+
+    def _removal_growth(self, problem, tasks, processes):
+        # the (key, objective) of problem with each (key, columns, lower,
+        # upper) removal applied, over processes worker processes
+        out = []
+        for chunk in solver_map(problem.lp, _removal_chunk,
+                                split(sorted(tasks), 4 * processes),
+                                processes):
+            out.extend(chunk)
+        return out
+
+    def program(self, growth, excluded=()):
+        '''
+        Returns the gap generation MILP over the open reaction directions
+        not in excluded, and those directions in the order of its use
+        variables, which are its last columns. The program minimizes the
+        number of directions removed, keeping growth in the reference media
+        and holding the dual of the target media program at FBA.NO_GROWTH.
+        '''
+        nrxn = len(self.network.reactions)
+        uses = [(col, direction) for col in range(nrxn)
+                for direction in ('>', '<')
+                if (col, direction) not in excluded and
+                self.removable(col, direction) is not None]
+        forward = np.array([col for col, direction in uses
+                            if direction == '>'], dtype=int)
+        reverse = np.array([col for col, direction in uses
+                            if direction == '<'], dtype=int)
+        uses = ([(col, '>') for col in forward] +
+                [(col, '<') for col in reverse])
+        nuse = len(uses)
+        nfor = len(forward)
+
+        # the reference media program, unchanged
+        ref = self.reference.lp
+        nref = ref.shape[1]
+        # the dual of the target media program: row duals split into the
+        # parts for their upper and lower bounds, column duals likewise,
+        # and the column duals a removal frees at no cost
+        target = self.problem.lp
+        nrow, ncol = target.shape
+        dual_c = np.concatenate([target.row_upper, -target.row_lower,
+                                 target.upper, -target.lower])
+        dual_upper = np.where(np.isfinite(dual_c), INF, 0)
+        dual_c[~np.isfinite(dual_c)] = 0
+        ndual = len(dual_c) + nuse
+        free = sparse.csc_matrix(
+            (np.concatenate([np.ones(nfor), -np.ones(nuse - nfor)]),
+             (np.concatenate([forward, reverse]), np.arange(nuse))),
+            shape=(ncol, nuse))
+        eye = sparse.identity(ncol, format='csc')
+        dual_rows = sparse.hstack([target.A.T, -target.A.T, eye, -eye, free],
+                                  format='csc')
+
+        first = nref + ndual
+        ncols = first + nuse
+        c = np.zeros(ncols)
+        c[first:] = 1
+        lower = np.concatenate([ref.lower, np.zeros(ndual + nuse)])
+        upper = np.concatenate([ref.upper, dual_upper,
+                                np.full(nuse, _DUAL_BOUND), np.ones(nuse)])
+
+        # each freed dual is 0 unless its direction is removed, and each
+        # removed direction carries no flux in the reference media
+        rows = np.arange(nuse)
+        limits = np.array([ref.upper[col] for col in forward] +
+                          [-ref.lower[col] for col in reverse])
+        limits[~np.isfinite(limits)] = self.formulation['defaultmaxflux']
+        sign = np.concatenate([np.ones(nfor), -np.ones(nuse - nfor)])
+        links = sparse.csc_matrix(
+            (np.concatenate([np.ones(nuse), np.full(nuse, -_DUAL_BOUND),
+                             sign, limits]),
+             (np.concatenate([rows, rows, nuse + rows, nuse + rows]),
+              np.concatenate([nref + ndual - nuse + rows, first + rows,
+                              np.concatenate([forward, reverse]),
+                              first + rows]))),
+            shape=(2 * nuse, ncols))
+        objectives = np.zeros((2, ncols))
+        objectives[0, :nref] = ref.c
+        objectives[1, nref:nref + len(dual_c)] = dual_c
+        A = sparse.vstack([
+            sparse.hstack([ref.A, sparse.csc_matrix((ref.shape[0],
+                                                     ndual + nuse))]),
+            sparse.csr_matrix(objectives[:1]),
+            sparse.hstack([sparse.csc_matrix((ncol, nref)), dual_rows,
+                           sparse.csc_matrix((ncol, nuse))]),
+            sparse.csr_matrix(objectives[1:]),
+            links], format='csc')
+        row_lower = np.concatenate([
+            ref.row_lower, [growth], target.c, [-INF],
+            np.full(nuse, -INF), np.full(nuse, -INF)])
+        row_upper = np.concatenate([
+            ref.row_upper, [INF], target.c, [FBA.NO_GROWTH],
+            np.zeros(nuse), limits])
+        integrality = np.zeros(ncols)
+        integrality[first:] = 1
+        return LinearProgram(c, A, row_lower, row_upper, lower, upper,
+                             False, integrality=integrality), uses
+
+    def _combinations(self, growth, excluded, count):
+        # up to count removals of more than one direction from the MILP,
+        # cheapest first
+        options = self.options
+        deadline = time.time() + options['totalTimeLimit']
+        lp, uses = self.program(growth, excluded)
+        first = lp.shape[1] - len(uses)
+        solver = LPSolver(lp)
+        removals = []
+        while len(removals) < count:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            solver.set_time_limit(min(options['timePerSolution'], remaining))
+            result = solver.solve()
+            self.combinations += 1
+            if result.x is None:
+                break
+            used = np.flatnonzero(result.x[first:] > 0.5)
+            if not len(used):
+                break
+            removals.append(sorted(uses[i] for i in used))
+            # the removal found and every one containing it are cut off
+            solver.add_rows(sparse.csr_matrix(
+                (np.ones(len(used)), (np.zeros(len(used), dtype=int),
+                                      first + used)),
+                shape=(1, lp.shape[1])), [-INF], [len(used) - 1])
+        return removals
+
+    def gapgen_object(self, gg_id, removals, fba_ref, model_ref, media_ref,
+                      refmedia_ref):
+        '''
+        Returns the KBaseFBA.Gapgeneration object of the removals found,
+        for saving to the workspace.
+        '''
+        network = self.network
+        options = self.options
+        solutions = []
+        for i, removal in enumerate(removals):
+            solutions.append({
+                'id': '%s.ggsol.%d' % (gg_id, i + 1),
+                'solutionCost': len(removal),
+                'biomassSuppplement_refs': [],
+                'mediaRemoval_refs': [],
+                'additionalKO_refs': [],
+                'integrated': 0,
+                'suboptimal': 0,
+                'gapgenSolutionReactions': [
+                    {'modelreaction_ref': '%s/modelreactions/id/%s' % (
+                        model_ref, network.reactions[col]),
+                     'direction': direction}
+                    for col, direction in removal]})
+        return {'id': gg_id,
+                'fba_ref': fba_ref,
+                'fbamodel_ref': model_ref,
+                'mediaHypothesis': 1 - int(options['nomediahyp']),
+                'biomassHypothesis': 1 - int(options['nobiomasshyp']),
+                'gprHypothesis': 1 - int(options['nogprhyp']),
+                'reactionRemovalHypothesis':
+                    1 - int(options['nopathwayhyp']),
+                'media_ref': media_ref,
+                'referenceMedia_ref': refmedia_ref,
+                'timePerSolution': int(options['timePerSolution']),
+                'totalTimeLimit': int(options['totalTimeLimit']),
+                'gapgenSolutions': solutions}
+
+
+def _removal_chunk(solver, tasks):
+    # solves each (key, columns, lower, upper) removal with the columns'
+    # bounds narrowed to lower and upper, then restores them. A removal
+    # that leaves no solution does not grow.
+    out = []
+    for key, cols, lower, upper in tasks:
+        saved = (solver.lower[cols], solver.upper[cols])
+        solver.set_bounds(cols, lower, upper)
+        result = solver.solve()
+        solver.set_bounds(cols, *saved)
+        out.append((key, result.objective if result.optimal else 0.0))
+    return out
+
+
+def integrate_solution(model, solution):
+    '''
+    Removes the reaction directions of a GapgenerationSolution from model,
+    as integrateGapgenSolution: a reaction running only in the removed
+    direction is removed, and a reversible one keeps the other direction.
+    Returns the ids of the reactions removed and of those narrowed.
+    '''
+    reactions = dict((rxn['id'], rxn) for rxn in
+                     model.get('modelreactions', []))
+    removed = []
+    narrowed = []
+    for ggrxn in solution['gapgenSolutionReactions']:
+        rxn = reactions[FBA._ref_id(ggrxn['modelreaction_ref'])]
+        direction = ggrxn['direction']
+        if rxn.get('direction', '=') == direction:
+            removed.append(rxn['id'])
+        else:
+            rxn['direction'] = '<' if direction == '>' else '>'
+            narrowed.append(rxn['id'])
+    model['modelreactions'] = [rxn for rxn in model.get('modelreactions',
+                                                        [])
+                               if rxn['id'] not in set(removed)]
+    return removed, narrowed
@@ -0,0 +1,96 @@
+'''
+Worker-level cache of compiled FBAModel networks.
+
+Compiling an FBAModel into a ModelNetwork - the sparse stoichiometric matrix,
+flux limits, index maps, gene rules and the reduction that drops blocked
+reactions and lumps linear pathways - costs far more than applying a
+formulation to it, so networks are kept between calls. Entries are keyed by
+the model's workspace reference (ws/obj/version) and the version of the
+biochemistry its compounds come from, so saving a new model version or
+updating an unversioned biochemistry reference compiles a new network.
+The cache is an LRU bounded by the approximate memory the networks hold.
+'''
+
+import threading
+from collections import OrderedDict
+
+from biokbase.fbaModelServices.FBA import ModelNetwork
+
+
+def _versioned(ref):
+    parts = ref.split('/')
+    return len(parts) == 3 and all(p.isdigit() for p in parts)
+
+
+class ModelCache(object):
+
+    def __init__(self, max_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = OrderedDict()
+        # {model ref: biochemistry ref as written in the model}, for the
+        # models with a network in the cache
+        self._biochemistry = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_ref, load_model, resolve_ref=None):
+        '''
+        Returns the ModelNetwork for the model at workspace reference
+        model_ref (ws/obj/version). load_model() must return the FBAModel
+        object data and is only called on a miss. resolve_ref(ref) must
+        return the ws/obj/version reference of the latest version of an
+        object; it is used when the model refers to its biochemistry without
+        a version.
+        '''
+        with self._lock:
+            biochem = self._biochemistry.get(model_ref)
+        if biochem is not None:
+            key = (model_ref, self._biochemistry_version(biochem,
+                                                         resolve_ref))
+            with self._lock:
+                network = self._cache.pop(key, None)
+                if network is not None:
+                    self._cache[key] = network
+                    self.hits += 1
+                    return network
+        with self._lock:
+            self.misses += 1
+        network = ModelNetwork(load_model())
+        biochem = network.biochemistry_ref or ''
+        key = (model_ref, self._biochemistry_version(biochem, resolve_ref))
+        self._store(key, network, biochem)
+        return network
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions,
+                    'size': len(self._cache), 'bytes': self.bytes}
+
+    def _biochemistry_version(self, ref, resolve_ref):
+        if not ref or _versioned(ref) or resolve_ref is None:
+            return ref
+        return resolve_ref(ref)
+
+    def _store(self, key, network, biochem):
+        if network.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self.bytes -= old.nbytes
+            self._cache[key] = network
+            self._biochemistry[key[0]] = biochem
+            self.bytes += network.nbytes
+            while self.bytes > self.max_bytes:
+                evicted_key, evicted = self._cache.popitem(last=False)
+                self.bytes -= evicted.nbytes
+                self.evictions += 1
+                # a network compiled against another biochemistry version
+                # may still be cached for the model
+                if not any(cached[0] == evicted_key[0]
+                           for cached in self._cache):
+                    del self._biochemistry[evicted_key[0]]
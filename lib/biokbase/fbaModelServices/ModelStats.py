@@ -0,0 +1,203 @@
+'''
+Statistics of an FBAModel and its genome, as reported by generate_model_stats.
+
+This follows compute_model_stats in Bio::KBase::ObjectAPI::KBaseFBA::FBAModel.
+Reactions are classified as blocked, essential or variable in complete and in
+minimal media with FBAProblem.consistency instead of flux variability
+analysis, which takes a few dozen solves per media rather than two per
+reaction.
+'''
+
+import re
+
+from biokbase.fbaModelServices import FBA
+
+# the formulation compute_model_stats runs, as set by build_model_fba; the
+# objective is the model's biomass reaction (see stats_formulation)
+STATS_FORMULATION = {
+    'objfraction': 0.1,
+    'defaultmaxflux': 100,
+    'defaultminuptake': -100,
+    'defaultmaxuptake': 0
+}
+
+_ROLE_SEPARATOR = re.compile(r'\s*;\s+|\s+[@/]\s+')
+_EC_NUMBER = re.compile(r'[\d\-]+\.[\d\-]+\.[\d\-]+\.[\d\-]+')
+
+_SUBSYSTEM_COUNTS = ('genes', 'reactions', 'model_genes',
+                     'minimal_essential_genes', 'complete_essential_genes',
+                     'minimal_essential_reactions',
+                     'complete_essential_reactions',
+                     'minimal_blocked_reactions',
+                     'complete_blocked_reactions',
+                     'minimal_variable_reactions',
+                     'complete_variable_reactions')
+
+_MODEL_COUNTS = ('transport_reactions', 'subsystem_reactions',
+                 'spontaneous_reactions', 'reactions_with_genes',
+                 'gapfilled_reactions', 'growth_complete_media',
+                 'growth_minimal_media') + _SUBSYSTEM_COUNTS[3:]
+
+
+def search_role(role):
+    '''Returns the name a role is matched by, as convertRoleToSearchRole.'''
+    role = _EC_NUMBER.sub('', role.lower())
+    role = re.sub(r'\s', '', role)
+    return re.sub(r'#.*$', '', role)
+
+
+def feature_roles(function):
+    '''Returns the roles of a feature's function, as _functionparse.'''
+    if not function:
+        return []
+    return _ROLE_SEPARATOR.split(function.split('#')[0].rstrip())
+
+
+def gene_subsystems(genome, mapping):
+    '''
+    Returns {feature id: {subsystem name: subsystem}} for the features of
+    genome with a role in one of the subsystems of mapping, leaving out
+    experimental and clustering based subsystems, as gene_subsystem_hash.
+    '''
+    if not mapping:
+        return {}
+    names = dict((role['id'], role.get('name', role['id']))
+                 for role in mapping.get('roles', []))
+    roles = {}
+    for ss in mapping.get('subsystems', []):
+        ss_class = ss.get('class', '')
+        if 'Experimental' in ss_class or 'Clustering' in ss_class:
+            continue
+        for ref in ss.get('role_refs', []):
+            role_id = ref.split('/')[-1]
+            roles.setdefault(search_role(names.get(role_id, role_id)),
+                             {})[ss.get('name', ss['id'])] = ss
+    genes = {}
+    for ftr in genome.get('features', []):
+        for role in feature_roles(ftr.get('function')):
+            for name, ss in roles.get(search_role(role), {}).items():
+                genes.setdefault(ftr['id'], {})[name] = ss
+    return genes
+
+
+def stats_formulation(network):
+    '''
+    Returns STATS_FORMULATION with the first biomass reaction of network as
+    its objective, or None for a network without biomass, which can not
+    grow.
+    '''
+    if not network.biomasses:
+        return None
+    formulation = dict(STATS_FORMULATION)
+    formulation['objectiveTerms'] = [[1, 'biomassflux',
+                                      network.biomasses[0]]]
+    return formulation
+
+
+def model_statistics(network, model, genome, mapping, complete_media,
+                     minimal_media, processes=1):
+    '''
+    Returns the model_statistics of model, compiled into network, and the
+    number of programs solved for them. genome is the model's Genome and
+    mapping the Mapping of its template, or None; complete_media and
+    minimal_media are the Media objects growth is tested in, None standing
+    for complete media.
+    '''
+    genes_subsystems = gene_subsystems(genome, mapping)
+    subsystems = {}
+
+    def subsystem(ss):
+        name = ss.get('name', ss['id'])
+        if name not in subsystems:
+            subsystems[name] = dict((count, 0) for count in
+                                    _SUBSYSTEM_COUNTS)
+            subsystems[name].update({'name': name,
+                                     'class': ss.get('class', ''),
+                                     'subclass': ss.get('subclass', '')})
+        return subsystems[name]
+
+    output = dict((count, 0) for count in _MODEL_COUNTS)
+    output['total_genes'] = len(genome.get('features', []))
+    output['subsystem_genes'] = 0
+    for gene in sorted(genes_subsystems):
+        output['subsystem_genes'] += 1
+        for ss in genes_subsystems[gene].values():
+            subsystem(ss)['genes'] += 1
+
+    reactions = model.get('modelreactions', [])
+    compartment = dict((cpd['id'], cpd.get('modelcompartment_ref'))
+                       for cpd in model.get('modelcompounds', []))
+    output['total_reactions'] = len(reactions)
+    output['total_compounds'] = len(network.compounds)
+    output['extracellular_compounds'] = network.compound_compartment.count(
+        'e')
+    output['intracellular_compounds'] = (output['total_compounds'] -
+                                         output['extracellular_compounds'])
+    # {reaction column: [subsystem statistics]}
+    reaction_subsystems = {}
+    model_genes = set()
+    for col, rxn in enumerate(reactions):
+        if len(set(compartment.get(rgt['modelcompound_ref'].split('/')[-1])
+                   for rgt in rxn.get('modelReactionReagents', []))) > 1:
+            output['transport_reactions'] += 1
+        proteins = rxn.get('modelReactionProteins', [])
+        genes = set(ref.split('/')[-1] for protein in proteins
+                    for subunit in protein.get(
+                        'modelReactionProteinSubunits', [])
+                    for ref in subunit.get('feature_refs', []))
+        model_genes.update(genes)
+        found = {}
+        for gene in genes:
+            found.update(genes_subsystems.get(gene, {}))
+        if found:
+            output['subsystem_reactions'] += 1
+            reaction_subsystems[col] = [subsystem(ss)
+                                        for ss in found.values()]
+            for entry in reaction_subsystems[col]:
+                entry['reactions'] += 1
+        if genes:
+            output['reactions_with_genes'] += 1
+        elif any(protein.get('note') == 'spontaneous'
+                 for protein in proteins):
+            output['spontaneous_reactions'] += 1
+        else:
+            output['gapfilled_reactions'] += 1
+    for gene in model_genes:
+        for ss in genes_subsystems.get(gene, {}).values():
+            subsystem(ss)['model_genes'] += 1
+    output['model_genes'] = len(model_genes)
+
+    # a model that does not grow in complete media does not grow in
+    # minimal media either; all its reactions count as blocked in both
+    solved = 0
+    formulation = stats_formulation(network)
+    # [(media prefix, blocked, essential, variable reaction columns)]
+    classes = []
+    media = (('complete', complete_media), ('minimal', minimal_media))
+    for i, (prefix, medium) in enumerate(media):
+        solution = None
+        if formulation is not None:
+            problem = FBA.FBAProblem(network, formulation, medium)
+            solution = problem.solve()
+            solved += 1
+        if (solution is None or not solution.feasible or
+                solution.objective <= FBA.NO_GROWTH):
+            for later, _ in media[i:]:
+                classes.append((later, range(len(reactions)), (), ()))
+            break
+        output['growth_%s_media' % prefix] = 1
+        blocked, essential, count = problem.consistency(solution, processes)
+        solved += count
+        variable = sorted(set(range(len(reactions))) - set(blocked.tolist()) -
+                          set(essential.tolist()))
+        classes.append((prefix, blocked, essential, variable))
+    for prefix, blocked, essential, variable in classes:
+        for kind, cols in (('blocked', blocked), ('essential', essential),
+                           ('variable', variable)):
+            key = '%s_%s_reactions' % (prefix, kind)
+            output[key] = len(cols)
+            for col in cols:
+                for entry in reaction_subsystems.get(col, ()):
+                    entry[key] += 1
+    output['subsystems'] = [subsystems[name] for name in sorted(subsystems)]
+    return output, solved
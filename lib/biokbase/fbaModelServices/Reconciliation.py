@@ -0,0 +1,420 @@
+'''
+In-process phenotype reconciliation of workspace FBAModel objects.
+
+The perl implementation reconciles a model with a PhenotypeSet in separately
+queued jobs - wildtype phenotype reconciliation, reconciliation sensitivity
+analysis, solution combination and solution integration - each of which
+loads the model, the phenotype set and the solutions of the jobs before it
+again. A ReconciliationPipeline runs them as the stages of one call,
+holding the compiled ModelNetwork, the phenotype media and the simulations
+in memory from one stage to the next:
+
+simulate -- the PhenotypeSimulations of the model.
+reconcile -- one gapfilling per false negative and one gap generation per
+    false positive, each in its phenotype's media, additional compounds and
+    knockouts. They are solved in a pool of processes, each of which is
+    sent the network, model and reaction database once.
+analyse -- each solution is simulated against the whole phenotype set,
+    gapfilling solutions on a network compiled from the model with the
+    solution integrated, gap generation solutions as flux bounds on the
+    model's own network.
+combine -- solutions are picked greedily, the one correcting the most
+    phenotypes first, as long as they correct a phenotype not corrected
+    yet and make no correct prediction wrong.
+integrate -- the picked solutions are integrated into a copy of the model,
+    which is simulated once more.
+
+The simulations, the solutions and their simulations are checkpointed as
+gzipped JSON, keyed by the model, phenotype set and options, so that a
+pipeline run again - to carry on to later stages, or after a failure -
+starts after the last stage it completed.
+'''
+
+from __future__ import division
+
+import copy
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from biokbase.fbaModelServices import Curation
+from biokbase.fbaModelServices import FBA
+from biokbase.fbaModelServices import Gapfill
+from biokbase.fbaModelServices import Gapgen
+from biokbase.fbaModelServices.Solver import shared_map
+
+# the study that reconciles each wrong phenoclass
+_RECONCILED = {'FN': 'gapfill', 'FP': 'gapgen'}
+
+_RIGHT = ('CP', 'CN')
+_WRONG = ('FP', 'FN')
+
+# a solution given as the indexes of its study and of itself
+_INDEXED_SOLUTION = re.compile(r'(\d+)/(\d+)$')
+
+
+def phenoclass_counts(simulations):
+    '''
+    Returns the number of PhenotypeSimulations in each phenoclass (CP, CN,
+    FP and FN).
+    '''
+    counts = dict((phenoclass, 0) for phenoclass in _RIGHT + _WRONG)
+    for sim in simulations:
+        if sim['phenoclass'] in counts:
+            counts[sim['phenoclass']] += 1
+    return counts
+
+
+def solution_studies(studies, solution_ids):
+    '''
+    Returns the (study index, solution id or index) of each of solution_ids,
+    the solutions of a model's gapfillings or gapgens (studies), given by id
+    (STUDYID.gfsol.NUMBER or STUDYID.ggsol.NUMBER) or, as in the perl
+    implementation, as STUDY/SOLUTION indexes.
+    '''
+    out = []
+    for sol_id in solution_ids:
+        match = _INDEXED_SOLUTION.match(sol_id)
+        if match is not None:
+            study, solution = int(match.group(1)), int(match.group(2))
+        else:
+            found = [i for i, study in enumerate(studies)
+                     if sol_id.startswith(study['id'] + '.')]
+            if not found:
+                raise ValueError('Solution %s is not a solution of any ' %
+                                 sol_id + 'study of the model')
+            study = max(found, key=lambda i: len(studies[i]['id']))
+            solution = sol_id
+        if study >= len(studies):
+            raise ValueError('Solution %s is not a solution of any ' %
+                             sol_id + 'study of the model')
+        out.append((study, solution))
+    return out
+
+
+def find_solution(solutions, solution):
+    '''
+    Returns the solution with the id, or at the index, solution.
+    '''
+    if isinstance(solution, int):
+        if solution < len(solutions):
+            return solutions[solution]
+    else:
+        for candidate in solutions:
+            if candidate['id'] == solution:
+                return candidate
+    raise ValueError('Solution %s not found' % solution)
+
+
+def integrate_solutions(model, network, database, gapfill_solutions,
+                        gapgen_solutions):
+    '''
+    Integrates GapfillingSolutions and GapgenerationSolutions into model,
+    compiled into network. The gapfilling solutions go in first; the
+    reaction directions the gap generation solutions remove are then
+    deleted together, so that removals of the same reaction combine. The
+    solutions are marked as integrated.
+    '''
+    for solution in gapfill_solutions:
+        Gapfill.integrate_solution(model, database, solution)
+    deletions = Curation.ModelDeletions(network)
+    for solution in gapgen_solutions:
+        for ggrxn in solution['gapgenSolutionReactions']:
+            deletions.add(FBA._ref_id(ggrxn['modelreaction_ref']),
+                          ggrxn['direction'])
+        solution['integrated'] = 1
+    deletions.apply(model)
+
+
+class ReconciliationPipeline(object):
+    '''
+    The reconciliation of a model with a PhenotypeSet. media maps the
+    media_ref of each phenotype to its Media object; refmedia is the Media
+    gap generation keeps the model growing in. Objects made for a
+    phenotype are named after prefix and the phenotype's id.
+    '''
+
+    def __init__(self, network, model, model_ref, phenotype_set,
+                 phenotypeset_ref, media, database, formulation=None,
+                 gapfill=None, gapgen=None, refmedia=None,
+                 refmedia_ref=None, prefix=None, directory=None):
+        self.network = network
+        self.model = model
+        self.model_ref = model_ref
+        self.phenotype_set = phenotype_set
+        self.phenotypeset_ref = phenotypeset_ref
+        self.media = media
+        self.database = database
+        self.formulation = FBA.default_formulation(formulation)
+        self.gapfill = Gapfill.default_gapfill_formulation(gapfill)
+        gapgen = dict(gapgen or {})
+        if not gapgen.get('formulation'):
+            gapgen['formulation'] = self.formulation
+        self.gapgen = Gapgen.default_gapgen_formulation(gapgen)
+        self.refmedia = refmedia
+        self.refmedia_ref = refmedia_ref
+        self.prefix = prefix or model.get('id', 'model')
+
+        # stage results: PhenotypeSimulations of the model, a record per
+        # reconciled phenotype, and {solution id: (phenotype simulations,
+        # phenotypes corrected, phenotypes made wrong)}
+        self.simulations = None
+        self.records = None
+        self.sensitivity = {}
+
+        if directory is None:
+            directory = os.path.join(tempfile.gettempdir(), 'Reconciliation')
+        options = [self.formulation, self.gapfill, self.gapgen,
+                   refmedia_ref, database.ref]
+        digest = hashlib.sha1(json.dumps(
+            options, sort_keys=True).encode('utf-8')).hexdigest()
+        self.path = os.path.join(directory, '%s_%s_%s.json.gz' % (
+            model_ref.replace('/', '_'),
+            phenotypeset_ref.replace('/', '_'), digest))
+        self.resumed = self._load()
+
+    def _load(self):
+        # the stage results of an earlier run, if it left a checkpoint
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with gzip.open(self.path, 'rb') as f:
+                data = json.loads(f.read().decode('utf-8'))
+            self.simulations = data['simulations']
+            self.records = data['records']
+            self.sensitivity = dict((sol_id, tuple(effect)) for
+                                    sol_id, effect in
+                                    data['sensitivity'].items())
+        except (IOError, ValueError, KeyError):
+            return False
+        return True
+
+    def _checkpoint(self):
+        # written under a temporary name and renamed, so that a pipeline
+        # never resumes from a checkpoint another is still writing
+        directory = os.path.dirname(self.path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        os.close(fd)
+        with gzip.open(tmp, 'wb') as f:
+            f.write(json.dumps({'simulations': self.simulations,
+                                'records': self.records,
+                                'sensitivity': self.sensitivity},
+                               separators=(',', ':')).encode('utf-8'))
+        os.rename(tmp, self.path)
+
+    def _shared(self):
+        # the state every worker process of a stage is sent once
+        return {'network': self.network, 'model': self.model,
+                'model_ref': self.model_ref, 'database': self.database,
+                'phenotype_set': self.phenotype_set,
+                'phenotypeset_ref': self.phenotypeset_ref,
+                'media': self.media, 'formulation': self.formulation,
+                'gapfill': self.gapfill, 'gapgen': self.gapgen,
+                'refmedia': self.refmedia, 'refmedia_ref': self.refmedia_ref,
+                'prefix': self.prefix}
+
+    def simulate(self, processes=1):
+        '''Returns the PhenotypeSimulations of the model.'''
+        if self.simulations is None:
+            self.simulations = FBA.simulate_phenotypes(
+                self.network, self.formulation, self.phenotype_set,
+                self.phenotypeset_ref, self.media, processes)
+            self._checkpoint()
+        return self.simulations
+
+    def reconcile(self, processes=1):
+        '''
+        Returns a record per mispredicted phenotype: its index, the type
+        ('gapfill' or 'gapgen') and id of the study reconciling it, and the
+        FBA object and, for gap generation, the Gapgeneration object
+        holding its solutions, both None when none was found.
+        '''
+        if self.records is None:
+            tasks = []
+            for index, sim in enumerate(self.simulate(processes)):
+                if sim['phenoclass'] in _RECONCILED:
+                    tasks.append((_RECONCILED[sim['phenoclass']], index))
+            self.records = shared_map(_reconcile_task, self._shared(),
+                                      tasks, processes)
+            self._checkpoint()
+        return self.records
+
+    def solutions(self, processes=1, selected=None):
+        '''
+        Returns the (record, solution) of every solution found, or of the
+        studies and solutions whose ids are in selected, by solution id.
+        '''
+        out = {}
+        for record in self.reconcile(processes):
+            for solution in _record_solutions(record):
+                if (selected is None or record['id'] in selected or
+                        solution['id'] in selected):
+                    out[solution['id']] = (record, solution)
+        return out
+
+    def analyse(self, processes=1, selected=None):
+        '''
+        Simulates the phenotype set with each solution, and returns the
+        simulations, as (simulatedGrowth, simulatedGrowthFraction,
+        phenoclass), the phenotypes corrected and those made wrong, by
+        solution id. Solutions simulated by an earlier run are not
+        simulated again.
+        '''
+        solutions = self.solutions(processes, selected)
+        ids = sorted(sol_id for sol_id in solutions
+                     if sol_id not in self.sensitivity)
+        if ids:
+            tasks = [(solutions[sol_id][0]['type'], solutions[sol_id][1])
+                     for sol_id in ids]
+            wildtype = [sim['phenoclass'] for sim in self.simulations]
+            for sol_id, simulations in zip(ids, shared_map(
+                    _sensitivity_task, self._shared(), tasks, processes)):
+                classes = [sim[2] for sim in simulations]
+                self.sensitivity[sol_id] = (
+                    simulations,
+                    [i for i, (before, after) in
+                     enumerate(zip(wildtype, classes))
+                     if before in _WRONG and after in _RIGHT],
+                    [i for i, (before, after) in
+                     enumerate(zip(wildtype, classes))
+                     if before in _RIGHT and after in _WRONG])
+            self._checkpoint()
+        return dict((sol_id, self.sensitivity[sol_id])
+                    for sol_id in solutions)
+
+    def combine(self, processes=1, selected=None):
+        '''
+        Returns the ids of the solutions picked to be integrated together:
+        those that correct the most phenotypes first, then the cheapest,
+        skipping any that correct no phenotype not corrected already or
+        make a correct prediction wrong.
+        '''
+        solutions = self.solutions(processes, selected)
+        effects = self.analyse(processes, selected)
+        order = sorted(solutions, key=lambda sol_id: (
+            -len(effects[sol_id][1]),
+            solutions[sol_id][1]['solutionCost'], sol_id))
+        chosen = []
+        corrected = set()
+        for sol_id in order:
+            _, fixed, broken = effects[sol_id]
+            if broken or corrected.issuperset(fixed):
+                continue
+            chosen.append(sol_id)
+            corrected.update(fixed)
+        return chosen
+
+    def integrate(self, solution_ids, processes=1):
+        '''
+        Returns a copy of the model with the solutions integrated, as
+        integrate_solutions, and its PhenotypeSimulations.
+        '''
+        solutions = self.solutions(processes)
+        model = copy.deepcopy(self.model)
+        picked = dict((kind, [solutions[sol_id][1]
+                              for sol_id in solution_ids
+                              if solutions[sol_id][0]['type'] == kind])
+                      for kind in ('gapfill', 'gapgen'))
+        integrate_solutions(model, self.network, self.database,
+                            picked['gapfill'], picked['gapgen'])
+        simulations = FBA.simulate_phenotypes(
+            FBA.ModelNetwork(model), self.formulation, self.phenotype_set,
+            self.phenotypeset_ref, self.media, processes)
+        return model, simulations
+
+
+def _record_solutions(record):
+    # the GapfillingSolutions or GapgenerationSolutions of a study
+    if record['fba'] is None:
+        return []
+    if record['type'] == 'gapfill':
+        return record['fba']['gapfillingSolutions']
+    return record['gapgen']['gapgenSolutions']
+
+
+def _phenotype_conditions(shared, index, formulation):
+    # the phenotype at index, and the formulation and media it grows in
+    pheno = shared['phenotype_set']['phenotypes'][index]
+    formulation = copy.deepcopy(formulation)
+    formulation['geneko'] = formulation['geneko'] + [
+        FBA._ref_id(ref) for ref in pheno.get('geneko_refs', [])]
+    media = shared['media'][pheno['media_ref']]
+    if pheno.get('additionalcompound_refs'):
+        media = FBA._temporary_media(media, pheno['additionalcompound_refs'])
+    return pheno, formulation, media
+
+
+def _reconcile_task(shared, task):
+    # gapfills or gap generates the phenotype at index, in the worker's
+    # process only
+    kind, index = task
+    model_ref = shared['model_ref']
+    if kind == 'gapfill':
+        pheno, formulation, media = _phenotype_conditions(
+            shared, index, shared['formulation'])
+        problem = Gapfill.GapfillProblem(
+            shared['network'], shared['model'], shared['database'],
+            formulation, media, shared['gapfill'])
+        solutions, solution = problem.solve()
+        record = {'id': '%s.%s.gffba' % (shared['prefix'], pheno['id']),
+                  'type': kind, 'phenotype': index,
+                  'media_ref': pheno['media_ref'], 'fba': None,
+                  'gapgen': None}
+        if solutions:
+            for i, gfsol in enumerate(solutions):
+                gfsol['id'] = '%s.gfsol.%d' % (record['id'], i + 1)
+            record['fba'] = problem.fba_object(solution, solutions,
+                                               record['id'], model_ref,
+                                               pheno['media_ref'])
+        return record
+    gapgen = dict(shared['gapgen'])
+    pheno, gapgen['formulation'], media = _phenotype_conditions(
+        shared, index, gapgen['formulation'])
+    problem = Gapgen.GapgenProblem(shared['network'], media,
+                                   shared['refmedia'], gapgen)
+    removals, solution = problem.solve()
+    record = {'id': '%s.%s.gg' % (shared['prefix'], pheno['id']),
+              'type': kind, 'phenotype': index,
+              'media_ref': pheno['media_ref'], 'fba': None, 'gapgen': None}
+    if removals:
+        record['fba'] = problem.problem.fba_object(
+            solution, record['id'] + '.ggfba', model_ref,
+            pheno['media_ref'])
+        record['gapgen'] = problem.gapgen_object(
+            record['id'], removals, None, model_ref, pheno['media_ref'],
+            shared['refmedia_ref'])
+    return record
+
+
+def _sensitivity_task(shared, task):
+    # the phenotype simulations of the model with one solution
+    kind, solution = task
+    network = shared['network']
+    formulation = shared['formulation']
+    if kind == 'gapfill':
+        model = copy.deepcopy(shared['model'])
+        Gapfill.integrate_solution(model, shared['database'],
+                                   copy.deepcopy(solution))
+        network = FBA.ModelNetwork(model)
+    else:
+        deletions = Curation.ModelDeletions(network)
+        for ggrxn in solution['gapgenSolutionReactions']:
+            deletions.add(FBA._ref_id(ggrxn['modelreaction_ref']),
+                          ggrxn['direction'])
+        formulation = dict(formulation)
+        formulation['bounds'] = formulation['bounds'] + deletions.bounds(
+            FBA.FBAProblem(network, formulation))
+    return [(sim['simulatedGrowth'], sim['simulatedGrowthFraction'],
+             sim['phenoclass'])
+            for sim in FBA.simulate_phenotypes(
+                network, formulation, shared['phenotype_set'],
+                shared['phenotypeset_ref'], shared['media'])]
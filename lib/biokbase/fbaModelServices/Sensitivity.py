@@ -0,0 +1,420 @@
+'''
+Reaction knockout sensitivity analysis of workspace FBAModel objects.
+
+This follows the deletion experiments Bio::KBase::ObjectAPI::KBaseFBA::FBA
+has the MFAToolkit run for reaction_sensitivity_analysis. Each reaction
+direction tested is knocked out and reported with the fraction of the wild
+type growth left, the reactions that can no longer carry flux, the genes
+that become essential and, when growth stops, the biomass compounds that
+can no longer be produced.
+
+Knockouts are solved in chunks over a pool of processes, each warm starting
+from its previous solve. A direction no wild type solution can carry flux
+through changes nothing and is reported without a solve. A direction that
+carries no flux in the minimal flux wild type solution leaves that
+solution optimal, so it keeps the wild type growth without a growth solve
+and is only checked for the reactions closing it blocks; the gene knockout
+screen is only run for the directions the wild type uses.
+The gene knockout screen only looks at the genes that are not already
+essential in the wild type, which is screened once.
+
+With delete_noncontributing_reactions, each knockout marked for deletion is
+kept for the ones tested after it, which makes the analysis sequential.
+'''
+
+from __future__ import division
+
+import copy
+import re
+
+try:
+    import numpy as np
+    import scipy.sparse as sparse
+except ImportError:
+    np = None
+
+from biokbase.fbaModelServices import FBA
+from biokbase.fbaModelServices.Solver import (LinearProgram, LPSolver,
+                                              solver_map, split)
+
+# defaults of reaction_sensitivity_analysis in the perl implementation
+SENSITIVITY_DEFAULTS = {
+    'objective_fraction': 0.1,
+    'objective_reaction': 'bio1',
+    'media': 'Complete',
+    'media_ws': 'KBaseMedia',
+    'type': 'unknown',
+    'delete_noncontributing_reactions': 0
+}
+
+# growth fraction a knockout that blocks no other reaction has to keep to
+# be marked for deletion; knockouts keeping less stop growth
+DELETE_FRACTION = 0.00001
+
+# flux a biomass compound has to reach in a sink to count as producible
+_PRODUCIBLE = 1e-6
+
+_SOLUTION_ID = re.compile(r'(.+)\.gfsol\.(\d+)$')
+
+_DIRECTIONS = {'+': '>', '-': '<'}
+
+
+def default_parameters(params=None):
+    '''
+    Returns a copy of reaction_sensitivity_analysis parameters with
+    defaults for unset options.
+    '''
+    out = copy.deepcopy(SENSITIVITY_DEFAULTS)
+    for key, value in (params or {}).items():
+        if value is not None:
+            out[key] = copy.deepcopy(value)
+    return out
+
+
+def parse_solution_id(solution_id):
+    '''
+    Returns the gapfilling id and the (0 based) solution index of a
+    GAPFILLID.gfsol.NUMBER gapfill solution id, whose numbers start at 1.
+    '''
+    match = _SOLUTION_ID.match(solution_id)
+    if match is None or int(match.group(2)) < 1:
+        raise ValueError('Specified gapfill solution ID did not have '
+                         'expected format GAPFILLID.gfsol.NUMBER')
+    return match.group(1), int(match.group(2)) - 1
+
+
+def signed_deletions(reactions):
+    '''
+    Returns the reactions to delete as +id (forward) and -id (reverse)
+    directions; a reaction given without a sign is deleted in both.
+    '''
+    deletions = []
+    for rxn in reactions:
+        if rxn[:1] in _DIRECTIONS:
+            deletions.append(rxn)
+        else:
+            deletions.extend(('+' + rxn, '-' + rxn))
+    return deletions
+
+
+def solution_deletions(network, gapfill, index):
+    '''
+    Returns the directions of the model reactions a gapfilling solution
+    added, as _get_gapfill_solution_reactions: each once, leaving out those
+    the model does not have, and in reverse order so that the lower
+    priority reactions of iterative solutions are tested first.
+    '''
+    solutions = gapfill.get('gapfillingSolutions') or []
+    if index >= len(solutions):
+        raise ValueError('Solution number %d specified but there are ' %
+                         (index + 1) + 'fewer than that in the specified '
+                         'gapfill object (note that the solution numbers '
+                         'start at 1)')
+    nrxn = len(network.reactions)
+    deletions = []
+    for rxn in solutions[index].get('gapfillingSolutionReactions', []):
+        sign = {'>': '+', '<': '-'}.get(rxn['direction'])
+        if sign is None:
+            raise ValueError('Direction for gapfill solution reaction was '
+                             'not < or >')
+        col = network.find_reaction('%s_%s%d' % (
+            FBA._ref_id(rxn['reaction_ref']),
+            FBA._ref_id(rxn.get('compartment_ref', 'c')),
+            rxn.get('compartmentIndex', 0)))
+        if col is None or col >= nrxn:
+            continue
+        if ((sign == '+' and network.reverse_only[col]) or
+                (sign == '-' and network.forward_only[col])):
+            continue
+        deletion = sign + network.reactions[col]
+        if deletion not in deletions:
+            deletions.append(deletion)
+    deletions.reverse()
+    return deletions
+
+
+def sort_by_likelihood(deletions, rxnprobs):
+    '''
+    Returns deletions stably sorted by the likelihood a RxnProbs object
+    gives their reactions, least likely first; reactions it does not
+    list count as unlikely.
+    '''
+    likelihood = {}
+    for row in rxnprobs.get('reaction_probabilities', []):
+        likelihood[row[0]] = float(row[1])
+
+    def key(deletion):
+        rxn_id = deletion[1:]
+        return likelihood.get(rxn_id, likelihood.get(
+            rxn_id.rsplit('_', 1)[0], 0))
+    return sorted(deletions, key=key)
+
+
+class SensitivityProblem(object):
+    '''
+    The knockouts of reaction directions against one FBAFormulation and
+    Media, relative to the wild type FBAProblem in problem.
+    '''
+
+    def __init__(self, network, formulation, media):
+        self.network = network
+        self.media = media
+        self.problem = FBA.FBAProblem(network, formulation, media)
+        self.solved = 0
+
+        # the compounds the objective's biomass reactions consume, whose
+        # production is checked when a knockout stops growth
+        rows = set()
+        for col in self.problem.objective:
+            if isinstance(col, tuple) or col < len(network.reactions):
+                continue
+            column = network.S[:, col].tocoo()
+            rows.update(column.row[column.data < 0].tolist())
+        self.biomass_rows = sorted(rows)
+
+    def knockouts(self, deletions):
+        '''
+        Returns the (deletion, flux column, direction) of each of the +id
+        and -id reaction directions in deletions.
+        '''
+        knockouts = []
+        for deletion in deletions:
+            col = self.network.find_reaction(deletion[1:])
+            if col is None or deletion[:1] not in _DIRECTIONS:
+                raise ValueError('Reaction %s not found!' % deletion)
+            knockouts.append((deletion, col, _DIRECTIONS[deletion[:1]]))
+        return knockouts
+
+    def solve(self, deletions, delete_noncontributing=False, processes=1):
+        '''
+        Knocks out each direction in deletions, returning a result per
+        deletion and the wild type solution. Results hold the deletion,
+        its flux column and direction, the growth_fraction left, the
+        reactions it blocks (inactive), the genes it makes essential
+        (essentials), the biomass compounds that can no longer be produced
+        (biomass_compounds) and whether it was kept for the knockouts
+        after it (deleted).
+        '''
+        network = self.network
+        problem = self.problem
+        knockouts = self.knockouts(deletions)
+        solution = problem.solve()
+        if not solution.feasible:
+            raise ValueError('FBA failed with no solution returned!')
+        self.solved = 1
+        blocked, _, solved = problem.consistency(solution, processes,
+                                                 essential=False)
+        self.solved += solved
+        assertions, solved = problem.knockout_screen(solution, processes)
+        self.solved += solved
+        essential = set(assertion[0] for assertion in assertions
+                        if assertion[3])
+        minimal = problem.minimize_flux(solution, 1)
+
+        results = []
+        tasks = []
+        blocked = set(blocked.tolist())
+        for i, (deletion, col, direction) in enumerate(knockouts):
+            results.append({'reaction': deletion, 'col': col,
+                            'direction': direction, 'growth_fraction': 1.0,
+                            'inactive': [], 'essentials': [],
+                            'biomass_compounds': [], 'deleted': False})
+            closed = (problem.upper[col] <= 0 if direction == '>'
+                      else problem.lower[col] >= 0)
+            if col in blocked or closed:
+                results[i]['deleted'] = delete_noncontributing
+            else:
+                tasks.append((i, col, direction))
+
+        tested = set(col for deletion, col, direction in knockouts)
+        wildtype = (solution, minimal, blocked, essential, tested,
+                    self.biomass_rows, delete_noncontributing)
+        # kept deletions change the program the knockouts after them are
+        # solved against, so they all have to run in one chunk
+        chunks = ([tasks] if delete_noncontributing
+                  else split(tasks, 4 * processes))
+        for chunk in solver_map(
+                problem.lp, _sensitivity_chunk,
+                [(network, problem.formulation, self.media, wildtype, chunk)
+                 for chunk in chunks], processes):
+            for i, growth, inactive, genes, unproducible, deleted, solved \
+                    in chunk:
+                fraction = 1.0
+                if abs(solution.objective) > FBA.ZERO_FLUX:
+                    fraction = growth / solution.objective
+                results[i].update({
+                    'growth_fraction': fraction,
+                    'inactive': [network.reactions[col] for col in inactive],
+                    'essentials': genes,
+                    'biomass_compounds': [network.compounds[row]
+                                          for row in unproducible],
+                    'deleted': deleted})
+                self.solved += solved
+        return results, solution
+
+    def sensitivity_object(self, rs_id, results, model_ref, rs_type,
+                           delete_noncontributing=False):
+        '''
+        Returns the ReactionSensitivityAnalysis object of the results of
+        solve, with the normalized counts computed as in the perl
+        implementation.
+        '''
+        network = self.network
+        tested = set(network.reactions[result['col']] for result in results)
+        reactions = []
+        required = {}
+        for i, result in enumerate(results):
+            inactive = [rxn for rxn in result['inactive']
+                        if rxn not in tested]
+            for rxn in inactive:
+                required.setdefault(rxn, []).append(result['reaction'])
+            reactions.append({
+                'id': '%s.rxn.%d' % (rs_id, i),
+                'modelreaction_ref': '%s/modelreactions/id/%s' % (
+                    model_ref, network.reactions[result['col']]),
+                'growth_fraction': result['growth_fraction'],
+                'delete': int(not inactive and
+                              result['growth_fraction'] > DELETE_FRACTION),
+                'deleted': int(result['deleted']),
+                'direction': result['direction'],
+                'normalized_activated_reaction_count': 0,
+                'biomass_compounds': result['biomass_compounds'],
+                'new_inactive_rxns': inactive,
+                'new_essentials': result['essentials']})
+        corrected = {}
+        for rxn in sorted(required):
+            corrected[rxn] = {
+                'modelreaction_ref': '%s/modelreactions/id/%s' % (model_ref,
+                                                                  rxn),
+                'normalized_required_reaction_count': 0,
+                'required_reactions': required[rxn]}
+        # each tested reaction counts the reactions it activates, weighted
+        # down by how many tested reactions each of them needs, and each
+        # activated reaction the tested reactions it needs, weighted down
+        # by how many reactions each of those activates
+        for rxn in reactions:
+            inactive = rxn['new_inactive_rxns']
+            for other in inactive:
+                rxn['normalized_activated_reaction_count'] += (
+                    1 / len(corrected[other]['required_reactions']))
+                corrected[other]['normalized_required_reaction_count'] += (
+                    1 / len(inactive))
+        return {'id': rs_id,
+                'fbamodel_ref': model_ref,
+                'type': rs_type,
+                'deleted_noncontributing_reactions':
+                    int(delete_noncontributing),
+                'integrated_deletions_in_model': 0,
+                'reactions': reactions,
+                'corrected_reactions': [corrected[rxn]
+                                        for rxn in sorted(corrected)]}
+
+
+def _sensitivity_chunk(solver, chunk):
+    # knocks out each (index, column, direction), returning its (index,
+    # growth, newly blocked flux columns, newly essential genes, biomass
+    # compound rows that can not be produced, deleted, programs solved).
+    # Knockouts kept as deletions stay in the solver and in the bounds of
+    # the programs of the ones after them; the reference solutions, blocked
+    # reactions and essential genes are updated as they are kept
+    network, formulation, media, wildtype, tasks = chunk
+    solution, minimal, blocked, essential, tested, rows, delete = wildtype
+    growth = solution.objective
+    essential = set(essential)
+    bounds = list(formulation['bounds'])
+    out = []
+    for index, col, direction in tasks:
+        lower = solver.lower[col]
+        upper = solver.upper[col]
+        if direction == '>':
+            knockout = (lower, 0)
+            flux = minimal.x[col] > FBA.ZERO_FLUX
+        else:
+            knockout = (0, upper)
+            flux = minimal.x[col] < -FBA.ZERO_FLUX
+        if knockout[0] > knockout[1]:
+            # the formulation forces flux through the direction
+            out.append((index, 0.0, [], [], [], False, 0))
+            continue
+
+        form = dict(formulation)
+        form['bounds'] = bounds + [[knockout[0], knockout[1], 'flux',
+                                    network.reactions[col]]]
+        problem = FBA.FBAProblem(network, form, media)
+        if not flux:
+            # the minimal flux solution stays optimal without the direction,
+            # so only the reactions closing it blocks are looked for
+            found, _, solved = problem.consistency(minimal, essential=False)
+            inactive = [c for c in found.tolist()
+                        if c not in blocked and c not in tested]
+            deleted = delete and not inactive
+            if deleted:
+                bounds = form['bounds']
+                solver.set_bounds([col], *knockout)
+            out.append((index, solution.objective, inactive, [], [],
+                        deleted, solved))
+            continue
+
+        solver.set_bounds([col], *knockout)
+        result = solver.solve()
+        solved = 1
+        knocked = problem._solution(result)
+        objective = knocked.objective if knocked.feasible else 0.0
+        fraction = 1.0
+        if abs(growth) > FBA.ZERO_FLUX:
+            fraction = objective / growth
+
+        inactive = []
+        genes = []
+        unproducible = []
+        if knocked.feasible:
+            found, _, count = problem.consistency(knocked, essential=False)
+            solved += count
+            inactive = [c for c in found.tolist()
+                        if c not in blocked and c not in tested]
+        if fraction > DELETE_FRACTION:
+            assertions, count = problem.knockout_screen(
+                knocked, genes=[gene for gene in network.gene_reactions
+                                if gene not in essential])
+            solved += count
+            genes = [assertion[0] for assertion in assertions
+                     if assertion[3]]
+        elif knocked.feasible:
+            unproducible, count = _unproducible(problem, rows)
+            solved += count
+
+        deleted = delete and not inactive and fraction > DELETE_FRACTION
+        if deleted:
+            bounds = form['bounds']
+            solution = knocked
+            minimal = problem.minimize_flux(knocked, 1)
+            essential.update(genes)
+        else:
+            solver.set_bounds([col], lower, upper)
+        out.append((index, objective, inactive, genes, unproducible,
+                    deleted, solved))
+    return out
+
+
+def _unproducible(problem, rows):
+    # returns the rows of the compounds no flux through problem can produce,
+    # maximizing a sink of each in turn, and the number of programs solved
+    lp = problem.lp
+    ncol = lp.shape[1]
+    nsink = len(rows)
+    sinks = sparse.csc_matrix(
+        (-np.ones(nsink), (np.array(rows, dtype=int), np.arange(nsink))),
+        shape=(lp.shape[0], nsink))
+    solver = LPSolver(LinearProgram(
+        np.zeros(ncol + nsink), sparse.hstack([lp.A, sinks], format='csc'),
+        lp.row_lower, lp.row_upper,
+        np.concatenate([lp.lower, np.zeros(nsink)]),
+        np.concatenate([lp.upper, np.ones(nsink)]), True))
+    unproducible = []
+    for j, row in enumerate(rows):
+        solver.set_costs([ncol + j], 1)
+        result = solver.solve()
+        solver.set_costs([ncol + j], 0)
+        if not result.optimal or result.objective < _PRODUCIBLE:
+            unproducible.append(row)
+    return unproducible, nsink
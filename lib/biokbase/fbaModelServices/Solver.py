@@ -0,0 +1,575 @@
+'''
+Linear programs and the solvers the in-process FBA engine runs them with.
+
+An LPSolver holds one linear program and lets objective coefficients and
+bounds be changed between solves. With highspy installed, the program is
+loaded into a HiGHS instance once and every solve starts from the basis
+the previous one finished with, which is what makes long series of
+closely related solves (flux variability, knockouts, sweeps) cheap. Without
+highspy each solve is a fresh scipy linprog call, or milp call for programs
+with integer columns.
+
+A program can carry a ColumnProjection, which the LPSolver substitutes into
+it: the columns the projection proves to be zero are dropped and the ones it
+proves to be in fixed ratio become one column, so a smaller program is
+solved. Costs, bounds and solutions stay in terms of the original columns.
+
+solver_map runs such a series in a pool of processes, each holding its own
+LPSolver for the same program; program_map runs series that each have a
+program of their own, and shared_map runs work that builds its programs
+from state every worker shares.
+'''
+
+from __future__ import division
+
+import multiprocessing
+
+try:
+    import numpy as np
+    import scipy.sparse as sparse
+    from scipy.optimize import linprog
+except ImportError:
+    np = None
+
+try:
+    from scipy.optimize import Bounds, LinearConstraint, milp
+except ImportError:
+    milp = None
+
+try:
+    import highspy
+except ImportError:
+    highspy = None
+
+INF = float('inf')
+
+# HiGHS simplex_strategy values
+_DUAL = 1
+_PRIMAL = 4
+# HiGHS primal_solution_status of a feasible solution
+_FEASIBLE = 2
+
+# how far from integer an integer column may be: the HiGHS default of 1e-6
+# lets a binary switch on a flux bounded at 1000 leak 1e-3 through
+_INTEGRALITY_TOLERANCE = 1e-9
+
+
+def check_solvers():
+    '''
+    Raises ImportError unless the solvers the in-process engine needs are
+    installed: numpy and scipy for linear programs, and highspy or scipy
+    1.9 or later (which has milp) for programs with integer columns.
+    '''
+    if np is None:
+        raise ImportError('numpy and scipy are required for FBA')
+    if highspy is None and milp is None:
+        raise ImportError('highspy or scipy >= 1.9 is required for FBA')
+
+
+class LinearProgram(object):
+    '''
+    Optimizes c.x subject to row_lower <= A x <= row_upper and
+    lower <= x <= upper, with the columns integrality marks (if given)
+    taking integer values.
+    '''
+
+    def __init__(self, c, A, row_lower, row_upper, lower, upper,
+                 maximize=False, projection=None, integrality=None):
+        self.c = np.asarray(c, dtype=float)
+        self.A = sparse.csc_matrix(A)
+        self.row_lower = np.asarray(row_lower, dtype=float)
+        self.row_upper = np.asarray(row_upper, dtype=float)
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        self.maximize = maximize
+        self.projection = projection
+        self.integrality = (None if integrality is None else
+                            np.asarray(integrality, dtype=np.int8))
+
+    @classmethod
+    def from_constraints(cls, c, A_eq, b_eq, A_ub, b_ub, lower, upper,
+                         maximize=False):
+        '''Builds a program from equality and <= constraints.'''
+        return cls(c, sparse.vstack([A_eq, A_ub], format='csc'),
+                   np.concatenate([b_eq, np.full(len(b_ub), -INF)]),
+                   np.concatenate([b_eq, b_ub]), lower, upper, maximize)
+
+    def add_rows(self, A, row_lower, row_upper):
+        '''Returns a copy of the program with rows added.'''
+        return LinearProgram(
+            self.c, sparse.vstack([self.A, A], format='csc'),
+            np.concatenate([self.row_lower, row_lower]),
+            np.concatenate([self.row_upper, row_upper]),
+            self.lower, self.upper, self.maximize, self.projection,
+            self.integrality)
+
+    def add_columns(self, A, c, lower, upper, integrality=None):
+        '''
+        Returns a copy of the program with columns added, integer where
+        integrality is nonzero.
+        '''
+        if integrality is None and self.integrality is None:
+            combined = None
+        else:
+            combined = np.concatenate([
+                np.zeros(len(self.c)) if self.integrality is None
+                else self.integrality,
+                np.zeros(len(c)) if integrality is None else integrality])
+        return LinearProgram(
+            np.concatenate([self.c, c]),
+            sparse.hstack([self.A, A], format='csc'),
+            self.row_lower, self.row_upper,
+            np.concatenate([self.lower, lower]),
+            np.concatenate([self.upper, upper]), self.maximize,
+            self.projection.extend(len(c)) if self.projection is not None
+            else None, combined)
+
+    @property
+    def shape(self):
+        return self.A.shape
+
+
+class ColumnProjection(object):
+    '''
+    The substitution x = T z of a program's columns x by fewer columns z,
+    for columns that are zero (an empty row of T) or in fixed ratio to each
+    other (rows of T with their one entry in the same column) in every
+    solution. It is only exact while each column's bounds stay within
+    lower and upper and the balances it was derived from, the program's
+    leading rows (as many as rows), stay fixed at zero; beyond that the
+    full program is solved. The row duals of a projected solve are those of
+    the projected program.
+    '''
+
+    def __init__(self, T, lower, upper, rows=0):
+        self.T = sparse.csr_matrix(T)
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        self.rows = rows
+
+    def extend(self, count, lower=None, upper=None):
+        '''
+        Returns the projection with count more columns, each kept as it is,
+        whose bounds are only limited by lower and upper where given.
+        '''
+        if not count:
+            return self
+        if lower is None:
+            lower = np.full(count, -INF)
+        if upper is None:
+            upper = np.full(count, INF)
+        return ColumnProjection(
+            sparse.block_diag([self.T, sparse.identity(count)],
+                              format='csr'),
+            np.concatenate([self.lower, lower]),
+            np.concatenate([self.upper, upper]), self.rows)
+
+    @property
+    def shape(self):
+        return self.T.shape
+
+
+class LPResult(object):
+    '''
+    The outcome of a solve. x and row_duals are None unless optimal is
+    True, except that a solve stopped by its time limit keeps the best
+    solution it found in x. Solves with integer columns have no row_duals.
+    '''
+
+    def __init__(self, optimal, objective=None, x=None, row_duals=None,
+                 status=''):
+        self.optimal = optimal
+        self.objective = objective
+        self.x = x
+        self.row_duals = row_duals
+        self.status = status
+
+
+class LPSolver(object):
+    '''
+    A linear program loaded into a solver, whose costs and bounds can be
+    changed between solves.
+    '''
+
+    def __init__(self, lp):
+        if np is None:
+            raise ImportError('numpy and scipy are required for FBA')
+        self.c = lp.c.copy()
+        self.A = lp.A
+        self.row_lower = lp.row_lower.copy()
+        self.row_upper = lp.row_upper.copy()
+        self.lower = lp.lower.copy()
+        self.upper = lp.upper.copy()
+        self.maximize = lp.maximize
+        self.projection = lp.projection
+        self.integrality = lp.integrality
+        self.time_limit = None
+        self._highs = None
+        # what changed since the last solve: after objective changes only,
+        # the last basis is still primal feasible and primal simplex picks
+        # up from it; after bound changes it is still dual feasible
+        self._changed = set()
+        if self.projection is not None:
+            # the projected program, and the full one once bounds have left
+            # the projection's limits
+            self._T = self.projection.T
+            self._members = self._T.T.tocsr()
+            self._blocked = np.diff(self._T.indptr) == 0
+            self._full = None
+            lower, upper = self._group_bounds(
+                np.arange(self._T.shape[1]))
+            integrality = None
+            if self.integrality is not None:
+                # a projected column is integer when a column it stands
+                # for is
+                integrality = abs(self._members).dot(self.integrality) > 0
+            self._reduced = LPSolver(LinearProgram(
+                self._members.dot(self.c), self.A.dot(self._T),
+                self.row_lower, self.row_upper, lower, upper,
+                self.maximize, integrality=integrality))
+        elif highspy is not None:
+            self._highs = self._load()
+
+    def _load(self):
+        h = highspy.Highs()
+        h.setOptionValue('output_flag', False)
+        model = highspy.HighsLp()
+        nrow, ncol = self.A.shape
+        model.num_col_ = ncol
+        model.num_row_ = nrow
+        model.col_cost_ = self.c
+        model.col_lower_ = self.lower
+        model.col_upper_ = self.upper
+        model.row_lower_ = self.row_lower
+        model.row_upper_ = self.row_upper
+        model.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+        model.a_matrix_.start_ = self.A.indptr
+        model.a_matrix_.index_ = self.A.indices
+        model.a_matrix_.value_ = self.A.data
+        model.a_matrix_.num_col_ = ncol
+        model.a_matrix_.num_row_ = nrow
+        if self.integrality is not None:
+            model.integrality_ = [highspy.HighsVarType.kInteger if integer
+                                  else highspy.HighsVarType.kContinuous
+                                  for integer in self.integrality]
+            h.setOptionValue('mip_feasibility_tolerance',
+                             _INTEGRALITY_TOLERANCE)
+        h.passModel(model)
+        h.changeObjectiveSense(highspy.ObjSense.kMaximize if self.maximize
+                               else highspy.ObjSense.kMinimize)
+        return h
+
+    def set_costs(self, cols, costs):
+        cols = np.asarray(cols, dtype=np.int32)
+        costs = np.broadcast_to(np.asarray(costs, dtype=float), cols.shape)
+        self.c[cols] = costs
+        if self.projection is not None:
+            groups = self._groups_of(cols)
+            self._reduced.set_costs(groups, self._members[groups].dot(self.c))
+            if self._full is not None:
+                self._full.set_costs(cols, costs)
+            return
+        self._changed.add('cost')
+        if self._highs is not None:
+            self._highs.changeColsCost(len(cols), cols,
+                                       np.ascontiguousarray(costs))
+
+    def set_objective(self, c, maximize=None):
+        '''Replaces the whole objective, and optionally its sense.'''
+        self.set_costs(np.arange(len(self.c)), c)
+        if maximize is not None:
+            self.set_sense(maximize)
+
+    def set_sense(self, maximize):
+        if self.projection is not None:
+            self._reduced.set_sense(maximize)
+            if self._full is not None:
+                self._full.set_sense(maximize)
+        elif maximize != self.maximize:
+            self._changed.add('cost')
+        if maximize != self.maximize and self._highs is not None:
+            self._highs.changeObjectiveSense(
+                highspy.ObjSense.kMaximize if maximize
+                else highspy.ObjSense.kMinimize)
+        self.maximize = maximize
+
+    def set_bounds(self, cols, lower, upper):
+        cols = np.asarray(cols, dtype=np.int32)
+        lower = np.broadcast_to(np.asarray(lower, dtype=float), cols.shape)
+        upper = np.broadcast_to(np.asarray(upper, dtype=float), cols.shape)
+        self.lower[cols] = lower
+        self.upper[cols] = upper
+        if self.projection is not None:
+            groups = self._groups_of(cols)
+            self._reduced.set_bounds(groups, *self._group_bounds(groups))
+            if self._full is not None:
+                self._full.set_bounds(cols, lower, upper)
+            return
+        self._changed.add('bounds')
+        if self._highs is not None:
+            self._highs.changeColsBounds(len(cols), cols,
+                                         np.ascontiguousarray(lower),
+                                         np.ascontiguousarray(upper))
+
+    def set_row_bounds(self, rows, lower, upper):
+        rows = np.asarray(rows, dtype=np.int32)
+        lower = np.broadcast_to(np.asarray(lower, dtype=float), rows.shape)
+        upper = np.broadcast_to(np.asarray(upper, dtype=float), rows.shape)
+        self.row_lower[rows] = lower
+        self.row_upper[rows] = upper
+        if self.projection is not None:
+            self._reduced.set_row_bounds(rows, lower, upper)
+            if self._full is not None:
+                self._full.set_row_bounds(rows, lower, upper)
+            return
+        self._changed.add('bounds')
+        if self._highs is not None:
+            self._highs.changeRowsBounds(len(rows), rows,
+                                         np.ascontiguousarray(lower),
+                                         np.ascontiguousarray(upper))
+
+    def add_rows(self, A, lower, upper):
+        '''Adds rows to the loaded program, such as cuts between solves.'''
+        A = sparse.csr_matrix(A)
+        lower = np.asarray(lower, dtype=float)
+        upper = np.asarray(upper, dtype=float)
+        self.A = sparse.vstack([self.A, A], format='csc')
+        self.row_lower = np.concatenate([self.row_lower, lower])
+        self.row_upper = np.concatenate([self.row_upper, upper])
+        if self.projection is not None:
+            self._reduced.add_rows(A.dot(self._T), lower, upper)
+            if self._full is not None:
+                self._full.add_rows(A, lower, upper)
+            return
+        self._changed.add('bounds')
+        if self._highs is not None:
+            self._highs.addRows(len(lower), lower, upper, A.nnz,
+                                A.indptr.astype(np.int32),
+                                A.indices.astype(np.int32), A.data)
+
+    def set_time_limit(self, seconds):
+        '''Limits each solve to seconds, or lifts the limit for None.'''
+        self.time_limit = seconds
+        if self.projection is not None:
+            self._reduced.set_time_limit(seconds)
+            if self._full is not None:
+                self._full.set_time_limit(seconds)
+        elif self._highs is not None:
+            self._highs.setOptionValue(
+                'time_limit', INF if seconds is None else float(seconds))
+
+    def _groups_of(self, cols):
+        return np.unique(self._T[cols].indices).astype(np.int32)
+
+    def _group_bounds(self, groups):
+        # the tightest bounds on each projected column that keep every
+        # column it stands for within its own bounds
+        if not len(groups):
+            return np.zeros(0), np.zeros(0)
+        members = self._members[groups]
+        ratio = members.data
+        cols = members.indices
+        lower = np.where(ratio > 0, self.lower[cols], self.upper[cols])
+        upper = np.where(ratio > 0, self.upper[cols], self.lower[cols])
+        starts = members.indptr[:-1]
+        return (np.maximum.reduceat(lower / ratio, starts),
+                np.minimum.reduceat(upper / ratio, starts))
+
+    def solve(self):
+        if self.projection is not None:
+            return self._solve_projected()
+        if self._highs is not None:
+            return self._solve_highs()
+        if self.integrality is not None:
+            return self._solve_milp()
+        return self._solve_linprog()
+
+    def _solve_projected(self):
+        projection = self.projection
+        fixed = slice(0, projection.rows)
+        if ((self.lower < projection.lower).any() or
+                (self.upper > projection.upper).any() or
+                self.row_lower[fixed].any() or self.row_upper[fixed].any()):
+            if self._full is None:
+                self._full = LPSolver(LinearProgram(
+                    self.c, self.A, self.row_lower, self.row_upper,
+                    self.lower, self.upper, self.maximize,
+                    integrality=self.integrality))
+                self._full.set_time_limit(self.time_limit)
+            return self._full.solve()
+        blocked = self._blocked
+        if ((self.lower[blocked] > 0).any() or
+                (self.upper[blocked] < 0).any()):
+            return LPResult(False, status='Infeasible')
+        result = self._reduced.solve()
+        if result.x is not None:
+            result.x = self._T.dot(result.x)
+        return result
+
+    def _solve_highs(self):
+        h = self._highs
+        h.setOptionValue('simplex_strategy', _PRIMAL if self._changed ==
+                         set(['cost']) else _DUAL)
+        self._changed = set()
+        h.run()
+        status = h.getModelStatus()
+        info = h.getInfo()
+        if (status == highspy.HighsModelStatus.kTimeLimit and
+                info.primal_solution_status == _FEASIBLE):
+            return LPResult(False, info.objective_function_value,
+                            np.array(h.getSolution().col_value),
+                            status=h.modelStatusToString(status))
+        if status != highspy.HighsModelStatus.kOptimal:
+            return LPResult(False, status=h.modelStatusToString(status))
+        solution = h.getSolution()
+        duals = None
+        if self.integrality is None:
+            duals = np.array(solution.row_dual)
+        return LPResult(True, info.objective_function_value,
+                        np.array(solution.col_value), duals, 'Optimal')
+
+    def _solve_milp(self):
+        if milp is None:
+            raise ImportError('highspy or scipy 1.9 is required for programs '
+                              'with integer columns')
+        options = {}
+        if self.time_limit is not None:
+            options['time_limit'] = self.time_limit
+        res = milp(-self.c if self.maximize else self.c,
+                   integrality=self.integrality,
+                   bounds=Bounds(self.lower, self.upper),
+                   constraints=LinearConstraint(self.A, self.row_lower,
+                                                self.row_upper),
+                   options=options)
+        if res.x is None:
+            return LPResult(False, status=res.message)
+        return LPResult(res.status == 0, float(self.c.dot(res.x)), res.x,
+                        status=res.message)
+
+    def _solve_linprog(self):
+        equal = self.row_lower == self.row_upper
+        upper = ~equal & np.isfinite(self.row_upper)
+        lower = ~equal & np.isfinite(self.row_lower)
+        A = self.A.tocsr()
+        A_ub = sparse.vstack([A[upper], -A[lower]], format='csr')
+        b_ub = np.concatenate([self.row_upper[upper], -self.row_lower[lower]])
+        res = linprog(-self.c if self.maximize else self.c,
+                      A_ub=A_ub if A_ub.shape[0] else None,
+                      b_ub=b_ub if A_ub.shape[0] else None,
+                      A_eq=A[equal] if equal.any() else None,
+                      b_eq=self.row_lower[equal] if equal.any() else None,
+                      bounds=np.column_stack([self.lower, self.upper]),
+                      method='highs')
+        if res.status != 0:
+            return LPResult(False, status=res.message)
+        # duals in the row order of the program, for the sense it was
+        # given in
+        duals = np.zeros(A.shape[0])
+        sign = -1 if self.maximize else 1
+        duals[equal] = sign * res.eqlin.marginals
+        nupper = upper.sum()
+        if A_ub.shape[0]:
+            duals[upper] += sign * res.ineqlin.marginals[:nupper]
+            duals[lower] -= sign * res.ineqlin.marginals[nupper:]
+        return LPResult(True, float(self.c.dot(res.x)), res.x, duals,
+                        res.message)
+
+
+# the solver of a solver_map worker process
+_worker_solver = None
+
+
+def _init_worker(lp):
+    global _worker_solver
+    _worker_solver = LPSolver(lp)
+
+
+def _run_chunk(task):
+    function, chunk = task
+    return function(_worker_solver, chunk)
+
+
+def solver_map(lp, function, chunks, processes=1):
+    '''
+    Returns [function(solver, chunk) for chunk in chunks], where solver is
+    an LPSolver for lp. Chunks are spread over up to processes worker
+    processes, each loading lp once; a chunk is always run by one solver,
+    so consecutive solves within it are warm started. function must be
+    defined at module level, and should leave the solver as it found it.
+    '''
+    if processes <= 1 or len(chunks) <= 1:
+        solver = LPSolver(lp)
+        return [function(solver, chunk) for chunk in chunks]
+    return _pool_map(min(processes, len(chunks)), _run_chunk,
+                     [(function, chunk) for chunk in chunks],
+                     _init_worker, (lp,))
+
+
+def program_map(function, tasks, processes=1):
+    '''
+    Returns [function(LPSolver(lp), chunk) for lp, chunk in tasks], for
+    series of solves that each need a program of their own. Tasks are
+    spread over up to processes worker processes; function must be defined
+    at module level.
+    '''
+    if processes <= 1 or len(tasks) <= 1:
+        return [function(LPSolver(lp), chunk) for lp, chunk in tasks]
+    return _pool_map(min(processes, len(tasks)), _run_program,
+                     [(function, lp, chunk) for lp, chunk in tasks])
+
+
+def _run_program(task):
+    function, lp, chunk = task
+    return function(LPSolver(lp), chunk)
+
+
+# the state a shared_map worker process was given
+_worker_shared = None
+
+
+def _init_shared(shared):
+    global _worker_shared
+    _worker_shared = shared
+
+
+def _run_shared(task):
+    function, item = task
+    return function(_worker_shared, item)
+
+
+def shared_map(function, shared, tasks, processes=1):
+    '''
+    Returns [function(shared, task) for task in tasks], for work that needs
+    more than a program - a ModelNetwork and the model it was compiled
+    from, say. Tasks are spread over up to processes worker processes,
+    each receiving shared once rather than with every task; function must
+    be defined at module level.
+    '''
+    if processes <= 1 or len(tasks) <= 1:
+        return [function(shared, task) for task in tasks]
+    return _pool_map(min(processes, len(tasks)), _run_shared,
+                     [(function, task) for task in tasks],
+                     _init_shared, (shared,))
+
+
+def _pool_map(processes, function, tasks, initializer=None, initargs=()):
+    pool = multiprocessing.Pool(processes, initializer, initargs)
+    try:
+        return pool.map(function, tasks, chunksize=1)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def split(items, count):
+    '''Splits items into up to count contiguous, nearly equal chunks.'''
+    items = list(items)
+    count = max(1, min(count, len(items)))
+    size, extra = divmod(len(items), count)
+    chunks = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return [chunk for chunk in chunks if chunk]
@@ -0,0 +1,267 @@
+############################################################
+#
+# Hand written transport for the fbaModelServices python client.
+#
+# Client.py is generated by the type compiler and rewritten by every
+# make compile-typespec, so anything beyond plain JSON-RPC calls lives here,
+# in a subclass of the generated client with the same method surface.
+#
+############################################################
+
+import cookielib as _cookielib
+import json as _json
+import random as _random
+import zlib as _zlib
+
+import requests as _requests
+from requests.adapters import HTTPAdapter as _HTTPAdapter
+
+from biokbase.fbaModelServices.Client import fbaModelServices as _Client
+from biokbase.fbaModelServices.Client import ServerError, _JSONObjectEncoder
+from biokbase.fbaModelServices.Client import _CT, _AJ
+
+# public client methods that are not service methods
+_CLIENT_METHODS = frozenset(['batch', 'pool_stats', 'close'])
+
+
+class _BatchCall(object):
+
+    def __init__(self, method, params):
+        self.method = method
+        self.id = str(_random.random())[2:]
+        self.body = _json.dumps({'method': method,
+                                 'params': params,
+                                 'version': '1.1',
+                                 'id': self.id
+                                 }, cls=_JSONObjectEncoder)
+        self.done = False
+        self.value = None
+
+    def set_result(self, value):
+        self.value = value
+        self.done = True
+
+    def set_error(self, error):
+        self.value = error
+        self.done = True
+
+    def result(self):
+        '''
+        Returns the call's return value, or raises its ServerError.
+        '''
+        if not self.done:
+            raise ValueError('The batch containing this call has not ' +
+                             'been executed')
+        if isinstance(self.value, ServerError):
+            raise self.value
+        return self.value
+
+
+class Batch(object):
+    '''
+    Collects service calls and sends them as JSON-RPC batch requests.
+
+    Service methods called on a batch are queued and return a handle whose
+    result() gives the call's return value once the batch has executed.
+    execute() sends the queued calls, split into requests of at most
+    max_calls calls and max_bytes bytes, and returns their return values in
+    the order they were queued, with a ServerError in place of the value of
+    any call that failed. Used as a context manager the batch executes on
+    exit.
+    '''
+
+    def __init__(self, client, max_calls=100, max_bytes=1024 * 1024):
+        self._client = client
+        self.max_calls = max_calls
+        self.max_bytes = max_bytes
+        self._calls = []
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name in _CLIENT_METHODS or \
+                not hasattr(fbaModelServices, name):
+            raise AttributeError(name)
+
+        def queue(*params):
+            call = _BatchCall('fbaModelServices.' + name, list(params))
+            self._calls.append(call)
+            return call
+        return queue
+
+    def __len__(self):
+        return len(self._calls)
+
+    def execute(self):
+        calls, self._calls = self._calls, []
+        chunk = []
+        chunk_bytes = 0
+        for call in calls:
+            if chunk and (len(chunk) >= self.max_calls or
+                          chunk_bytes + len(call.body) > self.max_bytes):
+                self._client._call_batch(chunk)
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(call)
+            chunk_bytes += len(call.body) + 1
+        if chunk:
+            self._client._call_batch(chunk)
+        return [call.value for call in calls]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+
+
+class _NoCookies(_cookielib.DefaultCookiePolicy):
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+class fbaModelServices(_Client):
+    '''
+    The generated fbaModelServices client, with kept-alive connections,
+    gzip compressed requests and JSON-RPC batches.
+
+    Calls go through one keep-alive session per client. Everything a call
+    needs is passed per request and cookies are ignored, so the client is
+    safe to share between threads; pool_size bounds the number of open
+    connections, with extra threads waiting for a free one.
+
+    Request bodies of at least compression_threshold bytes are gzipped at
+    compression_level once the server has said, in the Accept-Encoding header
+    of a response, that it accepts gzip; a compression_level of 0 turns
+    compression off. Responses are always negotiated and decompressed by
+    requests.
+    '''
+
+    def __init__(self, url=None, compression_threshold=1024,
+                 compression_level=6, pool_size=10, **kwargs):
+        super(fbaModelServices, self).__init__(url, **kwargs)
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+        self._server_accepts_gzip = False
+        self._session = _requests.Session()
+        self._session.cookies.set_policy(_NoCookies())
+        self._adapter = _HTTPAdapter(pool_connections=1,
+                                     pool_maxsize=pool_size, pool_block=True)
+        self._session.mount('http://', self._adapter)
+        self._session.mount('https://', self._adapter)
+
+    def _call(self, method, params):
+        arg_hash = {'method': method,
+                    'params': params,
+                    'version': '1.1',
+                    'id': str(_random.random())[2:]
+                    }
+
+        body = _json.dumps(arg_hash, cls=_JSONObjectEncoder)
+        ret = self._post(body)
+        if ret.status_code == _requests.codes.server_error:
+            raise self._server_error(ret)
+        if ret.status_code != _requests.codes.OK:
+            ret.raise_for_status()
+        resp = _json.loads(ret.text)
+        if 'result' not in resp:
+            raise ServerError('Unknown', 0, 'An unknown server error occurred')
+        return resp['result']
+
+    def _call_batch(self, calls):
+        body = '[' + ','.join(call.body for call in calls) + ']'
+        ret = self._post(body)
+        if ret.status_code == _requests.codes.server_error:
+            # the batch as a whole was rejected, e.g. for lack of a token
+            self._fail_batch(calls, self._server_error(ret))
+            return
+        if ret.status_code != _requests.codes.OK:
+            ret.raise_for_status()
+        resps = _json.loads(ret.text)
+        if not isinstance(resps, list):
+            # a single response to the whole batch, e.g. a parse error
+            if isinstance(resps, dict) and 'error' in resps:
+                err = ServerError(**resps['error'])
+            else:
+                err = ServerError('Unknown', 0, ret.text)
+            self._fail_batch(calls, err)
+            return
+        resps = dict((resp.get('id'), resp) for resp in resps)
+        for call in calls:
+            resp = resps.get(call.id)
+            if resp is not None and 'error' in resp:
+                call.set_error(ServerError(**resp['error']))
+            elif resp is None or 'result' not in resp:
+                call.set_error(ServerError(
+                    'Unknown', 0, 'An unknown server error occurred'))
+            else:
+                call.set_result(resp['result'][0])
+
+    def _fail_batch(self, calls, err):
+        for call in calls:
+            call.set_error(err)
+
+    def _server_error(self, ret):
+        if _CT in ret.headers and ret.headers[_CT] == _AJ:
+            err = _json.loads(ret.text)
+            if 'error' in err:
+                return ServerError(**err['error'])
+        return ServerError('Unknown', 0, ret.text)
+
+    def _post(self, body):
+        headers = self._headers
+        compress = (self._server_accepts_gzip and self.compression_level > 0
+                    and len(body) >= self.compression_threshold)
+        if compress:
+            headers = dict(self._headers)
+            headers['Content-Encoding'] = 'gzip'
+            compressor = _zlib.compressobj(self.compression_level,
+                                           _zlib.DEFLATED,
+                                           16 + _zlib.MAX_WBITS)
+            data = compressor.compress(body) + compressor.flush()
+        else:
+            data = body
+        ret = self._session.post(self.url, data=data, headers=headers,
+                                 timeout=self.timeout,
+                                 verify=not self.trust_all_ssl_certificates)
+        if compress and ret.status_code == 415:
+            # the server stopped accepting gzip, e.g. after a redeploy
+            self._server_accepts_gzip = False
+            return self._post(body)
+        accepted = ret.headers.get('Accept-Encoding', '')
+        self._server_accepts_gzip = 'gzip' in accepted.lower()
+        return ret
+
+    def batch(self, max_calls=100, max_bytes=1024 * 1024):
+        '''
+        Returns a Batch that queues service calls and sends them together in
+        JSON-RPC batch requests of at most max_calls calls and max_bytes
+        bytes each.
+        '''
+        return Batch(self, max_calls, max_bytes)
+
+    def pool_stats(self):
+        '''
+        Returns counts of the requests sent and the connections opened by
+        this client; the difference is the number of requests that reused a
+        kept-alive connection.
+        '''
+        requests = connections = 0
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            if pool is None:
+                continue
+            requests += pool.num_requests
+            connections += pool.num_connections
+        return {'requests': requests, 'connections': connections,
+                'reused': requests - connections}
+
+    def close(self):
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -1,4 +1,18 @@
 #BEGIN_HEADER
+import multiprocessing
+import os
+import time
+from biokbase.workspace.client import Workspace
+from biokbase.fbaModelServices import AliasIndex
+from biokbase.fbaModelServices import Curation
+from biokbase.fbaModelServices import FBA
+from biokbase.fbaModelServices import Gapfill
+from biokbase.fbaModelServices import Gapgen
+from biokbase.fbaModelServices import ModelStats
+from biokbase.fbaModelServices import Reconciliation
+from biokbase.fbaModelServices import Sensitivity
+from biokbase.fbaModelServices import Solver
+from biokbase.fbaModelServices.ModelCache import ModelCache
 #END_HEADER
 
 
@@ -62,12 +76,299 @@ uniquely identifies a workspace among all workspaces.
     # the latter method is running.
     #########################################
     #BEGIN_CLASS_HEADER
+    def _check_engine(self, method):
+        # FBA, gapfilling, gapgeneration and everything built on them run in
+        # process only when deploy.cfg opts in with fba-engine=inprocess;
+        # otherwise they stay with the perl service and the MFAToolkit
+        if not self.inprocess:
+            raise ValueError('Method %s is run by the perl fbaModelServices '
+                             % method + 'service through the MFAToolkit; ' +
+                             'set fba-engine=inprocess to run it in the ' +
+                             'python server')
+
+    def _workspace(self, ctx):
+        return Workspace(self.workspace_url, token=ctx.get('token'))
+
+    def _alias_index(self, ctx, input):
+        # the index is keyed on the biochemistry's ws/obj/version reference,
+        # so a new biochemistry version is picked up on the next call
+        ws = self._workspace(ctx)
+        ident = {'workspace': input.get('biochemistry_workspace', 'kbase'),
+                 'name': input.get('biochemistry', 'default')}
+        info = ws.get_object_info_new({'objects': [ident]})[0]
+        ref = '%s/%s/%s' % (info[6], info[0], info[4])
+
+        def load_biochemistry():
+            return ws.get_objects([{'ref': ref}])[0]['data']
+        return AliasIndex.get_index(ref, load_biochemistry,
+                                    self.alias_index_dir)
+
+    def _get_object(self, ctx, workspace, id):
+        # returns the object data and its ws/obj/version reference
+        obj = self._workspace(ctx).get_objects(
+            [{'ref': '%s/%s' % (workspace, id)}])[0]
+        info = obj['info']
+        return obj['data'], '%s/%s/%s' % (info[6], info[0], info[4])
+
+    def _get_object_info(self, ctx, ref):
+        # returns the object data at ref and its object info, which holds
+        # the workspace (7) and name (1) it was saved under
+        obj = self._workspace(ctx).get_objects([{'ref': ref}])[0]
+        return obj['data'], obj['info']
+
+    def _object_ref(self, ctx, ref):
+        # returns the ws/obj/version reference of ref
+        info = self._workspace(ctx).get_object_info_new(
+            {'objects': [{'ref': ref}]})[0]
+        return '%s/%s/%s' % (info[6], info[0], info[4])
+
+    def _model_network(self, ctx, workspace, id):
+        # returns the compiled network of a model and its reference; the
+        # model object is only fetched when the cache does not hold it
+        model_ref = self._object_ref(ctx, '%s/%s' % (workspace, id))
+
+        def load_model():
+            return self._workspace(ctx).get_objects(
+                [{'ref': model_ref}])[0]['data']
+        network = self.model_cache.get(
+            model_ref, load_model, lambda ref: self._object_ref(ctx, ref))
+        ctx.log_debug('model cache: %(hits)d hits, %(misses)d misses, '
+                      '%(evictions)d evictions, %(size)d models, '
+                      '%(bytes)d bytes' % self.model_cache.stats())
+        ctx.log_debug('model %s: %d flux columns, %d after reduction' %
+                      ((model_ref, network.flux_count) +
+                       network.reduction.shape[1:]))
+        return network, model_ref
+
+    def _sensitivity_formulation(self, ctx, network, params):
+        # the formulation and media object of the objective, objective
+        # fraction and media of reaction_sensitivity_analysis parameters
+        objective = params['objective_reaction']
+        if network.find_biomass(objective) is not None:
+            term = [1, 'biomassflux', objective]
+        elif network.find_reaction(objective) is not None:
+            term = [1, 'flux', network.reactions[
+                network.find_reaction(objective)]]
+        else:
+            raise ValueError('Could not find objective reaction %s in model!'
+                             % objective)
+        formulation = FBA.default_formulation({
+            'media': params['media'],
+            'media_workspace': params['media_ws'],
+            'objfraction': params['objective_fraction'],
+            'objectiveTerms': [term]})
+        media, media_ref = self._get_object(
+            ctx, formulation['media_workspace'], formulation['media'])
+        return formulation, media
+
+    def _reaction_database(self, ctx, ref):
+        # the gapfilling candidates of the biochemistry at ref, compiled
+        # once per biochemistry version
+        ref = self._object_ref(ctx, ref or 'kbase/default')
+
+        def load_biochemistry():
+            return self._workspace(ctx).get_objects(
+                [{'ref': ref}])[0]['data']
+        return Gapfill.get_database(ref, load_biochemistry)
+
+    def _phenotype_media(self, ctx, phenoset):
+        # the Media of a PhenotypeSet by media_ref; every media is fetched
+        # once, however many phenotypes use it
+        media_refs = sorted(set(pheno['media_ref']
+                                for pheno in phenoset['phenotypes']))
+        if not media_refs:
+            return {}
+        objects = self._workspace(ctx).get_objects(
+            [{'ref': ref} for ref in media_refs])
+        return dict((ref, obj['data'])
+                    for ref, obj in zip(media_refs, objects))
+
+    def _save_object(self, ctx, data, type, workspace, id):
+        return self._save_objects(ctx, [(id, data)], type, workspace)[0]
+
+    def _save_objects(self, ctx, objects, type, workspace):
+        # saves (id, data) pairs of one type in a single workspace call
+        params = {'objects': []}
+        if str(workspace).isdigit():
+            params['id'] = int(workspace)
+        else:
+            params['workspace'] = workspace
+        for id, data in objects:
+            obj = {'data': data, 'type': type}
+            if str(id).isdigit():
+                obj['objid'] = int(id)
+            else:
+                obj['name'] = id
+            params['objects'].append(obj)
+        return self._workspace(ctx).save_objects(params)
+
+    def _study_solutions(self, ctx, studies, solution_ids, ref_keys,
+                         solutions_key):
+        # the solutions solution_ids name of a model's gapfillings or
+        # gapgens (studies), whose objects, at the first of ref_keys an
+        # entry has, are fetched in one workspace call; the studies are
+        # marked as integrated
+        found = Reconciliation.solution_studies(studies, solution_ids)
+        indexes = sorted(set(study for study, _ in found))
+        if not indexes:
+            return []
+        refs = []
+        for i in indexes:
+            ref = [studies[i][key] for key in ref_keys if studies[i].get(key)]
+            if not ref:
+                raise ValueError('Study %s of the model has no object ' %
+                                 studies[i]['id'] + 'reference')
+            refs.append({'ref': ref[0]})
+        objects = self._workspace(ctx).get_objects(refs)
+        data = dict((i, obj['data']) for i, obj in zip(indexes, objects))
+        solutions = []
+        for study, solution in found:
+            solution = Reconciliation.find_solution(
+                data[study].get(solutions_key) or [], solution)
+            studies[study]['integrated'] = 1
+            studies[study]['integrated_solution'] = solution['id']
+            solutions.append(solution)
+        return solutions
+
+    def _reconciliation(self, ctx, input, stage):
+        # runs a phenotype reconciliation in process, through the stages up
+        # to stage ('reconcile', 'sensitivity' or 'combine'), and returns
+        # its PhenotypeReconciliation. Stages an earlier call completed for
+        # the same model, phenotype set and options are taken from its
+        # checkpoint.
+        for arg in ('model', 'phenotypeSet', 'workspace'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        model, model_ref = self._get_object(
+            ctx, input.get('model_workspace') or input['workspace'],
+            input['model'])
+        network = self.model_cache.get(
+            model_ref, lambda: model, lambda ref: self._object_ref(ctx, ref))
+        phenoset, phenoset_ref = self._get_object(
+            ctx, input.get('phenotypeSet_workspace') or input['workspace'],
+            input['phenotypeSet'])
+        gapgen = Gapgen.default_gapgen_formulation(
+            input.get('gapgen_formulation'))
+        refmedia, refmedia_ref = self._get_object(
+            ctx, gapgen['refmedia_workspace'], gapgen['refmedia'])
+        out_model = input.get('out_model') or input['model']
+        pipeline = Reconciliation.ReconciliationPipeline(
+            network, model, model_ref, phenoset, phenoset_ref,
+            self._phenotype_media(ctx, phenoset),
+            self._reaction_database(ctx, network.biochemistry_ref),
+            input.get('fba_formulation') or input.get('formulation'),
+            input.get('gapfill_formulation'),
+            input.get('gapgen_formulation'), refmedia, refmedia_ref,
+            out_model, self.reconciliation_dir)
+        processes = self.fba_processes
+        simulations = pipeline.simulate(processes)
+        records = [record for record in pipeline.reconcile(processes)
+                   if record['fba'] is not None]
+        ctx.log_debug('reconciliation: %d of %d mispredicted phenotypes ' %
+                      (len(records), len(pipeline.records)) +
+                      'with solutions%s' % (' (resumed from %s)' %
+                                            pipeline.path
+                                            if pipeline.resumed else ''))
+        selected = None
+        if input.get('gapFills') or input.get('gapGens'):
+            selected = set((input.get('gapFills') or []) +
+                           (input.get('gapGens') or []))
+        phenotypes = phenoset['phenotypes']
+        output = {'phenoclasses': Reconciliation.phenoclass_counts(
+                      simulations),
+                  'sensitivity': {}, 'combined_solutions': [],
+                  'checkpoint': pipeline.path}
+        if stage != 'reconcile':
+            effects = pipeline.analyse(processes, selected)
+            for sol_id, (_, fixed, broken) in effects.items():
+                output['sensitivity'][sol_id] = (
+                    [phenotypes[i]['id'] for i in fixed],
+                    [phenotypes[i]['id'] for i in broken])
+        if stage == 'combine':
+            chosen = pipeline.combine(processes, selected)
+            reconciled, simulations = pipeline.integrate(chosen, processes)
+            output['combined_solutions'] = chosen
+            output['reconciled_phenoclasses'] = (
+                Reconciliation.phenoclass_counts(simulations))
+
+        # the studies with solutions are saved in three workspace calls,
+        # however many phenotypes were reconciled
+        infos = self._save_objects(
+            ctx, [(record['fba']['id'], record['fba'])
+                  for record in records], 'KBaseFBA.FBA', input['workspace'])
+        fba_refs = {}
+        for record, info in zip(records, infos):
+            fba_refs[record['id']] = '%s/%s/%s' % (info[6], info[0], info[4])
+            if record['gapgen'] is not None:
+                record['gapgen']['fba_ref'] = fba_refs[record['id']]
+        gapgens = [record for record in records
+                   if record['gapgen'] is not None]
+        gapgen_refs = {}
+        if gapgens:
+            infos = self._save_objects(
+                ctx, [(record['id'], record['gapgen'])
+                      for record in gapgens],
+                'KBaseFBA.Gapgeneration', input['workspace'])
+            for record, info in zip(gapgens, infos):
+                gapgen_refs[record['id']] = '%s/%s/%s' % (info[6], info[0],
+                                                          info[4])
+        output['gapfills'] = [record['id'] for record in records
+                              if record['type'] == 'gapfill']
+        output['gapgens'] = [record['id'] for record in gapgens]
+
+        if stage == 'combine':
+            solutions = pipeline.solutions(processes)
+            for sol_id in chosen:
+                record = solutions[sol_id][0]
+                entry = {'id': record['id'],
+                         'fba_ref': fba_refs[record['id']],
+                         'media_ref': record['media_ref'], 'integrated': 1,
+                         'integrated_solution': sol_id}
+                if record['type'] == 'gapfill':
+                    entry['gapfill_id'] = record['id']
+                    reconciled.setdefault('gapfillings', []).append(entry)
+                else:
+                    entry['gapgen_id'] = record['id']
+                    entry['gapgen_ref'] = gapgen_refs[record['id']]
+                    reconciled.setdefault('gapgens', []).append(entry)
+            output['reconciled_model'] = self._save_object(
+                ctx, reconciled, 'KBaseFBA.FBAModel', input['workspace'],
+                out_model)
+        return output
     #END_CLASS_HEADER
 
     # config contains contents of config file in a hash or None if it couldn't
     # be found
     def __init__(self, config):
         #BEGIN_CONSTRUCTOR
+        config = config or {}
+        self.workspace_url = config.get('workspace-url',
+                                        'http://kbase.us/services/ws')
+        self.alias_index_dir = None
+        self.reconciliation_dir = None
+        if config.get('file_cache'):
+            self.alias_index_dir = os.path.join(config['file_cache'],
+                                                'AliasIndex')
+            self.reconciliation_dir = os.path.join(config['file_cache'],
+                                                   'Reconciliation')
+        self.model_cache = ModelCache(
+            int(config.get('model-cache-mb', 512)) * 1024 * 1024)
+        self.fba_processes = int(config.get('fba-processes') or
+                                 multiprocessing.cpu_count())
+        # the media generate_model_stats computes minimal media essential
+        # genes and reactions on, unless a call names another
+        self.minimal_media = (config.get('minimal-media') or
+                              'KBaseMedia/Carbon-D-Glucose').split('/')
+        if len(self.minimal_media) != 2:
+            raise ValueError('minimal-media must be a workspace/id reference')
+        engine = config.get('fba-engine') or 'mfatoolkit'
+        if engine not in ('mfatoolkit', 'inprocess'):
+            raise ValueError('fba-engine must be mfatoolkit or inprocess, ' +
+                             'not ' + engine)
+        self.inprocess = engine == 'inprocess'
+        if self.inprocess:
+            # fail at startup rather than on the first FBA call
+            Solver.check_solvers()
         #END_CONSTRUCTOR
         pass
 
@@ -153,6 +454,13 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: output
         #BEGIN get_alias
+        for arg in ('input_ids', 'input_id_type', 'output_id_type',
+                    'object_type'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        index = self._alias_index(ctx, input)
+        output = index.lookup(input['object_type'], input['input_id_type'],
+                              input['output_id_type'], input['input_ids'])
         #END get_alias
 
         # At some point might do deeper type checking...
@@ -166,6 +474,10 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: aliassets
         #BEGIN get_aliassets
+        if 'object_type' not in input:
+            raise ValueError('Mandatory argument object_type not provided')
+        index = self._alias_index(ctx, input)
+        aliassets = index.alias_sets(input['object_type'])
         #END get_aliassets
 
         # At some point might do deeper type checking...
@@ -465,6 +777,39 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: fbaMeta
         #BEGIN runfba
+        self._check_engine('runfba')
+        for arg in ('model', 'workspace'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        if input.get('findminmedia'):
+            raise ValueError('Option findminmedia is not supported by the ' +
+                             'in-process FBA engine')
+        network, model_ref = self._model_network(
+            ctx, input.get('model_workspace') or input['workspace'],
+            input['model'])
+        formulation = FBA.default_formulation(input.get('formulation'))
+        media, media_ref = self._get_object(
+            ctx, formulation['media_workspace'], formulation['media'])
+        problem = FBA.FBAProblem(network, formulation, media)
+        solution = problem.solve()
+        minimum = maximum = None
+        if input.get('fva'):
+            minimum, maximum = problem.fva(solution, self.fba_processes)
+        assertions = None
+        if input.get('simulateko'):
+            assertions, solved = problem.knockout_screen(solution,
+                                                         self.fba_processes)
+            ctx.log_debug('knockout screen: %d genes, %d solved' %
+                          (len(assertions), solved))
+        if input.get('minimizeflux'):
+            solution = problem.minimize_flux(solution)
+        fba_id = input.get('fba') or '%s.fba.%d' % (input['model'],
+                                                    int(time.time()))
+        fba = problem.fba_object(solution, fba_id, model_ref, media_ref,
+                                 minimum, maximum, assertions)
+        fba['fluxMinimization'] = input.get('minimizeflux', 0)
+        fbaMeta = self._save_object(ctx, fba, 'KBaseFBA.FBA',
+                                    input['workspace'], fba_id)
         #END runfba
 
         # At some point might do deeper type checking...
@@ -474,6 +819,125 @@ uniquely identifies a workspace among all workspaces.
         # return the results
         return [fbaMeta]
 
+    def runfba_batch(self, ctx, input):
+        # ctx is the context object
+        # return variables are: output
+        #BEGIN runfba_batch
+        self._check_engine('runfba_batch')
+        for arg in ('model', 'formulations', 'workspace'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        formulations = [FBA.default_formulation(formulation)
+                        for formulation in input['formulations']]
+        fba_ids = input.get('fbas') or []
+        if input.get('save_fbas') and fba_ids and (len(fba_ids) !=
+                                                   len(formulations)):
+            raise ValueError('%d FBA IDs given for %d formulations' %
+                             (len(fba_ids), len(formulations)))
+        network, model_ref = self._model_network(
+            ctx, input.get('model_workspace') or input['workspace'],
+            input['model'])
+        # every media is fetched once, however many formulations use it
+        media_ids = sorted(set((form['media_workspace'], form['media'])
+                               for form in formulations))
+        media = {}
+        if media_ids:
+            objects = self._workspace(ctx).get_objects(
+                [{'ref': '%s/%s' % ident} for ident in media_ids])
+            for ident, obj in zip(media_ids, objects):
+                info = obj['info']
+                media[ident] = (obj['data'],
+                                '%s/%s/%s' % (info[6], info[0], info[4]))
+        batch = FBA.solve_batch(
+            network, formulations,
+            [media[(form['media_workspace'], form['media'])][0]
+             for form in formulations], self.fba_processes)
+        fluxes = input.get('fluxes') or []
+        output = {'fluxes': fluxes, 'feasible': [], 'objectives': [],
+                  'values': [], 'fbaMetas': []}
+        fbas = []
+        start = int(time.time())
+        for i, (problem, solution) in enumerate(batch):
+            if input.get('minimizeflux'):
+                solution = problem.minimize_flux(solution)
+            output['feasible'].append(1 if solution.feasible else 0)
+            output['objectives'].append(solution.objective)
+            output['values'].append(problem.flux_values(solution, fluxes))
+            if input.get('save_fbas'):
+                fba_id = (fba_ids[i] if fba_ids else
+                          '%s.fba.%d.%d' % (input['model'], start, i))
+                form = formulations[i]
+                fba = problem.fba_object(
+                    solution, fba_id, model_ref,
+                    media[(form['media_workspace'], form['media'])][1])
+                fba['fluxMinimization'] = input.get('minimizeflux', 0)
+                fbas.append((fba_id, fba))
+        if fbas:
+            output['fbaMetas'] = self._save_objects(ctx, fbas, 'KBaseFBA.FBA',
+                                                    input['workspace'])
+        ctx.log_debug('batch FBA: %d formulations, %d saved' %
+                      (len(formulations), len(fbas)))
+        #END runfba_batch
+
+        # At some point might do deeper type checking...
+        if not isinstance(output, dict):
+            raise ValueError('Method runfba_batch return value ' +
+                             'output is not type dict as required.')
+        # return the results
+        return [output]
+
+    def fba_parameter_sweep(self, ctx, input):
+        # ctx is the context object
+        # return variables are: output
+        #BEGIN fba_parameter_sweep
+        self._check_engine('fba_parameter_sweep')
+        for arg in ('model', 'model_workspace', 'parameters'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        network = self._model_network(ctx, input['model_workspace'],
+                                      input['model'])[0]
+        formulation = FBA.default_formulation(input.get('formulation'))
+        media = self._get_object(ctx, formulation['media_workspace'],
+                                 formulation['media'])[0]
+        problem = FBA.FBAProblem(network, formulation, media)
+        output = problem.sweep(input['parameters'], input.get('compounds'),
+                               self.fba_processes)
+        #END fba_parameter_sweep
+
+        # At some point might do deeper type checking...
+        if not isinstance(output, dict):
+            raise ValueError('Method fba_parameter_sweep return value ' +
+                             'output is not type dict as required.')
+        # return the results
+        return [output]
+
+    def simulate_double_knockouts(self, ctx, input):
+        # ctx is the context object
+        # return variables are: output
+        #BEGIN simulate_double_knockouts
+        self._check_engine('simulate_double_knockouts')
+        for arg in ('model', 'model_workspace'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        network = self._model_network(ctx, input['model_workspace'],
+                                      input['model'])[0]
+        formulation = FBA.default_formulation(input.get('formulation'))
+        media = self._get_object(ctx, formulation['media_workspace'],
+                                 formulation['media'])[0]
+        problem = FBA.FBAProblem(network, formulation, media)
+        output = problem.double_knockout_matrix(
+            problem.solve(), input.get('genes'), self.fba_processes)
+        ctx.log_debug('double knockouts: %d genes, %d solved' %
+                      (len(output['genes']), output['solved']))
+        #END simulate_double_knockouts
+
+        # At some point might do deeper type checking...
+        if not isinstance(output, dict):
+            raise ValueError('Method simulate_double_knockouts return value ' +
+                             'output is not type dict as required.')
+        # return the results
+        return [output]
+
     def quantitative_optimization(self, ctx, input):
         # ctx is the context object
         # return variables are: output
@@ -491,6 +955,36 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: output
         #BEGIN generate_model_stats
+        self._check_engine('generate_model_stats')
+        if 'model' not in input:
+            raise ValueError('Mandatory argument model not provided')
+        workspace = input.get('model_workspace') or input.get('workspace')
+        if workspace is None:
+            raise ValueError('Mandatory argument model_workspace not provided')
+        model, model_ref = self._get_object(ctx, workspace, input['model'])
+        network = self.model_cache.get(
+            model_ref, lambda: model, lambda ref: self._object_ref(ctx, ref))
+        ws = self._workspace(ctx)
+        genome = {}
+        if model.get('genome_ref'):
+            genome = ws.get_objects([{'ref': model['genome_ref']}])[0]['data']
+        mapping = None
+        if model.get('template_ref'):
+            # only the mapping reference of the template is needed
+            template = ws.get_object_subset(
+                [{'ref': model['template_ref'],
+                  'included': ['mapping_ref']}])[0]['data']
+            if template.get('mapping_ref'):
+                mapping = ws.get_objects(
+                    [{'ref': template['mapping_ref']}])[0]['data']
+        minimal_media = self._get_object(
+            ctx, input.get('minimal_media_workspace') or
+            self.minimal_media[0],
+            input.get('minimal_media') or self.minimal_media[1])[0]
+        output, solved = ModelStats.model_statistics(
+            network, model, genome, mapping, None, minimal_media,
+            self.fba_processes)
+        ctx.log_debug('model statistics: %d solved' % solved)
         #END generate_model_stats
 
         # At some point might do deeper type checking...
@@ -543,6 +1037,38 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: output
         #BEGIN simulate_phenotypes
+        self._check_engine('simulate_phenotypes')
+        for arg in ('model', 'phenotypeSet', 'workspace'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        for option in ('all_transporters', 'positive_transporters'):
+            if input.get(option):
+                raise ValueError('Option %s is not supported by the ' %
+                                 option + 'in-process FBA engine')
+        network, model_ref = self._model_network(
+            ctx, input.get('model_workspace') or input['workspace'],
+            input['model'])
+        phenoset, phenoset_ref = self._get_object(
+            ctx, input.get('phenotypeSet_workspace') or input['workspace'],
+            input['phenotypeSet'])
+        formulation = FBA.default_formulation(input.get('formulation'))
+        if (input.get('biomass') and
+                formulation['objectiveTerms'] ==
+                FBA.FORMULATION_DEFAULTS['objectiveTerms']):
+            formulation['objectiveTerms'] = [[1, 'biomassflux',
+                                              input['biomass']]]
+        media = self._phenotype_media(ctx, phenoset)
+        simset_id = (input.get('phenotypeSimulationSet') or
+                     input['phenotypeSet'] + '.simulation')
+        simset = {'id': simset_id,
+                  'fbamodel_ref': model_ref,
+                  'phenotypeset_ref': phenoset_ref,
+                  'phenotypeSimulations': FBA.simulate_phenotypes(
+                      network, formulation, phenoset, phenoset_ref, media,
+                      self.fba_processes)}
+        output = self._save_object(ctx, simset,
+                                   'KBasePhenotypes.PhenotypeSimulationSet',
+                                   input['workspace'], simset_id)
         #END simulate_phenotypes
 
         # At some point might do deeper type checking...
@@ -582,6 +1108,32 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: modelMeta
         #BEGIN integrate_reconciliation_solutions
+        self._check_engine('integrate_reconciliation_solutions')
+        for arg in ('model', 'workspace', 'gapfillSolutions',
+                    'gapgenSolutions'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        model, model_ref = self._get_object(
+            ctx, input.get('model_workspace') or input['workspace'],
+            input['model'])
+        network = self.model_cache.get(
+            model_ref, lambda: model, lambda ref: self._object_ref(ctx, ref))
+        gapfills = self._study_solutions(
+            ctx, model.get('gapfillings') or [], input['gapfillSolutions'],
+            ('fba_ref', 'gapfill_ref'), 'gapfillingSolutions')
+        gapgens = self._study_solutions(
+            ctx, model.get('gapgens') or [], input['gapgenSolutions'],
+            ('gapgen_ref',), 'gapgenSolutions')
+        database = None
+        if gapfills:
+            database = self._reaction_database(ctx,
+                                               network.biochemistry_ref)
+        Reconciliation.integrate_solutions(model, network, database,
+                                           gapfills, gapgens)
+        modelMeta = self._save_object(ctx, model, 'KBaseFBA.FBAModel',
+                                      input['workspace'],
+                                      input.get('out_model') or
+                                      input['model'])
         #END integrate_reconciliation_solutions
 
         # At some point might do deeper type checking...
@@ -621,6 +1173,50 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: modelMeta
         #BEGIN gapfill_model
+        self._check_engine('gapfill_model')
+        for arg in ('model', 'workspace'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        model, model_ref = self._get_object(
+            ctx, input.get('model_workspace') or input['workspace'],
+            input['model'])
+        network = self.model_cache.get(
+            model_ref, lambda: model, lambda ref: self._object_ref(ctx, ref))
+        gapfill = input.get('formulation') or {}
+        formulation = FBA.default_formulation(gapfill.get('formulation'))
+        media, media_ref = self._get_object(
+            ctx, formulation['media_workspace'], formulation['media'])
+        problem = Gapfill.GapfillProblem(
+            network, model, self._reaction_database(
+                ctx, network.biochemistry_ref),
+            formulation, media, gapfill)
+        ctx.log_debug('gapfill candidates: %d of %d kept after pruning, ' %
+                      (len(problem.candidates), problem.candidate_count) +
+                      '%d model reactions reversible' %
+                      len(problem.reversible))
+        gfsolutions, solution = problem.solve(self.fba_processes)
+        if not gfsolutions:
+            raise ValueError('Analysis completed, but no valid solutions '
+                             'found!')
+        ctx.log_debug('gapfill solutions: %d of %d requested found' %
+                      (len(gfsolutions), problem.options['num_solutions']))
+        gfsolution = gfsolutions[0]
+        out_model = input.get('out_model') or input['model']
+        fba_id = out_model + '.gffba'
+        fba = problem.fba_object(solution, gfsolutions, fba_id, model_ref,
+                                 media_ref)
+        info = self._save_object(ctx, fba, 'KBaseFBA.FBA',
+                                 input['workspace'], fba_id)
+        gapfilling = {'id': fba_id, 'gapfill_id': fba_id,
+                      'fba_ref': '%s/%s/%s' % (info[6], info[0], info[4]),
+                      'media_ref': media_ref, 'integrated': 0}
+        if input.get('integrate_solution'):
+            Gapfill.integrate_solution(model, problem.database, gfsolution)
+            gapfilling['integrated'] = 1
+            gapfilling['integrated_solution'] = gfsolution['id']
+        model.setdefault('gapfillings', []).append(gapfilling)
+        modelMeta = self._save_object(ctx, model, 'KBaseFBA.FBAModel',
+                                      input['workspace'], out_model)
         #END gapfill_model
 
         # At some point might do deeper type checking...
@@ -634,6 +1230,10 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: job
         #BEGIN queue_gapgen_model
+        # jobs are queued and run by the perl service
+        raise ValueError('Method queue_gapgen_model is not supported by the ' +
+                         'python server, which has no job queue; call ' +
+                         'gapgen_model to run gap generation in process')
         #END queue_gapgen_model
 
         # At some point might do deeper type checking...
@@ -647,6 +1247,61 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: modelMeta
         #BEGIN gapgen_model
+        self._check_engine('gapgen_model')
+        for arg in ('model', 'workspace'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        model, model_ref = self._get_object(
+            ctx, input.get('model_workspace') or input['workspace'],
+            input['model'])
+        network = self.model_cache.get(
+            model_ref, lambda: model, lambda ref: self._object_ref(ctx, ref))
+        gapgen = dict(input.get('formulation') or {})
+        for option in ('timePerSolution', 'totalTimeLimit'):
+            if input.get(option) is not None:
+                gapgen[option] = input[option]
+        gapgen = Gapgen.default_gapgen_formulation(gapgen)
+        formulation = gapgen['formulation']
+        media, media_ref = self._get_object(
+            ctx, formulation['media_workspace'], formulation['media'])
+        refmedia, refmedia_ref = self._get_object(
+            ctx, gapgen['refmedia_workspace'], gapgen['refmedia'])
+        problem = Gapgen.GapgenProblem(network, media, refmedia, gapgen)
+        removals, solution = problem.solve(self.fba_processes)
+        ctx.log_debug('gapgen: %d single removals solved in the target ' %
+                      problem.solved[0] + 'media, %d in the reference ' %
+                      problem.solved[1] + 'media, %d combination solves; ' %
+                      problem.combinations + '%d of %d requested found' %
+                      (len(removals), gapgen['num_solutions']))
+        gg_id = input.get('gapGen') or '%s.gg.%d' % (input['model'],
+                                                     int(time.time()))
+        fba_id = gg_id + '.ggfba'
+        info = self._save_object(
+            ctx, problem.problem.fba_object(solution, fba_id, model_ref,
+                                            media_ref),
+            'KBaseFBA.FBA', input['workspace'], fba_id)
+        fba_ref = '%s/%s/%s' % (info[6], info[0], info[4])
+        gapgeneration = problem.gapgen_object(gg_id, removals, fba_ref,
+                                              model_ref, media_ref,
+                                              refmedia_ref)
+        info = self._save_object(ctx, gapgeneration,
+                                 'KBaseFBA.Gapgeneration',
+                                 input['workspace'], gg_id)
+        gapgen_entry = {'id': gg_id, 'gapgen_id': gg_id,
+                        'gapgen_ref': '%s/%s/%s' % (info[6], info[0],
+                                                    info[4]),
+                        'fba_ref': fba_ref, 'media_ref': media_ref,
+                        'integrated': 0}
+        solutions = gapgeneration['gapgenSolutions']
+        if input.get('integrate_solution') and solutions:
+            Gapgen.integrate_solution(model, solutions[0])
+            gapgen_entry['integrated'] = 1
+            gapgen_entry['integrated_solution'] = solutions[0]['id']
+        model.setdefault('gapgens', []).append(gapgen_entry)
+        modelMeta = self._save_object(ctx, model, 'KBaseFBA.FBAModel',
+                                      input['workspace'],
+                                      input.get('out_model') or
+                                      input['model'])
         #END gapgen_model
 
         # At some point might do deeper type checking...
@@ -660,6 +1315,12 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: job
         #BEGIN queue_wildtype_phenotype_reconciliation
+        # jobs are queued and run by the perl service
+        raise ValueError(
+            'Method %s is not supported by the python server, which has '
+            'no job queue; call reconcile_phenotypes to run the '
+            'reconciliation in process' %
+            'queue_wildtype_phenotype_reconciliation')
         #END queue_wildtype_phenotype_reconciliation
 
         # At some point might do deeper type checking...
@@ -673,6 +1334,12 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: job
         #BEGIN queue_reconciliation_sensitivity_analysis
+        # jobs are queued and run by the perl service
+        raise ValueError(
+            'Method %s is not supported by the python server, which has '
+            'no job queue; call reconcile_phenotypes to run the '
+            'reconciliation in process' %
+            'queue_reconciliation_sensitivity_analysis')
         #END queue_reconciliation_sensitivity_analysis
 
         # At some point might do deeper type checking...
@@ -686,6 +1353,12 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: job
         #BEGIN queue_combine_wildtype_phenotype_reconciliation
+        # jobs are queued and run by the perl service
+        raise ValueError(
+            'Method %s is not supported by the python server, which has '
+            'no job queue; call reconcile_phenotypes to run the '
+            'reconciliation in process' %
+            'queue_combine_wildtype_phenotype_reconciliation')
         #END queue_combine_wildtype_phenotype_reconciliation
 
         # At some point might do deeper type checking...
@@ -695,6 +1368,26 @@ uniquely identifies a workspace among all workspaces.
         # return the results
         return [job]
 
+    def reconcile_phenotypes(self, ctx, input):
+        # ctx is the context object
+        # return variables are: output
+        #BEGIN reconcile_phenotypes
+        self._check_engine('reconcile_phenotypes')
+        stage = 'reconcile'
+        if input.get('combine_solutions'):
+            stage = 'combine'
+        elif input.get('sensitivity_analysis'):
+            stage = 'sensitivity'
+        output = self._reconciliation(ctx, input, stage)
+        #END reconcile_phenotypes
+
+        # At some point might do deeper type checking...
+        if not isinstance(output, dict):
+            raise ValueError('Method reconcile_phenotypes return value ' +
+                             'output is not type dict as required.')
+        # return the results
+        return [output]
+
     def run_job(self, ctx, input):
         # ctx is the context object
         # return variables are: job
@@ -764,6 +1457,52 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: output
         #BEGIN reaction_sensitivity_analysis
+        self._check_engine('reaction_sensitivity_analysis')
+        for arg in ('model', 'workspace'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        input = Sensitivity.default_parameters(input)
+        if (not input.get('reactions_to_delete') and
+                not input.get('gapfill_solution_id')):
+            raise ValueError('Must specify either reactions_to_delete or a '
+                             'gapfill solution ID')
+        network, model_ref = self._model_network(
+            ctx, input.get('model_ws') or input['workspace'], input['model'])
+        deletions = Sensitivity.signed_deletions(
+            input.get('reactions_to_delete') or [])
+        if input.get('gapfill_solution_id'):
+            gapfill_id, index = Sensitivity.parse_solution_id(
+                input['gapfill_solution_id'])
+            gapfill, gapfill_ref = self._get_object(
+                ctx, input.get('gapfill_ws') or input['workspace'],
+                gapfill_id)
+            solution_deletions = Sensitivity.solution_deletions(
+                network, gapfill, index)
+            if not solution_deletions:
+                raise ValueError('No reactions in the specified gapfill '
+                                 'solution were found in the model (did you '
+                                 'integrate the gapfill solution first?)')
+            if input.get('rxnprobs_id'):
+                rxnprobs, rxnprobs_ref = self._get_object(
+                    ctx, input.get('rxnprobs_ws') or input['workspace'],
+                    input['rxnprobs_id'])
+                solution_deletions = Sensitivity.sort_by_likelihood(
+                    solution_deletions, rxnprobs)
+            deletions.extend(solution_deletions)
+        formulation, media = self._sensitivity_formulation(ctx, network,
+                                                           input)
+        problem = Sensitivity.SensitivityProblem(network, formulation, media)
+        delete = bool(input['delete_noncontributing_reactions'])
+        results, solution = problem.solve(deletions, delete,
+                                          self.fba_processes)
+        ctx.log_debug('reaction sensitivity: %d deletions tested, ' %
+                      len(results) + '%d programs solved' % problem.solved)
+        rs_id = '%s.rxnsens.%d' % (input['model'], int(time.time()))
+        output = self._save_object(
+            ctx, problem.sensitivity_object(rs_id, results, model_ref,
+                                            input['type'], delete),
+            'KBaseFBA.ReactionSensitivityAnalysis', input['workspace'],
+            input.get('rxnsens_uid') or rs_id)
         #END reaction_sensitivity_analysis
 
         # At some point might do deeper type checking...
@@ -777,6 +1516,35 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: output
         #BEGIN filter_iterative_solutions
+        self._check_engine('filter_iterative_solutions')
+        for arg in ('model', 'workspace', 'cutoff', 'gapfillsln'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        model_ws = input.get('input_model_ws') or input['workspace']
+        model, model_ref = self._get_object(ctx, model_ws, input['model'])
+        network = self.model_cache.get(
+            model_ref, lambda: model, lambda ref: self._object_ref(ctx, ref))
+        gapfill_id = Sensitivity.parse_solution_id(input['gapfillsln'])[0]
+        gapfill, gapfill_ref = self._get_object(ctx, model_ws, gapfill_id)
+        deletions = Curation.ModelDeletions(network)
+        for cost, reactions in Curation.iterative_solutions(gapfill):
+            if reactions and float(cost) / len(reactions) > input['cutoff']:
+                for rxn_id, direction in reactions:
+                    deletions.add(rxn_id, direction)
+        if deletions.directions:
+            media = None
+            if gapfill.get('media_ref'):
+                media = self._get_object_info(ctx, gapfill['media_ref'])[0]
+            growth = deletions.verify(media=media,
+                                      processes=self.fba_processes)
+            ctx.log_debug('filtered model objective %g, %g before' %
+                          growth[::-1])
+        removed, narrowed = deletions.apply(model)
+        ctx.log_debug('filter_iterative_solutions: %d reactions removed, ' %
+                      len(removed) + '%d made irreversible' % len(narrowed))
+        output = self._save_object(ctx, model, 'KBaseFBA.FBAModel',
+                                   input['workspace'],
+                                   input.get('outmodel') or input['model'])
         #END filter_iterative_solutions
 
         # At some point might do deeper type checking...
@@ -790,6 +1558,64 @@ uniquely identifies a workspace among all workspaces.
         # ctx is the context object
         # return variables are: output
         #BEGIN delete_noncontributing_reactions
+        self._check_engine('delete_noncontributing_reactions')
+        for arg in ('rxn_sensitivity', 'workspace'):
+            if arg not in input:
+                raise ValueError('Mandatory argument %s not provided' % arg)
+        rxnsens, rxnsens_info = self._get_object_info(ctx, '%s/%s' % (
+            input.get('rxn_sensitivity_ws') or input['workspace'],
+            input['rxn_sensitivity']))
+        # the model object is only fetched on a cache miss or to save it
+        model_ref = self._object_ref(ctx, rxnsens['fbamodel_ref'])
+        fetched = []
+
+        def load_model():
+            fetched.append(self._get_object_info(ctx, model_ref))
+            return fetched[0][0]
+        network = self.model_cache.get(
+            model_ref, load_model, lambda ref: self._object_ref(ctx, ref))
+        deletions = Curation.ModelDeletions(network)
+        for rxn in rxnsens.get('reactions', []):
+            if rxn.get('delete'):
+                # objects from before directions were recorded delete the
+                # whole reaction
+                deletions.add(FBA._ref_id(rxn['modelreaction_ref']),
+                              rxn.get('direction') or '=')
+                rxn['deleted'] = 1
+        if deletions.directions:
+            # verified under the options the analysis takes, which the
+            # ReactionSensitivityAnalysis object does not record
+            formulation, media = self._sensitivity_formulation(
+                ctx, network, Sensitivity.default_parameters(input))
+            growth = deletions.verify(formulation, media,
+                                      self.fba_processes)
+            ctx.log_debug('model objective %g after deletions, %g before' %
+                          growth[::-1])
+        model, model_info = (fetched[0] if fetched else
+                             self._get_object_info(ctx, model_ref))
+        removed, narrowed = deletions.apply(model)
+        ctx.log_debug('delete_noncontributing_reactions: %d reactions ' %
+                      len(removed) + 'removed, %d made irreversible' %
+                      len(narrowed))
+        if input.get('new_model_uid'):
+            output = self._save_object(ctx, model, 'KBaseFBA.FBAModel',
+                                       input['workspace'],
+                                       input['new_model_uid'])
+        else:
+            output = self._save_object(ctx, model, 'KBaseFBA.FBAModel',
+                                       model_info[7], model_info[1])
+        rxnsens['fbamodel_ref'] = '%s/%s/%s' % (output[6], output[0],
+                                                output[4])
+        rxnsens['integrated_deletions_in_model'] = 1
+        if input.get('new_rxn_sensitivity_uid'):
+            self._save_object(ctx, rxnsens,
+                              'KBaseFBA.ReactionSensitivityAnalysis',
+                              input['workspace'],
+                              input['new_rxn_sensitivity_uid'])
+        else:
+            self._save_object(ctx, rxnsens,
+                              'KBaseFBA.ReactionSensitivityAnalysis',
+                              rxnsens_info[7], rxnsens_info[1])
         #END delete_noncontributing_reactions
 
         # At some point might do deeper type checking...
@@ -2,8 +2,14 @@
 from wsgiref.simple_server import make_server
 import sys
 import json
+import time
+import itertools
+import threading
+import zlib
 import traceback
+from collections import OrderedDict
 from multiprocessing import Process
+from multiprocessing.pool import ThreadPool
 from getopt import getopt, GetoptError
 from jsonrpcbase import JSONRPCService, InvalidParamsError, KeywordError,\
     JSONRPCError, ServerError, InvalidRequestError
@@ -56,6 +62,24 @@ class JSONObjectEncoder(json.JSONEncoder):
 
 class JSONRPCServiceCustom(JSONRPCService):
 
+    def __init__(self, max_batch_workers=1):
+        """
+        Arguments:
+        max_batch_workers -- maximum number of requests from a single batch
+            that are executed concurrently. 1 runs batches serially.
+        """
+        JSONRPCService.__init__(self)
+        self.max_batch_workers = max(1, int(max_batch_workers))
+        self.batch_unsafe = set()
+
+    def set_batch_unsafe(self, name):
+        """
+        Marks a method as unsafe for concurrent execution within a batch. An
+        unsafe method is run on its own, after every request preceding it in
+        the batch has finished and before any request following it starts.
+        """
+        self.batch_unsafe.add(name)
+
     def call(self, ctx, jsondata):
         """
         Calls jsonrpc service's method and returns its return value in a JSON
@@ -70,6 +94,52 @@ class JSONRPCServiceCustom(JSONRPCService):
 
         return None
 
+    def call_iter(self, ctx, jsondata, chunk_size=65536, min_size=None):
+        """
+        Calls jsonrpc service's method and returns its return value encoded
+        as JSON: as a string if it is shorter than min_size bytes, and
+        otherwise as an iterator over chunks of roughly chunk_size bytes.
+        Returns None if there is no return value.
+
+        The method itself runs to completion before this returns, so any
+        error it raises is raised here, as is an error encoding the first
+        min_size bytes. The rest of a streamed result is produced while the
+        iterator is consumed and never held in memory in full.
+
+        Arguments:
+        jsondata -- remote method call in jsonrpc format
+        chunk_size -- number of bytes to accumulate before yielding
+        min_size -- smallest result to stream (default chunk_size)
+        """
+        result = self.call_py(ctx, jsondata)
+        if result is not None:
+            if min_size is None:
+                min_size = chunk_size
+            chunks = self._encode_chunks(result, chunk_size)
+            head = []
+            head_len = 0
+            for chunk in chunks:
+                head.append(chunk)
+                head_len += len(chunk)
+                if head_len >= min_size:
+                    return itertools.chain(head, chunks)
+            return ''.join(head)
+
+        return None
+
+    def _encode_chunks(self, result, chunk_size):
+        buf = []
+        buf_len = 0
+        for part in JSONObjectEncoder().iterencode(result):
+            buf.append(part)
+            buf_len += len(part)
+            if buf_len >= chunk_size:
+                yield ''.join(buf)
+                buf = []
+                buf_len = 0
+        if buf:
+            yield ''.join(buf)
+
     def _call_method(self, ctx, request):
         """Calls given method with given params and returns it value."""
         method = self.method_data[request['method']]['method']
@@ -139,20 +209,37 @@ class JSONRPCServiceCustom(JSONRPCService):
         elif isinstance(rdata, list) and rdata:
             # It's a batch.
             requests = []
-            responds = []
 
             for rdata_ in rdata:
                 # set some default values for error handling
                 request_ = self._get_default_vals()
-                self._fill_request(request_, rdata_)
+                try:
+                    self._fill_request(request_, rdata_)
+                except JSONRPCError as jre:
+                    request_['error'] = jre
                 requests.append(request_)
 
-            for request_ in requests:
-                respond = self._handle_request(ctx, request_)
-                # Don't respond to notifications
-                if respond is not None:
-                    responds.append(respond)
+            responds = [None] * len(requests)
+            for segment in self._batch_segments(requests):
+                if len(segment) == 1 or self.max_batch_workers == 1:
+                    for i in segment:
+                        responds[i] = self._handle_batch_request(
+                            ctx, requests[i])
+                    continue
+                pool = ThreadPool(min(self.max_batch_workers, len(segment)))
+                try:
+                    results = pool.map(
+                        lambda i: self._handle_batch_request(ctx,
+                                                             requests[i]),
+                        segment)
+                finally:
+                    pool.close()
+                    pool.join()
+                for i, respond in zip(segment, results):
+                    responds[i] = respond
 
+            # Don't respond to notifications
+            responds = [r for r in responds if r is not None]
             if responds:
                 return responds
 
@@ -162,6 +249,65 @@ class JSONRPCServiceCustom(JSONRPCService):
             # empty dict, list or wrong type
             raise InvalidRequestError
 
+    def _batch_segments(self, requests):
+        """
+        Splits the indexes of a batch into runs that may execute together.
+        Consecutive batch safe requests share a run; a batch unsafe request
+        always forms a run of its own.
+        """
+        segment = []
+        for i, request in enumerate(requests):
+            if request.get('method') in self.batch_unsafe:
+                if segment:
+                    yield segment
+                    segment = []
+                yield [i]
+            else:
+                segment.append(i)
+        if segment:
+            yield segment
+
+    def _handle_batch_request(self, ctx, request):
+        """
+        Handles one element of a batch. Errors are returned as the element's
+        response rather than raised, so that one failing call does not fail
+        the rest of the batch.
+        """
+        ctx_ = MethodContext(ctx._logger)
+        ctx_.update(ctx)
+        ctx_['call_id'] = request['id']
+        if 'method' in request:
+            ctx_['module'], ctx_['method'] = request['method'].split('.', 1)
+        try:
+            if 'error' in request:
+                raise request['error']
+            return self._handle_request(ctx_, request)
+        except JSONRPCError as jre:
+            err = {'error': {'code': jre.code,
+                             'name': jre.message,
+                             'message': jre.data
+                             }
+                   }
+            trace = jre.trace if hasattr(jre, 'trace') else None
+        except Exception:
+            err = {'error': {'code': 0,
+                             'name': 'Unexpected Server Error',
+                             'message': 'An unexpected server error ' +
+                                        'occurred',
+                             }
+                   }
+            trace = traceback.format_exc()
+        if trace:
+            ctx_.log_err(trace.split('\n')[0:-1])
+        err['id'] = request['id']
+        self._fill_ver(request['jsonrpc'], err)
+        if 'jsonrpc' in err:
+            err['error']['data'] = trace
+        else:
+            err.setdefault('version', '1.0')
+            err['error']['error'] = trace
+        return err
+
     def _handle_request(self, ctx, request):
         """Handles given request and returns its response."""
         if self.method_data[request['method']].has_key('types'): # @IgnorePep8
@@ -225,6 +371,92 @@ class MethodContext(dict):
                                  self['method'], self['call_id'])
 
 
+class TokenCache(object):
+    '''
+    Bounded LRU cache of token validation results, so that repeated calls
+    with the same token skip the round trip to the auth service. Validated
+    tokens are kept for ttl seconds (never past the expiry embedded in the
+    token), rejected tokens for negative_ttl seconds. Only the exceptions
+    in rejections count as a rejection of the token: the nexus client
+    raises ValueError for a bad signature or an expired token. Any other
+    failure, such as a timeout reaching the auth service, is raised
+    without being cached.
+
+    The cache lives in the worker process, so every uwsgi worker keeps its
+    own. The lock is never held while a token is being validated, which
+    keeps the cache usable when the std libraries are monkeypatched by
+    gevent.
+    '''
+
+    def __init__(self, validate, size=500, ttl=300, negative_ttl=30,
+                 rejections=(ValueError,)):
+        self._validate = validate
+        self.rejections = rejections
+        self.size = size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate_token(self, token):
+        '''
+        Returns the user name for the token or raises the exception the auth
+        service raised for it.
+        '''
+        now = time.time()
+        with self._lock:
+            entry = self._cache.pop(token, None)
+            if entry is not None and entry[0] > now:
+                self._cache[token] = entry
+                self.hits += 1
+                if entry[2] is not None:
+                    error, args = entry[2]
+                    raise error(*args)
+                return entry[1]
+            self.misses += 1
+        try:
+            user, _, _ = self._validate(token)
+        except self.rejections as e:
+            # the class and arguments of the rejection are kept, so that
+            # every call raises an exception of its own
+            self._store(token, (now + self.negative_ttl, None,
+                                (e.__class__, e.args)))
+            raise
+        expiry = now + self.ttl
+        token_expiry = self._token_expiry(token)
+        if token_expiry is not None:
+            expiry = min(expiry, token_expiry)
+        self._store(token, (expiry, user, None))
+        return user
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._cache)}
+
+    def _store(self, token, entry):
+        if self.size < 1:
+            return
+        with self._lock:
+            self._cache.pop(token, None)
+            self._cache[token] = entry
+            while len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+
+    def _token_expiry(self, token):
+        # globus nexus tokens are a | separated list of key=value pairs,
+        # one of which is the expiry time in epoch seconds
+        for field in token.split('|'):
+            if field.startswith('expiry='):
+                try:
+                    return float(field[len('expiry='):])
+                except ValueError:
+                    return None
+        return None
+
+
 def getIPAddress(environ):
     xFF = environ.get('HTTP_X_FORWARDED_FOR')
     realIP = environ.get('HTTP_X_REAL_IP')
@@ -262,7 +494,21 @@ class Application(object):
             submod, ip_address=True, authuser=True, module=True, method=True,
             call_id=True, logfile=self.userlog.get_log_file())
         self.serverlog.set_log_level(6)
-        self.rpc_service = JSONRPCServiceCustom()
+        max_batch_workers = 1
+        if config is not None and config.get('batch_max_workers'):
+            max_batch_workers = int(config['batch_max_workers'])
+        self.rpc_service = JSONRPCServiceCustom(max_batch_workers)
+        self.gzip_level = 6
+        self.gzip_min_size = 1024
+        if config is not None:
+            if config.get('gzip_level'):
+                self.gzip_level = int(config['gzip_level'])
+            if config.get('gzip_min_size'):
+                self.gzip_min_size = int(config['gzip_min_size'])
+        self.stream_chunk_size = 0
+        if config is not None and config.get('stream_responses') == 'true':
+            self.stream_chunk_size = int(
+                config.get('stream_chunk_size') or 65536)
         self.method_authentication = dict()
         self.rpc_service.add(impl_fbaModelServices.get_models,
                              name='fbaModelServices.get_models',
@@ -388,6 +634,18 @@ class Application(object):
                              name='fbaModelServices.runfba',
                              types=[dict])
         self.method_authentication['fbaModelServices.runfba'] = 'required'
+        self.rpc_service.add(impl_fbaModelServices.runfba_batch,
+                             name='fbaModelServices.runfba_batch',
+                             types=[dict])
+        self.method_authentication['fbaModelServices.runfba_batch'] = 'required'
+        self.rpc_service.add(impl_fbaModelServices.fba_parameter_sweep,
+                             name='fbaModelServices.fba_parameter_sweep',
+                             types=[dict])
+        self.method_authentication['fbaModelServices.fba_parameter_sweep'] = 'required'
+        self.rpc_service.add(impl_fbaModelServices.simulate_double_knockouts,
+                             name='fbaModelServices.simulate_double_knockouts',
+                             types=[dict])
+        self.method_authentication['fbaModelServices.simulate_double_knockouts'] = 'required'
         self.rpc_service.add(impl_fbaModelServices.quantitative_optimization,
                              name='fbaModelServices.quantitative_optimization',
                              types=[dict])
@@ -456,6 +714,10 @@ class Application(object):
                              name='fbaModelServices.queue_combine_wildtype_phenotype_reconciliation',
                              types=[dict])
         self.method_authentication['fbaModelServices.queue_combine_wildtype_phenotype_reconciliation'] = 'required'
+        self.rpc_service.add(impl_fbaModelServices.reconcile_phenotypes,
+                             name='fbaModelServices.reconcile_phenotypes',
+                             types=[dict])
+        self.method_authentication['fbaModelServices.reconcile_phenotypes'] = 'required'
         self.rpc_service.add(impl_fbaModelServices.run_job,
                              name='fbaModelServices.run_job',
                              types=[dict])
@@ -648,11 +910,37 @@ class Application(object):
                              name='fbaModelServices.build_tissue_model',
                              types=[dict])
         self.method_authentication['fbaModelServices.build_tissue_model'] = 'required'
+        # Only methods that neither write to the workspace nor start worker
+        # processes may run concurrently inside a batch: writes must see the
+        # calls before them, and forking a process pool from a thread while
+        # another holds a lock (token cache, model cache, logging) can
+        # deadlock the child. Every other method runs on its own.
+        batch_safe = set([
+            'get_models', 'get_fbas', 'get_gapfills', 'get_gapgens',
+            'get_reactions', 'get_compounds', 'get_alias', 'get_aliassets',
+            'get_media', 'get_biochemistry', 'genome_heatmap_from_pangenome',
+            'ortholog_family_from_pangenome', 'export_fbamodel',
+            'export_object', 'export_genome', 'export_media', 'export_fba',
+            'export_phenotypeSimulationSet', 'role_to_reactions',
+            'get_mapping', 'subsystem_of_roles', 'get_template_model',
+            'compare_models'])
+        if config is not None and config.get('batch_unsafe_methods'):
+            batch_safe.difference_update(
+                m.strip() for m in config['batch_unsafe_methods'].split(','))
+        for name in self.method_authentication:
+            if name.split('.', 1)[1] not in batch_safe:
+                self.rpc_service.set_batch_unsafe(name)
         self.auth_client = biokbase.nexus.Client(
             config={'server': 'nexus.api.globusonline.org',
                     'verify_ssl': True,
                     'client': None,
                     'client_secret': None})
+        cache_config = {'size': 500, 'ttl': 300, 'negative_ttl': 30}
+        for key in cache_config:
+            if config is not None and config.get('auth_cache_' + key):
+                cache_config[key] = int(config['auth_cache_' + key])
+        self.token_cache = TokenCache(self.auth_client.validate_token,
+                                      **cache_config)
 
     def __call__(self, environ, start_response):
         # Context object, equivalent to the perl impl CallContext
@@ -671,6 +959,17 @@ class Application(object):
         else:
             request_body = environ['wsgi.input'].read(body_size)
             try:
+                encoding = environ.get('HTTP_CONTENT_ENCODING', 'identity')
+                if encoding.strip().lower() == 'gzip':
+                    try:
+                        request_body = zlib.decompress(request_body,
+                                                       16 + zlib.MAX_WBITS)
+                    except zlib.error as ze:
+                        raise ValueError('Invalid gzip request body: %s' % ze)
+                elif encoding.strip().lower() != 'identity':
+                    status = '415 Unsupported Media Type'
+                    raise ValueError('Unsupported content encoding: %s' %
+                                     encoding)
                 req = json.loads(request_body)
             except ValueError as ve:
                 err = {'error': {'code': -32700,
@@ -680,14 +979,26 @@ class Application(object):
                        }
                 rpc_result = self.process_error(err, ctx, {'version': '1.1'})
             else:
-                ctx['module'], ctx['method'] = req['method'].split('.')
-                ctx['call_id'] = req['id']
+                if isinstance(req, list):
+                    methods = [r.get('method') for r in req
+                               if isinstance(r, dict)]
+                    ctx['module'], ctx['method'] = 'fbaModelServices', 'batch'
+                else:
+                    methods = [req['method']]
+                    ctx['module'], ctx['method'] = req['method'].split('.')
+                    ctx['call_id'] = req['id']
                 try:
                     token = environ.get('HTTP_AUTHORIZATION')
-                    # parse out the method being requested and check if it
-                    # has an authentication requirement
-                    auth_req = self.method_authentication.get(req['method'],
-                                                              "none")
+                    # parse out the methods being requested and check if
+                    # they have an authentication requirement; a batch is
+                    # held to the strictest requirement of its elements
+                    auth_reqs = set(self.method_authentication.get(m, "none")
+                                    for m in methods)
+                    auth_req = "none"
+                    for level in ('required', 'optional'):
+                        if level in auth_reqs:
+                            auth_req = level
+                            break
                     if auth_req != "none":
                         if token is None and auth_req == 'required':
                             err = ServerError()
@@ -698,8 +1009,7 @@ class Application(object):
                             pass
                         else:
                             try:
-                                user, _, _ = \
-                                    self.auth_client.validate_token(token)
+                                user = self.token_cache.validate_token(token)
                                 ctx['user_id'] = user
                                 ctx['authenticated'] = 1
                                 ctx['token'] = token
@@ -712,8 +1022,20 @@ class Application(object):
                     if (environ.get('HTTP_X_FORWARDED_FOR')):
                         self.log(log.INFO, ctx, 'X-Forwarded-For: ' +
                                  environ.get('HTTP_X_FORWARDED_FOR'))
+                    if (ctx['token'] is not None and
+                            self.serverlog.get_log_level() >= log.DEBUG):
+                        self.log(log.DEBUG, ctx, 'token cache: %(hits)d hits, '
+                                 '%(misses)d misses, %(size)d entries' %
+                                 self.token_cache.stats())
                     self.log(log.INFO, ctx, 'start method')
-                    rpc_result = self.rpc_service.call(ctx, req)
+                    if self.stream_chunk_size:
+                        # streamed results are never below the gzip
+                        # threshold
+                        rpc_result = self.rpc_service.call_iter(
+                            ctx, req, self.stream_chunk_size,
+                            max(self.stream_chunk_size, self.gzip_min_size))
+                    else:
+                        rpc_result = self.rpc_service.call(ctx, req)
                     self.log(log.INFO, ctx, 'end method')
                 except JSONRPCError as jre:
                     err = {'error': {'code': jre.code,
@@ -741,20 +1063,79 @@ class Application(object):
         # print 'The result from the method call is:\n%s\n' % \
         #    pprint.pformat(rpc_result)
 
-        if rpc_result:
-            response_body = rpc_result
-        else:
-            response_body = ''
-
         response_headers = [
             ('Access-Control-Allow-Origin', '*'),
             ('Access-Control-Allow-Headers', environ.get(
                 'HTTP_ACCESS_CONTROL_REQUEST_HEADERS', 'authorization')),
             ('content-type', 'application/json'),
-            ('content-length', str(len(response_body)))]
+            # tells clients gzipped request bodies are understood (RFC 7694)
+            ('Accept-Encoding', 'gzip'),
+            ('Vary', 'Accept-Encoding')]
+        gzip_ok = self.gzip_level > 0 and self._accepts_gzip(
+            environ.get('HTTP_ACCEPT_ENCODING', ''))
+
+        if rpc_result is not None and not isinstance(rpc_result, basestring):
+            # A streamed result, at least gzip_min_size bytes long. Without a
+            # content-length the wsgi container sends the chunks with chunked
+            # transfer encoding as they are produced
+            chunks = self._log_stream_errors(ctx, rpc_result)
+            if gzip_ok:
+                response_headers.append(('Content-Encoding', 'gzip'))
+                chunks = self._gzip_chunks(chunks)
+            start_response(status, response_headers)
+            return chunks
+
+        if rpc_result:
+            response_body = rpc_result
+        else:
+            response_body = ''
+
+        if gzip_ok and len(response_body) >= self.gzip_min_size:
+            compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED,
+                                          16 + zlib.MAX_WBITS)
+            response_body = compressor.compress(response_body) + \
+                compressor.flush()
+            response_headers.append(('Content-Encoding', 'gzip'))
+        response_headers.append(('content-length', str(len(response_body))))
         start_response(status, response_headers)
         return [response_body]
 
+    def _accepts_gzip(self, accept_encoding):
+        for coding in accept_encoding.split(','):
+            parts = coding.strip().split(';')
+            if parts[0].strip().lower() not in ('gzip', '*'):
+                continue
+            qvalue = 1.0
+            for param in parts[1:]:
+                name, _, value = param.strip().partition('=')
+                if name.strip() == 'q':
+                    try:
+                        qvalue = float(value)
+                    except ValueError:
+                        qvalue = 0.0
+            return qvalue > 0
+        return False
+
+    def _gzip_chunks(self, chunks):
+        compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED,
+                                      16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    def _log_stream_errors(self, context, chunks):
+        # the status line has already been sent by the time a chunk fails to
+        # encode, so all that can be done is to log and cut the body short
+        try:
+            for chunk in chunks:
+                yield chunk
+        except Exception:
+            self.log(log.ERR, context,
+                     traceback.format_exc().split('\n')[0:-1])
+            raise
+
     def process_error(self, error, context, request, trace=None):
         if trace:
             self.log(log.ERR, context, trace.split('\n')[0:-1])
@@ -1,32 +1,89 @@
 #!/usr/bin/python
 
-from biokbase.fbaModelServices.Client import fbaModelServices
+from biokbase.fbaModelServices.Transport import fbaModelServices
+from collections import deque
+from multiprocessing.pool import ThreadPool
 import optparse
 import subprocess
 import sys
 
-usage = """%prog object_type input_id_type output_id_type <input_ids, ;-delimited>
+usage = """%prog [options] object_type input_id_type output_id_type [<input_ids, ;-delimited>]
 E.g. %prog compound ModelSEED name "cpd00001;cpd00002"
+     %prog -i ids.txt compound ModelSEED KEGG > aliases.tsv
+     cut -f1 ids.tsv | %prog compound ModelSEED KEGG > aliases.tsv
 """
-description = """ Convert one type of alias into another. """
+description = """ Convert one type of alias into another. When no input IDs
+are given on the command line they are read one per line from the input file
+(or standard input), sent to the server in chunks, and written as
+tab-separated lines (input ID, then its aliases separated by ';') as the
+chunks complete. Input IDs with no alias are not written. """
 parser = optparse.OptionParser(usage=usage, description=description)
+parser.add_option("-u", "--url", dest="url", default="http://localhost:7036",
+                  help="URL of the fbaModelServices server (default %default)")
+parser.add_option("-i", "--input", dest="input", default="-",
+                  help="file with one input ID per line; - for standard input (default %default)")
+parser.add_option("-c", "--chunk-size", dest="chunk_size", type="int", default=1000,
+                  help="number of IDs per get_alias request (default %default)")
+parser.add_option("-t", "--threads", dest="threads", type="int", default=4,
+                  help="number of get_alias requests to run at once (default %default)")
 (options, args) = parser.parse_args()
 
-if len(args) < 4:
+if len(args) < 3 or options.chunk_size < 1 or options.threads < 1:
     p = subprocess.Popen(["python", sys.argv[0], "-h"], stdout=subprocess.PIPE)
     stdout, stderr = p.communicate()
     print stdout
     exit(1)
 
-fbaClient = fbaModelServices("http://localhost:7036")
+fbaClient = fbaModelServices(options.url, pool_size=options.threads)
 
-input_params = { "object_type" : args[0],
-                 "input_id_type" : args[1],
-                 "output_id_type" : args[2],
-                 "input_ids" : args[3].split(";")
-                 }
+def get_alias(input_ids):
+    input_params = { "object_type" : args[0],
+                     "input_id_type" : args[1],
+                     "output_id_type" : args[2],
+                     "input_ids" : input_ids
+                     }
+    return fbaClient.get_alias(input_params)
 
-aliaslist = fbaClient.get_alias(input_params)
+if len(args) > 3:
+    aliaslist = get_alias(args[3].split(";"))
+    for aliases in aliaslist:
+        print aliases
+    exit(0)
 
-for aliases in aliaslist:
-    print aliases
+def read_chunks(infile):
+    chunk = []
+    for line in infile:
+        input_id = line.strip()
+        if input_id:
+            chunk.append(input_id)
+            if len(chunk) == options.chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+def write_aliases(aliaslist):
+    for aliases in aliaslist:
+        line = u"%s\t%s\n" % (aliases["original_id"], u";".join(aliases["aliases"]))
+        sys.stdout.write(line.encode("utf-8"))
+    sys.stdout.flush()
+
+if options.input == "-":
+    infile = sys.stdin
+else:
+    infile = open(options.input)
+
+# Chunks are submitted as earlier ones finish, so no more than twice the
+# thread count are ever held in memory; output keeps the input order.
+pool = ThreadPool(options.threads)
+pending = deque()
+try:
+    for chunk in read_chunks(infile):
+        pending.append(pool.apply_async(get_alias, (chunk,)))
+        while len(pending) >= 2 * options.threads or (pending and pending[0].ready()):
+            write_aliases(pending.popleft().get())
+    while pending:
+        write_aliases(pending.popleft().get())
+finally:
+    pool.terminate()
+    fbaClient.close()
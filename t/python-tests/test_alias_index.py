@@ -0,0 +1,126 @@
+'''
+Tests of the precomputed alias index behind get_alias and get_aliassets.
+'''
+
+import gzip
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+from biokbase.fbaModelServices import AliasIndex
+
+REF = '1/2/3'
+
+# C00001 is an alias of two compounds, and cpd00001 has two KEGG aliases
+BIOCHEMISTRY = {
+    'compounds': [{'id': 'cpd00001', 'name': 'H2O'},
+                  {'id': 'cpd00002', 'name': 'ATP'},
+                  {'id': 'cpd00003', 'name': 'NAD'}],
+    'reactions': [{'id': 'rxn00001', 'name': 'inorganic diphosphatase'}],
+    'compound_aliases': {
+        'cpd00001': {'KEGG': ['C00001', 'C01328'], 'BiGG': ['h2o']},
+        'cpd00002': {'KEGG': ['C00002'], 'BiGG': ['atp']},
+        'cpd00003': {'KEGG': ['C00001'], 'BiGG': ['nad', 'h2o']}},
+    'reaction_aliases': {'rxn00001': {'KEGG': ['R00004']}}}
+
+
+class AliasIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = AliasIndex.AliasIndex.from_biochemistry(REF,
+                                                             BIOCHEMISTRY)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_from_biochemistry(self):
+        self.assertEqual(self.index.alias_sets('compound'),
+                         ['BiGG', 'KEGG', 'ModelSEED', 'name'])
+        self.assertEqual(self.index.alias_sets('Reaction'),
+                         ['KEGG', 'ModelSEED', 'name'])
+        self.assertEqual(
+            self.index.lookup('compound', 'ModelSEED', 'name',
+                              ['cpd00002']),
+            [{'original_id': 'cpd00002', 'aliases': ['ATP']}])
+        self.assertEqual(
+            self.index.lookup('reaction', 'KEGG', 'ModelSEED', ['R00004']),
+            [{'original_id': 'R00004', 'aliases': ['rxn00001']}])
+        self.assertRaises(ValueError, self.index.alias_sets, 'gene')
+
+    def test_many_to_many_lookup(self):
+        self.assertEqual(
+            self.index.lookup('compound', 'KEGG', 'ModelSEED',
+                              ['C01328', 'C99999', 'C00001']),
+            [{'original_id': 'C01328', 'aliases': ['cpd00001']},
+             {'original_id': 'C00001', 'aliases': ['cpd00001', 'cpd00003']}])
+        # aliases shared by the compounds are listed once
+        self.assertEqual(
+            self.index.lookup('compound', 'KEGG', 'BiGG', ['C00001']),
+            [{'original_id': 'C00001', 'aliases': ['h2o', 'nad']}])
+
+    def test_save_and_load(self):
+        path = os.path.join(self.directory, 'index.json.gz')
+        self.index.save(path)
+        with gzip.open(path, 'rb') as f:
+            f.read()
+        self.assertEqual(os.listdir(self.directory), ['index.json.gz'])
+        loaded = AliasIndex.AliasIndex.load(path)
+        self.assertEqual(loaded.ref, REF)
+        for object_type in ('compound', 'reaction'):
+            self.assertEqual(loaded.alias_sets(object_type),
+                             self.index.alias_sets(object_type))
+        self.assertEqual(
+            loaded.lookup('compound', 'KEGG', 'BiGG', ['C00001', 'C00002']),
+            self.index.lookup('compound', 'KEGG', 'BiGG',
+                              ['C00001', 'C00002']))
+
+
+class GetIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        AliasIndex._indexes.clear()
+        self.directory = tempfile.mkdtemp()
+        self.loads = []
+
+    def tearDown(self):
+        AliasIndex._indexes.clear()
+        shutil.rmtree(self.directory)
+
+    def get(self, ref):
+        def load_biochemistry():
+            self.loads.append(ref)
+            return BIOCHEMISTRY
+        return AliasIndex.get_index(ref, load_biochemistry, self.directory)
+
+    def test_index_is_built_once(self):
+        index = self.get(REF)
+        self.assertIs(self.get(REF), index)
+        # a new worker loads it from disk
+        AliasIndex._indexes.clear()
+        self.assertEqual(self.get(REF).ref, REF)
+        self.assertEqual(self.loads, [REF])
+
+    def test_new_version_is_rebuilt(self):
+        self.get(REF)
+        index = self.get('1/2/4')
+        self.assertEqual(index.ref, '1/2/4')
+        self.assertEqual(self.loads, [REF, '1/2/4'])
+        # only the latest version is kept in memory
+        self.assertEqual(list(AliasIndex._indexes.values()), [index])
+
+    def test_unreadable_index_is_rebuilt(self):
+        with open(os.path.join(self.directory, '1_2_3.json.gz'), 'w') as f:
+            f.write('not gzip')
+        self.assertEqual(self.get(REF).alias_sets('reaction'),
+                         ['KEGG', 'ModelSEED', 'name'])
+        self.assertEqual(self.loads, [REF])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+'''
+Tests of the concurrency bound, timeout and cancellation of the asyncio
+client, against a local HTTP server.
+'''
+
+import json
+import os
+import re
+import sys
+import unittest
+
+LIB = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..',
+                   'lib')
+sys.path.insert(0, LIB)
+
+# the asyncio client runs under python 3, with aiohttp
+try:
+    import asyncio
+    from biokbase.fbaModelServices import AsyncClient
+    SKIP = None
+except (ImportError, SyntaxError) as e:
+    AsyncClient = None
+    SKIP = 'asyncio client not importable: %s' % e
+
+
+class Server(object):
+    '''
+    Answers every call with its params after the delay given in them,
+    counting the calls in flight.
+    '''
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.answered = 0
+
+    def __call__(self):
+        return _Connection(self)
+
+
+class _Connection(asyncio.Protocol if AsyncClient else object):
+
+    def __init__(self, server):
+        self.server = server
+        self.buffer = b''
+        self.pending = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
+            self.server.in_flight -= 1
+
+    def data_received(self, data):
+        self.buffer += data
+        head, sep, body = self.buffer.partition(b'\r\n\r\n')
+        if not sep:
+            return
+        length = 0
+        for line in head.split(b'\r\n')[1:]:
+            name, _, value = line.partition(b':')
+            if name.strip().lower() == b'content-length':
+                length = int(value)
+        if len(body) < length:
+            return
+        self.buffer = body[length:]
+        call = json.loads(body[:length].decode())
+        self.server.in_flight += 1
+        self.server.max_in_flight = max(self.server.max_in_flight,
+                                         self.server.in_flight)
+        self.pending = self.server.loop.call_later(
+            call['params'][0].get('delay', 0), self.respond, call)
+
+    def respond(self, call):
+        self.pending = None
+        self.server.in_flight -= 1
+        self.server.answered += 1
+        body = json.dumps({'version': '1.1', 'id': call['id'],
+                           'result': call['params']}).encode()
+        self.transport.write(
+            b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n' +
+            ('Content-Length: %d\r\n\r\n' % len(body)).encode() + body)
+
+
+@unittest.skipIf(SKIP, SKIP)
+class AsyncClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = Server(self.loop)
+        self.listener = self.wait(self.loop.create_server(
+            self.server, '127.0.0.1', 0))
+        self.url = 'http://127.0.0.1:%d' % (
+            self.listener.sockets[0].getsockname()[1])
+        self.clients = []
+
+    def tearDown(self):
+        for client in self.clients:
+            self.wait(client.close())
+        self.listener.close()
+        self.wait(self.listener.wait_closed())
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def wait(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def client(self, **kwargs):
+        client = AsyncClient.fbaModelServices(
+            self.url, token='token', ignore_authrc=True, **kwargs)
+        self.clients.append(client)
+        return client
+
+    def test_calls_in_flight_are_bounded(self):
+        client = self.client(max_concurrency=2)
+        results = self.wait(asyncio.gather(
+            *[client.get_models({'id': i, 'delay': 0.05})
+              for i in range(6)]))
+        self.assertEqual([result['id'] for result in results],
+                         list(range(6)))
+        self.assertEqual(self.server.max_in_flight, 2)
+
+    def test_timeout_aborts_the_call(self):
+        client = self.client(timeout=1)
+        self.assertRaises(asyncio.TimeoutError, self.wait,
+                          client.get_models({'delay': 5}))
+        self.assertEqual(self.server.answered, 0)
+
+    def test_cancelled_call_frees_its_slot(self):
+        client = self.client(max_concurrency=1)
+        slow = self.loop.create_task(client.get_models({'delay': 5}))
+        self.wait(asyncio.sleep(0.2))
+        self.assertEqual(self.server.in_flight, 1)
+        slow.cancel()
+        self.assertRaises(asyncio.CancelledError, self.wait, slow)
+        self.assertEqual(self.wait(client.get_models({'id': 1}))['id'], 1)
+        self.assertEqual(self.server.answered, 1)
+
+
+class MethodSurfaceTest(unittest.TestCase):
+    '''
+    Client.py is python 2 and AsyncClient python 3, so their service
+    methods are compared in the source.
+    '''
+
+    def service_methods(self, name):
+        with open(os.path.join(LIB, 'biokbase', 'fbaModelServices',
+                               name)) as client:
+            source = client.read()
+        methods = re.findall(r"^    (?:async )?def (\w+)\(self, \w+\):\n"
+                             r" +resp = (?:await )?self\._call\("
+                             r"'fbaModelServices\.(\w+)'", source, re.M)
+        for method, called in methods:
+            self.assertEqual(method, called)
+        return set(method for method, _ in methods)
+
+    def test_async_client_has_the_client_methods(self):
+        methods = self.service_methods('Client.py')
+        self.assertIn('reconcile_phenotypes', methods)
+        self.assertEqual(self.service_methods('AsyncClient.py'), methods)
+
+
+if __name__ == '__main__':
+    unittest.main()
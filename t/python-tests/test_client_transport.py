@@ -0,0 +1,191 @@
+'''
+Tests of the hand written transport of the python client, against a fake
+HTTP session.
+'''
+
+import json
+import os
+import sys
+import unittest
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+# the client runs under python 2 only, with requests, so these tests skip
+# under python 3 (where AsyncClient is the client; see test_async_client)
+try:
+    from biokbase.fbaModelServices import Transport
+    SKIP = None
+except (ImportError, SyntaxError) as e:
+    Transport = None
+    SKIP = ('python client not importable (it needs python 2 and '
+            'requests): %s' % e)
+
+
+class Response(object):
+
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self.text = json.dumps(body)
+        self.headers = {'content-type': 'application/json'}
+        self.headers.update(headers or {})
+
+    def raise_for_status(self):
+        raise IOError(self.status_code)
+
+
+class Session(object):
+    '''Answers every call with its params, recording what was posted.'''
+
+    def __init__(self, accepts_gzip=True):
+        self.accepts_gzip = accepts_gzip
+        self.posts = []
+        self.closed = False
+        self.reject_batches = False
+
+    def close(self):
+        self.closed = True
+
+    def post(self, url, data=None, headers=None, **kwargs):
+        gzipped = headers.get('Content-Encoding') == 'gzip'
+        self.posts.append((gzipped, len(data)))
+        if gzipped:
+            if not self.accepts_gzip:
+                return Response(415, {})
+            data = zlib.decompress(data, 16 + zlib.MAX_WBITS)
+        call = json.loads(data)
+        headers = {'Accept-Encoding': 'gzip'} if self.accepts_gzip else {}
+        if self.reject_batches and isinstance(call, list):
+            return Response(200, {'version': '1.1', 'error': {
+                'name': 'JSONRPCError', 'code': -32600,
+                'message': 'Invalid Request'}}, headers)
+        if isinstance(call, list):
+            return Response(200, [self.answer(c) for c in reversed(call)],
+                            headers)
+        if call['method'] == 'fbaModelServices.runfba':
+            return Response(500, self.answer(call))
+        return Response(200, self.answer(call), headers)
+
+    def answer(self, call):
+        if call['method'] == 'fbaModelServices.runfba':
+            return {'id': call['id'], 'error': {
+                'name': 'JSONRPCError', 'code': -32000,
+                'message': 'no model'}}
+        return {'id': call['id'], 'result': call['params']}
+
+
+@unittest.skipIf(SKIP, SKIP)
+class CompressionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Transport.fbaModelServices(
+            'http://localhost', token='un=alice', ignore_authrc=True,
+            compression_threshold=500)
+        self.session = Session()
+        self.client._session = self.session
+
+    def test_large_requests_are_gzipped_once_server_accepts(self):
+        big = {'workspace': 'x' * 1000}
+        self.assertEqual(self.client.get_models(big), big)
+        self.assertEqual(self.client.get_models(big), big)
+        self.assertEqual([p[0] for p in self.session.posts], [False, True])
+        self.assertLess(self.session.posts[1][1], self.session.posts[0][1])
+
+    def test_small_requests_are_not_gzipped(self):
+        for _ in range(2):
+            self.client.get_models({'workspace': 'x'})
+        self.assertEqual([p[0] for p in self.session.posts], [False, False])
+
+    def test_rejected_gzip_is_resent_uncompressed(self):
+        big = {'workspace': 'x' * 1000}
+        self.client.get_models(big)
+        self.session.accepts_gzip = False
+        self.assertEqual(self.client.get_models(big), big)
+        self.assertEqual([p[0] for p in self.session.posts],
+                         [False, True, False])
+        self.client.get_models(big)
+        self.assertEqual(self.session.posts[-1][0], False)
+
+    def test_compression_level_zero_disables_gzip(self):
+        self.client.compression_level = 0
+        for _ in range(2):
+            self.client.get_models({'workspace': 'x' * 1000})
+        self.assertEqual([p[0] for p in self.session.posts], [False, False])
+
+
+@unittest.skipIf(SKIP, SKIP)
+class SessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Transport.fbaModelServices(
+            'http://localhost', token='un=alice', ignore_authrc=True)
+        self.session = Session()
+        self.client._session = self.session
+
+    def test_server_error_is_raised(self):
+        try:
+            self.client.runfba({'model': 'missing'})
+            self.fail('no ServerError')
+        except Transport.ServerError as e:
+            self.assertEqual(e.code, -32000)
+            self.assertEqual(e.message, 'no model')
+
+    def test_cookies_are_ignored(self):
+        client = Transport.fbaModelServices(
+            'http://localhost', token='un=alice', ignore_authrc=True)
+        self.assertFalse(client._session.cookies._policy.set_ok(None, None))
+
+    def test_context_manager_closes_session(self):
+        with self.client as client:
+            client.get_models({})
+        self.assertTrue(self.session.closed)
+
+
+@unittest.skipIf(SKIP, SKIP)
+class BatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Transport.fbaModelServices(
+            'http://localhost', token='un=alice', ignore_authrc=True)
+        self.session = Session()
+        self.client._session = self.session
+
+    def test_results_keep_queue_order(self):
+        batch = self.client.batch()
+        calls = [batch.get_models({'n': i}) for i in range(5)]
+        self.assertEqual(batch.execute(), [{'n': i} for i in range(5)])
+        self.assertEqual(calls[3].result(), {'n': 3})
+        self.assertEqual(len(self.session.posts), 1)
+
+    def test_batches_are_split_by_max_calls(self):
+        with self.client.batch(max_calls=2) as batch:
+            for i in range(5):
+                batch.get_models({'n': i})
+        self.assertEqual(len(self.session.posts), 3)
+
+    def test_failed_call_does_not_fail_batch(self):
+        batch = self.client.batch()
+        ok = batch.get_models({})
+        failed = batch.runfba({})
+        batch.execute()
+        self.assertEqual(ok.result(), {})
+        self.assertRaises(Transport.ServerError, failed.result)
+
+    def test_whole_batch_error_fails_every_call(self):
+        self.session.reject_batches = True
+        batch = self.client.batch()
+        calls = [batch.get_models({}), batch.get_fbas({})]
+        results = batch.execute()
+        for call, result in zip(calls, results):
+            self.assertEqual(result.code, -32600)
+            self.assertRaises(Transport.ServerError, call.result)
+
+    def test_client_methods_cannot_be_batched(self):
+        batch = self.client.batch()
+        for name in ('batch', 'close', 'pool_stats', '_call', 'no_method'):
+            self.assertRaises(AttributeError, getattr, batch, name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+'''
+Tests of the reaction deletions of the in-process engine on the toy model.
+'''
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+import toy_model
+from biokbase.fbaModelServices import Solver
+
+try:
+    Solver.check_solvers()
+    from biokbase.fbaModelServices import Curation, FBA
+    SKIP = None
+except ImportError as e:
+    FBA = None
+    SKIP = 'no solver for the in-process engine: %s' % e
+
+
+@unittest.skipIf(SKIP, SKIP)
+class ModelDeletionsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = toy_model.model()
+        self.deletions = Curation.ModelDeletions(
+            FBA.ModelNetwork(self.model))
+
+    def test_alternative_deletion_keeps_growth(self):
+        self.deletions.add('rxn00003_c0', '>')
+        growth, remaining = self.deletions.verify(media=toy_model.media())
+        self.assertAlmostEqual(growth, 8)
+        self.assertAlmostEqual(remaining, 8)
+
+    def test_essential_deletion_is_rejected(self):
+        self.deletions.add('rxn00007_c0', '>')
+        self.assertRaises(ValueError, self.deletions.verify,
+                          media=toy_model.media())
+
+    def test_model_without_growth_is_not_rejected(self):
+        self.deletions.add('rxn00007_c0', '>')
+        growth, remaining = self.deletions.verify(media=toy_model.media(()))
+        self.assertLessEqual(growth, FBA.NO_GROWTH)
+        self.assertLessEqual(remaining, FBA.NO_GROWTH)
+
+    def test_deletions_leaving_no_solution_are_rejected(self):
+        # rxn00005 is forced to carry flux, which only rxn00004 feeds
+        formulation = {'bounds': [[1, 5, 'flux', 'rxn00005_c0']]}
+        self.deletions.add('rxn00004_c0', '>')
+        self.assertRaises(ValueError, self.deletions.verify, formulation,
+                          toy_model.media())
+
+    def test_model_without_solution_does_not_grow(self):
+        # the dead end rxn00006 can not carry the flux it is forced to
+        formulation = {'bounds': [[1, 5, 'flux', 'rxn00006_c0']]}
+        self.deletions.add('rxn00003_c0', '>')
+        self.assertEqual(self.deletions.verify(formulation,
+                                               toy_model.media()), (0, 0))
+
+    def test_apply_removes_and_narrows(self):
+        self.deletions.add('rxn00003_c0', '>')
+        self.deletions.add('rxn00004_c0', '<')
+        self.deletions.add('rxn00010_c0', '>')
+        self.deletions.add('rxn00010_c0', '<')
+        removed, narrowed = self.deletions.apply(self.model)
+        self.assertEqual(removed, ['rxn00003_c0', 'rxn00010_c0'])
+        self.assertEqual(narrowed, ['rxn00004_c0'])
+        ids = [rxn['id'] for rxn in self.model['modelreactions']]
+        self.assertNotIn('rxn00003_c0', ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+'''
+Tests that the in-process engine is opt-in, through fba-engine in
+deploy.cfg.
+'''
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+from biokbase.fbaModelServices import Solver
+
+# the implementation needs the workspace client
+try:
+    import fbaModelServicesImpl as impl
+    SKIP = None
+except (ImportError, SyntaxError) as e:
+    impl = None
+    SKIP = 'python implementation not importable: %s' % e
+
+
+class SolverCheckTest(unittest.TestCase):
+
+    def test_missing_solvers_are_reported(self):
+        saved = Solver.highspy, Solver.milp
+        try:
+            Solver.highspy = Solver.milp = None
+            self.assertRaises(ImportError, Solver.check_solvers)
+        finally:
+            Solver.highspy, Solver.milp = saved
+
+
+@unittest.skipIf(SKIP, SKIP)
+class EngineConfigTest(unittest.TestCase):
+
+    def test_engine_methods_are_off_by_default(self):
+        service = impl.fbaModelServices({})
+        for method in ('runfba', 'gapfill_model', 'simulate_phenotypes'):
+            self.assertRaises(ValueError, getattr(service, method), {},
+                              {'model': 'm', 'workspace': 'w'})
+
+    def test_unknown_engine_is_rejected(self):
+        self.assertRaises(ValueError, impl.fbaModelServices,
+                          {'fba-engine': 'glpk'})
+
+
+@unittest.skipIf(SKIP, SKIP)
+class MinimalMediaConfigTest(unittest.TestCase):
+
+    def test_default_minimal_media(self):
+        self.assertEqual(impl.fbaModelServices({}).minimal_media,
+                         ['KBaseMedia', 'Carbon-D-Glucose'])
+
+    def test_configured_minimal_media(self):
+        service = impl.fbaModelServices({'minimal-media': 'mine/Glycerol'})
+        self.assertEqual(service.minimal_media, ['mine', 'Glycerol'])
+
+    def test_minimal_media_must_be_a_reference(self):
+        self.assertRaises(ValueError, impl.fbaModelServices,
+                          {'minimal-media': 'Glycerol'})
+
+
+if __name__ == '__main__':
+    unittest.main()
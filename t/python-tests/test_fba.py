@@ -0,0 +1,160 @@
+'''
+Tests of the in-process FBA engine on the toy model.
+'''
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+import toy_model
+from biokbase.fbaModelServices import Solver
+
+try:
+    Solver.check_solvers()
+    import numpy as np
+    from biokbase.fbaModelServices import FBA
+    SKIP = None
+except ImportError as e:
+    FBA = None
+    SKIP = 'no solver for the in-process engine: %s' % e
+
+
+@unittest.skipIf(SKIP, SKIP)
+class FBATest(unittest.TestCase):
+
+    def setUp(self):
+        self.network = FBA.ModelNetwork(toy_model.model())
+        self.problem = FBA.FBAProblem(self.network, None, toy_model.media())
+        self.solution = self.problem.solve()
+
+    def flux(self, values, rxn):
+        return values[self.network.find_reaction(rxn)]
+
+    def test_objective(self):
+        self.assertTrue(self.solution.feasible)
+        self.assertAlmostEqual(self.solution.objective, 8)
+
+    def test_no_growth_without_carbon(self):
+        problem = FBA.FBAProblem(self.network, None, toy_model.media(()))
+        self.assertLessEqual(problem.solve().objective, FBA.NO_GROWTH)
+
+    def test_fva_ranges(self):
+        minimum, maximum = self.problem.fva(self.solution)
+        for rxn, lower, upper in (('rxn00001_c0', 10, 10),
+                                  ('rxn00003_c0', 0, 10),
+                                  ('rxn00004_c0', 0, 10),
+                                  ('rxn00006_c0', 0, 0),
+                                  ('rxn00009_c0', 4, 4),
+                                  ('rxn00010_c0', 0, 0)):
+            self.assertAlmostEqual(self.flux(minimum, rxn), lower)
+            self.assertAlmostEqual(self.flux(maximum, rxn), upper)
+
+    def test_fva_is_the_same_in_parallel(self):
+        serial = self.problem.fva(self.solution)
+        parallel = self.problem.fva(self.solution, 3)
+        for one, other in zip(serial, parallel):
+            self.assertEqual([round(v, 6) for v in one],
+                             [round(v, 6) for v in other])
+
+    def test_double_knockouts_find_isozymes_and_alternative_paths(self):
+        matrix = self.problem.double_knockout_matrix(self.solution)
+        genes = matrix['genes']
+        pairs = sorted((genes[i], genes[j])
+                       for i, j, growth in matrix['interactions'])
+        # g2 and g3 are isozymes; g4 and the g5/g6 branch are alternatives
+        self.assertEqual(pairs, [('g2', 'g3'), ('g4', 'g5'), ('g4', 'g6')])
+        single = dict(zip(genes, matrix['single_growth']))
+        self.assertAlmostEqual(single['g2'], 8)
+        for gene in ('g1', 'g10', 'g11'):
+            self.assertAlmostEqual(single[gene], 0)
+
+    def sweep(self, processes=1):
+        # glucose uptake against the bound of rxn00003, which the
+        # rxn00004/rxn00005 branch makes up for
+        return self.problem.sweep(
+            [{'variable_type': 'drainflux', 'variable': 'cpd00027_e0',
+              'bound': 'upper', 'values': [10, 5, 2.5, 0]},
+             {'variable_type': 'flux', 'variable': 'rxn00003_c0',
+              'bound': 'upper', 'values': [0, 100]}], processes=processes)
+
+    def test_sweep_grows_8_tenths_per_glucose(self):
+        results = self.sweep()
+        self.assertEqual(results['compounds'], ['cpd00027_e0'])
+        self.assertEqual(results['feasible'], [[1, 1]] * 4)
+        for i, glucose in enumerate(results['values1']):
+            for j in range(2):
+                self.assertAlmostEqual(results['objectives'][i][j],
+                                       0.8 * glucose)
+                self.assertAlmostEqual(results['shadow_prices'][i][j][0],
+                                       0.8)
+        self.assertEqual(self.sweep(3), results)
+
+    def test_sweep_is_the_same_without_highs(self):
+        results = self.sweep()
+        highspy = Solver.highspy
+        Solver.highspy = None
+        try:
+            problem = FBA.FBAProblem(self.network, None, toy_model.media())
+            self.problem = problem
+            linprog = self.sweep()
+        finally:
+            Solver.highspy = highspy
+        self.assertEqual(results['feasible'], linprog['feasible'])
+        for key in ('objectives', 'shadow_prices'):
+            self.assertEqual(np.round(results[key], 6).tolist(),
+                             np.round(linprog[key], 6).tolist())
+
+    def simulate(self, processes=1):
+        # (id, media, gene knockouts, additional compounds, observed growth)
+        phenotypes = [
+            ('grows', 'glucose', [], [], 1),
+            ('transport_ko', 'glucose', ['g1'], [], 1),
+            ('no_carbon', 'empty', [], [], 0),
+            ('added_glucose', 'empty', [], ['cpd00027'], 0),
+            ('isozyme_ko', 'glucose', ['g2'], [], 1),
+            ('alternative_ko', 'glucose', ['g4'], [], 1),
+            ('both_paths_ko', 'glucose', ['g4', 'g5'], [], 1),
+            ('unobserved', 'glucose', ['g10'], [], None)]
+        phenotype_set = {'phenotypes': [
+            {'id': id, 'media_ref': 'w/' + media,
+             'geneko_refs': ['~/features/id/' + gene for gene in genes],
+             'additionalcompound_refs': [
+                 toy_model.BIOCHEMISTRY + '/compounds/id/' + cpd
+                 for cpd in compounds],
+             'normalizedGrowth': growth}
+            for id, media, genes, compounds, growth in phenotypes]}
+        return FBA.simulate_phenotypes(
+            self.network, None, phenotype_set, '2/3/1',
+            {'w/glucose': toy_model.media(), 'w/empty': toy_model.media(())},
+            processes)
+
+    def test_phenotype_classes(self):
+        simulations = self.simulate()
+        self.assertEqual([sim['phenoclass'] for sim in simulations],
+                         ['CP', 'FN', 'CN', 'FP', 'CP', 'CP', 'FN', 'UN'])
+        self.assertEqual(simulations[1]['phenotype_ref'],
+                         '2/3/1/phenotypes/id/transport_ko')
+        self.assertAlmostEqual(simulations[0]['simulatedGrowth'], 8)
+        self.assertAlmostEqual(simulations[4]['simulatedGrowthFraction'], 1)
+        self.assertEqual(simulations[7]['simulatedGrowth'], 0)
+
+    def test_phenotypes_are_the_same_in_a_pool(self):
+        serial = self.simulate()
+        pooled = self.simulate(3)
+        self.assertEqual([sim['phenoclass'] for sim in serial],
+                         [sim['phenoclass'] for sim in pooled])
+        for one, other in zip(serial, pooled):
+            for key in ('simulatedGrowth', 'simulatedGrowthFraction'):
+                self.assertAlmostEqual(one[key], other[key])
+
+    def test_knockout_of_one_subunit_disables_a_complex(self):
+        self.assertEqual(self.network.knocked_out_reactions(['g10']),
+                         [self.network.find_reaction('rxn00009_c0')])
+        self.assertEqual(self.network.knocked_out_reactions(['g2']), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+'''
+Tests of the gapfilling of the in-process engine on the toy model, with
+the reactions that make cpd00101 out of cpd00100 taken out of the model and
+offered as candidates.
+'''
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+import toy_model
+from biokbase.fbaModelServices import Solver
+
+try:
+    Solver.check_solvers()
+    from biokbase.fbaModelServices import FBA, Gapfill
+    SKIP = None
+except ImportError as e:
+    FBA = None
+    SKIP = 'no solver for the in-process engine: %s' % e
+
+# the candidates: rxn00003 alone, or rxn00004 and rxn00005, restore
+# growth; rxn00020 is fed only by cpd00201, which the model can not make
+# while its reactions run in their own directions
+CANDIDATES = (
+    ('rxn00003', [('cpd00100', -1), ('cpd00101', 1)], '>'),
+    ('rxn00004', [('cpd00100', -1), ('cpd00102', 1)], '='),
+    ('rxn00005', [('cpd00102', -1), ('cpd00101', 1)], '>'),
+    ('rxn00020', [('cpd00201', -1), ('cpd00101', 1)], '>'))
+
+
+def biochemistry():
+    compounds = set(['cpd00201'])
+    for cpd in toy_model.model()['modelcompounds']:
+        compounds.add(cpd['id'].split('_')[0])
+    return {'compounds': [{'id': cpd, 'name': cpd, 'formula': 'C6H12O6'}
+                          for cpd in sorted(compounds)],
+            'reactions': [
+                {'id': id, 'name': id, 'direction': direction,
+                 'status': 'OK', 'deltaG': -1,
+                 'reagents': [{'compound_ref': '~/compounds/id/' + cpd,
+                               'compartment_ref': '~/compartments/id/c',
+                               'coefficient': coefficient}
+                              for cpd, coefficient in reagents]}
+                for id, reagents, direction in CANDIDATES]}
+
+
+def gapped_model():
+    # the toy model without rxn00003 to rxn00005, and with rxn00011, which
+    # only consumes cpd00201
+    model = toy_model.model()
+    model['modelreactions'] = [
+        rxn for rxn in model['modelreactions']
+        if rxn['name'] not in ('rxn00003', 'rxn00004', 'rxn00005')]
+    model['modelcompounds'].append(toy_model.compound('cpd00201', 'c0'))
+    model['modelreactions'].append(toy_model.reaction(
+        'rxn00011', [('cpd00201_c0', -1), ('cpd00100_c0', 1)], '>',
+        [['g13']]))
+    return model
+
+
+@unittest.skipIf(SKIP, SKIP)
+class GapfillTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = gapped_model()
+        self.database = Gapfill.ReactionDatabase(toy_model.BIOCHEMISTRY,
+                                                 biochemistry())
+
+    def problem(self, num_solutions=1, blacklist=()):
+        return Gapfill.GapfillProblem(
+            FBA.ModelNetwork(self.model), self.model, self.database, None,
+            toy_model.media(), {'num_solutions': num_solutions,
+                                'blacklistedrxns': list(blacklist)})
+
+    def reactions(self, solution):
+        return sorted(FBA._ref_id(rxn['reaction_ref'])
+                      for rxn in solution['gapfillingSolutionReactions'])
+
+    def test_gapped_model_does_not_grow(self):
+        problem = FBA.FBAProblem(FBA.ModelNetwork(self.model), None,
+                                 toy_model.media())
+        self.assertLessEqual(problem.solve().objective, FBA.NO_GROWTH)
+
+    def test_first_solution(self):
+        solutions, _ = self.problem().solve()
+        self.assertEqual(len(solutions), 1)
+        self.assertEqual(self.reactions(solutions[0]), ['rxn00003'])
+
+    def test_enumerated_solutions(self):
+        solutions, _ = self.problem(2).solve()
+        self.assertEqual([self.reactions(solution) for solution in solutions],
+                         [['rxn00003'], ['rxn00004', 'rxn00005']])
+        self.assertLess(solutions[0]['solutionCost'],
+                        solutions[1]['solutionCost'])
+
+    def test_enumeration_is_the_same_in_parallel(self):
+        serial, _ = self.problem(2).solve()
+        parallel, _ = self.problem(2).solve(3)
+        self.assertEqual([self.reactions(solution) for solution in serial],
+                         [self.reactions(solution) for solution in parallel])
+
+    def test_branches_around_first_solution_in_parallel(self):
+        # without rxn00003 the first solution has two uses, which the
+        # parallel enumeration branches around
+        serial, _ = self.problem(2, ['rxn00003']).solve()
+        parallel, _ = self.problem(2, ['rxn00003']).solve(2)
+        for solutions in (serial, parallel):
+            self.assertEqual([self.reactions(solution)
+                              for solution in solutions],
+                             [['rxn00004', 'rxn00005']])
+
+    def test_unreachable_candidate_is_pruned(self):
+        candidates = [candidate[1] for candidate in
+                      self.problem().candidates]
+        self.assertIn('rxn00003_c0', candidates)
+        self.assertNotIn('rxn00020_c0', candidates)
+
+    def test_integrated_solution_restores_growth(self):
+        solutions, _ = self.problem(2).solve()
+        for solution in solutions:
+            model = gapped_model()
+            added, _ = Gapfill.integrate_solution(model, self.database,
+                                                  solution)
+            self.assertEqual(sorted(added), [
+                rxn + '_c0' for rxn in self.reactions(solution)])
+            self.assertEqual(solution['integrated'], 1)
+            growth = FBA.FBAProblem(FBA.ModelNetwork(model), None,
+                                    toy_model.media()).solve().objective
+            self.assertGreater(growth, FBA.NO_GROWTH)
+
+
+if __name__ == '__main__':
+    unittest.main()
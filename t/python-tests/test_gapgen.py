@@ -0,0 +1,105 @@
+'''
+Tests of in-process gap generation.
+'''
+
+import copy
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+from toy_model import compound, media, reaction
+from biokbase.fbaModelServices import Solver
+
+try:
+    Solver.check_solvers()
+    from biokbase.fbaModelServices import FBA, Gapgen
+    SKIP = None
+except ImportError as e:
+    SKIP = 'no solver for the in-process engine: %s' % e
+
+
+def model():
+    # grows on cpd00027 through rxn00001 and then rxn00003 or rxn00005 and
+    # rxn00006, and on cpd00028 through rxn00002 and rxn00004
+    compounds = [compound(id, compartment)
+                 for id in ('cpd00027', 'cpd00028')
+                 for compartment in ('e0', 'c0')]
+    compounds += [compound('cpd00100', 'c0'), compound('cpd00101', 'c0')]
+    reactions = [
+        reaction('rxn00001', [('cpd00027_e0', -1), ('cpd00027_c0', 1)], '='),
+        reaction('rxn00002', [('cpd00028_e0', -1), ('cpd00028_c0', 1)]),
+        reaction('rxn00003', [('cpd00027_c0', -1), ('cpd00100_c0', 1)]),
+        reaction('rxn00004', [('cpd00028_c0', -1), ('cpd00100_c0', 1)]),
+        reaction('rxn00005', [('cpd00027_c0', -1), ('cpd00101_c0', 1)]),
+        reaction('rxn00006', [('cpd00101_c0', -1), ('cpd00100_c0', 1)], '=')]
+    return {'id': 'gg', 'modelcompartments': [
+                {'id': 'c0', 'compartment_ref': '~/compartments/id/c'},
+                {'id': 'e0', 'compartment_ref': '~/compartments/id/e'}],
+            'modelcompounds': compounds, 'modelreactions': reactions,
+            'biomasses': [{'id': 'bio1', 'biomasscompounds': [
+                {'modelcompound_ref': '~/modelcompounds/id/cpd00100_c0',
+                 'coefficient': -1}]}]}
+
+
+@unittest.skipIf(SKIP, SKIP)
+class GapgenTest(unittest.TestCase):
+
+    def setUp(self):
+        self.network = FBA.ModelNetwork(model())
+
+    def solve(self, count):
+        problem = Gapgen.GapgenProblem(
+            self.network, media((('cpd00027', -100, 10),)),
+            media((('cpd00028', -100, 10),)), {'num_solutions': count})
+        removals, solution = problem.solve()
+        return problem, [[(self.network.reactions[col], direction)
+                          for col, direction in removal]
+                         for removal in removals]
+
+    def test_single_removal(self):
+        self.assertEqual(self.solve(1)[1], [[('rxn00001_c0', '>')]])
+
+    def test_removals_come_cheapest_first(self):
+        removals = self.solve(3)[1]
+        self.assertEqual(removals[0], [('rxn00001_c0', '>')])
+        self.assertEqual(sorted(removals[1:]),
+                         [[('rxn00003_c0', '>'), ('rxn00005_c0', '>')],
+                          [('rxn00003_c0', '>'), ('rxn00006_c0', '>')]])
+        self.assertEqual([len(removal) for removal in removals], [1, 2, 2])
+
+    def test_integrate_solution(self):
+        problem = self.solve(1)[0]
+        removal = [(self.network.find_reaction('rxn00003_c0'), '>'),
+                   (self.network.find_reaction('rxn00006_c0'), '>')]
+        gapgen = problem.gapgen_object('gg', [removal], '1/9/1', '1/8/1',
+                                       '1/7/1', '1/6/1')
+        solution = gapgen['gapgenSolutions'][0]
+        integrated = copy.deepcopy(model())
+        self.assertEqual(Gapgen.integrate_solution(integrated, solution),
+                         (['rxn00003_c0'], ['rxn00006_c0']))
+        directions = dict((rxn['id'], rxn['direction'])
+                          for rxn in integrated['modelreactions'])
+        self.assertNotIn('rxn00003_c0', directions)
+        self.assertEqual(directions['rxn00006_c0'], '<')
+
+
+@unittest.skipIf(SKIP, SKIP)
+class FormulationTest(unittest.TestCase):
+
+    def test_flux_bounds_default_to_gapgen_bounds(self):
+        formulation = Gapgen.default_gapgen_formulation()['formulation']
+        self.assertEqual(formulation['defaultmaxflux'], 100)
+        self.assertEqual(formulation['defaultminuptake'], -100)
+
+    def test_flux_bounds_of_the_formulation_are_kept(self):
+        formulation = Gapgen.default_gapgen_formulation(
+            {'formulation': {'defaultmaxflux': 500}})['formulation']
+        self.assertEqual(formulation['defaultmaxflux'], 500)
+        self.assertEqual(formulation['defaultminuptake'], -100)
+
+
+if __name__ == '__main__':
+    unittest.main()
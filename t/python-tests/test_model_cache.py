@@ -0,0 +1,67 @@
+'''
+Tests of the worker-level cache of compiled model networks.
+'''
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+import toy_model
+from biokbase.fbaModelServices import Solver
+
+try:
+    Solver.check_solvers()
+    from biokbase.fbaModelServices import FBA
+    from biokbase.fbaModelServices.ModelCache import ModelCache
+    SKIP = None
+except ImportError as e:
+    SKIP = 'no solver for the in-process engine: %s' % e
+
+
+@unittest.skipIf(SKIP, SKIP)
+class ModelCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loads = 0
+        self.nbytes = FBA.ModelNetwork(toy_model.model()).nbytes
+
+    def load(self):
+        self.loads += 1
+        return toy_model.model()
+
+    def test_network_is_compiled_once(self):
+        cache = ModelCache()
+        first = cache.get('1/7/1', self.load)
+        self.assertIs(cache.get('1/7/1', self.load), first)
+        self.assertEqual(self.loads, 1)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_new_model_version_is_compiled(self):
+        cache = ModelCache()
+        cache.get('1/7/1', self.load)
+        cache.get('1/7/2', self.load)
+        self.assertEqual(self.loads, 2)
+
+    def test_network_too_large_to_cache_is_not_recorded(self):
+        cache = ModelCache(self.nbytes - 1)
+        for _ in range(2):
+            cache.get('1/7/1', self.load)
+        self.assertEqual(self.loads, 2)
+        self.assertEqual(cache.stats()['size'], 0)
+        self.assertEqual(cache._biochemistry, {})
+
+    def test_evicted_model_is_forgotten(self):
+        cache = ModelCache(self.nbytes * 3 // 2)
+        cache.get('1/7/1', self.load)
+        cache.get('1/8/1', self.load)
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertEqual(sorted(cache._biochemistry), ['1/8/1'])
+        cache.get('1/7/1', self.load)
+        self.assertEqual(self.loads, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+'''
+Tests of the model statistics of generate_model_stats on the toy model,
+against flux variability analysis.
+'''
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+import toy_model
+from biokbase.fbaModelServices import Solver
+
+try:
+    Solver.check_solvers()
+    from biokbase.fbaModelServices import FBA, ModelStats
+    SKIP = None
+except ImportError as e:
+    FBA = None
+    SKIP = 'no solver for the in-process engine: %s' % e
+
+# the genes of the toy model with a role in a subsystem
+GENOME = {'features': [
+    {'id': 'g1', 'function': 'Glucose transporter'},
+    {'id': 'g7', 'function': 'Dead end enzyme'},
+    {'id': 'g12', 'function': 'Dead end enzyme'},
+    {'id': 'g13', 'function': 'hypothetical protein'}]}
+
+MAPPING = {
+    'roles': [{'id': 'r1', 'name': 'Glucose transporter'},
+              {'id': 'r2', 'name': 'Dead end enzyme'}],
+    'subsystems': [
+        {'id': 'ss1', 'name': 'Glucose uptake', 'class': 'Carbohydrates',
+         'role_refs': ['~/roles/id/r1']},
+        {'id': 'ss2', 'name': 'Dead ends', 'class': 'Miscellaneous',
+         'role_refs': ['~/roles/id/r2']}]}
+
+
+@unittest.skipIf(SKIP, SKIP)
+class ModelStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = toy_model.model()
+        self.network = FBA.ModelNetwork(self.model)
+
+    def fva_classes(self, media):
+        # the blocked, essential and variable reactions of flux variability
+        # analysis
+        problem = FBA.FBAProblem(
+            self.network, ModelStats.stats_formulation(self.network), media)
+        minimum, maximum = problem.fva(problem.solve())
+        classes = ([], [], [])
+        for col in range(len(self.network.reactions)):
+            if minimum[col] == 0 and maximum[col] == 0:
+                classes[0].append(col)
+            elif minimum[col] > 0 or maximum[col] < 0:
+                classes[1].append(col)
+            else:
+                classes[2].append(col)
+        return classes
+
+    def statistics(self, minimal_media):
+        return ModelStats.model_statistics(
+            self.network, self.model, GENOME, MAPPING, None,
+            minimal_media)[0]
+
+    def subsystem(self, stats, name):
+        for ss in stats['subsystems']:
+            if ss['name'] == name:
+                return ss
+
+    def test_consistency_matches_fva(self):
+        for media in (None, toy_model.media()):
+            problem = FBA.FBAProblem(
+                self.network, ModelStats.stats_formulation(self.network),
+                media)
+            blocked, essential, _ = problem.consistency(problem.solve())
+            expected = self.fva_classes(media)
+            self.assertEqual(sorted(blocked.tolist()), expected[0])
+            self.assertEqual(sorted(essential.tolist()), expected[1])
+
+    def test_model_statistics_match_fva(self):
+        stats = self.statistics(toy_model.media())
+        for prefix, media in (('complete', None),
+                              ('minimal', toy_model.media())):
+            self.assertEqual(stats['growth_%s_media' % prefix], 1)
+            for kind, cols in zip(('blocked', 'essential', 'variable'),
+                                  self.fva_classes(media)):
+                self.assertEqual(stats['%s_%s_reactions' % (prefix, kind)],
+                                 len(cols))
+        dead_ends = self.subsystem(stats, 'Dead ends')
+        self.assertEqual(dead_ends['reactions'], 2)
+        self.assertEqual(dead_ends['minimal_blocked_reactions'], 2)
+        self.assertEqual(self.subsystem(
+            stats, 'Glucose uptake')['minimal_essential_reactions'], 1)
+
+    def test_no_growth_blocks_subsystem_reactions(self):
+        stats = self.statistics(toy_model.media(()))
+        self.assertEqual(stats['growth_minimal_media'], 0)
+        self.assertEqual(stats['minimal_blocked_reactions'],
+                         len(self.model['modelreactions']))
+        self.assertEqual(stats['minimal_essential_reactions'], 0)
+        for ss in stats['subsystems']:
+            self.assertEqual(ss['minimal_blocked_reactions'],
+                             ss['reactions'])
+
+    def test_objective_is_the_model_biomass(self):
+        self.model['biomasses'][0]['id'] = 'bio2'
+        self.network = FBA.ModelNetwork(self.model)
+        self.assertEqual(
+            ModelStats.stats_formulation(self.network)['objectiveTerms'],
+            [[1, 'biomassflux', 'bio2']])
+        self.assertEqual(self.statistics(toy_model.media())[
+            'growth_complete_media'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
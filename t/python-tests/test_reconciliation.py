@@ -0,0 +1,151 @@
+'''
+Tests of the integration of phenotype reconciliation solutions on the toy
+model.
+'''
+
+import copy
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+import toy_model
+from biokbase.fbaModelServices import Solver
+
+try:
+    Solver.check_solvers()
+    from biokbase.fbaModelServices import FBA, Reconciliation
+    SKIP = None
+except ImportError as e:
+    FBA = None
+    SKIP = 'no solver for the in-process engine: %s' % e
+
+# the implementation needs the workspace client
+try:
+    import fbaModelServicesImpl as impl
+    SKIP_IMPL = SKIP
+except (ImportError, SyntaxError) as e:
+    impl = None
+    SKIP_IMPL = 'python implementation not importable: %s' % e
+
+
+def gapgen_solution(id, removals):
+    return {'id': id, 'solutionCost': len(removals), 'integrated': 0,
+            'gapgenSolutionReactions': [
+                {'modelreaction_ref': '~/modelreactions/id/' + rxn,
+                 'direction': direction}
+                for rxn, direction in removals]}
+
+
+STUDIES = [{'id': 'toy.gg'}, {'id': 'toy.gg.1'}]
+
+
+@unittest.skipIf(SKIP, SKIP)
+class SolutionStudiesTest(unittest.TestCase):
+
+    def test_solution_ids_name_the_longest_study(self):
+        self.assertEqual(Reconciliation.solution_studies(
+            STUDIES, ['toy.gg.ggsol.1', 'toy.gg.1.ggsol.2']),
+            [(0, 'toy.gg.ggsol.1'), (1, 'toy.gg.1.ggsol.2')])
+
+    def test_indexed_solutions(self):
+        self.assertEqual(Reconciliation.solution_studies(STUDIES, ['1/0']),
+                         [(1, 0)])
+
+    def test_unknown_solutions_are_rejected(self):
+        for sol_id in ('other.ggsol.1', '2/0'):
+            self.assertRaises(ValueError, Reconciliation.solution_studies,
+                              STUDIES, [sol_id])
+
+    def test_find_solution(self):
+        solutions = [gapgen_solution('a', []), gapgen_solution('b', [])]
+        self.assertEqual(Reconciliation.find_solution(solutions, 'b')['id'],
+                         'b')
+        self.assertEqual(Reconciliation.find_solution(solutions, 0)['id'],
+                         'a')
+        self.assertRaises(ValueError, Reconciliation.find_solution,
+                          solutions, 2)
+
+
+@unittest.skipIf(SKIP, SKIP)
+class IntegrateSolutionsTest(unittest.TestCase):
+
+    def test_removals_of_one_reaction_combine(self):
+        model = toy_model.model()
+        network = FBA.ModelNetwork(model)
+        solutions = [gapgen_solution('s1', [('rxn00003_c0', '>'),
+                                            ('rxn00004_c0', '>')]),
+                     gapgen_solution('s2', [('rxn00004_c0', '<')])]
+        Reconciliation.integrate_solutions(model, network, None, [],
+                                           solutions)
+        ids = [rxn['id'] for rxn in model['modelreactions']]
+        self.assertNotIn('rxn00003_c0', ids)
+        self.assertNotIn('rxn00004_c0', ids)
+        self.assertEqual([solution['integrated'] for solution in solutions],
+                         [1, 1])
+
+    def test_phenoclass_counts(self):
+        self.assertEqual(Reconciliation.phenoclass_counts(
+            [{'phenoclass': 'CP'}, {'phenoclass': 'FN'},
+             {'phenoclass': 'CP'}]),
+            {'CP': 2, 'CN': 0, 'FP': 0, 'FN': 1})
+
+
+class Workspace(object):
+    '''Serves objects by reference, recording what is saved.'''
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.saved = []
+
+    def get_objects(self, refs):
+        return [{'data': copy.deepcopy(self.objects[ref['ref']]),
+                 'info': [1, 'name', 'type', '', 1, '', 2]}
+                for ref in refs]
+
+    def get_object_info_new(self, params):
+        return [[1, 'name', 'type', '', 1, '', 2]
+                for ref in params['objects']]
+
+    def save_objects(self, params):
+        self.saved.extend(params['objects'])
+        return [[i + 1, obj['name'], obj['type'], '', 1, '', 2]
+                for i, obj in enumerate(params['objects'])]
+
+
+@unittest.skipIf(SKIP_IMPL, SKIP_IMPL)
+class IntegrateReconciliationSolutionsTest(unittest.TestCase):
+
+    def setUp(self):
+        model = toy_model.model()
+        model['gapgens'] = [{'id': 'toy.gg', 'gapgen_ref': '2/7/1',
+                             'integrated': 0}]
+        gapgen = {'id': 'toy.gg', 'gapgenSolutions': [
+            gapgen_solution('toy.gg.ggsol.1', [('rxn00003_c0', '>')])]}
+        self.workspace = Workspace({'w/toy': model, '2/7/1': gapgen})
+        self.service = impl.fbaModelServices({'fba-engine': 'inprocess'})
+        self.service._workspace = lambda ctx: self.workspace
+
+    def test_solutions_are_integrated_and_saved_once(self):
+        self.service.integrate_reconciliation_solutions(
+            {}, {'model': 'toy', 'workspace': 'w', 'gapfillSolutions': [],
+                 'gapgenSolutions': ['toy.gg.ggsol.1']})
+        self.assertEqual(len(self.workspace.saved), 1)
+        model = self.workspace.saved[0]['data']
+        self.assertNotIn('rxn00003_c0',
+                         [rxn['id'] for rxn in model['modelreactions']])
+        self.assertEqual(model['gapgens'][0]['integrated_solution'],
+                         'toy.gg.ggsol.1')
+
+    def test_queued_reconciliation_is_rejected(self):
+        for method in ('queue_wildtype_phenotype_reconciliation',
+                       'queue_reconciliation_sensitivity_analysis',
+                       'queue_combine_wildtype_phenotype_reconciliation'):
+            self.assertRaises(ValueError, getattr(self.service, method), {},
+                              {'model': 'toy', 'workspace': 'w'})
+
+
+if __name__ == '__main__':
+    unittest.main()
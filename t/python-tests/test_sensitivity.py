@@ -0,0 +1,148 @@
+'''
+Tests of the reaction sensitivity analysis of the in-process engine on the
+toy model.
+'''
+
+import copy
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+import toy_model
+from biokbase.fbaModelServices import Solver
+
+try:
+    Solver.check_solvers()
+    from biokbase.fbaModelServices import FBA, Sensitivity
+    SKIP = None
+except ImportError as e:
+    FBA = None
+    SKIP = 'no solver for the in-process engine: %s' % e
+
+# the implementation needs the workspace client
+try:
+    import fbaModelServicesImpl as impl
+    SKIP_IMPL = SKIP
+except (ImportError, SyntaxError) as e:
+    impl = None
+    SKIP_IMPL = 'python implementation not importable: %s' % e
+
+
+@unittest.skipIf(SKIP, SKIP)
+class SensitivityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = Sensitivity.SensitivityProblem(
+            FBA.ModelNetwork(toy_model.model()), None, toy_model.media())
+
+    def results(self, reactions, delete=False):
+        results, _ = self.problem.solve(
+            Sensitivity.signed_deletions(reactions), delete)
+        return dict((result['reaction'], result) for result in results)
+
+    def test_alternative_keeps_growth(self):
+        result = self.results(['rxn00003'])['+rxn00003']
+        self.assertAlmostEqual(result['growth_fraction'], 1)
+        self.assertEqual(result['inactive'], [])
+
+    def test_essential_reaction_stops_growth(self):
+        result = self.results(['rxn00007'])['+rxn00007']
+        self.assertAlmostEqual(result['growth_fraction'], 0)
+        self.assertEqual(result['biomass_compounds'], ['cpd00106_c0'])
+
+    def test_unused_direction_reports_blocked_reactions(self):
+        # the wild type makes cpd00101 through rxn00003, so rxn00004 carries
+        # no flux, but closing it still blocks rxn00005
+        results = self.results(['rxn00004'])
+        self.assertAlmostEqual(results['+rxn00004']['growth_fraction'], 1)
+        self.assertEqual(results['+rxn00004']['inactive'],
+                         ['rxn00005_c0'])
+        self.assertEqual(results['-rxn00004']['inactive'], [])
+
+    def test_direction_blocking_reactions_is_not_deleted(self):
+        results = self.results(['rxn00004'], True)
+        self.assertFalse(results['+rxn00004']['deleted'])
+        self.assertTrue(results['-rxn00004']['deleted'])
+
+    def test_parse_solution_id(self):
+        self.assertEqual(Sensitivity.parse_solution_id('m.gf.gfsol.2'),
+                         ('m.gf', 1))
+        self.assertRaises(ValueError, Sensitivity.parse_solution_id,
+                          'm.gf.gfsol.0')
+
+
+class Workspace(object):
+    '''Serves objects by reference, recording what is fetched and saved.'''
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.fetched = []
+        self.saved = []
+
+    def get_objects(self, refs):
+        self.fetched.extend(ref['ref'] for ref in refs)
+        return [{'data': copy.deepcopy(self.objects[ref['ref']]),
+                 'info': [1, 'name', 'type', '', 1, '', 2, 'w', '', 0, {}]}
+                for ref in refs]
+
+    def get_object_info_new(self, params):
+        return [[1, 'name', 'type', '', 1, '', 2]
+                for ref in params['objects']]
+
+    def save_objects(self, params):
+        self.saved.extend(params['objects'])
+        return [[i + 1, obj['name'], obj['type'], '', 1, '', 2]
+                for i, obj in enumerate(params['objects'])]
+
+
+@unittest.skipIf(SKIP_IMPL, SKIP_IMPL)
+class DeleteNoncontributingReactionsTest(unittest.TestCase):
+
+    def setUp(self):
+        # the analysis flagged the glucose transport for deletion
+        rxnsens = {'id': 'toy.rxnsens', 'fbamodel_ref': 'w/toy',
+                   'reactions': [{
+                       'modelreaction_ref':
+                           '2/1/1/modelreactions/id/rxn00001_c0',
+                       'delete': 1, 'direction': '='}]}
+        self.workspace = Workspace({
+            'w/rs': rxnsens, '2/1/1': toy_model.model(),
+            'w/glucose': toy_model.media(),
+            'w/noglucose': toy_model.media([('cpd00200', -10, 10)])})
+        self.service = impl.fbaModelServices({'fba-engine': 'inprocess'})
+        self.service._workspace = lambda ctx: self.workspace
+        self.ctx = Context()
+
+    def delete(self, media):
+        return self.service.delete_noncontributing_reactions(
+            self.ctx, {'rxn_sensitivity': 'rs', 'workspace': 'w',
+                       'media': media, 'media_ws': 'w'})
+
+    def test_deletions_are_verified_on_the_analysis_media(self):
+        self.assertRaises(ValueError, self.delete, 'glucose')
+        self.assertEqual(self.workspace.saved, [])
+        # without glucose the model grows neither way
+        self.delete('noglucose')
+        model = self.workspace.saved[0]['data']
+        self.assertNotIn('rxn00001_c0',
+                         [rxn['id'] for rxn in model['modelreactions']])
+
+    def test_cached_model_is_only_fetched_to_save(self):
+        self.service.model_cache.get('2/1/1', toy_model.model)
+        self.assertRaises(ValueError, self.delete, 'glucose')
+        self.assertNotIn('2/1/1', self.workspace.fetched)
+        self.delete('noglucose')
+        self.assertEqual(self.workspace.fetched.count('2/1/1'), 1)
+
+
+class Context(dict):
+
+    def log_debug(self, message):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+'''
+Tests of JSON-RPC batch handling in the python server: responses come back
+in request order, batch safe requests run concurrently and batch unsafe
+ones run on their own.
+'''
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+# the server runs under python 2, with jsonrpcbase and biokbase.log
+try:
+    import fbaModelServicesServer as server
+    SKIP = None
+except (ImportError, SyntaxError) as e:
+    server = None
+    SKIP = 'python server not importable: %s' % e
+
+
+class Logger(object):
+
+    def log_message(self, *args):
+        pass
+
+
+class Context(dict):
+    '''The parts of MethodContext the batch handling uses.'''
+
+    _logger = Logger()
+
+    def log_err(self, message):
+        pass
+
+
+@unittest.skipIf(SKIP, SKIP)
+class BatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.service = server.JSONRPCServiceCustom(max_batch_workers=4)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.overlaps = {}
+
+        def make(name, delay):
+            def method(ctx, value):
+                with self.lock:
+                    self.running += 1
+                    self.overlaps[value] = self.running
+                time.sleep(delay)
+                with self.lock:
+                    self.running -= 1
+                return value
+            self.service.add(method, name=name, types=[int])
+        make('Test.slow', 0.2)
+        make('Test.fast', 0.0)
+        make('Test.write', 0.05)
+        self.service.set_batch_unsafe('Test.write')
+
+    def call(self, calls):
+        return self.service.call_py(Context(), [
+            {'version': '1.1', 'id': str(i), 'method': method,
+             'params': [value]}
+            for i, (method, value) in enumerate(calls)])
+
+    def test_responses_keep_request_order(self):
+        calls = [('Test.slow', 1), ('Test.fast', 2), ('Test.slow', 3),
+                 ('Test.fast', 4)]
+        responses = self.call(calls)
+        self.assertEqual([r['id'] for r in responses], ['0', '1', '2', '3'])
+        self.assertEqual([r['result'] for r in responses], [1, 2, 3, 4])
+
+    def test_safe_requests_run_concurrently(self):
+        start = time.time()
+        self.call([('Test.slow', i) for i in range(4)])
+        self.assertLess(time.time() - start, 0.6)
+        self.assertEqual(max(self.overlaps.values()), 4)
+
+    def test_unsafe_requests_run_alone(self):
+        self.call([('Test.slow', 1), ('Test.write', 2), ('Test.slow', 3),
+                   ('Test.slow', 4)])
+        self.assertEqual(self.overlaps[2], 1)
+        self.assertEqual(self.overlaps[3] + self.overlaps[4], 3)
+
+    def test_failing_request_does_not_fail_batch(self):
+        responses = self.service.call_py(Context(), [
+            {'version': '1.1', 'id': '0', 'method': 'Test.fast',
+             'params': [1]},
+            {'version': '1.1', 'id': '1', 'method': 'Test.missing',
+             'params': [2]}])
+        self.assertEqual(responses[0]['result'], 1)
+        self.assertIn('error', responses[1])
+
+
+@unittest.skipIf(SKIP, SKIP)
+class BatchSafetyTest(unittest.TestCase):
+
+    def test_writing_and_forking_methods_are_unsafe(self):
+        unsafe = server.application.rpc_service.batch_unsafe
+        for method in ('gapfill_model', 'gapgen_model', 'runfba',
+                       'filter_iterative_solutions',
+                       'delete_noncontributing_reactions',
+                       'generate_model_stats', 'simulate_double_knockouts',
+                       'integrate_reconciliation_solutions'):
+            self.assertIn('fbaModelServices.' + method, unsafe)
+
+    def test_read_only_methods_are_safe(self):
+        unsafe = server.application.rpc_service.batch_unsafe
+        for method in ('get_models', 'get_alias', 'export_fbamodel'):
+            self.assertNotIn('fbaModelServices.' + method, unsafe)
+
+
+if __name__ == '__main__':
+    unittest.main()
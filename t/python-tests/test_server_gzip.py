@@ -0,0 +1,120 @@
+'''
+Tests of the gzip negotiation of the python server: gzipped request bodies
+are accepted, other content encodings are refused with a 415, and
+responses are gzipped only for clients that accept it.
+'''
+
+import json
+import os
+import sys
+import unittest
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+# the server runs under python 2, with jsonrpcbase and biokbase.log
+try:
+    from StringIO import StringIO
+    import fbaModelServicesServer as server
+    SKIP = None
+except (ImportError, SyntaxError) as e:
+    server = None
+    SKIP = 'python server not importable: %s' % e
+
+
+def gzip(data):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def gunzip(data):
+    return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+
+@unittest.skipIf(SKIP, SKIP)
+class GzipTest(unittest.TestCase):
+
+    def setUp(self):
+        self.app = server.application
+        self.saved = (self.app.stream_chunk_size, self.app.gzip_min_size,
+                      self.app.gzip_level)
+        self.app.stream_chunk_size = 0
+        self.app.gzip_min_size = 128
+        self.app.gzip_level = 6
+        self.app.rpc_service.add(lambda ctx, size: 'x' * size,
+                                 name='Test.text', types=[int])
+
+    def tearDown(self):
+        (self.app.stream_chunk_size, self.app.gzip_min_size,
+         self.app.gzip_level) = self.saved
+
+    def request(self, size, content_encoding=None, accept_encoding='gzip'):
+        body = json.dumps({'version': '1.1', 'id': '1',
+                           'method': 'Test.text', 'params': [size]})
+        environ = {'REQUEST_METHOD': 'POST',
+                   'HTTP_ACCEPT_ENCODING': accept_encoding,
+                   'REMOTE_ADDR': '127.0.0.1'}
+        if content_encoding is not None:
+            environ['HTTP_CONTENT_ENCODING'] = content_encoding
+            if content_encoding == 'gzip':
+                body = gzip(body)
+        environ['CONTENT_LENGTH'] = str(len(body))
+        environ['wsgi.input'] = StringIO(body)
+        response = {}
+
+        def start_response(status, headers):
+            response['status'] = status
+            response['headers'] = dict((name.lower(), value)
+                                       for name, value in headers)
+        body = ''.join(self.app(environ, start_response))
+        if response['headers'].get('content-encoding') == 'gzip':
+            body = gunzip(body)
+        return response['status'], response['headers'], json.loads(body)
+
+    def test_gzipped_request_body(self):
+        status, headers, response = self.request(10, 'gzip')
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(response['result'], 'x' * 10)
+
+    def test_identity_request_body(self):
+        status, headers, response = self.request(10, 'identity')
+        self.assertEqual(response['result'], 'x' * 10)
+
+    def test_unsupported_content_encoding_is_refused(self):
+        status, headers, response = self.request(10, 'br')
+        self.assertEqual(status, '415 Unsupported Media Type')
+        self.assertEqual(response['error']['code'], -32700)
+        self.assertIn('br', response['error']['message'])
+        self.assertEqual(headers['accept-encoding'], 'gzip')
+
+    def test_responses_are_gzipped_above_the_minimum(self):
+        status, headers, response = self.request(1000)
+        self.assertEqual(headers['content-encoding'], 'gzip')
+        self.assertEqual(response['result'], 'x' * 1000)
+        status, headers, response = self.request(10)
+        self.assertNotIn('content-encoding', headers)
+
+    def test_refused_gzip_is_not_sent(self):
+        status, headers, response = self.request(
+            1000, accept_encoding='gzip;q=0')
+        self.assertNotIn('content-encoding', headers)
+        self.assertEqual(response['result'], 'x' * 1000)
+
+    def test_accepts_gzip(self):
+        for accept_encoding, accepted in (('gzip', True),
+                                          ('deflate, gzip;q=0.5', True),
+                                          ('*', True),
+                                          ('GZIP; q=1.0', True),
+                                          ('gzip;q=0', False),
+                                          ('gzip; q=0.0, br', False),
+                                          ('*;q=0', False),
+                                          ('gzip;q=bad', False),
+                                          ('identity', False),
+                                          ('', False)):
+            self.assertEqual(self.app._accepts_gzip(accept_encoding),
+                             accepted, accept_encoding)
+
+
+if __name__ == '__main__':
+    unittest.main()
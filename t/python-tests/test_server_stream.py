@@ -0,0 +1,166 @@
+'''
+Tests of the streamed JSON-RPC responses of the python server: results of
+at least a chunk are encoded incrementally and sent, gzipped when the
+client accepts it, in chunks; shorter ones are sent whole.
+'''
+
+import json
+import os
+import sys
+import unittest
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+# the server runs under python 2, with jsonrpcbase and biokbase.log
+try:
+    from StringIO import StringIO
+    import fbaModelServicesServer as server
+    SKIP = None
+except (ImportError, SyntaxError) as e:
+    server = None
+    SKIP = 'python server not importable: %s' % e
+
+
+def call(method, *params):
+    return {'version': '1.1', 'id': '1', 'method': method,
+            'params': list(params)}
+
+
+def gunzip(data):
+    return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+
+@unittest.skipIf(SKIP, SKIP)
+class EncodeChunksTest(unittest.TestCase):
+
+    def setUp(self):
+        self.service = server.JSONRPCServiceCustom()
+        self.service.add(lambda ctx, size: 'x' * size, name='Test.text',
+                         types=[int])
+        self.service.add(lambda ctx, size: ['x' * size, object()],
+                         name='Test.broken', types=[int])
+
+    def test_chunks_join_into_the_json(self):
+        value = {'ids': ['rxn%05d' % i for i in range(100)]}
+        chunks = list(self.service._encode_chunks(value, 64))
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks[:-1]:
+            self.assertGreaterEqual(len(chunk), 64)
+        self.assertEqual(json.loads(''.join(chunks)), value)
+
+    def test_short_results_are_returned_whole(self):
+        result = self.service.call_iter({}, call('Test.text', 10), 64)
+        self.assertIsInstance(result, basestring)
+        self.assertEqual(json.loads(result)['result'], 'x' * 10)
+
+    def test_long_results_are_streamed(self):
+        result = self.service.call_iter({}, call('Test.text', 500), 64)
+        self.assertNotIsInstance(result, basestring)
+        self.assertEqual(json.loads(''.join(result))['result'], 'x' * 500)
+
+    def test_min_size_sets_the_smallest_streamed_result(self):
+        result = self.service.call_iter({}, call('Test.text', 500), 64,
+                                        1024)
+        self.assertIsInstance(result, basestring)
+
+    def test_encoding_errors_in_the_first_chunk_are_raised(self):
+        self.assertRaises(TypeError, self.service.call_iter, {},
+                          call('Test.broken', 10), 64)
+
+    def test_encoding_errors_later_are_raised_while_streaming(self):
+        chunks = self.service.call_iter({}, call('Test.broken', 500), 64)
+        self.assertRaises(TypeError, list, chunks)
+
+
+@unittest.skipIf(SKIP, SKIP)
+class StreamedResponseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.app = server.application
+        self.saved = (self.app.stream_chunk_size, self.app.gzip_min_size,
+                      self.app.gzip_level)
+        self.app.stream_chunk_size = 64
+        self.app.gzip_min_size = 128
+        self.app.gzip_level = 6
+        self.app.rpc_service.add(lambda ctx, size: 'x' * size,
+                                 name='Test.text', types=[int])
+        self.app.rpc_service.add(lambda ctx, size: ['x' * size, object()],
+                                 name='Test.broken', types=[int])
+        self.logged = []
+        self.app.log = lambda level, ctx, message: self.logged.append(
+            (level, message))
+
+    def tearDown(self):
+        (self.app.stream_chunk_size, self.app.gzip_min_size,
+         self.app.gzip_level) = self.saved
+        del self.app.log
+
+    def request(self, body, accept_encoding='gzip'):
+        environ = {'REQUEST_METHOD': 'POST',
+                   'CONTENT_LENGTH': str(len(body)),
+                   'wsgi.input': StringIO(body),
+                   'HTTP_ACCEPT_ENCODING': accept_encoding,
+                   'REMOTE_ADDR': '127.0.0.1'}
+        response = {}
+
+        def start_response(status, headers):
+            response['status'] = status
+            response['headers'] = dict((name.lower(), value)
+                                       for name, value in headers)
+        body = self.app(environ, start_response)
+        return response['status'], response['headers'], body
+
+    def test_chunked_gzip_response_decodes(self):
+        status, headers, body = self.request(
+            json.dumps(call('Test.text', 5000)))
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(headers['content-encoding'], 'gzip')
+        self.assertNotIn('content-length', headers)
+        chunks = list(body)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(json.loads(gunzip(''.join(chunks)))['result'],
+                         'x' * 5000)
+
+    def test_results_below_the_gzip_minimum_are_sent_whole(self):
+        # longer than a chunk, but too short to gzip
+        status, headers, body = self.request(
+            json.dumps(call('Test.text', 80)))
+        self.assertNotIn('content-encoding', headers)
+        self.assertEqual(headers['content-length'], str(len(body[0])))
+        self.assertEqual(json.loads(body[0])['result'], 'x' * 80)
+
+    def test_stream_without_gzip(self):
+        status, headers, body = self.request(
+            json.dumps(call('Test.text', 5000)), '')
+        self.assertNotIn('content-encoding', headers)
+        self.assertNotIn('content-length', headers)
+        self.assertEqual(json.loads(''.join(body))['result'], 'x' * 5000)
+
+    def test_gzip_chunks_decode(self):
+        chunks = ['{"a": ', '"%s"' % ('x' * 1000), '}']
+        self.assertEqual(gunzip(''.join(self.app._gzip_chunks(chunks))),
+                         ''.join(chunks))
+
+    def test_mid_stream_encoding_error_is_logged(self):
+        status, headers, body = self.request(
+            json.dumps(call('Test.broken', 5000)))
+        # the status line went out before the error
+        self.assertEqual(status, '200 OK')
+        self.assertRaises(TypeError, list, body)
+        self.assertEqual([level for level, _ in self.logged][-1],
+                         server.log.ERR)
+
+    def test_early_encoding_error_is_an_error_response(self):
+        status, headers, body = self.request(
+            json.dumps(call('Test.broken', 10)))
+        self.assertEqual(status, '500 Internal Server Error')
+        response = json.loads(gunzip(body[0]) if 'content-encoding' in
+                              headers else body[0])
+        self.assertEqual(response['error']['name'],
+                         'Unexpected Server Error')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+'''
+Tests of the auth token cache of the python server.
+'''
+
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+# the server runs under python 2, with jsonrpcbase and biokbase.log
+try:
+    from StringIO import StringIO
+    import fbaModelServicesServer as server
+    SKIP = None
+except (ImportError, SyntaxError) as e:
+    server = None
+    SKIP = 'python server not importable: %s' % e
+
+
+class AuthService(object):
+    '''Validates tokens like the nexus client, counting its calls.'''
+
+    def __init__(self):
+        self.calls = 0
+        self.down = False
+
+    def validate_token(self, token):
+        self.calls += 1
+        if self.down:
+            raise IOError('timed out')
+        if token.startswith('bad'):
+            raise ValueError('Invalid Signature')
+        return token.split('|')[0].split('=')[1], None, None
+
+
+@unittest.skipIf(SKIP, SKIP)
+class TokenCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.auth = AuthService()
+        self.cache = server.TokenCache(self.auth.validate_token, size=2)
+
+    def test_valid_token_is_cached(self):
+        for _ in range(3):
+            self.assertEqual(self.cache.validate_token('un=alice|x=1'),
+                             'alice')
+        self.assertEqual(self.auth.calls, 1)
+        self.assertEqual(self.cache.stats()['hits'], 2)
+
+    def test_rejected_token_is_cached(self):
+        for _ in range(2):
+            self.assertRaises(ValueError, self.cache.validate_token, 'bad')
+        self.assertEqual(self.auth.calls, 1)
+
+    def test_cached_rejection_raises_a_new_exception(self):
+        errors = []
+        for _ in range(2):
+            try:
+                self.cache.validate_token('bad')
+            except ValueError as e:
+                errors.append(e)
+        self.assertEqual(self.auth.calls, 1)
+        self.assertIsNot(errors[0], errors[1])
+        self.assertEqual(str(errors[0]), str(errors[1]))
+
+    def test_auth_service_failure_is_not_cached(self):
+        self.auth.down = True
+        self.assertRaises(IOError, self.cache.validate_token, 'un=bob|x=1')
+        self.auth.down = False
+        self.assertEqual(self.cache.validate_token('un=bob|x=1'), 'bob')
+        self.assertEqual(self.auth.calls, 2)
+
+    def test_token_expiry_bounds_ttl(self):
+        self.cache.validate_token('un=carol|expiry=1')
+        self.cache.validate_token('un=carol|expiry=1')
+        self.assertEqual(self.auth.calls, 2)
+
+    def test_least_recently_used_token_is_evicted(self):
+        for token in ('un=a|x=1', 'un=b|x=1', 'un=a|x=1', 'un=c|x=1',
+                      'un=a|x=1', 'un=b|x=1'):
+            self.cache.validate_token(token)
+        self.assertEqual(self.auth.calls, 4)
+
+
+class CountingCache(object):
+    '''Accepts every token, counting the calls for statistics.'''
+
+    def __init__(self):
+        self.stats_calls = 0
+
+    def validate_token(self, token):
+        return 'alice'
+
+    def stats(self):
+        self.stats_calls += 1
+        return {'hits': 0, 'misses': 0, 'size': 0}
+
+
+@unittest.skipIf(SKIP, SKIP)
+class TokenStatsLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.app = server.application
+        self.saved = (self.app.token_cache,
+                      self.app.serverlog.get_log_level())
+        self.app.token_cache = CountingCache()
+        self.app.rpc_service.add(lambda ctx: ctx['user_id'],
+                                 name='Test.whoami')
+        self.app.method_authentication['Test.whoami'] = 'required'
+
+    def tearDown(self):
+        self.app.token_cache = self.saved[0]
+        self.app.serverlog.set_log_level(self.saved[1])
+
+    def request(self):
+        body = json.dumps({'version': '1.1', 'id': '1',
+                           'method': 'Test.whoami', 'params': []})
+        environ = {'REQUEST_METHOD': 'POST',
+                   'CONTENT_LENGTH': str(len(body)),
+                   'wsgi.input': StringIO(body),
+                   'HTTP_AUTHORIZATION': 'un=alice|x=1',
+                   'REMOTE_ADDR': '127.0.0.1'}
+        body = ''.join(self.app(environ, lambda status, headers: None))
+        return json.loads(body)['result']
+
+    def test_statistics_are_only_read_for_debug_logging(self):
+        self.app.serverlog.set_log_level(server.log.INFO)
+        self.assertEqual(self.request(), 'alice')
+        self.assertEqual(self.app.token_cache.stats_calls, 0)
+        self.app.serverlog.set_log_level(server.log.DEBUG)
+        self.request()
+        self.assertEqual(self.app.token_cache.stats_calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+'''
+A small FBAModel for the engine tests.
+
+Glucose is taken up by rxn00001 and turned into cpd00100 by rxn00002, which
+either of the isozymes g2 and g3 catalyzes. cpd00100 becomes the biomass
+precursor cpd00101 directly through rxn00003 (g4) or through cpd00102 by
+rxn00004 (g5) and rxn00005 (g6). rxn00007 to rxn00009 make the second
+precursor cpd00106 out of cpd00101; rxn00009 needs both subunits g10 and g11.
+rxn00006 and rxn00010 lead to dead ends and are blocked. On 10 glucose the
+model grows 8.
+'''
+
+BIOCHEMISTRY = '1/2/3'
+
+
+def compound(id, compartment):
+    return {'id': '%s_%s' % (id, compartment), 'name': id,
+            'formula': 'C6H12O6',
+            'compound_ref': BIOCHEMISTRY + '/compounds/id/' + id,
+            'modelcompartment_ref': '~/modelcompartments/id/' + compartment}
+
+
+def reaction(id, reagents, direction='>', genes=()):
+    # genes holds the alternative proteins (isozymes), each a list of the
+    # genes of its subunits
+    return {'id': id + '_c0', 'name': id, 'direction': direction,
+            'reaction_ref': BIOCHEMISTRY + '/reactions/id/' + id,
+            'modelReactionReagents': [
+                {'modelcompound_ref': '~/modelcompounds/id/' + cpd,
+                 'coefficient': coefficient}
+                for cpd, coefficient in reagents],
+            'modelReactionProteins': [
+                {'modelReactionProteinSubunits': [
+                    {'feature_refs': ['~/features/id/' + gene]}
+                    for gene in subunits]}
+                for subunits in genes]}
+
+
+def model():
+    compounds = [compound('cpd00027', 'e0'), compound('cpd00200', 'e0')]
+    compounds += [compound(id, 'c0') for id in (
+        'cpd00027', 'cpd00100', 'cpd00101', 'cpd00102', 'cpd00103',
+        'cpd00104', 'cpd00105', 'cpd00106', 'cpd00200', 'cpd11416')]
+    reactions = [
+        reaction('rxn00001', [('cpd00027_e0', -1), ('cpd00027_c0', 1)],
+                 '>', [['g1']]),
+        reaction('rxn00002', [('cpd00027_c0', -1), ('cpd00100_c0', 1)],
+                 '>', [['g2'], ['g3']]),
+        reaction('rxn00003', [('cpd00100_c0', -1), ('cpd00101_c0', 1)],
+                 '>', [['g4']]),
+        reaction('rxn00004', [('cpd00100_c0', -1), ('cpd00102_c0', 1)],
+                 '=', [['g5']]),
+        reaction('rxn00005', [('cpd00102_c0', -1), ('cpd00101_c0', 1)],
+                 '>', [['g6']]),
+        reaction('rxn00006', [('cpd00101_c0', -1), ('cpd00103_c0', 1)],
+                 '>', [['g7']]),
+        reaction('rxn00007', [('cpd00101_c0', -1), ('cpd00104_c0', 1)],
+                 '>', [['g8']]),
+        reaction('rxn00008', [('cpd00104_c0', -1), ('cpd00105_c0', 2)],
+                 '>', [['g9']]),
+        reaction('rxn00009', [('cpd00105_c0', -1), ('cpd00106_c0', 1)],
+                 '>', [['g10', 'g11']]),
+        reaction('rxn00010', [('cpd00200_e0', -1), ('cpd00200_c0', 1)],
+                 '=', [['g12']])]
+    biomass = {'id': 'bio1', 'name': 'bio1', 'biomasscompounds': [
+        {'modelcompound_ref': '~/modelcompounds/id/cpd00101_c0',
+         'coefficient': -1},
+        {'modelcompound_ref': '~/modelcompounds/id/cpd00106_c0',
+         'coefficient': -0.5},
+        {'modelcompound_ref': '~/modelcompounds/id/cpd11416_c0',
+         'coefficient': 1}]}
+    return {'id': 'toy', 'genome_ref': '1/5/1',
+            'modelcompartments': [
+                {'id': 'c0', 'compartment_ref': '~/compartments/id/c'},
+                {'id': 'e0', 'compartment_ref': '~/compartments/id/e'}],
+            'modelcompounds': compounds, 'modelreactions': reactions,
+            'biomasses': [biomass]}
+
+
+def media(compounds=(('cpd00027', -10, 10),)):
+    return {'id': 'glucose', 'name': 'glucose', 'mediacompounds': [
+        {'compound_ref': BIOCHEMISTRY + '/compounds/id/' + id,
+         'minFlux': lower, 'maxFlux': upper}
+        for id, lower, upper in compounds]}